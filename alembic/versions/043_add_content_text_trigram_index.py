@@ -0,0 +1,73 @@
+"""Add a pg_trgm GIN index for substring search-term matching.
+
+The analysis-layer ``search_terms`` predicate with
+``search_terms_text_fallback=True`` (network-builder window mode) matches
+records whose ``text_content`` contains a term as a substring.  Neither
+existing index can serve that:
+
+- ``idx_content_fulltext`` only answers ``to_tsvector('danish', ...) @@``
+  queries — stemmed word matching, not substrings.
+- ``idx_content_terms`` only covers the ``search_terms_matched`` array.
+
+so every fallback query sequentially scanned all matching partitions.
+
+Index added
+===========
+
+idx_content_text_trgm — GIN index on ``text_content gin_trgm_ops``.
+pg_trgm answers ``ILIKE '%term%'`` from this index for any term of three or
+more characters, preserving ILIKE's case-insensitive substring semantics.
+
+``core/queries/content_filters.py::_text_contains_any_sql`` emits one
+``text_content ILIKE :p`` branch per term (OR-ed) rather than
+``ILIKE ANY(ARRAY[...])``, because GIN cannot evaluate scalar-array
+operators.  Each branch becomes a Bitmap Index Scan and the planner
+combines them, together with ``idx_content_terms`` for the array-overlap
+side, via BitmapOr.
+
+Partitions
+==========
+
+Creating the index on the partitioned parent creates a matching index on
+every existing partition (including ``content_records_default``) and on
+partitions attached later, so no per-partition DDL is needed here.
+
+Production note on CONCURRENTLY
+================================
+
+As for migrations 040 and 042, CREATE INDEX CONCURRENTLY is not supported
+on a partitioned parent.  Trigram GIN indexes are larger and slower to build
+than B-tree indexes (expect roughly the size of the text column itself);
+schedule the upgrade during low-traffic hours, or pre-build the index per
+partition with CONCURRENTLY and attach it with ALTER INDEX ... ATTACH
+PARTITION before running this migration.
+
+The extension is created with IF NOT EXISTS; ``core/entity_resolver.py``
+already relies on pg_trgm at runtime.
+
+Revision ID: 043
+Revises: 042
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "043"
+down_revision = "042"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_content_text_trgm "
+        "ON content_records USING gin (text_content gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    # The extension is left installed: entity resolution uses it as well.
+    op.execute("DROP INDEX IF EXISTS idx_content_text_trgm")
@@ -0,0 +1,153 @@
+"""Add per-day content rollup tables and backfill them.
+
+The dashboard volume chart, platform counts, top terms, filter options and
+the Records Collected card each ran ``COUNT(*)`` / ``GROUP BY`` over every
+``content_records`` partition for the project's query designs on every page
+load.  Their latency grew linearly with the corpus.
+
+Tables added
+============
+
+1. content_daily_rollups — one row per (query_design_id, day,
+   collection_run_id, platform, arena, content_type, language, term_matched,
+   is_duplicate) with ``record_count`` and likes/shares/comments/views sums.
+
+   ``day`` is ``(published_at AT TIME ZONE 'UTC')::date``; ``language`` is the
+   effective-language base expression of migration 042 (column, falling back
+   to the enrichment result, truncated at the first ``-``); ``is_duplicate``
+   is ``raw_metadata->>'duplicate_of' IS NOT NULL``.
+
+2. content_daily_term_rollups — the same dimensions minus content_type, plus
+   ``term``, counting one occurrence per ``search_terms_matched`` element
+   (the ``unnest()`` counting used by get_top_terms).
+
+Both unique indexes are ``NULLS NOT DISTINCT`` (PostgreSQL 15+) because
+``day``, ``collection_run_id`` and ``language`` are nullable dimensions and
+the insert path upserts on them with ``ON CONFLICT``.  The indexes lead with
+(query_design_id, day) so they also serve the design + date-range reads.
+
+Only records with a query_design_id are rolled up — every reader is scoped
+by query design.  After this migration the rollups are maintained by
+``core/content_rollups.py`` (insert deltas, slice recomputation after
+duplicate marking, nightly ``reconcile_content_rollups``).
+
+Production note
+===============
+
+The backfill is a single aggregate pass over content_records.  On the
+4M-row production DB it runs for a few minutes; run it during low-traffic
+hours.  Records inserted while it runs are reconciled the following night.
+
+Revision ID: 044
+Revises: 043
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "044"
+down_revision = "043"
+branch_labels = None
+depends_on = None
+
+# Must match core/content_rollups.py (_DAY_EXPR, _LANG_EXPR, _DUP_EXPR).
+_DAY = "(published_at AT TIME ZONE 'UTC')::date"
+_LANG = (
+    "split_part(COALESCE(NULLIF(language, ''),"
+    " raw_metadata->'enrichments'->'language_detection'->>'language'), '-', 1)"
+)
+_DUP = "((raw_metadata->>'duplicate_of') IS NOT NULL)"
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE TABLE content_daily_rollups (
+            id BIGINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+            query_design_id UUID NOT NULL
+                REFERENCES query_designs(id) ON DELETE CASCADE,
+            collection_run_id UUID,
+            day DATE,
+            platform VARCHAR(50) NOT NULL,
+            arena VARCHAR(50) NOT NULL,
+            content_type VARCHAR(50) NOT NULL,
+            language TEXT,
+            term_matched BOOLEAN NOT NULL,
+            is_duplicate BOOLEAN NOT NULL,
+            record_count BIGINT NOT NULL DEFAULT 0,
+            likes_sum BIGINT NOT NULL DEFAULT 0,
+            shares_sum BIGINT NOT NULL DEFAULT 0,
+            comments_sum BIGINT NOT NULL DEFAULT 0,
+            views_sum BIGINT NOT NULL DEFAULT 0
+        )
+        """
+    )
+    op.execute(
+        "CREATE UNIQUE INDEX uq_content_daily_rollups_dims "
+        "ON content_daily_rollups (query_design_id, day, collection_run_id, "
+        "platform, arena, content_type, language, term_matched, is_duplicate) "
+        "NULLS NOT DISTINCT"
+    )
+
+    op.execute(
+        """
+        CREATE TABLE content_daily_term_rollups (
+            id BIGINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+            query_design_id UUID NOT NULL
+                REFERENCES query_designs(id) ON DELETE CASCADE,
+            collection_run_id UUID,
+            day DATE,
+            platform VARCHAR(50) NOT NULL,
+            arena VARCHAR(50) NOT NULL,
+            language TEXT,
+            term_matched BOOLEAN NOT NULL,
+            is_duplicate BOOLEAN NOT NULL,
+            term TEXT NOT NULL,
+            record_count BIGINT NOT NULL DEFAULT 0
+        )
+        """
+    )
+    op.execute(
+        "CREATE UNIQUE INDEX uq_content_daily_term_rollups_dims "
+        "ON content_daily_term_rollups (query_design_id, day, collection_run_id, "
+        "platform, arena, language, term_matched, is_duplicate, term) "
+        "NULLS NOT DISTINCT"
+    )
+
+    # One-time backfill from the raw table.
+    op.execute(
+        f"""
+        INSERT INTO content_daily_rollups (
+            query_design_id, day, collection_run_id, platform, arena,
+            content_type, language, term_matched, is_duplicate,
+            record_count, likes_sum, shares_sum, comments_sum, views_sum
+        )
+        SELECT query_design_id, {_DAY}, collection_run_id, platform, arena,
+               content_type, {_LANG}, term_matched, {_DUP},
+               count(*),
+               COALESCE(sum(likes_count), 0), COALESCE(sum(shares_count), 0),
+               COALESCE(sum(comments_count), 0), COALESCE(sum(views_count), 0)
+        FROM content_records
+        WHERE query_design_id IS NOT NULL
+        GROUP BY 1, 2, 3, 4, 5, 6, 7, 8, 9
+        """
+    )
+    op.execute(
+        f"""
+        INSERT INTO content_daily_term_rollups (
+            query_design_id, day, collection_run_id, platform, arena,
+            language, term_matched, is_duplicate, term, record_count
+        )
+        SELECT query_design_id, {_DAY}, collection_run_id, platform, arena,
+               {_LANG}, term_matched, {_DUP}, term, count(*)
+        FROM content_records, unnest(search_terms_matched) AS term
+        WHERE query_design_id IS NOT NULL AND term IS NOT NULL
+        GROUP BY 1, 2, 3, 4, 5, 6, 7, 8, 9
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS content_daily_term_rollups")
+    op.execute("DROP TABLE IF EXISTS content_daily_rollups")
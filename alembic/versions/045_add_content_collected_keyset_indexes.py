@@ -0,0 +1,60 @@
+"""Add (scope, collected_at, id) indexes for emergent-term catch-up.
+
+``analysis/descriptive.py::get_emergent_terms`` keeps incremental term
+statistics per query design and per collection run.  It reads the records
+collected after its watermark in keyset order::
+
+    WHERE query_design_id = :qd AND ...
+      AND (collected_at, id) > (:wm_at, :wm_id)
+    ORDER BY collected_at, id
+    LIMIT 10000
+
+and checks the stored statistics with a ``count(*)`` over
+``(collected_at, id) <= watermark``.  ``idx_content_query`` and
+``idx_content_collected_at`` (migration 040) each cover only half of that,
+so every batch sorted all of a design's matching records again.
+
+Indexes added
+=============
+
+1. idx_content_query_collected — ``(query_design_id, collected_at, id)``.
+2. idx_content_run_collected — ``(collection_run_id, collected_at, id)``.
+
+With the scope column leading, the planner reads each partition's index in
+keyset order from the watermark on and merges the partitions (Merge Append)
+instead of sorting, stopping after one batch.
+
+Production note on CONCURRENTLY
+================================
+
+As for migrations 040 and 042, CREATE INDEX CONCURRENTLY is not supported
+on a partitioned parent; schedule the upgrade during low-traffic hours.
+
+Revision ID: 045
+Revises: 044
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "045"
+down_revision = "044"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_content_query_collected "
+        "ON content_records (query_design_id, collected_at, id)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_content_run_collected "
+        "ON content_records (collection_run_id, collected_at, id)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_content_run_collected")
+    op.execute("DROP INDEX IF EXISTS idx_content_query_collected")
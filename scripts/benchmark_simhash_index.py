@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+"""Benchmark SimHashIndex clustering against the former pairwise scan.
+
+Generates synthetic 64-bit SimHash fingerprints — uniformly random
+"originals" plus a configurable share of near-duplicates that differ from
+an original by 0-3 flipped bits — and times:
+
+- ``SimHashIndex`` clustering (the path used by ``find_near_duplicates``).
+- The former all-pairs ``hamming_distance`` scan.  Above
+  ``--pairwise-limit`` records the full scan is infeasible (10^11+ pairs),
+  so its runtime is extrapolated from a timed sample of comparisons.
+
+For sizes at or below ``--pairwise-limit`` the cluster sets produced by both
+approaches are compared and the script exits non-zero on any mismatch.
+
+Usage:
+    # Default sizes: 10k, 100k and 1M records
+    python scripts/benchmark_simhash_index.py
+
+    # Custom sizes and duplicate share
+    python scripts/benchmark_simhash_index.py --sizes 5000 50000 --dup-ratio 0.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path so we can import the package
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from issue_observatory.core.deduplication import SimHashIndex, hamming_distance
+
+_THRESHOLD = 3
+_PAIRWISE_SAMPLE = 2_000_000
+
+
+def make_fingerprints(n: int, dup_ratio: float, seed: int) -> list[int]:
+    """Return *n* synthetic fingerprints, ``dup_ratio`` of them near-duplicates."""
+    rng = random.Random(seed)
+    n_dupes = int(n * dup_ratio)
+    originals = [rng.getrandbits(64) for _ in range(n - n_dupes)]
+    fingerprints = list(originals)
+    for _ in range(n_dupes):
+        fp = rng.choice(originals)
+        for bit in rng.sample(range(64), rng.randint(0, _THRESHOLD)):
+            fp ^= 1 << bit
+        fingerprints.append(fp)
+    rng.shuffle(fingerprints)
+    return fingerprints
+
+
+def cluster_with_index(fingerprints: list[int]) -> list[list[str]]:
+    index = SimHashIndex(hamming_threshold=_THRESHOLD)
+    for i, fp in enumerate(fingerprints):
+        index.add(str(i), fp)
+    return index.clusters()
+
+
+def cluster_pairwise(fingerprints: list[int]) -> list[list[str]]:
+    """Reference implementation: the former O(n^2) union-find scan."""
+    parent = list(range(len(fingerprints)))
+
+    def find(x: int) -> int:
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for i in range(len(fingerprints)):
+        for j in range(i + 1, len(fingerprints)):
+            if hamming_distance(fingerprints[i], fingerprints[j]) <= _THRESHOLD:
+                ri, rj = find(i), find(j)
+                if ri != rj:
+                    parent[rj] = ri
+
+    groups: dict[int, list[str]] = {}
+    for i in range(len(fingerprints)):
+        groups.setdefault(find(i), []).append(str(i))
+    return [g for g in groups.values() if len(g) >= 2]
+
+
+def estimate_pairwise_seconds(fingerprints: list[int]) -> float:
+    """Extrapolate the all-pairs scan runtime from a timed sample."""
+    n = len(fingerprints)
+    total_pairs = n * (n - 1) // 2
+    rng = random.Random(0)
+    sample = [(rng.randrange(n), rng.randrange(n)) for _ in range(_PAIRWISE_SAMPLE)]
+    start = time.perf_counter()
+    for i, j in sample:
+        if hamming_distance(fingerprints[i], fingerprints[j]) <= _THRESHOLD:
+            pass
+    elapsed = time.perf_counter() - start
+    return elapsed / _PAIRWISE_SAMPLE * total_pairs
+
+
+def _normalise(clusters: list[list[str]]) -> set[frozenset[str]]:
+    return {frozenset(c) for c in clusters}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--dup-ratio", type=float, default=0.1)
+    parser.add_argument("--pairwise-limit", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"{'records':>10} {'clusters':>9} {'index (s)':>10} {'pairwise (s)':>14} {'speedup':>9}")
+    ok = True
+    for n in args.sizes:
+        fingerprints = make_fingerprints(n, args.dup_ratio, args.seed)
+
+        start = time.perf_counter()
+        clusters = cluster_with_index(fingerprints)
+        index_s = time.perf_counter() - start
+
+        if n <= args.pairwise_limit:
+            start = time.perf_counter()
+            reference = cluster_pairwise(fingerprints)
+            pairwise_s = time.perf_counter() - start
+            pairwise_label = f"{pairwise_s:14.2f}"
+            if _normalise(reference) != _normalise(clusters):
+                print(f"  cluster mismatch at n={n}", file=sys.stderr)
+                ok = False
+        else:
+            pairwise_s = estimate_pairwise_seconds(fingerprints)
+            pairwise_label = f"~{pairwise_s:13.0f}"
+
+        print(
+            f"{n:>10} {len(clusters):>9} {index_s:>10.2f} {pairwise_label} "
+            f"{pairwise_s / max(index_s, 1e-9):>8.0f}x"
+        )
+
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
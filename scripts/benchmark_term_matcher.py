@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+"""Benchmark TermMatcher against the former per-term scans.
+
+Generates synthetic Danish-alphabet documents and random term lists of
+increasing size, then times, per term-list size:
+
+- **substring** — the former ``_match_terms_in_text`` body
+  (``t.lower() in haystack`` for every term) against
+  ``TermMatcher(terms).match()``.
+- **word boundary** — one ``term_in_text`` regex search per term (the former
+  ``match_groups_in_text`` inner loop) against
+  ``TermMatcher(terms, word_boundary=True).match()``.
+
+Matcher construction is timed separately; in production it is paid once per
+term set per worker process (see ``get_term_matcher``).  Results of both
+approaches are compared for every document and the script exits non-zero on
+any mismatch.
+
+Usage:
+    # Default term-list sizes: 10, 50, 100, 200, 400 and 1000
+    python scripts/benchmark_term_matcher.py
+
+    # Custom sizes and corpus
+    python scripts/benchmark_term_matcher.py --sizes 25 400 --docs 2000 --words 150
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path so we can import the package
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from issue_observatory.core.term_matcher import TermMatcher, word_boundary_pattern
+
+_ALPHABET = "abcdefghijklmnopqrstuvwxyzæøå"
+
+
+def make_corpus(n_docs: int, mean_words: int, seed: int) -> tuple[list[str], list[str]]:
+    """Return (vocabulary, documents) built from random pseudo-words."""
+    rng = random.Random(seed)
+    vocabulary = [
+        "".join(rng.choice(_ALPHABET) for _ in range(rng.randint(3, 10))) for _ in range(5000)
+    ]
+    docs = [
+        " ".join(rng.choice(vocabulary) for _ in range(rng.randint(mean_words // 5, mean_words * 2)))
+        for _ in range(n_docs)
+    ]
+    return vocabulary, docs
+
+
+def make_terms(vocabulary: list[str], n: int, rng: random.Random) -> list[str]:
+    """Return *n* terms: mostly single words, every tenth a two-word phrase."""
+    terms = []
+    for i in range(n):
+        if i % 10 == 9:
+            terms.append(f"{rng.choice(vocabulary)} {rng.choice(vocabulary)}")
+        else:
+            terms.append(rng.choice(vocabulary).capitalize())
+    return terms
+
+
+def _timed(fn, docs: list[str]) -> tuple[float, list[list[str]]]:
+    start = time.perf_counter()
+    results = [fn(doc) for doc in docs]
+    return time.perf_counter() - start, results
+
+
+def run(sizes: list[int], docs: list[str], vocabulary: list[str], seed: int) -> bool:
+    rng = random.Random(seed)
+    ok = True
+    print(
+        f"{'terms':>6}  {'mode':<13} {'build ms':>9} {'old s':>8} {'matcher s':>10} {'speed-up':>9}"
+    )
+    for n in sizes:
+        terms = make_terms(vocabulary, n, rng)
+
+        for mode in ("substring", "word boundary"):
+            word_boundary = mode == "word boundary"
+            if word_boundary:
+                patterns = [word_boundary_pattern(t.lower()) for t in terms]
+
+                def old(doc: str, terms=terms, patterns=patterns) -> list[str]:
+                    return [t for t, p in zip(terms, patterns) if p.search(doc)]
+            else:
+
+                def old(doc: str, terms=terms) -> list[str]:
+                    haystack = doc.lower()
+                    return [t for t in terms if t.lower() in haystack]
+
+            start = time.perf_counter()
+            matcher = TermMatcher(terms, word_boundary=word_boundary)
+            build = time.perf_counter() - start
+            # Warm the memoised transitions, as a long-lived worker would.
+            for doc in docs[:50]:
+                matcher.match(doc)
+
+            old_s, expected = _timed(old, docs)
+            new_s, got = _timed(matcher.match, docs)
+            if got != expected:
+                print(f"MISMATCH: {mode} matching with {n} terms differs", file=sys.stderr)
+                ok = False
+            print(
+                f"{n:>6}  {mode:<13} {build * 1000:>9.1f} {old_s:>8.3f} {new_s:>10.3f} "
+                f"{old_s / new_s:>8.1f}x"
+            )
+    return ok
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[10, 50, 100, 200, 400, 1000],
+        help="Term-list sizes to benchmark",
+    )
+    parser.add_argument("--docs", type=int, default=1000, help="Number of documents")
+    parser.add_argument("--words", type=int, default=150, help="Mean words per document")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    vocabulary, docs = make_corpus(args.docs, args.words, args.seed)
+    return 0 if run(args.sizes, docs, vocabulary, args.seed) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -35,6 +35,9 @@ import structlog
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from issue_observatory.analysis.term_statistics import run_cpu_bound, update_and_rank
+from issue_observatory.core import content_rollups
+from issue_observatory.core.analysis_cache import get_analysis_cache
 from issue_observatory.core.queries.content_filters import (
     ContentFilterSpec,
     build_content_where_sql,
@@ -55,6 +58,14 @@ _VALID_GRANULARITIES = frozenset({"hour", "day", "week", "month"})
 # have different snapshot behaviours (e.g. Wikipedia is not snapshot-based).
 _SNAPSHOT_PLATFORMS = frozenset({"google_search", "google_autocomplete", "openrouter"})
 
+# Records fetched and tokenized per batch by get_emergent_terms(); also the
+# sample size of project-wide calls.
+_EMERGENT_TERMS_BATCH_SIZE = 10_000
+
+# Batches get_emergent_terms() fetches per call when catching stored
+# statistics up, bounding the work a single request does.
+_EMERGENT_TERMS_MAX_BATCHES = 5
+
 
 def _dt_iso(value: Any) -> Any:
     """Convert a datetime to an ISO 8601 string; pass everything else through."""
@@ -107,6 +118,32 @@ def _build_content_filters(
     return build_content_where_sql(spec, table_alias="", params=params)
 
 
+def _rollup_scope(
+    query_design_id: uuid.UUID | None,
+    run_id: uuid.UUID | None,
+    date_from: datetime | None,
+    date_to: datetime | None,
+    query_design_ids: list[uuid.UUID] | None,
+    include_linked: bool,
+) -> tuple[list[uuid.UUID], Any, Any] | None:
+    """Return ``(design_ids, day_from, day_to)`` when the rollups can answer.
+
+    The per-day rollups (``core/content_rollups.py``) hold design-scoped
+    counts in whole UTC days, so they serve a query only when it is scoped
+    by query design without run or linked-record predicates and its date
+    bounds fall on day boundaries.  ``None`` means: query the raw table.
+    """
+    if include_linked or run_id is not None or not content_rollups.rollups_enabled():
+        return None
+    design_ids = query_design_ids or ([query_design_id] if query_design_id else [])
+    if not design_ids:
+        return None
+    days = content_rollups.rollup_day_range(date_from, date_to)
+    if days is None:
+        return None
+    return design_ids, days[0], days[1]
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -141,6 +178,10 @@ async def get_volume_over_time(
         query_design_ids: Restrict to records belonging to any of these
             query designs.  Takes precedence over *query_design_id*.
         exclude_platforms: Set of platform names to exclude from volume counts.
+        include_linked: When False, skip correlated EXISTS subqueries
+            against content_record_links.  Design-scoped queries with
+            whole-day bounds and day-or-coarser buckets are then answered
+            from ``content_daily_rollups``.
 
     Returns:
         A list of dicts, one per time-period/arena combination, sorted by
@@ -165,6 +206,39 @@ async def get_volume_over_time(
         )
 
     params: dict[str, Any] = {}
+    scope = _rollup_scope(
+        query_design_id, run_id, date_from, date_to, query_design_ids, include_linked
+    )
+    if scope is not None and granularity != "hour":
+        design_ids, day_from, day_to = scope
+        where = content_rollups.build_rollup_where(
+            params,
+            query_design_ids=design_ids,
+            arena=arena,
+            platform=platform,
+            exclude_platforms=exclude_platforms,
+            language=language,
+            day_from=day_from,
+            day_to=day_to,
+        )
+        # date_trunc over the UTC day yields the same bucket starts as the raw
+        # query's date_trunc over published_at in the UTC session.
+        sql = text(
+            f"""
+            SELECT
+                date_trunc('{granularity}', day::timestamp) AT TIME ZONE 'UTC' AS period,
+                arena,
+                SUM(record_count)::bigint AS cnt
+            FROM content_daily_rollups
+            {where}
+            AND day IS NOT NULL
+            GROUP BY 1, arena
+            ORDER BY 1 ASC, arena
+            """
+        )
+        rows = (await db.execute(sql, params)).fetchall()
+        return _aggregate_volume_rows(rows)
+
     where = _build_content_filters(
         query_design_id, run_id, arena, platform, date_from, date_to, params,
         query_design_ids=query_design_ids,
@@ -201,8 +275,11 @@ async def get_volume_over_time(
     )
 
     result = await db.execute(sql, params)
-    rows = result.fetchall()
+    return _aggregate_volume_rows(result.fetchall())
+
 
+def _aggregate_volume_rows(rows: Any) -> list[dict]:
+    """Fold ``(period, arena, cnt)`` rows into per-period volume dicts."""
     # Aggregate per-period totals and per-arena counts.
     # Use an ordered dict keyed by period ISO string to preserve sort order.
     aggregated: OrderedDict[str, dict] = OrderedDict()
@@ -562,7 +639,9 @@ async def get_top_terms(
     """Top search terms by match frequency across content records.
 
     Uses ``unnest(search_terms_matched)`` to expand the array column so each
-    term counts independently.
+    term counts independently.  Design-scoped queries with whole-day bounds
+    and ``include_linked=False`` read ``content_daily_term_rollups``, which
+    holds the same per-term counts.
 
     Args:
         db: Active async database session.
@@ -578,6 +657,31 @@ async def get_top_terms(
             [{"term": "klimaforandringer", "count": 834}, ...]
     """
     params: dict[str, Any] = {"limit": limit}
+    scope = _rollup_scope(
+        query_design_id, run_id, date_from, date_to, query_design_ids, include_linked
+    )
+    if scope is not None:
+        design_ids, day_from, day_to = scope
+        where = content_rollups.build_rollup_where(
+            params,
+            query_design_ids=design_ids,
+            language=language,
+            day_from=day_from,
+            day_to=day_to,
+        )
+        sql = text(
+            f"""
+            SELECT term, SUM(record_count)::bigint AS cnt
+            FROM content_daily_term_rollups
+            {where}
+            GROUP BY term
+            ORDER BY cnt DESC
+            LIMIT :limit
+            """
+        )
+        rows = (await db.execute(sql, params)).fetchall()
+        return [{"term": row.term, "count": row.cnt} for row in rows]
+
     # Build filters without arena/platform — terms span all arenas.
     # _build_content_filters always returns a WHERE clause, so additional
     # conditions always use AND.
@@ -734,9 +838,25 @@ async def get_emergent_terms(
 ) -> list[dict]:
     """Extract frequently-occurring terms from collected text content using TF-IDF.
 
-    Uses scikit-learn TfidfVectorizer on ``text_content`` from matching
-    content_records.  Applies Danish tokenization regex ``[a-z0-9æøå]{2,}``
-    and filters out Danish and English stop words to surface meaningful terms.
+    Tokenizes ``text_content`` from matching content_records with the Danish
+    token pattern ``[a-z0-9æøå]{2,}``, drops Danish and English stop words,
+    and ranks terms by mean TF-IDF (see
+    :mod:`~issue_observatory.analysis.term_statistics` for the scoring).
+
+    For a single query design or run, the vocabulary and document
+    frequencies are kept in an incremental store: each call tokenizes the
+    records collected after the previous call, in batches of
+    ``_EMERGENT_TERMS_BATCH_SIZE``, and the store is rebuilt when previously
+    counted records were deleted or marked as duplicates.  A call fetches at
+    most ``_EMERGENT_TERMS_MAX_BATCHES`` batches; a store further behind
+    (e.g. while rebuilding a large design) is served as far as it got and
+    catches up over the following calls.  The store's vocabulary is saved in
+    chunks (see
+    :meth:`~issue_observatory.analysis.term_statistics.TermStatistics.to_chunks`).
+    Project-wide calls (``query_design_ids``) sample up to
+    ``_EMERGENT_TERMS_BATCH_SIZE`` records each time.  Decoding the store,
+    tokenizing, re-encoding and ranking run in the analysis process pool so
+    the event loop is not blocked.
 
     Args:
         db: Active async database session.
@@ -752,112 +872,72 @@ async def get_emergent_terms(
 
             [{"term": "etik", "score": 0.42, "document_frequency": 87}, ...]
 
-        Returns an empty list if scikit-learn is not installed, if fewer than
-        5 text records are available, or if no terms pass the frequency filter.
+        Returns an empty list if fewer than 5 text records are available or
+        if no terms pass the frequency filter.
     """
-    try:
-        from sklearn.feature_extraction.text import TfidfVectorizer  # type: ignore[import]
-    except ImportError:
-        logger.warning(
-            "get_emergent_terms: scikit-learn not installed; returning empty list"
-        )
-        return []
-
-    import numpy as np  # type: ignore[import]
-
     params: dict[str, Any] = {}
     where = _build_content_filters(
         query_design_id, run_id, None, None, None, None, params,
         query_design_ids=query_design_ids,
     )
-
-    text_sql = text(
-        f"""
-        SELECT text_content
-        FROM content_records
-        {where}
-        AND text_content IS NOT NULL
-        AND length(text_content) > 20
-        LIMIT 10000
-        """
-    )
-
-    result = await db.execute(text_sql, params)
-    rows = result.fetchall()
-    texts = [row.text_content for row in rows if row.text_content]
-
-    if len(texts) < 5:
+    text_where = f"{where} AND text_content IS NOT NULL AND length(text_content) > 20"
+
+    # Incremental statistics are kept for single-design / single-run scopes.
+    state_name: str | None = None
+    if not query_design_ids and (query_design_id is not None or run_id is not None):
+        state_name = f"emergent_terms:design={query_design_id}:run={run_id}"
+
+    cache = get_analysis_cache()
+    header: dict[str, Any] | None = None
+    chunks: list[str] | None = None
+    if state_name:
+        state = await cache.load_state(state_name, encoded=True)
+        if state and state.get("chunks"):
+            chunks = state.pop("chunks")
+            header = state
+    if header and not await _term_statistics_valid(db, header, text_where, params):
+        logger.info("get_emergent_terms: stored statistics outdated; rebuilding")
+        header, chunks = None, None
+    watermark = header.get("watermark") if header else None
+
+    # At most _EMERGENT_TERMS_MAX_BATCHES per call; a store that is further
+    # behind serves what it has and catches up over the following calls.
+    texts: list[str] = []
+    caught_up = False
+    for _ in range(_EMERGENT_TERMS_MAX_BATCHES if state_name else 1):
+        cursor = ""
+        if watermark:
+            cursor = (
+                "AND (collected_at, id) > (CAST(:wm_at AS timestamptz), CAST(:wm_id AS uuid))"
+            )
+            params["wm_at"], params["wm_id"] = watermark
+        order_by = "ORDER BY collected_at, id" if state_name else ""
+        text_sql = text(
+            f"""
+            SELECT id, collected_at, text_content
+            FROM content_records
+            {text_where}
+            {cursor}
+            {order_by}
+            LIMIT {_EMERGENT_TERMS_BATCH_SIZE}
+            """
+        )
+        result = await db.execute(text_sql, params)
+        rows = result.fetchall()
+        texts.extend(row.text_content for row in rows if row.text_content)
+        if state_name and rows:
+            watermark = [str(rows[-1].collected_at), str(rows[-1].id)]
+        if len(rows) < _EMERGENT_TERMS_BATCH_SIZE:
+            caught_up = True
+            break
+    if state_name and not caught_up:
         logger.info(
-            "get_emergent_terms: fewer than 5 text records; returning empty list",
-            record_count=len(texts),
+            "get_emergent_terms: batch limit reached; serving partial statistics",
+            state=state_name,
         )
-        return []
-
-    # Build comprehensive stop word list: Danish + English + query-specific terms.
-    stop_words_set: set[str] = set()
-
-    # Danish stop words (comprehensive list including common function words)
-    danish_stop_words = {
-        "og", "i", "at", "er", "en", "et", "den", "det", "de", "til", "for",
-        "af", "med", "der", "har", "var", "som", "han", "hun", "på", "kan",
-        "vil", "skal", "fra", "over", "under", "efter", "inden", "mellem",
-        "mod", "om", "sig", "sin", "sit", "sine", "ud", "op", "ned", "ind",
-        "hen", "ad", "meg", "dig", "ham", "hende", "dem", "os", "jer", "mig",
-        "mit", "min", "mine", "dit", "din", "dine", "hans", "hennes", "dens",
-        "dets", "vores", "jeres", "deres", "denne", "dette", "disse", "her",
-        "hvor", "når", "da", "hvis", "fordi", "men", "eller", "så",
-        "end", "også", "kun", "jo", "nu", "ved", "se", "gå", "gøre", "gør",
-        "have", "hav", "gik", "blev", "fået", "fik", "aldrig", "ingen", "alle",
-        "mange", "få", "noget", "intet", "nogen", "hver", "meget", "mere",
-        "mest", "andet", "andre", "hvad", "hvilken", "hvilket", "hvilke",
-        "hvem", "hvordan", "hvorfor", "hvorhen", "hvornår", "ja", "nej", "ikke",
-        "være", "været", "bliver", "blive", "havde", "skulle", "kunne", "ville", "måtte", "blevet", "gjort", "sagt",
-        "kom", "kommer", "komme", "gjorde", "tag", "tage",
-        "tager", "tog", "taget", "før", "siden", "senere", "længe", "altid",
-        "ofte", "nogle", "heller", "hverken", "enten", "både",
-        # Additional common Danish words from UX testing
-        "vi", "du", "siger", "sige", "sagde", "fortæller", "fortælle",
-        "fortalt", "laver", "lave", "lavet", "lavede", "får",
-        "giver", "give", "givet", "gav", "stor", "store", "lidt",
-        "helt", "godt", "god", "dårlig", "dårligt", "nye", "ny", "nyt",
-        "gammel", "gamle", "lang", "langt", "lange", "kort", "korte", "høj",
-        "høje", "lav", "rigtig", "rigtigt", "forkert", "gerne",
-        "vist", "nok", "vel", "lige", "blot", "bare", "især", "særligt",
-        "omkring", "cirka", "altså", "nemlig", "dog", "imidlertid",
-        "derfor", "dermed", "derudover", "desuden", "dertil", "således",
-        "samtidig", "imens", "mens", "selvom", "skønt", "undtagen", "uden",
-        "indtil", "gennem", "blandt", "samt", "ligesom", "eftersom", "såfremt", "medmindre",
-    }
-    stop_words_set.update(danish_stop_words)
-
-    # English stop words (comprehensive list for mixed-language content)
-    english_stop_words = {
-        "the", "a", "an", "is", "are", "was", "were", "be", "been", "being",
-        "have", "has", "had", "having", "do", "does", "did", "doing", "will",
-        "would", "shall", "should", "can", "could", "may", "might", "must",
-        "to", "of", "in", "for", "on", "with", "at", "by", "from", "as",
-        "into", "through", "during", "before", "after", "above", "below",
-        "between", "out", "off", "over", "under", "again", "further", "then",
-        "once", "here", "there", "when", "where", "why", "how", "all", "both",
-        "each", "few", "more", "most", "other", "some", "such", "no", "nor",
-        "not", "only", "own", "same", "so", "than", "too", "very", "just",
-        "about", "and", "but", "or", "if", "while", "although", "because",
-        "until", "it", "its", "this", "that", "these", "those", "i", "me",
-        "my", "mine", "we", "us", "our", "ours", "you", "your", "yours",
-        "he", "him", "his", "she", "her", "hers", "they", "them", "their",
-        "theirs", "what", "which", "who", "whom", "whose", "am", "become", "becomes", "became", "get", "gets", "got", "gotten",
-        "make", "makes", "made", "go", "goes", "went", "gone", "take", "takes",
-        "took", "taken", "come", "comes", "came", "know", "knows", "knew",
-        "known", "think", "thinks", "thought", "see", "sees", "saw", "seen",
-        "say", "says", "said", "give", "gives", "gave", "given", "find",
-        "finds", "found", "tell", "tells", "told", "ask", "asks", "asked",
-        "work", "works", "worked", "seem", "seems", "seemed", "feel", "feels",
-        "felt", "try", "tries", "tried", "leave", "leaves", "left", "call",
-        "calls", "called",
-    }
-    stop_words_set.update(english_stop_words)
 
     # Optionally exclude existing search terms for this query design.
+    excluded: set[str] = set()
     if exclude_search_terms and query_design_id is not None:
         term_sql = text(
             """
@@ -867,75 +947,72 @@ async def get_emergent_terms(
             """
         )
         term_result = await db.execute(term_sql, {"query_design_id": str(query_design_id)})
-        existing_terms = [row.term.lower() for row in term_result.fetchall() if row.term]
-        if existing_terms:
-            stop_words_set.update(existing_terms)
-
-    # Convert set to list for TfidfVectorizer
-    stop_words_list = list(stop_words_set)
-
-    vectorizer = TfidfVectorizer(
-        analyzer="word",
-        token_pattern=r"[a-z0-9æøå]{2,}",
-        max_features=5000,
-        min_df=min_doc_frequency,
-        stop_words=stop_words_list,
+        excluded = {row.term.lower() for row in term_result.fetchall() if row.term}
+
+    # Decoding, counting, re-encoding and ranking are CPU-bound and grow with
+    # the vocabulary; keep them off the event loop.
+    header, chunks, ranked = await run_cpu_bound(
+        update_and_rank,
+        {**(header or {}), "watermark": watermark},
+        chunks,
+        texts,
+        top_n,
+        min_doc_frequency,
+        frozenset(excluded),
     )
+    if state_name and chunks is not None:
+        await cache.store_state(state_name, header, chunks=chunks, encoded=True)
 
-    try:
-        tfidf_matrix = vectorizer.fit_transform(texts)
-    except ValueError:
-        # Raised when vocabulary is empty after filtering.
-        logger.info("get_emergent_terms: empty vocabulary after filtering")
+    doc_count = header.get("doc_count", 0)
+    if doc_count < 5:
+        logger.info(
+            "get_emergent_terms: fewer than 5 text records; returning empty list",
+            record_count=doc_count,
+        )
         return []
 
-    feature_names: list[str] = vectorizer.get_feature_names_out().tolist()
-
-    # Mean TF-IDF score per term across all documents.
-    mean_scores = np.asarray(tfidf_matrix.mean(axis=0)).flatten()
-
-    # Document frequency: number of documents in which each term appears.
-    doc_freq = np.diff(tfidf_matrix.T.tocsr().indptr)
-
-    # Sort by mean score descending, take top_n.
-    top_indices = np.argsort(mean_scores)[::-1][:top_n]
-
-    # Post-filter results to remove any remaining problematic tokens:
-    # - Single-character tokens (even though token_pattern should catch this)
-    # - Purely numeric tokens
-    # - Tokens that are somehow still stop words (belt-and-suspenders)
-    results = []
-    for idx in top_indices:
-        term = feature_names[idx]
-        # Skip single-char tokens
-        if len(term) < 2:
-            continue
-        # Skip purely numeric tokens
-        if term.isdigit():
-            continue
-        # Skip if somehow still a stop word (case-insensitive check)
-        if term.lower() in stop_words_set:
-            continue
-
-        results.append({
-            "term": term,
-            "score": round(float(mean_scores[idx]), 6),
-            "document_frequency": int(doc_freq[idx]),
-        })
-
-        # Stop when we have enough valid results
-        if len(results) >= top_n:
-            break
-
     logger.info(
         "get_emergent_terms: extracted terms",
-        doc_count=len(texts),
-        term_count=len(results),
+        doc_count=doc_count,
+        new_doc_count=len(texts),
+        term_count=len(ranked),
         query_design_id=str(query_design_id) if query_design_id else None,
         run_id=str(run_id) if run_id else None,
     )
 
-    return results
+    return ranked
+
+
+async def _term_statistics_valid(
+    db: AsyncSession,
+    header: dict[str, Any],
+    text_where: str,
+    params: dict[str, Any],
+) -> bool:
+    """Check that no counted record has since been deleted or deduplicated.
+
+    The stored statistics are additive only, so they are valid as long as
+    the number of matching records up to the watermark still equals the
+    number of documents they were built from.
+
+    Args:
+        header: Header of the stored statistics (``doc_count``, ``watermark``).
+    """
+    watermark = header.get("watermark")
+    if not watermark:
+        return False
+    count_sql = text(
+        f"""
+        SELECT count(*)
+        FROM content_records
+        {text_where}
+        AND (collected_at, id) <= (CAST(:wm_at AS timestamptz), CAST(:wm_id AS uuid))
+        """
+    )
+    result = await db.execute(
+        count_sql, {**params, "wm_at": watermark[0], "wm_id": watermark[1]}
+    )
+    return result.scalar_one() == header.get("doc_count")
 
 
 async def get_top_actors_unified(
@@ -27,6 +27,10 @@ Available enrichers:
   records; writes to both JSONB and the ``extracted_urls`` relational table.
 - :class:`EngagementScorer` — data-driven per-platform engagement
   normalization using fitted Yeo-Johnson + MinMaxScaler transformers.
+
+:class:`EnrichmentPipeline` runs a set of enrichers over batches of records,
+using each enricher's ``enrich_batch()`` hook and an optional process pool
+for CPU-bound enrichers.
 """
 
 from __future__ import annotations
@@ -36,15 +40,18 @@ from issue_observatory.analysis.enrichments.coordination_detector import Coordin
 from issue_observatory.analysis.enrichments.engagement_scorer import EngagementScorer
 from issue_observatory.analysis.enrichments.language_detector import LanguageDetector
 from issue_observatory.analysis.enrichments.named_entity_extractor import NamedEntityExtractor
+from issue_observatory.analysis.enrichments.pipeline import BatchOutcome, EnrichmentPipeline
 from issue_observatory.analysis.enrichments.propagation_detector import PropagationEnricher
 from issue_observatory.analysis.enrichments.sentiment_analyzer import SentimentAnalyzer
 from issue_observatory.analysis.enrichments.url_extractor import UrlExtractor
 
 __all__ = [
+    "BatchOutcome",
     "ContentEnricher",
     "CoordinationDetector",
     "EngagementScorer",
     "EnrichmentError",
+    "EnrichmentPipeline",
     "LanguageDetector",
     "NamedEntityExtractor",
     "PropagationEnricher",
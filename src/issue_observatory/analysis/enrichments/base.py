@@ -22,6 +22,8 @@ class ContentEnricher(ABC):
     record without requiring schema migrations for each new enricher.
 
     Implementors must override enricher_name, enrich(), and is_applicable().
+    Enrichers whose underlying library can process many documents at once
+    (e.g. spaCy ``nlp.pipe``) should also override :meth:`enrich_batch`.
 
     Usage (Celery task context)::
 
@@ -34,6 +36,12 @@ class ContentEnricher(ABC):
 
     enricher_name: str  # must be set by subclasses; used as key in enrichments dict
 
+    cpu_bound: bool = False
+    """Whether enrich() is dominated by pure-Python CPU work.  CPU-bound
+    enrichers may be dispatched to a process pool by
+    :class:`~issue_observatory.analysis.enrichments.pipeline.EnrichmentPipeline`;
+    they must therefore be picklable."""
+
     @abstractmethod
     async def enrich(self, record: dict[str, Any]) -> dict[str, Any]:
         """Run the enrichment on a content record dict.
@@ -61,6 +69,31 @@ class ContentEnricher(ABC):
             True if the record meets the criteria for this enricher.
         """
 
+    async def enrich_batch(
+        self, records: list[dict[str, Any]]
+    ) -> list[dict[str, Any] | Exception]:
+        """Run the enrichment on a batch of applicable records.
+
+        The default implementation awaits :meth:`enrich` once per record.
+        Failures are returned in place of the result rather than raised so
+        that one bad record does not discard the rest of the batch.
+
+        Args:
+            records: Content record dicts for which :meth:`is_applicable`
+                returned True.
+
+        Returns:
+            One entry per input record, in order: the enrichment dict, or the
+            exception raised while enriching that record.
+        """
+        results: list[dict[str, Any] | Exception] = []
+        for record in records:
+            try:
+                results.append(await self.enrich(record))
+            except Exception as exc:
+                results.append(exc)
+        return results
+
     def __repr__(self) -> str:
         """Return a human-readable representation of this enricher."""
         return f"{self.__class__.__name__}(enricher_name={self.enricher_name!r})"
@@ -2,8 +2,14 @@
 
 Computes per-platform normalized engagement scores (0-100) using fitted
 Yeo-Johnson + MinMaxScaler transformers.  The fitting step runs weekly as a
-Celery task (requires sklearn); the scoring step uses pure-Python math so that
-no optional dependencies are needed at enrichment time.
+Celery task (requires sklearn); the scoring step is vectorized with NumPy when
+it is installed and falls back to pure-Python math otherwise, so no optional
+dependencies are needed at enrichment time.
+
+Engagement data moves in columns: fitting reads one array of composites per
+platform, a refit rescores every record of the platform in keyset-paginated
+chunks, and scores are written back with one ``UPDATE ... FROM unnest(...)``
+per chunk or batch.
 
 Inspired by spreadAnalysis's ``create_enga_transformer_actor`` approach: fit
 per-platform PowerTransformer(yeo-johnson) + MinMaxScaler to actual engagement
@@ -21,12 +27,15 @@ from __future__ import annotations
 import math
 from dataclasses import dataclass
 from datetime import UTC, datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import structlog
 
 from issue_observatory.analysis.enrichments.base import ContentEnricher
 
+if TYPE_CHECKING:
+    import numpy as np
+
 logger = structlog.get_logger(__name__)
 
 #: Platforms with real user-generated engagement metrics suitable for
@@ -51,6 +60,17 @@ _ENGAGEMENT_PLATFORMS: frozenset[str] = frozenset(
 #: lambda estimation.
 _MIN_SAMPLE_SIZE: int = 100
 
+#: Most recent records per platform used to fit its scaler.
+_FIT_SAMPLE_SIZE: int = 50_000
+
+#: Engagement count columns summed into the raw composite.
+_ENGAGEMENT_FIELDS: tuple[str, ...] = (
+    "views_count",
+    "likes_count",
+    "shares_count",
+    "comments_count",
+)
+
 
 def _yeo_johnson_transform(x: float, lmbda: float) -> float:
     """Pure-Python Yeo-Johnson power transform for a single value.
@@ -74,6 +94,33 @@ def _yeo_johnson_transform(x: float, lmbda: float) -> float:
         return -((-x + 1) ** (2 - lmbda) - 1) / (2 - lmbda)
 
 
+def _yeo_johnson_array(x: np.ndarray, lmbda: float) -> np.ndarray:
+    """Vectorized :func:`_yeo_johnson_transform` over a float array.
+
+    Args:
+        x: Input values (may be negative).
+        lmbda: Fitted lambda parameter.
+
+    Returns:
+        Array of transformed values, same shape as *x*.
+    """
+    import numpy as np
+
+    out = np.empty_like(x, dtype=float)
+    pos = x >= 0
+    xp = x[pos]
+    xn = x[~pos]
+    if abs(lmbda) < 1e-10:
+        out[pos] = np.log1p(xp)
+    else:
+        out[pos] = (np.power(xp + 1, lmbda) - 1) / lmbda
+    if abs(lmbda - 2) < 1e-10:
+        out[~pos] = -np.log1p(-xn)
+    else:
+        out[~pos] = -(np.power(-xn + 1, 2 - lmbda) - 1) / (2 - lmbda)
+    return out
+
+
 @dataclass
 class EngagementScalerState:
     """Deserialized per-platform transformer + scaler parameters.
@@ -116,6 +163,24 @@ class EngagementScalerState:
         scaled = max(0.0, min(1.0, scaled))
         return round(scaled * 100, 2)
 
+    def transform_array(self, raw_composites: np.ndarray) -> np.ndarray:
+        """Vectorized :meth:`transform` over an array of raw composites.
+
+        Args:
+            raw_composites: Float array of raw composite engagement values.
+
+        Returns:
+            Array of scores clamped to [0, 100].
+        """
+        import numpy as np
+
+        data_range = self.data_max - self.data_min
+        if data_range < 1e-10:
+            return np.full(len(raw_composites), 50.0)
+        transformed = _yeo_johnson_array(raw_composites, self.lmbda)
+        scaled = np.clip((transformed - self.data_min) / data_range, 0.0, 1.0)
+        return np.round(scaled * 100, 2)
+
 
 def _compute_raw_composite(record: dict[str, Any]) -> float:
     """Sum available engagement metrics from a content record dict.
@@ -127,13 +192,32 @@ def _compute_raw_composite(record: dict[str, Any]) -> float:
         Sum of non-null engagement metrics as a float.
     """
     total = 0.0
-    for key in ("views_count", "likes_count", "shares_count", "comments_count"):
+    for key in _ENGAGEMENT_FIELDS:
         val = record.get(key)
         if val is not None and val > 0:
             total += val
     return total
 
 
+def _raw_composite_array(records: list[dict[str, Any]]) -> np.ndarray:
+    """Vectorized :func:`_compute_raw_composite` over a list of records.
+
+    Args:
+        records: Content record dicts with engagement count columns.
+
+    Returns:
+        Float array with one composite per record.
+    """
+    import numpy as np
+
+    # None becomes NaN, and NaN > 0 is False, so missing counts add nothing.
+    values = np.array(
+        [[record.get(key) for key in _ENGAGEMENT_FIELDS] for record in records],
+        dtype=float,
+    ).reshape(len(records), len(_ENGAGEMENT_FIELDS))
+    return np.where(values > 0, values, 0.0).sum(axis=1)
+
+
 def _log_fallback_score(raw_composite: float) -> float:
     """Cold-start fallback: log-scale engagement to 0-100.
 
@@ -153,6 +237,21 @@ def _log_fallback_score(raw_composite: float) -> float:
     return min(100.0, round(score, 2))
 
 
+def _log_fallback_array(raw_composites: np.ndarray) -> np.ndarray:
+    """Vectorized :func:`_log_fallback_score`.
+
+    Args:
+        raw_composites: Float array of raw composite engagement values.
+
+    Returns:
+        Array of scores in the [0, 100] range.
+    """
+    import numpy as np
+
+    scores = np.round(np.log1p(np.maximum(raw_composites, 0.0)) * 7.0, 2)
+    return np.minimum(scores, 100.0)
+
+
 class EngagementScorer(ContentEnricher):
     """Data-driven engagement score enricher.
 
@@ -253,6 +352,58 @@ class EngagementScorer(ContentEnricher):
             result["scaler_fitted_at"] = fitted_at
         return result
 
+    async def enrich_batch(
+        self, records: list[dict[str, Any]]
+    ) -> list[dict[str, Any] | Exception]:
+        """Score a whole batch with one array operation per platform.
+
+        Produces the same results as :meth:`enrich` per record.  Falls back
+        to the per-record default when NumPy is not installed.
+
+        Args:
+            records: Applicable content record dicts.
+
+        Returns:
+            One enrichment dict per input record, in order.
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            return await super().enrich_batch(records)
+        if not records:
+            return []
+
+        scored_at = datetime.now(tz=UTC).isoformat()
+        raw = _raw_composite_array(records)
+        by_platform: dict[str, list[int]] = {}
+        for i, record in enumerate(records):
+            by_platform.setdefault(record.get("platform", ""), []).append(i)
+
+        results: list[dict[str, Any] | Exception] = [{} for _ in records]
+        for platform, indices in by_platform.items():
+            idx = np.asarray(indices)
+            scaler = self._scalers.get(platform)
+            if scaler is not None:
+                scores = scaler.transform_array(raw[idx])
+                method = "yeo_johnson_minmax"
+            else:
+                scores = _log_fallback_array(raw[idx])
+                method = "log_fallback"
+            for i, score, composite in zip(
+                indices, scores.tolist(), raw[idx].tolist(), strict=True
+            ):
+                result: dict[str, Any] = {
+                    "score": score,
+                    "raw_composite": composite,
+                    "method": method,
+                    "platform": platform,
+                    "scored_at": scored_at,
+                }
+                if scaler is not None:
+                    result["scaler_fitted_at"] = scaler.fitted_at
+                results[i] = result
+        return results
+
     def write_relational(
         self,
         record: dict[str, Any],
@@ -273,94 +424,126 @@ class EngagementScorer(ContentEnricher):
         if score is not None:
             update_engagement_score_column([(record_id, score)])
 
+    def write_relational_batch(
+        self,
+        items: list[tuple[dict[str, Any], dict[str, Any]]],
+    ) -> None:
+        """Write the scores of a whole batch with one bulk UPDATE.
+
+        Args:
+            items: ``(record, enrichment_result)`` pairs.
+        """
+        from issue_observatory.workers._enrichment_helpers import (
+            update_engagement_score_column,
+        )
+
+        update_engagement_score_column(
+            [
+                (str(record["id"]), result["score"])
+                for record, result in items
+                if result.get("score") is not None
+            ]
+        )
+
+
+def rescore_engagement_platform(platform: str, scaler: EngagementScalerState) -> int:
+    """Rewrite ``engagement_score`` for every record of *platform* with *scaler*.
+
+    Streams ``(ids, composites)`` column chunks, transforms each chunk with
+    one array operation and writes it back with one bulk UPDATE.  Only the
+    column is rewritten; ``raw_metadata.enrichments.engagement_score`` keeps
+    the score computed when the record was enriched.
+
+    Requires ``numpy``.
+
+    Args:
+        platform: Platform name.
+        scaler: Fitted scaler to apply.
+
+    Returns:
+        Number of records rescored.
+    """
+    import numpy as np
+
+    from issue_observatory.workers._enrichment_helpers import (
+        iter_engagement_composites,
+        update_engagement_score_column,
+    )
+
+    rescored = 0
+    for record_ids, composites in iter_engagement_composites(platform):
+        scores = scaler.transform_array(np.asarray(composites, dtype=float))
+        update_engagement_score_column(list(zip(record_ids, scores.tolist(), strict=True)))
+        rescored += len(record_ids)
+    return rescored
+
 
 def fit_engagement_scalers() -> dict[str, Any]:
     """Fit per-platform Yeo-Johnson + MinMaxScaler from actual engagement data.
 
-    Samples engagement data per platform from the DB, fits sklearn
-    ``PowerTransformer(method='yeo-johnson')`` + ``MinMaxScaler``, and upserts
-    the fitted parameters into the ``engagement_scalers`` table.
+    Reads the newest engagement composites per platform as one array, fits
+    sklearn ``PowerTransformer(method='yeo-johnson')`` to it, takes the
+    MinMax range of the transformed array, and upserts the fitted parameters
+    into the ``engagement_scalers`` table.  Every record of a fitted platform
+    is then rescored with the new parameters
+    (:func:`rescore_engagement_platform`).
 
     Requires ``scikit-learn`` (only for fitting, not for scoring).
 
     Returns:
-        Dict with per-platform fitting results including sample_size and
-        diagnostic statistics.
+        Dict with per-platform fitting results including sample_size,
+        rescored count and diagnostic statistics.
     """
     import json
 
     import numpy as np
-    from sklearn.preprocessing import MinMaxScaler, PowerTransformer
+    from sklearn.preprocessing import PowerTransformer
     from sqlalchemy import text
 
     from issue_observatory.core.database import get_sync_session
+    from issue_observatory.workers._enrichment_helpers import fetch_engagement_composites
 
     results: dict[str, Any] = {}
 
     for platform in sorted(_ENGAGEMENT_PLATFORMS):
-        # Sample engagement data for this platform.
-        with get_sync_session() as db:
-            stmt = text(
-                """
-                SELECT
-                    COALESCE(views_count, 0) +
-                    COALESCE(likes_count, 0) +
-                    COALESCE(shares_count, 0) +
-                    COALESCE(comments_count, 0) AS composite
-                FROM content_records
-                WHERE platform = :platform
-                  AND (
-                      views_count IS NOT NULL AND views_count > 0
-                      OR likes_count IS NOT NULL AND likes_count > 0
-                      OR shares_count IS NOT NULL AND shares_count > 0
-                      OR comments_count IS NOT NULL AND comments_count > 0
-                  )
-                ORDER BY collected_at DESC
-                LIMIT 50000
-                """
-            )
-            rows = db.execute(stmt, {"platform": platform}).fetchall()
+        composites = np.asarray(
+            fetch_engagement_composites(platform, _FIT_SAMPLE_SIZE), dtype=float
+        )
 
-        if len(rows) < _MIN_SAMPLE_SIZE:
+        if len(composites) < _MIN_SAMPLE_SIZE:
             logger.info(
                 "fit_engagement_scalers: skipping platform — insufficient data",
                 platform=platform,
-                sample_size=len(rows),
+                sample_size=len(composites),
                 min_required=_MIN_SAMPLE_SIZE,
             )
-            results[platform] = {"status": "skipped", "sample_size": len(rows)}
+            results[platform] = {"status": "skipped", "sample_size": len(composites)}
             continue
 
-        data = np.array([float(row[0]) for row in rows]).reshape(-1, 1)
-
-        # Fit Yeo-Johnson power transform.
+        # Fit Yeo-Johnson power transform, then MinMax on the transformed data.
         pt = PowerTransformer(method="yeo-johnson", standardize=False)
-        transformed = pt.fit_transform(data)
-
-        # Fit MinMaxScaler on the transformed data.
-        mm = MinMaxScaler()
-        mm.fit(transformed)
+        transformed = pt.fit_transform(composites.reshape(-1, 1)).ravel()
 
         lmbda = float(pt.lambdas_[0])
-        data_min = float(mm.data_min_[0])
-        data_max = float(mm.data_max_[0])
-        data_range = float(mm.data_range_[0])
+        data_min = float(transformed.min())
+        data_max = float(transformed.max())
+        data_range = data_max - data_min
 
         # Diagnostic statistics.
-        composites = data.flatten()
+        p25, median, p75, p95 = np.percentile(composites, [25, 50, 75, 95])
+        mean_val = float(composites.mean())
+        std_val = float(composites.std())
         stats = {
-            "mean": float(np.mean(composites)),
-            "median": float(np.median(composites)),
-            "std": float(np.std(composites)),
-            "min": float(np.min(composites)),
-            "max": float(np.max(composites)),
-            "p25": float(np.percentile(composites, 25)),
-            "p75": float(np.percentile(composites, 75)),
-            "p95": float(np.percentile(composites, 95)),
+            "mean": mean_val,
+            "median": float(median),
+            "std": std_val,
+            "min": float(composites.min()),
+            "max": float(composites.max()),
+            "p25": float(p25),
+            "p75": float(p75),
+            "p95": float(p95),
         }
         # Skewness (Fisher definition).
-        mean_val = np.mean(composites)
-        std_val = np.std(composites)
         if std_val > 0:
             stats["skewness"] = float(np.mean(((composites - mean_val) / std_val) ** 3))
         else:
@@ -405,16 +588,27 @@ def fit_engagement_scalers() -> dict[str, Any]:
                     "platform": platform,
                     "transformer_params": json.dumps(transformer_params),
                     "scaler_params": json.dumps(scaler_params),
-                    "sample_size": len(rows),
+                    "sample_size": len(composites),
                     "stats": json.dumps(stats),
                     "fitted_at": fitted_at,
                 },
             )
             db.commit()
 
+        rescored = rescore_engagement_platform(
+            platform,
+            EngagementScalerState(
+                lmbda=lmbda,
+                data_min=data_min,
+                data_max=data_max,
+                fitted_at=fitted_at.isoformat(),
+            ),
+        )
+
         results[platform] = {
             "status": "fitted",
-            "sample_size": len(rows),
+            "sample_size": len(composites),
+            "rescored": rescored,
             "lambda": lmbda,
             "data_min": data_min,
             "data_max": data_max,
@@ -423,7 +617,8 @@ def fit_engagement_scalers() -> dict[str, Any]:
         logger.info(
             "fit_engagement_scalers: platform fitted",
             platform=platform,
-            sample_size=len(rows),
+            sample_size=len(composites),
+            rescored=rescored,
             lmbda=round(lmbda, 4),
         )
 
@@ -102,6 +102,7 @@ class LanguageDetector(ContentEnricher):
     """
 
     enricher_name = "language_detection"
+    cpu_bound = True
 
     def __init__(self, expected_languages: list[str] | None = None) -> None:
         """Initialise the detector with an optional expected-language list.
@@ -210,10 +211,69 @@ class LanguageDetector(ContentEnricher):
             detector="none",
         )
 
+    async def enrich_batch(
+        self, records: list[dict[str, Any]]
+    ) -> list[dict[str, Any] | Exception]:
+        """Detect language for a batch of records.
+
+        langdetect availability is resolved once for the whole batch rather
+        than per record, and the neutral fallback result is computed once
+        and shared when the library is missing.
+
+        Args:
+            records: Applicable content record dicts.
+
+        Returns:
+            One detection result dict per input record, in order.
+        """
+        try:
+            import langdetect  # type: ignore[import-untyped]  # noqa: F401
+        except ImportError:
+            fallback = self._fallback_result()
+            return [dict(fallback) for _ in records]
+
+        results: list[dict[str, Any] | Exception] = []
+        for record in records:
+            try:
+                lang_code, confidence = _detect_with_langdetect(
+                    record.get("text_content") or ""
+                )
+            except EnrichmentError as exc:
+                logger.warning(
+                    "language_detector: langdetect error; using fallback",
+                    record_id=str(record.get("id", "<unknown>")),
+                    error=str(exc),
+                )
+                results.append(self._fallback_result())
+                continue
+            results.append(
+                self._build_result(
+                    language=lang_code,
+                    confidence=round(confidence, 4),
+                    detector="langdetect",
+                )
+            )
+        return results
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
+    def _fallback_result(self) -> dict[str, Any]:
+        """Return the neutral result used when langdetect cannot answer.
+
+        Returns:
+            A single-language heuristic result when exactly one expected
+            language is configured, otherwise an unknown-language result.
+        """
+        if len(self.expected_languages) == 1:
+            return self._build_result(
+                language=self.expected_languages[0],
+                confidence=None,
+                detector="heuristic_single_lang",
+            )
+        return self._build_result(language=None, confidence=None, detector="none")
+
     def _build_result(
         self,
         language: str | None,
@@ -63,6 +63,7 @@ def _get_nlp() -> Any:
 # ---------------------------------------------------------------------------
 
 _CONTEXT_WINDOW = 80  # characters on each side of entity span for context
+_PIPE_BATCH_SIZE = 64  # documents per spaCy nlp.pipe minibatch
 
 # Danish verb patterns that indicate the preceding entity is a speaker.
 _SPEAKER_PATTERNS: frozenset[str] = frozenset(
@@ -113,6 +114,37 @@ def _classify_role(ent_text: str, full_text: str) -> str:
     return "mentioned"
 
 
+def _extract_entities(doc: Any, text: str) -> list[dict[str, Any]]:
+    """Convert a spaCy ``Doc`` into the enrichment entity list.
+
+    Args:
+        doc: The spaCy document produced for *text*.
+        text: The source text (used for context windows and roles).
+
+    Returns:
+        Entity dicts for PER/ORG/GPE/LOC spans of at least two characters.
+    """
+    entities: list[dict[str, Any]] = []
+    for ent in doc.ents:
+        if ent.label_ not in _RELEVANT_LABELS:
+            continue
+        name = ent.text.strip()
+        if not name or len(name) < 2:
+            continue
+        start = max(0, ent.start_char - _CONTEXT_WINDOW)
+        end = min(len(text), ent.end_char + _CONTEXT_WINDOW)
+        entities.append(
+            {
+                "name": name,
+                "entity_type": _LABEL_MAP.get(ent.label_, ent.label_),
+                "role": _classify_role(name, text),
+                "confidence": 1.0,
+                "context": text[start:end],
+            }
+        )
+    return entities
+
+
 class NamedEntityExtractor(ContentEnricher):
     """Extract named entities and classify their roles in content.
 
@@ -141,6 +173,7 @@ class NamedEntityExtractor(ContentEnricher):
     """
 
     enricher_name = "actor_roles"
+    cpu_bound = True
 
     def is_applicable(self, record: dict[str, Any]) -> bool:
         """Applicable when text_content is present and longer than 100 chars.
@@ -192,34 +225,65 @@ class NamedEntityExtractor(ContentEnricher):
             }
 
         try:
-            doc = nlp(text)
-            entities: list[dict[str, Any]] = []
-            for ent in doc.ents:
-                if ent.label_ not in _RELEVANT_LABELS:
-                    continue
-                name = ent.text.strip()
-                if not name or len(name) < 2:
-                    continue
-                start = max(0, ent.start_char - _CONTEXT_WINDOW)
-                end = min(len(text), ent.end_char + _CONTEXT_WINDOW)
-                entities.append(
-                    {
-                        "name": name,
-                        "entity_type": _LABEL_MAP.get(ent.label_, ent.label_),
-                        "role": _classify_role(name, text),
-                        "confidence": 1.0,
-                        "context": text[start:end],
-                    }
-                )
-            logger.debug(
-                "named_entity_extractor.done",
-                record_id=str(record.get("id", "")),
-                entity_count=len(entities),
-            )
-            return {
-                "entities": entities,
-                "model": "da_core_news_lg",
-                "processed_at": processed_at,
-            }
+            entities = _extract_entities(nlp(text), text)
         except Exception as exc:
             raise EnrichmentError(f"NER extraction failed: {exc}") from exc
+        logger.debug(
+            "named_entity_extractor.done",
+            record_id=str(record.get("id", "")),
+            entity_count=len(entities),
+        )
+        return {
+            "entities": entities,
+            "model": "da_core_news_lg",
+            "processed_at": processed_at,
+        }
+
+    async def enrich_batch(
+        self, records: list[dict[str, Any]]
+    ) -> list[dict[str, Any] | Exception]:
+        """Run NER over a whole batch with ``nlp.pipe``.
+
+        ``nlp.pipe`` amortises tokenizer and model overhead across
+        documents, which is several times faster than calling ``nlp(text)``
+        once per record.  If the pipe fails part-way the batch is retried
+        record by record so that only the offending records report an error.
+
+        Args:
+            records: Applicable content record dicts.
+
+        Returns:
+            One result dict (or exception) per input record, in order.
+        """
+        nlp = _get_nlp()
+        if nlp is None:
+            return await super().enrich_batch(records)
+
+        processed_at = datetime.now(UTC).isoformat()
+        texts = [record.get("text_content") or "" for record in records]
+        try:
+            docs = list(nlp.pipe(texts, batch_size=_PIPE_BATCH_SIZE))
+        except Exception as exc:
+            logger.warning(
+                "named_entity_extractor.pipe_failed",
+                batch_size=len(records),
+                error=str(exc),
+            )
+            return await super().enrich_batch(records)
+
+        results: list[dict[str, Any] | Exception] = []
+        for doc, text in zip(docs, texts, strict=True):
+            try:
+                entities = _extract_entities(doc, text)
+            except Exception as exc:
+                results.append(EnrichmentError(f"NER extraction failed: {exc}"))
+                continue
+            results.append(
+                {
+                    "entities": entities,
+                    "model": "da_core_news_lg",
+                    "processed_at": processed_at,
+                }
+            )
+        logger.debug("named_entity_extractor.batch_done", batch_size=len(records))
+        return results
@@ -0,0 +1,212 @@
+"""Batch execution engine for content enrichers.
+
+Owned by the Core Application Engineer.
+
+:class:`EnrichmentPipeline` runs a fixed set of
+:class:`~issue_observatory.analysis.enrichments.base.ContentEnricher`
+instances over one batch of content records at a time:
+
+- Each enricher receives the whole applicable slice of the batch through
+  :meth:`~issue_observatory.analysis.enrichments.base.ContentEnricher.enrich_batch`,
+  so libraries with native batching (spaCy ``nlp.pipe``) can use it.
+- In-process enrichers share a single ``run_async()`` call per batch on the
+  worker's persistent event loop instead of one event loop per record.
+- When ``process_workers > 0``, enrichers flagged ``cpu_bound`` are
+  dispatched to a :class:`~concurrent.futures.ProcessPoolExecutor` and run
+  concurrently with the in-process enrichers.  If the pool cannot be used —
+  most notably inside a Celery prefork child, whose daemonic processes may
+  not spawn children — the pipeline logs a warning and falls back to
+  in-process execution for the rest of its lifetime.
+
+The pipeline performs no I/O; callers persist :class:`BatchOutcome` results
+(see ``workers/_enrichment_helpers.write_enrichments_batch``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from issue_observatory.analysis.enrichments.base import ContentEnricher
+
+logger = structlog.get_logger(__name__)
+
+
+def _run_enrich_batch(
+    enricher: ContentEnricher, records: list[dict[str, Any]]
+) -> list[dict[str, Any] | Exception]:
+    """Process-pool entry point: run one enricher over one slice of records."""
+    return asyncio.run(enricher.enrich_batch(records))
+
+
+@dataclass
+class BatchOutcome:
+    """Results of running the pipeline over one batch of records.
+
+    Attributes:
+        results: Per-record enrichment payloads keyed by record id, then by
+            ``enricher_name``.  Ready for a single multi-enricher write.
+        relational: ``(enricher, record, result)`` triples for enrichers
+            that also write to a relational table via ``write_relational``.
+        errors: ``(enricher_name, record_id, exception)`` for every record
+            an enricher failed on.
+    """
+
+    results: dict[Any, dict[str, dict[str, Any]]] = field(default_factory=dict)
+    relational: list[tuple[ContentEnricher, dict[str, Any], dict[str, Any]]] = field(
+        default_factory=list
+    )
+    errors: list[tuple[str, Any, Exception]] = field(default_factory=list)
+
+    @property
+    def enrichments_applied(self) -> int:
+        """Total number of successful (record, enricher) results."""
+        return sum(len(by_enricher) for by_enricher in self.results.values())
+
+
+class EnrichmentPipeline:
+    """Run several enrichers over batches of content records.
+
+    Args:
+        enrichers: The enrichers to apply, in order.
+        process_workers: Size of the process pool used for ``cpu_bound``
+            enrichers.  ``0`` (the default) runs everything in-process.
+
+    Usage::
+
+        with EnrichmentPipeline(enrichers, process_workers=2) as pipeline:
+            for batch in batches:
+                outcome = pipeline.run_batch(batch)
+    """
+
+    def __init__(
+        self,
+        enrichers: Sequence[ContentEnricher],
+        process_workers: int = 0,
+    ) -> None:
+        self.enrichers = list(enrichers)
+        self._process_workers = max(process_workers, 0)
+        self._pool: ProcessPoolExecutor | None = None
+        self._pool_disabled = not any(e.cpu_bound for e in self.enrichers)
+
+    def __enter__(self) -> EnrichmentPipeline:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the process pool, if one was started."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+
+    def run_batch(self, records: list[dict[str, Any]]) -> BatchOutcome:
+        """Apply every enricher to the records it is applicable to.
+
+        Args:
+            records: Content record dicts; each must carry an ``id`` key.
+
+        Returns:
+            A :class:`BatchOutcome` with successes, relational follow-ups and
+            per-record errors.
+        """
+        from issue_observatory.workers.runtime import run_async
+
+        slices: list[tuple[ContentEnricher, list[dict[str, Any]]]] = []
+        for enricher in self.enrichers:
+            applicable = [r for r in records if enricher.is_applicable(r)]
+            if applicable:
+                slices.append((enricher, applicable))
+
+        remote: list[tuple[ContentEnricher, list[dict[str, Any]], Future[Any]]] = []
+        local: list[tuple[ContentEnricher, list[dict[str, Any]]]] = []
+        for enricher, applicable in slices:
+            future = self._submit(enricher, applicable) if enricher.cpu_bound else None
+            if future is not None:
+                remote.append((enricher, applicable, future))
+            else:
+                local.append((enricher, applicable))
+
+        outcome = BatchOutcome()
+        if local:
+            local_results = run_async(self._run_local(local))
+            for (enricher, applicable), results in zip(local, local_results, strict=True):
+                self._collect(outcome, enricher, applicable, results)
+
+        for enricher, applicable, future in remote:
+            try:
+                results = future.result()
+            except Exception as exc:
+                logger.warning(
+                    "enrichment_pipeline.process_pool_failed",
+                    enricher=enricher.enricher_name,
+                    error=str(exc),
+                )
+                self._disable_pool()
+                results = run_async(enricher.enrich_batch(applicable))
+            self._collect(outcome, enricher, applicable, results)
+
+        return outcome
+
+    @staticmethod
+    async def _run_local(
+        work: list[tuple[ContentEnricher, list[dict[str, Any]]]],
+    ) -> list[list[dict[str, Any] | Exception]]:
+        """Run in-process enrichers on one shared event loop."""
+        return [await enricher.enrich_batch(applicable) for enricher, applicable in work]
+
+    def _submit(
+        self, enricher: ContentEnricher, records: list[dict[str, Any]]
+    ) -> Future[Any] | None:
+        """Submit *records* to the process pool, or return None to run locally."""
+        if self._process_workers == 0 or self._pool_disabled:
+            return None
+        try:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self._process_workers)
+            return self._pool.submit(_run_enrich_batch, enricher, records)
+        except Exception as exc:
+            logger.warning(
+                "enrichment_pipeline.process_pool_unavailable",
+                enricher=enricher.enricher_name,
+                error=str(exc),
+            )
+            self._disable_pool()
+            return None
+
+    def _disable_pool(self) -> None:
+        """Fall back to in-process execution for the rest of this pipeline."""
+        self._pool_disabled = True
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    @staticmethod
+    def _collect(
+        outcome: BatchOutcome,
+        enricher: ContentEnricher,
+        records: list[dict[str, Any]],
+        results: list[dict[str, Any] | Exception],
+    ) -> None:
+        """Fold one enricher's batch results into *outcome*."""
+        relational = hasattr(enricher, "write_relational")
+        for record, result in zip(records, results, strict=True):
+            record_id = record.get("id")
+            if isinstance(result, Exception):
+                outcome.errors.append((enricher.enricher_name, record_id, result))
+                continue
+            outcome.results.setdefault(record_id, {})[enricher.enricher_name] = result
+            if relational:
+                outcome.relational.append((enricher, record, result))
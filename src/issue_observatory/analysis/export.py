@@ -34,13 +34,14 @@ Owned by the DB Engineer.
 from __future__ import annotations
 
 import io
+import itertools
 import json
 import uuid as uuid_mod
 import xml.etree.ElementTree as ET
 from collections import defaultdict
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Callable, Iterable
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, BinaryIO
 
 import structlog
 
@@ -128,6 +129,113 @@ def _safe_str(value: Any) -> str:
     return str(value)
 
 
+def _json_default(obj: Any) -> str:
+    """``json.dumps`` fallback serializing datetimes and UUIDs to strings."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, uuid_mod.UUID):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _xlsx_row(rec: dict[str, Any], columns: list[str]) -> list[Any]:
+    """Return the worksheet cell values for one record.
+
+    Datetimes are kept as (naive) datetimes so Excel formats them as date
+    cells; lists are joined with ``|`` like the CSV exporter.
+    """
+    row_values: list[Any] = []
+    for col in columns:
+        val = rec.get(col)
+        if val is None:
+            row_values.append("")
+        elif isinstance(val, list):
+            row_values.append(" | ".join(str(v) for v in val))
+        elif isinstance(val, datetime):
+            # Keep as datetime so Excel formats it as a date cell.
+            row_values.append(val.replace(tzinfo=None))
+        elif isinstance(val, uuid_mod.UUID):
+            row_values.append(str(val))
+        else:
+            row_values.append(val)
+    return row_values
+
+
+# ---------------------------------------------------------------------------
+# Parquet schema helpers (shared by buffered and streaming writers)
+# ---------------------------------------------------------------------------
+
+_PARQUET_INT_COLS: frozenset[str] = frozenset(
+    {"views_count", "likes_count", "shares_count", "comments_count", "search_rank"}
+)
+_PARQUET_FLOAT_COLS: frozenset[str] = frozenset({"engagement_score"})
+_PARQUET_TS_COLS: frozenset[str] = frozenset({"published_at"})
+
+
+def _parquet_schema() -> Any:
+    """Return the pyarrow schema used for Parquet exports of ``_FLAT_COLUMNS``."""
+    import pyarrow as pa
+
+    schema_fields = []
+    for col in _FLAT_COLUMNS:
+        if col in _PARQUET_INT_COLS:
+            schema_fields.append(pa.field(col, pa.int64()))
+        elif col in _PARQUET_FLOAT_COLS:
+            schema_fields.append(pa.field(col, pa.float64()))
+        elif col in _PARQUET_TS_COLS:
+            schema_fields.append(pa.field(col, pa.timestamp("us", tz="UTC")))
+        elif col == "search_terms_matched":
+            schema_fields.append(pa.field(col, pa.list_(pa.string())))
+        else:
+            schema_fields.append(pa.field(col, pa.string()))
+    return pa.schema(schema_fields)
+
+
+def _parquet_table(records: list[dict[str, Any]]) -> Any:
+    """Convert *records* to a pyarrow ``Table`` matching :func:`_parquet_schema`.
+
+    Args:
+        records: List of content record dicts.
+
+    Returns:
+        A ``pyarrow.Table`` with one column per entry in ``_FLAT_COLUMNS``.
+    """
+    import pyarrow as pa
+
+    column_data: dict[str, list[Any]] = {col: [] for col in _FLAT_COLUMNS}
+
+    for rec in records:
+        for col in _FLAT_COLUMNS:
+            val = rec.get(col)
+            if col in _PARQUET_INT_COLS:
+                column_data[col].append(int(val) if val is not None else None)
+            elif col in _PARQUET_FLOAT_COLS:
+                column_data[col].append(float(val) if val is not None else None)
+            elif col in _PARQUET_TS_COLS:
+                if isinstance(val, datetime):
+                    # Convert to UTC-aware, then to microseconds timestamp
+                    if val.tzinfo is None:
+                        val = val.replace(tzinfo=UTC)
+                    column_data[col].append(val)
+                else:
+                    column_data[col].append(None)
+            elif col == "search_terms_matched":
+                if isinstance(val, list):
+                    column_data[col].append(val)
+                else:
+                    column_data[col].append([])
+            elif isinstance(val, uuid_mod.UUID):
+                column_data[col].append(str(val))
+            else:
+                column_data[col].append(str(val) if val is not None else None)
+
+    schema = _parquet_schema()
+    arrays = [
+        pa.array(column_data[field.name], type=field.type) for field in schema
+    ]
+    return pa.table(dict(zip(_FLAT_COLUMNS, arrays, strict=True)), schema=schema)
+
+
 class ContentExporter:
     """Export content records to various file formats.
 
@@ -143,6 +251,10 @@ class ContentExporter:
         return Response(content=data, media_type="text/csv; charset=utf-8")
     """
 
+    #: Formats :meth:`write_stream` can serialize incrementally.  GEXF needs
+    #: the full record set to build the graph and is always buffered.
+    STREAMING_FORMATS: frozenset[str] = frozenset({"csv", "xlsx", "json", "parquet"})
+
     # ------------------------------------------------------------------
     # CSV
     # ------------------------------------------------------------------
@@ -303,21 +415,7 @@ class ContentExporter:
 
         # Write data rows (read data by snake_case column name).
         for rec in records:
-            row_values = []
-            for col in columns:
-                val = rec.get(col)
-                if val is None:
-                    row_values.append("")
-                elif isinstance(val, list):
-                    row_values.append(" | ".join(str(v) for v in val))
-                elif isinstance(val, datetime):
-                    # Keep as datetime so Excel formats it as a date cell.
-                    row_values.append(val.replace(tzinfo=None))
-                elif isinstance(val, uuid_mod.UUID):
-                    row_values.append(str(val))
-                else:
-                    row_values.append(val)
-            ws.append(row_values)
+            ws.append(_xlsx_row(rec, columns))
 
         # Auto-size columns based on header label width + first 100 data rows.
         for col_idx, header_label in enumerate(headers, start=1):
@@ -353,17 +451,8 @@ class ContentExporter:
         Returns:
             UTF-8 encoded NDJSON bytes.
         """
-        import uuid
-
-        def _default(obj: Any) -> str:
-            if isinstance(obj, datetime):
-                return obj.isoformat()
-            if isinstance(obj, uuid.UUID):
-                return str(obj)
-            raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
-
         lines = [
-            json.dumps(rec, ensure_ascii=False, default=_default) for rec in records
+            json.dumps(rec, ensure_ascii=False, default=_json_default) for rec in records
         ]
         return "\n".join(lines).encode("utf-8")
 
@@ -391,7 +480,6 @@ class ContentExporter:
             ImportError: If ``pyarrow`` is not installed.
         """
         try:
-            import pyarrow as pa
             import pyarrow.parquet as pq
         except ImportError as exc:
             raise ImportError(
@@ -399,76 +487,193 @@ class ContentExporter:
                 "Install it with: pip install 'pyarrow>=15.0,<16.0'"
             ) from exc
 
-        import uuid
+        table = _parquet_table(records)
+        buf = io.BytesIO()
+        pq.write_table(table, buf)
+        return buf.getvalue()
 
-        string_cols = [
-            "platform", "arena", "arena_category", "content_type",
-            "title", "text_content",
-            "url", "links", "author_display_name", "pseudonymized_author_id",
-            "language", "content_hash",
-        ]
-        int_cols = ["views_count", "likes_count", "shares_count", "comments_count", "search_rank"]
-        float_cols = ["engagement_score"]
-        ts_cols = ["published_at"]
+    # ------------------------------------------------------------------
+    # Streaming file writers — background exports of unbounded size
+    # ------------------------------------------------------------------
 
-        column_data: dict[str, list[Any]] = {col: [] for col in _FLAT_COLUMNS}
+    def write_stream(
+        self,
+        batches: Iterable[list[dict[str, Any]]],
+        export_format: str,
+        fileobj: BinaryIO,
+        on_batch: Callable[[int], None] | None = None,
+    ) -> int:
+        """Serialize record batches incrementally into *fileobj*.
+
+        Unlike the ``export_*`` methods, which build the whole file as an
+        in-memory ``bytes`` object, this writes each batch as soon as it
+        arrives so peak memory is bounded by one batch regardless of export
+        size.  Output is byte-compatible with the buffered exporters except
+        that Parquet files contain one row group per batch and XLSX column
+        widths are sized from the first batch only.
+
+        Used by the ``export_content_records`` Celery task, which feeds
+        batches straight from a server-side database cursor and spools the
+        output to a temporary file before uploading it.  The method is
+        synchronous because the work is CPU- and file-bound.
 
-        for rec in records:
-            for col in _FLAT_COLUMNS:
-                val = rec.get(col)
-                if col in int_cols:
-                    column_data[col].append(int(val) if val is not None else None)
-                elif col in float_cols:
-                    column_data[col].append(float(val) if val is not None else None)
-                elif col in ts_cols:
-                    if isinstance(val, datetime):
-                        # Convert to UTC-aware, then to microseconds timestamp
-                        if val.tzinfo is None:
-                            val = val.replace(tzinfo=UTC)
-                        column_data[col].append(val)
-                    else:
-                        column_data[col].append(None)
-                elif col == "search_terms_matched":
-                    if isinstance(val, list):
-                        column_data[col].append(val)
-                    else:
-                        column_data[col].append([])
-                elif isinstance(val, uuid.UUID):
-                    column_data[col].append(str(val))
-                else:
-                    column_data[col].append(str(val) if val is not None else None)
+        Args:
+            batches: Iterable of record-dict lists (same shape as
+                :meth:`export_csv`).  Consumed exactly once.
+            export_format: One of :data:`STREAMING_FORMATS`.
+            fileobj: Writable binary file object (e.g. a temporary file).
+            on_batch: Optional callback invoked after each batch with the
+                cumulative number of rows written, for progress reporting.
 
-        schema_fields = []
-        for col in _FLAT_COLUMNS:
-            if col in int_cols:
-                schema_fields.append(pa.field(col, pa.int64()))
-            elif col in float_cols:
-                schema_fields.append(pa.field(col, pa.float64()))
-            elif col in ts_cols:
-                schema_fields.append(pa.field(col, pa.timestamp("us", tz="UTC")))
-            elif col == "search_terms_matched":
-                schema_fields.append(pa.field(col, pa.list_(pa.string())))
-            else:
-                schema_fields.append(pa.field(col, pa.string()))
+        Returns:
+            Total number of records written.
 
-        schema = pa.schema(schema_fields)
-        arrays = []
-        for col in _FLAT_COLUMNS:
-            if col in int_cols:
-                arrays.append(pa.array(column_data[col], type=pa.int64()))
-            elif col in float_cols:
-                arrays.append(pa.array(column_data[col], type=pa.float64()))
-            elif col in ts_cols:
-                arrays.append(pa.array(column_data[col], type=pa.timestamp("us", tz="UTC")))
-            elif col == "search_terms_matched":
-                arrays.append(pa.array(column_data[col], type=pa.list_(pa.string())))
-            else:
-                arrays.append(pa.array(column_data[col], type=pa.string()))
+        Raises:
+            ValueError: If *export_format* does not support streaming.
+            ImportError: If the format's optional dependency is missing.
+        """
+        writers = {
+            "csv": self._write_csv_stream,
+            "xlsx": self._write_xlsx_stream,
+            "json": self._write_json_stream,
+            "parquet": self._write_parquet_stream,
+        }
+        if export_format not in self.STREAMING_FORMATS:
+            raise ValueError(f"Export format {export_format!r} does not support streaming")
+        return writers[export_format](batches, fileobj, on_batch)
 
-        table = pa.table(dict(zip(_FLAT_COLUMNS, arrays, strict=True)), schema=schema)
-        buf = io.BytesIO()
-        pq.write_table(table, buf)
-        return buf.getvalue()
+    @staticmethod
+    def _write_csv_stream(
+        batches: Iterable[list[dict[str, Any]]],
+        fileobj: BinaryIO,
+        on_batch: Callable[[int], None] | None,
+    ) -> int:
+        import csv  # stdlib — always available
+
+        columns = list(_FLAT_COLUMNS)
+        buf = io.StringIO()
+        writer = csv.writer(buf, lineterminator="\r\n")
+        writer.writerow([_COLUMN_HEADERS.get(col, col) for col in columns])
+        # UTF-8 BOM so Excel auto-detects encoding for Danish characters (æøå).
+        fileobj.write("\ufeff".encode() + buf.getvalue().encode("utf-8"))
+
+        total = 0
+        for batch in batches:
+            buf.seek(0)
+            buf.truncate(0)
+            for rec in batch:
+                writer.writerow([_safe_str(rec.get(col)) for col in columns])
+            fileobj.write(buf.getvalue().encode("utf-8"))
+            total += len(batch)
+            if on_batch is not None:
+                on_batch(total)
+        return total
+
+    @staticmethod
+    def _write_json_stream(
+        batches: Iterable[list[dict[str, Any]]],
+        fileobj: BinaryIO,
+        on_batch: Callable[[int], None] | None,
+    ) -> int:
+        total = 0
+        for batch in batches:
+            if not batch:
+                continue
+            lines = "\n".join(
+                json.dumps(rec, ensure_ascii=False, default=_json_default) for rec in batch
+            )
+            # Records are newline-separated with no trailing newline, matching
+            # export_json().
+            fileobj.write((("\n" if total else "") + lines).encode("utf-8"))
+            total += len(batch)
+            if on_batch is not None:
+                on_batch(total)
+        return total
+
+    @staticmethod
+    def _write_xlsx_stream(
+        batches: Iterable[list[dict[str, Any]]],
+        fileobj: BinaryIO,
+        on_batch: Callable[[int], None] | None,
+        sheet_name: str = "Content",
+    ) -> int:
+        try:
+            import openpyxl
+            from openpyxl.cell import WriteOnlyCell
+            from openpyxl.styles import Font
+        except ImportError as exc:
+            raise ImportError(
+                "openpyxl is required for XLSX export. "
+                "Install it with: pip install 'openpyxl>=3.1,<4.0'"
+            ) from exc
+
+        # Write-only mode streams rows to disk instead of keeping every cell
+        # object in memory.
+        wb = openpyxl.Workbook(write_only=True)
+        ws = wb.create_sheet(sheet_name[:31])  # Excel limit
+        ws.freeze_panes = "A2"
+
+        columns = list(_FLAT_COLUMNS)
+        headers = [_COLUMN_HEADERS.get(col, col) for col in columns]
+
+        batch_iter = iter(batches)
+        first_batch = next(batch_iter, [])
+
+        # Column widths must be set before the first row in write-only mode,
+        # so size them from the header plus the first 100 rows of batch one.
+        sample_rows = [_xlsx_row(rec, columns) for rec in first_batch[:100]]
+        for col_idx, header_label in enumerate(headers, start=1):
+            max_len = len(header_label)
+            for row_values in sample_rows:
+                cell_val = row_values[col_idx - 1]
+                if cell_val is not None:
+                    max_len = max(max_len, len(str(cell_val)))
+            col_letter = openpyxl.utils.get_column_letter(col_idx)
+            ws.column_dimensions[col_letter].width = min(max_len + 2, 80)
+
+        header_cells = []
+        for label in headers:
+            cell = WriteOnlyCell(ws, value=label)
+            cell.font = Font(bold=True)
+            header_cells.append(cell)
+        ws.append(header_cells)
+
+        total = 0
+        for batch in itertools.chain([first_batch], batch_iter):
+            for rec in batch:
+                ws.append(_xlsx_row(rec, columns))
+            total += len(batch)
+            if on_batch is not None and batch:
+                on_batch(total)
+
+        wb.save(fileobj)
+        return total
+
+    @staticmethod
+    def _write_parquet_stream(
+        batches: Iterable[list[dict[str, Any]]],
+        fileobj: BinaryIO,
+        on_batch: Callable[[int], None] | None,
+    ) -> int:
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as exc:
+            raise ImportError(
+                "pyarrow is required for Parquet export. "
+                "Install it with: pip install 'pyarrow>=15.0,<16.0'"
+            ) from exc
+
+        total = 0
+        # One row group per batch keeps only the current batch in memory.
+        with pq.ParquetWriter(fileobj, _parquet_schema()) as writer:
+            for batch in batches:
+                if not batch:
+                    continue
+                writer.write_table(_parquet_table(batch))
+                total += len(batch)
+                if on_batch is not None:
+                    on_batch(total)
+        return total
 
     # ------------------------------------------------------------------
     # GEXF — shared serialization helper
@@ -8,6 +8,9 @@ filtering followed by disparity filter backboning (Serrano et al. 2009).
 
 Inspired by some2net for bipartite construction and guidedLP for projection
 weighting and backboning. Pure Python implementation — no networkx dependency.
+Unipartite projection is vectorized with ``scipy.sparse`` when SciPy is
+installed (``pip install issue-observatory[ml]``) and falls back to a
+pure-Python pair loop otherwise.
 """
 from __future__ import annotations
 
@@ -810,9 +813,11 @@ def project_to_unipartite(
     2. **Top-K retained node reduction** — if estimated pairs exceed
        ``max_projected_edges``, keep only the top-K retained nodes ranked
        by bipartite degree (number of collapsed neighbors) and total weight.
-       K is found via binary search to bring estimated pairs just under the cap.
-    3. **Hard cap during projection** — if unique edges exceed the cap during
-       the inner loop, projection halts and the top edges by weight are kept.
+       K is found in one pass over the ranked nodes to bring estimated pairs
+       just under the cap.
+    3. **Hard cap during projection** — with SciPy, all pair weights are
+       computed by sparse products and only the top ``max_projected_edges``
+       by weight are kept; without it, the pair loop halts at the cap.
 
     Args:
         bipartite_edges: Dict mapping retained nodes to their collapsed neighbors with weights.
@@ -874,7 +879,12 @@ def project_to_unipartite(
         estimated_pairs = new_estimate
 
     # --- Stage 3: Projection with hard cap ---
-    projected_edges, capped = _project_edges(inverted, max_projected_edges)
+    sparse_result = _project_edges_sparse(inverted, max_projected_edges, min_weight)
+    if sparse_result is not None:
+        edge_triples, capped = sparse_result
+    else:
+        projected_edges, capped = _project_edges(inverted, max_projected_edges)
+        edge_triples = [(a, b, w) for (a, b), w in projected_edges.items() if w >= min_weight]
     if capped:
         warnings.append(
             f"Projection reached {max_projected_edges:,} unique edge cap. "
@@ -886,9 +896,7 @@ def project_to_unipartite(
     edges: list[dict] = []
     node_ids: set[str] = set()
 
-    for (a, b), weight in projected_edges.items():
-        if weight < min_weight:
-            continue
+    for a, b, weight in edge_triples:
         for node_id in (a, b):
             if node_id not in node_ids:
                 nodes.append({
@@ -933,36 +941,33 @@ def _reduce_retained_nodes(
     """Reduce retained nodes via top-K selection to fit within the edge cap.
 
     Ranks retained nodes by (bipartite_degree, total_weight) descending, then
-    binary-searches for the smallest K where estimated pairs <= cap.
+    adds them in rank order while maintaining the estimate incrementally:
+    a node joining a collapsed node that already has k kept neighbors adds
+    k pairs.  The estimate grows monotonically with K, so the first node that
+    would exceed the cap ends the pass.  At least 10 nodes are always kept.
 
     Returns:
         Tuple of (rebuilt inverted index, K kept).
     """
     # Rank retained nodes by bipartite degree and total weight
-    retained_degree: dict[str, int] = defaultdict(int)
-    retained_total_weight: dict[str, int] = defaultdict(int)
-    for retained, neighbors in bipartite_edges.items():
-        retained_degree[retained] = len(neighbors)
-        retained_total_weight[retained] = sum(neighbors.values())
-
     ranked = sorted(
-        retained_degree.keys(),
-        key=lambda r: (retained_degree[r], retained_total_weight[r]),
+        bipartite_edges,
+        key=lambda r: (len(bipartite_edges[r]), sum(bipartite_edges[r].values())),
         reverse=True,
     )
 
-    # Binary search for the largest K where estimated pairs <= cap.
-    # More K → more pairs (monotonically increasing), so find the rightmost
-    # K where the estimate fits.
-    lo, hi = 10, len(ranked)
-    while lo < hi:
-        mid = (lo + hi + 1) // 2  # round up to avoid infinite loop
-        keep = set(ranked[:mid])
-        est = _estimate_projected_pairs(inverted, keep)
-        if est <= max_projected_edges:
-            lo = mid  # this K fits, try keeping more
-        else:
-            hi = mid - 1  # too many pairs, try fewer nodes
+    kept_per_collapsed: dict[str, int] = defaultdict(int)
+    estimate = 0
+    lo = 0
+    for retained in ranked:
+        neighbors = [c for c in bipartite_edges[retained] if c in inverted]
+        added = sum(kept_per_collapsed[c] for c in neighbors)
+        if estimate + added > max_projected_edges and lo >= 10:
+            break
+        estimate += added
+        for c in neighbors:
+            kept_per_collapsed[c] += 1
+        lo += 1
 
     keep = set(ranked[:lo])
 
@@ -1007,6 +1012,107 @@ def _project_edges(
     return projected_edges, capped
 
 
+def _project_edges_sparse(
+    inverted: dict[str, dict[str, int]],
+    max_edges: int,
+    min_weight: int = 1,
+) -> tuple[list[tuple[str, str, int]], bool] | None:
+    """Vectorized projection over a sparse retained x collapsed incidence matrix.
+
+    ``min``-weighted co-occurrence is computed by layer-cake decomposition:
+    for integer weights, ``min(a, b) = sum over levels l of
+    (l - l_prev) * [a >= l] * [b >= l]``, so each distinct weight level
+    contributes one binary sparse product ``B_l @ B_l.T``.  Entries below
+    the level and collapsed nodes left with fewer than two entries are
+    dropped as the level rises, so higher levels are cheap.
+
+    When more than *max_edges* pairs result, the heaviest *max_edges* are
+    kept.  Pairs lighter than *min_weight* are dropped afterwards.
+
+    Returns:
+        Tuple of (``(a, b, weight)`` edges with ``a < b``, capped bool), or
+        ``None`` when SciPy is not installed.
+    """
+    try:
+        import numpy as np
+        from scipy import sparse
+    except ImportError:
+        return None
+
+    names: list[str] = []
+    index: dict[str, int] = {}
+    rows: list[int] = []
+    cols: list[int] = []
+    data: list[int] = []
+    n_cols = 0
+    for retained_nodes in inverted.values():
+        if len(retained_nodes) < 2:
+            continue
+        for retained, weight in retained_nodes.items():
+            i = index.get(retained)
+            if i is None:
+                i = index[retained] = len(names)
+                names.append(retained)
+            rows.append(i)
+            cols.append(n_cols)
+            data.append(weight)
+        n_cols += 1
+    if not data:
+        return [], False
+
+    row_arr = np.asarray(rows, dtype=np.int64)
+    col_arr = np.asarray(cols, dtype=np.int64)
+    weight_arr = np.asarray(data, dtype=np.int64)
+    n = len(names)
+    pieces: list[Any] = []
+    previous = 0
+    for level in np.unique(weight_arr):
+        keep = weight_arr >= level
+        row_arr, col_arr, weight_arr = row_arr[keep], col_arr[keep], weight_arr[keep]
+        shared = np.bincount(col_arr, minlength=n_cols)[col_arr] >= 2
+        row_arr, col_arr, weight_arr = row_arr[shared], col_arr[shared], weight_arr[shared]
+        if row_arr.size == 0:
+            break
+        incidence = sparse.csr_matrix(
+            (np.ones(row_arr.size, dtype=np.int64), (row_arr, col_arr)),
+            shape=(n, n_cols),
+        )
+        co_occurrence = (incidence @ incidence.T).tocoo()
+        upper = co_occurrence.row < co_occurrence.col
+        pieces.append((
+            co_occurrence.row[upper],
+            co_occurrence.col[upper],
+            co_occurrence.data[upper] * int(level - previous),
+        ))
+        previous = int(level)
+    if not pieces:
+        return [], False
+
+    # Summing duplicates across levels happens once, in the COO -> CSR step.
+    total = sparse.coo_matrix(
+        (
+            np.concatenate([p[2] for p in pieces]),
+            (np.concatenate([p[0] for p in pieces]), np.concatenate([p[1] for p in pieces])),
+        ),
+        shape=(n, n),
+    ).tocsr().tocoo()
+    pair_rows, pair_cols, pair_weights = total.row, total.col, total.data
+    capped = pair_weights.size > max_edges
+    if capped:
+        top = np.argpartition(-pair_weights, max_edges - 1)[:max_edges]
+        pair_rows, pair_cols, pair_weights = pair_rows[top], pair_cols[top], pair_weights[top]
+    heavy = pair_weights >= min_weight
+    pair_rows, pair_cols, pair_weights = pair_rows[heavy], pair_cols[heavy], pair_weights[heavy]
+
+    edges: list[tuple[str, str, int]] = []
+    for i, j, weight in zip(
+        pair_rows.tolist(), pair_cols.tolist(), pair_weights.tolist(), strict=True
+    ):
+        a, b = names[i], names[j]
+        edges.append((a, b, weight) if a < b else (b, a, weight))
+    return edges, capped
+
+
 def extract_giant_component(graph: dict) -> dict:
     """Extract the largest connected component using BFS.
 
@@ -0,0 +1,349 @@
+"""Incremental term statistics for TF-IDF emergent-term extraction.
+
+:func:`~issue_observatory.analysis.descriptive.get_emergent_terms` used to
+fit a scikit-learn ``TfidfVectorizer`` on up to 10,000 texts inside the
+request handler.  This module replaces that with an additive vocabulary /
+document-frequency store, :class:`TermStatistics`, so that:
+
+- Repeat calls only tokenize records added since the previous computation;
+  the store is persisted between calls, its vocabulary split into
+  :data:`VOCABULARY_CHUNKS` chunks (see
+  :meth:`~issue_observatory.core.analysis_cache.AnalysisCache.load_state`).
+- The CPU-bound work — decoding the stored vocabulary, tokenizing, merging,
+  re-encoding and ranking — runs in a process pool (:func:`update_and_rank`
+  via :func:`run_cpu_bound`) instead of on the API event loop.
+
+Scoring
+-------
+Each document contributes its L2-normalised raw term frequencies to a
+per-term running sum.  A term's score is its smoothed inverse document
+frequency, ``ln((1 + n) / (1 + df)) + 1`` (the ``TfidfVectorizer``
+default), times the mean of those normalised frequencies over all ``n``
+documents.  This differs from scikit-learn's mean TF-IDF only in applying
+the L2 normalisation before, rather than after, IDF weighting — the price
+of making the statistics additive.
+
+Tokenization matches the previous vectorizer: lowercase, token pattern
+``[a-z0-9æøå]{2,}``, Danish and English stop words removed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+import re
+import zlib
+from collections import Counter
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from multiprocessing import get_context
+from typing import TYPE_CHECKING, Any, TypeVar
+
+import structlog
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9æøå]{2,}")
+
+_DANISH_STOP_WORDS = frozenset({
+    "og", "i", "at", "er", "en", "et", "den", "det", "de", "til", "for",
+    "af", "med", "der", "har", "var", "som", "han", "hun", "på", "kan",
+    "vil", "skal", "fra", "over", "under", "efter", "inden", "mellem",
+    "mod", "om", "sig", "sin", "sit", "sine", "ud", "op", "ned", "ind",
+    "hen", "ad", "meg", "dig", "ham", "hende", "dem", "os", "jer", "mig",
+    "mit", "min", "mine", "dit", "din", "dine", "hans", "hennes", "dens",
+    "dets", "vores", "jeres", "deres", "denne", "dette", "disse", "her",
+    "hvor", "når", "da", "hvis", "fordi", "men", "eller", "så",
+    "end", "også", "kun", "jo", "nu", "ved", "se", "gå", "gøre", "gør",
+    "have", "hav", "gik", "blev", "fået", "fik", "aldrig", "ingen", "alle",
+    "mange", "få", "noget", "intet", "nogen", "hver", "meget", "mere",
+    "mest", "andet", "andre", "hvad", "hvilken", "hvilket", "hvilke",
+    "hvem", "hvordan", "hvorfor", "hvorhen", "hvornår", "ja", "nej", "ikke",
+    "være", "været", "bliver", "blive", "havde", "skulle", "kunne", "ville",
+    "måtte", "blevet", "gjort", "sagt",
+    "kom", "kommer", "komme", "gjorde", "tag", "tage",
+    "tager", "tog", "taget", "før", "siden", "senere", "længe", "altid",
+    "ofte", "nogle", "heller", "hverken", "enten", "både",
+    # Additional common Danish words from UX testing
+    "vi", "du", "siger", "sige", "sagde", "fortæller", "fortælle",
+    "fortalt", "laver", "lave", "lavet", "lavede", "får",
+    "giver", "give", "givet", "gav", "stor", "store", "lidt",
+    "helt", "godt", "god", "dårlig", "dårligt", "nye", "ny", "nyt",
+    "gammel", "gamle", "lang", "langt", "lange", "kort", "korte", "høj",
+    "høje", "lav", "rigtig", "rigtigt", "forkert", "gerne",
+    "vist", "nok", "vel", "lige", "blot", "bare", "især", "særligt",
+    "omkring", "cirka", "altså", "nemlig", "dog", "imidlertid",
+    "derfor", "dermed", "derudover", "desuden", "dertil", "således",
+    "samtidig", "imens", "mens", "selvom", "skønt", "undtagen", "uden",
+    "indtil", "gennem", "blandt", "samt", "ligesom", "eftersom", "såfremt", "medmindre",
+})
+
+_ENGLISH_STOP_WORDS = frozenset({
+    "the", "a", "an", "is", "are", "was", "were", "be", "been", "being",
+    "have", "has", "had", "having", "do", "does", "did", "doing", "will",
+    "would", "shall", "should", "can", "could", "may", "might", "must",
+    "to", "of", "in", "for", "on", "with", "at", "by", "from", "as",
+    "into", "through", "during", "before", "after", "above", "below",
+    "between", "out", "off", "over", "under", "again", "further", "then",
+    "once", "here", "there", "when", "where", "why", "how", "all", "both",
+    "each", "few", "more", "most", "other", "some", "such", "no", "nor",
+    "not", "only", "own", "same", "so", "than", "too", "very", "just",
+    "about", "and", "but", "or", "if", "while", "although", "because",
+    "until", "it", "its", "this", "that", "these", "those", "i", "me",
+    "my", "mine", "we", "us", "our", "ours", "you", "your", "yours",
+    "he", "him", "his", "she", "her", "hers", "they", "them", "their",
+    "theirs", "what", "which", "who", "whom", "whose", "am", "become",
+    "becomes", "became", "get", "gets", "got", "gotten",
+    "make", "makes", "made", "go", "goes", "went", "gone", "take", "takes",
+    "took", "taken", "come", "comes", "came", "know", "knows", "knew",
+    "known", "think", "thinks", "thought", "see", "sees", "saw", "seen",
+    "say", "says", "said", "give", "gives", "gave", "given", "find",
+    "finds", "found", "tell", "tells", "told", "ask", "asks", "asked",
+    "work", "works", "worked", "seem", "seems", "seemed", "feel", "feels",
+    "felt", "try", "tries", "tried", "leave", "leaves", "left", "call",
+    "calls", "called",
+})
+
+STOP_WORDS: frozenset[str] = _DANISH_STOP_WORDS | _ENGLISH_STOP_WORDS
+"""Danish and English stop words never counted as emergent terms."""
+
+
+VOCABULARY_CHUNKS = 32
+"""Number of chunks the stored vocabulary is split into, by term hash."""
+
+
+def tokenize(text: str) -> list[str]:
+    """Split *text* into lowercase tokens, dropping stop words."""
+    return [t for t in _TOKEN_PATTERN.findall(text.lower()) if t not in STOP_WORDS]
+
+
+# ---------------------------------------------------------------------------
+# Statistics store
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class TermStatistics:
+    """Additive term statistics over a growing set of documents.
+
+    Attributes:
+        doc_count: Number of documents folded in so far.
+        document_frequency: Number of documents each term occurs in.
+        tf_norm_sum: Per-term sum of L2-normalised term frequencies.
+        watermark: ``[collected_at, id]`` of the newest document folded in,
+            as ISO / UUID strings; ``None`` for an empty store.
+    """
+
+    doc_count: int = 0
+    document_frequency: dict[str, int] = field(default_factory=dict)
+    tf_norm_sum: dict[str, float] = field(default_factory=dict)
+    watermark: list[str] | None = None
+
+    def add_documents(self, texts: list[str]) -> None:
+        """Fold *texts* into the statistics."""
+        df = self.document_frequency
+        tf_sum = self.tf_norm_sum
+        for text in texts:
+            counts = Counter(tokenize(text))
+            self.doc_count += 1
+            if not counts:
+                continue
+            norm = math.sqrt(sum(c * c for c in counts.values()))
+            for term, count in counts.items():
+                df[term] = df.get(term, 0) + 1
+                tf_sum[term] = tf_sum.get(term, 0.0) + count / norm
+
+    def rank(
+        self,
+        top_n: int,
+        min_doc_frequency: int = 2,
+        exclude: frozenset[str] | set[str] = frozenset(),
+    ) -> list[dict[str, Any]]:
+        """Return the *top_n* terms by mean TF-IDF score.
+
+        Args:
+            top_n: Number of terms to return.
+            min_doc_frequency: Minimum document frequency for a term.
+            exclude: Lowercase terms to leave out (e.g. existing search terms).
+
+        Returns:
+            ``[{"term", "score", "document_frequency"}, ...]`` ordered by
+            score descending.
+        """
+        n = self.doc_count
+        if n == 0:
+            return []
+        scored: list[tuple[float, str]] = []
+        for term, df in self.document_frequency.items():
+            if df < min_doc_frequency or term.isdigit() or term in exclude:
+                continue
+            idf = math.log((1 + n) / (1 + df)) + 1.0
+            scored.append((idf * self.tf_norm_sum[term] / n, term))
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return [
+            {
+                "term": term,
+                "score": round(score, 6),
+                "document_frequency": self.document_frequency[term],
+            }
+            for score, term in scored[:top_n]
+        ]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialise for storage as JSON."""
+        return {
+            "doc_count": self.doc_count,
+            "document_frequency": self.document_frequency,
+            "tf_norm_sum": self.tf_norm_sum,
+            "watermark": self.watermark,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> TermStatistics:
+        """Inverse of :meth:`to_dict`."""
+        return cls(
+            doc_count=int(data.get("doc_count", 0)),
+            document_frequency=dict(data.get("document_frequency") or {}),
+            tf_norm_sum=dict(data.get("tf_norm_sum") or {}),
+            watermark=data.get("watermark"),
+        )
+
+    def to_chunks(
+        self, chunks: int = VOCABULARY_CHUNKS
+    ) -> tuple[dict[str, Any], list[dict[str, list[float]]]]:
+        """Serialise as a small header plus the vocabulary split into *chunks*.
+
+        Terms are assigned to chunks by CRC-32, so the chunks stay evenly
+        sized as the vocabulary grows.
+
+        Returns:
+            ``(header, chunks)`` where each chunk maps a term to
+            ``[document_frequency, tf_norm_sum]``.
+        """
+        parts: list[dict[str, list[float]]] = [{} for _ in range(chunks)]
+        tf_sum = self.tf_norm_sum
+        for term, df in self.document_frequency.items():
+            parts[zlib.crc32(term.encode()) % chunks][term] = [df, tf_sum[term]]
+        header = {"doc_count": self.doc_count, "watermark": self.watermark}
+        return header, parts
+
+    @classmethod
+    def from_chunks(
+        cls, header: dict[str, Any], chunks: list[dict[str, list[float]]]
+    ) -> TermStatistics:
+        """Inverse of :meth:`to_chunks`."""
+        stats = cls(doc_count=int(header.get("doc_count", 0)), watermark=header.get("watermark"))
+        for chunk in chunks:
+            for term, (df, tf) in chunk.items():
+                stats.document_frequency[term] = int(df)
+                stats.tf_norm_sum[term] = tf
+        return stats
+
+
+def update_and_rank(
+    header: dict[str, Any] | None,
+    chunks: list[str] | None,
+    texts: list[str],
+    top_n: int,
+    min_doc_frequency: int,
+    exclude: frozenset[str],
+) -> tuple[dict[str, Any], list[str] | None, list[dict[str, Any]]]:
+    """Process-pool entry point: fold *texts* into stored statistics and rank.
+
+    Decoding the stored vocabulary, counting the new documents, re-encoding
+    and ranking all happen in the worker, so none of the work that grows
+    with the vocabulary runs on the API event loop.
+
+    Args:
+        header: Stored header (see :meth:`TermStatistics.to_chunks`), with
+            the watermark of *texts* already set; ``None`` for an empty store.
+        chunks: The stored vocabulary chunks as JSON strings, or ``None``.
+        texts: Documents not yet counted.
+        top_n: Number of terms to return.
+        min_doc_frequency: Minimum document frequency for a term.
+        exclude: Lowercase terms to leave out of the ranking.
+
+    Returns:
+        ``(header, chunks, ranked)``: the updated header and JSON-encoded
+        chunks (``chunks`` is ``None`` when *texts* is empty and there is
+        nothing new to store) and the ranking of
+        :meth:`TermStatistics.rank`.
+    """
+    stats = TermStatistics.from_chunks(
+        header or {}, [json.loads(chunk) for chunk in chunks or ()]
+    )
+    encoded: list[str] | None = None
+    if texts:
+        stats.add_documents(texts)
+        header, parts = stats.to_chunks()
+        encoded = [json.dumps(part) for part in parts]
+    return header or {}, encoded, stats.rank(top_n, min_doc_frequency, exclude)
+
+
+# ---------------------------------------------------------------------------
+# Process pool
+# ---------------------------------------------------------------------------
+
+_pool: ProcessPoolExecutor | None = None
+_pool_disabled = False
+
+
+def _get_pool() -> ProcessPoolExecutor | None:
+    """Return the shared analysis process pool, or None to use a thread."""
+    global _pool, _pool_disabled
+    if _pool is not None or _pool_disabled:
+        return _pool
+    from issue_observatory.config.settings import get_settings
+
+    workers = get_settings().analysis_process_workers
+    if workers <= 0:
+        _pool_disabled = True
+        return None
+    # "spawn" avoids forking a process that runs an event loop and threads.
+    _pool = ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn"))
+    return _pool
+
+
+async def run_cpu_bound(fn: Callable[..., T], *args: Any) -> T:
+    """Run ``fn(*args)`` off the event loop, preferably in a process pool.
+
+    Falls back to a worker thread when the pool is disabled
+    (``Settings.analysis_process_workers = 0``) or broken; after a pool
+    failure the thread fallback is used for the rest of the process.
+    Exceptions raised by *fn* itself propagate unchanged.
+
+    Args:
+        fn: A picklable module-level function.
+        *args: Picklable positional arguments.
+
+    Returns:
+        The return value of *fn*.
+    """
+    pool = _get_pool()
+    if pool is not None:
+        try:
+            future = pool.submit(fn, *args)
+        except Exception as exc:
+            # Worker processes are started on submit; spawning can fail.
+            _disable_pool(pool, exc)
+        else:
+            try:
+                return await asyncio.wrap_future(future)
+            except BrokenExecutor as exc:
+                _disable_pool(pool, exc)
+    return await asyncio.to_thread(fn, *args)
+
+
+def _disable_pool(pool: ProcessPoolExecutor, exc: BaseException) -> None:
+    """Abandon a failed pool and use threads for the rest of the process."""
+    global _pool, _pool_disabled
+    logger.warning("analysis.process_pool_failed", error=str(exc))
+    _pool_disabled = True
+    _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
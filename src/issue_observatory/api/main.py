@@ -572,9 +572,11 @@ def create_app() -> FastAPI:
 
     @application.on_event("shutdown")
     async def on_shutdown() -> None:
-        """Dispose DB engine and log clean shutdown."""
+        """Write queued credential timestamps, dispose DB engine, log shutdown."""
+        from issue_observatory.core.credential_pool import get_credential_pool
         from issue_observatory.core.database import async_engine
 
+        await get_credential_pool().flush_last_used()
         await async_engine.dispose()
         logger.info("application_shutdown")
 
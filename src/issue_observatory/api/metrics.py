@@ -38,6 +38,19 @@ Metrics defined here:
   celery_task_duration_seconds{task_name}
       Histogram — Celery task wall-clock duration in seconds.
 
+  analysis_cache_requests_total{endpoint, outcome}
+      Counter — analysis result cache lookups by endpoint and outcome
+      (hit, miss, coalesced, bypass).
+
+  analysis_cache_compute_seconds{endpoint}
+      Histogram — time spent computing an analysis result on a cache miss.
+
+Collection hot-path metrics recorded inside Celery workers (flush, rate-limit
+wait, credential acquisition and enrichment timings) are aggregated in Redis
+and exposed here through
+:class:`~issue_observatory.core.worker_metrics.WorkerMetricsCollector`; see
+``core/worker_metrics.py`` for their names and labels.
+
 Usage::
 
     from issue_observatory.api.metrics import collection_runs_total
@@ -46,7 +59,9 @@ Usage::
 
 from __future__ import annotations
 
-from prometheus_client import Counter, Gauge, Histogram
+from prometheus_client import REGISTRY, Counter, Gauge, Histogram
+
+from issue_observatory.core.worker_metrics import WorkerMetricsCollector
 
 # ---------------------------------------------------------------------------
 # Collection metrics
@@ -166,6 +181,47 @@ Labels:
 """
 
 
+# ---------------------------------------------------------------------------
+# Analysis result cache (populated in core/analysis_cache.py)
+# ---------------------------------------------------------------------------
+
+analysis_cache_requests_total: Counter = Counter(
+    "analysis_cache_requests_total",
+    "Analysis result cache lookups by endpoint and outcome.",
+    labelnames=["endpoint", "outcome"],
+)
+"""Counter incremented once per cached analysis request.
+
+Labels:
+  endpoint: cache endpoint identifier (e.g. run.volume, design.network.actors)
+  outcome:  'hit' (served from Redis), 'miss' (computed here), 'coalesced'
+            (served by a concurrent identical request's computation), or
+            'bypass' (cache disabled or Redis unavailable)
+"""
+
+analysis_cache_compute_seconds: Histogram = Histogram(
+    "analysis_cache_compute_seconds",
+    "Time spent computing analysis results that were not cached.",
+    labelnames=["endpoint"],
+    buckets=[0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0],
+)
+"""Histogram of analysis computation durations on cache misses and bypasses.
+
+Labels:
+  endpoint: cache endpoint identifier
+"""
+
+
+# ---------------------------------------------------------------------------
+# Worker metrics (recorded in Celery workers, aggregated in Redis)
+# ---------------------------------------------------------------------------
+
+worker_metrics_collector: WorkerMetricsCollector = WorkerMetricsCollector()
+"""Collector that reads the worker-side series from Redis on each scrape."""
+
+REGISTRY.register(worker_metrics_collector)
+
+
 # ---------------------------------------------------------------------------
 # Response helper
 # ---------------------------------------------------------------------------
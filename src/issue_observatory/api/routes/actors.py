@@ -59,6 +59,7 @@ from issue_observatory.api.dependencies import (
     get_pagination,
     ownership_guard,
 )
+from issue_observatory.core.analysis_cache import content_record_scopes, get_analysis_cache
 from issue_observatory.core.database import get_db
 from issue_observatory.core.models.actors import (
     Actor,
@@ -2296,7 +2297,14 @@ async def update_actor(
     for field, value in update_data.items():
         setattr(actor, field, value)
 
+    # Cached analyses of the actor's records show its name.
+    affected_runs, affected_designs = await content_record_scopes(
+        db, UniversalContentRecord.author_id == actor_id
+    )
     await db.commit()
+    await get_analysis_cache().invalidate(
+        run_ids=affected_runs, design_ids=affected_designs
+    )
     logger.info(
         "actor_updated",
         actor_id=str(actor_id),
@@ -2332,8 +2340,15 @@ async def delete_actor(
     actor = await _get_actor_or_404(actor_id, db)
     ownership_guard(actor.created_by or uuid.UUID(int=0), current_user)
 
+    # Looked up before the delete sets the records' author_id to NULL.
+    affected_runs, affected_designs = await content_record_scopes(
+        db, UniversalContentRecord.author_id == actor_id
+    )
     await db.delete(actor)
     await db.commit()
+    await get_analysis_cache().invalidate(
+        run_ids=affected_runs, design_ids=affected_designs
+    )
     logger.info("actor_deleted", actor_id=str(actor_id))
 
 
@@ -2476,6 +2491,9 @@ async def add_presence(
     """
     actor = await _get_actor_or_404(actor_id, db)
     ownership_guard(actor.created_by or uuid.UUID(int=0), current_user)
+    affected_runs, affected_designs = await content_record_scopes(
+        db, UniversalContentRecord.author_id == actor_id
+    )
 
     presence = ActorPlatformPresence(
         actor_id=actor_id,
@@ -2499,6 +2517,9 @@ async def add_presence(
             ),
         ) from exc
 
+    await get_analysis_cache().invalidate(
+        run_ids=affected_runs, design_ids=affected_designs
+    )
     await db.refresh(presence)
     logger.info(
         "actor_presence_added",
@@ -2548,8 +2569,14 @@ async def remove_presence(
             detail=f"Presence '{presence_id}' not found on actor '{actor_id}'.",
         )
 
+    affected_runs, affected_designs = await content_record_scopes(
+        db, UniversalContentRecord.author_id == actor_id
+    )
     await db.delete(presence)
     await db.commit()
+    await get_analysis_cache().invalidate(
+        run_ids=affected_runs, design_ids=affected_designs
+    )
     logger.info(
         "actor_presence_removed",
         actor_id=str(actor_id),
@@ -2934,7 +2961,11 @@ async def merge_actors(
 
     # ------------------------------------------------------------------
     # 4. Re-point content_records.author_id from source to target.
+    # Author-scoped analyses of the affected runs change with it.
     # ------------------------------------------------------------------
+    affected_runs, affected_designs = await content_record_scopes(
+        db, UniversalContentRecord.author_id == other_actor_id
+    )
     update_result = await db.execute(
         update(UniversalContentRecord)
         .where(UniversalContentRecord.author_id == other_actor_id)
@@ -2949,6 +2980,9 @@ async def merge_actors(
     await db.flush()
     await db.delete(source)
     await db.commit()
+    await get_analysis_cache().invalidate(
+        run_ids=affected_runs, design_ids=affected_designs
+    )
 
     logger.info(
         "actors_merged",
@@ -26,6 +26,13 @@ Routes:
     GET /analysis/{run_id}/network/{type}/temporal      — JSON temporal index (path alias)
     GET /analysis/{run_id}/network/{type}/temporal/{period} — JSON single-period graph
 
+Result caching:
+    Aggregations are served through :func:`_cached`, which stores results in
+    the Redis analysis cache (``core/analysis_cache.py``) keyed on the request
+    parameters and the data version of the run, design, or project designs
+    they read.  Writers bump those versions, so cached results are never
+    stale.  Run summaries and the user-wide volume chart are not cached.
+
 Per-arena GEXF export (IP2-047):
     The ``/network/actors``, ``/network/terms``, and ``/network/bipartite``
     endpoints all accept an optional ``arena`` query parameter.  Passing
@@ -38,6 +45,7 @@ Per-arena GEXF export (IP2-047):
 from __future__ import annotations
 
 import uuid
+from collections.abc import Awaitable, Callable
 from datetime import datetime
 from typing import Annotated, Any
 
@@ -81,6 +89,7 @@ from issue_observatory.api.dependencies import (
     is_project_collaborator,
     ownership_guard,
 )
+from issue_observatory.core.analysis_cache import get_analysis_cache
 from issue_observatory.core.database import get_db
 from issue_observatory.core.models.collection import CollectionRun
 from issue_observatory.core.models.content import UniversalContentRecord
@@ -139,6 +148,102 @@ async def _get_run_or_raise(
     return run
 
 
+# ---------------------------------------------------------------------------
+# Internal helper — cached analysis computation
+# ---------------------------------------------------------------------------
+
+
+async def _cached(
+    scope: str,
+    fn: Callable[..., Awaitable[Any]],
+    db: AsyncSession,
+    *,
+    run_ids: list[uuid.UUID] | tuple[()] = (),
+    design_ids: list[uuid.UUID] | tuple[()] = (),
+    **params: Any,
+) -> Any:
+    """Call ``fn(db, **params)`` through the Redis analysis result cache.
+
+    Args:
+        scope: ``"run"``, ``"design"`` or ``"project"``; combined with the
+            function name to form the cache endpoint label.
+        fn: Async analysis function taking the session as first argument.
+        db: Active async database session.
+        run_ids: Collection runs the result is derived from.
+        design_ids: Query designs the result is derived from.
+        **params: Keyword arguments forwarded to *fn*; also part of the key.
+
+    Returns:
+        The JSON-ready (possibly cached) result of *fn*.
+    """
+    return await get_analysis_cache().get_or_compute(
+        f"{scope}.{fn.__name__}",
+        lambda: fn(db, **params),
+        params=params,
+        run_ids=run_ids,
+        design_ids=design_ids,
+    )
+
+
+def _design_scope(
+    design_id: uuid.UUID, run_id: uuid.UUID | None
+) -> dict[str, list[uuid.UUID]]:
+    """Return the cache scope of a design endpoint, optionally narrowed to one run."""
+    if run_id is not None:
+        return {"run_ids": [run_id]}
+    return {"design_ids": [design_id]}
+
+
+async def _cached_emergent_terms(
+    scope: str,
+    db: AsyncSession,
+    *,
+    query_design_id: uuid.UUID | None,
+    top_n: int,
+    exclude_search_terms: bool,
+    run_ids: list[uuid.UUID] | tuple[()] = (),
+    design_ids: list[uuid.UUID] | tuple[()] = (),
+    **params: Any,
+) -> list[dict[str, Any]]:
+    """Call :func:`get_emergent_terms` through the cache, excluding search terms after.
+
+    Editing a design's search terms does not bump its data version, so the
+    exclusion is applied to the cached ranking rather than cached with it.
+    The ranking is over-fetched by the number of excluded terms.
+
+    Args:
+        scope: Cache endpoint scope, as for :func:`_cached`.
+        db: Active async database session.
+        query_design_id: Design whose search terms are excluded.
+        top_n: Number of terms to return.
+        exclude_search_terms: Whether to exclude the design's search terms.
+        run_ids: Collection runs the result is derived from.
+        design_ids: Query designs the result is derived from.
+        **params: Further keyword arguments for :func:`get_emergent_terms`.
+
+    Returns:
+        Up to *top_n* ``{"term", "score", "document_frequency"}`` dicts.
+    """
+    excluded: set[str] = set()
+    if exclude_search_terms and query_design_id is not None:
+        term_result = await db.execute(
+            select(SearchTerm.term).where(SearchTerm.query_design_id == query_design_id)
+        )
+        excluded = {row[0].lower() for row in term_result.fetchall() if row[0]}
+    ranked = await _cached(
+        scope,
+        get_emergent_terms,
+        db,
+        run_ids=run_ids,
+        design_ids=design_ids,
+        query_design_id=query_design_id,
+        top_n=top_n + len(excluded),
+        exclude_search_terms=False,
+        **params,
+    )
+    return [item for item in ranked if item["term"] not in excluded][:top_n]
+
+
 # ---------------------------------------------------------------------------
 # Root redirect
 # ---------------------------------------------------------------------------
@@ -248,7 +353,14 @@ async def compare_collection_runs(
     await _get_run_or_raise(run_id_1, db, current_user)
     await _get_run_or_raise(run_id_2, db, current_user)
 
-    return await compare_runs(db, run_id_1=run_id_1, run_id_2=run_id_2)
+    return await _cached(
+        "run",
+        compare_runs,
+        db,
+        run_ids=[run_id_1, run_id_2],
+        run_id_1=run_id_1,
+        run_id_2=run_id_2,
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -289,8 +401,11 @@ async def volume_over_time(
     """
     await _get_run_or_raise(run_id, db, current_user)
     try:
-        return await get_volume_over_time(
+        return await _cached(
+            "run",
+            get_volume_over_time,
             db,
+            run_ids=[run_id],
             run_id=run_id,
             arena=arena,
             platform=platform,
@@ -339,8 +454,11 @@ async def top_actors(
         HTTPException 403: If the current user does not own the run.
     """
     await _get_run_or_raise(run_id, db, current_user)
-    return await get_top_actors(
+    return await _cached(
+        "run",
+        get_top_actors,
         db,
+        run_ids=[run_id],
         run_id=run_id,
         platform=platform,
         date_from=date_from,
@@ -381,8 +499,11 @@ async def top_terms(
         HTTPException 403: If the current user does not own the run.
     """
     await _get_run_or_raise(run_id, db, current_user)
-    return await get_top_terms(
+    return await _cached(
+        "run",
+        get_top_terms,
         db,
+        run_ids=[run_id],
         run_id=run_id,
         date_from=date_from,
         date_to=date_to,
@@ -425,8 +546,11 @@ async def engagement_distribution(
         HTTPException 403: If the current user does not own the run.
     """
     await _get_run_or_raise(run_id, db, current_user)
-    return await get_engagement_distribution(
+    return await _cached(
+        "run",
+        get_engagement_distribution,
         db,
+        run_ids=[run_id],
         run_id=run_id,
         arena=arena,
         platform=platform,
@@ -484,8 +608,11 @@ async def temporal_comparison(
     """
     await _get_run_or_raise(run_id, db, current_user)
     try:
-        return await get_temporal_comparison(
+        return await _cached(
+            "run",
+            get_temporal_comparison,
             db,
+            run_ids=[run_id],
             run_id=run_id,
             period=period,
             date_from=date_from,
@@ -544,7 +671,7 @@ async def arena_comparison(
         HTTPException 403: If the current user does not own the run.
     """
     await _get_run_or_raise(run_id, db, current_user)
-    return await get_arena_comparison(db, run_id=run_id)
+    return await _cached("run", get_arena_comparison, db, run_ids=[run_id], run_id=run_id)
 
 
 # ---------------------------------------------------------------------------
@@ -589,8 +716,11 @@ async def network_actors(
         HTTPException 403: If the current user does not own the run.
     """
     await _get_run_or_raise(run_id, db, current_user)
-    return await get_actor_co_occurrence(
+    return await _cached(
+        "run",
+        get_actor_co_occurrence,
         db,
+        run_ids=[run_id],
         run_id=run_id,
         platform=platform,
         arena=arena,
@@ -636,8 +766,11 @@ async def network_terms(
         HTTPException 403: If the current user does not own the run.
     """
     await _get_run_or_raise(run_id, db, current_user)
-    return await get_term_co_occurrence(
+    return await _cached(
+        "run",
+        get_term_co_occurrence,
         db,
+        run_ids=[run_id],
         run_id=run_id,
         arena=arena,
         min_co_occurrences=min_co_occurrences,
@@ -676,8 +809,11 @@ async def network_cross_platform(
         HTTPException 403: If the current user does not own the run.
     """
     await _get_run_or_raise(run_id, db, current_user)
-    return await get_cross_platform_actors(
+    return await _cached(
+        "run",
+        get_cross_platform_actors,
         db,
+        run_ids=[run_id],
         run_id=run_id,
         min_platforms=min_platforms,
     )
@@ -721,8 +857,11 @@ async def network_bipartite(
         HTTPException 403: If the current user does not own the run.
     """
     await _get_run_or_raise(run_id, db, current_user)
-    return await build_bipartite_network(
+    return await _cached(
+        "run",
+        build_bipartite_network,
         db,
+        run_ids=[run_id],
         run_id=run_id,
         arena=arena,
         limit=limit,
@@ -776,8 +915,10 @@ async def emergent_terms(
     """
     run = await _get_run_or_raise(run_id, db, current_user)
     query_design_id: uuid.UUID | None = getattr(run, "query_design_id", None)
-    return await get_emergent_terms(
+    return await _cached_emergent_terms(
+        "run",
         db,
+        run_ids=[run_id],
         query_design_id=query_design_id,
         run_id=run_id,
         top_n=top_n,
@@ -828,8 +969,11 @@ async def top_actors_unified(
     """
     run = await _get_run_or_raise(run_id, db, current_user)
     query_design_id: uuid.UUID | None = getattr(run, "query_design_id", None)
-    return await get_top_actors_unified(
+    return await _cached(
+        "run",
+        get_top_actors_unified,
         db,
+        run_ids=[run_id],
         query_design_id=query_design_id,
         run_id=run_id,
         date_from=date_from,
@@ -892,8 +1036,11 @@ async def network_temporal(
     """
     await _get_run_or_raise(run_id, db, current_user)
     try:
-        return await get_temporal_network_snapshots(
+        return await _cached(
+            "run",
+            get_temporal_network_snapshots,
             db,
+            run_ids=[run_id],
             run_id=run_id,
             interval=interval,
             network_type=network_type,
@@ -960,16 +1107,21 @@ async def network_enhanced_bipartite(
     query_design_id: uuid.UUID | None = getattr(run, "query_design_id", None)
 
     # Extract emergent terms first (returns [] gracefully if sklearn unavailable).
-    emergent = await get_emergent_terms(
+    emergent = await _cached_emergent_terms(
+        "run",
         db,
+        run_ids=[run_id],
         query_design_id=query_design_id,
         run_id=run_id,
         top_n=top_emergent,
         exclude_search_terms=True,
     )
 
-    return await build_enhanced_bipartite_network(
+    return await _cached(
+        "run",
+        build_enhanced_bipartite_network,
         db,
+        run_ids=[run_id],
         emergent_terms=emergent,
         query_design_id=query_design_id,
         run_id=run_id,
@@ -1013,8 +1165,11 @@ async def network_temporal_by_type(
     """
     await _get_run_or_raise(run_id, db, current_user)
     try:
-        snapshots = await get_temporal_network_snapshots(
+        snapshots = await _cached(
+            "run",
+            get_temporal_network_snapshots,
             db,
+            run_ids=[run_id],
             run_id=run_id,
             interval=interval,
             network_type=network_type,
@@ -1065,8 +1220,11 @@ async def network_temporal_period(
     """
     await _get_run_or_raise(run_id, db, current_user)
     try:
-        snapshots = await get_temporal_network_snapshots(
+        snapshots = await _cached(
+            "run",
+            get_temporal_network_snapshots,
             db,
+            run_ids=[run_id],
             run_id=run_id,
             interval=interval,
             network_type=network_type,
@@ -1129,8 +1287,11 @@ async def export_temporal_network_gexf(
     await _get_run_or_raise(run_id, db, current_user)
 
     try:
-        snapshots = await get_temporal_network_snapshots(
+        snapshots = await _cached(
+            "run",
+            get_temporal_network_snapshots,
             db,
+            run_ids=[run_id],
             run_id=run_id,
             interval=interval,
             network_type=network_type,
@@ -1533,38 +1694,21 @@ async def suggested_terms(
     run = await _get_run_or_raise(run_id, db, current_user)
     query_design_id: uuid.UUID | None = getattr(run, "query_design_id", None)
 
-    # Fetch all emergent terms (more than top_n so we can filter after exclusion).
-    all_emergent = await get_emergent_terms(
+    suggestions = await _cached_emergent_terms(
+        "run",
         db,
+        run_ids=[run_id],
         query_design_id=query_design_id,
         run_id=run_id,
-        top_n=top_n * 4,  # over-fetch to survive exclusion filtering
+        top_n=top_n,
         exclude_search_terms=True,
         min_doc_frequency=min_doc_frequency,
     )
 
-    # Build a set of existing search term strings for this query design.
-    existing_terms: set[str] = set()
-    if query_design_id is not None:
-        term_stmt = select(SearchTerm.term).where(
-            SearchTerm.query_design_id == query_design_id,
-            SearchTerm.is_active.is_(True),
-        )
-        term_result = await db.execute(term_stmt)
-        existing_terms = {row[0].lower() for row in term_result.fetchall()}
-
-    # Exclude terms already in the query design (case-insensitive).
-    suggestions = [
-        item
-        for item in all_emergent
-        if item["term"].lower() not in existing_terms
-    ][:top_n]
-
     logger.info(
         "analysis.suggested_terms",
         run_id=str(run_id),
         query_design_id=str(query_design_id) if query_design_id else None,
-        existing_count=len(existing_terms),
         suggestion_count=len(suggestions),
     )
 
@@ -1813,8 +1957,11 @@ async def design_volume_over_time(
     run_id = await _validate_run_for_design(design_id, run_id, db, current_user)
     volume_fn = get_volume_with_deltas if delta_mode else get_volume_over_time
     try:
-        return await volume_fn(
+        return await _cached(
+            "design",
+            volume_fn,
             db,
+            **_design_scope(design_id, run_id),
             query_design_id=design_id if run_id is None else None,
             run_id=run_id,
             arena=arena,
@@ -1866,8 +2013,11 @@ async def design_top_actors(
     """
     await _get_design_or_raise(design_id, db, current_user)
     run_id = await _validate_run_for_design(design_id, run_id, db, current_user)
-    return await get_top_actors(
+    return await _cached(
+        "design",
+        get_top_actors,
         db,
+        **_design_scope(design_id, run_id),
         query_design_id=design_id if run_id is None else None,
         run_id=run_id,
         platform=platform,
@@ -1911,8 +2061,11 @@ async def design_top_terms(
     """
     await _get_design_or_raise(design_id, db, current_user)
     run_id = await _validate_run_for_design(design_id, run_id, db, current_user)
-    return await get_top_terms(
+    return await _cached(
+        "design",
+        get_top_terms,
         db,
+        **_design_scope(design_id, run_id),
         query_design_id=design_id if run_id is None else None,
         run_id=run_id,
         date_from=date_from,
@@ -1959,8 +2112,11 @@ async def design_network_actors(
     """
     await _get_design_or_raise(design_id, db, current_user)
     run_id = await _validate_run_for_design(design_id, run_id, db, current_user)
-    return await get_actor_co_occurrence(
+    return await _cached(
+        "design",
+        get_actor_co_occurrence,
         db,
+        **_design_scope(design_id, run_id),
         query_design_id=design_id if run_id is None else None,
         run_id=run_id,
         platform=platform,
@@ -2003,8 +2159,11 @@ async def design_network_terms(
     """
     await _get_design_or_raise(design_id, db, current_user)
     run_id = await _validate_run_for_design(design_id, run_id, db, current_user)
-    return await get_term_co_occurrence(
+    return await _cached(
+        "design",
+        get_term_co_occurrence,
         db,
+        **_design_scope(design_id, run_id),
         query_design_id=design_id if run_id is None else None,
         run_id=run_id,
         arena=arena,
@@ -2044,8 +2203,11 @@ async def design_network_bipartite(
     """
     await _get_design_or_raise(design_id, db, current_user)
     run_id = await _validate_run_for_design(design_id, run_id, db, current_user)
-    return await build_bipartite_network(
+    return await _cached(
+        "design",
+        build_bipartite_network,
         db,
+        **_design_scope(design_id, run_id),
         query_design_id=design_id if run_id is None else None,
         run_id=run_id,
         arena=arena,
@@ -2094,8 +2256,11 @@ async def design_engagement(
     """
     await _get_design_or_raise(design_id, db, current_user)
     run_id = await _validate_run_for_design(design_id, run_id, db, current_user)
-    return await get_engagement_distribution(
+    return await _cached(
+        "design",
+        get_engagement_distribution,
         db,
+        **_design_scope(design_id, run_id),
         query_design_id=design_id if run_id is None else None,
         run_id=run_id,
         arena=arena,
@@ -2145,8 +2310,10 @@ async def design_emergent_terms(
     """
     await _get_design_or_raise(design_id, db, current_user)
     run_id = await _validate_run_for_design(design_id, run_id, db, current_user)
-    return await get_emergent_terms(
+    return await _cached_emergent_terms(
+        "design",
         db,
+        **_design_scope(design_id, run_id),
         query_design_id=design_id if run_id is None else None,
         run_id=run_id,
         top_n=top_n,
@@ -2201,8 +2368,11 @@ async def design_temporal_comparison(
     await _get_design_or_raise(design_id, db, current_user)
     run_id = await _validate_run_for_design(design_id, run_id, db, current_user)
     try:
-        return await get_temporal_comparison(
+        return await _cached(
+            "design",
+            get_temporal_comparison,
             db,
+            **_design_scope(design_id, run_id),
             query_design_id=design_id if run_id is None else None,
             run_id=run_id,
             period=period,
@@ -2244,8 +2414,11 @@ async def design_arena_comparison(
     """
     await _get_design_or_raise(design_id, db, current_user)
     run_id = await _validate_run_for_design(design_id, run_id, db, current_user)
-    return await get_arena_comparison(
+    return await _cached(
+        "design",
+        get_arena_comparison,
         db,
+        **_design_scope(design_id, run_id),
         query_design_id=design_id if run_id is None else None,
         run_id=run_id,
     )
@@ -2286,8 +2459,11 @@ async def design_top_actors_unified(
     """
     await _get_design_or_raise(design_id, db, current_user)
     run_id = await _validate_run_for_design(design_id, run_id, db, current_user)
-    return await get_top_actors_unified(
+    return await _cached(
+        "design",
+        get_top_actors_unified,
         db,
+        **_design_scope(design_id, run_id),
         query_design_id=design_id if run_id is None else None,
         run_id=run_id,
         date_from=date_from,
@@ -2327,8 +2503,11 @@ async def design_network_cross_platform(
     """
     await _get_design_or_raise(design_id, db, current_user)
     run_id = await _validate_run_for_design(design_id, run_id, db, current_user)
-    return await get_cross_platform_actors(
+    return await _cached(
+        "design",
+        get_cross_platform_actors,
         db,
+        **_design_scope(design_id, run_id),
         query_design_id=design_id if run_id is None else None,
         run_id=run_id,
         min_platforms=min_platforms,
@@ -2382,8 +2561,11 @@ async def design_network_temporal(
     await _get_design_or_raise(design_id, db, current_user)
     run_id = await _validate_run_for_design(design_id, run_id, db, current_user)
     try:
-        snapshots = await get_temporal_network_snapshots(
+        snapshots = await _cached(
+            "design",
+            get_temporal_network_snapshots,
             db,
+            **_design_scope(design_id, run_id),
             query_design_id=design_id if run_id is None else None,
             run_id=run_id,
             interval=interval,
@@ -2440,8 +2622,11 @@ async def design_network_temporal_by_type(
     await _get_design_or_raise(design_id, db, current_user)
     run_id = await _validate_run_for_design(design_id, run_id, db, current_user)
     try:
-        snapshots = await get_temporal_network_snapshots(
+        snapshots = await _cached(
+            "design",
+            get_temporal_network_snapshots,
             db,
+            **_design_scope(design_id, run_id),
             query_design_id=design_id if run_id is None else None,
             run_id=run_id,
             interval=interval,
@@ -2499,8 +2684,11 @@ async def design_network_temporal_period(
     await _get_design_or_raise(design_id, db, current_user)
     run_id = await _validate_run_for_design(design_id, run_id, db, current_user)
     try:
-        snapshots = await get_temporal_network_snapshots(
+        snapshots = await _cached(
+            "design",
+            get_temporal_network_snapshots,
             db,
+            **_design_scope(design_id, run_id),
             query_design_id=design_id if run_id is None else None,
             run_id=run_id,
             interval=interval,
@@ -2568,15 +2756,20 @@ async def design_network_enhanced_bipartite(
     await _get_design_or_raise(design_id, db, current_user)
     run_id = await _validate_run_for_design(design_id, run_id, db, current_user)
 
-    emergent = await get_emergent_terms(
+    emergent = await _cached_emergent_terms(
+        "design",
         db,
+        **_design_scope(design_id, run_id),
         query_design_id=design_id,
         run_id=run_id,
         top_n=top_emergent,
         exclude_search_terms=True,
     )
-    return await build_enhanced_bipartite_network(
+    return await _cached(
+        "design",
+        build_enhanced_bipartite_network,
         db,
+        **_design_scope(design_id, run_id),
         emergent_terms=emergent,
         query_design_id=design_id if run_id is None else None,
         run_id=run_id,
@@ -2687,8 +2880,11 @@ async def design_enrichment_languages(
     """
     await _get_design_or_raise(design_id, db, current_user)
     run_id = await _validate_run_for_design(design_id, run_id, db, current_user)
-    return await get_language_distribution(
+    return await _cached(
+        "design",
+        get_language_distribution,
         db,
+        **_design_scope(design_id, run_id),
         query_design_id=design_id if run_id is None else None,
         run_id=run_id,
     )
@@ -2724,8 +2920,11 @@ async def design_enrichment_entities(
     """
     await _get_design_or_raise(design_id, db, current_user)
     run_id = await _validate_run_for_design(design_id, run_id, db, current_user)
-    return await get_top_named_entities(
+    return await _cached(
+        "design",
+        get_top_named_entities,
         db,
+        **_design_scope(design_id, run_id),
         query_design_id=design_id if run_id is None else None,
         run_id=run_id,
         limit=limit,
@@ -2760,8 +2959,11 @@ async def design_enrichment_propagation(
     """
     await _get_design_or_raise(design_id, db, current_user)
     run_id = await _validate_run_for_design(design_id, run_id, db, current_user)
-    return await get_propagation_patterns(
+    return await _cached(
+        "design",
+        get_propagation_patterns,
         db,
+        **_design_scope(design_id, run_id),
         query_design_id=design_id if run_id is None else None,
         run_id=run_id,
     )
@@ -2795,8 +2997,11 @@ async def design_enrichment_coordination(
     """
     await _get_design_or_raise(design_id, db, current_user)
     run_id = await _validate_run_for_design(design_id, run_id, db, current_user)
-    return await get_coordination_signals(
+    return await _cached(
+        "design",
+        get_coordination_signals,
         db,
+        **_design_scope(design_id, run_id),
         query_design_id=design_id if run_id is None else None,
         run_id=run_id,
     )
@@ -2830,8 +3035,11 @@ async def design_enrichment_sentiment(
     """
     await _get_design_or_raise(design_id, db, current_user)
     run_id = await _validate_run_for_design(design_id, run_id, db, current_user)
-    return await get_sentiment_distribution(
+    return await _cached(
+        "design",
+        get_sentiment_distribution,
         db,
+        **_design_scope(design_id, run_id),
         query_design_id=design_id if run_id is None else None,
         run_id=run_id,
     )
@@ -3049,35 +3257,21 @@ async def design_suggested_terms(
     await _get_design_or_raise(design_id, db, current_user)
     run_id = await _validate_run_for_design(design_id, run_id, db, current_user)
 
-    all_emergent = await get_emergent_terms(
+    suggestions = await _cached_emergent_terms(
+        "design",
         db,
+        **_design_scope(design_id, run_id),
         query_design_id=design_id,
         run_id=run_id,
-        top_n=top_n * 4,
+        top_n=top_n,
         exclude_search_terms=True,
         min_doc_frequency=min_doc_frequency,
     )
 
-    # Build a set of existing search term strings for this query design.
-    existing_terms: set[str] = set()
-    term_stmt = select(SearchTerm.term).where(
-        SearchTerm.query_design_id == design_id,
-        SearchTerm.is_active.is_(True),
-    )
-    term_result = await db.execute(term_stmt)
-    existing_terms = {row[0].lower() for row in term_result.fetchall()}
-
-    suggestions = [
-        item
-        for item in all_emergent
-        if item["term"].lower() not in existing_terms
-    ][:top_n]
-
     logger.info(
         "analysis.design_suggested_terms",
         design_id=str(design_id),
         run_id=str(run_id) if run_id else None,
-        existing_count=len(existing_terms),
         suggestion_count=len(suggestions),
     )
 
@@ -3121,7 +3315,7 @@ async def enrichment_languages(
         HTTPException 403: If the current user does not own the run.
     """
     await _get_run_or_raise(run_id, db, current_user)
-    return await get_language_distribution(db, run_id=run_id)
+    return await _cached("run", get_language_distribution, db, run_ids=[run_id], run_id=run_id)
 
 
 @router.get("/{run_id:uuid}/enrichments/entities")
@@ -3158,7 +3352,14 @@ async def enrichment_entities(
         HTTPException 403: If the current user does not own the run.
     """
     await _get_run_or_raise(run_id, db, current_user)
-    return await get_top_named_entities(db, run_id=run_id, limit=limit)
+    return await _cached(
+        "run",
+        get_top_named_entities,
+        db,
+        run_ids=[run_id],
+        run_id=run_id,
+        limit=limit,
+    )
 
 
 @router.get("/{run_id:uuid}/enrichments/propagation")
@@ -3199,7 +3400,7 @@ async def enrichment_propagation(
         HTTPException 403: If the current user does not own the run.
     """
     await _get_run_or_raise(run_id, db, current_user)
-    return await get_propagation_patterns(db, run_id=run_id)
+    return await _cached("run", get_propagation_patterns, db, run_ids=[run_id], run_id=run_id)
 
 
 # ---------------------------------------------------------------------------
@@ -3263,8 +3464,11 @@ async def propagation_flows(
         HTTPException 403: If the current user does not own the run.
     """
     await _get_run_or_raise(run_id, db, current_user)
-    return await get_propagation_flows(
+    return await _cached(
+        "run",
+        get_propagation_flows,
         db,
+        run_ids=[run_id],
         collection_run_id=run_id,
         min_arenas_reached=min_arenas_reached,
         limit=limit,
@@ -3311,7 +3515,7 @@ async def enrichment_coordination(
         HTTPException 403: If the current user does not own the run.
     """
     await _get_run_or_raise(run_id, db, current_user)
-    return await get_coordination_signals(db, run_id=run_id)
+    return await _cached("run", get_coordination_signals, db, run_ids=[run_id], run_id=run_id)
 
 
 @router.get("/{run_id:uuid}/enrichments/sentiment")
@@ -3348,7 +3552,7 @@ async def enrichment_sentiment(
         HTTPException 403: If the current user does not own the run.
     """
     await _get_run_or_raise(run_id, db, current_user)
-    return await get_sentiment_distribution(db, run_id=run_id)
+    return await _cached("run", get_sentiment_distribution, db, run_ids=[run_id], run_id=run_id)
 
 
 # ---------------------------------------------------------------------------
@@ -3403,8 +3607,11 @@ async def coordination_events(
         HTTPException 403: If the current user does not own the run.
     """
     await _get_run_or_raise(run_id, db, current_user)
-    return await get_coordination_events(
+    return await _cached(
+        "run",
+        get_coordination_events,
         db,
+        run_ids=[run_id],
         collection_run_id=run_id,
         min_score=min_score,
         limit=limit,
@@ -3484,7 +3691,11 @@ async def _get_project_design_ids(
                 detail="You do not have permission to access this resource.",
             )
 
-    qd_stmt = select(QueryDesign.id).where(QueryDesign.project_id == project_id)
+    qd_stmt = (
+        select(QueryDesign.id)
+        .where(QueryDesign.project_id == project_id)
+        .order_by(QueryDesign.id)
+    )
     qd_result = await db.execute(qd_stmt)
     design_ids = [row[0] for row in qd_result.all()]
 
@@ -3606,8 +3817,9 @@ async def project_volume(
     if not design_ids:
         return []
     try:
-        return await get_volume_over_time(
-            db, query_design_ids=design_ids, arena=arena, platform=platform,
+        return await _cached(
+            "project", get_volume_over_time, db, design_ids=design_ids,
+            query_design_ids=design_ids, arena=arena, platform=platform,
             date_from=date_from, date_to=date_to, granularity=granularity,
         )
     except ValueError as exc:
@@ -3633,8 +3845,9 @@ async def project_top_actors(
     )
     if not design_ids:
         return []
-    return await get_top_actors(
-        db, query_design_ids=design_ids, platform=platform,
+    return await _cached(
+        "project", get_top_actors, db, design_ids=design_ids,
+        query_design_ids=design_ids, platform=platform,
         date_from=date_from, date_to=date_to, limit=limit,
     )
 
@@ -3655,8 +3868,9 @@ async def project_top_terms(
     )
     if not design_ids:
         return []
-    return await get_top_terms(
-        db, query_design_ids=design_ids,
+    return await _cached(
+        "project", get_top_terms, db, design_ids=design_ids,
+        query_design_ids=design_ids,
         date_from=date_from, date_to=date_to, limit=limit,
     )
 
@@ -3678,8 +3892,9 @@ async def project_engagement(
     )
     if not design_ids:
         return {}
-    return await get_engagement_distribution(
-        db, query_design_ids=design_ids, arena=arena, platform=platform,
+    return await _cached(
+        "project", get_engagement_distribution, db, design_ids=design_ids,
+        query_design_ids=design_ids, arena=arena, platform=platform,
         date_from=date_from, date_to=date_to,
     )
 
@@ -3700,8 +3915,9 @@ async def project_emergent_terms(
     )
     if not design_ids:
         return []
-    return await get_emergent_terms(
-        db, query_design_ids=design_ids, top_n=top_n,
+    return await _cached(
+        "project", get_emergent_terms, db, design_ids=design_ids,
+        query_design_ids=design_ids, top_n=top_n,
         exclude_search_terms=exclude_search_terms,
         min_doc_frequency=min_doc_frequency,
     )
@@ -3761,8 +3977,9 @@ async def project_network_actors(
     )
     if not design_ids:
         return {"nodes": [], "edges": []}
-    return await get_actor_co_occurrence(
-        db, query_design_ids=design_ids, platform=platform, arena=arena,
+    return await _cached(
+        "project", get_actor_co_occurrence, db, design_ids=design_ids,
+        query_design_ids=design_ids, platform=platform, arena=arena,
         date_from=date_from, date_to=date_to,
         min_co_occurrences=min_co_occurrences,
     )
@@ -3783,8 +4000,9 @@ async def project_network_terms(
     )
     if not design_ids:
         return {"nodes": [], "edges": []}
-    return await get_term_co_occurrence(
-        db, query_design_ids=design_ids, arena=arena,
+    return await _cached(
+        "project", get_term_co_occurrence, db, design_ids=design_ids,
+        query_design_ids=design_ids, arena=arena,
         min_co_occurrences=min_co_occurrences,
     )
 
@@ -3804,8 +4022,9 @@ async def project_network_bipartite(
     )
     if not design_ids:
         return {"nodes": [], "edges": []}
-    return await build_bipartite_network(
-        db, query_design_ids=design_ids, arena=arena, limit=limit,
+    return await _cached(
+        "project", build_bipartite_network, db, design_ids=design_ids,
+        query_design_ids=design_ids, arena=arena, limit=limit,
     )
 
 
@@ -3830,8 +4049,9 @@ async def project_temporal_comparison(
             "delta": 0, "pct_change": 0.0, "per_arena": [],
         }
     try:
-        return await get_temporal_comparison(
-            db, query_design_ids=design_ids,
+        return await _cached(
+            "project", get_temporal_comparison, db, design_ids=design_ids,
+            query_design_ids=design_ids,
             period=period, date_from=date_from, date_to=date_to,
         )
     except ValueError as exc:
@@ -3853,7 +4073,13 @@ async def project_arena_comparison(
     )
     if not design_ids:
         return {"by_arena": [], "totals": {}}
-    return await get_arena_comparison(db, query_design_ids=design_ids)
+    return await _cached(
+        "project",
+        get_arena_comparison,
+        db,
+        design_ids=design_ids,
+        query_design_ids=design_ids,
+    )
 
 
 @router.get("/project/{project_id:uuid}/actors-unified")
@@ -3872,8 +4098,9 @@ async def project_top_actors_unified(
     )
     if not design_ids:
         return []
-    return await get_top_actors_unified(
-        db, query_design_ids=design_ids,
+    return await _cached(
+        "project", get_top_actors_unified, db, design_ids=design_ids,
+        query_design_ids=design_ids,
         date_from=date_from, date_to=date_to, limit=limit,
     )
 
@@ -3892,8 +4119,9 @@ async def project_network_cross_platform(
     )
     if not design_ids:
         return []
-    return await get_cross_platform_actors(
-        db, query_design_ids=design_ids, min_platforms=min_platforms,
+    return await _cached(
+        "project", get_cross_platform_actors, db, design_ids=design_ids,
+        query_design_ids=design_ids, min_platforms=min_platforms,
     )
 
 
@@ -3914,8 +4142,9 @@ async def project_network_temporal(
     if not design_ids:
         return []
     try:
-        snapshots = await get_temporal_network_snapshots(
-            db, query_design_ids=design_ids,
+        snapshots = await _cached(
+            "project", get_temporal_network_snapshots, db, design_ids=design_ids,
+            query_design_ids=design_ids,
             interval=interval, network_type=network_type,
             limit_per_snapshot=limit_per_snapshot,
         )
@@ -3946,8 +4175,9 @@ async def project_network_temporal_by_type(
     if not design_ids:
         return []
     try:
-        snapshots = await get_temporal_network_snapshots(
-            db, query_design_ids=design_ids,
+        snapshots = await _cached(
+            "project", get_temporal_network_snapshots, db, design_ids=design_ids,
+            query_design_ids=design_ids,
             interval=interval, network_type=network_type,
             limit_per_snapshot=limit_per_snapshot,
         )
@@ -3979,8 +4209,9 @@ async def project_network_temporal_period(
     if not design_ids:
         return {"nodes": [], "edges": []}
     try:
-        snapshots = await get_temporal_network_snapshots(
-            db, query_design_ids=design_ids,
+        snapshots = await _cached(
+            "project", get_temporal_network_snapshots, db, design_ids=design_ids,
+            query_design_ids=design_ids,
             interval=interval, network_type=network_type,
             limit_per_snapshot=limit_per_snapshot,
         )
@@ -4016,12 +4247,14 @@ async def project_network_enhanced_bipartite(
     if not design_ids:
         return {"nodes": [], "edges": []}
 
-    emergent = await get_emergent_terms(
-        db, query_design_ids=design_ids,
+    emergent = await _cached(
+        "project", get_emergent_terms, db, design_ids=design_ids,
+        query_design_ids=design_ids,
         top_n=top_emergent, exclude_search_terms=True,
     )
-    return await build_enhanced_bipartite_network(
-        db, emergent_terms=emergent,
+    return await _cached(
+        "project", build_enhanced_bipartite_network, db, design_ids=design_ids,
+        emergent_terms=emergent,
         query_design_ids=design_ids, limit=limit,
     )
 
@@ -4039,7 +4272,13 @@ async def project_enrichment_languages(
     )
     if not design_ids:
         return []
-    return await get_language_distribution(db, query_design_ids=design_ids)
+    return await _cached(
+        "project",
+        get_language_distribution,
+        db,
+        design_ids=design_ids,
+        query_design_ids=design_ids,
+    )
 
 
 @router.get("/project/{project_id:uuid}/enrichments/entities")
@@ -4056,8 +4295,9 @@ async def project_enrichment_entities(
     )
     if not design_ids:
         return []
-    return await get_top_named_entities(
-        db, query_design_ids=design_ids, limit=limit,
+    return await _cached(
+        "project", get_top_named_entities, db, design_ids=design_ids,
+        query_design_ids=design_ids, limit=limit,
     )
 
 
@@ -4074,7 +4314,13 @@ async def project_enrichment_propagation(
     )
     if not design_ids:
         return []
-    return await get_propagation_patterns(db, query_design_ids=design_ids)
+    return await _cached(
+        "project",
+        get_propagation_patterns,
+        db,
+        design_ids=design_ids,
+        query_design_ids=design_ids,
+    )
 
 
 @router.get("/project/{project_id:uuid}/enrichments/coordination")
@@ -4090,7 +4336,13 @@ async def project_enrichment_coordination(
     )
     if not design_ids:
         return []
-    return await get_coordination_signals(db, query_design_ids=design_ids)
+    return await _cached(
+        "project",
+        get_coordination_signals,
+        db,
+        design_ids=design_ids,
+        query_design_ids=design_ids,
+    )
 
 
 @router.get("/project/{project_id:uuid}/enrichments/sentiment")
@@ -4109,7 +4361,13 @@ async def project_enrichment_sentiment(
             "positive": 0, "negative": 0, "neutral": 0,
             "average_score": 0.0, "total_records": 0,
         }
-    return await get_sentiment_distribution(db, query_design_ids=design_ids)
+    return await _cached(
+        "project",
+        get_sentiment_distribution,
+        db,
+        design_ids=design_ids,
+        query_design_ids=design_ids,
+    )
 
 
 @router.get("/project/{project_id:uuid}/filtered-export")
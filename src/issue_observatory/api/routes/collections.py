@@ -11,6 +11,7 @@ Routes:
     GET  /collections/{run_id}      — run detail with per-task statuses
     POST /collections/{run_id}/cancel — cancel a running collection
     GET  /collections/{run_id}/stream — SSE live status
+    GET  /collections/{run_id}/snapshots — Bright Data snapshot lifecycle
     POST /collections/estimate      — pre-flight credit estimate (non-destructive)
 """
 
@@ -1715,6 +1716,47 @@ async def get_collection_schedule(
     }
 
 
+@router.get("/{run_id:uuid}/snapshots")
+async def get_collection_snapshots(
+    run_id: uuid.UUID,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[User, Depends(get_current_active_user)],
+) -> list[dict]:
+    """Return the Bright Data snapshots of a collection run.
+
+    Facebook and Instagram collection tasks trigger Bright Data snapshots and
+    ingest them once ready (see ``arenas/_brightdata_snapshots.py``).  Each
+    entry shows the snapshot's lifecycle state, the seconds spent in the
+    current and earlier states, the last progress payload, and the records
+    read and inserted so far.
+
+    Args:
+        run_id: UUID of the collection run.
+        db: Injected async database session.
+        current_user: The authenticated, active user making the request.
+
+    Returns:
+        One dict per snapshot, oldest trigger first; empty for runs without
+        Bright Data arenas.
+
+    Raises:
+        HTTPException 404: If the run does not exist.
+        HTTPException 403: If the caller did not initiate the run (and is not admin).
+    """
+    from issue_observatory.arenas._brightdata_snapshots import SnapshotStore
+    from issue_observatory.config.settings import get_settings
+
+    run = await _get_run_or_404(run_id, db)
+    await _run_read_guard(run, current_user, db)
+
+    store = SnapshotStore(get_settings().redis_url)
+    try:
+        jobs = await store.for_run(str(run.id))
+    finally:
+        await store.aclose()
+    return [job.summary() for job in jobs]
+
+
 # ---------------------------------------------------------------------------
 # Refresh engagement metrics (IP2-035)
 # ---------------------------------------------------------------------------
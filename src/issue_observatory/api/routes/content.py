@@ -41,6 +41,8 @@ from issue_observatory.analysis.network import (
 )
 from issue_observatory.api.dependencies import get_current_active_user
 from issue_observatory.arenas.categories import ARENA_CATEGORIES, ARENA_CATEGORY_LABELS
+from issue_observatory.core import content_rollups
+from issue_observatory.core.analysis_cache import get_analysis_cache
 from issue_observatory.core.database import get_db
 from issue_observatory.core.models.actors import Actor
 from issue_observatory.core.models.collection import CollectionRun
@@ -633,7 +635,8 @@ async def content_record_count(
 
     Scopes via query_design_id (using idx_content_query) rather than joining
     through collection_runs, which avoids full partition scans on the
-    content_records table.
+    content_records table.  Without a ``run_id`` both counts are summed from
+    the per-day content rollups in a single query.
 
     Args:
         db: Injected async database session.
@@ -660,6 +663,26 @@ async def content_record_count(
     if not qd_ids:
         return {"matched": 0, "total": 0}
 
+    if run_id_parsed is None and content_rollups.rollups_enabled():
+        params: dict[str, Any] = {}
+        where = content_rollups.build_rollup_where(
+            params,
+            query_design_ids=qd_ids,
+            term_filter="all",
+            include_duplicates=True,
+        )
+        row = (
+            await db.execute(
+                text(
+                    "SELECT COALESCE(SUM(record_count) FILTER (WHERE term_matched), 0)"
+                    " AS matched, COALESCE(SUM(record_count), 0) AS total"
+                    f" FROM content_daily_rollups {where}"
+                ),
+                params,
+            )
+        ).one()
+        return {"matched": int(row.matched), "total": int(row.total)}
+
     # Re-build spec with resolved query_design_ids so build_count_stmt can
     # use the short-circuit optimization path.
     spec = ContentFilterSpec.from_dashboard_count(
@@ -2374,6 +2397,7 @@ async def fetch_content_for_record(
         extract_from_html as scraper_extract,
     )
     from issue_observatory.scraper.http_fetcher import fetch_url as scraper_fetch
+    from issue_observatory.scraper.robots import RobotsCache
 
     # Fetch the page content
     try:
@@ -2381,8 +2405,7 @@ async def fetch_content_for_record(
             timeout=30.0,
             follow_redirects=True,
             headers={"User-Agent": "IssueObservatory/1.0"},
-        ) as client:
-            robots_cache: dict[str, bool] = {}
+        ) as client, RobotsCache.from_settings() as robots_cache:
             fetch_result = await scraper_fetch(
                 record.url,
                 client=client,
@@ -2455,6 +2478,9 @@ async def fetch_content_for_record(
         },
     )
     await db.commit()
+    await get_analysis_cache().invalidate(
+        run_ids=[record.collection_run_id], design_ids=[record.query_design_id]
+    )
 
     logger.info(
         "fetch_content: updated record %s with %d chars of content",
@@ -3,6 +3,7 @@
 Provides CRUD operations for the ``api_credentials`` table, returning HTML
 ``<tr>`` fragments for HTMX in-place row swaps.  Credential values are
 encrypted with Fernet before storage and are never returned to the browser.
+Every change invalidates the credential pool's in-process caches.
 
 Mounted at ``/admin/credentials`` in ``main.py``.
 """
@@ -18,7 +19,7 @@ from fastapi.responses import HTMLResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from issue_observatory.api.dependencies import require_admin
-from issue_observatory.core.credential_pool import _get_fernet
+from issue_observatory.core.credential_pool import _get_fernet, invalidate_credential_cache
 from issue_observatory.core.database import get_db
 from issue_observatory.core.models.credentials import ApiCredential
 from issue_observatory.core.models.users import User
@@ -238,6 +239,7 @@ async def create_credential(
     )
     db.add(cred)
     await db.commit()
+    await invalidate_credential_cache()
     await db.refresh(cred)
     return HTMLResponse(_credential_row_html(cred))
 
@@ -254,6 +256,7 @@ async def activate_credential(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Credential not found.")
     cred.is_active = True
     await db.commit()
+    await invalidate_credential_cache()
     await db.refresh(cred)
     return HTMLResponse(_credential_row_html(cred))
 
@@ -270,6 +273,7 @@ async def deactivate_credential(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Credential not found.")
     cred.is_active = False
     await db.commit()
+    await invalidate_credential_cache()
     await db.refresh(cred)
     return HTMLResponse(_credential_row_html(cred))
 
@@ -287,6 +291,7 @@ async def reset_errors(
     cred.error_count = 0
     cred.last_error_at = None
     await db.commit()
+    await invalidate_credential_cache()
     await db.refresh(cred)
     return HTMLResponse(_credential_row_html(cred))
 
@@ -303,4 +308,5 @@ async def delete_credential(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Credential not found.")
     await db.delete(cred)
     await db.commit()
+    await invalidate_credential_cache()
     return HTMLResponse("")
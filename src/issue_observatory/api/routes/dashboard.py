@@ -42,6 +42,11 @@ from issue_observatory.arenas.categories import (
     ARENA_CATEGORY_LABELS,
     VALID_CATEGORIES,
 )
+from issue_observatory.core.content_rollups import (
+    build_rollup_where,
+    rollups_enabled,
+    whole_days,
+)
 from issue_observatory.core.database import AsyncSessionLocal, get_db
 from issue_observatory.core.models.collection import CollectionRun
 from issue_observatory.core.models.content import UniversalContentRecord
@@ -160,6 +165,25 @@ async def _get_latest_published_at(
     return result.scalar()
 
 
+async def _default_window(
+    db: AsyncSession,
+    design_ids: list[uuid.UUID],
+    date_from: datetime | None,
+    date_to: datetime | None,
+) -> tuple[datetime, datetime]:
+    """Fill missing date bounds with the default 30-day dashboard window.
+
+    The window ends with the UTC day of the latest record (or today) and
+    starts 30 days earlier.  It covers whole days so that the volume and
+    term cards can be answered from the per-day content rollups.
+    """
+    if date_from is not None and date_to is not None:
+        return date_from, date_to
+    anchor = await _get_latest_published_at(db, design_ids) or datetime.now(UTC)
+    window_from, window_to = whole_days(anchor - timedelta(days=30), anchor)
+    return date_from or window_from, date_to or window_to
+
+
 async def _get_most_recent_project_id(
     db: AsyncSession,
     user_id: uuid.UUID,
@@ -416,11 +440,17 @@ async def get_project_volume(
     ),
     date_from: datetime | None = Query(
         default=None,
-        description="Inclusive lower bound on published_at (ISO 8601). Defaults to 30 days ago.",
+        description=(
+            "Inclusive lower bound on published_at (ISO 8601). "
+            "Defaults to the start of the day 30 days before the latest record."
+        ),
     ),
     date_to: datetime | None = Query(
         default=None,
-        description="Inclusive upper bound on published_at (ISO 8601). Defaults to now.",
+        description=(
+            "Inclusive upper bound on published_at (ISO 8601). "
+            "Defaults to the end of the day of the latest record."
+        ),
     ),
     granularity: str = Query(
         default="day",
@@ -448,8 +478,10 @@ async def get_project_volume(
         db: Injected async database session.
         current_user: The authenticated, active user.
         project_id: Project to scope the query to.
-        date_from: Lower bound on published_at; defaults to 30 days ago.
-        date_to: Upper bound on published_at; defaults to now.
+        date_from: Lower bound on published_at; defaults to the start of
+            the day 30 days before the latest record.
+        date_to: Upper bound on published_at; defaults to the end of the
+            day of the latest record.
         granularity: Bucket size — one of hour, day, week, month.
         arena_category: Optional arena category filter.
         platform: Optional platform filter.
@@ -480,9 +512,9 @@ async def get_project_volume(
     if not design_ids:
         return []
 
-    anchor = await _get_latest_published_at(db, design_ids) or datetime.now(UTC)
-    effective_date_from = date_from or (anchor - timedelta(days=30))
-    effective_date_to = date_to or anchor
+    effective_date_from, effective_date_to = await _default_window(
+        db, design_ids, date_from, date_to
+    )
 
     try:
         return await get_volume_with_deltas(
@@ -513,11 +545,17 @@ async def get_project_top_actors(
     ),
     date_from: datetime | None = Query(
         default=None,
-        description="Inclusive lower bound on published_at (ISO 8601). Defaults to 30 days ago.",
+        description=(
+            "Inclusive lower bound on published_at (ISO 8601). "
+            "Defaults to the start of the day 30 days before the latest record."
+        ),
     ),
     date_to: datetime | None = Query(
         default=None,
-        description="Inclusive upper bound on published_at (ISO 8601). Defaults to now.",
+        description=(
+            "Inclusive upper bound on published_at (ISO 8601). "
+            "Defaults to the end of the day of the latest record."
+        ),
     ),
     arena_category: str | None = Query(
         default=None,
@@ -544,8 +582,10 @@ async def get_project_top_actors(
         db: Injected async database session.
         current_user: The authenticated, active user.
         project_id: Project to scope the query to.
-        date_from: Lower bound on published_at; defaults to 30 days ago.
-        date_to: Upper bound on published_at; defaults to now.
+        date_from: Lower bound on published_at; defaults to the start of
+            the day 30 days before the latest record.
+        date_to: Upper bound on published_at; defaults to the end of the
+            day of the latest record.
         arena_category: Optional arena category filter
             (ignored by get_top_actors, kept for API symmetry).
         platform: Optional platform filter.
@@ -577,9 +617,9 @@ async def get_project_top_actors(
     if not design_ids:
         return []
 
-    anchor = await _get_latest_published_at(db, design_ids) or datetime.now(UTC)
-    effective_date_from = date_from or (anchor - timedelta(days=30))
-    effective_date_to = date_to or anchor
+    effective_date_from, effective_date_to = await _default_window(
+        db, design_ids, date_from, date_to
+    )
 
     return await get_top_actors(
         db,
@@ -603,11 +643,17 @@ async def get_project_top_terms(
     ),
     date_from: datetime | None = Query(
         default=None,
-        description="Inclusive lower bound on published_at (ISO 8601). Defaults to 30 days ago.",
+        description=(
+            "Inclusive lower bound on published_at (ISO 8601). "
+            "Defaults to the start of the day 30 days before the latest record."
+        ),
     ),
     date_to: datetime | None = Query(
         default=None,
-        description="Inclusive upper bound on published_at (ISO 8601). Defaults to now.",
+        description=(
+            "Inclusive upper bound on published_at (ISO 8601). "
+            "Defaults to the end of the day of the latest record."
+        ),
     ),
     arena_category: str | None = Query(
         default=None,
@@ -634,8 +680,10 @@ async def get_project_top_terms(
         db: Injected async database session.
         current_user: The authenticated, active user.
         project_id: Project to scope the query to.
-        date_from: Lower bound on published_at; defaults to 30 days ago.
-        date_to: Upper bound on published_at; defaults to now.
+        date_from: Lower bound on published_at; defaults to the start of
+            the day 30 days before the latest record.
+        date_to: Upper bound on published_at; defaults to the end of the
+            day of the latest record.
         arena_category: Accepted for API symmetry but not applied (terms span all arenas).
         platform: Accepted for API symmetry but not applied (terms span all platforms).
         language: Optional detected language filter.
@@ -666,9 +714,9 @@ async def get_project_top_terms(
     if not design_ids:
         return []
 
-    anchor = await _get_latest_published_at(db, design_ids) or datetime.now(UTC)
-    effective_date_from = date_from or (anchor - timedelta(days=30))
-    effective_date_to = date_to or anchor
+    effective_date_from, effective_date_to = await _default_window(
+        db, design_ids, date_from, date_to
+    )
 
     return await get_top_terms(
         db,
@@ -692,8 +740,9 @@ async def get_filter_options(
 ) -> dict[str, Any]:
     """Return available arena categories and platforms for filtering.
 
-    Queries distinct ``arena`` and ``platform`` values from content_records
-    scoped to the project's query designs, then enriches arena slugs with
+    Queries distinct ``arena`` and ``platform`` values from the per-day
+    content rollups (or content_records when rollups are disabled) scoped to
+    the project's query designs, then enriches arena slugs with
     human-readable labels from the canonical categories mapping.
 
     Args:
@@ -724,26 +773,42 @@ async def get_filter_options(
             "platforms": [],
         }
 
-    placeholders = ", ".join(f":id_{i}" for i in range(len(design_ids)))
-    params: dict[str, Any] = {f"id_{i}": str(did) for i, did in enumerate(design_ids)}
-
-    # Single scan instead of three separate DISTINCT queries.
-    # Language: prefer the column, fall back to the enrichment result.
-    _LANG_EXPR = (
-        "COALESCE(NULLIF(language, ''), "
-        "raw_metadata->'enrichments'->'language_detection'->>'language')"
-    )
-    combined_sql = text(
-        f"""
-        SELECT
-            COALESCE(array_agg(DISTINCT arena) FILTER (WHERE arena IS NOT NULL), '{{}}') AS arenas,
-            COALESCE(array_agg(DISTINCT platform) FILTER (WHERE platform IS NOT NULL), '{{}}') AS platforms,
-            COALESCE(array_agg(DISTINCT split_part({_LANG_EXPR}, '-', 1)) FILTER (WHERE {_LANG_EXPR} IS NOT NULL), '{{}}') AS languages
-        FROM content_records
-        WHERE query_design_id IN ({placeholders})
-          AND (raw_metadata->>'duplicate_of') IS NULL
-        """
-    )
+    params: dict[str, Any] = {}
+    if rollups_enabled():
+        # The rollups store the effective language base already.
+        where = build_rollup_where(params, query_design_ids=design_ids, term_filter="all")
+        combined_sql = text(
+            f"""
+            SELECT
+                COALESCE(array_agg(DISTINCT arena), '{{}}') AS arenas,
+                COALESCE(array_agg(DISTINCT platform), '{{}}') AS platforms,
+                COALESCE(
+                    array_agg(DISTINCT language) FILTER (WHERE language IS NOT NULL), '{{}}'
+                ) AS languages
+            FROM content_daily_rollups
+            {where}
+            """
+        )
+    else:
+        placeholders = ", ".join(f":id_{i}" for i in range(len(design_ids)))
+        params = {f"id_{i}": str(did) for i, did in enumerate(design_ids)}
+        # Single scan instead of three separate DISTINCT queries.
+        # Language: prefer the column, fall back to the enrichment result.
+        _LANG_EXPR = (
+            "COALESCE(NULLIF(language, ''), "
+            "raw_metadata->'enrichments'->'language_detection'->>'language')"
+        )
+        combined_sql = text(
+            f"""
+            SELECT
+                COALESCE(array_agg(DISTINCT arena) FILTER (WHERE arena IS NOT NULL), '{{}}') AS arenas,
+                COALESCE(array_agg(DISTINCT platform) FILTER (WHERE platform IS NOT NULL), '{{}}') AS platforms,
+                COALESCE(array_agg(DISTINCT split_part({_LANG_EXPR}, '-', 1)) FILTER (WHERE {_LANG_EXPR} IS NOT NULL), '{{}}') AS languages
+            FROM content_records
+            WHERE query_design_id IN ({placeholders})
+              AND (raw_metadata->>'duplicate_of') IS NULL
+            """
+        )
     result = await db.execute(combined_sql, params)
     row = result.fetchone()
 
@@ -767,6 +832,56 @@ async def get_filter_options(
     return {"arena_categories": arena_categories, "platforms": platforms, "languages": languages}
 
 
+async def _raw_platform_counts(
+    db: AsyncSession,
+    design_ids: list[uuid.UUID],
+    matched_only: bool,
+    language: str | None,
+    arena_category: str | None,
+    platform: str | None,
+) -> list[Any]:
+    """Return ``(platform, content_type, cnt)`` rows counted from content_records."""
+    placeholders = ", ".join(f":id_{i}" for i in range(len(design_ids)))
+    params: dict[str, Any] = {f"id_{i}": str(did) for i, did in enumerate(design_ids)}
+
+    matched_clause = "AND term_matched = true" if matched_only else ""
+    # Language: prefer the column, fall back to the enrichment result.
+    _LANG_EXPR = (
+        "COALESCE(NULLIF(language, ''), "
+        "raw_metadata->'enrichments'->'language_detection'->>'language')"
+    )
+    language_clause = ""
+    if language:
+        language_clause = f"AND split_part({_LANG_EXPR}, '-', 1) = :language"
+        params["language"] = language.split("-")[0]
+    arena_clause = ""
+    if arena_category:
+        arena_clause = "AND arena = :arena_category"
+        params["arena_category"] = arena_category
+    platform_clause = ""
+    if platform:
+        platform_clause = "AND platform = :platform"
+        params["platform"] = platform
+    sql = text(
+        f"""
+        SELECT platform,
+               content_type,
+               count(*) AS cnt
+        FROM content_records
+        WHERE query_design_id IN ({placeholders})
+          AND (raw_metadata->>'duplicate_of') IS NULL
+          {matched_clause}
+          {language_clause}
+          {arena_clause}
+          {platform_clause}
+        GROUP BY platform, content_type
+        ORDER BY platform
+        """
+    )
+    result = await db.execute(sql, params)
+    return list(result.fetchall())
+
+
 @router.get("/platform-counts")
 async def get_platform_counts(
     db: Annotated[AsyncSession, Depends(get_db)],
@@ -794,9 +909,10 @@ async def get_platform_counts(
 ) -> list[dict[str, Any]]:
     """Return per-platform record counts grouped by content type.
 
-    Queries content_records scoped to the project's query designs and groups
-    by platform and content_type (post, comment, etc.), returning totals for
-    each combination plus a per-platform total.
+    Sums the per-day content rollups (or counts content_records when
+    rollups are disabled) scoped to the project's query designs, grouped
+    by platform and content_type (post, comment, etc.), returning totals
+    for each combination plus a per-platform total.
 
     Args:
         db: Injected async database session.
@@ -816,45 +932,32 @@ async def get_platform_counts(
     if not design_ids:
         return []
 
-    placeholders = ", ".join(f":id_{i}" for i in range(len(design_ids)))
-    params: dict[str, Any] = {f"id_{i}": str(did) for i, did in enumerate(design_ids)}
-
-    matched_clause = "AND term_matched = true" if matched_only else ""
-    # Language: prefer the column, fall back to the enrichment result.
-    _LANG_EXPR = (
-        "COALESCE(NULLIF(language, ''), "
-        "raw_metadata->'enrichments'->'language_detection'->>'language')"
-    )
-    language_clause = ""
-    if language:
-        language_clause = f"AND split_part({_LANG_EXPR}, '-', 1) = :language"
-        params["language"] = language.split("-")[0]
-    arena_clause = ""
-    if arena_category:
-        arena_clause = "AND arena = :arena_category"
-        params["arena_category"] = arena_category
-    platform_clause = ""
-    if platform:
-        platform_clause = "AND platform = :platform"
-        params["platform"] = platform
-    sql = text(
-        f"""
-        SELECT platform,
-               content_type,
-               count(*) AS cnt
-        FROM content_records
-        WHERE query_design_id IN ({placeholders})
-          AND (raw_metadata->>'duplicate_of') IS NULL
-          {matched_clause}
-          {language_clause}
-          {arena_clause}
-          {platform_clause}
-        GROUP BY platform, content_type
-        ORDER BY platform
-        """
-    )
-    result = await db.execute(sql, params)
-    rows = result.fetchall()
+    if rollups_enabled():
+        rollup_params: dict[str, Any] = {}
+        where = build_rollup_where(
+            rollup_params,
+            query_design_ids=design_ids,
+            arena=arena_category,
+            platform=platform,
+            language=language,
+            term_filter="matched" if matched_only else "all",
+        )
+        rollup_sql = text(
+            f"""
+            SELECT platform,
+                   content_type,
+                   SUM(record_count)::bigint AS cnt
+            FROM content_daily_rollups
+            {where}
+            GROUP BY platform, content_type
+            ORDER BY platform
+            """
+        )
+        rows = (await db.execute(rollup_sql, rollup_params)).fetchall()
+    else:
+        rows = await _raw_platform_counts(
+            db, design_ids, matched_only, language, arena_category, platform
+        )
 
     # Aggregate into per-platform rows with posts/comments/other breakdown
     platform_data: dict[str, dict[str, int]] = {}
@@ -44,6 +44,8 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from issue_observatory.api.dependencies import get_current_active_user
+from issue_observatory.core import content_rollups
+from issue_observatory.core.analysis_cache import get_analysis_cache
 from issue_observatory.core.database import get_db
 from issue_observatory.core.models.users import User
 from issue_observatory.core.normalizer import Normalizer
@@ -164,6 +166,9 @@ async def _bulk_insert(
     ``content_records`` table keyed on ``content_hash``. The conflict target
     must match the partial unique index: ``WHERE content_hash IS NOT NULL``.
 
+    Inserted records that belong to a query design are folded into the
+    per-day content rollups before the commit.
+
     Args:
         db: Active async DB session.
         records: List of normalized content record dicts.
@@ -174,6 +179,8 @@ async def _bulk_insert(
     if not records:
         return 0, 0
 
+    track_rollups = content_rollups.rollups_enabled()
+
     inserted = 0
     skipped = 0
 
@@ -193,10 +200,13 @@ async def _bulk_insert(
             f"INSERT INTO content_records ({col_list}) "
             f"VALUES ({placeholders}) "
             f"ON CONFLICT (content_hash, published_at) WHERE content_hash IS NOT NULL DO NOTHING"
+            + (content_rollups.INSERT_RETURNING if track_rollups else "")
         )
         result = await db.execute(stmt, {col: record[col] for col in columns})
         if result.rowcount == 1:
             inserted += 1
+            if track_rollups:
+                await content_rollups.apply_insert_deltas(db, result.fetchall())
         else:
             skipped += 1
 
@@ -379,6 +389,9 @@ async def import_content(
             detail=f"Database insert failed: {exc}",
         ) from exc
 
+    if inserted and query_design_id is not None:
+        await get_analysis_cache().invalidate(design_ids=[query_design_id])
+
     logger.info(
         "import: method=%s format=%s total=%d inserted=%d skipped=%d errors=%d",
         collection_method,
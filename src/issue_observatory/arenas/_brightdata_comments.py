@@ -3,7 +3,10 @@
 Provides the ``BrightDataCommentCollector`` class that encapsulates the
 trigger → poll → download workflow for Bright Data's comment scraper datasets.
 Used by both ``FacebookCollector.collect_comments()`` and
-``InstagramCollector.collect_comments()``.
+``InstagramCollector.collect_comments()``.  Collection runs use the
+non-blocking halves instead — :meth:`~BrightDataCommentCollector.trigger_comments`
+and :meth:`~BrightDataCommentCollector.iter_comments` — with the snapshot
+lifecycle in :mod:`issue_observatory.arenas._brightdata_snapshots`.
 
 The class does NOT subclass ``ArenaCollector`` — it is a utility mixin
 instantiated by the platform-specific collector and given an HTTP client
@@ -17,11 +20,17 @@ Dataset IDs:
 from __future__ import annotations
 
 import asyncio
+from collections.abc import AsyncIterator
 from typing import Any
 
 import httpx
 import structlog
 
+from issue_observatory.arenas._brightdata_snapshots import (
+    BRIGHTDATA_API_BASE,
+    PROGRESS_URL,
+    iter_snapshot_records,
+)
 from issue_observatory.core.exceptions import (
     ArenaAuthError,
     ArenaCollectionError,
@@ -159,16 +168,14 @@ def filter_already_collected_posts(
         )
     return filtered
 
-_BRIGHTDATA_API_BASE: str = "https://api.brightdata.com/datasets/v3"
-_PROGRESS_URL: str = f"{_BRIGHTDATA_API_BASE}/progress/{{snapshot_id}}"
-_SNAPSHOT_URL: str = f"{_BRIGHTDATA_API_BASE}/snapshot/{{snapshot_id}}?format=json"
+
 _POLL_INTERVAL: int = 30
 _MAX_POLL_ATTEMPTS: int = 40
 
 
 def _build_trigger_url(dataset_id: str) -> str:
     """Build the full trigger URL for a comment dataset."""
-    return f"{_BRIGHTDATA_API_BASE}/trigger?dataset_id={dataset_id}&include_errors=true"
+    return f"{BRIGHTDATA_API_BASE}/trigger?dataset_id={dataset_id}&include_errors=true"
 
 
 class BrightDataCommentCollector:
@@ -215,13 +222,9 @@ class BrightDataCommentCollector:
         if not post_urls:
             return []
 
-        # Bright Data comment scrapers for Facebook and Instagram reject
-        # ``num_of_comments`` — the field is not part of their input schema.
-        # Send URL-only payloads; the scraper returns all available comments.
-        payload = [{"url": url} for url in post_urls]
-
-        trigger_url = _build_trigger_url(dataset_id)
-        snapshot_id = await self._trigger(client, api_token, trigger_url, payload, platform)
+        snapshot_id = await self.trigger_comments(
+            client, api_token, post_urls, dataset_id, platform
+        )
         raw_items = await self._poll_and_download(
             client, api_token, snapshot_id, platform, cancel_check
         )
@@ -248,6 +251,71 @@ class BrightDataCommentCollector:
         )
         return valid
 
+    async def trigger_comments(
+        self,
+        client: httpx.AsyncClient,
+        api_token: str,
+        post_urls: list[str],
+        dataset_id: str,
+        platform: str,
+    ) -> str:
+        """Trigger a Bright Data comment scrape and return its snapshot ID.
+
+        Does not wait for the snapshot; the snapshot poller picks it up.
+
+        Args:
+            client: Shared httpx async client.
+            api_token: Bright Data API bearer token.
+            post_urls: Post URLs to scrape comments from.
+            dataset_id: Bright Data dataset ID for comments.
+            platform: Platform name (``"facebook"`` or ``"instagram"``).
+
+        Returns:
+            The snapshot ID.
+        """
+        # Bright Data comment scrapers for Facebook and Instagram reject
+        # ``num_of_comments`` — the field is not part of their input schema.
+        # Send URL-only payloads; the scraper returns all available comments.
+        payload = [{"url": url} for url in post_urls]
+        return await self._trigger(
+            client, api_token, _build_trigger_url(dataset_id), payload, platform
+        )
+
+    async def iter_comments(
+        self,
+        client: httpx.AsyncClient,
+        api_token: str,
+        snapshot_id: str,
+        platform: str,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream the comments of a ready snapshot, skipping error records.
+
+        Args:
+            client: Shared httpx async client.
+            api_token: Bright Data API bearer token.
+            snapshot_id: Ready comment snapshot.
+            platform: Platform name for logging.
+
+        Yields:
+            Raw comment dicts, one at a time as they are downloaded.
+        """
+        async for item in iter_snapshot_records(
+            client,
+            api_token,
+            snapshot_id,
+            arena="social_media",
+            platform=f"{platform}_comments",
+        ):
+            if item.get("error_code"):
+                logger.warning(
+                    "%s_comments: BD error record — url=%s error=%s",
+                    platform,
+                    (item.get("input") or {}).get("url", "unknown"),
+                    item.get("error", ""),
+                )
+                continue
+            yield item
+
     async def _trigger(
         self,
         client: httpx.AsyncClient,
@@ -317,8 +385,7 @@ class BrightDataCommentCollector:
     ) -> list[dict[str, Any]]:
         """Poll until ready, then download the snapshot."""
         headers = {"Authorization": f"Bearer {api_token}"}
-        progress_url = _PROGRESS_URL.format(snapshot_id=snapshot_id)
-        snapshot_url = _SNAPSHOT_URL.format(snapshot_id=snapshot_id)
+        progress_url = PROGRESS_URL.format(snapshot_id=snapshot_id)
 
         for attempt in range(1, _MAX_POLL_ATTEMPTS + 1):
             if cancel_check is not None:
@@ -364,29 +431,20 @@ class BrightDataCommentCollector:
                 platform=f"{platform}_comments",
             )
 
-        # Download
-        try:
-            dl_resp = await client.get(snapshot_url, headers=headers)
-            dl_resp.raise_for_status()
-            raw_items: list[dict[str, Any]] = dl_resp.json()
-            if not isinstance(raw_items, list):
-                raw_items = raw_items.get("data", []) if isinstance(raw_items, dict) else []
-            logger.info(
-                "%s_comments: snapshot=%s downloaded %d items",
-                platform,
+        raw_items = [
+            item
+            async for item in iter_snapshot_records(
+                client,
+                api_token,
                 snapshot_id,
-                len(raw_items),
-            )
-            return raw_items
-        except httpx.HTTPStatusError as exc:
-            raise ArenaCollectionError(
-                f"{platform}_comments: BD download HTTP {exc.response.status_code}",
                 arena="social_media",
                 platform=f"{platform}_comments",
-            ) from exc
-        except httpx.RequestError as exc:
-            raise ArenaCollectionError(
-                f"{platform}_comments: BD download connection error: {exc}",
-                arena="social_media",
-                platform=f"{platform}_comments",
-            ) from exc
+            )
+        ]
+        logger.info(
+            "%s_comments: snapshot=%s downloaded %d items",
+            platform,
+            snapshot_id,
+            len(raw_items),
+        )
+        return raw_items
@@ -0,0 +1,940 @@
+"""Non-blocking Bright Data snapshot lifecycle for Facebook + Instagram.
+
+Bright Data's Web Scraper API is asynchronous: a trigger returns a
+``snapshot_id``, the scrape runs for minutes to hours, and the snapshot is
+downloaded once its progress reports ``ready``.  Instead of holding a Celery
+worker in a poll loop for that whole time, collection runs drive each
+snapshot through a small state machine:
+
+1. The collection task triggers its snapshots, registers one
+   :class:`SnapshotJob` per snapshot in :class:`SnapshotStore` and returns.
+2. The ``advance_brightdata_snapshots`` beat task
+   (:func:`advance_pending_snapshots`) polls the progress of every pending
+   snapshot once per tick and dispatches the platform's ``ingest_snapshot``
+   task for snapshots that became ready or failed.
+3. ``ingest_snapshot`` (:func:`ingest_snapshot`) downloads the snapshot as
+   NDJSON, parsing records incrementally (:func:`iter_snapshot_records`)
+   straight into the batch sink.  The job that settles the last snapshot of
+   a collection task completes that task (:func:`finalize_snapshot_task`).
+
+States::
+
+    triggered ──▶ running ──▶ ready ──▶ downloading ──▶ done
+        └────────────┴──────────┴────────────┴────────▶ failed
+
+Each job records when it entered its current state and how long it spent in
+the previous ones, so ``GET /collections/{run_id}/snapshots`` shows progress
+and time-in-state per run.  Keys::
+
+    brightdata:snapshot:{snapshot_id}              job JSON
+    brightdata:snapshots:pending                   IDs of non-terminal jobs
+    brightdata:run:{run_id}:snapshots              IDs of the run's jobs
+    brightdata:run:{run_id}:{task}:context         task context, open while triggering
+    brightdata:run:{run_id}:{task}:settled         claimed by the job that completes the task
+
+Unlike the cursor stores of the streaming arenas, Redis is the system of
+record here: store errors propagate, so a triggered snapshot is never
+silently forgotten.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from collections.abc import AsyncIterator, Callable
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+import httpx
+
+from issue_observatory.config.settings import get_settings
+from issue_observatory.core.event_bus import publish_task_update
+from issue_observatory.core.exceptions import ArenaCollectionError
+from issue_observatory.workers.runtime import run_async
+
+logger = logging.getLogger(__name__)
+
+BRIGHTDATA_API_BASE: str = "https://api.brightdata.com/datasets/v3"
+"""Base URL for the Bright Data Datasets v3 API."""
+
+PROGRESS_URL: str = f"{BRIGHTDATA_API_BASE}/progress/{{snapshot_id}}"
+"""URL template for snapshot progress. Format with ``snapshot_id``."""
+
+SNAPSHOT_URL: str = f"{BRIGHTDATA_API_BASE}/snapshot/{{snapshot_id}}?format=ndjson"
+"""URL template for downloading a ready snapshot as newline-delimited JSON."""
+
+# ---------------------------------------------------------------------------
+# States
+# ---------------------------------------------------------------------------
+
+TRIGGERED: str = "triggered"
+RUNNING: str = "running"
+READY: str = "ready"
+DOWNLOADING: str = "downloading"
+DONE: str = "done"
+FAILED: str = "failed"
+
+TERMINAL_STATES: frozenset[str] = frozenset({DONE, FAILED})
+
+POSTS: str = "posts"
+COMMENTS: str = "comments"
+
+# ---------------------------------------------------------------------------
+# Lifecycle limits
+# ---------------------------------------------------------------------------
+
+SNAPSHOT_MAX_AGE_SECONDS: int = 6 * 3_600
+"""Snapshots not ready this long after their trigger are failed."""
+
+DOWNLOAD_STALL_SECONDS: int = 3_600
+"""A download in progress this long is assumed lost and re-dispatched."""
+
+MAX_DOWNLOAD_ATTEMPTS: int = 3
+"""Downloads dispatched per snapshot before it is failed."""
+
+JOB_TTL_SECONDS: int = 7 * 86_400
+"""Expiry of job records and run indexes."""
+
+POLL_LOCK_SECONDS: int = 240
+"""Expiry of the lock that keeps overlapping poller ticks apart."""
+
+ARENA: str = "social_media"
+"""Arena of every Bright Data platform."""
+
+CREDENTIAL_PLATFORMS: dict[str, str] = {
+    "facebook": "brightdata_facebook",
+    "instagram": "brightdata_instagram",
+}
+"""Platform → credential pool platform of its Bright Data API token."""
+
+_JOB_PREFIX = "brightdata:snapshot"
+_PENDING_KEY = "brightdata:snapshots:pending"
+_RUN_PREFIX = "brightdata:run"
+_POLL_LOCK_KEY = "brightdata:snapshots:poll_lock"
+
+#: Characters between records: NDJSON newlines, or the brackets and commas
+#: of a JSON array when the API ignores ``format=ndjson``.
+_RECORD_SEPARATORS = " \t\r\n,[]"
+
+
+# ---------------------------------------------------------------------------
+# Jobs and store
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class SnapshotJob:
+    """One Bright Data snapshot and the collection context to ingest it.
+
+    Attributes:
+        snapshot_id: Bright Data snapshot ID.
+        platform: ``"facebook"`` or ``"instagram"``.
+        task: ``collection_tasks.arena`` label the snapshot belongs to
+            (``"facebook"``, ``"facebook_comments"``, ...).
+        kind: :data:`POSTS` or :data:`COMMENTS`.
+        collection_run_id: UUID string of the owning collection run.
+        query_design_id: UUID string of the owning query design.
+        inputs: Actor URLs or post URLs submitted with the trigger.
+        date_from: Effective lower date bound of the trigger.
+        date_to: Effective upper date bound of the trigger.
+        max_results: Cap on records ingested from the snapshot.
+        credential_id: ID of the pool credential whose token triggered the
+            snapshot; Bright Data only serves it to that account.
+        state: Current lifecycle state.
+        created_at: Unix time of the trigger.
+        state_since: Unix time the current state was entered.
+        state_seconds: Seconds spent in each earlier state.
+        polls: Progress requests made so far.
+        progress: Last progress payload returned by Bright Data.
+        downloads: Download attempts dispatched.
+        records_read: Records parsed from the snapshot.
+        records_inserted: Records newly persisted from the snapshot.
+        errors: Bright Data error records (``url``, ``error_code``,
+            ``error_detail``).
+        error: Reason the job failed.
+    """
+
+    snapshot_id: str
+    platform: str
+    task: str
+    kind: str
+    collection_run_id: str
+    query_design_id: str
+    inputs: list[str]
+    date_from: str | None = None
+    date_to: str | None = None
+    max_results: int | None = None
+    credential_id: str | None = None
+    state: str = TRIGGERED
+    created_at: float = field(default_factory=time.time)
+    state_since: float = field(default_factory=time.time)
+    state_seconds: dict[str, float] = field(default_factory=dict)
+    polls: int = 0
+    progress: dict[str, Any] = field(default_factory=dict)
+    downloads: int = 0
+    records_read: int = 0
+    records_inserted: int = 0
+    errors: list[dict[str, str]] = field(default_factory=list)
+    error: str | None = None
+
+    @property
+    def terminal(self) -> bool:
+        """``True`` once the job is done or failed."""
+        return self.state in TERMINAL_STATES
+
+    def seconds_in_state(self, now: float | None = None) -> float:
+        """Return seconds spent in the current state."""
+        return max(0.0, (now or time.time()) - self.state_since)
+
+    def summary(self, now: float | None = None) -> dict[str, Any]:
+        """Return the job as a JSON-serialisable progress view."""
+        view = asdict(self)
+        view["seconds_in_state"] = round(self.seconds_in_state(now), 1)
+        view["input_count"] = len(self.inputs)
+        del view["inputs"]
+        return view
+
+
+class SnapshotStore:
+    """Redis-backed registry of Bright Data snapshots shared across workers.
+
+    Args:
+        redis_url: Redis connection URL (``settings.redis_url``).
+    """
+
+    def __init__(self, redis_url: str) -> None:
+        self._redis_url = redis_url
+        self._redis: Any | None = None
+
+    async def _get_redis(self) -> Any:
+        """Return (lazily initialised) async Redis client."""
+        if self._redis is None:
+            import redis.asyncio as aioredis
+
+            self._redis = aioredis.from_url(self._redis_url, decode_responses=True)
+        return self._redis
+
+    async def aclose(self) -> None:
+        """Close the Redis connection (call before the event loop ends)."""
+        if self._redis is not None:
+            try:
+                await self._redis.aclose()
+            except Exception:
+                logger.debug("brightdata: snapshot store close failed", exc_info=True)
+            self._redis = None
+
+    @staticmethod
+    def _job_key(snapshot_id: str) -> str:
+        return f"{_JOB_PREFIX}:{snapshot_id}"
+
+    @staticmethod
+    def _run_key(run_id: str, suffix: str) -> str:
+        return f"{_RUN_PREFIX}:{run_id}:{suffix}"
+
+    # ------------------------------------------------------------------
+    # Jobs
+    # ------------------------------------------------------------------
+
+    async def register(self, job: SnapshotJob) -> None:
+        """Persist a freshly triggered job and index it as pending."""
+        redis = await self._get_redis()
+        run_key = self._run_key(job.collection_run_id, "snapshots")
+        await redis.set(self._job_key(job.snapshot_id), _dump(job), ex=JOB_TTL_SECONDS)
+        await redis.sadd(run_key, job.snapshot_id)
+        await redis.expire(run_key, JOB_TTL_SECONDS)
+        await redis.sadd(_PENDING_KEY, job.snapshot_id)
+
+    async def get(self, snapshot_id: str) -> SnapshotJob | None:
+        """Return the job of *snapshot_id*, or ``None`` when unknown."""
+        redis = await self._get_redis()
+        return _load(await redis.get(self._job_key(snapshot_id)))
+
+    async def _get_many(self, snapshot_ids: list[str]) -> list[SnapshotJob]:
+        if not snapshot_ids:
+            return []
+        redis = await self._get_redis()
+        raw = await redis.mget([self._job_key(sid) for sid in snapshot_ids])
+        jobs = [_load(value) for value in raw]
+        return [job for job in jobs if job is not None]
+
+    async def save(self, job: SnapshotJob) -> None:
+        """Persist progress counters of *job* without changing its state."""
+        redis = await self._get_redis()
+        await redis.set(self._job_key(job.snapshot_id), _dump(job), ex=JOB_TTL_SECONDS)
+
+    async def transition(self, job: SnapshotJob, state: str, **changes: Any) -> SnapshotJob:
+        """Move *job* to *state*, applying *changes*, and persist it.
+
+        Time spent in the previous state is added to ``state_seconds``.
+        Terminal jobs leave the pending index.
+        """
+        now = time.time()
+        if state != job.state:
+            job.state_seconds[job.state] = round(
+                job.state_seconds.get(job.state, 0.0) + job.seconds_in_state(now), 1
+            )
+            job.state = state
+            job.state_since = now
+        for name, value in changes.items():
+            setattr(job, name, value)
+        await self.save(job)
+        if job.terminal:
+            redis = await self._get_redis()
+            await redis.srem(_PENDING_KEY, job.snapshot_id)
+        return job
+
+    async def pending(self) -> list[SnapshotJob]:
+        """Return every job that has not reached a terminal state."""
+        redis = await self._get_redis()
+        snapshot_ids = sorted(await redis.smembers(_PENDING_KEY))
+        jobs = await self._get_many(snapshot_ids)
+        known = {job.snapshot_id for job in jobs}
+        expired = [sid for sid in snapshot_ids if sid not in known]
+        if expired:
+            await redis.srem(_PENDING_KEY, *expired)
+        return [job for job in jobs if not job.terminal]
+
+    async def for_run(self, run_id: str, task: str | None = None) -> list[SnapshotJob]:
+        """Return the jobs of *run_id*, optionally only those of *task*."""
+        redis = await self._get_redis()
+        snapshot_ids = sorted(await redis.smembers(self._run_key(run_id, "snapshots")))
+        jobs = await self._get_many(snapshot_ids)
+        if task is not None:
+            jobs = [job for job in jobs if job.task == task]
+        return sorted(jobs, key=lambda job: job.created_at)
+
+    # ------------------------------------------------------------------
+    # Collection tasks
+    # ------------------------------------------------------------------
+
+    async def begin_task(self, run_id: str, task: str, context: dict[str, Any]) -> None:
+        """Open *task* of *run_id* for triggering and store its context.
+
+        While a task is open, :meth:`settle` never completes it, so jobs that
+        finish before the last trigger cannot end the task early.
+        """
+        redis = await self._get_redis()
+        payload = {**context, "open": True, "started_at": context.get("started_at", time.time())}
+        await redis.set(
+            self._run_key(run_id, f"{task}:context"),
+            json.dumps(payload, ensure_ascii=False, default=str),
+            ex=JOB_TTL_SECONDS,
+        )
+
+    async def end_task(self, run_id: str, task: str) -> None:
+        """Close *task* of *run_id* once all its snapshots are triggered."""
+        context = await self.task_context(run_id, task)
+        context["open"] = False
+        redis = await self._get_redis()
+        await redis.set(
+            self._run_key(run_id, f"{task}:context"),
+            json.dumps(context, ensure_ascii=False, default=str),
+            ex=JOB_TTL_SECONDS,
+        )
+
+    async def task_context(self, run_id: str, task: str) -> dict[str, Any]:
+        """Return the context stored by :meth:`begin_task` (empty if none)."""
+        redis = await self._get_redis()
+        raw = await redis.get(self._run_key(run_id, f"{task}:context"))
+        try:
+            return json.loads(raw) if raw else {}
+        except ValueError:
+            return {}
+
+    async def settle(
+        self, run_id: str, task: str
+    ) -> tuple[dict[str, Any], list[SnapshotJob]] | None:
+        """Claim completion of *task* once it is closed and all its jobs ended.
+
+        Returns:
+            ``(context, jobs)`` for exactly one caller — the one that saw the
+            task settled first — or ``None``.
+        """
+        context = await self.task_context(run_id, task)
+        if context.get("open"):
+            return None
+        jobs = await self.for_run(run_id, task)
+        if any(not job.terminal for job in jobs):
+            return None
+        redis = await self._get_redis()
+        claimed = await redis.set(
+            self._run_key(run_id, f"{task}:settled"), "1", ex=JOB_TTL_SECONDS, nx=True
+        )
+        if not claimed:
+            return None
+        return context, jobs
+
+    async def acquire_poll_lock(self) -> bool:
+        """Return ``True`` if no other poller tick is running."""
+        redis = await self._get_redis()
+        return bool(await redis.set(_POLL_LOCK_KEY, "1", ex=POLL_LOCK_SECONDS, nx=True))
+
+    async def release_poll_lock(self) -> None:
+        """Release the lock taken by :meth:`acquire_poll_lock`."""
+        redis = await self._get_redis()
+        await redis.delete(_POLL_LOCK_KEY)
+
+
+def _dump(job: SnapshotJob) -> str:
+    return json.dumps(asdict(job), ensure_ascii=False)
+
+
+def _load(raw: str | None) -> SnapshotJob | None:
+    if not raw:
+        return None
+    try:
+        return SnapshotJob(**json.loads(raw))
+    except (TypeError, ValueError):
+        return None
+
+
+# ---------------------------------------------------------------------------
+# HTTP helpers
+# ---------------------------------------------------------------------------
+
+
+def error_entry(item: dict[str, Any]) -> dict[str, str] | None:
+    """Return the error entry of a Bright Data error record, else ``None``.
+
+    With ``include_errors=true`` on the trigger URL, failed scrapes are
+    delivered as records carrying an ``error_code`` instead of content.
+    """
+    error_code = item.get("error_code")
+    if not error_code:
+        return None
+    return {
+        "url": (item.get("input") or {}).get("url", "unknown"),
+        "error_code": str(error_code),
+        "error_detail": str(item.get("error", "")),
+    }
+
+
+async def fetch_progress(
+    client: httpx.AsyncClient, api_token: str, snapshot_id: str
+) -> dict[str, Any]:
+    """Return the progress payload of *snapshot_id*.
+
+    Raises:
+        httpx.HTTPError: On connection errors or non-2xx responses.
+    """
+    response = await client.get(
+        PROGRESS_URL.format(snapshot_id=snapshot_id),
+        headers={"Authorization": f"Bearer {api_token}"},
+    )
+    response.raise_for_status()
+    data = response.json()
+    return data if isinstance(data, dict) else {}
+
+
+async def snapshot_credential(credential_pool: Any, job: SnapshotJob) -> dict[str, Any] | None:
+    """Return the pool credential that triggered *job*.
+
+    Returns ``None`` when the job carries no credential or the credential
+    has since been removed.  The credential is not leased, so it must not be
+    released.
+    """
+    if credential_pool is None or job.credential_id is None:
+        return None
+    return await credential_pool.get(
+        platform=CREDENTIAL_PLATFORMS[job.platform],
+        tier="medium",
+        credential_id=job.credential_id,
+    )
+
+
+class _RecordDecoder:
+    """Incremental parser for NDJSON (or JSON array) snapshot bodies.
+
+    Only the unparsed tail of the body is kept in memory.
+    """
+
+    def __init__(self) -> None:
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+
+    def feed(self, chunk: str) -> list[dict[str, Any]]:
+        """Add *chunk* and return the records it completes."""
+        buffer = self._buffer + chunk
+        records: list[dict[str, Any]] = []
+        pos = 0
+        while True:
+            while pos < len(buffer) and buffer[pos] in _RECORD_SEPARATORS:
+                pos += 1
+            if pos >= len(buffer):
+                break
+            try:
+                value, pos = self._decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                break
+            if isinstance(value, dict) and isinstance(value.get("data"), list) and len(value) == 1:
+                # Some Bright Data endpoints wrap records in {"data": [...]}.
+                records.extend(v for v in value["data"] if isinstance(v, dict))
+            elif isinstance(value, dict):
+                records.append(value)
+        self._buffer = buffer[pos:]
+        return records
+
+    @property
+    def leftover(self) -> str:
+        """Unparsed trailing text; non-empty after a truncated body."""
+        return self._buffer.strip(_RECORD_SEPARATORS)
+
+
+async def iter_snapshot_records(
+    client: httpx.AsyncClient,
+    api_token: str,
+    snapshot_id: str,
+    arena: str = "social_media",
+    platform: str = "brightdata",
+) -> AsyncIterator[dict[str, Any]]:
+    """Stream a ready snapshot, yielding each record as soon as it is parsed.
+
+    Args:
+        client: HTTP client.
+        api_token: Bright Data API bearer token.
+        snapshot_id: Snapshot to download.
+        arena: Arena label for raised errors.
+        platform: Platform label for raised errors.
+
+    Yields:
+        Raw record dicts, error records included.
+
+    Raises:
+        ArenaCollectionError: On HTTP errors, connection errors or a
+            truncated body.
+    """
+    decoder = _RecordDecoder()
+    try:
+        async with client.stream(
+            "GET",
+            SNAPSHOT_URL.format(snapshot_id=snapshot_id),
+            headers={"Authorization": f"Bearer {api_token}"},
+        ) as response:
+            if response.status_code != 200:
+                body = (await response.aread())[:300].decode("utf-8", "replace")
+                raise ArenaCollectionError(
+                    f"{platform}: Bright Data snapshot {snapshot_id} download "
+                    f"HTTP {response.status_code}: {body}",
+                    arena=arena,
+                    platform=platform,
+                )
+            async for chunk in response.aiter_text():
+                for record in decoder.feed(chunk):
+                    yield record
+    except httpx.HTTPError as exc:
+        raise ArenaCollectionError(
+            f"{platform}: Bright Data snapshot {snapshot_id} download error: {exc}",
+            arena=arena,
+            platform=platform,
+        ) from exc
+    if decoder.leftover:
+        raise ArenaCollectionError(
+            f"{platform}: Bright Data snapshot {snapshot_id} ended mid-record",
+            arena=arena,
+            platform=platform,
+        )
+
+
+# ---------------------------------------------------------------------------
+# Poller
+# ---------------------------------------------------------------------------
+
+
+async def advance_pending_snapshots(
+    store: SnapshotStore,
+    client: httpx.AsyncClient,
+    credential_pool: Any,
+    is_cancelled: Any = None,
+) -> dict[str, list[SnapshotJob]]:
+    """Advance every pending snapshot by at most one step.
+
+    Triggered and running snapshots get one progress request each; ready
+    snapshots, and downloads that stalled, move to ``downloading``.
+
+    Args:
+        store: Snapshot store.
+        client: HTTP client for progress requests.
+        credential_pool: Credential pool; each job is polled with the token
+            of the credential that triggered it (:func:`snapshot_credential`).
+            Jobs whose credential is unavailable wait for the next tick.
+        is_cancelled: Optional ``(run_id) -> bool`` callable; jobs of
+            cancelled runs are failed without a download.
+
+    Returns:
+        ``{"dispatch": [...], "failed": [...]}`` — jobs whose platform
+        ``ingest_snapshot`` task must now run to download or settle them.
+    """
+    now = time.time()
+    dispatch: list[SnapshotJob] = []
+    failed: list[SnapshotJob] = []
+    cancelled_runs: dict[str, bool] = {}
+    api_tokens: dict[str | None, str] = {}
+
+    for job in await store.pending():
+        run_id = job.collection_run_id
+        if is_cancelled is not None:
+            if run_id not in cancelled_runs:
+                cancelled_runs[run_id] = bool(is_cancelled(run_id))
+            if cancelled_runs[run_id]:
+                await store.transition(job, FAILED, error="collection run cancelled")
+                failed.append(job)
+                continue
+
+        if job.state in (TRIGGERED, RUNNING):
+            if now - job.created_at > SNAPSHOT_MAX_AGE_SECONDS:
+                await store.transition(
+                    job,
+                    FAILED,
+                    error=f"not ready after {SNAPSHOT_MAX_AGE_SECONDS // 60} minutes",
+                )
+                failed.append(job)
+                continue
+            if job.credential_id not in api_tokens:
+                cred = await snapshot_credential(credential_pool, job)
+                api_tokens[job.credential_id] = (
+                    cred.get("api_token") or cred.get("api_key", "") if cred else ""
+                )
+            api_token = api_tokens[job.credential_id]
+            if not api_token:
+                continue
+            try:
+                progress = await fetch_progress(client, api_token, job.snapshot_id)
+            except httpx.HTTPError as exc:
+                logger.warning(
+                    "brightdata: progress poll failed for snapshot=%s: %s",
+                    job.snapshot_id,
+                    exc,
+                )
+                continue
+            status = str(progress.get("status", ""))
+            if status == "ready":
+                await store.transition(job, READY, polls=job.polls + 1, progress=progress)
+            elif status in ("failed", "error"):
+                await store.transition(
+                    job,
+                    FAILED,
+                    polls=job.polls + 1,
+                    progress=progress,
+                    error=f"snapshot {status}: {progress.get('error') or progress}",
+                )
+                failed.append(job)
+                continue
+            else:
+                await store.transition(job, RUNNING, polls=job.polls + 1, progress=progress)
+
+        stalled = (
+            job.state == DOWNLOADING
+            and job.seconds_in_state(now) > DOWNLOAD_STALL_SECONDS
+        )
+        if job.state == READY or stalled:
+            if job.downloads >= MAX_DOWNLOAD_ATTEMPTS:
+                await store.transition(
+                    job, FAILED, error=f"download failed {job.downloads} times"
+                )
+                failed.append(job)
+                continue
+            if stalled:
+                await store.transition(job, READY)
+            await store.transition(job, DOWNLOADING, downloads=job.downloads + 1)
+            dispatch.append(job)
+
+    return {"dispatch": dispatch, "failed": failed}
+
+
+def ingest_task_name(platform: str) -> str:
+    """Return the Celery task that ingests snapshots of *platform*."""
+    return f"issue_observatory.arenas.{platform}.tasks.ingest_snapshot"
+
+
+# ---------------------------------------------------------------------------
+# Ingest and task completion
+# ---------------------------------------------------------------------------
+
+ReindexCallback = Callable[[dict[str, Any], str, str], int]
+"""``(context, collection_run_id, query_design_id) -> linked`` — links records
+of earlier runs to the run once its actor task settles (see
+:func:`~issue_observatory.workers._task_helpers.reindex_existing_records`)."""
+
+
+def finalize_snapshot_task(
+    platform: str,
+    task: str,
+    context: dict[str, Any],
+    jobs: list[SnapshotJob],
+    collection_run_id: str,
+    query_design_id: str,
+    reindex: ReindexCallback | None = None,
+    trigger_errors: list[str] | None = None,
+) -> dict[str, Any]:
+    """Complete a collection task whose Bright Data snapshots have all settled.
+
+    Called exactly once per task — by the trigger task when nothing is left
+    to wait for, otherwise by the ``ingest_snapshot`` task that settled the
+    last snapshot (see :meth:`SnapshotStore.settle`).  The task fails only
+    when every snapshot failed.
+
+    Args:
+        platform: ``"facebook"`` or ``"instagram"``.
+        task: ``collection_tasks`` arena label (*platform* or
+            ``"{platform}_comments"``).
+        context: Task context stored by :meth:`SnapshotStore.begin_task`.
+        jobs: Settled snapshot jobs of the task.
+        collection_run_id: UUID string of the owning collection run.
+        query_design_id: UUID string of the owning query design.
+        reindex: Links existing records to the run; called for the actor
+            task only.
+        trigger_errors: Actors whose trigger failed (for the log summary).
+
+    Returns:
+        Dict with ``records_collected``, ``status``, ``arena``, ``platform``, ``tier``.
+    """
+    from issue_observatory.workers._task_helpers import (
+        count_run_platform_records,
+        update_collection_task_status,
+    )
+
+    elapsed = max(0.0, time.time() - float(context.get("started_at") or time.time()))
+    tier = context.get("tier", "medium")
+    total_inserted = sum(job.records_inserted for job in jobs)
+    failures = [f"{job.snapshot_id}: {job.error}" for job in jobs if job.state == FAILED]
+    all_failed = bool(jobs) and len(failures) == len(jobs)
+    status = "failed" if all_failed else "completed"
+    error_message = "; ".join(failures)[:500] if all_failed else None
+
+    linked = 0
+    if task == platform:
+        # Fallback: if per-snapshot counters missed records, use DB count.
+        if total_inserted == 0:
+            db_count = count_run_platform_records(collection_run_id, platform)
+            if db_count > 0:
+                logger.info(
+                    "%s: per-snapshot counter=0 but DB has %d records — using DB count",
+                    platform,
+                    db_count,
+                )
+                total_inserted = db_count
+
+        # Link existing records from other runs to this run so that
+        # analysis includes previously collected content without
+        # re-fetching from Bright Data.
+        if reindex is not None:
+            linked = reindex(context, collection_run_id, query_design_id)
+        if linked:
+            logger.info(
+                "%s: reindexed %d existing records for run=%s",
+                platform,
+                linked,
+                collection_run_id,
+            )
+
+    errors = (trigger_errors or []) + failures
+    error_summary = f" ({len(errors)} errors)" if errors else ""
+    logger.info(
+        "%s: %s %s — run=%s snapshots=%d inserted=%d linked=%d%s",
+        platform,
+        task,
+        status,
+        collection_run_id,
+        len(jobs),
+        total_inserted,
+        linked,
+        error_summary,
+    )
+    update_collection_task_status(
+        collection_run_id,
+        task,
+        status,
+        records_collected=total_inserted,
+        error_message=error_message,
+    )
+    publish_task_update(
+        redis_url=get_settings().redis_url,
+        run_id=collection_run_id,
+        arena=ARENA,
+        platform=task,
+        status=status,
+        records_collected=total_inserted,
+        error_message=error_message,
+        elapsed_seconds=elapsed,
+    )
+    return {
+        "records_collected": total_inserted,
+        "status": status,
+        "arena": ARENA,
+        "platform": task,
+        "tier": tier,
+    }
+
+
+async def ingest_snapshot_job(store: SnapshotStore, job: SnapshotJob, collector: Any) -> None:
+    """Stream a ``downloading`` job into the batch sink and record its coverage.
+
+    A failed download moves the job back to ``ready``; the poller retries it
+    until :data:`MAX_DOWNLOAD_ATTEMPTS` is reached.
+
+    Args:
+        store: Snapshot store.
+        job: The job to download.
+        collector: The platform's collector; its ``ingest_snapshot`` parses
+            the records.
+    """
+    from issue_observatory.workers._task_helpers import (
+        clear_url_errors,
+        make_batch_sink,
+        persist_collected_records,
+        record_collection_attempts_batch,
+        record_url_errors,
+    )
+
+    collector.configure_batch_persistence(
+        sink=make_batch_sink(
+            job.collection_run_id, job.query_design_id, actor_sourced=True,
+        ),
+        batch_size=100,
+        collection_run_id=job.collection_run_id,
+    )
+    try:
+        remaining = await collector.ingest_snapshot(job)
+    except Exception as exc:
+        logger.warning(
+            "%s: snapshot=%s download %d/%d failed: %s",
+            job.platform,
+            job.snapshot_id,
+            job.downloads,
+            MAX_DOWNLOAD_ATTEMPTS,
+            exc,
+        )
+        await store.transition(job, READY, error=f"{type(exc).__name__}: {exc}"[:500])
+        return
+
+    # Most records already persisted incrementally via the batch sink.
+    # Persist any remaining un-flushed records as a fallback.
+    fallback_inserted = 0
+    if remaining:
+        fallback_inserted, _ = persist_collected_records(
+            remaining, job.collection_run_id, job.query_design_id
+        )
+    inserted = collector.batch_stats["inserted"] + fallback_inserted
+
+    if job.kind == COMMENTS:
+        # Record comment collection attempts so posts aren't re-submitted
+        # on the next run (even if they returned 0 comments).
+        now_iso = datetime.now(UTC).isoformat()
+        record_collection_attempts_batch(
+            platform=f"{job.platform}_comments",
+            collection_run_id=job.collection_run_id,
+            query_design_id=job.query_design_id,
+            inputs=job.inputs,
+            input_type="post_url",
+            date_from=now_iso,
+            date_to=now_iso,
+            records_returned=inserted,
+        )
+    else:
+        # Record per-actor coverage and track BD errors / clear recovered URLs.
+        if job.date_from and job.date_to:
+            record_collection_attempts_batch(
+                platform=job.platform,
+                collection_run_id=job.collection_run_id,
+                query_design_id=job.query_design_id,
+                inputs=job.inputs,
+                input_type="actor",
+                date_from=job.date_from,
+                date_to=job.date_to,
+                records_returned=inserted,
+                per_input_counts=dict.fromkeys(job.inputs, inserted),
+            )
+        actor_bd_errors = [e for e in job.errors if e.get("url") in job.inputs]
+        if actor_bd_errors:
+            record_url_errors(job.platform, actor_bd_errors)
+        else:
+            clear_url_errors(job.platform, job.inputs)
+
+    await store.transition(job, DONE, records_inserted=inserted, error=None)
+
+
+def ingest_snapshot(
+    platform: str,
+    snapshot_id: str,
+    collection_run_id: str,
+    make_collector: Callable[[], Any],
+    reindex: ReindexCallback | None = None,
+) -> dict[str, Any]:
+    """Body of the platforms' ``ingest_snapshot`` Celery tasks.
+
+    Downloads the snapshot if it is ``downloading``, then completes the
+    task that triggered it if this was its last open snapshot.
+
+    Args:
+        platform: ``"facebook"`` or ``"instagram"``.
+        snapshot_id: Bright Data snapshot ID.
+        collection_run_id: UUID string of the owning collection run.
+        make_collector: Returns a fresh collector of *platform*.
+        reindex: Passed to :func:`finalize_snapshot_task`.
+
+    Returns:
+        Dict with ``snapshot_id``, ``state``, ``records_collected`` and ``task``.
+    """
+    redis_url = get_settings().redis_url
+    store = SnapshotStore(redis_url)
+
+    async def _ingest() -> tuple[
+        SnapshotJob | None, tuple[dict[str, Any], list[SnapshotJob]] | None
+    ]:
+        try:
+            job = await store.get(snapshot_id)
+            if job is None:
+                return None, None
+            if job.state == DOWNLOADING:
+                await ingest_snapshot_job(store, job, make_collector())
+                context = await store.task_context(collection_run_id, job.task)
+                jobs = await store.for_run(collection_run_id, job.task)
+                publish_task_update(
+                    redis_url=redis_url,
+                    run_id=collection_run_id,
+                    arena=ARENA,
+                    platform=job.task,
+                    status="running",
+                    records_collected=sum(j.records_inserted for j in jobs),
+                    error_message=None,
+                    elapsed_seconds=max(
+                        0.0, time.time() - float(context.get("started_at") or job.created_at)
+                    ),
+                )
+            return job, await store.settle(collection_run_id, job.task)
+        finally:
+            await store.aclose()
+
+    job, settled = run_async(_ingest())
+    if job is None:
+        logger.warning("%s: ingest_snapshot — unknown snapshot=%s", platform, snapshot_id)
+        return {"snapshot_id": snapshot_id, "state": None, "records_collected": 0, "task": None}
+
+    logger.info(
+        "%s: snapshot=%s %s — run=%s task=%s inserted=%d",
+        platform,
+        snapshot_id,
+        job.state,
+        collection_run_id,
+        job.task,
+        job.records_inserted,
+    )
+    if settled is not None:
+        context, jobs = settled
+        finalize_snapshot_task(
+            platform,
+            job.task,
+            context,
+            jobs,
+            collection_run_id,
+            job.query_design_id,
+            reindex=reindex,
+        )
+    return {
+        "snapshot_id": snapshot_id,
+        "state": job.state,
+        "records_collected": job.records_inserted,
+        "task": job.task,
+    }
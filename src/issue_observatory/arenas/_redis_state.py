@@ -0,0 +1,141 @@
+"""Shared Redis plumbing for the arenas' persistent sync state.
+
+Several arenas keep per-source state between collection runs in Redis — RSS
+conditional-GET validators, Discord snowflake cursors, Telegram high-water
+marks, the Bluesky Jetstream cursor.  The stores differ in their keys and
+records but share how they talk to Redis:
+
+- :class:`RedisStateStore` — lazily connected client, :meth:`~RedisStateStore.aclose`,
+  and JSON records stored under per-scope keys with a refreshed TTL.  Redis
+  failures are logged and swallowed; a collection falls back to reading
+  without state.
+- :class:`SyncedHistory` — the ``synced_from`` coverage check of cursors
+  that resume paging from a high-water mark.
+- :func:`collect_then_close` — closes the stores a task opened on the event
+  loop that ran the collection.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from collections.abc import Callable, Coroutine
+from dataclasses import asdict
+from datetime import datetime
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SyncedHistory:
+    """Mixin for cursor dataclasses with a ``synced_from`` field.
+
+    ``synced_from`` is the ISO timestamp down to which the history below the
+    cursor has been evaluated without gaps, or ``None`` when it was paged to
+    the start of the source.
+    """
+
+    synced_from: str | None
+
+    def covers(self, date_from: datetime | None) -> bool:
+        """Return ``True`` if the evaluated history reaches back to *date_from*.
+
+        Only then can a run resume from the cursor instead of paging the
+        source down to ``date_from`` again.
+        """
+        if self.synced_from is None:
+            return True
+        if date_from is None:
+            return False
+        return date_from >= datetime.fromisoformat(self.synced_from)
+
+
+class RedisStateStore:
+    """Base class of the Redis-backed arena state stores.
+
+    Args:
+        redis_url: Redis connection URL (``settings.redis_url``).
+        scope: Consumer scope, normally the query design ID.
+        ttl_seconds: Expiry of stored records; refreshed on every save.
+    """
+
+    log_prefix: str = "arenas"
+    """Arena name that prefixes the store's log messages."""
+
+    def __init__(self, redis_url: str, scope: str, ttl_seconds: int) -> None:
+        self._redis_url = redis_url
+        self._scope = scope
+        self._ttl = ttl_seconds
+        self._redis: Any | None = None
+
+    async def _get_redis(self) -> Any:
+        """Return (lazily initialised) async Redis client."""
+        if self._redis is None:
+            import redis.asyncio as aioredis
+
+            self._redis = aioredis.from_url(self._redis_url, decode_responses=True)
+        return self._redis
+
+    async def aclose(self) -> None:
+        """Close the Redis connection (call before the event loop ends)."""
+        if self._redis is not None:
+            try:
+                await self._redis.aclose()
+            except Exception:
+                logger.debug("%s: state store close failed", self.log_prefix, exc_info=True)
+            self._redis = None
+
+    async def _load_records(
+        self,
+        ids: list[str],
+        key: Callable[[str], str],
+        record_type: Callable[..., T],
+        what: str,
+    ) -> dict[str, T]:
+        """Load the JSON records of *ids* in one ``MGET``.
+
+        Args:
+            ids: Source identifiers (feed URLs, channel IDs, ...).
+            key: Returns the Redis key of one identifier.
+            record_type: Dataclass built from each record's fields.
+            what: Record description for the log message.
+
+        Returns:
+            ``{id: record}`` for identifiers with a readable record; empty
+            when Redis is unavailable.
+        """
+        if not ids:
+            return {}
+        try:
+            redis = await self._get_redis()
+            raw = await redis.mget([key(i) for i in ids])
+        except Exception as exc:
+            logger.warning("%s: could not load %s: %s", self.log_prefix, what, exc)
+            return {}
+        records: dict[str, T] = {}
+        for i, value in zip(ids, raw, strict=True):
+            if value:
+                try:
+                    records[i] = record_type(**json.loads(value))
+                except (TypeError, ValueError):
+                    continue
+        return records
+
+    async def _save_record(self, key: str, record: Any, what: str) -> None:
+        """Store one dataclass *record* as JSON under *key*."""
+        try:
+            redis = await self._get_redis()
+            await redis.set(key, json.dumps(asdict(record)), ex=self._ttl)
+        except Exception as exc:
+            logger.warning("%s: could not save %s: %s", self.log_prefix, what, exc)
+
+
+async def collect_then_close(coro: Coroutine[Any, Any, T], *stores: RedisStateStore) -> T:
+    """Await *coro*, then close *stores* on the same event loop."""
+    try:
+        return await coro
+    finally:
+        for store in stores:
+            await store.aclose()
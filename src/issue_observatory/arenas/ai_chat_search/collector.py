@@ -69,6 +69,7 @@ from issue_observatory.core.exceptions import (
     ArenaRateLimitError,
     NoCredentialAvailableError,
 )
+from issue_observatory.workers.runtime import shared_http_transport
 
 logger = logging.getLogger(__name__)
 
@@ -514,6 +515,7 @@ class AiChatSearchCollector(ArenaCollector):
                     "IssueObservatory/1.0 (ai-chat-search-collector; research use)"
                 )
             },
+            transport=shared_http_transport(),
         ) as client:
             yield client
 
@@ -26,7 +26,6 @@ Note on tier strings:
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import time
 from typing import Any
@@ -41,6 +40,7 @@ from issue_observatory.core.exceptions import (
     NoCredentialAvailableError,
 )
 from issue_observatory.workers.celery_app import celery_app
+from issue_observatory.workers.runtime import run_async
 
 logger = logging.getLogger(__name__)
 
@@ -230,7 +230,7 @@ def ai_chat_search_collect_terms(
         collector.configure_batch_persistence(sink=sink, batch_size=100, collection_run_id=collection_run_id)
 
         try:
-            remaining = asyncio.run(
+            remaining = run_async(
                 collector.collect_by_terms(
                     terms=terms,
                     tier=tier_enum,
@@ -353,7 +353,7 @@ def ai_chat_search_health_check() -> dict[str, Any]:
     """
     credential_pool = CredentialPool()
     collector = AiChatSearchCollector(credential_pool=credential_pool)
-    result: dict[str, Any] = asyncio.run(collector.health_check())
+    result: dict[str, Any] = run_async(collector.health_check())
     logger.info(
         "ai_chat_search: health_check status=%s",
         result.get("status", "unknown"),
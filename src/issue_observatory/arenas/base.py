@@ -23,6 +23,7 @@ Example usage::
 from __future__ import annotations
 
 import logging
+import time
 from abc import ABC, abstractmethod
 from datetime import UTC, datetime
 from enum import Enum
@@ -147,6 +148,27 @@ class ArenaCollector(ABC):
     (e.g. Google Search, GDELT) should leave this at the default ``False``.
     """
 
+    supports_coverage_check: bool = False
+    """Whether this arena's tasks narrow collection with the coverage checker.
+
+    Set to ``True`` for arenas whose ``collect_by_terms`` / ``collect_by_actors``
+    tasks call :func:`~issue_observatory.core.coverage_checker.check_existing_coverage`.
+    The orchestration layer plans coverage for these arenas in one batch
+    (:func:`~issue_observatory.core.coverage_checker.plan_coverage`) and passes
+    each task its uncovered date ranges as the ``coverage_gaps`` kwarg.
+    """
+
+    supports_live_stream: bool = False
+    """Whether this arena's task module provides a ``stream_live`` task.
+
+    When ``True`` and ``Settings.live_streaming_enabled`` is set, the daily
+    live-tracking trigger does not dispatch ``collect_by_terms`` (or the
+    dual-mode ``collect_by_actors``) for this arena.  It instead collects the
+    terms and source lists of all live designs and starts one ``stream_live``
+    task on the ``streaming`` queue that serves them all (e.g. the Bluesky
+    Jetstream firehose).
+    """
+
     source_list_daily_chunk_size: int | None = None
     """Maximum number of source-list actors to dispatch per daily collection run.
 
@@ -333,18 +355,35 @@ class ArenaCollector(ABC):
         """
         if not self._batch_buffer or self._record_sink is None:
             return
+        from issue_observatory.core import worker_metrics
+
         batch = self._batch_buffer
         self._batch_buffer = []
+        labels = {
+            "arena": getattr(self, "arena_name", "unknown"),
+            "platform": getattr(self, "platform_name", "unknown"),
+            "tier": str(batch[0].get("collection_tier") or "unknown"),
+        }
+        started = time.perf_counter()
         try:
             inserted, skipped = self._record_sink(batch)
             self._total_inserted += inserted
             self._total_skipped += skipped
+            worker_metrics.collection_records_persisted_total.inc(
+                inserted, outcome="inserted", **labels
+            )
+            worker_metrics.collection_records_persisted_total.inc(
+                skipped, outcome="skipped", **labels
+            )
         except Exception as exc:
             # Let RunCancelledError propagate so the task stops immediately.
             from issue_observatory.workers._task_helpers import RunCancelledError
 
             if isinstance(exc, RunCancelledError):
                 raise
+            worker_metrics.collection_records_persisted_total.inc(
+                len(batch), outcome="failed", **labels
+            )
             logger.warning(
                 "%s: batch flush failed (%d records), keeping in buffer for fallback: %s",
                 getattr(self, "platform_name", "unknown"),
@@ -354,6 +393,11 @@ class ArenaCollector(ABC):
             self._batch_errors.append(str(exc))
             # Put records back so the task-level fallback can persist them.
             self._batch_buffer = batch + self._batch_buffer
+        finally:
+            worker_metrics.collection_flush_seconds.observe(
+                time.perf_counter() - started, **labels
+            )
+        worker_metrics.maybe_flush_worker_metrics()
 
     def _record_input_count(self, input_key: str, count: int) -> None:
         """Record how many records a specific input (term/actor) produced.
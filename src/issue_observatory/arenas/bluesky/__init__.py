@@ -12,7 +12,8 @@ and by filtering author feeds for known Danish handles/DIDs.
 The collector obtains a session token via ``com.atproto.server.createSession``
 and uses it for all subsequent requests with the Authorization header.
 
-The ``BlueskyStreamer`` class in ``collector.py`` provides optional Jetstream
-firehose support for real-time collection, but batch Celery tasks do not
-require it.
+The ``BlueskyStreamer`` class in ``collector.py`` consumes the Jetstream
+firehose for live tracking: the ``stream_live`` task matches every live
+design's terms and actors against one connection, resuming from a cursor
+kept in Redis (``stream_state.py``).
 """
@@ -17,18 +17,22 @@ via the ``Authorization: Bearer {token}`` header.
 Rate limiting uses :meth:`RateLimiter.wait_for_slot` with key
 ``ratelimit:bluesky:public:{credential_id}``.
 
-The :class:`BlueskyStreamer` class provides optional Jetstream firehose support
-for real-time streaming collection.  It is NOT required by the batch Celery
-tasks and is documented as a future enhancement.
+Live tracking can instead run :class:`BlueskyStreamer`, which consumes the
+Jetstream firehose over one WebSocket connection and matches posts against
+the terms and actors of every live query design in-process (see the
+``stream_live`` task).
 
 All requests use Danish defaults: ``lang=da`` on term searches.
 """
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import httpx
 
@@ -38,10 +42,18 @@ from issue_observatory.arenas.bluesky.config import (
     BSKY_API_BASE,
     BSKY_AUTHOR_FEED_ENDPOINT,
     BSKY_GET_POST_THREAD_ENDPOINT,
+    BSKY_RESOLVE_HANDLE_ENDPOINT,
     BSKY_SEARCH_POSTS_ENDPOINT,
     BSKY_WEB_BASE,
     DANISH_LANG,
+    JETSTREAM_ENDPOINTS,
+    JETSTREAM_MAX_WANTED_DIDS,
+    JETSTREAM_POST_COLLECTION,
     MAX_RESULTS_PER_PAGE,
+    STREAM_BATCH_SIZE,
+    STREAM_FLUSH_INTERVAL_SECONDS,
+    STREAM_MAX_BACKOFF_SECONDS,
+    STREAM_QUEUE_SIZE,
 )
 from issue_observatory.arenas.query_builder import format_boolean_query_for_platform
 from issue_observatory.arenas.registry import register
@@ -52,6 +64,11 @@ from issue_observatory.core.exceptions import (
 )
 from issue_observatory.core.language_utils import resolve_bluesky_lang
 from issue_observatory.core.normalizer import Normalizer
+from issue_observatory.core.term_matcher import get_term_matcher
+from issue_observatory.workers.runtime import shared_http_transport
+
+if TYPE_CHECKING:
+    from issue_observatory.arenas.bluesky.stream_state import StreamCursorStore
 
 logger = logging.getLogger(__name__)
 
@@ -88,6 +105,8 @@ class BlueskyCollector(ArenaCollector):
     supported_tiers: list[Tier] = [Tier.FREE]
     temporal_mode: TemporalMode = TemporalMode.RECENT
     supports_actor_collection: bool = True
+    supports_coverage_check: bool = True
+    supports_live_stream: bool = True
     source_list_config_key: str | None = "custom_accounts"
 
     def __init__(
@@ -536,6 +555,45 @@ class BlueskyCollector(ArenaCollector):
         except httpx.RequestError as exc:
             return {**base, "status": "down", "detail": f"Connection error: {exc}"}
 
+    async def resolve_dids(self, actor_ids: list[str]) -> list[str]:
+        """Resolve Bluesky handles to DIDs for matching Jetstream events.
+
+        Jetstream identifies authors by DID only.  DIDs are passed through;
+        handles (with or without a leading ``@``) are resolved with the
+        unauthenticated ``com.atproto.identity.resolveHandle`` endpoint.
+        Handles that cannot be resolved are logged and left out.
+
+        Args:
+            actor_ids: Bluesky DIDs or handles.
+
+        Returns:
+            The DIDs, in input order and without duplicates.
+        """
+        dids: list[str] = []
+        handles: list[str] = []
+        for actor_id in actor_ids:
+            actor = actor_id.strip().lstrip("@")
+            if actor.startswith("did:"):
+                dids.append(actor)
+            elif actor:
+                handles.append(actor)
+
+        if handles:
+            async with self._build_http_client() as client:
+                for handle in handles:
+                    try:
+                        response = await client.get(
+                            BSKY_RESOLVE_HANDLE_ENDPOINT, params={"handle": handle}
+                        )
+                        response.raise_for_status()
+                        did = response.json().get("did")
+                    except (httpx.HTTPError, ValueError) as exc:
+                        logger.warning("bluesky: could not resolve handle %r: %s", handle, exc)
+                        continue
+                    if did:
+                        dids.append(did)
+        return list(dict.fromkeys(dids))
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
@@ -544,7 +602,7 @@ class BlueskyCollector(ArenaCollector):
         """Return an :class:`httpx.AsyncClient` for use as a context manager."""
         if self._http_client is not None:
             return self._http_client  # type: ignore[return-value]
-        return httpx.AsyncClient(timeout=30.0)
+        return httpx.AsyncClient(timeout=30.0, transport=shared_http_transport())
 
     async def _authenticate(self, client: httpx.AsyncClient) -> str:
         """Authenticate with Bluesky and obtain a session token.
@@ -1002,132 +1060,355 @@ def _build_comment_raw(
 
 
 # ---------------------------------------------------------------------------
-# BlueskyStreamer — optional Jetstream firehose support
+# BlueskyStreamer — Jetstream firehose consumer for live tracking
 # ---------------------------------------------------------------------------
 
 
-class BlueskyStreamer:
-    """Optional Jetstream firehose client for real-time Bluesky post streaming.
+@dataclass
+class StreamSubscription:
+    """What one live query design wants from the firehose.
+
+    Attributes:
+        collector: Collector that normalizes the design's posts and owns its
+            batch sink (see :meth:`ArenaCollector.configure_batch_persistence`).
+        term_groups: AND-groups of terms; a post matches when every term of
+            one group occurs in its text (word-boundary rules of
+            :func:`~issue_observatory.arenas.query_builder.term_in_text`).
+        actor_dids: Authors whose posts match regardless of text or language.
+        languages: ISO 639-1 codes a term match must be tagged with.  Posts
+            without a ``langs`` tag pass, as they always have in the streamer.
+    """
+
+    collector: BlueskyCollector
+    term_groups: list[list[str]] = field(default_factory=list)
+    actor_dids: set[str] = field(default_factory=set)
+    languages: list[str] = field(default_factory=lambda: [DANISH_LANG])
+
+    def __post_init__(self) -> None:
+        self.term_groups = [[t.lower() for t in grp] for grp in self.term_groups if grp]
+        self.actor_dids = set(self.actor_dids)
+        self.languages = [lang.lower() for lang in self.languages]
+
 
-    This class connects to a Jetstream WebSocket endpoint and streams new
-    Bluesky posts in real time.  It is NOT required by the batch Celery tasks
-    and is documented as a future enhancement for live tracking.
+_STOP = object()
+
+
+class BlueskyStreamer:
+    """Jetstream firehose consumer that replaces per-term search polling.
+
+    One WebSocket connection (``wantedCollections=app.bsky.feed.post``)
+    serves every :class:`StreamSubscription`.  Each created post is checked
+    in-process: the language filter first, then a single word-boundary
+    :class:`~issue_observatory.core.term_matcher.TermMatcher` pass over the
+    text for the terms of all subscriptions together, then each
+    subscription's AND-groups and actor DIDs.  When no subscription has
+    terms, the actor DIDs are sent as ``wantedDids`` so that Jetstream
+    filters server-side.
+
+    Matched posts go through a bounded queue to a writer that hands them to
+    the subscriptions' batch sinks (in a thread, since the sinks are
+    synchronous).  When the sinks fall behind or fail, the queue fills and
+    the reader stops reading frames — backpressure reaches Jetstream instead
+    of growing memory.  After every successful flush the cursor (``time_us``
+    of the last event fully handled) is saved to the
+    :class:`~issue_observatory.arenas.bluesky.stream_state.StreamCursorStore`
+    and reconnects resume from it, rotating through *endpoints* with
+    exponential backoff (1s → 2s → ... → 60s).
 
     Usage::
 
         streamer = BlueskyStreamer(
-            collector=BlueskyCollector(),
-            on_record=lambda record: print(record),
+            subscriptions=[StreamSubscription(collector, term_groups=[["folketinget"]])],
+            cursor_store=StreamCursorStore(settings.redis_url),
         )
-        await streamer.run()
-
-    Notes:
-        - Requires the ``websockets`` package (not installed by default).
-        - No language filter is available on the Jetstream; Danish posts must
-          be filtered client-side using the ``lang`` field in post records.
-        - Store the cursor (Unix microsecond timestamp) for reconnection.
-        - Exponential backoff is applied on disconnect.
+        await streamer.run(max_seconds=3600)
 
     Args:
-        collector: A :class:`BlueskyCollector` instance used for normalization.
-        on_record: Async callback invoked with each normalized post record.
-        endpoint: Jetstream WebSocket URL.  Defaults to the first US-East endpoint.
-        wanted_dids: Optional list of DIDs to filter (up to 10,000).
+        subscriptions: Query designs to match posts for.
+        cursor_store: Optional cursor persistence; without it the stream
+            starts at the live tip and resumes only within this process.
+        endpoints: Jetstream WebSocket URLs.  Defaults to
+            :data:`~.config.JETSTREAM_ENDPOINTS`.
+        queue_size: Matched posts buffered ahead of the sinks.
+        batch_size: Posts handed to the sinks before a flush is forced.
+        flush_interval: Maximum seconds between flushes.
     """
 
-    DEFAULT_ENDPOINT: str = "wss://jetstream1.us-east.bsky.network/subscribe"
-
     def __init__(
         self,
-        collector: BlueskyCollector,
-        on_record: Any,
-        endpoint: str | None = None,
-        wanted_dids: list[str] | None = None,
+        subscriptions: list[StreamSubscription],
+        cursor_store: StreamCursorStore | None = None,
+        endpoints: list[str] | None = None,
+        queue_size: int = STREAM_QUEUE_SIZE,
+        batch_size: int = STREAM_BATCH_SIZE,
+        flush_interval: float = STREAM_FLUSH_INTERVAL_SECONDS,
     ) -> None:
-        self._collector = collector
-        self._on_record = on_record
-        self._endpoint = endpoint or self.DEFAULT_ENDPOINT
-        self._wanted_dids = wanted_dids or []
-        self._cursor: str | None = None
+        self._subscriptions = subscriptions
+        for sub in subscriptions:
+            sub.collector._reset_batch_state()
+        self._cursor_store = cursor_store
+        self._endpoints = endpoints or list(JETSTREAM_ENDPOINTS)
+        self._queue_size = queue_size
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+
+        all_terms = {t for sub in subscriptions for grp in sub.term_groups for t in grp}
+        self._matcher = (
+            get_term_matcher(sorted(all_terms), word_boundary=True) if all_terms else None
+        )
+        self._all_dids: set[str] = set().union(*(sub.actor_dids for sub in subscriptions))
+        self._all_languages: set[str] = {
+            lang for sub in subscriptions if sub.term_groups for lang in sub.languages
+        }
+
+        # ``_cursor``: time_us of the last frame read whose matches are queued.
+        # ``_emitted_us``: time_us of the last match handed to a collector.
+        self._cursor: int | None = None
+        self._emitted_us: int | None = None
+        self._saved_cursor: int | None = None
+        self._stop = asyncio.Event()
+
+    @property
+    def cursor(self) -> int | None:
+        """The ``time_us`` of the last event read from Jetstream."""
+        return self._cursor
 
-    async def run(self) -> None:
-        """Connect to Jetstream and stream posts indefinitely.
+    def stop(self) -> None:
+        """Ask :meth:`run` to persist what it has buffered and return."""
+        self._stop.set()
 
-        Applies exponential backoff on disconnect (1s → 2s → 4s → ... → 60s).
+    async def run(self, max_seconds: float | None = None) -> None:
+        """Stream until :meth:`stop` is called or *max_seconds* have passed.
+
+        On return every matched post has been offered to its sink and the
+        cursor saved when the final flush succeeded.
 
         Raises:
             ImportError: If the ``websockets`` package is not installed.
         """
         try:
-            import websockets
+            import websockets  # noqa: F401
         except ImportError as exc:
             raise ImportError(
                 "The 'websockets' package is required for BlueskyStreamer. "
                 "Install it with: pip install websockets"
             ) from exc
 
-        import asyncio
-        import json
+        if self._cursor_store is not None and self._cursor is None:
+            self._cursor = await self._cursor_store.load()
+            self._saved_cursor = self._cursor
 
-        backoff = 1.0
-        logger.info("bluesky: BlueskyStreamer starting on %s", self._endpoint)
+        queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=self._queue_size)
+        reader = asyncio.create_task(self._read(queue))
+        writer = asyncio.create_task(self._write(queue))
+        stopper = asyncio.create_task(self._stop.wait())
+        try:
+            done, _ = await asyncio.wait(
+                {reader, writer, stopper},
+                timeout=max_seconds,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            for task in done - {stopper}:
+                task.result()  # surface reader/writer failures
+        finally:
+            stopper.cancel()
+            reader.cancel()
+            await asyncio.gather(reader, stopper, return_exceptions=True)
+            if not writer.done():
+                await queue.put(_STOP)
+                await writer
 
-        while True:
-            url = self._endpoint
-            params_parts = ["wantedCollections=app.bsky.feed.post"]
-            if self._wanted_dids:
-                params_parts.append(
-                    "&".join(f"wantedDids={d}" for d in self._wanted_dids)
-                )
-            if self._cursor:
-                params_parts.append(f"cursor={self._cursor}")
-            if params_parts:
-                url = f"{url}?{'&'.join(params_parts)}"
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
 
+    def _subscribe_url(self, endpoint: str) -> str:
+        params = [f"wantedCollections={JETSTREAM_POST_COLLECTION}"]
+        if (
+            self._matcher is None
+            and self._all_dids
+            and len(self._all_dids) <= JETSTREAM_MAX_WANTED_DIDS
+        ):
+            params.extend(f"wantedDids={did}" for did in sorted(self._all_dids))
+        if self._cursor:
+            params.append(f"cursor={self._cursor}")
+        return f"{endpoint}?{'&'.join(params)}"
+
+    async def _read(self, queue: asyncio.Queue[Any]) -> None:
+        """Read frames, reconnecting from the cursor, until cancelled."""
+        import websockets
+
+        backoff = 1.0
+        attempt = 0
+        while True:
+            endpoint = self._endpoints[attempt % len(self._endpoints)]
             try:
-                async with websockets.connect(url) as ws:
+                async with websockets.connect(self._subscribe_url(endpoint)) as ws:
+                    logger.info(
+                        "bluesky: Jetstream connected to %s (cursor=%s)", endpoint, self._cursor
+                    )
                     backoff = 1.0
-                    logger.info("bluesky: BlueskyStreamer connected.")
                     async for message in ws:
-                        try:
-                            event = json.loads(message)
-                        except Exception:
-                            continue
-
-                        self._cursor = str(event.get("time_us", ""))
-
-                        commit = event.get("commit") or {}
-                        record_data = commit.get("record") or {}
-                        if event.get("kind") != "commit":
-                            continue
-                        if commit.get("collection") != "app.bsky.feed.post":
-                            continue
-
-                        # Filter by language client-side.
-                        langs = record_data.get("langs") or []
-                        if langs and "da" not in langs:
-                            continue
-
-                        # Build a minimal post view for normalization.
-                        post_view: dict[str, Any] = {
-                            "uri": f"at://{event.get('did', '')}/app.bsky.feed.post/{commit.get('rkey', '')}",
-                            "author": {"did": event.get("did", ""), "handle": "", "displayName": ""},
-                            "record": record_data,
-                            "likeCount": 0,
-                            "repostCount": 0,
-                            "replyCount": 0,
-                        }
-                        normalized = self._collector.normalize(post_view)
-                        await self._on_record(normalized)
-
-            except Exception as exc:
+                        await self._handle_frame(message, queue)
+                logger.warning(
+                    "bluesky: Jetstream closed the connection. Reconnecting in %.0fs.", backoff
+                )
+            except (OSError, websockets.WebSocketException, TimeoutError) as exc:
+                attempt += 1
                 logger.warning(
-                    "bluesky: BlueskyStreamer disconnected (%s). Reconnecting in %.0fs.",
+                    "bluesky: Jetstream disconnected (%s). Reconnecting in %.0fs.",
                     exc,
                     backoff,
                 )
-                await asyncio.sleep(backoff)
-                backoff = min(backoff * 2, 60.0)
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, STREAM_MAX_BACKOFF_SECONDS)
+
+    async def _handle_frame(self, message: str | bytes, queue: asyncio.Queue[Any]) -> None:
+        """Queue the matches of one Jetstream event and advance the cursor."""
+        try:
+            event = json.loads(message)
+            time_us = int(event["time_us"])
+        except (ValueError, TypeError, KeyError):
+            return
+
+        commit = event.get("commit") or {}
+        if (
+            event.get("kind") == "commit"
+            and commit.get("operation") == "create"
+            and commit.get("collection") == JETSTREAM_POST_COLLECTION
+        ):
+            for sub, matched in self._match(event.get("did", ""), commit.get("record") or {}):
+                try:
+                    record = sub.collector.normalize(_jetstream_post_view(event))
+                except (KeyError, TypeError, ValueError) as exc:
+                    logger.warning("bluesky: skipping malformed Jetstream post: %s", exc)
+                    break
+                record["search_terms_matched"] = matched
+                await queue.put((time_us, sub, record))
+        self._cursor = time_us
+
+    def _match(
+        self, did: str, record: dict[str, Any]
+    ) -> list[tuple[StreamSubscription, list[str]]]:
+        """Return the subscriptions a post matches, with the terms it matched."""
+        is_actor = did in self._all_dids
+        post_langs = {
+            str(lang).split("-")[0].lower() for lang in record.get("langs") or []
+        }
+        lang_ok = not post_langs or not post_langs.isdisjoint(self._all_languages)
+        if not is_actor and (self._matcher is None or not lang_ok):
+            return []
+
+        found: set[str] = set()
+        if self._matcher is not None:
+            found = set(self._matcher.match((record.get("text") or "").lower()))
+        if not found and not is_actor:
+            return []
+
+        matches: list[tuple[StreamSubscription, list[str]]] = []
+        for sub in self._subscriptions:
+            matched = [
+                t for grp in sub.term_groups if all(t in found for t in grp) for t in grp
+            ]
+            if did in sub.actor_dids:
+                matches.append((sub, matched))
+            elif matched and (not post_langs or not post_langs.isdisjoint(sub.languages)):
+                matches.append((sub, matched))
+        return matches
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    async def _write(self, queue: asyncio.Queue[Any]) -> None:
+        """Hand queued matches to the sinks and checkpoint the cursor."""
+        loop = asyncio.get_running_loop()
+        last_flush = loop.time()
+        pending = 0
+        stopping = False
+        while not stopping:
+            items: list[tuple[int, StreamSubscription, dict[str, Any]]] = []
+            timeout = max(0.0, self._flush_interval - (loop.time() - last_flush))
+            try:
+                item = await asyncio.wait_for(queue.get(), timeout=timeout)
+            except TimeoutError:
+                item = None
+            while item is not None:
+                if item is _STOP:
+                    stopping = True
+                    break
+                items.append(item)
+                if len(items) >= self._batch_size or queue.empty():
+                    break
+                item = queue.get_nowait()
+
+            if items:
+                await self._emit(items)
+                pending += len(items)
+
+            if stopping or pending >= self._batch_size or (
+                loop.time() - last_flush >= self._flush_interval
+            ):
+                if await self._checkpoint(queue):
+                    pending = 0
+                elif not stopping:
+                    # The sink is failing: stop draining so the queue fills
+                    # and the reader pauses until a flush succeeds again.
+                    await asyncio.sleep(self._flush_interval)
+                last_flush = loop.time()
+
+    async def _emit(self, items: list[tuple[int, StreamSubscription, dict[str, Any]]]) -> None:
+        """Buffer *items* in their subscriptions' collectors."""
+        by_sub: dict[int, tuple[StreamSubscription, list[dict[str, Any]]]] = {}
+        for _, sub, record in items:
+            by_sub.setdefault(id(sub), (sub, []))[1].append(record)
+        for sub, records in by_sub.values():
+            # _emit_many auto-flushes full batches through the synchronous sink.
+            await asyncio.to_thread(sub.collector._emit_many, records)
+        self._emitted_us = items[-1][0]
+
+    async def _checkpoint(self, queue: asyncio.Queue[Any]) -> bool:
+        """Flush every collector and, if all flushes succeeded, save the cursor.
+
+        Returns:
+            ``True`` when nothing is left in any collector's buffer.
+        """
+        # Everything up to ``_cursor`` is in the collectors once the queue is
+        # empty; otherwise only events up to the last emitted match are.
+        cursor = self._cursor if queue.empty() else self._emitted_us
+        flushed = True
+        for sub in self._subscriptions:
+            await asyncio.to_thread(sub.collector._flush)
+            if sub.collector._batch_buffer:
+                flushed = False
+        if (
+            flushed
+            and cursor is not None
+            and cursor != self._saved_cursor
+            and self._cursor_store is not None
+        ):
+            await self._cursor_store.save(cursor)
+            self._saved_cursor = cursor
+        return flushed
+
+
+def _jetstream_post_view(event: dict[str, Any]) -> dict[str, Any]:
+    """Build the minimal post view :meth:`BlueskyCollector.normalize` expects.
+
+    Jetstream events carry the author DID but no handle; the DID is a valid
+    profile path segment, so the web URL is built from it.  Engagement counts
+    are unknown at creation time and start at zero.
+    """
+    did = event.get("did", "")
+    commit = event.get("commit") or {}
+    return {
+        "uri": f"at://{did}/{JETSTREAM_POST_COLLECTION}/{commit.get('rkey', '')}",
+        "author": {"did": did},
+        "record": commit.get("record") or {},
+        "likeCount": 0,
+        "repostCount": 0,
+        "replyCount": 0,
+    }
 
 
 # ---------------------------------------------------------------------------
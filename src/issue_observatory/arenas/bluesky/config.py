@@ -48,6 +48,11 @@ BSKY_PUBLIC_API_BASE: str = "https://public.api.bsky.app/xrpc"
 BSKY_GET_POST_THREAD_ENDPOINT: str = f"{BSKY_PUBLIC_API_BASE}/app.bsky.feed.getPostThread"
 """Thread retrieval endpoint; does not require authentication."""
 
+BSKY_RESOLVE_HANDLE_ENDPOINT: str = (
+    f"{BSKY_PUBLIC_API_BASE}/com.atproto.identity.resolveHandle"
+)
+"""Handle-to-DID resolution endpoint; does not require authentication."""
+
 BSKY_WEB_BASE: str = "https://bsky.app"
 """Web URL base for constructing post URLs from AT URIs."""
 
@@ -63,6 +68,35 @@ JETSTREAM_ENDPOINTS: list[str] = [
 ]
 """Jetstream WebSocket endpoints (regional; use first available)."""
 
+JETSTREAM_POST_COLLECTION: str = "app.bsky.feed.post"
+"""Record collection subscribed to with ``wantedCollections``."""
+
+JETSTREAM_MAX_WANTED_DIDS: int = 10_000
+"""Jetstream cap on ``wantedDids``; larger actor sets are filtered locally."""
+
+STREAM_QUEUE_SIZE: int = 2_000
+"""Matched posts buffered between the WebSocket reader and the batch sink.
+
+When the sink falls behind, the reader blocks on the full queue and stops
+reading frames, so the backlog stays in Jetstream instead of in memory.
+"""
+
+STREAM_BATCH_SIZE: int = 200
+"""Matched posts persisted per sink call by the live stream."""
+
+STREAM_FLUSH_INTERVAL_SECONDS: float = 5.0
+"""Maximum delay before buffered posts are persisted and the cursor saved."""
+
+STREAM_MAX_BACKOFF_SECONDS: float = 60.0
+"""Upper bound of the exponential reconnect backoff."""
+
+STREAM_RUN_SECONDS: int = 86_400
+"""Lifetime of one ``stream_live`` task.
+
+The daily live-tracking trigger starts a fresh stream with the current term
+and actor lists; the stored cursor bridges the hand-over.
+"""
+
 # ---------------------------------------------------------------------------
 # Danish defaults
 # ---------------------------------------------------------------------------
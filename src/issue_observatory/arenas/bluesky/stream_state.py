@@ -0,0 +1,73 @@
+"""Persistent Jetstream cursor for the Bluesky live stream.
+
+Jetstream events carry ``time_us``, a Unix microsecond timestamp, and the
+``cursor`` query parameter replays the stream from such a timestamp.
+:class:`StreamCursorStore` keeps the cursor of the last event whose matches
+have been persisted, so a reconnect — or the next day's ``stream_live``
+task — resumes without gaps.  The key is scoped like the other streaming
+cursors::
+
+    streaming:cursor:bluesky:{scope}
+
+The stored cursor only advances after the batch sink has accepted every
+matched post up to it; resuming from it may replay a few already persisted
+posts, which the sink skips as duplicates.
+
+Redis failures never fail the stream: without a cursor it starts from the
+live tip of the firehose.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from issue_observatory.arenas._redis_state import RedisStateStore
+
+logger = logging.getLogger(__name__)
+
+_CURSOR_PREFIX = "streaming:cursor:bluesky"
+
+CURSOR_TTL_SECONDS: int = 7 * 86_400
+"""Expiry of the stored cursor; Jetstream cannot replay further back anyway."""
+
+
+class StreamCursorStore(RedisStateStore):
+    """Redis-backed Jetstream cursor shared across stream tasks.
+
+    Args:
+        redis_url: Redis connection URL (``settings.redis_url``).
+        scope: Cursor scope; ``"live"`` for the live-tracking stream.
+        ttl_seconds: Expiry of the stored cursor.
+    """
+
+    log_prefix = "bluesky"
+
+    def __init__(
+        self,
+        redis_url: str,
+        scope: str = "live",
+        ttl_seconds: int = CURSOR_TTL_SECONDS,
+    ) -> None:
+        super().__init__(redis_url, scope, ttl_seconds)
+        self._key = f"{_CURSOR_PREFIX}:{scope}"
+
+    async def load(self) -> int | None:
+        """Return the stored cursor, or ``None`` when there is none."""
+        try:
+            redis = await self._get_redis()
+            raw = await redis.get(self._key)
+        except Exception as exc:
+            logger.warning("bluesky: could not load stream cursor: %s", exc)
+            return None
+        try:
+            return int(raw) if raw else None
+        except ValueError:
+            return None
+
+    async def save(self, time_us: int) -> None:
+        """Persist *time_us* as the resume cursor."""
+        try:
+            redis = await self._get_redis()
+            await redis.set(self._key, str(time_us), ex=self._ttl)
+        except Exception as exc:
+            logger.warning("bluesky: could not save stream cursor: %s", exc)
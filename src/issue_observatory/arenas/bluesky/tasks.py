@@ -15,6 +15,11 @@ Retry policy:
 Bluesky is free-only, so ``NoCredentialAvailableError`` should never occur
 in normal operation.  It is handled gracefully for interface consistency.
 
+Live tracking:
+- ``stream_live`` consumes the Jetstream firehose for all live-tracking
+  designs at once instead of polling ``searchPosts`` per term (enabled with
+  ``Settings.live_streaming_enabled``).  It runs on the ``streaming`` queue.
+
 Database updates:
 - Best-effort via ``_update_task_status()`` — DB failures are logged at WARNING
   and do not mask the collection outcome.
@@ -22,12 +27,22 @@ Database updates:
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import time
 from typing import Any
 
-from issue_observatory.arenas.bluesky.collector import BlueskyCollector
+from issue_observatory.arenas._redis_state import collect_then_close
+from issue_observatory.arenas.bluesky.collector import (
+    BlueskyCollector,
+    BlueskyStreamer,
+    StreamSubscription,
+)
+from issue_observatory.arenas.bluesky.config import (
+    DANISH_LANG,
+    STREAM_BATCH_SIZE,
+    STREAM_RUN_SECONDS,
+)
+from issue_observatory.arenas.bluesky.stream_state import StreamCursorStore
 from issue_observatory.config.settings import get_settings
 from issue_observatory.core.credential_pool import CredentialPool
 from issue_observatory.core.event_bus import elapsed_since, publish_task_update
@@ -37,6 +52,7 @@ from issue_observatory.core.exceptions import (
     NoCredentialAvailableError,
 )
 from issue_observatory.workers.celery_app import celery_app
+from issue_observatory.workers.runtime import run_async
 
 logger = logging.getLogger(__name__)
 
@@ -219,6 +235,7 @@ def bluesky_collect_terms(
             date_from=_dt.fromisoformat(date_from) if isinstance(date_from, str) else date_from,
             date_to=_dt.fromisoformat(date_to) if isinstance(date_to, str) else date_to,
             terms=terms,
+            planned_gaps=_extra.get("coverage_gaps"),
         )
         if not gaps:
             logger.info(
@@ -271,7 +288,7 @@ def bluesky_collect_terms(
         )
 
     try:
-        remaining = asyncio.run(
+        remaining = run_async(
             collector.collect_by_terms(
                 terms=terms,
                 tier=Tier.FREE,
@@ -489,6 +506,7 @@ def bluesky_collect_actors(
             date_from=_dt.fromisoformat(date_from) if isinstance(date_from, str) else date_from,
             date_to=_dt.fromisoformat(date_to) if isinstance(date_to, str) else date_to,
             actor_ids=actor_ids,
+            planned_gaps=_extra.get("coverage_gaps"),
         )
         if not gaps:
             logger.info(
@@ -541,7 +559,7 @@ def bluesky_collect_actors(
         )
 
     try:
-        remaining = asyncio.run(
+        remaining = run_async(
             collector.collect_by_actors(
                 actor_ids=actor_ids,
                 tier=Tier.FREE,
@@ -677,7 +695,7 @@ def bluesky_health_check() -> dict[str, Any]:
     """
     credential_pool = CredentialPool()
     collector = BlueskyCollector(credential_pool=credential_pool)
-    result: dict[str, Any] = asyncio.run(collector.health_check())
+    result: dict[str, Any] = run_async(collector.health_check())
     logger.info("bluesky: health_check status=%s", result.get("status", "unknown"))
     return result
 
@@ -764,7 +782,7 @@ def bluesky_collect_comments(
     )
 
     try:
-        records = asyncio.run(
+        records = run_async(
             collector.collect_comments(
                 post_ids=post_ids,
                 tier=Tier.FREE,
@@ -849,3 +867,148 @@ def bluesky_collect_comments(
         "platform": "bluesky",
         "tier": tier,
     }
+
+
+@celery_app.task(
+    name="issue_observatory.arenas.bluesky.tasks.stream_live",
+    bind=True,
+    # A redelivered stream would duplicate the connection; the stored cursor
+    # already makes a lost stream resumable by the next daily trigger.
+    acks_late=False,
+    time_limit=STREAM_RUN_SECONDS + 1_800,
+)
+def bluesky_stream_live(
+    self: Any,
+    subscriptions: list[dict[str, Any]],
+    duration_seconds: int = STREAM_RUN_SECONDS,
+    **_extra: Any,
+) -> dict[str, Any]:
+    """Stream live Bluesky posts for every live-tracking query design.
+
+    Replaces the daily ``collect_by_terms`` search polling for designs with
+    Bluesky enabled: one Jetstream connection is matched against the terms
+    and actors of all designs (see :class:`BlueskyStreamer`), and each
+    design's matches are persisted into its own collection run through the
+    batch sink.  The cursor is kept in Redis, so the next day's task resumes
+    where this one stopped.  Routed to the ``streaming`` queue.
+
+    Args:
+        subscriptions: One dict per query design with ``query_design_id``,
+            ``collection_run_id``, ``terms``, and optionally ``actor_ids``
+            (handles or DIDs) and ``language_filter``.
+        duration_seconds: How long to stream before returning.
+
+    Returns:
+        Dict with ``records_collected`` per collection run, ``status``,
+        ``arena``, and ``tier``.
+    """
+    from issue_observatory.workers._task_helpers import (
+        make_batch_sink,
+        persist_collected_records,
+    )
+
+    _settings = get_settings()
+    _redis_url = _settings.redis_url
+    _task_start = time.monotonic()
+
+    streamed: list[tuple[str, str, StreamSubscription]] = []
+    for spec in subscriptions:
+        collection_run_id = str(spec["collection_run_id"])
+        query_design_id = str(spec["query_design_id"])
+        terms: list[str] = spec.get("terms") or []
+
+        collector = BlueskyCollector()
+        sink = make_batch_sink(collection_run_id, query_design_id, terms=terms)
+        collector.configure_batch_persistence(
+            sink=sink, batch_size=STREAM_BATCH_SIZE, collection_run_id=collection_run_id
+        )
+        actor_dids = run_async(collector.resolve_dids(spec.get("actor_ids") or []))
+        streamed.append((
+            collection_run_id,
+            query_design_id,
+            StreamSubscription(
+                collector=collector,
+                term_groups=[[t] for t in terms if t],
+                actor_dids=set(actor_dids),
+                languages=spec.get("language_filter") or [DANISH_LANG],
+            ),
+        ))
+        _update_task_status(collection_run_id, "bluesky", "running")
+        publish_task_update(
+            redis_url=_redis_url,
+            run_id=collection_run_id,
+            arena="bluesky",
+            platform="bluesky",
+            status="running",
+            records_collected=0,
+            error_message=None,
+            elapsed_seconds=elapsed_since(_task_start),
+        )
+
+    logger.info(
+        "bluesky: stream_live started — designs=%d duration=%ds",
+        len(streamed),
+        duration_seconds,
+    )
+    cursor_store = StreamCursorStore(_redis_url)
+    streamer = BlueskyStreamer(
+        subscriptions=[sub for _, _, sub in streamed], cursor_store=cursor_store
+    )
+    try:
+        run_async(
+            collect_then_close(streamer.run(max_seconds=duration_seconds), cursor_store)
+        )
+    except Exception as exc:
+        msg = f"bluesky: live stream failed: {exc}"
+        logger.error(msg)
+        for collection_run_id, _, _ in streamed:
+            _update_task_status(collection_run_id, "bluesky", "failed", error_message=msg)
+            publish_task_update(
+                redis_url=_redis_url,
+                run_id=collection_run_id,
+                arena="bluesky",
+                platform="bluesky",
+                status="failed",
+                records_collected=0,
+                error_message=msg,
+                elapsed_seconds=elapsed_since(_task_start),
+            )
+        raise ArenaCollectionError(msg, arena="bluesky", platform="bluesky") from exc
+
+    records_collected: dict[str, int] = {}
+    for collection_run_id, query_design_id, sub in streamed:
+        collector = sub.collector
+        # Fallback: persist any records whose final flush failed.
+        fallback_inserted = 0
+        if collector._batch_buffer:
+            fallback_inserted, _ = persist_collected_records(
+                collector._batch_buffer, collection_run_id, query_design_id
+            )
+        inserted = collector.batch_stats["inserted"] + fallback_inserted
+        records_collected[collection_run_id] = inserted
+        _update_task_status(
+            collection_run_id, "bluesky", "completed", records_collected=inserted
+        )
+        publish_task_update(
+            redis_url=_redis_url,
+            run_id=collection_run_id,
+            arena="bluesky",
+            platform="bluesky",
+            status="completed",
+            records_collected=inserted,
+            error_message=None,
+            elapsed_seconds=elapsed_since(_task_start),
+        )
+
+    logger.info(
+        "bluesky: stream_live completed — designs=%d inserted=%d cursor=%s",
+        len(streamed),
+        sum(records_collected.values()),
+        streamer.cursor,
+    )
+    return {
+        "records_collected": records_collected,
+        "status": "completed",
+        "arena": "bluesky",
+        "tier": "free",
+    }
@@ -4,9 +4,10 @@ Internal module — not part of the public API. Used exclusively by
 :mod:`~issue_observatory.arenas.discord.collector`.
 
 Contains:
-- Date parsing utilities
+- Date parsing utilities and snowflake / timestamp conversion
 - Message enrichment helper
-- Discord API pagination logic (``fetch_channel_messages``)
+- Discord API pagination logic (``fetch_channel_messages`` backwards from the
+  newest message, ``iter_channel_pages_after`` forwards from a cursor)
 - Raw HTTP request dispatch with rate-limit header handling
 """
 
@@ -15,8 +16,9 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import httpx
 
@@ -26,11 +28,17 @@ from issue_observatory.core.exceptions import (
     ArenaRateLimitError,
 )
 
+if TYPE_CHECKING:
+    from issue_observatory.arenas.discord.sync_state import ChannelSyncStore
+
 logger = logging.getLogger(__name__)
 
 # Minimum inter-request delay: 1 / 5 req/s
 _MIN_DELAY_SECONDS: float = 0.2
 
+# First millisecond of 2015 (UTC), the epoch of Discord snowflake timestamps.
+_DISCORD_EPOCH_MS: int = 1_420_070_400_000
+
 
 # ---------------------------------------------------------------------------
 # Date parsing utilities
@@ -85,6 +93,22 @@ def parse_iso_timestamp(value: str | None) -> datetime | None:
         return None
 
 
+def snowflake_from_datetime(value: datetime) -> str:
+    """Return the smallest snowflake ID that Discord could assign at *value*.
+
+    Used as an ``after`` cursor: ``after=snowflake_from_datetime(dt)`` returns
+    messages created at or after *dt*.
+
+    Args:
+        value: Timezone-aware datetime.
+
+    Returns:
+        Snowflake ID as a decimal string (``"0"`` before the Discord epoch).
+    """
+    millis = int(value.timestamp() * 1000) - _DISCORD_EPOCH_MS
+    return str(max(millis, 0) << 22)
+
+
 # ---------------------------------------------------------------------------
 # Message enrichment
 # ---------------------------------------------------------------------------
@@ -294,3 +318,79 @@ async def fetch_channel_messages(
         channel_id,
     )
     return messages
+
+
+async def iter_channel_pages_after(
+    client: httpx.AsyncClient,
+    channel_id: str,
+    arena_name: str,
+    platform_name: str,
+    after: str,
+    sync_store: ChannelSyncStore | None = None,
+) -> AsyncIterator[list[dict[str, Any]]]:
+    """Page forward through a channel's messages newer than *after*.
+
+    Each request asks for ``MESSAGES_PER_REQUEST`` messages ``after`` the
+    newest ID of the previous page; pages are yielded oldest first and
+    paging ends at the channel's newest message.  The caller stops early by
+    leaving the loop.
+
+    With a *sync_store* each page is first looked up in the collection run's
+    page cache and fetched pages are cached for the run's other tasks.
+
+    Args:
+        client: Authenticated HTTP client.
+        channel_id: Discord channel snowflake ID.
+        arena_name: Arena name for error context.
+        platform_name: Platform name for error context.
+        after: Snowflake cursor; only newer messages are returned.
+        sync_store: Optional store holding the run page cache.
+
+    Yields:
+        Lists of raw message dicts in ascending ID order.
+    """
+    cursor = after
+    pages = cached = 0
+
+    while True:
+        batch = await sync_store.get_page(channel_id, cursor) if sync_store else None
+        if batch is not None:
+            cached += 1
+        else:
+            try:
+                batch = await make_request(
+                    client,
+                    f"/channels/{channel_id}/messages",
+                    arena_name=arena_name,
+                    platform_name=platform_name,
+                    params={"limit": MESSAGES_PER_REQUEST, "after": cursor},
+                )
+            except ArenaRateLimitError:
+                raise
+            except ArenaCollectionError as exc:
+                logger.warning(
+                    "discord: error fetching messages from channel %s: %s",
+                    channel_id,
+                    exc,
+                )
+                break
+            if sync_store is not None and batch:
+                await sync_store.put_page(channel_id, cursor, batch)
+
+        if not batch:
+            break
+        pages += 1
+        batch = sorted(batch, key=lambda m: int(m["id"]))
+        yield batch
+
+        if len(batch) < MESSAGES_PER_REQUEST:
+            break
+        cursor = batch[-1]["id"]
+
+    logger.debug(
+        "discord: paged %d page(s) after %s in channel %s (%d from run cache)",
+        pages,
+        after,
+        channel_id,
+        cached,
+    )
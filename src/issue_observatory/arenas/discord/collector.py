@@ -9,6 +9,13 @@ REST API (v10). Supports two collection modes:
 - **collect_by_actors()**: Fetches all messages from monitored channels and
   filters by ``author.id`` matching provided Discord user snowflake IDs.
 
+With a :class:`~.sync_state.ChannelSyncStore` both modes read channels
+incrementally: the snowflake ID of the newest evaluated message is stored per
+channel and the next run pages forward from it with ``after=``.  Pages fetched
+during a collection run are shared between its term and actor tasks.
+Without stored state, channels are read forward from ``date_from`` or, when no
+``date_from`` is given, backwards from the newest message.
+
 A bot token credential is required for all collection. The token is retrieved
 from the CredentialPool with ``platform="discord", tier="free"``. The
 credential JSON must contain ``{"bot_token": "..."}``.
@@ -25,6 +32,8 @@ All messages are normalized to the universal ``content_records`` schema by
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
+from contextlib import aclosing
 from datetime import UTC, datetime
 from typing import Any
 
@@ -34,14 +43,22 @@ from issue_observatory.arenas.base import ArenaCollector, TemporalMode, Tier
 from issue_observatory.arenas.discord._http import (
     enrich_message,
     fetch_channel_messages,
+    iter_channel_pages_after,
     make_request,
     parse_date_bound,
+    parse_iso_timestamp,
+    snowflake_from_datetime,
 )
 from issue_observatory.arenas.discord.config import (
     DEFAULT_MAX_RESULTS,
     DISCORD_API_BASE,
     DISCORD_TIERS,
 )
+from issue_observatory.arenas.discord.sync_state import (
+    ChannelCursor,
+    ChannelSyncStore,
+    query_digest,
+)
 from issue_observatory.arenas.registry import register
 from issue_observatory.config.tiers import TierConfig
 from issue_observatory.core.exceptions import (
@@ -49,6 +66,7 @@ from issue_observatory.core.exceptions import (
     NoCredentialAvailableError,
 )
 from issue_observatory.core.normalizer import Normalizer
+from issue_observatory.workers.runtime import shared_http_transport
 
 logger = logging.getLogger(__name__)
 
@@ -83,6 +101,8 @@ class DiscordCollector(ArenaCollector):
             based adaptive limiting is used instead via :mod:`._http`).
         http_client: Optional injected :class:`httpx.AsyncClient`. Inject for
             testing. If ``None``, a new client is created per collection call.
+        sync_store: Optional store for persisted channel cursors and the
+            collection run's shared page cache.
     """
 
     arena_name: str = "social_media"
@@ -91,15 +111,18 @@ class DiscordCollector(ArenaCollector):
     temporal_mode: TemporalMode = TemporalMode.RECENT
     source_list_config_key: str | None = "custom_channel_ids"
     supports_actor_collection: bool = True
+    supports_coverage_check: bool = True
 
     def __init__(
         self,
         credential_pool: Any = None,
         rate_limiter: Any = None,
         http_client: httpx.AsyncClient | None = None,
+        sync_store: ChannelSyncStore | None = None,
     ) -> None:
         super().__init__(credential_pool=credential_pool, rate_limiter=rate_limiter)
         self._http_client = http_client
+        self._sync_store = sync_store
         self._normalizer = Normalizer()
 
     # ------------------------------------------------------------------
@@ -120,8 +143,9 @@ class DiscordCollector(ArenaCollector):
     ) -> list[dict[str, Any]]:
         """Collect Discord messages matching any of the supplied terms.
 
-        Fetches all messages from the provided channels and filters client-side
-        by term occurrence in message content.
+        Fetches the messages of the provided channels and filters client-side
+        by term occurrence in message content.  Channels with a stored cursor
+        covering ``date_from`` are only read past that cursor.
 
         NOTE: Discord does not support server-side keyword search for bot
         accounts. The ``/channels/{id}/messages/search`` endpoint is restricted
@@ -200,40 +224,21 @@ class DiscordCollector(ArenaCollector):
         bot_token = await self._acquire_bot_token()
         self._reset_batch_state()
 
-        async with self._build_http_client(bot_token) as client:
-            for channel_id in effective_channel_ids:
-                if self._total_emitted >= effective_max:
-                    break
-                count_before = self._total_emitted
-
-                channel_meta = await self._fetch_channel_metadata(client, channel_id)
-                messages = await fetch_channel_messages(
-                    client=client,
-                    channel_id=channel_id,
-                    arena_name=self.arena_name,
-                    platform_name=self.platform_name,
-                    date_from_dt=date_from_dt,
-                    date_to_dt=date_to_dt,
-                    max_count=effective_max - self._total_emitted,
-                )
-
-                for msg in messages:
-                    content_lower = (msg.get("content") or "").lower()
-                    matched = any(
-                        all(term in content_lower for term in grp)
-                        for grp in lower_groups
-                    )
-                    if not matched:
-                        continue
-
-                    record = self.normalize(enrich_message(msg, channel_id, channel_meta))
-                    self._emit(record)
+        def matches(msg: dict[str, Any]) -> bool:
+            content_lower = (msg.get("content") or "").lower()
+            return any(all(term in content_lower for term in grp) for grp in lower_groups)
 
-                    if self._total_emitted >= effective_max:
-                        break
-
-                self._record_input_count(channel_id, self._total_emitted - count_before)
-                self._flush()
+        async with self._build_http_client(bot_token) as client:
+            await self._collect_channels(
+                client,
+                channel_ids=effective_channel_ids,
+                query=query_digest("terms", lower_groups),
+                matches=matches,
+                date_from=date_from_dt,
+                date_to=date_to_dt,
+                max_results=effective_max,
+                record_input_counts=True,
+            )
 
         self._flush()
         logger.info(
@@ -255,8 +260,10 @@ class DiscordCollector(ArenaCollector):
     ) -> list[dict[str, Any]]:
         """Collect Discord messages authored by specific users.
 
-        Fetches all messages from the provided channels, then filters by
+        Fetches the messages of the provided channels, then filters by
         ``author.id`` matching any of the provided Discord user snowflake IDs.
+        Channels with a stored cursor covering ``date_from`` are only read
+        past that cursor.
 
         Args:
             actor_ids: Discord user snowflake IDs (as strings) to match
@@ -312,34 +319,20 @@ class DiscordCollector(ArenaCollector):
         bot_token = await self._acquire_bot_token()
         self._reset_batch_state()
 
-        async with self._build_http_client(bot_token) as client:
-            for channel_id in effective_channel_ids:
-                if self._total_emitted >= effective_max:
-                    break
+        def matches(msg: dict[str, Any]) -> bool:
+            return str(msg.get("author", {}).get("id", "")) in actor_id_set
 
-                channel_meta = await self._fetch_channel_metadata(client, channel_id)
-                messages = await fetch_channel_messages(
-                    client=client,
-                    channel_id=channel_id,
-                    arena_name=self.arena_name,
-                    platform_name=self.platform_name,
-                    date_from_dt=date_from_dt,
-                    date_to_dt=date_to_dt,
-                    max_count=effective_max - self._total_emitted,
-                )
-
-                for msg in messages:
-                    author_id = str(msg.get("author", {}).get("id", ""))
-                    if author_id not in actor_id_set:
-                        continue
-
-                    record = self.normalize(enrich_message(msg, channel_id, channel_meta))
-                    self._emit(record)
-
-                    if self._total_emitted >= effective_max:
-                        break
-
-                self._flush()
+        async with self._build_http_client(bot_token) as client:
+            await self._collect_channels(
+                client,
+                channel_ids=effective_channel_ids,
+                query=query_digest("actors", sorted(actor_id_set)),
+                matches=matches,
+                date_from=date_from_dt,
+                date_to=date_to_dt,
+                max_results=effective_max,
+                record_input_counts=False,
+            )
 
         self._flush()
         logger.info(
@@ -563,7 +556,177 @@ class DiscordCollector(ArenaCollector):
                 "User-Agent": "IssueObservatory/1.0 (discord-collector; research bot)",
             },
             timeout=30.0,
+            transport=shared_http_transport(),
+        )
+
+    async def _collect_channels(
+        self,
+        client: httpx.AsyncClient,
+        channel_ids: list[str],
+        query: str,
+        matches: Callable[[dict[str, Any]], bool],
+        date_from: datetime | None,
+        date_to: datetime | None,
+        max_results: int,
+        record_input_counts: bool,
+    ) -> None:
+        """Read each channel and emit the messages accepted by *matches*.
+
+        Records are flushed after each channel, and only then is the
+        channel's new cursor persisted.
+
+        Args:
+            client: Authenticated HTTP client.
+            channel_ids: Channel snowflake IDs to read.
+            query: Digest of the collection mode and inputs (cursor scope).
+            matches: Predicate selecting the raw messages to emit.
+            date_from: Optional lower date bound.
+            date_to: Optional upper date bound.
+            max_results: Upper bound on emitted records.
+            record_input_counts: Record per-channel counts for coverage
+                tracking.
+        """
+        cursors: dict[str, ChannelCursor] = {}
+        if self._sync_store is not None:
+            cursors = await self._sync_store.load_cursors(query, channel_ids)
+
+        for channel_id in channel_ids:
+            if self._total_emitted >= max_results:
+                break
+            count_before = self._total_emitted
+
+            channel_meta = await self._fetch_channel_metadata(client, channel_id)
+            stored = cursors.get(channel_id)
+            if stored is not None and stored.covers(date_from):
+                start, synced_from = stored.after, stored.synced_from
+                if date_from is not None:
+                    floor = snowflake_from_datetime(date_from)
+                    if int(floor) > int(start):
+                        start, synced_from = floor, date_from.isoformat()
+                cursor = await self._read_channel_forward(
+                    client, channel_id, channel_meta, matches, start, date_to, max_results
+                )
+                new_cursor: ChannelCursor | None = ChannelCursor(cursor, synced_from)
+            elif date_from is not None:
+                start = snowflake_from_datetime(date_from)
+                cursor = await self._read_channel_forward(
+                    client, channel_id, channel_meta, matches, start, date_to, max_results
+                )
+                new_cursor = ChannelCursor(cursor, date_from.isoformat())
+            else:
+                new_cursor = await self._read_channel_backward(
+                    client, channel_id, channel_meta, matches, date_to, max_results
+                )
+
+            if record_input_counts:
+                self._record_input_count(channel_id, self._total_emitted - count_before)
+            self._flush()
+
+            if new_cursor is None or self._sync_store is None:
+                continue
+            if stored is not None and int(new_cursor.after) < int(stored.after):
+                # An older window than the stored cursor was read.
+                continue
+            await self._sync_store.save_cursor(query, channel_id, new_cursor)
+
+    async def _read_channel_forward(
+        self,
+        client: httpx.AsyncClient,
+        channel_id: str,
+        channel_meta: dict[str, Any],
+        matches: Callable[[dict[str, Any]], bool],
+        start: str,
+        date_to: datetime | None,
+        max_results: int,
+    ) -> str:
+        """Page a channel forward from *start* and emit matching messages.
+
+        Joins the collection run's page stream for the channel when a
+        sibling task registered a start that is not newer than *start*;
+        messages up to *start* are then skipped.
+
+        Returns:
+            Snowflake ID of the newest message evaluated (*start* if none),
+            the channel's next cursor.  Evaluation stops at the first
+            message newer than ``date_to`` or when ``max_results`` is
+            reached; later messages are left for the next run.
+        """
+        page_start = start
+        if self._sync_store is not None:
+            registered = await self._sync_store.claim_stream_start(channel_id, start)
+            if int(registered) <= int(start):
+                page_start = registered
+
+        last_id = start
+        pages = iter_channel_pages_after(
+            client,
+            channel_id,
+            arena_name=self.arena_name,
+            platform_name=self.platform_name,
+            after=page_start,
+            sync_store=self._sync_store,
+        )
+        async with aclosing(pages):
+            async for batch in pages:
+                for msg in batch:
+                    if int(msg["id"]) <= int(start):
+                        continue
+                    msg_dt = parse_iso_timestamp(msg.get("timestamp"))
+                    if date_to and msg_dt and msg_dt > date_to:
+                        return last_id
+                    last_id = str(msg["id"])
+                    if matches(msg):
+                        self._emit(self.normalize(enrich_message(msg, channel_id, channel_meta)))
+                        if self._total_emitted >= max_results:
+                            return last_id
+        return last_id
+
+    async def _read_channel_backward(
+        self,
+        client: httpx.AsyncClient,
+        channel_id: str,
+        channel_meta: dict[str, Any],
+        matches: Callable[[dict[str, Any]], bool],
+        date_to: datetime | None,
+        max_results: int,
+    ) -> ChannelCursor | None:
+        """Read a channel backwards from its newest message and emit matches.
+
+        Used when neither a cursor nor ``date_from`` bounds the read.
+
+        Returns:
+            Cursor at the newest message read, whose ``synced_from`` is the
+            oldest message evaluated unless the channel was read to its
+            start; ``None`` for an empty channel.
+        """
+        max_count = max_results - self._total_emitted
+        messages = await fetch_channel_messages(
+            client=client,
+            channel_id=channel_id,
+            arena_name=self.arena_name,
+            platform_name=self.platform_name,
+            date_from_dt=None,
+            date_to_dt=date_to,
+            max_count=max_count,
         )
+        if not messages:
+            return None
+
+        evaluated = 0
+        for msg in messages:
+            evaluated += 1
+            if matches(msg):
+                self._emit(self.normalize(enrich_message(msg, channel_id, channel_meta)))
+                if self._total_emitted >= max_results:
+                    break
+
+        synced_from: str | None = None
+        if evaluated < len(messages) or len(messages) >= max_count:
+            oldest = parse_iso_timestamp(messages[evaluated - 1].get("timestamp"))
+            if oldest is None:
+                return None
+            synced_from = oldest.isoformat()
+        return ChannelCursor(str(messages[0]["id"]), synced_from)
 
     async def _fetch_channel_metadata(
         self,
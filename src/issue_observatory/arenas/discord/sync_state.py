@@ -0,0 +1,200 @@
+"""Persistent snowflake cursors and per-run page sharing for the Discord arena.
+
+Discord bots cannot search, so every collection reads channel history and
+filters it client-side.  :class:`ChannelSyncStore` keeps that reading
+incremental and shared, in Redis:
+
+**Cursors** — per channel, the snowflake ID of the newest message already
+evaluated (:class:`ChannelCursor`).  The next run pages forward from it with
+``GET /channels/{id}/messages?after=...`` instead of re-reading history.
+Like the RSS feed state, cursors are scoped: messages below a cursor were
+only matched against the terms (or authors) of the collection that read
+them, so keys combine the store scope (the query design ID), a digest of the
+collection mode and its inputs, and the channel ID::
+
+    discord:cursor:{scope}:{query_digest}:{channel_id}
+
+**Run pages** — the ``collect_by_terms`` and ``collect_by_actors`` tasks of
+one collection run read the same channels.  Pages fetched with ``after=`` are
+cached for the run, keyed by channel and cursor, so the second task replays
+them from Redis instead of spending the bot's rate-limit budget again.  The
+first task to page a channel registers its starting cursor; a sibling task
+whose own cursor is not older starts from the registered one, skipping the
+messages it has already evaluated, so both walk the same page keys::
+
+    discord:run_stream:{run_id}:{channel_id}
+    discord:run_page:{run_id}:{channel_id}:{after}
+
+Redis failures never fail a collection: the collector falls back to reading
+each channel from ``date_from`` (or from the newest message backwards).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any
+
+from issue_observatory.arenas._redis_state import RedisStateStore, SyncedHistory
+
+logger = logging.getLogger(__name__)
+
+_CURSOR_PREFIX = "discord:cursor"
+_STREAM_PREFIX = "discord:run_stream"
+_PAGE_PREFIX = "discord:run_page"
+
+CURSOR_TTL_SECONDS: int = 30 * 86_400
+"""Expiry of stored cursors; refreshed on every save."""
+
+RUN_PAGE_TTL_SECONDS: int = 6 * 3_600
+"""Expiry of pages shared between the tasks of one collection run."""
+
+
+def query_digest(mode: str, parts: list[str] | list[list[str]]) -> str:
+    """Return a stable digest of a collection mode and its inputs.
+
+    Args:
+        mode: ``"terms"`` or ``"actors"``.
+        parts: Term groups or actor IDs of the collection call.
+
+    Returns:
+        A short hex digest, independent of element order.
+    """
+    normalised = sorted(
+        json.dumps(sorted(p), ensure_ascii=False) if isinstance(p, list) else json.dumps(p)
+        for p in parts
+    )
+    return hashlib.sha256("\n".join([mode, *normalised]).encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass
+class ChannelCursor(SyncedHistory):
+    """Evaluated history of one channel for one scope.
+
+    Attributes:
+        after: Snowflake ID of the newest message evaluated.
+        synced_from: ISO timestamp down to which the history below ``after``
+            has been evaluated, or ``None`` for the start of the channel.
+    """
+
+    after: str
+    synced_from: str | None = None
+
+
+class ChannelSyncStore(RedisStateStore):
+    """Redis-backed cursors and run page cache shared across workers.
+
+    Args:
+        redis_url: Redis connection URL (``settings.redis_url``).
+        scope: Cursor scope, normally the query design ID.
+        run_id: Collection run whose tasks share fetched pages.  ``None``
+            disables page sharing.
+    """
+
+    log_prefix = "discord"
+
+    def __init__(self, redis_url: str, scope: str, run_id: str | None = None) -> None:
+        super().__init__(redis_url, scope, CURSOR_TTL_SECONDS)
+        self._run_id = run_id
+
+    # ------------------------------------------------------------------
+    # Cursors
+    # ------------------------------------------------------------------
+
+    def _cursor_key(self, query: str, channel_id: str) -> str:
+        return f"{_CURSOR_PREFIX}:{self._scope}:{query}:{channel_id}"
+
+    async def load_cursors(
+        self, query: str, channel_ids: list[str]
+    ) -> dict[str, ChannelCursor]:
+        """Load stored cursors for *channel_ids*.
+
+        Args:
+            query: Digest of the collection (see :func:`query_digest`).
+            channel_ids: Channels about to be read.
+
+        Returns:
+            ``{channel_id: ChannelCursor}`` for channels with a cursor; empty
+            when Redis is unavailable.
+        """
+        return await self._load_records(
+            channel_ids, lambda ch: self._cursor_key(query, ch), ChannelCursor, "channel cursors"
+        )
+
+    async def save_cursor(self, query: str, channel_id: str, cursor: ChannelCursor) -> None:
+        """Persist the cursor of one channel.
+
+        Args:
+            query: Digest of the collection.
+            channel_id: Channel snowflake ID.
+            cursor: Cursor to store.
+        """
+        await self._save_record(
+            self._cursor_key(query, channel_id), cursor, f"cursor for channel {channel_id}"
+        )
+
+    # ------------------------------------------------------------------
+    # Run page cache
+    # ------------------------------------------------------------------
+
+    async def claim_stream_start(self, channel_id: str, after: str) -> str:
+        """Register *after* as the run's starting cursor for a channel.
+
+        Args:
+            channel_id: Channel snowflake ID.
+            after: The caller's own starting cursor.
+
+        Returns:
+            The cursor registered by the first task of the run to page the
+            channel, or *after* itself when it was first (or sharing is off).
+        """
+        if self._run_id is None:
+            return after
+        key = f"{_STREAM_PREFIX}:{self._run_id}:{channel_id}"
+        try:
+            redis = await self._get_redis()
+            if await redis.set(key, after, ex=RUN_PAGE_TTL_SECONDS, nx=True):
+                return after
+            registered = await redis.get(key)
+        except Exception as exc:
+            logger.warning("discord: could not register stream start: %s", exc)
+            return after
+        return registered or after
+
+    def _page_key(self, channel_id: str, after: str) -> str:
+        return f"{_PAGE_PREFIX}:{self._run_id}:{channel_id}:{after}"
+
+    async def get_page(self, channel_id: str, after: str) -> list[dict[str, Any]] | None:
+        """Return the run's cached page of messages after *after*, if any."""
+        if self._run_id is None:
+            return None
+        try:
+            redis = await self._get_redis()
+            raw = await redis.get(self._page_key(channel_id, after))
+        except Exception as exc:
+            logger.warning("discord: could not read cached page: %s", exc)
+            return None
+        if not raw:
+            return None
+        try:
+            return json.loads(raw)
+        except ValueError:
+            return None
+
+    async def put_page(
+        self, channel_id: str, after: str, batch: list[dict[str, Any]]
+    ) -> None:
+        """Cache a fetched page for the other tasks of the run."""
+        if self._run_id is None:
+            return
+        try:
+            redis = await self._get_redis()
+            await redis.set(
+                self._page_key(channel_id, after),
+                json.dumps(batch, ensure_ascii=False),
+                ex=RUN_PAGE_TTL_SECONDS,
+            )
+        except Exception as exc:
+            logger.warning("discord: could not cache page: %s", exc)
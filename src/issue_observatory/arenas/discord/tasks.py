@@ -17,16 +17,23 @@ Retry policy:
 
 All tasks update the ``collection_tasks`` row as best-effort (DB failures are
 logged at WARNING and do not mask collection outcomes).
+
+Collection tasks share a Redis-backed
+:class:`~issue_observatory.arenas.discord.sync_state.ChannelSyncStore` scoped
+to the query design and the collection run: per-channel snowflake cursors let
+each run read only messages newer than the previous one, and pages fetched
+by the term task are replayed by the actor task of the same run.
 """
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import time
 from typing import Any
 
+from issue_observatory.arenas._redis_state import collect_then_close
 from issue_observatory.arenas.discord.collector import DiscordCollector
+from issue_observatory.arenas.discord.sync_state import ChannelSyncStore
 from issue_observatory.config.settings import get_settings
 from issue_observatory.core.credential_pool import CredentialPool
 from issue_observatory.core.event_bus import elapsed_since, publish_task_update
@@ -35,6 +42,7 @@ from issue_observatory.core.exceptions import (
     ArenaRateLimitError,
 )
 from issue_observatory.workers.celery_app import celery_app
+from issue_observatory.workers.runtime import run_async
 
 logger = logging.getLogger(__name__)
 
@@ -246,7 +254,8 @@ def discord_collect_terms(
     from issue_observatory.workers._task_helpers import make_batch_sink
 
     credential_pool = CredentialPool()
-    collector = DiscordCollector(credential_pool=credential_pool)
+    sync_store = ChannelSyncStore(_redis_url, scope=query_design_id, run_id=collection_run_id)
+    collector = DiscordCollector(credential_pool=credential_pool, sync_store=sync_store)
     sink = make_batch_sink(collection_run_id, query_design_id)
     collector.configure_batch_persistence(sink=sink, batch_size=100, collection_run_id=collection_run_id)
 
@@ -268,6 +277,7 @@ def discord_collect_terms(
             date_from=_dt.fromisoformat(date_from) if isinstance(date_from, str) else date_from,
             date_to=_dt.fromisoformat(date_to) if isinstance(date_to, str) else date_to,
             terms=terms,
+            planned_gaps=_extra.get("coverage_gaps"),
         )
         if not gaps:
             logger.info(
@@ -318,15 +328,18 @@ def discord_collect_terms(
         )
 
     try:
-        remaining = asyncio.run(
-            collector.collect_by_terms(
-                terms=terms,
-                tier=tier_enum,
-                date_from=effective_date_from,
-                date_to=effective_date_to,
-                max_results=max_results,
-                channel_ids=channel_ids,
-                extra_channel_ids=extra_channel_ids,
+        remaining = run_async(
+            collect_then_close(
+                collector.collect_by_terms(
+                    terms=terms,
+                    tier=tier_enum,
+                    date_from=effective_date_from,
+                    date_to=effective_date_to,
+                    max_results=max_results,
+                    channel_ids=channel_ids,
+                    extra_channel_ids=extra_channel_ids,
+                ),
+                sync_store,
             )
         )
     except ArenaRateLimitError:
@@ -506,7 +519,8 @@ def discord_collect_actors(
     from issue_observatory.workers._task_helpers import make_batch_sink
 
     credential_pool = CredentialPool()
-    collector = DiscordCollector(credential_pool=credential_pool)
+    sync_store = ChannelSyncStore(_redis_url, scope=query_design_id, run_id=collection_run_id)
+    collector = DiscordCollector(credential_pool=credential_pool, sync_store=sync_store)
     sink = make_batch_sink(collection_run_id, query_design_id)
     collector.configure_batch_persistence(sink=sink, batch_size=100, collection_run_id=collection_run_id)
 
@@ -528,6 +542,7 @@ def discord_collect_actors(
             date_from=_dt.fromisoformat(date_from) if isinstance(date_from, str) else date_from,
             date_to=_dt.fromisoformat(date_to) if isinstance(date_to, str) else date_to,
             actor_ids=actor_ids,
+            planned_gaps=_extra.get("coverage_gaps"),
         )
         if not gaps:
             logger.info(
@@ -579,14 +594,17 @@ def discord_collect_actors(
         )
 
     try:
-        remaining = asyncio.run(
-            collector.collect_by_actors(
-                actor_ids=actor_ids,
-                tier=tier_enum,
-                date_from=effective_date_from,
-                date_to=effective_date_to,
-                max_results=max_results,
-                channel_ids=channel_ids,
+        remaining = run_async(
+            collect_then_close(
+                collector.collect_by_actors(
+                    actor_ids=actor_ids,
+                    tier=tier_enum,
+                    date_from=effective_date_from,
+                    date_to=effective_date_to,
+                    max_results=max_results,
+                    channel_ids=channel_ids,
+                ),
+                sync_store,
             )
         )
     except ArenaRateLimitError:
@@ -692,7 +710,7 @@ def discord_health_check() -> dict[str, Any]:
     """
     credential_pool = CredentialPool()
     collector = DiscordCollector(credential_pool=credential_pool)
-    result: dict[str, Any] = asyncio.run(collector.health_check())
+    result: dict[str, Any] = run_async(collector.health_check())
     logger.info(
         "discord: health_check status=%s", result.get("status", "unknown")
     )
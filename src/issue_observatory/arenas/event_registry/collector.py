@@ -60,6 +60,7 @@ from issue_observatory.core.exceptions import (
     NoCredentialAvailableError,
 )
 from issue_observatory.core.normalizer import Normalizer
+from issue_observatory.workers.runtime import shared_http_transport
 
 logger = logging.getLogger(__name__)
 
@@ -93,6 +94,7 @@ class EventRegistryCollector(ArenaCollector):
     platform_name: str = "event_registry"
     supported_tiers: list[Tier] = [Tier.MEDIUM, Tier.PREMIUM]
     temporal_mode: TemporalMode = TemporalMode.HISTORICAL
+    supports_coverage_check: bool = True
 
     def __init__(
         self,
@@ -719,6 +721,7 @@ class EventRegistryCollector(ArenaCollector):
             headers={
                 "User-Agent": "IssueObservatory/1.0 (event-registry-collector; research use)"
             },
+            transport=shared_http_transport(),
         )
 
     async def _rate_limit_wait(self, credential_id: str) -> None:
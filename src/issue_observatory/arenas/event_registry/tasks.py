@@ -26,7 +26,6 @@ Note on tier strings:
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import time
 from typing import Any
@@ -41,6 +40,7 @@ from issue_observatory.core.exceptions import (
     NoCredentialAvailableError,
 )
 from issue_observatory.workers.celery_app import celery_app
+from issue_observatory.workers.runtime import run_async
 
 logger = logging.getLogger(__name__)
 
@@ -215,6 +215,7 @@ def event_registry_collect_terms(
             date_from=_dt.fromisoformat(date_from) if isinstance(date_from, str) else date_from,
             date_to=_dt.fromisoformat(date_to) if isinstance(date_to, str) else date_to,
             terms=terms,
+            planned_gaps=_extra.get("coverage_gaps"),
         )
         if not gaps:
             logger.info(
@@ -265,7 +266,7 @@ def event_registry_collect_terms(
         )
 
     try:
-        remaining = asyncio.run(
+        remaining = run_async(
             collector.collect_by_terms(
                 terms=terms,
                 tier=tier_enum,
@@ -472,6 +473,7 @@ def event_registry_collect_actors(
             date_from=_dt.fromisoformat(date_from) if isinstance(date_from, str) else date_from,
             date_to=_dt.fromisoformat(date_to) if isinstance(date_to, str) else date_to,
             actor_ids=actor_ids,
+            planned_gaps=_extra.get("coverage_gaps"),
         )
         if not gaps:
             logger.info(
@@ -523,7 +525,7 @@ def event_registry_collect_actors(
         )
 
     try:
-        remaining = asyncio.run(
+        remaining = run_async(
             collector.collect_by_actors(
                 actor_ids=actor_ids,
                 tier=tier_enum,
@@ -645,7 +647,7 @@ def event_registry_health_check() -> dict[str, Any]:
     """
     credential_pool = CredentialPool()
     collector = EventRegistryCollector(credential_pool=credential_pool)
-    result: dict[str, Any] = asyncio.run(collector.health_check())
+    result: dict[str, Any] = run_async(collector.health_check())
     logger.info(
         "event_registry: health_check status=%s remaining_tokens=%s",
         result.get("status", "unknown"),
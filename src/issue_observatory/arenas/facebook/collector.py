@@ -5,6 +5,9 @@ Collects public Facebook posts via two tiers:
 - **MEDIUM** (:class:`Tier.MEDIUM`): Bright Data Web Scraper API.
   Asynchronous delivery: POST trigger → poll progress → download snapshot.
   Credential: ``platform="brightdata_facebook"``, JSONB ``api_token`` + ``zone``.
+  Collection runs only trigger (:meth:`FacebookCollector.trigger_actor_snapshot`)
+  and later stream the ready snapshot (:meth:`FacebookCollector.ingest_snapshot`);
+  see ``arenas/_brightdata_snapshots.py``.
 
 - **PREMIUM** (:class:`Tier.PREMIUM`): Meta Content Library (MCL).
   Both collection methods raise ``NotImplementedError`` — MCL integration is
@@ -50,6 +53,13 @@ from issue_observatory.arenas._brightdata_comments import (
     get_parent_post_date,
     lookup_parent_post_dates,
 )
+from issue_observatory.arenas._brightdata_snapshots import (
+    COMMENTS,
+    SnapshotJob,
+    error_entry,
+    iter_snapshot_records,
+    snapshot_credential,
+)
 from issue_observatory.arenas.base import ArenaCollector, TemporalMode, Tier
 from issue_observatory.arenas.facebook.config import (
     BRIGHTDATA_MAX_POLL_ATTEMPTS,
@@ -57,7 +67,6 @@ from issue_observatory.arenas.facebook.config import (
     BRIGHTDATA_PROGRESS_URL,
     BRIGHTDATA_RATE_LIMIT_MAX_CALLS,
     BRIGHTDATA_RATE_LIMIT_WINDOW_SECONDS,
-    BRIGHTDATA_SNAPSHOT_URL,
     FACEBOOK_DATASET_ID_COMMENTS,
     FACEBOOK_DATASET_ID_GROUPS,
     FACEBOOK_DATASET_ID_POSTS,
@@ -74,6 +83,7 @@ from issue_observatory.core.exceptions import (
     NoCredentialAvailableError,
 )
 from issue_observatory.core.normalizer import Normalizer
+from issue_observatory.workers.runtime import shared_http_transport
 
 logger = logging.getLogger(__name__)
 
@@ -501,29 +511,7 @@ class FacebookCollector(ArenaCollector):
         """
         await self._wait_rate_limit(cred_id)
 
-        start_date_str = to_brightdata_date(date_from)
-        end_date_str = to_brightdata_date(date_to)
-
-        # Compute per-actor post limit from the date range width.
-        date_range_days = _compute_date_range_days(date_from, date_to)
-        per_actor_limit = min(date_range_days * _POSTS_PER_ACTOR_PER_DAY, max_results)
-
-        entry: dict[str, Any] = {
-            "url": url,
-            "num_of_posts": per_actor_limit,
-        }
-        if start_date_str:
-            entry["start_date"] = start_date_str
-        if end_date_str:
-            entry["end_date"] = end_date_str
-        payload: list[dict[str, Any]] = [entry]
-
-        logger.info(
-            "facebook: BD trigger payload for %s — %s",
-            url.split("/")[-1],
-            entry,
-        )
-
+        payload = self._build_actor_payload(url, max_results, date_from, date_to)
         trigger_url = build_trigger_url(dataset_id)
         snapshot_id = await self._trigger_dataset(client, api_token, trigger_url, payload)
         raw_items = await self._poll_and_download(client, api_token, snapshot_id)
@@ -534,21 +522,10 @@ class FacebookCollector(ArenaCollector):
         valid_items: list[dict[str, Any]] = []
         error_entries: list[dict[str, str]] = []
         for item in raw_items:
-            error_code = item.get("error_code")
-            if error_code:
-                input_url = (item.get("input") or {}).get("url", "unknown")
-                logger.warning(
-                    "facebook: Bright Data error record skipped — "
-                    "url=%s error_code=%s error=%s",
-                    input_url,
-                    error_code,
-                    item.get("error", ""),
-                )
-                error_entries.append({
-                    "url": input_url,
-                    "error_code": str(error_code),
-                    "error_detail": str(item.get("error", "")),
-                })
+            entry = error_entry(item)
+            if entry is not None:
+                self._log_error_record(entry)
+                error_entries.append(entry)
                 continue
             valid_items.append(item)
 
@@ -578,20 +555,9 @@ class FacebookCollector(ArenaCollector):
 
         records: list[dict[str, Any]] = []
         for item in valid_items[:max_results]:
-            try:
-                rec = self.normalize(item, source="brightdata")
-                # Client-side date filter: BD may ignore start_date/end_date
-                # and return the latest posts regardless. Drop records outside
-                # the requested range so we don't persist irrelevant data.
-                if not _is_within_date_range(rec, date_from, date_to):
-                    continue
+            rec = self._snapshot_post_record(item, date_from, date_to)
+            if rec is not None:
                 records.append(rec)
-                # Attribute this record to its source actor via BD's input echo.
-                input_url = (item.get("input") or {}).get("url", "")
-                if input_url:
-                    self._record_input_count(input_url, 1)
-            except Exception as exc:
-                logger.warning("facebook: normalization error for item: %s", exc)
 
         if len(records) < len(valid_items):
             logger.info(
@@ -604,6 +570,77 @@ class FacebookCollector(ArenaCollector):
             )
         return records, error_entries
 
+    def _build_actor_payload(
+        self,
+        url: str,
+        max_results: int,
+        date_from: datetime | str | None,
+        date_to: datetime | str | None,
+    ) -> list[dict[str, Any]]:
+        """Build the single-entry trigger payload for one Facebook URL.
+
+        The post cap grows with the width of the date range (see
+        :data:`_POSTS_PER_ACTOR_PER_DAY`) and never exceeds *max_results*.
+        """
+        start_date_str = to_brightdata_date(date_from)
+        end_date_str = to_brightdata_date(date_to)
+
+        # Compute per-actor post limit from the date range width.
+        date_range_days = _compute_date_range_days(date_from, date_to)
+        per_actor_limit = min(date_range_days * _POSTS_PER_ACTOR_PER_DAY, max_results)
+
+        entry: dict[str, Any] = {
+            "url": url,
+            "num_of_posts": per_actor_limit,
+        }
+        if start_date_str:
+            entry["start_date"] = start_date_str
+        if end_date_str:
+            entry["end_date"] = end_date_str
+
+        logger.info(
+            "facebook: BD trigger payload for %s — %s",
+            url.split("/")[-1],
+            entry,
+        )
+        return [entry]
+
+    def _snapshot_post_record(
+        self,
+        item: dict[str, Any],
+        date_from: datetime | str | None,
+        date_to: datetime | str | None,
+    ) -> dict[str, Any] | None:
+        """Normalize one valid snapshot item, or return ``None`` to drop it.
+
+        Attributes kept records to their source actor through Bright Data's
+        ``input.url`` echo.
+        """
+        try:
+            rec = self.normalize(item, source="brightdata")
+        except Exception as exc:
+            logger.warning("facebook: normalization error for item: %s", exc)
+            return None
+        # Client-side date filter: BD may ignore start_date/end_date
+        # and return the latest posts regardless. Drop records outside
+        # the requested range so we don't persist irrelevant data.
+        if not _is_within_date_range(rec, date_from, date_to):
+            return None
+        input_url = (item.get("input") or {}).get("url", "")
+        if input_url:
+            self._record_input_count(input_url, 1)
+        return rec
+
+    @staticmethod
+    def _log_error_record(entry: dict[str, str]) -> None:
+        logger.warning(
+            "facebook: Bright Data error record skipped — "
+            "url=%s error_code=%s error=%s",
+            entry["url"],
+            entry["error_code"],
+            entry["error_detail"],
+        )
+
     # ------------------------------------------------------------------
     # Normalizer parsing paths
     # ------------------------------------------------------------------
@@ -1004,46 +1041,9 @@ class FacebookCollector(ArenaCollector):
                         max_comments_per_post,
                     )
 
-                    # Normalize each raw comment using the field names that
-                    # _parse_brightdata_facebook expects.
-                    # - "content" is the primary text field.
-                    # - "comment_id" triggers content_type="comment" detection.
-                    records: list[dict[str, Any]] = []
-                    for item in raw_comments:
-                        text: str = (
-                            item.get("text")
-                            or item.get("comment_text")
-                            or item.get("content", "")
-                        )
-                        parent_url: str = item.get("post_url") or item.get("post_id") or ""
-                        # Inherit publication date from parent post; fall back
-                        # to the Bright Data field (which is the scrape date).
-                        inherited_date = get_parent_post_date(parent_url, parent_dates)
-                        raw_dict: dict[str, Any] = {
-                            "comment_id": item.get("id") or item.get("comment_id"),
-                            "id": item.get("id") or item.get("comment_id"),
-                            "content": text,
-                            "page_name": item.get("author_name") or item.get("page_name"),
-                            "user_url": (
-                                item.get("author_id")
-                                or item.get("author_url")
-                                or item.get("user_url")
-                            ),
-                            "date_posted": inherited_date or (
-                                item.get("date_posted")
-                                or item.get("date")
-                                or item.get("timestamp")
-                            ),
-                            "num_likes": (
-                                item.get("num_likes")
-                                or item.get("likes")
-                                or item.get("like_count")
-                                or 0
-                            ),
-                            "url": item.get("comment_url") or item.get("url"),
-                            "parent_post_id": parent_url,
-                        }
-                        records.append(self.normalize(raw_dict))
+                    records = [
+                        self._comment_record(item, parent_dates) for item in raw_comments
+                    ]
 
                     self._emit_many(records)
                     self._flush()
@@ -1070,6 +1070,246 @@ class FacebookCollector(ArenaCollector):
         )
         return list(self._batch_buffer)
 
+    def _comment_record(
+        self, item: dict[str, Any], parent_dates: dict[str, str]
+    ) -> dict[str, Any]:
+        """Normalize one raw Bright Data comment.
+
+        Maps the comment onto the field names that
+        :meth:`_parse_brightdata_facebook` expects: ``content`` is the primary
+        text field and ``comment_id`` triggers ``content_type="comment"``.
+
+        Args:
+            item: Raw comment dict from a comment snapshot.
+            parent_dates: Parent post URL → ``published_at`` mapping from
+                :func:`lookup_parent_post_dates`.
+
+        Returns:
+            The normalized comment record.
+        """
+        text: str = (
+            item.get("text")
+            or item.get("comment_text")
+            or item.get("content", "")
+        )
+        parent_url: str = item.get("post_url") or item.get("post_id") or ""
+        # Inherit publication date from parent post; fall back
+        # to the Bright Data field (which is the scrape date).
+        inherited_date = get_parent_post_date(parent_url, parent_dates)
+        raw_dict: dict[str, Any] = {
+            "comment_id": item.get("id") or item.get("comment_id"),
+            "id": item.get("id") or item.get("comment_id"),
+            "content": text,
+            "page_name": item.get("author_name") or item.get("page_name"),
+            "user_url": (
+                item.get("author_id")
+                or item.get("author_url")
+                or item.get("user_url")
+            ),
+            "date_posted": inherited_date or (
+                item.get("date_posted")
+                or item.get("date")
+                or item.get("timestamp")
+            ),
+            "num_likes": (
+                item.get("num_likes")
+                or item.get("likes")
+                or item.get("like_count")
+                or 0
+            ),
+            "url": item.get("comment_url") or item.get("url"),
+            "parent_post_id": parent_url,
+        }
+        return self.normalize(raw_dict)
+
+    # ------------------------------------------------------------------
+    # Non-blocking snapshot lifecycle
+    # ------------------------------------------------------------------
+
+    async def trigger_actor_snapshot(
+        self,
+        actor_url: str,
+        tier: Tier,
+        date_from: datetime | str | None = None,
+        date_to: datetime | str | None = None,
+        max_results: int | None = None,
+    ) -> tuple[str, str]:
+        """Trigger the Bright Data scrape of one actor without waiting for it.
+
+        The caller registers the returned snapshot with the
+        :class:`~issue_observatory.arenas._brightdata_snapshots.SnapshotStore`;
+        :meth:`ingest_snapshot` downloads it once the poller reports it ready.
+
+        Args:
+            actor_url: Normalized Facebook page, group, or profile URL.
+            tier: :attr:`Tier.MEDIUM` (PREMIUM raises ``NotImplementedError``).
+            date_from: Earliest publication date (inclusive).
+            date_to: Latest publication date (inclusive).
+            max_results: Upper bound on records for this actor.
+
+        Returns:
+            ``(snapshot_id, credential_id)`` — the snapshot must be polled
+            and downloaded with the same credential.
+
+        Raises:
+            NotImplementedError: For PREMIUM tier (MCL pending approval).
+            ArenaRateLimitError: On HTTP 429 from Bright Data.
+            ArenaAuthError: On HTTP 401/403 from Bright Data.
+            ArenaCollectionError: On other trigger errors.
+            NoCredentialAvailableError: When no credential is available.
+        """
+        self._validate_tier(tier)
+        if tier == Tier.PREMIUM:
+            raise NotImplementedError(
+                "Meta Content Library integration pending approval. "
+                "PREMIUM tier is not yet operational for the Facebook arena."
+            )
+        tier_config = self.get_tier_config(tier)
+        effective_max = (
+            max_results if max_results is not None
+            else (tier_config.max_results_per_run if tier_config else 10_000)
+        )
+
+        cred = await self._acquire_medium_credential()
+        if cred is None:
+            raise NoCredentialAvailableError(platform="brightdata_facebook", tier="medium")
+        cred_id: str = cred["id"]
+        api_token: str = cred.get("api_token") or cred.get("api_key", "")
+
+        try:
+            await self._wait_rate_limit(cred_id)
+            payload = self._build_actor_payload(actor_url, effective_max, date_from, date_to)
+            trigger_url = build_trigger_url(_detect_facebook_dataset_id(actor_url))
+            async with self._build_http_client() as client:
+                snapshot_id = await self._trigger_dataset(client, api_token, trigger_url, payload)
+            return snapshot_id, cred_id
+        finally:
+            if self.credential_pool:
+                await self.credential_pool.release(credential_id=cred_id)
+
+    async def trigger_comment_snapshots(
+        self, post_ids: list[dict]
+    ) -> AsyncIterator[tuple[str, list[str], str]]:
+        """Trigger comment scrapes for *post_ids* without waiting for them.
+
+        Posts that already have comments are skipped; the rest are sent in
+        batches of :data:`_COMMENT_BATCH_SIZE`, one snapshot per batch.  Each
+        snapshot is yielded as soon as it is triggered so the caller can
+        register it before the next trigger.
+
+        Args:
+            post_ids: List of dicts with ``url`` key (Facebook post URL).
+
+        Yields:
+            ``(snapshot_id, post_urls, credential_id)`` per triggered batch.
+
+        Raises:
+            NoCredentialAvailableError: When no credential is available.
+        """
+        post_urls = filter_already_collected_posts(
+            [entry["url"] for entry in post_ids if entry.get("url")], _PLATFORM
+        )
+        if not post_urls:
+            return
+
+        cred = await self._acquire_medium_credential()
+        if cred is None:
+            raise NoCredentialAvailableError(platform="brightdata_facebook", tier="medium")
+        cred_id: str = cred["id"]
+        api_token: str = cred.get("api_token") or cred.get("api_key", "")
+
+        triggered = 0
+        try:
+            bd = BrightDataCommentCollector()
+            async with self._build_http_client() as client:
+                for chunk_start in range(0, len(post_urls), _COMMENT_BATCH_SIZE):
+                    self.check_cancelled()
+                    chunk = post_urls[chunk_start : chunk_start + _COMMENT_BATCH_SIZE]
+                    await self._wait_rate_limit(cred_id)
+                    snapshot_id = await bd.trigger_comments(
+                        client, api_token, chunk, FACEBOOK_DATASET_ID_COMMENTS, _PLATFORM
+                    )
+                    triggered += 1
+                    yield snapshot_id, chunk, cred_id
+        finally:
+            if self.credential_pool:
+                await self.credential_pool.release(credential_id=cred_id)
+
+        logger.info(
+            "facebook: triggered %d comment snapshots for %d posts",
+            triggered,
+            len(post_urls),
+        )
+
+    async def ingest_snapshot(self, job: SnapshotJob) -> list[dict[str, Any]]:
+        """Stream a ready snapshot into the batch sink.
+
+        Records are normalized and emitted as the NDJSON body is parsed, so
+        memory stays bounded by the batch size rather than the snapshot size.
+        ``job.records_read`` and ``job.errors`` are updated in place.
+
+        Args:
+            job: A snapshot in the ``downloading`` state.
+
+        Returns:
+            Any remaining un-flushed records (non-empty only if the sink failed).
+
+        Raises:
+            ArenaCollectionError: If the download fails.
+            NoCredentialAvailableError: When the credential that triggered
+                the snapshot is no longer available.
+        """
+        cred = await snapshot_credential(self.credential_pool, job)
+        if cred is None:
+            raise NoCredentialAvailableError(platform="brightdata_facebook", tier="medium")
+        api_token: str = cred.get("api_token") or cred.get("api_key", "")
+
+        self._reset_batch_state()
+        job.records_read = 0
+        job.errors = []
+        parent_dates = (
+            lookup_parent_post_dates(job.inputs, _PLATFORM) if job.kind == COMMENTS else {}
+        )
+        async with self._build_http_client() as client:
+            if job.kind == COMMENTS:
+                items = BrightDataCommentCollector().iter_comments(
+                    client, api_token, job.snapshot_id, _PLATFORM
+                )
+            else:
+                items = iter_snapshot_records(
+                    client,
+                    api_token,
+                    job.snapshot_id,
+                    arena=self.arena_name,
+                    platform=self.platform_name,
+                )
+            async for item in items:
+                job.records_read += 1
+                if job.kind == COMMENTS:
+                    self._emit(self._comment_record(item, parent_dates))
+                    continue
+                entry = error_entry(item)
+                if entry is not None:
+                    self._log_error_record(entry)
+                    job.errors.append(entry)
+                    continue
+                if job.max_results is not None and self._total_emitted >= job.max_results:
+                    continue
+                rec = self._snapshot_post_record(item, job.date_from, job.date_to)
+                if rec is not None:
+                    self._emit(rec)
+
+        self._flush()
+        logger.info(
+            "facebook: snapshot=%s ingested — read=%d emitted=%d inserted=%d errors=%d",
+            job.snapshot_id,
+            job.records_read,
+            self._total_emitted,
+            self._total_inserted,
+            len(job.errors),
+        )
+        return list(self._batch_buffer)
+
     # ------------------------------------------------------------------
     # Bright Data low-level HTTP helpers
     # ------------------------------------------------------------------
@@ -1176,7 +1416,6 @@ class FacebookCollector(ArenaCollector):
         """
         headers = {"Authorization": f"Bearer {api_token}"}
         progress_url = BRIGHTDATA_PROGRESS_URL.format(snapshot_id=snapshot_id)
-        snapshot_url = BRIGHTDATA_SNAPSHOT_URL.format(snapshot_id=snapshot_id)
 
         for attempt in range(1, BRIGHTDATA_MAX_POLL_ATTEMPTS + 1):
             # Bail out early if the run was cancelled while polling.
@@ -1219,30 +1458,18 @@ class FacebookCollector(ArenaCollector):
                 platform=self.platform_name,
             )
 
-        # Download the snapshot.
-        try:
-            dl_response = await client.get(snapshot_url, headers=headers)
-            dl_response.raise_for_status()
-            raw_items: list[dict[str, Any]] = dl_response.json()
-            if not isinstance(raw_items, list):
-                # Some Bright Data endpoints wrap in {"data": [...]}
-                raw_items = raw_items.get("data", []) if isinstance(raw_items, dict) else []
-            logger.info(
-                "facebook: snapshot=%s downloaded %d items", snapshot_id, len(raw_items)
-            )
-            return raw_items
-        except httpx.HTTPStatusError as exc:
-            raise ArenaCollectionError(
-                f"facebook: Bright Data snapshot download HTTP {exc.response.status_code}",
-                arena=self.arena_name,
-                platform=self.platform_name,
-            ) from exc
-        except httpx.RequestError as exc:
-            raise ArenaCollectionError(
-                f"facebook: Bright Data snapshot download connection error: {exc}",
+        raw_items = [
+            item
+            async for item in iter_snapshot_records(
+                client,
+                api_token,
+                snapshot_id,
                 arena=self.arena_name,
                 platform=self.platform_name,
-            ) from exc
+            )
+        ]
+        logger.info("facebook: snapshot=%s downloaded %d items", snapshot_id, len(raw_items))
+        return raw_items
 
     # ------------------------------------------------------------------
     # Rate limit helpers
@@ -1295,7 +1522,7 @@ class FacebookCollector(ArenaCollector):
         if self._http_client is not None:
             yield self._http_client
             return
-        async with httpx.AsyncClient(timeout=60.0) as client:
+        async with httpx.AsyncClient(timeout=60.0, transport=shared_http_transport()) as client:
             yield client
 
 
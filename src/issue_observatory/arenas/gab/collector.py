@@ -55,6 +55,7 @@ from issue_observatory.core.exceptions import (
     NoCredentialAvailableError,
 )
 from issue_observatory.core.normalizer import Normalizer
+from issue_observatory.workers.runtime import shared_http_transport
 
 logger = logging.getLogger(__name__)
 
@@ -85,6 +86,7 @@ class GabCollector(ArenaCollector):
     supported_tiers: list[Tier] = [Tier.FREE]
     temporal_mode: TemporalMode = TemporalMode.RECENT
     supports_actor_collection: bool = True
+    supports_coverage_check: bool = True
     source_list_config_key: str | None = "custom_accounts"
 
     def __init__(
@@ -477,7 +479,7 @@ class GabCollector(ArenaCollector):
         """Return an ``httpx.AsyncClient`` for use as a context manager."""
         if self._http_client is not None:
             return self._http_client  # type: ignore[return-value]
-        return httpx.AsyncClient(timeout=30.0)
+        return httpx.AsyncClient(timeout=30.0, transport=shared_http_transport())
 
     async def _get_credential(self) -> dict[str, Any]:
         """Acquire a Gab credential from the pool.
@@ -13,7 +13,6 @@ These tasks are expected to complete quickly with small result sets.
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import time
 from typing import Any
@@ -29,6 +28,7 @@ from issue_observatory.core.exceptions import (
     NoCredentialAvailableError,
 )
 from issue_observatory.workers.celery_app import celery_app
+from issue_observatory.workers.runtime import run_async
 
 logger = logging.getLogger(__name__)
 
@@ -190,6 +190,7 @@ def gab_collect_terms(
             date_from=_dt.fromisoformat(date_from) if isinstance(date_from, str) else date_from,
             date_to=_dt.fromisoformat(date_to) if isinstance(date_to, str) else date_to,
             terms=terms,
+            planned_gaps=_extra.get("coverage_gaps"),
         )
         if not gaps:
             logger.info(
@@ -240,7 +241,7 @@ def gab_collect_terms(
         )
 
     try:
-        remaining = asyncio.run(
+        remaining = run_async(
             collector.collect_by_terms(
                 terms=terms,
                 tier=Tier.FREE,
@@ -423,6 +424,7 @@ def gab_collect_actors(
             date_from=_dt.fromisoformat(date_from) if isinstance(date_from, str) else date_from,
             date_to=_dt.fromisoformat(date_to) if isinstance(date_to, str) else date_to,
             actor_ids=actor_ids,
+            planned_gaps=_extra.get("coverage_gaps"),
         )
         if not gaps:
             logger.info(
@@ -474,7 +476,7 @@ def gab_collect_actors(
         )
 
     try:
-        remaining = asyncio.run(
+        remaining = run_async(
             collector.collect_by_actors(
                 actor_ids=actor_ids,
                 tier=Tier.FREE,
@@ -577,6 +579,6 @@ def gab_health_check() -> dict[str, Any]:
     """
     credential_pool = CredentialPool()
     collector = GabCollector(credential_pool=credential_pool)
-    result: dict[str, Any] = asyncio.run(collector.health_check())
+    result: dict[str, Any] = run_async(collector.health_check())
     logger.info("gab: health_check status=%s", result.get("status", "unknown"))
     return result
@@ -52,6 +52,7 @@ from issue_observatory.config.tiers import TierConfig
 from issue_observatory.core.exceptions import ArenaCollectionError
 from issue_observatory.core.language_utils import resolve_gdelt_filters
 from issue_observatory.core.normalizer import Normalizer
+from issue_observatory.workers.runtime import shared_http_transport
 
 logger = logging.getLogger(__name__)
 
@@ -82,6 +83,7 @@ class GDELTCollector(ArenaCollector):
     platform_name: str = "gdelt"
     supported_tiers: list[Tier] = [Tier.FREE]
     temporal_mode: TemporalMode = TemporalMode.HISTORICAL
+    supports_coverage_check: bool = True
 
     def __init__(
         self,
@@ -413,6 +415,7 @@ class GDELTCollector(ArenaCollector):
             headers={
                 "User-Agent": "IssueObservatory/1.0 (gdelt-collector; research use)"
             },
+            transport=shared_http_transport(),
         )
 
     async def _rate_limit_wait(self) -> None:
@@ -20,7 +20,6 @@ collection outcomes.
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import time
 from typing import Any
@@ -33,6 +32,7 @@ from issue_observatory.core.exceptions import (
     ArenaRateLimitError,
 )
 from issue_observatory.workers.celery_app import celery_app
+from issue_observatory.workers.runtime import run_async
 
 logger = logging.getLogger(__name__)
 
@@ -206,6 +206,7 @@ def gdelt_collect_terms(
                 date_from=_dt.fromisoformat(date_from) if isinstance(date_from, str) else date_from,
                 date_to=_dt.fromisoformat(date_to) if isinstance(date_to, str) else date_to,
                 terms=terms,
+                planned_gaps=_extra.get("coverage_gaps"),
             )
             if not gaps:
                 logger.info(
@@ -256,7 +257,7 @@ def gdelt_collect_terms(
             )
 
         try:
-            remaining = asyncio.run(
+            remaining = run_async(
                 collector.collect_by_terms(
                     terms=terms,
                     tier=tier_enum,
@@ -383,6 +384,6 @@ def gdelt_health_check() -> dict[str, Any]:
         ``checked_at``, and optionally ``detail``.
     """
     collector = GDELTCollector()
-    result: dict[str, Any] = asyncio.run(collector.health_check())
+    result: dict[str, Any] = run_async(collector.health_check())
     logger.info("gdelt: health_check status=%s", result.get("status", "unknown"))
     return result
@@ -47,6 +47,7 @@ from issue_observatory.core.exceptions import (
 )
 from issue_observatory.core.language_utils import resolve_google_params, resolve_language_label
 from issue_observatory.core.normalizer import Normalizer
+from issue_observatory.workers.runtime import shared_http_transport
 
 logger = logging.getLogger(__name__)
 
@@ -392,7 +393,7 @@ class GoogleAutocompleteCollector(ArenaCollector):
         """
         if self._http_client is not None:
             return self._http_client  # type: ignore[return-value]
-        return httpx.AsyncClient(timeout=30.0)
+        return httpx.AsyncClient(timeout=30.0, transport=shared_http_transport())
 
     async def _wait_for_rate_limit(self, credential_id: str) -> None:
         """Wait for a rate-limit slot before making an API call.
@@ -21,7 +21,6 @@ Database updates:
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import time
 from typing import Any
@@ -36,6 +35,7 @@ from issue_observatory.core.exceptions import (
     NoCredentialAvailableError,
 )
 from issue_observatory.workers.celery_app import celery_app
+from issue_observatory.workers.runtime import run_async
 
 logger = logging.getLogger(__name__)
 
@@ -327,7 +327,7 @@ def google_autocomplete_health_check() -> dict[str, Any]:
     """
     credential_pool = CredentialPool()
     collector = GoogleAutocompleteCollector(credential_pool=credential_pool)
-    result: dict[str, Any] = asyncio.run(collector.health_check())
+    result: dict[str, Any] = run_async(collector.health_check())
     logger.info(
         "google_autocomplete: health_check status=%s", result.get("status", "unknown")
     )
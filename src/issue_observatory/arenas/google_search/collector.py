@@ -58,6 +58,7 @@ from issue_observatory.core.exceptions import (
 )
 from issue_observatory.core.language_utils import resolve_google_params, resolve_language_label
 from issue_observatory.core.normalizer import Normalizer
+from issue_observatory.workers.runtime import shared_http_transport
 
 logger = logging.getLogger(__name__)
 
@@ -448,7 +449,7 @@ class GoogleSearchCollector(ArenaCollector):
         """
         if self._http_client is not None:
             return self._http_client  # type: ignore[return-value]
-        return httpx.AsyncClient(timeout=30.0)
+        return httpx.AsyncClient(timeout=30.0, transport=shared_http_transport())
 
     async def _collect_term(
         self,
@@ -37,7 +37,6 @@ the original collection outcome.
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import time
 from typing import Any
@@ -52,6 +51,7 @@ from issue_observatory.core.exceptions import (
     NoCredentialAvailableError,
 )
 from issue_observatory.workers.celery_app import celery_app
+from issue_observatory.workers.runtime import run_async
 
 logger = logging.getLogger(__name__)
 
@@ -388,7 +388,7 @@ def google_search_health_check() -> dict[str, Any]:
     """
     credential_pool = CredentialPool()
     collector = GoogleSearchCollector(credential_pool=credential_pool)
-    result: dict[str, Any] = asyncio.run(collector.health_check())
+    result: dict[str, Any] = run_async(collector.health_check())
     logger.info(
         "google_search: health_check status=%s", result.get("status", "unknown")
     )
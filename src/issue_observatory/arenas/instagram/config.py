@@ -47,8 +47,12 @@ BRIGHTDATA_API_BASE: str = "https://api.brightdata.com/datasets/v3"
 BRIGHTDATA_PROGRESS_URL: str = f"{BRIGHTDATA_API_BASE}/progress/{{snapshot_id}}"
 """URL template for polling snapshot delivery progress. Format with ``snapshot_id``."""
 
-BRIGHTDATA_SNAPSHOT_URL: str = f"{BRIGHTDATA_API_BASE}/snapshot/{{snapshot_id}}?format=json"
-"""URL template for downloading a completed snapshot. Format with ``snapshot_id``."""
+BRIGHTDATA_SNAPSHOT_URL: str = f"{BRIGHTDATA_API_BASE}/snapshot/{{snapshot_id}}?format=ndjson"
+"""URL template for downloading a completed snapshot as NDJSON. Format with ``snapshot_id``.
+
+Newline-delimited records are parsed as they arrive instead of loading the
+whole snapshot as one JSON document.
+"""
 
 # ---------------------------------------------------------------------------
 # Web Scraper API — dataset IDs by content type
@@ -106,6 +110,10 @@ def build_trigger_url(dataset_id: str, *, discover_by_url: bool = False) -> str:
 
 # ---------------------------------------------------------------------------
 # Polling parameters
+#
+# Used when the collector waits for its own snapshots (direct collection via
+# the arena router).  Collection runs hand snapshots to the beat-driven
+# lifecycle in ``arenas/_brightdata_snapshots.py`` instead.
 # ---------------------------------------------------------------------------
 
 BRIGHTDATA_POLL_INTERVAL: int = 30
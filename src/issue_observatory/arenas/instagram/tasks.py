@@ -18,9 +18,16 @@ Retry policy:
   duplicate requests). Backoff capped at 900 seconds (15 minutes).
 - ``NoCredentialAvailableError`` immediately marks the task as FAILED.
 
-Time limits:
-- No fixed time limit. Records persist incrementally via the batch sink and
-  stale_run_cleanup handles any stuck tasks.
+Snapshot lifecycle:
+- ``collect_by_actors`` and ``collect_comments`` only trigger Bright Data
+  snapshots and register them in the
+  :class:`~issue_observatory.arenas._brightdata_snapshots.SnapshotStore`; the
+  ``collection_tasks`` row stays ``running``.
+- The ``advance_brightdata_snapshots`` beat task polls the snapshots and
+  dispatches ``ingest_snapshot`` for each ready or failed one.
+- ``ingest_snapshot`` streams the snapshot into the batch sink, records
+  per-actor coverage, and the one that settles the last snapshot completes the
+  collection task.
 
 All task arguments are JSON-serializable.
 """
@@ -33,6 +40,14 @@ import random
 import time
 from typing import Any
 
+from issue_observatory.arenas._brightdata_snapshots import (
+    COMMENTS,
+    POSTS,
+    SnapshotJob,
+    SnapshotStore,
+    finalize_snapshot_task,
+    ingest_snapshot,
+)
 from issue_observatory.arenas.instagram.collector import InstagramCollector
 from issue_observatory.config.settings import get_settings
 from issue_observatory.core.credential_pool import CredentialPool
@@ -44,6 +59,7 @@ from issue_observatory.core.exceptions import (
     NoCredentialAvailableError,
 )
 from issue_observatory.workers.celery_app import celery_app
+from issue_observatory.workers.runtime import run_async
 
 logger = logging.getLogger(__name__)
 
@@ -119,6 +135,34 @@ def _update_task_status(
             exc,
         )
 
+def _reindex_actor_records(
+    context: dict[str, Any], collection_run_id: str, query_design_id: str
+) -> int:
+    """Link records of earlier runs from the task's profiles to this run.
+
+    Instagram stores a numeric owner_id as author_platform_id, which doesn't
+    match the profile URLs in actor_ids.  Usernames are extracted and matched
+    via author_display_name instead.  Instagram post URLs (/p/ID, /reel/ID)
+    don't contain the username, so URL-prefix matching is not applicable.
+    """
+    from issue_observatory.workers._task_helpers import reindex_existing_records
+
+    usernames = [
+        url.rstrip("/").split("/")[-1]
+        for url in context.get("actor_ids") or []
+        if url.rstrip("/").split("/")[-1]
+    ]
+    return reindex_existing_records(
+        platform=_PLATFORM,
+        collection_run_id=collection_run_id,
+        query_design_id=query_design_id,
+        author_names=usernames,
+        source_url_prefixes=None,
+        require_term_match=True,
+        date_from=context.get("date_from"),
+        date_to=context.get("date_to"),
+    )
+
 
 # ---------------------------------------------------------------------------
 # Tasks
@@ -219,7 +263,11 @@ def instagram_collect_actors(
 ) -> dict[str, Any]:
     """Collect Instagram posts from specific profiles.
 
-    Wraps :meth:`InstagramCollector.collect_by_actors` as a Celery task.
+    Triggers one Bright Data snapshot per profile via
+    :meth:`InstagramCollector.trigger_actor_snapshot` and returns without
+    waiting; :func:`instagram_ingest_snapshot` downloads each snapshot once
+    it is ready and completes the task after the last one.
+
     Actor IDs should be Instagram usernames (with or without ``@``) or full
     profile URLs (e.g. ``https://www.instagram.com/drnyheder``). Uses the
     Reels scraper which covers all content types (posts and reels).
@@ -237,7 +285,9 @@ def instagram_collect_actors(
             ignored — actor-only tasks do not use these parameters.
 
     Returns:
-        Dict with ``records_collected``, ``status``, ``arena``, ``platform``, ``tier``.
+        Dict with ``records_collected``, ``status``, ``arena``, ``platform``,
+        ``tier`` — ``status`` is ``"running"`` (with ``snapshots_pending``)
+        while snapshots are outstanding.
 
     Raises:
         ArenaRateLimitError: Triggers automatic retry (max 2, backoff ≤ 900s).
@@ -269,13 +319,8 @@ def instagram_collect_actors(
             elapsed_seconds=elapsed_since(_task_start),
         )
 
-        from issue_observatory.workers._task_helpers import make_batch_sink
-
         credential_pool = CredentialPool()
         tier_enum = Tier(tier)
-        sink = make_batch_sink(
-            collection_run_id, query_design_id, actor_sourced=True,
-        )
 
         # Normalize URLs before coverage check so keys match BD's format.
         from issue_observatory.arenas.instagram.collector import (
@@ -284,12 +329,8 @@ def instagram_collect_actors(
         from issue_observatory.workers._task_helpers import (
             RunCancelledError,
             check_run_cancelled,
-            clear_url_errors,
-            count_run_platform_records,
             get_latest_actor_coverage_date,
             get_suppressed_urls,
-            record_collection_attempts_batch,
-            record_url_errors,
         )
 
         normalized_actor_ids = [_normalize_profile_url(aid) for aid in actor_ids]
@@ -340,35 +381,51 @@ def instagram_collect_actors(
                 }
 
         # ---------------------------------------------------------------
-        # Per-actor parallel collection loop (single event loop, 6-way)
+        # Per-actor snapshot triggers (single event loop, 6-way)
         # ---------------------------------------------------------------
+        # Only the triggers run here.  The advance_brightdata_snapshots beat
+        # task polls the snapshots and dispatches ingest_snapshot for each
+        # ready one; whichever settles last finalizes this task.
         _MAX_CONCURRENT_ACTORS = 6
+        store = SnapshotStore(_redis_url)
 
-        async def _run_per_actor_loop() -> tuple[int, list[str]]:
-            """Collect actors with bounded parallelism within one event loop.
+        async def _trigger_per_actor() -> tuple[
+            list[str], int, tuple[dict[str, Any], list[SnapshotJob]] | None
+        ]:
+            """Trigger one snapshot per actor with bounded parallelism.
 
-            Each actor gets its own collector instance (isolated batch_stats).
-            A semaphore limits concurrency to ``_MAX_CONCURRENT_ACTORS``.
-
-            Returns (total_inserted, actor_errors).
+            Returns (actor_errors, pending_snapshots, settled).
             """
-            _total = 0
             _errors: list[str] = []
             _cancel = asyncio.Event()
             _sem = asyncio.Semaphore(_MAX_CONCURRENT_ACTORS)
             _total_actors = len(normalized_actor_ids)
 
-            async def _collect_one(
-                actor_idx: int, actor_url: str
-            ) -> tuple[int, str | None]:
-                """Collect a single actor. Returns (inserted, error_or_None)."""
-                nonlocal _total
+            await store.begin_task(
+                collection_run_id,
+                _PLATFORM,
+                {
+                    "actor_ids": normalized_actor_ids,
+                    "date_from": date_from,
+                    "date_to": date_to,
+                    "tier": tier,
+                },
+            )
+            # A retried task keeps the snapshots its earlier attempts triggered.
+            already_triggered = {
+                url
+                for job in await store.for_run(collection_run_id, _PLATFORM)
+                for url in job.inputs
+            }
+
+            async def _trigger_one(actor_idx: int, actor_url: str) -> str | None:
+                """Trigger a single actor. Returns an error or None."""
                 async with _sem:
                     actor_label = actor_url.split("/")[-2] or actor_url
 
                     # 1. Check for cancellation.
-                    if _cancel.is_set():
-                        return 0, None
+                    if _cancel.is_set() or actor_url in already_triggered:
+                        return None
                     try:
                         check_run_cancelled(collection_run_id)
                     except RunCancelledError:
@@ -379,7 +436,7 @@ def instagram_collect_actors(
                             _total_actors,
                         )
                         _cancel.set()
-                        return 0, None
+                        return None
 
                     # 2. Per-actor coverage check (sync DB).
                     #    - latest > user end date  → skip (beyond requested range)
@@ -410,34 +467,18 @@ def instagram_collect_actors(
                                 actor_label,
                                 latest,
                             )
-                            return 0, None
+                            return None
                         if latest is not None:
                             # Re-collect from the last covered day (partial)
                             effective_date_from = latest.isoformat()
 
-                    # 3. Create a dedicated collector for this actor.
+                    # 3. Trigger the snapshot and register it for the poller.
                     actor_collector = InstagramCollector(
                         credential_pool=credential_pool
                     )
-                    actor_collector.configure_batch_persistence(
-                        sink=sink, batch_size=100,
-                        collection_run_id=collection_run_id,
-                    )
-
-                    logger.info(
-                        "instagram: [%d/%d] %s — collecting with dates=%s..%s "
-                        "max_results=%s tier=%s",
-                        actor_idx,
-                        _total_actors,
-                        actor_label,
-                        effective_date_from,
-                        effective_date_to,
-                        max_results,
-                        tier,
-                    )
                     try:
-                        await actor_collector.collect_by_actors(
-                            [actor_url],
+                        snapshot_id, credential_id = await actor_collector.trigger_actor_snapshot(
+                            actor_url,
                             tier_enum,
                             date_from=effective_date_from,
                             date_to=effective_date_to,
@@ -458,95 +499,79 @@ def instagram_collect_actors(
                             actor_label,
                             exc,
                         )
-                        return 0, f"{actor_label}: {exc}"
-
-                    # 4. Read stats from this actor's own collector.
-                    stats = actor_collector.batch_stats
-                    actor_count = stats["inserted"]
-                    logger.info(
-                        "instagram: [%d/%d] %s — batch_stats=%s "
-                        "bd_errors=%d",
-                        actor_idx,
-                        _total_actors,
-                        actor_label,
-                        stats,
-                        len(actor_collector.brightdata_errors),
-                    )
-                    _total += actor_count
+                        return f"{actor_label}: {exc}"
 
-                    # 5. Record per-actor coverage (sync DB).
-                    if date_from and date_to:
-                        record_collection_attempts_batch(
+                    await store.register(
+                        SnapshotJob(
+                            snapshot_id=snapshot_id,
                             platform=_PLATFORM,
+                            task=_PLATFORM,
+                            kind=POSTS,
                             collection_run_id=collection_run_id,
                             query_design_id=query_design_id,
                             inputs=[actor_url],
-                            input_type="actor",
                             date_from=effective_date_from,
                             date_to=effective_date_to,
-                            records_returned=actor_count,
-                            per_input_counts={actor_url: actor_count},
+                            max_results=max_results,
+                            credential_id=credential_id,
                         )
-
-                    # 6. Track BD errors / clear recovered URLs.
-                    bd_errors = actor_collector.brightdata_errors
-                    actor_bd_errors = [
-                        e for e in bd_errors if e.get("url") == actor_url
-                    ]
-                    if actor_bd_errors:
-                        record_url_errors(_PLATFORM, actor_bd_errors)
-                    else:
-                        clear_url_errors(_PLATFORM, [actor_url])
-
-                    # 7. SSE progress update.
+                    )
                     logger.info(
-                        "instagram: [%d/%d] %s — %d records",
+                        "instagram: [%d/%d] %s — snapshot=%s triggered "
+                        "(dates=%s..%s max_results=%s tier=%s)",
                         actor_idx,
                         _total_actors,
                         actor_label,
-                        actor_count,
-                    )
-                    publish_task_update(
-                        redis_url=_redis_url,
-                        run_id=collection_run_id,
-                        arena=_ARENA,
-                        platform=_PLATFORM,
-                        status="running",
-                        records_collected=_total,
-                        error_message=None,
-                        elapsed_seconds=elapsed_since(_task_start),
+                        snapshot_id,
+                        effective_date_from,
+                        effective_date_to,
+                        max_results,
+                        tier,
                     )
-                    return actor_count, None
-
-            # Launch all actors; semaphore gates concurrency to 6.
-            tasks = [
-                _collect_one(idx, url)
-                for idx, url in enumerate(normalized_actor_ids, 1)
-            ]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            # Aggregate results — re-raise fatal exceptions.
-            for r in results:
-                if isinstance(
-                    r,
-                    NoCredentialAvailableError
-                    | ArenaRateLimitError
-                    | NotImplementedError
-                    | ArenaAuthError,
-                ):
-                    raise r
-                if isinstance(r, Exception):
-                    _errors.append(str(r))
-                    continue
-                if isinstance(r, tuple):
-                    _count, _err = r
-                    if _err:
-                        _errors.append(_err)
-
-            return _total, _errors
+                    return None
+
+            try:
+                # Launch all actors; semaphore gates concurrency to 6.
+                results = await asyncio.gather(
+                    *(
+                        _trigger_one(idx, url)
+                        for idx, url in enumerate(normalized_actor_ids, 1)
+                    ),
+                    return_exceptions=True,
+                )
+
+                # A rate-limited attempt leaves the task open: the retry
+                # triggers the remaining actors and closes it.
+                for r in results:
+                    if isinstance(r, ArenaRateLimitError):
+                        raise r
+                await store.end_task(collection_run_id, _PLATFORM)
+
+                # Aggregate results — re-raise fatal exceptions.
+                for r in results:
+                    if isinstance(
+                        r,
+                        NoCredentialAvailableError
+                        | NotImplementedError
+                        | ArenaAuthError,
+                    ):
+                        raise r
+                    if isinstance(r, Exception):
+                        _errors.append(str(r))
+                    elif r:
+                        _errors.append(r)
+
+                settled = await store.settle(collection_run_id, _PLATFORM)
+                pending = 0
+                if settled is None:
+                    jobs = await store.for_run(collection_run_id, _PLATFORM)
+                    pending = sum(1 for job in jobs if not job.terminal)
+                return _errors, pending, settled
+            finally:
+                await store.aclose()
 
         try:
-            total_inserted, actor_errors = asyncio.run(_run_per_actor_loop())
+            actor_errors, pending, settled = run_async(_trigger_per_actor())
         except NoCredentialAvailableError as exc:
             msg = f"instagram: no credential available for tier={tier}: {exc}"
             logger.error(msg)
@@ -584,83 +609,46 @@ def instagram_collect_actors(
                 msg, arena=_ARENA, platform=_PLATFORM
             ) from exc
 
-        # ---------------------------------------------------------------
-        # Post-loop: finalize
-        # ---------------------------------------------------------------
-
-        # Fallback: if per-actor counters missed records, use DB count.
-        if total_inserted == 0:
-            db_count = count_run_platform_records(collection_run_id, "instagram")
-            if db_count > 0:
-                logger.info(
-                    "instagram: per-actor counter=0 but DB has %d records — using DB count",
-                    db_count,
-                )
-                total_inserted = db_count
-
-        # Link existing records from other runs to this run so that
-        # analysis includes previously collected content without
-        # re-fetching from Bright Data.
-        # Instagram stores a numeric owner_id as author_platform_id,
-        # which doesn't match the profile URLs in actor_ids.  Extract
-        # usernames and match via author_display_name instead.
-        # Instagram post URLs (/p/ID, /reel/ID) don't contain the
-        # username, so URL-prefix matching is not applicable here.
-        from issue_observatory.workers._task_helpers import (
-            reindex_existing_records,
-        )
-
-        usernames = [
-            url.rstrip("/").split("/")[-1]
-            for url in normalized_actor_ids
-            if url.rstrip("/").split("/")[-1]
-        ]
-        linked = reindex_existing_records(
-            platform=_PLATFORM,
-            collection_run_id=collection_run_id,
-            query_design_id=query_design_id,
-            author_names=usernames,
-            source_url_prefixes=None,
-            require_term_match=True,
-            date_from=date_from,
-            date_to=date_to,
-        )
-        if linked:
-            logger.info(
-                "instagram: reindexed %d existing records for run=%s",
-                linked,
+        if settled is not None:
+            # Nothing left to wait for (all actors skipped or failed to trigger).
+            context, jobs = settled
+            return finalize_snapshot_task(
+                _PLATFORM,
+                _PLATFORM,
+                context,
+                jobs,
                 collection_run_id,
+                query_design_id,
+                reindex=_reindex_actor_records,
+                trigger_errors=actor_errors,
             )
 
         error_summary = (
             f" ({len(actor_errors)} actor errors)" if actor_errors else ""
         )
         logger.info(
-            "instagram: collect_by_actors completed — run=%s inserted=%d linked=%d%s",
+            "instagram: collect_by_actors triggered — run=%s snapshots_pending=%d%s",
             collection_run_id,
-            total_inserted,
-            linked,
+            pending,
             error_summary,
         )
-        _update_task_status(
-            collection_run_id, _PLATFORM, "completed", records_collected=total_inserted
-        )
         publish_task_update(
             redis_url=_redis_url,
             run_id=collection_run_id,
             arena=_ARENA,
             platform=_PLATFORM,
-            status="completed",
-            records_collected=total_inserted,
+            status="running",
+            records_collected=0,
             error_message=None,
             elapsed_seconds=elapsed_since(_task_start),
         )
         return {
-            "records_collected": total_inserted,
-            "status": "completed",
+            "records_collected": 0,
+            "status": "running",
             "arena": _ARENA,
             "platform": _PLATFORM,
             "tier": tier,
+            "snapshots_pending": pending,
         }
     except Exception as exc:
         msg = (
@@ -672,6 +660,10 @@ def instagram_collect_actors(
         # Salvage: per-actor persistence means most records are already saved.
         salvaged_count = 0
         try:
+            from issue_observatory.workers._task_helpers import (
+                count_run_platform_records,
+            )
+
             salvaged_count = count_run_platform_records(collection_run_id, "instagram")
         except Exception:
             logger.warning("instagram: failed to count salvaged records", exc_info=True)
@@ -715,31 +707,30 @@ def instagram_collect_comments(
 ) -> dict[str, Any]:
     """Collect comments for Instagram posts via Bright Data.
 
-    Wraps :meth:`InstagramCollector.collect_comments` as a Celery task.
     Each entry in *post_ids* must be a dict with a ``url`` key pointing to
-    an Instagram post URL. Comments are collected in a single Bright Data
-    trigger/poll/download cycle.
+    an Instagram post URL. Posts are triggered in batches via
+    :meth:`InstagramCollector.trigger_comment_snapshots`;
+    :func:`instagram_ingest_snapshot` downloads each batch once it is ready.
 
     Args:
         query_design_id: UUID string of the owning query design.
         collection_run_id: UUID string of the owning collection run.
         post_ids: List of dicts with ``url`` key (Instagram post URLs).
         tier: Tier string — ``"medium"`` (Bright Data, default).
-        max_comments_per_post: Maximum comments to request per post.
+        max_comments_per_post: Unused — the comments scraper has no per-post cap.
         depth: Unused — Bright Data returns a flat comment list.
         **_extra: Extra keyword arguments from the orchestration layer.
             Silently ignored.
 
     Returns:
-        Dict with ``records_collected``, ``status``, ``arena``, ``platform``, ``tier``.
+        Dict with ``records_collected``, ``status``, ``arena``, ``platform``,
+        ``tier`` — ``status`` is ``"running"`` while snapshots are outstanding.
 
     Raises:
         ArenaRateLimitError: Triggers automatic retry (max 2, backoff ≤ 900s).
         ArenaCollectionError: Marks the task as FAILED.
         NoCredentialAvailableError: Marks the task as FAILED immediately.
     """
-    from issue_observatory.arenas.base import Tier
-
     _settings = get_settings()
     _redis_url = _settings.redis_url
     _task_start = time.monotonic()
@@ -764,85 +755,83 @@ def instagram_collect_comments(
             elapsed_seconds=elapsed_since(_task_start),
         )
 
-        from issue_observatory.workers._task_helpers import (
-            make_batch_sink,
-            persist_collected_records,
-            record_collection_attempts_batch,
-        )
-
         credential_pool = CredentialPool()
         collector = InstagramCollector(credential_pool=credential_pool)
-        tier_enum = Tier(tier)
+        store = SnapshotStore(_redis_url)
 
-        sink = make_batch_sink(
-            collection_run_id, query_design_id, actor_sourced=True,
-        )
-        collector.configure_batch_persistence(
-            sink=sink, batch_size=100, collection_run_id=collection_run_id
-        )
+        async def _trigger_comments() -> tuple[
+            int, tuple[dict[str, Any], list[SnapshotJob]] | None
+        ]:
+            """Trigger and register comment snapshots.
 
-        remaining = asyncio.run(
-            collector.collect_comments(
-                post_ids=post_ids,
-                tier=tier_enum,
-                max_comments_per_post=max_comments_per_post,
-                depth=depth,
-            )
-        )
-
-        # Most records already persisted incrementally via the batch sink.
-        # Persist any remaining un-flushed records as a fallback.
-        fallback_inserted, fallback_skipped = 0, 0
-        if remaining:
-            fallback_inserted, fallback_skipped = persist_collected_records(
-                remaining, collection_run_id, query_design_id
-            )
-        inserted = collector.batch_stats["inserted"] + fallback_inserted
-        skipped = collector.batch_stats["skipped"] + fallback_skipped
-
-        # Record comment collection attempts so posts aren't re-submitted
-        # on the next run (even if they returned 0 comments).
-        from datetime import UTC, datetime
-
-        _now_iso = datetime.now(UTC).isoformat()
-        submitted_urls = [entry["url"] for entry in post_ids if entry.get("url")]
-        if submitted_urls:
-            record_collection_attempts_batch(
-                platform=f"{_PLATFORM}_comments",
-                collection_run_id=collection_run_id,
-                query_design_id=query_design_id,
-                inputs=submitted_urls,
-                input_type="post_url",
-                date_from=_now_iso,
-                date_to=_now_iso,
-                records_returned=inserted,
+            Returns (pending_snapshots, settled).
+            """
+            try:
+                await store.begin_task(
+                    collection_run_id, _arena_label, {"tier": tier, "posts": len(post_ids)}
+                )
+                # A retried task keeps the snapshots its earlier attempts triggered.
+                already_triggered = {
+                    url
+                    for job in await store.for_run(collection_run_id, _arena_label)
+                    for url in job.inputs
+                }
+                remaining_posts = [
+                    entry for entry in post_ids
+                    if entry.get("url") and entry["url"] not in already_triggered
+                ]
+                try:
+                    async for snapshot_id, urls, credential_id in (
+                        collector.trigger_comment_snapshots(remaining_posts)
+                    ):
+                        await store.register(
+                            SnapshotJob(
+                                snapshot_id=snapshot_id,
+                                platform=_PLATFORM,
+                                task=_arena_label,
+                                kind=COMMENTS,
+                                collection_run_id=collection_run_id,
+                                query_design_id=query_design_id,
+                                inputs=urls,
+                                credential_id=credential_id,
+                            )
+                        )
+                except ArenaRateLimitError:
+                    # Left open: the retry triggers the remaining posts.
+                    raise
+                except Exception:
+                    await store.end_task(collection_run_id, _arena_label)
+                    raise
+                await store.end_task(collection_run_id, _arena_label)
+
+                settled = await store.settle(collection_run_id, _arena_label)
+                pending = 0
+                if settled is None:
+                    jobs = await store.for_run(collection_run_id, _arena_label)
+                    pending = sum(1 for job in jobs if not job.terminal)
+                return pending, settled
+            finally:
+                await store.aclose()
+
+        pending, settled = run_async(_trigger_comments())
+        if settled is not None:
+            context, jobs = settled
+            return finalize_snapshot_task(
+                _PLATFORM, _arena_label, context, jobs, collection_run_id, query_design_id
             )
 
         logger.info(
-            "instagram: collect_comments completed — run=%s inserted=%d skipped=%d",
+            "instagram: collect_comments triggered — run=%s snapshots_pending=%d",
             collection_run_id,
-            inserted,
-            skipped,
-        )
-        _update_task_status(
-            collection_run_id, _arena_label, "completed", records_collected=inserted
-        )
-        publish_task_update(
-            redis_url=_redis_url,
-            run_id=collection_run_id,
-            arena=_ARENA,
-            platform=_arena_label,
-            status="completed",
-            records_collected=inserted,
-            error_message=None,
-            elapsed_seconds=elapsed_since(_task_start),
+            pending,
         )
         return {
-            "records_collected": inserted,
-            "status": "completed",
+            "records_collected": 0,
+            "status": "running",
             "arena": _ARENA,
             "platform": _arena_label,
             "tier": tier,
+            "snapshots_pending": pending,
         }
     except NoCredentialAvailableError as exc:
         msg = f"instagram: no credential available for comments tier={tier}: {exc}"
@@ -889,6 +878,40 @@ def instagram_collect_comments(
         raise
 
 
+@celery_app.task(
+    name="issue_observatory.arenas.instagram.tasks.ingest_snapshot",
+    bind=True,
+    max_retries=0,
+    acks_late=True,
+)
+def instagram_ingest_snapshot(
+    self: Any,
+    snapshot_id: str,
+    collection_run_id: str,
+) -> dict[str, Any]:
+    """Download a ready Instagram snapshot and settle its collection task.
+
+    Dispatched by the ``advance_brightdata_snapshots`` beat task for every
+    snapshot that became ready (now ``downloading``) or failed.  Ready
+    snapshots are streamed into the batch sink; afterwards the task that
+    triggered the snapshot is completed if this was its last open snapshot.
+
+    Args:
+        snapshot_id: Bright Data snapshot ID.
+        collection_run_id: UUID string of the owning collection run.
+
+    Returns:
+        Dict with ``snapshot_id``, ``state``, ``records_collected`` and ``task``.
+    """
+    return ingest_snapshot(
+        _PLATFORM,
+        snapshot_id,
+        collection_run_id,
+        make_collector=lambda: InstagramCollector(credential_pool=CredentialPool()),
+        reindex=_reindex_actor_records,
+    )
+
+
 @celery_app.task(
     name="issue_observatory.arenas.instagram.tasks.health_check",
     bind=False,
@@ -905,6 +928,6 @@ def instagram_health_check() -> dict[str, Any]:
     """
     credential_pool = CredentialPool()
     collector = InstagramCollector(credential_pool=credential_pool)
-    result: dict[str, Any] = asyncio.run(collector.health_check())
+    result: dict[str, Any] = run_async(collector.health_check())
     logger.info("instagram: health_check status=%s", result.get("status", "unknown"))
     return result
@@ -64,6 +64,7 @@ from issue_observatory.core.exceptions import (
     NoCredentialAvailableError,
 )
 from issue_observatory.core.normalizer import Normalizer
+from issue_observatory.workers.runtime import shared_http_transport
 
 logger = logging.getLogger(__name__)
 
@@ -97,6 +98,7 @@ class MajesticCollector(ArenaCollector):
     platform_name: str = "majestic"
     supported_tiers: list[Tier] = [Tier.PREMIUM]
     temporal_mode: TemporalMode = TemporalMode.RECENT
+    supports_coverage_check: bool = True
 
     def __init__(
         self,
@@ -513,6 +515,7 @@ class MajesticCollector(ArenaCollector):
             headers={
                 "User-Agent": "IssueObservatory/1.0 (majestic-collector; research use)"
             },
+            transport=shared_http_transport(),
         )
 
     async def _rate_limit_wait(self, credential_id: str) -> None:
@@ -23,7 +23,6 @@ Note on tier strings:
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import time
 from typing import Any
@@ -38,6 +37,7 @@ from issue_observatory.core.exceptions import (
     NoCredentialAvailableError,
 )
 from issue_observatory.workers.celery_app import celery_app
+from issue_observatory.workers.runtime import run_async
 
 logger = logging.getLogger(__name__)
 
@@ -224,6 +224,7 @@ def majestic_collect_terms(
             date_from=_dt.fromisoformat(date_from) if isinstance(date_from, str) else date_from,
             date_to=_dt.fromisoformat(date_to) if isinstance(date_to, str) else date_to,
             terms=terms,
+            planned_gaps=_extra.get("coverage_gaps"),
         )
         if not gaps:
             logger.info(
@@ -275,7 +276,7 @@ def majestic_collect_terms(
         )
 
     try:
-        remaining = asyncio.run(
+        remaining = run_async(
             collector.collect_by_terms(
                 terms=terms,
                 tier=tier_enum,
@@ -492,6 +493,7 @@ def majestic_collect_actors(
             date_from=_dt.fromisoformat(date_from),
             date_to=_dt.fromisoformat(date_to),
             actor_ids=actor_ids,
+            planned_gaps=_extra.get("coverage_gaps"),
         )
         if not gaps:
             logger.info(
@@ -522,7 +524,7 @@ def majestic_collect_actors(
         effective_date_to = gaps[-1][1].isoformat()
 
     try:
-        remaining = asyncio.run(
+        remaining = run_async(
             collector.collect_by_actors(
                 actor_ids=actor_ids,
                 tier=tier_enum,
@@ -646,7 +648,7 @@ def majestic_health_check() -> dict[str, Any]:
     """
     credential_pool = CredentialPool()
     collector = MajesticCollector(credential_pool=credential_pool)
-    result: dict[str, Any] = asyncio.run(collector.health_check())
+    result: dict[str, Any] = run_async(collector.health_check())
     logger.info(
         "majestic: health_check status=%s trust_flow=%s",
         result.get("status", "unknown"),
@@ -33,11 +33,12 @@ from __future__ import annotations
 
 import re
 from collections import OrderedDict
-from functools import lru_cache
 from typing import Any
 
 import structlog
 
+from issue_observatory.core.term_matcher import get_term_matcher, word_boundary_pattern
+
 logger = structlog.get_logger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -300,7 +301,6 @@ def has_boolean_groups(term_specs: list[TermSpec]) -> bool:
 # ---------------------------------------------------------------------------
 
 
-@lru_cache(maxsize=512)
 def _term_pattern(term: str) -> re.Pattern[str]:
     """Compile a word-boundary regex for a single lowercased term.
 
@@ -313,18 +313,11 @@ def _term_pattern(term: str) -> re.Pattern[str]:
     allowing the term to appear at the start of compound words. Very short terms
     (≤2 characters) use strict boundaries on both sides to avoid false positives.
 
-    The pattern is cached for the lifetime of the process.
+    The pattern is cached for the lifetime of the process.  The rule itself
+    is :func:`~issue_observatory.core.term_matcher.word_boundary_pattern`,
+    shared with the multi-term matcher used by :func:`match_groups_in_text`.
     """
-    escaped = re.escape(term)
-    # Replace escaped whitespace with flexible whitespace matcher
-    escaped = re.sub(r"\\ ", r"\\s+", escaped)
-
-    # For terms longer than 2 chars, use left boundary only (Danish compound support)
-    # For very short terms, use strict boundaries to avoid false positives
-    if len(term) > 2:
-        return re.compile(rf"\b{escaped}", re.IGNORECASE)
-    else:
-        return re.compile(rf"\b{escaped}\b", re.IGNORECASE)
+    return word_boundary_pattern(term)
 
 
 def term_in_text(term: str, text: str) -> bool:
@@ -347,6 +340,14 @@ def term_in_text(term: str, text: str) -> bool:
     return bool(_term_pattern(term.lower()).search(text))
 
 
+def _found_group_terms(lower_groups: list[list[str]], text: str) -> set[str]:
+    """Return the terms of *lower_groups* that :func:`term_in_text` would match."""
+    terms = tuple(t for grp in lower_groups for t in grp)
+    if not terms:
+        return set()
+    return set(get_term_matcher(terms, word_boundary=True).match(text))
+
+
 def match_groups_in_text(
     lower_groups: list[list[str]],
     text: str,
@@ -365,10 +366,15 @@ def match_groups_in_text(
     Returns:
         A flat list of all matched terms (from all matching groups).
         Empty list if no group matched.
+
+    All terms of all groups are located in a single pass over ``text`` by a
+    word-boundary :class:`~issue_observatory.core.term_matcher.TermMatcher`
+    cached per group structure.
     """
+    found = _found_group_terms(lower_groups, text)
     matched: list[str] = []
     for grp in lower_groups:
-        if all(term_in_text(t, text) for t in grp):
+        if all(t in found for t in grp):
             matched.extend(grp)
     return matched
 
@@ -389,7 +395,8 @@ def any_group_matches_text(
     Returns:
         ``True`` if any group fully matches.
     """
-    return any(all(term_in_text(t, text) for t in grp) for grp in lower_groups)
+    found = _found_group_terms(lower_groups, text)
+    return any(all(t in found for t in grp) for grp in lower_groups)
 
 
 # ---------------------------------------------------------------------------
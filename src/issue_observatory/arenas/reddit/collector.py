@@ -100,6 +100,7 @@ class RedditCollector(ArenaCollector):
     temporal_mode: TemporalMode = TemporalMode.RECENT
     source_list_config_key: str | None = "custom_subreddits"
     supports_actor_collection: bool = True
+    supports_coverage_check: bool = True
 
     def __init__(
         self,
@@ -30,7 +30,6 @@ PRAW instance ownership:
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import time
 from typing import Any
@@ -45,6 +44,7 @@ from issue_observatory.core.exceptions import (
     NoCredentialAvailableError,
 )
 from issue_observatory.workers.celery_app import celery_app
+from issue_observatory.workers.runtime import run_async
 
 logger = logging.getLogger(__name__)
 
@@ -300,6 +300,7 @@ def reddit_collect_terms(
             date_from=_dt.fromisoformat(date_from) if isinstance(date_from, str) else date_from,
             date_to=_dt.fromisoformat(date_to) if isinstance(date_to, str) else date_to,
             terms=terms,
+            planned_gaps=_extra.get("coverage_gaps"),
         )
         if not gaps:
             logger.info(
@@ -348,7 +349,7 @@ def reddit_collect_terms(
         )
 
     try:
-        remaining = asyncio.run(
+        remaining = run_async(
             collector.collect_by_terms(
                 terms=terms,
                 tier=tier_enum,
@@ -581,6 +582,7 @@ def reddit_collect_actors(
             date_from=_dt.fromisoformat(date_from) if isinstance(date_from, str) else date_from,
             date_to=_dt.fromisoformat(date_to) if isinstance(date_to, str) else date_to,
             actor_ids=actor_ids,
+            planned_gaps=_extra.get("coverage_gaps"),
         )
         if not gaps:
             logger.info(
@@ -630,7 +632,7 @@ def reddit_collect_actors(
         )
 
     try:
-        remaining = asyncio.run(
+        remaining = run_async(
             collector.collect_by_actors(
                 actor_ids=actor_ids,
                 tier=tier_enum,
@@ -774,7 +776,7 @@ def reddit_health_check() -> dict[str, Any]:
     """
     credential_pool = CredentialPool()
     collector = RedditCollector(credential_pool=credential_pool)
-    result: dict[str, Any] = asyncio.run(collector.health_check())
+    result: dict[str, Any] = run_async(collector.health_check())
     logger.info(
         "reddit: health_check status=%s", result.get("status", "unknown")
     )
@@ -888,7 +890,7 @@ def reddit_collect_comments(
     )
 
     try:
-        remaining = asyncio.run(
+        remaining = run_async(
             collector.collect_comments(
                 post_ids=post_ids,
                 tier=tier_enum,
@@ -48,6 +48,7 @@ from issue_observatory.core.exceptions import (
     ArenaRateLimitError,
 )
 from issue_observatory.core.normalizer import Normalizer
+from issue_observatory.workers.runtime import shared_http_transport
 
 logger = logging.getLogger(__name__)
 
@@ -441,7 +442,7 @@ class RitzauViaCollector(ArenaCollector):
         """Return an ``httpx.AsyncClient`` for use as a context manager."""
         if self._http_client is not None:
             return self._http_client  # type: ignore[return-value]
-        return httpx.AsyncClient(timeout=30.0)
+        return httpx.AsyncClient(timeout=30.0, transport=shared_http_transport())
 
     def _match_search_terms(
         self, item: dict[str, Any], search_terms: list[str]
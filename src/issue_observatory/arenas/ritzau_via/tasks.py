@@ -13,7 +13,6 @@ NoCredentialAvailableError should never occur for this arena.
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import time
 from typing import Any
@@ -26,6 +25,7 @@ from issue_observatory.core.exceptions import (
     ArenaRateLimitError,
 )
 from issue_observatory.workers.celery_app import celery_app
+from issue_observatory.workers.runtime import run_async
 
 logger = logging.getLogger(__name__)
 
@@ -171,7 +171,7 @@ def ritzau_via_collect_terms(
     collector.configure_batch_persistence(sink=sink, batch_size=100, collection_run_id=collection_run_id)
 
     try:
-        remaining = asyncio.run(
+        remaining = run_async(
             collector.collect_by_terms(
                 terms=terms,
                 tier=Tier.FREE,
@@ -326,7 +326,7 @@ def ritzau_via_collect_actors(
     collector.configure_batch_persistence(sink=sink, batch_size=100, collection_run_id=collection_run_id)
 
     try:
-        remaining = asyncio.run(
+        remaining = run_async(
             collector.collect_by_actors(
                 actor_ids=actor_ids,
                 tier=Tier.FREE,
@@ -421,6 +421,6 @@ def ritzau_via_health_check() -> dict[str, Any]:
         ``checked_at``, and optionally ``detail``.
     """
     collector = RitzauViaCollector()
-    result: dict[str, Any] = asyncio.run(collector.health_check())
+    result: dict[str, Any] = run_async(collector.health_check())
     logger.info("ritzau_via: health_check status=%s", result.get("status", "unknown"))
     return result
@@ -19,12 +19,20 @@ delay between requests to the same hostname.
 
 Conditional GET (``If-Modified-Since`` / ``If-None-Match``) is implemented
 to avoid re-processing feeds that have not changed since the last fetch.
+With a :class:`~.feed_state.FeedStateStore` the validators, the last body
+hash and the IDs of entries already evaluated persist in Redis across tasks
+and workers: feeds answering ``304`` or serving an unchanged body are not
+parsed, and entries already seen by the same query are not emitted again.
+Only entries inside a run's date window count as seen; a feed with entries
+newer than ``date_to`` is fetched in full on the next run (see
+:meth:`RSSFeedsCollector._in_date_window`).
 """
 
 from __future__ import annotations
 
 import asyncio
 import calendar
+import hashlib
 import logging
 import re
 from datetime import UTC, datetime
@@ -44,10 +52,17 @@ from issue_observatory.arenas.rss_feeds.config import (
     RSS_TIERS,
     outlet_slug_from_key,
 )
+from issue_observatory.arenas.rss_feeds.feed_state import (
+    FETCH_OUTCOMES,
+    FeedState,
+    FeedStateStore,
+    query_digest,
+)
 from issue_observatory.config.danish_defaults import DANISH_RSS_FEEDS
 from issue_observatory.config.tiers import TierConfig
 from issue_observatory.core.exceptions import ArenaCollectionError
 from issue_observatory.core.normalizer import Normalizer
+from issue_observatory.workers.runtime import shared_http_transport
 
 logger = logging.getLogger(__name__)
 
@@ -97,6 +112,9 @@ class RSSFeedsCollector(ArenaCollector):
             per collection call.
         feed_overrides: Optional dict overriding the default feed registry
             (``DANISH_RSS_FEEDS``).  Useful for testing with mock feeds.
+        feed_state_store: Optional persistent conditional-GET state store.
+            If ``None``, validators are only kept for the lifetime of this
+            collector instance.
     """
 
     arena_name: str = "news"
@@ -116,13 +134,17 @@ class RSSFeedsCollector(ArenaCollector):
         rate_limiter: Any = None,
         http_client: httpx.AsyncClient | None = None,
         feed_overrides: dict[str, str] | None = None,
+        feed_state_store: FeedStateStore | None = None,
     ) -> None:
         super().__init__(credential_pool=credential_pool, rate_limiter=rate_limiter)
         self._http_client = http_client
         self._normalizer = Normalizer()
         self._feeds: dict[str, str] = feed_overrides if feed_overrides is not None else DANISH_RSS_FEEDS
-        # Cache: feed_key -> {"etag": str, "last_modified": str}
-        self._feed_cache: dict[str, dict[str, str]] = {}
+        self._feed_state_store = feed_state_store
+        # Conditional-GET state: feed_url -> FeedState
+        self._feed_states: dict[str, FeedState] = {}
+        # Outcomes of the current collection: feed_url -> (feed_key, outcome)
+        self._fetch_outcomes: dict[str, tuple[str, str]] = {}
 
     # ------------------------------------------------------------------
     # ArenaCollector abstract method implementations
@@ -200,6 +222,9 @@ class RSSFeedsCollector(ArenaCollector):
             lower_terms[:5],  # Log first 5 terms to avoid clutter
         )
 
+        query = query_digest(lower_groups)
+        await self._load_feed_states(query, effective_feeds)
+
         async with self._build_http_client() as client:
             raw_entries = await self._fetch_feeds(client, effective_feeds)
 
@@ -232,10 +257,9 @@ class RSSFeedsCollector(ArenaCollector):
 
             entries_checked += 1
 
-            pub_dt = _entry_datetime(entry)
-            if date_from_dt and pub_dt and pub_dt < date_from_dt:
-                continue
-            if date_to_dt and pub_dt and pub_dt > date_to_dt:
+            if not self._in_date_window(
+                effective_feeds[feed_key], entry, date_from_dt, date_to_dt
+            ):
                 continue
 
             entries_after_date_filter += 1
@@ -289,6 +313,7 @@ class RSSFeedsCollector(ArenaCollector):
                     summary_preview,
                 )
         self._flush()
+        await self._save_feed_states(query, complete=self._total_emitted < effective_max)
         return list(self._batch_buffer)
 
     async def collect_by_actors(
@@ -349,6 +374,9 @@ class RSSFeedsCollector(ArenaCollector):
 
         self._reset_batch_state()
 
+        query = query_digest(list(actor_ids))
+        await self._load_feed_states(query, target_feeds)
+
         async with self._build_http_client() as client:
             raw_entries = await self._fetch_feeds(client, target_feeds)
 
@@ -356,10 +384,9 @@ class RSSFeedsCollector(ArenaCollector):
             if self._total_emitted >= effective_max:
                 break
 
-            pub_dt = _entry_datetime(entry)
-            if date_from_dt and pub_dt and pub_dt < date_from_dt:
-                continue
-            if date_to_dt and pub_dt and pub_dt > date_to_dt:
+            if not self._in_date_window(
+                target_feeds[feed_key], entry, date_from_dt, date_to_dt
+            ):
                 continue
 
             record = self._normalize_entry(
@@ -377,6 +404,7 @@ class RSSFeedsCollector(ArenaCollector):
             len(target_feeds),
         )
         self._flush()
+        await self._save_feed_states(query, complete=self._total_emitted < effective_max)
         return list(self._batch_buffer)
 
     def get_tier_config(self, tier: Tier) -> TierConfig:
@@ -483,7 +511,51 @@ class RSSFeedsCollector(ArenaCollector):
         return httpx.AsyncClient(
             timeout=30.0,
             headers={"User-Agent": "IssueObservatory/1.0 (rss-collector; +https://github.com/issue-observatory)"},
+            transport=shared_http_transport(),
+        )
+
+    async def _load_feed_states(self, query: str, feeds: dict[str, str]) -> None:
+        """Load persisted conditional-GET state for *feeds* and reset outcomes.
+
+        Args:
+            query: Digest of the collection query (see ``query_digest``).
+            feeds: Dict of ``{feed_key: feed_url}`` about to be fetched.
+        """
+        self._fetch_outcomes = {}
+        if self._feed_state_store is not None:
+            stored = await self._feed_state_store.load(query, list(feeds.values()))
+            self._feed_states.update(stored)
+
+    async def _save_feed_states(self, query: str, complete: bool) -> None:
+        """Log per-feed fetch outcomes and persist conditional-GET state.
+
+        Args:
+            query: Digest of the collection query.
+            complete: ``False`` when collection stopped early (``max_results``
+                reached).  State is then not persisted, so unprocessed
+                entries are fetched and evaluated again next time.
+        """
+        counts = dict.fromkeys(FETCH_OUTCOMES, 0)
+        for _feed_key, outcome in self._fetch_outcomes.values():
+            counts[outcome] += 1
+        logger.info(
+            "rss_feeds: conditional GET — %d modified, %d not modified (304), "
+            "%d unchanged body, %d errors",
+            counts["modified"],
+            counts["not_modified"],
+            counts["unchanged"],
+            counts["error"],
         )
+        if self._feed_state_store is None:
+            return
+        states: dict[str, FeedState] = {}
+        if complete:
+            states = {
+                url: self._feed_states[url]
+                for url in self._fetch_outcomes
+                if url in self._feed_states
+            }
+        await self._feed_state_store.save(query, states, self._fetch_outcomes)
 
     async def _fetch_all_feeds(
         self, client: httpx.AsyncClient
@@ -558,8 +630,11 @@ class RSSFeedsCollector(ArenaCollector):
     ) -> list[tuple[str, str, Any]]:
         """Fetch and parse a single RSS/Atom feed.
 
-        Implements conditional GET using cached ETag / Last-Modified headers.
-        Returns empty list on 304 Not Modified.
+        Implements conditional GET using stored ETag / Last-Modified headers.
+        Returns an empty list without parsing on 304 Not Modified or when the
+        response body is byte-identical to the last parsed one.  Entries
+        already recorded as seen are dropped.  The outcome is recorded in
+        ``self._fetch_outcomes``.
 
         Args:
             client: Shared HTTP client.
@@ -574,18 +649,13 @@ class RSSFeedsCollector(ArenaCollector):
             ArenaCollectionError: On non-retryable HTTP errors.
         """
         outlet_slug = outlet_slug_from_key(feed_key)
+        state = self._feed_states.get(feed_url) or FeedState()
 
         async with semaphore:
-            headers: dict[str, str] = {}
-            cached = self._feed_cache.get(feed_key, {})
-            if cached.get("etag"):
-                headers["If-None-Match"] = cached["etag"]
-            if cached.get("last_modified"):
-                headers["If-Modified-Since"] = cached["last_modified"]
-
             try:
-                response = await client.get(feed_url, headers=headers)
+                response = await client.get(feed_url, headers=state.request_headers())
             except httpx.RequestError as exc:
+                self._fetch_outcomes[feed_url] = (feed_key, "error")
                 raise ArenaCollectionError(
                     f"rss_feeds: request error fetching '{feed_key}': {exc}",
                     arena="news_media",
@@ -594,6 +664,7 @@ class RSSFeedsCollector(ArenaCollector):
 
             if response.status_code == 304:
                 logger.debug("rss_feeds: '%s' — 304 Not Modified, skipping.", feed_key)
+                self._fetch_outcomes[feed_url] = (feed_key, "not_modified")
                 return []
 
             if response.status_code >= 400:
@@ -605,20 +676,28 @@ class RSSFeedsCollector(ArenaCollector):
                     response.status_code,
                     body_snippet,
                 )
+                self._fetch_outcomes[feed_url] = (feed_key, "error")
                 return []
 
-            # Update conditional-GET cache
-            new_cache: dict[str, str] = {}
-            if response.headers.get("ETag"):
-                new_cache["etag"] = response.headers["ETag"]
-            if response.headers.get("Last-Modified"):
-                new_cache["last_modified"] = response.headers["Last-Modified"]
-            if new_cache:
-                self._feed_cache[feed_key] = new_cache
+            # Update conditional-GET state
+            new_state = FeedState(
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                body_hash=hashlib.sha256(response.content).hexdigest(),
+                seen_ids=list(state.seen_ids),
+            )
+            self._feed_states[feed_url] = new_state
+
+            if new_state.body_hash == state.body_hash:
+                logger.debug("rss_feeds: '%s' — body unchanged, skipping.", feed_key)
+                self._fetch_outcomes[feed_url] = (feed_key, "unchanged")
+                return []
 
             # Small inter-outlet courtesy delay
             await asyncio.sleep(INTER_OUTLET_DELAY_SECONDS)
 
+        self._fetch_outcomes[feed_url] = (feed_key, "modified")
+
         # Parse feed (feedparser is CPU-bound but fast enough to run inline)
         try:
             feed = feedparser.parse(response.text)
@@ -641,7 +720,50 @@ class RSSFeedsCollector(ArenaCollector):
                 feed_key,
             )
 
-        return [(feed_key, outlet_slug, entry) for entry in feed.entries]
+        # Seen IDs no longer in the feed are dropped; the collection loop
+        # adds the new entries that fall inside its date window.
+        previously_seen = set(state.seen_ids)
+        entry_ids = [_entry_id(entry) for entry in feed.entries]
+        new_state.seen_ids = [eid for eid in entry_ids if eid and eid in previously_seen]
+        return [
+            (feed_key, outlet_slug, entry)
+            for entry, eid in zip(feed.entries, entry_ids, strict=True)
+            if eid is None or eid not in previously_seen
+        ]
+
+    def _in_date_window(
+        self,
+        feed_url: str,
+        entry: Any,
+        date_from: datetime | None,
+        date_to: datetime | None,
+    ) -> bool:
+        """Return whether *entry* falls inside the collection date window.
+
+        Entries inside the window are recorded as seen in the feed's state.
+        An entry newer than *date_to* is not: a later run with a wider window
+        must still evaluate it.  Its feed's validators and body hash are
+        dropped as well, so that run fetches and parses the feed in full
+        instead of stopping at ``304`` or an unchanged body.
+
+        Args:
+            feed_url: URL of the feed the entry came from.
+            entry: A feedparser entry.
+            date_from: Earliest publication date to include, if any.
+            date_to: Latest publication date to include, if any.
+        """
+        pub_dt = _entry_datetime(entry)
+        if date_from and pub_dt and pub_dt < date_from:
+            return False
+        state = self._feed_states.get(feed_url)
+        if date_to and pub_dt and pub_dt > date_to:
+            if state is not None:
+                state.etag = state.last_modified = state.body_hash = None
+            return False
+        entry_id = _entry_id(entry)
+        if state is not None and entry_id and entry_id not in state.seen_ids:
+            state.seen_ids.append(entry_id)
+        return True
 
     def _normalize_entry(
         self,
@@ -780,6 +902,11 @@ def _parse_date_bound(value: datetime | str | None) -> datetime | None:
     return None
 
 
+def _entry_id(entry: Any) -> str | None:
+    """Return the identity of a feedparser entry (``id``/guid, else ``link``)."""
+    return getattr(entry, "id", None) or getattr(entry, "link", None)
+
+
 def _entry_datetime(entry: Any) -> datetime | None:
     """Extract a timezone-aware publication datetime from a feedparser entry.
 
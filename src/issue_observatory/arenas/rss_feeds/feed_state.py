@@ -0,0 +1,209 @@
+"""Persistent conditional-GET state for the RSS Feeds arena.
+
+Each Celery task builds a fresh :class:`~.collector.RSSFeedsCollector`, so an
+in-memory ETag cache never survives to the next run.  :class:`FeedStateStore`
+keeps per-feed state in Redis instead, shared by every worker:
+
+- ``ETag`` / ``Last-Modified`` validators for ``If-None-Match`` /
+  ``If-Modified-Since`` requests.
+- A SHA-256 of the last response body, so a feed that ignores conditional
+  requests but serves identical bytes is not parsed again.
+- The IDs of entries in the last parsed body that fell inside a run's date
+  window, so only new entries are normalized and emitted.  Entries outside
+  the window stay unseen and are evaluated again by later runs.
+
+State is scoped: the same feed polled for two query designs (or for one
+design whose terms changed) must not share validators, otherwise the second
+consumer would see ``304 Not Modified`` and miss entries it has never
+evaluated.  Keys therefore combine the store scope (the query design ID),
+a digest of the query (terms or actor IDs) and a digest of the feed URL::
+
+    rss:feed_state:{scope}:{query_digest}:{url_digest}
+
+Per-feed fetch outcomes are counted in ``rss:feed_stats:{url_digest}``
+hashes; :func:`load_feed_stats` turns them into hit / 304 ratios.
+
+Redis failures never fail a collection: the collector falls back to
+unconditional fetches.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+from issue_observatory.arenas._redis_state import RedisStateStore
+
+logger = logging.getLogger(__name__)
+
+_STATE_PREFIX = "rss:feed_state"
+_STATS_PREFIX = "rss:feed_stats"
+
+STATE_TTL_SECONDS: int = 30 * 86_400
+"""Expiry of stored feed state; refreshed on every save."""
+
+MAX_SEEN_IDS: int = 500
+"""Upper bound on remembered entry IDs per feed (feeds rarely exceed 100)."""
+
+FETCH_OUTCOMES: tuple[str, ...] = ("modified", "not_modified", "unchanged", "error")
+"""Per-feed fetch outcomes counted in the stats hashes.
+
+- ``modified``: body fetched and parsed.
+- ``not_modified``: server answered ``304 Not Modified``.
+- ``unchanged``: ``200`` with a body identical to the previous one.
+- ``error``: request error or HTTP status >= 400.
+"""
+
+
+def _digest(value: str) -> str:
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()[:16]
+
+
+def query_digest(parts: list[str] | list[list[str]]) -> str:
+    """Return a stable digest of a query (term groups or actor IDs).
+
+    Args:
+        parts: Terms, term groups, or actor IDs of the collection call.
+
+    Returns:
+        A short hex digest, independent of element order.
+    """
+    normalised = sorted(
+        json.dumps(sorted(p), ensure_ascii=False) if isinstance(p, list) else json.dumps(p)
+        for p in parts
+    )
+    return _digest("\n".join(normalised))
+
+
+@dataclass
+class FeedState:
+    """Conditional-GET state of one feed for one scope.
+
+    Attributes:
+        etag: Last ``ETag`` response header.
+        last_modified: Last ``Last-Modified`` response header.
+        body_hash: SHA-256 of the last parsed response body.
+        seen_ids: IDs of entries of the last parsed body that fell inside
+            a collection date window.
+    """
+
+    etag: str | None = None
+    last_modified: str | None = None
+    body_hash: str | None = None
+    seen_ids: list[str] = field(default_factory=list)
+
+    def request_headers(self) -> dict[str, str]:
+        """Return the conditional request headers for this state."""
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class FeedStateStore(RedisStateStore):
+    """Redis-backed :class:`FeedState` storage shared across workers.
+
+    Args:
+        redis_url: Redis connection URL (``settings.redis_url``).
+        scope: Consumer scope, normally the query design ID.
+        ttl_seconds: Expiry of stored state.
+    """
+
+    log_prefix = "rss_feeds"
+
+    def __init__(
+        self,
+        redis_url: str,
+        scope: str,
+        ttl_seconds: int = STATE_TTL_SECONDS,
+    ) -> None:
+        super().__init__(redis_url, scope, ttl_seconds)
+
+    def _state_key(self, query: str, feed_url: str) -> str:
+        return f"{_STATE_PREFIX}:{self._scope}:{query}:{_digest(feed_url)}"
+
+    async def load(self, query: str, feed_urls: list[str]) -> dict[str, FeedState]:
+        """Load stored state for *feed_urls*.
+
+        Args:
+            query: Digest of the collection query (see :func:`query_digest`).
+            feed_urls: Feed URLs about to be fetched.
+
+        Returns:
+            ``{feed_url: FeedState}`` for feeds with stored state; empty when
+            Redis is unavailable.
+        """
+        return await self._load_records(
+            feed_urls, lambda url: self._state_key(query, url), FeedState, "feed state"
+        )
+
+    async def save(
+        self,
+        query: str,
+        states: dict[str, FeedState],
+        outcomes: dict[str, tuple[str, str]],
+    ) -> None:
+        """Persist feed state and count fetch outcomes in one pipeline.
+
+        Args:
+            query: Digest of the collection query.
+            states: ``{feed_url: FeedState}`` to store.
+            outcomes: ``{feed_url: (feed_key, outcome)}`` for this collection.
+        """
+        if not states and not outcomes:
+            return
+        try:
+            redis = await self._get_redis()
+            pipe = redis.pipeline(transaction=False)
+            for url, state in states.items():
+                state.seen_ids = state.seen_ids[-MAX_SEEN_IDS:]
+                pipe.set(self._state_key(query, url), json.dumps(asdict(state)), ex=self._ttl)
+            for url, (feed_key, outcome) in outcomes.items():
+                stats_key = f"{_STATS_PREFIX}:{_digest(url)}"
+                pipe.hset(stats_key, mapping={"feed_key": feed_key, "feed_url": url})
+                pipe.hincrby(stats_key, outcome, 1)
+            await pipe.execute()
+        except Exception as exc:
+            logger.warning("rss_feeds: could not save feed state: %s", exc)
+
+
+async def load_feed_stats(redis: Any) -> list[dict[str, Any]]:
+    """Return per-feed fetch outcome counts and ratios.
+
+    Args:
+        redis: An async Redis client with ``decode_responses=True``.
+
+    Returns:
+        One dict per feed with ``feed_key``, ``feed_url``, the counts in
+        :data:`FETCH_OUTCOMES`, ``requests``, ``not_modified_ratio`` (304s)
+        and ``hit_ratio`` (304s plus unchanged bodies — fetches that
+        skipped parsing), ordered by ``feed_key``.
+    """
+    feeds: list[dict[str, Any]] = []
+    async for key in redis.scan_iter(match=f"{_STATS_PREFIX}:*", count=500):
+        raw = await redis.hgetall(key)
+        counts = {outcome: int(raw.get(outcome, 0)) for outcome in FETCH_OUTCOMES}
+        requests = sum(counts.values())
+        feeds.append(
+            {
+                "feed_key": raw.get("feed_key"),
+                "feed_url": raw.get("feed_url"),
+                **counts,
+                "requests": requests,
+                "not_modified_ratio": (
+                    round(counts["not_modified"] / requests, 4) if requests else 0.0
+                ),
+                "hit_ratio": (
+                    round((counts["not_modified"] + counts["unchanged"]) / requests, 4)
+                    if requests
+                    else 0.0
+                ),
+            }
+        )
+    feeds.sort(key=lambda f: f["feed_key"] or "")
+    return feeds
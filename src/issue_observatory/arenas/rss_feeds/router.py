@@ -24,6 +24,8 @@ Endpoints:
 - ``POST /rss-feeds/collect/actors``  — collect by outlet slugs (authenticated).
 - ``GET  /rss-feeds/health``          — arena health check (authenticated).
 - ``GET  /rss-feeds/feeds``           — list configured feeds (authenticated).
+- ``GET  /rss-feeds/fetch-stats``     — per-feed conditional-GET hit / 304 ratios
+  (authenticated).
 """
 
 from __future__ import annotations
@@ -31,12 +33,14 @@ from __future__ import annotations
 import logging
 from typing import Annotated, Any
 
+import redis.asyncio as aioredis
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, Field
 
-from issue_observatory.api.dependencies import get_current_active_user
+from issue_observatory.api.dependencies import get_current_active_user, get_redis
 from issue_observatory.arenas.base import Tier
 from issue_observatory.arenas.rss_feeds.collector import RSSFeedsCollector
+from issue_observatory.arenas.rss_feeds.feed_state import load_feed_stats
 from issue_observatory.config.danish_defaults import DANISH_RSS_FEEDS
 from issue_observatory.core.exceptions import ArenaCollectionError, ArenaRateLimitError
 from issue_observatory.core.models.users import User
@@ -302,3 +306,29 @@ async def list_feeds(
         "count": len(DANISH_RSS_FEEDS),
         "feeds": DANISH_RSS_FEEDS,
     }
+
+
+@router.get(
+    "/fetch-stats",
+    summary="Per-feed conditional-GET statistics",
+    description=(
+        "Returns, for every feed polled by collection tasks, how often it was "
+        "downloaded and parsed, answered ``304 Not Modified``, served an "
+        "unchanged body, or failed — plus the resulting hit and 304 ratios."
+    ),
+)
+async def fetch_stats(
+    current_user: Annotated[User, Depends(get_current_active_user)],
+    redis: Annotated[aioredis.Redis, Depends(get_redis)],
+) -> dict[str, Any]:
+    """Return per-feed fetch outcome counts and ratios.
+
+    Args:
+        current_user: Injected active user.
+        redis: Injected async Redis client.
+
+    Returns:
+        Dict with ``count`` and ``feeds`` (list of per-feed stats dicts).
+    """
+    feeds = await load_feed_stats(redis)
+    return {"count": len(feeds), "feeds": feeds}
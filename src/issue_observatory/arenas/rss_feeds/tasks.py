@@ -17,16 +17,23 @@ Retry policy:
 
 All tasks update the ``collection_tasks`` row as best-effort (DB failures are
 logged at WARNING and do not mask collection outcomes).
+
+Collection tasks share conditional-GET state (ETag, Last-Modified, body hash,
+seen entry IDs) through a Redis-backed
+:class:`~issue_observatory.arenas.rss_feeds.feed_state.FeedStateStore`
+scoped to the query design, so unchanged feeds are neither downloaded in
+full nor parsed again on the next run.
 """
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import time
 from typing import Any
 
+from issue_observatory.arenas._redis_state import collect_then_close
 from issue_observatory.arenas.rss_feeds.collector import RSSFeedsCollector
+from issue_observatory.arenas.rss_feeds.feed_state import FeedStateStore
 from issue_observatory.config.settings import get_settings
 from issue_observatory.core.event_bus import elapsed_since, publish_task_update
 from issue_observatory.core.exceptions import (
@@ -34,6 +41,7 @@ from issue_observatory.core.exceptions import (
     ArenaRateLimitError,
 )
 from issue_observatory.workers.celery_app import celery_app
+from issue_observatory.workers.runtime import run_async
 
 logger = logging.getLogger(__name__)
 
@@ -174,7 +182,8 @@ def rss_feeds_collect_terms(
         update_collection_task_status(collection_run_id, _ARENA, "failed", error_message=msg)
         raise ArenaCollectionError(msg, arena=_ARENA, platform="rss_feeds")
 
-    collector = RSSFeedsCollector()
+    feed_state_store = FeedStateStore(_redis_url, scope=query_design_id)
+    collector = RSSFeedsCollector(feed_state_store=feed_state_store)
 
     # NOTE: RSS feeds are FORWARD_ONLY — they only return current/recent
     # entries and cannot backfill historical data.  Coverage pre-check is
@@ -190,15 +199,18 @@ def rss_feeds_collect_terms(
     collector.configure_batch_persistence(sink=sink, batch_size=100, collection_run_id=collection_run_id)
 
     try:
-        remaining = asyncio.run(
-            collector.collect_by_terms(
-                terms=terms,
-                tier=tier_enum,
-                date_from=date_from,
-                date_to=date_to,
-                max_results=max_results,
-                language_filter=language_filter,
-                extra_feed_urls=extra_feed_urls,
+        remaining = run_async(
+            collect_then_close(
+                collector.collect_by_terms(
+                    terms=terms,
+                    tier=tier_enum,
+                    date_from=date_from,
+                    date_to=date_to,
+                    max_results=max_results,
+                    language_filter=language_filter,
+                    extra_feed_urls=extra_feed_urls,
+                ),
+                feed_state_store,
             )
         )
     except ArenaRateLimitError:
@@ -368,7 +380,8 @@ def rss_feeds_collect_actors(
         if isinstance(raw_custom, list) and raw_custom:
             extra_feed_urls = [str(u) for u in raw_custom if u]
 
-    collector = RSSFeedsCollector()
+    feed_state_store = FeedStateStore(_redis_url, scope=query_design_id)
+    collector = RSSFeedsCollector(feed_state_store=feed_state_store)
 
     # NOTE: RSS feeds are FORWARD_ONLY — coverage pre-check skipped.
     # See collect_by_terms for explanation.
@@ -382,14 +395,17 @@ def rss_feeds_collect_actors(
     collector.configure_batch_persistence(sink=sink, batch_size=100, collection_run_id=collection_run_id)
 
     try:
-        remaining = asyncio.run(
-            collector.collect_by_actors(
-                actor_ids=actor_ids,
-                tier=tier_enum,
-                date_from=date_from,
-                date_to=date_to,
-                max_results=max_results,
-                extra_feed_urls=extra_feed_urls,
+        remaining = run_async(
+            collect_then_close(
+                collector.collect_by_actors(
+                    actor_ids=actor_ids,
+                    tier=tier_enum,
+                    date_from=date_from,
+                    date_to=date_to,
+                    max_results=max_results,
+                    extra_feed_urls=extra_feed_urls,
+                ),
+                feed_state_store,
             )
         )
     except ArenaRateLimitError:
@@ -485,7 +501,7 @@ def rss_feeds_health_check() -> dict[str, Any]:
         ``checked_at``, and optionally ``detail``.
     """
     collector = RSSFeedsCollector()
-    result: dict[str, Any] = asyncio.run(collector.health_check())
+    result: dict[str, Any] = run_async(collector.health_check())
     logger.info(
         "rss_feeds: health_check status=%s", result.get("status", "unknown")
     )
@@ -0,0 +1,115 @@
+"""Persistent per-channel sync state for the Telegram arena.
+
+Term collection pages each channel's history once per run and matches every
+term locally (see :meth:`~.collector.TelegramCollector.collect_by_terms`).
+:class:`ChannelStateStore` remembers, per channel, how far that history has
+been evaluated so the next run only pulls messages newer than the stored
+high-water mark (``get_messages(..., min_id=max_id)``):
+
+- ``max_id`` — ID of the newest message evaluated.
+- ``synced_from`` — ISO timestamp down to which the history below
+  ``max_id`` has been evaluated without gaps; ``None`` when it was paged to
+  the start of the channel.
+
+Like the RSS feed state, the state is scoped: messages below the high-water
+mark were only matched against the terms of the run that fetched them, so a
+changed term list must start over.  Keys combine the store scope (the query
+design ID), a digest of the term groups and the channel identifier::
+
+    telegram:channel_state:{scope}:{query_digest}:{channel}
+
+Redis failures never fail a collection: the collector falls back to paging
+each channel from ``date_to`` down to ``date_from``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass
+
+from issue_observatory.arenas._redis_state import RedisStateStore, SyncedHistory
+
+_STATE_PREFIX = "telegram:channel_state"
+
+STATE_TTL_SECONDS: int = 30 * 86_400
+"""Expiry of stored channel state; refreshed on every save."""
+
+
+def query_digest(term_groups: list[list[str]]) -> str:
+    """Return a stable digest of the term groups matched by a collection.
+
+    Args:
+        term_groups: AND-groups of terms (single terms are one-element groups).
+
+    Returns:
+        A short hex digest, independent of group and term order and case.
+    """
+    normalised = sorted(
+        json.dumps(sorted(t.lower() for t in grp), ensure_ascii=False) for grp in term_groups
+    )
+    return hashlib.sha256("\n".join(normalised).encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass
+class ChannelSyncState(SyncedHistory):
+    """Evaluated history of one channel for one scope.
+
+    Attributes:
+        max_id: ID of the newest message evaluated.
+        synced_from: ISO timestamp down to which the history below ``max_id``
+            has been evaluated, or ``None`` for the start of the channel.
+    """
+
+    max_id: int = 0
+    synced_from: str | None = None
+
+
+class ChannelStateStore(RedisStateStore):
+    """Redis-backed :class:`ChannelSyncState` storage shared across workers.
+
+    Args:
+        redis_url: Redis connection URL (``settings.redis_url``).
+        scope: Consumer scope, normally the query design ID.
+        ttl_seconds: Expiry of stored state.
+    """
+
+    log_prefix = "telegram"
+
+    def __init__(
+        self,
+        redis_url: str,
+        scope: str,
+        ttl_seconds: int = STATE_TTL_SECONDS,
+    ) -> None:
+        super().__init__(redis_url, scope, ttl_seconds)
+
+    def _state_key(self, query: str, channel: str) -> str:
+        return f"{_STATE_PREFIX}:{self._scope}:{query}:{channel}"
+
+    async def load(self, query: str, channels: list[str]) -> dict[str, ChannelSyncState]:
+        """Load stored state for *channels*.
+
+        Args:
+            query: Digest of the term groups (see :func:`query_digest`).
+            channels: Channel identifiers about to be synced.
+
+        Returns:
+            ``{channel: ChannelSyncState}`` for channels with stored state;
+            empty when Redis is unavailable.
+        """
+        return await self._load_records(
+            channels, lambda ch: self._state_key(query, ch), ChannelSyncState, "channel state"
+        )
+
+    async def save(self, query: str, channel: str, state: ChannelSyncState) -> None:
+        """Persist the state of one channel.
+
+        Args:
+            query: Digest of the term groups.
+            channel: Channel identifier.
+            state: State to store.
+        """
+        await self._save_record(
+            self._state_key(query, channel), state, f"channel state for {channel!r}"
+        )
@@ -5,10 +5,13 @@ library (free, credential-required).
 
 Two collection modes are supported:
 
-- :meth:`TelegramCollector.collect_by_terms` — searches a configured list of
-  Danish channels for each term using ``client.get_messages(channel, search=term)``.
-  Paginates via ``offset_id`` until ``date_from`` is exceeded or ``max_results``
-  is reached.
+- :meth:`TelegramCollector.collect_by_terms` — pages each configured channel's
+  history once with ``client.get_messages(channel, offset_id=...)`` and matches
+  every term locally against the fetched messages, so the number of MTProto
+  requests no longer grows with the number of terms.  With a
+  :class:`~.channel_state.ChannelStateStore` the newest evaluated message ID
+  of each channel is persisted and the next run only pulls newer messages
+  (``min_id``).
 
 - :meth:`TelegramCollector.collect_by_actors` — fetches recent messages from
   each specified channel using ``client.get_messages(channel, limit=100)`` with
@@ -47,11 +50,17 @@ from datetime import UTC, datetime
 from typing import Any
 
 from issue_observatory.arenas.base import ArenaCollector, TemporalMode, Tier
-from issue_observatory.arenas.query_builder import format_boolean_query_for_platform
+from issue_observatory.arenas.query_builder import any_group_matches_text
 from issue_observatory.arenas.registry import register
+from issue_observatory.arenas.telegram.channel_state import (
+    ChannelStateStore,
+    ChannelSyncState,
+    query_digest,
+)
 from issue_observatory.arenas.telegram.config import (
     DANISH_TELEGRAM_CHANNELS,
     MAX_MESSAGES_PER_REQUEST,
+    MAX_SYNC_MESSAGES_PER_CHANNEL,
     TELEGRAM_CHANNEL_RESOLUTION_DELAY,
     TELEGRAM_INTER_REQUEST_DELAY_MAX,
     TELEGRAM_INTER_REQUEST_DELAY_MIN,
@@ -100,6 +109,9 @@ class TelegramCollector(ArenaCollector):
         default_channels: Optional list of channel usernames to search when
             no actor_ids are provided.  Defaults to
             :data:`~config.DANISH_TELEGRAM_CHANNELS`.
+        channel_state_store: Optional persistent per-channel sync state store.
+            Without it every term collection pages each channel from
+            ``date_to`` down to ``date_from``.
     """
 
     arena_name: str = "social_media"
@@ -108,18 +120,21 @@ class TelegramCollector(ArenaCollector):
     temporal_mode: TemporalMode = TemporalMode.RECENT
     source_list_config_key: str | None = "custom_channels"
     supports_actor_collection: bool = True
+    supports_coverage_check: bool = True
 
     def __init__(
         self,
         credential_pool: Any = None,
         rate_limiter: Any = None,
         default_channels: list[str] | None = None,
+        channel_state_store: ChannelStateStore | None = None,
     ) -> None:
         super().__init__(credential_pool=credential_pool, rate_limiter=rate_limiter)
         self._normalizer = Normalizer()
         self._default_channels: list[str] = (
             default_channels if default_channels is not None else list(DANISH_TELEGRAM_CHANNELS)
         )
+        self._channel_state_store = channel_state_store
 
     # ------------------------------------------------------------------
     # ArenaCollector abstract method implementations
@@ -140,13 +155,18 @@ class TelegramCollector(ArenaCollector):
         """Collect Telegram messages matching one or more search terms.
 
         Iterates over the configured Danish channel list (plus any channels
-        in ``actor_ids`` and ``extra_channel_ids``) and searches each for the
-        supplied terms using the ``search`` parameter of ``client.get_messages()``.
+        in ``actor_ids`` and ``extra_channel_ids``), pages each channel's
+        history once and keeps the messages matching any term (word-boundary
+        matching, see :func:`~issue_observatory.arenas.query_builder.term_in_text`).
         Results are deduplicated by ``{channel_id}_{message_id}``.
 
-        Telegram does not support boolean query syntax.  When ``term_groups``
-        is provided, each AND-group is searched as a space-joined phrase (one
-        request per group).  Results from all groups are merged.
+        When ``term_groups`` is provided, a message matches when it contains
+        every term of at least one AND-group.
+
+        Channels whose stored sync state already covers ``date_from`` are
+        only read above their high-water message ID.  State is persisted per
+        channel once the channel has been paged without hitting
+        ``max_results``.
 
         Args:
             terms: Search terms (used when ``term_groups`` is ``None``).
@@ -155,8 +175,8 @@ class TelegramCollector(ArenaCollector):
             date_to: Latest message date (inclusive).
             max_results: Upper bound on total records.
             actor_ids: Additional channel usernames or numeric IDs to search.
-            term_groups: Optional boolean AND/OR groups.  Each group issues
-                a separate search with terms space-joined as a phrase.
+            term_groups: Optional boolean AND/OR groups matched locally
+                against each message.
             language_filter: Not used — Telegram channels are pre-selected
                 for Danish content.
             extra_channel_ids: Optional list of additional channel usernames or
@@ -194,16 +214,11 @@ class TelegramCollector(ArenaCollector):
         combined_extra = list(actor_ids or []) + list(extra_channel_ids or [])
         channels = _build_channel_list(self._default_channels, combined_extra or None)
 
-        # Telegram has no boolean support; for groups, search each group as a
-        # space-joined phrase (one query per group).
+        # Terms are matched locally, so single terms become one-term groups.
         if term_groups is not None:
-            effective_terms: list[str] = [
-                format_boolean_query_for_platform(groups=[grp], platform="bluesky")
-                for grp in term_groups
-                if grp
-            ]
+            lower_groups = [[t.lower() for t in grp] for grp in term_groups if grp]
         else:
-            effective_terms = list(terms)
+            lower_groups = [[t.lower()] for t in terms if t]
 
         self._reset_batch_state()
 
@@ -211,7 +226,7 @@ class TelegramCollector(ArenaCollector):
         try:
             await self._collect_terms_with_credential(
                 cred=cred,
-                terms=effective_terms,
+                term_groups=lower_groups,
                 channels=channels,
                 date_from=date_from_dt,
                 date_to=date_to_dt,
@@ -225,7 +240,7 @@ class TelegramCollector(ArenaCollector):
         logger.info(
             "telegram: collect_by_terms collected %d records for %d queries across %d channels",
             self._total_emitted,
-            len(effective_terms),
+            len(lower_groups),
             len(channels),
         )
         return list(self._batch_buffer)
@@ -514,7 +529,7 @@ class TelegramCollector(ArenaCollector):
     async def _collect_terms_with_credential(
         self,
         cred: dict[str, Any],
-        terms: list[str],
+        term_groups: list[list[str]],
         channels: list[str],
         date_from: datetime | None,
         date_to: datetime | None,
@@ -528,8 +543,8 @@ class TelegramCollector(ArenaCollector):
 
         Args:
             cred: Decrypted credential dict.
-            terms: Search terms.
-            channels: Channel usernames/IDs to search.
+            term_groups: Lowercased AND-groups of terms.
+            channels: Channel usernames/IDs to sync.
             date_from: Earliest date filter.
             date_to: Latest date filter.
             max_results: Maximum records to collect.
@@ -565,28 +580,33 @@ class TelegramCollector(ArenaCollector):
                     arena=self.arena_name,
                     platform=self.platform_name,
                 )
+            query = query_digest(term_groups)
+            states: dict[str, ChannelSyncState] = {}
+            if self._channel_state_store is not None:
+                states = await self._channel_state_store.load(query, channels)
             try:
-                for term in terms:
+                for channel_id in channels:
                     if self._total_emitted >= max_results:
                         break
-                    for channel_id in channels:
-                        if self._total_emitted >= max_results:
-                            break
-                        remaining = max_results - self._total_emitted
-                        count_before = self._total_emitted
-                        await self._search_channel_for_term(
-                            client=client,
-                            cred_id=cred_id,
-                            channel=channel_id,
-                            term=term,
-                            date_from=date_from,
-                            date_to=date_to,
-                            max_results=remaining,
-                            seen=seen,
-                        )
-                        self._record_input_count(channel_id, self._total_emitted - count_before)
-                    # Flush after each term so records persist immediately.
+                    remaining = max_results - self._total_emitted
+                    count_before = self._total_emitted
+                    new_state = await self._sync_channel_for_terms(
+                        client=client,
+                        cred_id=cred_id,
+                        channel=channel_id,
+                        term_groups=term_groups,
+                        date_from=date_from,
+                        date_to=date_to,
+                        max_results=remaining,
+                        seen=seen,
+                        state=states.get(channel_id),
+                    )
+                    self._record_input_count(channel_id, self._total_emitted - count_before)
+                    # Flush after each channel so records persist before the
+                    # channel's high-water mark moves past them.
                     self._flush()
+                    if new_state is not None and self._channel_state_store is not None:
+                        await self._channel_state_store.save(query, channel_id, new_state)
             finally:
                 await client.disconnect()
         except ArenaCollectionError:
@@ -706,101 +726,150 @@ class TelegramCollector(ArenaCollector):
                 platform=self.platform_name,
             ) from exc
 
-    async def _search_channel_for_term(
+    async def _sync_channel_for_terms(
         self,
         client: Any,
         cred_id: str,
         channel: str,
-        term: str,
+        term_groups: list[list[str]],
         date_from: datetime | None,
         date_to: datetime | None,
         max_results: int,
         seen: set[str],
-    ) -> None:
-        """Search a single channel for messages matching a term.
+        state: ChannelSyncState | None,
+    ) -> ChannelSyncState | None:
+        """Page a channel's history once and emit the messages matching any term group.
 
-        Paginates via ``offset_id`` until ``date_from`` is exceeded or
-        ``max_results`` is reached.  Records are emitted via ``self._emit()``
-        rather than returned in a list.
+        Paginates newest-first via ``offset_id`` from ``date_to``.  When
+        *state* already covers ``date_from``, only messages above its
+        ``max_id`` are requested (``min_id``); otherwise paging stops at
+        ``date_from``, at the start of the channel, or after
+        :data:`~config.MAX_SYNC_MESSAGES_PER_CHANNEL` messages.  Records are
+        emitted via ``self._emit()`` rather than returned in a list.
 
         Args:
             client: Active Telethon client.
             cred_id: Credential ID for rate-limit keying.
             channel: Channel username or numeric ID.
-            term: Search term.
+            term_groups: Lowercased AND-groups of terms.
             date_from: Earliest date boundary.
             date_to: Latest date boundary.
             max_results: Maximum records to collect from this channel.
-            seen: Mutable set of already-seen platform_ids (deduplification).
+            seen: Mutable set of already-seen platform_ids (deduplication).
+            state: Stored sync state of the channel, if any.
+
+        Returns:
+            The channel's new sync state, or ``None`` when it must not be
+            persisted (channel unresolvable, ``max_results`` reached before
+            the history was fully evaluated, or an older window than the
+            stored state was paged).
         """
         import asyncio
         import random
 
         from telethon.errors import ChannelPrivateError, PeerIdInvalidError
 
-        offset_id = 0
-        channel_emitted = 0
-
         try:
             await asyncio.sleep(TELEGRAM_CHANNEL_RESOLUTION_DELAY)
             entity = await client.get_entity(channel)
         except ChannelPrivateError:
             logger.warning("telegram: channel %r is private — skipping.", channel)
-            return
+            return None
         except PeerIdInvalidError:
             logger.warning("telegram: invalid peer ID %r — skipping.", channel)
-            return
+            return None
         except Exception as exc:
             logger.warning("telegram: could not resolve channel %r: %s — skipping.", channel, exc)
-            return
+            return None
 
-        while channel_emitted < max_results:
+        incremental = state is not None and state.covers(date_from)
+        min_id = state.max_id if incremental and state is not None else 0
+        channel_id = getattr(entity, "id", None)
+
+        offset_id = 0
+        scanned = 0
+        channel_emitted = 0
+        newest_id = 0
+        oldest_date: datetime | None = None
+        reached_date_from = False
+
+        while scanned < MAX_SYNC_MESSAGES_PER_CHANNEL:
             await self._wait_for_rate_limit(cred_id)
             await asyncio.sleep(
                 random.uniform(TELEGRAM_INTER_REQUEST_DELAY_MIN, TELEGRAM_INTER_REQUEST_DELAY_MAX)
             )
-            batch_limit = min(MAX_MESSAGES_PER_REQUEST, max_results - channel_emitted)
-
             messages = await client.get_messages(
                 entity,
-                search=term,
-                limit=batch_limit,
+                limit=MAX_MESSAGES_PER_REQUEST,
                 offset_date=date_to,
-                add_offset=0,
                 offset_id=offset_id,
+                min_id=min_id,
             )
 
             if not messages:
                 break
 
-            stop_early = False
             for msg in messages:
+                scanned += 1
+                newest_id = max(newest_id, msg.id)
+                msg_date = msg.date
+                if msg_date and msg_date.tzinfo is None:
+                    msg_date = msg_date.replace(tzinfo=UTC)
+
+                if date_from and msg_date and msg_date < date_from:
+                    reached_date_from = True
+                    break
+                oldest_date = msg_date or oldest_date
                 if not msg.message:
                     # Skip service messages with no text
                     continue
-                if date_from and msg.date and msg.date.replace(tzinfo=UTC) < date_from:
-                    stop_early = True
-                    break
-                if date_to and msg.date and msg.date.replace(tzinfo=UTC) > date_to:
+                if date_to and msg_date and msg_date > date_to:
+                    continue
+                if not any_group_matches_text(term_groups, msg.message.lower()):
                     continue
 
-                raw_dict = _message_to_dict(msg, entity)
-                pid = raw_dict.get("platform_id_raw", "")
+                pid = f"{channel_id}_{msg.id}"
                 if pid in seen:
                     continue
                 seen.add(pid)
-                self._emit(self.normalize(raw_dict))
+                self._emit(self.normalize(_message_to_dict(msg, entity)))
                 channel_emitted += 1
 
                 if channel_emitted >= max_results:
-                    break
+                    # Older messages were not evaluated; keep the old state.
+                    return None
 
-            if stop_early or len(messages) < batch_limit:
+            if reached_date_from or len(messages) < MAX_MESSAGES_PER_REQUEST:
                 break
 
-            # Advance offset_id to the ID of the last message in this batch
             offset_id = messages[-1].id
 
+        logger.debug(
+            "telegram: synced channel %r — %d messages scanned (min_id=%d), %d matched",
+            channel,
+            scanned,
+            min_id,
+            channel_emitted,
+        )
+
+        if reached_date_from:
+            synced_from = date_from.isoformat() if date_from else None
+        elif scanned >= MAX_SYNC_MESSAGES_PER_CHANNEL:
+            synced_from = oldest_date.isoformat() if oldest_date else None
+        elif incremental and state is not None:
+            # Paged down to the stored high-water mark: the histories join.
+            synced_from = state.synced_from
+        else:
+            synced_from = None
+
+        if state is not None:
+            if newest_id <= state.max_id:
+                # Nothing new, or an older window than the stored state.
+                return state if incremental else None
+        elif newest_id == 0:
+            return None
+        return ChannelSyncState(max_id=newest_id, synced_from=synced_from)
+
     async def _fetch_channel_messages(
         self,
         client: Any,
@@ -69,6 +69,14 @@ of triggering ``FloodWaitError`` during the channel discovery phase.
 MAX_MESSAGES_PER_REQUEST: int = 100
 """Maximum messages fetched per ``get_messages()`` call (Telegram server cap)."""
 
+MAX_SYNC_MESSAGES_PER_CHANNEL: int = 5_000
+"""Upper bound on messages paged from one channel in one term collection.
+
+Bounds the first sync of a channel when no ``date_from`` is given.  The
+stored sync state then starts at the oldest message reached, and later runs
+resume from the channel's high-water mark.
+"""
+
 # ---------------------------------------------------------------------------
 # Default Danish channel list
 # ---------------------------------------------------------------------------
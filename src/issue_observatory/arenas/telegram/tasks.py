@@ -20,22 +20,29 @@ Retry policy:
 
 Asyncio integration:
 - Telethon is natively async.  Celery workers use
-  ``asyncio.run()`` to execute the async collector inside the sync task
+  ``run_async()`` to execute the async collector inside the sync task
   wrapper.  This is the same pattern used by other arena tasks (Bluesky,
   Reddit, YouTube).
 
 Database updates:
 - Best-effort via ``_update_task_status()`` — DB failures are logged at
   WARNING and do not mask the collection outcome.
+
+Term collection shares per-channel sync state (the newest evaluated message
+ID) through a Redis-backed
+:class:`~issue_observatory.arenas.telegram.channel_state.ChannelStateStore`
+scoped to the query design, so each run only pulls messages posted since the
+previous one.
 """
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import time
 from typing import Any
 
+from issue_observatory.arenas._redis_state import collect_then_close
+from issue_observatory.arenas.telegram.channel_state import ChannelStateStore
 from issue_observatory.arenas.telegram.collector import TelegramCollector
 from issue_observatory.config.settings import get_settings
 from issue_observatory.core.event_bus import elapsed_since, publish_task_update
@@ -45,6 +52,7 @@ from issue_observatory.core.exceptions import (
     NoCredentialAvailableError,
 )
 from issue_observatory.workers.celery_app import celery_app
+from issue_observatory.workers.runtime import run_async
 
 logger = logging.getLogger(__name__)
 
@@ -179,9 +187,9 @@ def telegram_collect_terms(
 ) -> dict[str, Any]:
     """Collect Telegram messages matching a list of search terms.
 
-    Searches each term across the configured Danish channel list (and any
+    Pages each channel of the configured Danish channel list (and any
     additional channels in ``channel_ids`` or ``arenas_config["telegram"]["custom_channels"]``)
-    using the Telethon MTProto client.
+    once using the Telethon MTProto client and matches all terms locally.
 
     Reads ``arenas_config["telegram"]["custom_channels"]`` from the QueryDesign
     (GR-02) and merges the extra channels with the default Danish channel list.
@@ -246,7 +254,10 @@ def telegram_collect_terms(
             extra_channel_ids = [str(c) for c in raw_channels if c]
 
     credential_pool = get_credential_pool()
-    collector = TelegramCollector(credential_pool=credential_pool)
+    channel_state_store = ChannelStateStore(_redis_url, scope=query_design_id)
+    collector = TelegramCollector(
+        credential_pool=credential_pool, channel_state_store=channel_state_store
+    )
     from issue_observatory.workers._task_helpers import make_batch_sink
 
     sink = make_batch_sink(collection_run_id, query_design_id, terms)
@@ -270,6 +281,7 @@ def telegram_collect_terms(
             date_from=_dt.fromisoformat(date_from) if isinstance(date_from, str) else date_from,
             date_to=_dt.fromisoformat(date_to) if isinstance(date_to, str) else date_to,
             terms=terms,
+            planned_gaps=_extra.get("coverage_gaps"),
         )
         if not gaps:
             logger.info(
@@ -320,16 +332,19 @@ def telegram_collect_terms(
         )
 
     try:
-        remaining = asyncio.run(
-            collector.collect_by_terms(
-                terms=terms,
-                tier=Tier.FREE,
-                date_from=effective_date_from,
-                date_to=effective_date_to,
-                max_results=max_results,
-                actor_ids=channel_ids,
-                language_filter=language_filter,
-                extra_channel_ids=extra_channel_ids,
+        remaining = run_async(
+            collect_then_close(
+                collector.collect_by_terms(
+                    terms=terms,
+                    tier=Tier.FREE,
+                    date_from=effective_date_from,
+                    date_to=effective_date_to,
+                    max_results=max_results,
+                    actor_ids=channel_ids,
+                    language_filter=language_filter,
+                    extra_channel_ids=extra_channel_ids,
+                ),
+                channel_state_store,
             )
         )
     except NoCredentialAvailableError as exc:
@@ -537,6 +552,7 @@ def telegram_collect_actors(
             date_from=_dt.fromisoformat(date_from) if isinstance(date_from, str) else date_from,
             date_to=_dt.fromisoformat(date_to) if isinstance(date_to, str) else date_to,
             actor_ids=actor_ids,
+            planned_gaps=_extra.get("coverage_gaps"),
         )
         if not gaps:
             logger.info(
@@ -588,7 +604,7 @@ def telegram_collect_actors(
         )
 
     try:
-        remaining = asyncio.run(
+        remaining = run_async(
             collector.collect_by_actors(
                 actor_ids=actor_ids,
                 tier=Tier.FREE,
@@ -728,6 +744,6 @@ def telegram_health_check() -> dict[str, Any]:
 
     credential_pool = get_credential_pool()
     collector = TelegramCollector(credential_pool=credential_pool)
-    result: dict[str, Any] = asyncio.run(collector.health_check())
+    result: dict[str, Any] = run_async(collector.health_check())
     logger.info("telegram: health_check status=%s", result.get("status", "unknown"))
     return result
@@ -62,6 +62,7 @@ from issue_observatory.core.exceptions import (
     NoCredentialAvailableError,
 )
 from issue_observatory.core.normalizer import Normalizer
+from issue_observatory.workers.runtime import shared_http_transport
 
 logger = logging.getLogger(__name__)
 
@@ -93,6 +94,7 @@ class ThreadsCollector(ArenaCollector):
     supported_tiers: list[Tier] = [Tier.FREE, Tier.MEDIUM]
     temporal_mode: TemporalMode = TemporalMode.RECENT
     supports_actor_collection: bool = True
+    supports_coverage_check: bool = True
     source_list_config_key: str | None = "custom_accounts"
 
     def __init__(
@@ -628,7 +630,7 @@ class ThreadsCollector(ArenaCollector):
         """
         if self._http_client is not None:
             return self._http_client  # type: ignore[return-value]
-        return httpx.AsyncClient(timeout=30.0)
+        return httpx.AsyncClient(timeout=30.0, transport=shared_http_transport())
 
     async def _acquire_credential(self) -> dict[str, Any] | None:
         """Acquire a Threads API credential from the pool.
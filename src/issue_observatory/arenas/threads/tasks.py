@@ -26,7 +26,6 @@ Database updates:
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import time
 from typing import Any
@@ -41,6 +40,7 @@ from issue_observatory.core.exceptions import (
     NoCredentialAvailableError,
 )
 from issue_observatory.workers.celery_app import celery_app
+from issue_observatory.workers.runtime import run_async
 
 logger = logging.getLogger(__name__)
 
@@ -189,7 +189,7 @@ def threads_collect_terms(
     credential_pool = get_credential_pool()
 
     try:
-        redis_client = asyncio.run(get_redis_client())
+        redis_client = run_async(get_redis_client())
     except Exception:
         redis_client = None
 
@@ -224,6 +224,7 @@ def threads_collect_terms(
             date_from=_dt.fromisoformat(date_from) if isinstance(date_from, str) else date_from,
             date_to=_dt.fromisoformat(date_to) if isinstance(date_to, str) else date_to,
             terms=terms,
+            planned_gaps=_extra.get("coverage_gaps"),
         )
         if not gaps:
             logger.info(
@@ -274,7 +275,7 @@ def threads_collect_terms(
         )
 
     try:
-        remaining = asyncio.run(
+        remaining = run_async(
             collector.collect_by_terms(
                 terms=terms,
                 tier=tier_enum,
@@ -477,7 +478,7 @@ def threads_collect_actors(
     credential_pool = get_credential_pool()
 
     try:
-        redis_client = asyncio.run(get_redis_client())
+        redis_client = run_async(get_redis_client())
     except Exception:
         redis_client = None
 
@@ -512,6 +513,7 @@ def threads_collect_actors(
             date_from=_dt.fromisoformat(date_from) if isinstance(date_from, str) else date_from,
             date_to=_dt.fromisoformat(date_to) if isinstance(date_to, str) else date_to,
             actor_ids=actor_ids,
+            planned_gaps=_extra.get("coverage_gaps"),
         )
         if not gaps:
             logger.info(
@@ -563,7 +565,7 @@ def threads_collect_actors(
         )
 
     try:
-        remaining = asyncio.run(
+        remaining = run_async(
             collector.collect_by_actors(
                 actor_ids=actor_ids,
                 tier=tier_enum,
@@ -715,7 +717,7 @@ def threads_health_check() -> dict[str, Any]:
 
     credential_pool = get_credential_pool()
     collector = ThreadsCollector(credential_pool=credential_pool)
-    result: dict[str, Any] = asyncio.run(collector.health_check())
+    result: dict[str, Any] = run_async(collector.health_check())
     logger.info(
         "threads: health_check status=%s", result.get("status", "unknown")
     )
@@ -778,7 +780,7 @@ def threads_refresh_tokens() -> dict[str, Any]:
                 )
         return {"refreshed": refreshed, "checked": checked, "status": "completed"}
 
-    result: dict[str, Any] = asyncio.run(_run_refresh())
+    result: dict[str, Any] = run_async(_run_refresh())
     logger.info(
         "threads: refresh_tokens completed — checked=%d refreshed=%d",
         result["checked"],
@@ -60,6 +60,7 @@ from issue_observatory.core.exceptions import (
 )
 from issue_observatory.core.language_utils import resolve_tiktok_region
 from issue_observatory.core.normalizer import Normalizer
+from issue_observatory.workers.runtime import shared_http_transport
 
 logger = logging.getLogger(__name__)
 
@@ -93,6 +94,7 @@ class TikTokCollector(ArenaCollector):
     supported_tiers: list[Tier] = [Tier.FREE]
     temporal_mode: TemporalMode = TemporalMode.HISTORICAL
     supports_actor_collection: bool = True
+    supports_coverage_check: bool = True
     source_list_config_key: str | None = "custom_accounts"
     source_list_daily_chunk_size: int | None = 100
 
@@ -627,7 +629,7 @@ class TikTokCollector(ArenaCollector):
         """Return an ``httpx.AsyncClient`` for use as a context manager."""
         if self._http_client is not None:
             return self._http_client  # type: ignore[return-value]
-        return httpx.AsyncClient(timeout=60.0)
+        return httpx.AsyncClient(timeout=60.0, transport=shared_http_transport())
 
     async def _get_credential(self) -> dict[str, Any]:
         """Acquire a TikTok credential from the pool.
@@ -22,7 +22,6 @@ Engagement lag note:
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import time
 from typing import Any
@@ -38,6 +37,7 @@ from issue_observatory.core.exceptions import (
     NoCredentialAvailableError,
 )
 from issue_observatory.workers.celery_app import celery_app
+from issue_observatory.workers.runtime import run_async
 
 logger = logging.getLogger(__name__)
 
@@ -175,7 +175,7 @@ def tiktok_collect_terms(
     from issue_observatory.workers.rate_limiter import RateLimiter, get_redis_client
 
     try:
-        redis_client = asyncio.run(get_redis_client())
+        redis_client = run_async(get_redis_client())
     except Exception:
         redis_client = None
 
@@ -206,6 +206,7 @@ def tiktok_collect_terms(
             date_from=_dt.fromisoformat(date_from) if isinstance(date_from, str) else date_from,
             date_to=_dt.fromisoformat(date_to) if isinstance(date_to, str) else date_to,
             terms=terms,
+            planned_gaps=_extra.get("coverage_gaps"),
         )
         if not gaps:
             logger.info(
@@ -256,7 +257,7 @@ def tiktok_collect_terms(
         )
 
     try:
-        remaining = asyncio.run(
+        remaining = run_async(
             collector.collect_by_terms(
                 terms=terms,
                 tier=Tier.FREE,
@@ -435,7 +436,7 @@ def tiktok_collect_actors(
     from issue_observatory.workers.rate_limiter import RateLimiter, get_redis_client
 
     try:
-        redis_client = asyncio.run(get_redis_client())
+        redis_client = run_async(get_redis_client())
     except Exception:
         redis_client = None
 
@@ -466,6 +467,7 @@ def tiktok_collect_actors(
             date_from=_dt.fromisoformat(date_from) if isinstance(date_from, str) else date_from,
             date_to=_dt.fromisoformat(date_to) if isinstance(date_to, str) else date_to,
             actor_ids=actor_ids,
+            planned_gaps=_extra.get("coverage_gaps"),
         )
         if not gaps:
             logger.info(
@@ -517,7 +519,7 @@ def tiktok_collect_actors(
         )
 
     try:
-        remaining = asyncio.run(
+        remaining = run_async(
             collector.collect_by_actors(
                 actor_ids=actor_ids,
                 tier=Tier.FREE,
@@ -640,7 +642,7 @@ def tiktok_health_check() -> dict[str, Any]:
     """
     credential_pool = CredentialPool()
     collector = TikTokCollector(credential_pool=credential_pool)
-    result: dict[str, Any] = asyncio.run(collector.health_check())
+    result: dict[str, Any] = run_async(collector.health_check())
     logger.info("tiktok: health_check status=%s", result.get("status", "unknown"))
     return result
 
@@ -770,7 +772,7 @@ def tiktok_collect_comments(
     from issue_observatory.workers.rate_limiter import RateLimiter, get_redis_client
 
     try:
-        redis_client = asyncio.run(get_redis_client())
+        redis_client = run_async(get_redis_client())
     except Exception:
         redis_client = None
 
@@ -786,7 +788,7 @@ def tiktok_collect_comments(
     )
 
     try:
-        remaining = asyncio.run(
+        remaining = run_async(
             collector.collect_comments(
                 post_ids=post_ids,
                 tier=Tier.FREE,
@@ -54,6 +54,7 @@ from issue_observatory.core.exceptions import (
     NoCredentialAvailableError,
 )
 from issue_observatory.core.normalizer import Normalizer
+from issue_observatory.workers.runtime import shared_http_transport
 
 logger = logging.getLogger(__name__)
 
@@ -550,6 +551,7 @@ class TwitchCollector(ArenaCollector):
                 "User-Agent": "IssueObservatory/1.0 (twitch-collector; research tool)",
             },
             timeout=30.0,
+            transport=shared_http_transport(),
         )
 
     async def _search_channels(
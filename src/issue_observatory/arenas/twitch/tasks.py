@@ -26,7 +26,6 @@ logged at WARNING and do not mask collection outcomes).
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import time
 from typing import Any
@@ -40,6 +39,7 @@ from issue_observatory.core.exceptions import (
     ArenaRateLimitError,
 )
 from issue_observatory.workers.celery_app import celery_app
+from issue_observatory.workers.runtime import run_async
 
 logger = logging.getLogger(__name__)
 
@@ -200,7 +200,7 @@ def twitch_collect_terms(
     collector.configure_batch_persistence(sink=sink, batch_size=100, collection_run_id=collection_run_id)
 
     try:
-        remaining = asyncio.run(
+        remaining = run_async(
             collector.collect_by_terms(
                 terms=terms,
                 tier=tier_enum,
@@ -372,7 +372,7 @@ def twitch_collect_actors(
     collector.configure_batch_persistence(sink=sink, batch_size=100, collection_run_id=collection_run_id)
 
     try:
-        remaining = asyncio.run(
+        remaining = run_async(
             collector.collect_by_actors(
                 actor_ids=actor_ids,
                 tier=tier_enum,
@@ -473,7 +473,7 @@ def twitch_health_check() -> dict[str, Any]:
     """
     credential_pool = CredentialPool()
     collector = TwitchCollector(credential_pool=credential_pool)
-    result: dict[str, Any] = asyncio.run(collector.health_check())
+    result: dict[str, Any] = run_async(collector.health_check())
     logger.info(
         "twitch: health_check status=%s", result.get("status", "unknown")
     )
@@ -34,13 +34,13 @@ full legal checklist.
 
 from __future__ import annotations
 
-import asyncio
 import logging
 from typing import Any
 
 from issue_observatory.arenas.vkontakte.collector import VKontakteCollector
 from issue_observatory.core.exceptions import ArenaCollectionError
 from issue_observatory.workers.celery_app import celery_app
+from issue_observatory.workers.runtime import run_async
 
 logger = logging.getLogger(__name__)
 
@@ -186,7 +186,7 @@ def vkontakte_health_check() -> dict[str, Any]:
         platform="vkontakte", and a detail message explaining the deferral.
     """
     collector = VKontakteCollector()
-    result: dict[str, Any] = asyncio.run(collector.health_check())
+    result: dict[str, Any] = run_async(collector.health_check())
     logger.info(
         "vkontakte: health_check status=%s", result.get("status", "unknown")
     )
@@ -1,8 +1,9 @@
 """Common Crawl arena package.
 
 Provides index-based access to the Common Crawl web archive via the
-CC Index API. Queries return index metadata (URL, timestamp, WARC location)
-rather than full page content. WARC record retrieval is out of scope.
+CC Index API. Queries return index metadata (URL, timestamp, WARC location);
+optionally the referenced WARC records are fetched with coalesced range
+reads and their article text is extracted.
 
 No credentials are required. Rate limit: 1 request/second courtesy throttle.
 """
@@ -0,0 +1,646 @@
+"""WARC record retrieval for Common Crawl index hits.
+
+Internal module used by
+:class:`~issue_observatory.arenas.web.common_crawl.collector.CommonCrawlCollector`
+when ``fetch_content=True``.  Not part of the public arena API.
+
+Every CC Index entry locates one gzip member inside a WARC file on the data
+bucket (``filename``, ``offset``, ``length``).  Fetching each member with its
+own request would cost one round trip per page, so hits are grouped by WARC
+file and neighbouring byte ranges are coalesced into a single ranged GET
+(:func:`plan_range_reads`).  Responses are streamed; each member is sliced
+out and decompressed as soon as its last byte arrives, so memory stays
+bounded by the largest record rather than the whole range.
+
+Article extraction (:func:`~issue_observatory.scraper.content_extractor.extract_from_html`)
+is CPU-bound and runs in a process pool owned by :class:`WarcFetcher`,
+falling back to a worker thread where child processes are unavailable.
+
+Provides:
+- :func:`warc_record_ref` — WARC location of a normalized record.
+- :func:`plan_range_reads` — group and coalesce record locations.
+- :func:`parse_warc_member` — decompress and parse one gzip WARC member.
+- :class:`WarcFetcher` — fetch, parse, and extract content for records.
+
+**Error isolation**: as in the Wayback content fetcher, a failed range or
+an unparsable record is recorded in ``raw_metadata["content_fetch_error"]``
+without raising, so the index metadata is still persisted.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+import zlib
+from collections import defaultdict
+from collections.abc import AsyncIterator
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor
+from contextlib import aclosing
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from multiprocessing import get_context
+from typing import Any
+
+import httpx
+
+from issue_observatory.arenas.web.common_crawl.config import (
+    CC_DATA_BASE_URL,
+    CC_WARC_CONCURRENT_READS,
+    CC_WARC_MAX_PAYLOAD_BYTES,
+    CC_WARC_MAX_RANGE_BYTES,
+    CC_WARC_MAX_RANGE_GAP,
+    CC_WARC_RETRY_DELAY_SECONDS,
+)
+from issue_observatory.scraper.content_extractor import (
+    ExtractedContent,
+    extract_from_html,
+)
+
+try:
+    import h2  # noqa: F401
+
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# User-Agent sent for WARC range requests (distinct from the index UA).
+_WARC_UA: str = "IssueObservatory/1.0 (common-crawl-warc; research use)"
+
+# Allowance for WARC and HTTP headers on top of the payload cap.
+_HEADER_ALLOWANCE: int = 64 * 1024
+
+_CHARSET_RE = re.compile(rb"""<meta[^>]+charset=["']?([A-Za-z0-9_\-:.]+)""", re.IGNORECASE)
+
+_RETRY_STATUSES = frozenset({429, 503})
+
+
+# ---------------------------------------------------------------------------
+# Range planning
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class WarcRecordRef:
+    """Location of one gzip WARC member.
+
+    Attributes:
+        index: Position of the owning record in the list being enriched.
+        filename: WARC file path relative to the data bucket.
+        offset: Byte offset of the member within the file.
+        length: Compressed length of the member in bytes.
+    """
+
+    index: int
+    filename: str
+    offset: int
+    length: int
+
+    @property
+    def end(self) -> int:
+        """Exclusive end offset of the member."""
+        return self.offset + self.length
+
+
+@dataclass
+class RangeRead:
+    """One ranged GET covering one or more members of a WARC file.
+
+    Attributes:
+        filename: WARC file path relative to the data bucket.
+        start: First byte requested.
+        end: Exclusive end of the requested range.
+        refs: Members inside the range, ordered by offset.
+    """
+
+    filename: str
+    start: int
+    end: int
+    refs: list[WarcRecordRef] = field(default_factory=list)
+
+    @property
+    def range_header(self) -> str:
+        """Value of the HTTP ``Range`` header for this read."""
+        return f"bytes={self.start}-{self.end - 1}"
+
+
+def warc_record_ref(index: int, record: dict[str, Any]) -> WarcRecordRef | None:
+    """Return the WARC location stored in a normalized record, if complete.
+
+    Args:
+        index: Position of *record* in the list being enriched.
+        record: Normalized CC Index record.
+
+    Returns:
+        A :class:`WarcRecordRef`, or ``None`` when the filename, offset, or
+        length is missing or malformed.
+    """
+    raw_meta: dict[str, Any] = record.get("raw_metadata") or {}
+    filename = raw_meta.get("warc_filename")
+    try:
+        offset = int(raw_meta.get("warc_record_offset"))
+        length = int(raw_meta.get("warc_record_length"))
+    except (TypeError, ValueError):
+        return None
+    if not filename or offset < 0 or length <= 0:
+        return None
+    return WarcRecordRef(index=index, filename=filename, offset=offset, length=length)
+
+
+def plan_range_reads(
+    refs: list[WarcRecordRef],
+    max_gap: int = CC_WARC_MAX_RANGE_GAP,
+    max_range_bytes: int = CC_WARC_MAX_RANGE_BYTES,
+) -> list[RangeRead]:
+    """Group members by WARC file and coalesce nearby ones into range reads.
+
+    Within a file, members are sorted by offset and appended to the current
+    read while the gap to it is at most *max_gap* and the combined span
+    stays within *max_range_bytes*.  Overlapping or duplicate locations
+    always share a read.
+
+    Args:
+        refs: Member locations, in any order.
+        max_gap: Largest number of unrelated bytes bridged within one read.
+        max_range_bytes: Largest span of a read that holds several members.
+
+    Returns:
+        Range reads, grouped by file in first-seen order.
+    """
+    by_file: dict[str, list[WarcRecordRef]] = defaultdict(list)
+    for ref in refs:
+        by_file[ref.filename].append(ref)
+
+    reads: list[RangeRead] = []
+    for filename, file_refs in by_file.items():
+        file_refs.sort(key=lambda r: (r.offset, r.length))
+        current: RangeRead | None = None
+        for ref in file_refs:
+            if (
+                current is not None
+                and ref.offset - current.end <= max_gap
+                and max(current.end, ref.end) - current.start <= max_range_bytes
+            ):
+                current.refs.append(ref)
+                current.end = max(current.end, ref.end)
+                continue
+            current = RangeRead(filename=filename, start=ref.offset, end=ref.end, refs=[ref])
+            reads.append(current)
+    return reads
+
+
+# ---------------------------------------------------------------------------
+# WARC parsing
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class WarcResponse:
+    """HTTP response captured in a WARC ``response`` record.
+
+    Attributes:
+        target_uri: Value of ``WARC-Target-URI``.
+        http_status: Status code of the captured response.
+        content_type: Media type of the payload without parameters.
+        charset: Charset from the ``Content-Type`` header, if any.
+        payload: Response body (possibly truncated).
+        truncated: Whether the payload was cut at the size cap.
+    """
+
+    target_uri: str | None
+    http_status: int | None
+    content_type: str | None
+    charset: str | None
+    payload: bytes
+    truncated: bool
+
+    def decode_html(self, charset_hint: str | None = None) -> str:
+        """Decode the payload using the declared, hinted, or sniffed charset.
+
+        Args:
+            charset_hint: Charset detected by Common Crawl (index ``charset``).
+
+        Returns:
+            The payload as text; undecodable bytes are replaced.
+        """
+        candidates = [self.charset, charset_hint]
+        sniffed = _CHARSET_RE.search(self.payload[:4096])
+        if sniffed:
+            candidates.append(sniffed.group(1).decode("ascii", errors="ignore"))
+        for charset in candidates:
+            if not charset:
+                continue
+            try:
+                return self.payload.decode(charset, errors="replace")
+            except LookupError:
+                continue
+        return self.payload.decode("utf-8", errors="replace")
+
+
+def _parse_header_block(block: bytes) -> tuple[str, dict[str, str]]:
+    """Split a CRLF header block into its first line and lower-cased headers."""
+    lines = block.decode("latin-1").split("\r\n")
+    headers: dict[str, str] = {}
+    for line in lines[1:]:
+        name, sep, value = line.partition(":")
+        if sep:
+            headers[name.strip().lower()] = value.strip()
+    return lines[0], headers
+
+
+def parse_warc_member(
+    member: bytes,
+    max_payload_bytes: int = CC_WARC_MAX_PAYLOAD_BYTES,
+) -> WarcResponse | None:
+    """Decompress one gzip WARC member and parse the captured HTTP response.
+
+    Common Crawl stores each record as an independent gzip member, so the
+    bytes located by an index entry decompress on their own.  Payloads
+    beyond *max_payload_bytes* are cut off rather than inflated.
+
+    Args:
+        member: Compressed bytes of exactly one WARC record.
+        max_payload_bytes: Decompressed payload cap.
+
+    Returns:
+        A :class:`WarcResponse`, or ``None`` for non-``response`` records
+        (``request``, ``metadata``, ``revisit``, ...).
+
+    Raises:
+        ValueError: If *member* is not a valid gzip WARC record.
+    """
+    decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+    try:
+        data = decompressor.decompress(member, max_payload_bytes + _HEADER_ALLOWANCE)
+    except zlib.error as exc:
+        raise ValueError(f"invalid gzip member: {exc}") from exc
+    truncated = bool(decompressor.unconsumed_tail)
+
+    warc_head, sep, block = data.partition(b"\r\n\r\n")
+    if not sep or not warc_head.startswith(b"WARC/"):
+        raise ValueError("missing WARC header")
+    _, warc_headers = _parse_header_block(warc_head)
+    if warc_headers.get("warc-type") != "response":
+        return None
+    try:
+        block_length = int(warc_headers.get("content-length", ""))
+    except ValueError:
+        block_length = len(block)
+    if block_length <= len(block):
+        block = block[:block_length]
+
+    http_head, sep, payload = block.partition(b"\r\n\r\n")
+    if not sep:
+        raise ValueError("missing HTTP header in WARC response record")
+    status_line, http_headers = _parse_header_block(http_head)
+    parts = status_line.split(" ", 2)
+    http_status = int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else None
+
+    content_type: str | None = None
+    charset: str | None = None
+    if raw_type := http_headers.get("content-type"):
+        media, *params = raw_type.split(";")
+        content_type = media.strip().lower() or None
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "charset":
+                charset = value.strip().strip("\"'") or None
+
+    if len(payload) > max_payload_bytes:
+        payload = payload[:max_payload_bytes]
+        truncated = True
+
+    return WarcResponse(
+        target_uri=warc_headers.get("warc-target-uri"),
+        http_status=http_status,
+        content_type=content_type,
+        charset=charset,
+        payload=payload,
+        truncated=truncated,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Fetcher
+# ---------------------------------------------------------------------------
+
+
+def build_warc_client(max_connections: int = CC_WARC_CONCURRENT_READS) -> httpx.AsyncClient:
+    """Return a pooled client for data bucket range reads.
+
+    Negotiates HTTP/2 when ``h2`` is installed so concurrent range reads
+    share one connection; otherwise keeps HTTP/1.1 connections alive.
+
+    Args:
+        max_connections: Upper bound on open connections.
+
+    Returns:
+        An unopened client; use it as an async context manager.
+    """
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_connections,
+        keepalive_expiry=30.0,
+    )
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(60.0, connect=15.0),
+        headers={"User-Agent": _WARC_UA},
+        http2=_HTTP2_AVAILABLE,
+        limits=limits,
+    )
+
+
+class WarcFetcher:
+    """Fetches WARC records for CC Index hits and extracts article text.
+
+    Use as an async context manager; on exit the HTTP client (unless
+    injected) and the extraction process pool are closed.
+
+    Args:
+        client: Optional injected client; by default one is built with
+            :func:`build_warc_client`.
+        base_url: Data bucket base URL.
+        process_workers: Extraction pool size.  ``None`` reads
+            ``Settings.warc_extract_workers``; ``0`` uses a worker thread.
+        max_gap: See :func:`plan_range_reads`.
+        max_range_bytes: See :func:`plan_range_reads`.
+        concurrency: Maximum ranged GETs in flight.
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient | None = None,
+        base_url: str = CC_DATA_BASE_URL,
+        process_workers: int | None = None,
+        max_gap: int = CC_WARC_MAX_RANGE_GAP,
+        max_range_bytes: int = CC_WARC_MAX_RANGE_BYTES,
+        concurrency: int = CC_WARC_CONCURRENT_READS,
+    ) -> None:
+        if process_workers is None:
+            from issue_observatory.config.settings import get_settings
+
+            process_workers = get_settings().warc_extract_workers
+        self._injected_client = client
+        self._client: httpx.AsyncClient | None = client
+        self._base_url = base_url.rstrip("/")
+        self._process_workers = process_workers
+        self._pool: ProcessPoolExecutor | None = None
+        self._pool_disabled = process_workers <= 0
+        self._max_gap = max_gap
+        self._max_range_bytes = max_range_bytes
+        self._concurrency = concurrency
+
+    async def __aenter__(self) -> WarcFetcher:
+        if self._client is None:
+            self._client = build_warc_client(self._concurrency)
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        if self._injected_client is None and self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        self._disable_pool()
+
+    async def fetch_content(self, records: list[dict[str, Any]]) -> int:
+        """Fetch, parse, and extract the WARC record of each CC Index record.
+
+        On success the record is mutated like a Wayback content fetch:
+        ``text_content``, ``content_type="web_page"``, ``title`` and
+        ``language`` when not already set, and ``raw_metadata`` keys
+        ``content_fetched``, ``content_fetch_url``, ``content_fetched_at``
+        and ``warc_http_status``.  On failure
+        ``raw_metadata["content_fetch_error"]`` is set instead.
+
+        Args:
+            records: Normalized CC Index records (mutated in place).
+
+        Returns:
+            Number of records whose text was extracted.
+        """
+        refs: list[WarcRecordRef] = []
+        for index, record in enumerate(records):
+            ref = warc_record_ref(index, record)
+            if ref is None:
+                _mark_error(record, "no WARC location in raw_metadata")
+            else:
+                refs.append(ref)
+        if not refs:
+            return 0
+
+        reads = plan_range_reads(refs, self._max_gap, self._max_range_bytes)
+        logger.info(
+            "common_crawl: fetching %d WARC records in %d range reads",
+            len(refs),
+            len(reads),
+        )
+        semaphore = asyncio.Semaphore(self._concurrency)
+        counts = await asyncio.gather(
+            *(self._process_read(read, records, semaphore) for read in reads)
+        )
+        fetched = sum(counts)
+        logger.info(
+            "common_crawl: WARC content fetch complete — %d extracted / %d located",
+            fetched,
+            len(refs),
+        )
+        return fetched
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    async def _process_read(
+        self,
+        read: RangeRead,
+        records: list[dict[str, Any]],
+        semaphore: asyncio.Semaphore,
+    ) -> int:
+        """Stream one range read and extract every member in it."""
+        extractions: list[asyncio.Task[bool]] = []
+        done: set[int] = set()
+        error: str | None = None
+        async with semaphore:
+            for attempt in range(2):
+                try:
+                    async with aclosing(self._stream_members(read, skip=done)) as members:
+                        async for ref, member in members:
+                            done.add(ref.index)
+                            extractions.append(
+                                asyncio.create_task(
+                                    self._extract(records[ref.index], ref, member)
+                                )
+                            )
+                except _RetryableRangeError as exc:
+                    error = str(exc)
+                    if attempt == 0:
+                        logger.warning(
+                            "common_crawl: %s for %s — retrying after %.0fs",
+                            exc,
+                            read.filename,
+                            CC_WARC_RETRY_DELAY_SECONDS,
+                        )
+                        await asyncio.sleep(CC_WARC_RETRY_DELAY_SECONDS)
+                        continue
+                except (httpx.HTTPError, ValueError) as exc:
+                    error = f"range read failed: {exc}"
+                else:
+                    error = None
+                break
+        if error is not None:
+            logger.warning(
+                "common_crawl: WARC range %s of %s failed: %s",
+                read.range_header,
+                read.filename,
+                error,
+            )
+            for ref in read.refs:
+                if ref.index not in done:
+                    _mark_error(records[ref.index], error)
+        results = await asyncio.gather(*extractions)
+        return sum(results)
+
+    async def _stream_members(
+        self,
+        read: RangeRead,
+        skip: set[int],
+    ) -> AsyncIterator[tuple[WarcRecordRef, bytes]]:
+        """Yield each member of *read* as soon as its bytes have arrived.
+
+        The buffer is trimmed to the start of the next pending member after
+        every slice, so gap bytes and finished members are released early.
+
+        Raises:
+            _RetryableRangeError: On HTTP 429 or 503.
+            ValueError: On other unexpected statuses or a short body.
+        """
+        assert self._client is not None
+        url = f"{self._base_url}/{read.filename}"
+        async with self._client.stream(
+            "GET", url, headers={"Range": read.range_header}
+        ) as response:
+            if response.status_code in _RETRY_STATUSES:
+                raise _RetryableRangeError(f"HTTP {response.status_code}")
+            if response.status_code != 206:
+                # A 200 would stream the whole (multi-GB) file; never read it.
+                raise ValueError(f"HTTP {response.status_code} for ranged GET")
+
+            pending = [ref for ref in read.refs if ref.index not in skip]
+            buffer = bytearray()
+            buffer_start = read.start
+            position = 0
+            async for chunk in response.aiter_raw():
+                buffer.extend(chunk)
+                buffer_end = buffer_start + len(buffer)
+                while position < len(pending) and pending[position].end <= buffer_end:
+                    ref = pending[position]
+                    begin = ref.offset - buffer_start
+                    member = bytes(buffer[begin : begin + ref.length])
+                    position += 1
+                    yield ref, member
+                keep_from = pending[position].offset if position < len(pending) else buffer_end
+                if keep_from > buffer_start:
+                    del buffer[: keep_from - buffer_start]
+                    buffer_start = keep_from
+                if position == len(pending):
+                    break
+            if position < len(pending):
+                raise ValueError(
+                    f"range response ended at byte {buffer_start + len(buffer)}, "
+                    f"expected {read.end}"
+                )
+
+    async def _extract(
+        self,
+        record: dict[str, Any],
+        ref: WarcRecordRef,
+        member: bytes,
+    ) -> bool:
+        """Parse one member and apply the extracted article to *record*."""
+        try:
+            response = parse_warc_member(member)
+        except ValueError as exc:
+            _mark_error(record, str(exc))
+            return False
+        if response is None:
+            _mark_error(record, "WARC record is not a response")
+            return False
+        raw_meta: dict[str, Any] = record.setdefault("raw_metadata", {})
+        raw_meta["warc_http_status"] = response.http_status
+        if response.content_type and "html" not in response.content_type:
+            _mark_error(record, f"non-HTML payload ({response.content_type})")
+            return False
+
+        html = response.decode_html(raw_meta.get("charset"))
+        url = record.get("url") or response.target_uri or ""
+        try:
+            extracted = await self._run_extraction(html, url)
+        except Exception as exc:
+            logger.warning("common_crawl: extraction error for %s: %s", url, exc)
+            _mark_error(record, f"extraction error: {exc}")
+            return False
+
+        raw_meta["content_fetch_url"] = f"{self._base_url}/{ref.filename}"
+        raw_meta["content_fetched_at"] = datetime.now(tz=UTC).isoformat()
+        if response.truncated:
+            raw_meta["content_truncated"] = True
+        if not extracted.text:
+            raw_meta["content_fetch_error"] = "extraction returned no text"
+            return False
+
+        record["text_content"] = extracted.text
+        record["content_type"] = "web_page"
+        if extracted.title and not record.get("title"):
+            record["title"] = extracted.title
+        if extracted.language and not record.get("language"):
+            record["language"] = extracted.language
+        raw_meta["content_fetched"] = True
+        return True
+
+    async def _run_extraction(self, html: str, url: str) -> ExtractedContent:
+        """Run :func:`extract_from_html` in the process pool, or a thread."""
+        pool = self._get_pool()
+        if pool is not None:
+            try:
+                future = pool.submit(extract_from_html, html, url)
+            except Exception as exc:
+                # Worker processes start on submit; daemonic Celery children
+                # may not spawn them.
+                logger.warning("common_crawl: extraction pool unavailable: %s", exc)
+                self._disable_pool()
+            else:
+                try:
+                    return await asyncio.wrap_future(future)
+                except BrokenExecutor as exc:
+                    logger.warning("common_crawl: extraction pool broke: %s", exc)
+                    self._disable_pool()
+        return await asyncio.to_thread(extract_from_html, html, url)
+
+    def _get_pool(self) -> ProcessPoolExecutor | None:
+        """Return the extraction pool, creating it on first use."""
+        if self._pool_disabled:
+            return None
+        if self._pool is None:
+            # "spawn" avoids forking a process that runs an event loop.
+            self._pool = ProcessPoolExecutor(
+                max_workers=self._process_workers, mp_context=get_context("spawn")
+            )
+        return self._pool
+
+    def _disable_pool(self) -> None:
+        """Shut the pool down and extract in threads from now on."""
+        self._pool_disabled = True
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+class _RetryableRangeError(Exception):
+    """Ranged GET answered with a status worth one retry (429/503)."""
+
+
+def _mark_error(record: dict[str, Any], error: str) -> None:
+    """Record a content fetch failure without touching the index metadata."""
+    raw_meta: dict[str, Any] = record.setdefault("raw_metadata", {})
+    raw_meta["content_fetch_error"] = error
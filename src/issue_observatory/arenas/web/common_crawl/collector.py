@@ -5,9 +5,10 @@ search terms or actor domains, filtering for Danish ``.dk`` content.
 
 **Design notes**:
 
-- Returns CC Index entries (metadata only) — WARC record retrieval is out of
-  scope for Phase 2. The ``raw_metadata`` field contains WARC location
-  references (``filename``, ``offset``, ``length``) for future retrieval.
+- Returns CC Index entries; the ``raw_metadata`` field contains WARC location
+  references (``filename``, ``offset``, ``length``).  With
+  ``fetch_content=True`` the referenced WARC records are fetched with
+  coalesced range reads and article text is extracted (see :mod:`._warc`).
 - ``collect_by_terms()`` queries the CC Index for ``*.dk`` domain captures
   and filters results client-side by matching terms against the URL path.
 - ``collect_by_actors()`` queries by domain; actor IDs must be registered
@@ -39,10 +40,12 @@ from issue_observatory.arenas.web.common_crawl._fetcher import (
     map_cc_language,
     parse_cc_timestamp,
 )
+from issue_observatory.arenas.web.common_crawl._warc import WarcFetcher
 from issue_observatory.arenas.web.common_crawl.config import (
     CC_COLLINFO_URL,
     CC_CONCURRENT_FETCH_LIMIT,
     CC_DANISH_TLD_FILTER,
+    CC_DATA_BASE_URL,
     CC_DEFAULT_INDEX,
     CC_DEFAULT_MATCH_TYPE,
     CC_DEFAULT_OUTPUT,
@@ -55,6 +58,7 @@ from issue_observatory.arenas.web.common_crawl.config import (
 )
 from issue_observatory.config.tiers import TierConfig
 from issue_observatory.core.normalizer import Normalizer
+from issue_observatory.workers.runtime import shared_http_transport
 
 logger = logging.getLogger(__name__)
 
@@ -64,8 +68,8 @@ class CommonCrawlCollector(ArenaCollector):
     """Collects web page index entries via the Common Crawl Index API.
 
     Queries the CC Index API for captures of Danish ``.dk`` domains.
-    Returns index metadata only; full page content requires WARC retrieval
-    which is out of scope.
+    Returns index metadata by default; pass ``fetch_content=True`` to the
+    collect methods to retrieve the WARC records and extract article text.
 
     Supported tiers:
     - ``Tier.FREE`` — CC Index API; no credentials required.
@@ -81,12 +85,15 @@ class CommonCrawlCollector(ArenaCollector):
         http_client: Optional injected :class:`httpx.AsyncClient` for testing.
         cc_index: Common Crawl index identifier to query. Defaults to
             ``CC_DEFAULT_INDEX``.
+        data_base_url: Base URL WARC files are fetched from. Defaults to
+            ``CC_DATA_BASE_URL``.
     """
 
     arena_name: str = "web"
     platform_name: str = "common_crawl"
     supported_tiers: list[Tier] = [Tier.FREE]
     temporal_mode: TemporalMode = TemporalMode.HISTORICAL
+    supports_coverage_check: bool = True
 
     def __init__(
         self,
@@ -94,11 +101,13 @@ class CommonCrawlCollector(ArenaCollector):
         rate_limiter: Any = None,
         http_client: httpx.AsyncClient | None = None,
         cc_index: str = CC_DEFAULT_INDEX,
+        data_base_url: str = CC_DATA_BASE_URL,
     ) -> None:
         super().__init__(credential_pool=credential_pool, rate_limiter=rate_limiter)
         self._http_client = http_client
         self._normalizer = Normalizer()
         self._cc_index = cc_index
+        self._data_base_url = data_base_url
 
     # ------------------------------------------------------------------
     # ArenaCollector abstract method implementations
@@ -113,6 +122,7 @@ class CommonCrawlCollector(ArenaCollector):
         max_results: int | None = None,
         term_groups: list[list[str]] | None = None,
         language_filter: list[str] | None = None,
+        fetch_content: bool = False,
     ) -> list[dict[str, Any]]:
         """Collect CC index entries for Danish pages matching the search terms.
 
@@ -122,6 +132,11 @@ class CommonCrawlCollector(ArenaCollector):
         No native boolean support.  When ``term_groups`` is provided each
         AND-group is searched as a separate space-joined query.
 
+        When ``fetch_content=True``, the WARC record of every entry is
+        retrieved from the data bucket and its article text extracted.
+        Individual fetch failures are recorded in ``raw_metadata`` and do
+        not abort the collection.
+
         Args:
             terms: Search terms matched as URL substrings (used when
                 ``term_groups`` is ``None``).
@@ -131,9 +146,14 @@ class CommonCrawlCollector(ArenaCollector):
             max_results: Upper bound on returned records.
             term_groups: Optional boolean AND/OR groups.
             language_filter: Not used — Common Crawl has no language filter.
+            fetch_content: When ``True``, fetch and extract the WARC record
+                of each entry.  Defaults to ``False``.
 
         Returns:
             List of normalized content record dicts (web index entries).
+            When ``fetch_content`` is ``True`` and extraction succeeded,
+            ``text_content`` is populated and ``content_type`` is
+            ``"web_page"``.
 
         Raises:
             ValueError: If *tier* is not ``Tier.FREE``.
@@ -141,6 +161,7 @@ class CommonCrawlCollector(ArenaCollector):
             ArenaRateLimitError: On HTTP 429 from the CC Index API.
         """
         self._validate_tier(tier)
+        self._reset_batch_state()
         tier_config = self.get_tier_config(tier)
         effective_max = max_results if max_results is not None else tier_config.max_results_per_run
 
@@ -174,10 +195,14 @@ class CommonCrawlCollector(ArenaCollector):
                 self._record_input_count(term, len(term_records))
                 self._flush()
 
+        if fetch_content and all_records:
+            await self._fetch_warc_content(all_records)
+
         logger.info(
-            "common_crawl: collect_by_terms — %d records for %d queries",
+            "common_crawl: collect_by_terms — %d records for %d queries (fetch_content=%s)",
             len(all_records),
             len(terms),
+            fetch_content,
         )
         return all_records
 
@@ -188,10 +213,12 @@ class CommonCrawlCollector(ArenaCollector):
         date_from: datetime | str | None = None,
         date_to: datetime | str | None = None,
         max_results: int | None = None,
+        fetch_content: bool = False,
     ) -> list[dict[str, Any]]:
         """Collect CC index entries for domains belonging to the specified actors.
 
         Actor IDs must be registered domain names (e.g. ``"dr.dk"``).
+        ``fetch_content`` behaves as in :meth:`collect_by_terms`.
 
         Args:
             actor_ids: Domain names to query.
@@ -199,6 +226,8 @@ class CommonCrawlCollector(ArenaCollector):
             date_from: Earliest capture timestamp (inclusive).
             date_to: Latest capture timestamp (inclusive).
             max_results: Upper bound on returned records.
+            fetch_content: When ``True``, fetch and extract the WARC record
+                of each entry.  Defaults to ``False``.
 
         Returns:
             List of normalized content record dicts.
@@ -209,6 +238,7 @@ class CommonCrawlCollector(ArenaCollector):
             ArenaRateLimitError: On HTTP 429 from the CC Index API.
         """
         self._validate_tier(tier)
+        self._reset_batch_state()
         tier_config = self.get_tier_config(tier)
         effective_max = max_results if max_results is not None else tier_config.max_results_per_run
 
@@ -231,10 +261,14 @@ class CommonCrawlCollector(ArenaCollector):
                 all_records.extend(domain_records)
                 self._flush()
 
+        if fetch_content and all_records:
+            await self._fetch_warc_content(all_records)
+
         logger.info(
-            "common_crawl: collect_by_actors — %d records for %d domains",
+            "common_crawl: collect_by_actors — %d records for %d domains (fetch_content=%s)",
             len(all_records),
             len(actor_ids),
+            fetch_content,
         )
         return all_records
 
@@ -398,8 +432,21 @@ class CommonCrawlCollector(ArenaCollector):
             headers={
                 "User-Agent": "IssueObservatory/1.0 (common-crawl-collector; research use)"
             },
+            transport=shared_http_transport(),
         )
 
+    async def _fetch_warc_content(self, records: list[dict[str, Any]]) -> int:
+        """Fetch WARC records for *records* and extract their article text.
+
+        Args:
+            records: Normalized CC Index records (mutated in place).
+
+        Returns:
+            Number of records whose text was extracted.
+        """
+        async with WarcFetcher(base_url=self._data_base_url) as fetcher:
+            return await fetcher.fetch_content(records)
+
     async def _rate_limit_wait(self) -> None:
         """Wait for a Common Crawl rate-limit slot.
 
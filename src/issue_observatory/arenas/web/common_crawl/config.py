@@ -103,6 +103,45 @@ Used by ``asyncio.Semaphore`` in collect methods to avoid overwhelming the
 API with simultaneous page requests.
 """
 
+# ---------------------------------------------------------------------------
+# WARC record retrieval
+# ---------------------------------------------------------------------------
+
+CC_DATA_BASE_URL: str = "https://data.commoncrawl.org"
+"""Base URL of the Common Crawl data bucket.
+
+WARC files are fetched as ``{CC_DATA_BASE_URL}/{filename}`` where
+``filename`` is the path reported by the CC Index entry.
+"""
+
+CC_WARC_MAX_RANGE_GAP: int = 64 * 1024
+"""Largest gap (bytes) between two records read within one ranged GET.
+
+Index hits in the same WARC file that lie closer together than this are
+fetched as a single range; the unrelated bytes in between are discarded.
+Downloading a small gap is cheaper than another request round trip.
+"""
+
+CC_WARC_MAX_RANGE_BYTES: int = 16 * 1024 * 1024
+"""Upper bound on the span of one coalesced ranged GET.
+
+Keeps a single request short enough to retry cheaply.  A record that is
+larger than this on its own is still fetched in one request.
+"""
+
+CC_WARC_CONCURRENT_READS: int = 8
+"""Maximum ranged GETs in flight against the data bucket."""
+
+CC_WARC_MAX_PAYLOAD_BYTES: int = 5 * 1024 * 1024
+"""Decompressed bytes read from one WARC record; larger payloads are cut off.
+
+Guards the worker against oversized pages and gzip bombs.  Truncated
+payloads are still handed to the extractor.
+"""
+
+CC_WARC_RETRY_DELAY_SECONDS: float = 5.0
+"""Pause before the single retry of a ranged GET answered with 429 or 503."""
+
 # ---------------------------------------------------------------------------
 # Tier configuration
 # ---------------------------------------------------------------------------
@@ -15,7 +15,9 @@ Endpoints:
 - ``GET  /common-crawl/health`` — arena health check.
 
 Notes:
-    - Returns CC Index metadata only; WARC content retrieval is out of scope.
+    - Returns CC Index metadata; when ``fetch_content=true`` is set in the
+      request body, the WARC records are also fetched and article text is
+      extracted.
     - Terms are matched as URL substrings (case-insensitive).
     - Actor IDs must be registered domain names (e.g. ``"dr.dk"``).
 """
@@ -54,6 +56,8 @@ class CollectByTermsRequest(BaseModel):
         date_to: ISO 8601 latest capture date (inclusive).
         max_results: Upper bound on returned records.
         cc_index: Common Crawl index to query. Defaults to the most recent.
+        fetch_content: When ``True``, fetch each entry's WARC record and
+            extract its article text.
     """
 
     terms: list[str] = Field(
@@ -79,6 +83,13 @@ class CollectByTermsRequest(BaseModel):
         default=CC_DEFAULT_INDEX,
         description="Common Crawl index identifier (e.g. 'CC-MAIN-2025-51').",
     )
+    fetch_content: bool = Field(
+        default=False,
+        description=(
+            "When true, fetch each entry's WARC record from the Common Crawl "
+            "data bucket and extract the article text."
+        ),
+    )
 
 
 class CollectByActorsRequest(BaseModel):
@@ -90,6 +101,8 @@ class CollectByActorsRequest(BaseModel):
         date_to: ISO 8601 latest capture date (inclusive).
         max_results: Upper bound on returned records.
         cc_index: Common Crawl index to query.
+        fetch_content: When ``True``, fetch each entry's WARC record and
+            extract its article text.
     """
 
     actor_ids: list[str] = Field(
@@ -115,6 +128,13 @@ class CollectByActorsRequest(BaseModel):
         default=CC_DEFAULT_INDEX,
         description="Common Crawl index identifier (e.g. 'CC-MAIN-2025-51').",
     )
+    fetch_content: bool = Field(
+        default=False,
+        description=(
+            "When true, fetch each entry's WARC record from the Common Crawl "
+            "data bucket and extract the article text."
+        ),
+    )
 
 
 class CollectResponse(BaseModel):
@@ -146,9 +166,9 @@ class CollectResponse(BaseModel):
     summary="Common Crawl collection by search terms",
     description=(
         "Query the Common Crawl Index API for Danish (.dk) pages where the URL "
-        "contains the search terms. Returns index metadata only — WARC record "
-        "retrieval (full page content) is out of scope. Terms are matched "
-        "case-insensitively as URL substrings."
+        "contains the search terms. Returns index metadata; set "
+        "``fetch_content=true`` to also retrieve the WARC records and extract "
+        "full page text. Terms are matched case-insensitively as URL substrings."
     ),
 )
 async def collect_by_terms(
@@ -177,6 +197,7 @@ async def collect_by_terms(
             date_from=body.date_from,
             date_to=body.date_to,
             max_results=body.max_results,
+            fetch_content=body.fetch_content,
         )
     except ArenaRateLimitError as exc:
         logger.warning(
@@ -219,7 +240,7 @@ async def collect_by_terms(
     description=(
         "Query the Common Crawl Index API for all captures of the specified "
         "domains. Actor IDs must be registered domain names (e.g. 'dr.dk'). "
-        "Returns index metadata only."
+        "Set ``fetch_content=true`` to also extract full page text."
     ),
 )
 async def collect_by_actors(
@@ -248,6 +269,7 @@ async def collect_by_actors(
             date_from=body.date_from,
             date_to=body.date_to,
             max_results=body.max_results,
+            fetch_content=body.fetch_content,
         )
     except ArenaRateLimitError as exc:
         logger.warning(
@@ -19,7 +19,6 @@ collection outcomes.
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import time
 from typing import Any
@@ -32,6 +31,7 @@ from issue_observatory.core.exceptions import (
     ArenaRateLimitError,
 )
 from issue_observatory.workers.celery_app import celery_app
+from issue_observatory.workers.runtime import run_async
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +44,53 @@ _PLATFORM = "common_crawl"
 # ---------------------------------------------------------------------------
 
 
+def _load_arenas_config(query_design_id: str) -> dict:
+    """Load ``arenas_config`` from the QueryDesign row identified by *query_design_id*.
+
+    Uses a synchronous SQLAlchemy session (Celery worker context).  Returns an
+    empty dict if the design is not found or on any DB error.
+
+    Args:
+        query_design_id: UUID string of the owning query design.
+
+    Returns:
+        The ``arenas_config`` JSONB dict, or ``{}`` on failure.
+    """
+    try:
+        from sqlalchemy import text
+
+        from issue_observatory.core.database import get_sync_session
+
+        with get_sync_session() as session:
+            row = session.execute(
+                text(
+                    "SELECT arenas_config FROM query_designs WHERE id = :id"
+                ),
+                {"id": query_design_id},
+            ).fetchone()
+            if row and row[0]:
+                return dict(row[0])
+    except Exception as exc:
+        logger.warning(
+            "common_crawl: failed to load arenas_config for design %s: %s",
+            query_design_id,
+            exc,
+        )
+    return {}
+
+
+def _fetch_content_enabled(query_design_id: str) -> bool:
+    """Return whether WARC content should be fetched for the query design.
+
+    Researchers opt out with ``arenas_config["common_crawl"]["fetch_content"]
+    = false``, keeping only the index metadata.  Defaults to ``True``.
+    """
+    cc_config = _load_arenas_config(query_design_id).get("common_crawl") or {}
+    if not isinstance(cc_config, dict):
+        return True
+    return bool(cc_config.get("fetch_content", True))
+
+
 def _update_task_status(
     collection_run_id: str,
     arena: str,
@@ -129,8 +176,9 @@ def common_crawl_collect_terms(
     """Collect Common Crawl index entries for Danish pages matching the terms.
 
     Queries the CC Index API for ``.dk`` domain captures and filters
-    client-side by URL substring matching. Returns index metadata only;
-    WARC retrieval is out of scope.
+    client-side by URL substring matching.  Unless the query design's
+    ``arenas_config["common_crawl"]["fetch_content"]`` is ``False``, the
+    WARC record of each entry is fetched and its article text extracted.
 
     Args:
         query_design_id: UUID string of the owning query design.
@@ -142,9 +190,12 @@ def common_crawl_collect_terms(
         max_results: Upper bound on returned records.
         cc_index: Common Crawl index identifier to query. Defaults to
             ``CC_DEFAULT_INDEX`` if not specified.
+        language_filter: Unused by Common Crawl; passed through for
+            interface consistency.
 
     Returns:
-        Dict with ``records_collected``, ``status``, ``arena``, ``tier``.
+        Dict with ``records_collected``, ``status``, ``arena``, ``tier``,
+        and ``fetch_content`` (bool reflecting the resolved setting).
 
     Raises:
         ArenaRateLimitError: Triggers automatic retry with exponential backoff.
@@ -157,11 +208,14 @@ def common_crawl_collect_terms(
     _redis_url = _settings.redis_url
     _task_start = time.monotonic()
 
+    fetch_content = _fetch_content_enabled(query_design_id)
+
     logger.info(
-        "common_crawl: collect_by_terms started — run=%s terms=%d tier=%s",
+        "common_crawl: collect_by_terms started — run=%s terms=%d tier=%s fetch_content=%s",
         collection_run_id,
         len(terms),
         tier,
+        fetch_content,
     )
     _update_task_status(collection_run_id, _PLATFORM, "running")
     publish_task_update(
@@ -210,6 +264,7 @@ def common_crawl_collect_terms(
             date_from=_dt.fromisoformat(date_from),
             date_to=_dt.fromisoformat(date_to),
             terms=terms,
+            planned_gaps=_extra.get("coverage_gaps"),
         )
         if not gaps:
             logger.info(
@@ -235,12 +290,13 @@ def common_crawl_collect_terms(
                 "arena": _ARENA,
                 "tier": tier,
                 "coverage_skip": True,
+                "fetch_content": fetch_content,
             }
         effective_date_from = gaps[0][0].isoformat()
         effective_date_to = gaps[-1][1].isoformat()
 
     try:
-        records = asyncio.run(
+        records = run_async(
             collector.collect_by_terms(
                 terms=terms,
                 tier=tier_enum,
@@ -248,6 +304,7 @@ def common_crawl_collect_terms(
                 date_to=effective_date_to,
                 max_results=max_results,
                 language_filter=language_filter,
+                fetch_content=fetch_content,
             )
         )
     except ArenaRateLimitError:
@@ -336,6 +393,7 @@ def common_crawl_collect_terms(
         "status": "completed",
         "arena": _ARENA,
         "tier": tier,
+        "fetch_content": fetch_content,
     }
 
 
@@ -364,7 +422,8 @@ def common_crawl_collect_actors(
     """Collect Common Crawl index entries for the specified actor domains.
 
     Actor IDs must be registered domain names (e.g. ``"dr.dk"``). Queries
-    the CC Index for all captures of each domain.
+    the CC Index for all captures of each domain.  WARC content is fetched
+    as in :func:`common_crawl_collect_terms`.
 
     Args:
         query_design_id: UUID string of the owning query design.
@@ -377,7 +436,8 @@ def common_crawl_collect_actors(
         cc_index: Common Crawl index identifier to query.
 
     Returns:
-        Dict with ``records_collected``, ``status``, ``arena``, ``tier``.
+        Dict with ``records_collected``, ``status``, ``arena``, ``tier``,
+        and ``fetch_content``.
     """
     from issue_observatory.arenas.base import Tier
     from issue_observatory.arenas.web.common_crawl.config import CC_DEFAULT_INDEX
@@ -386,11 +446,14 @@ def common_crawl_collect_actors(
     _redis_url = _settings.redis_url
     _task_start = time.monotonic()
 
+    fetch_content = _fetch_content_enabled(query_design_id)
+
     logger.info(
-        "common_crawl: collect_by_actors started — run=%s actors=%d tier=%s",
+        "common_crawl: collect_by_actors started — run=%s actors=%d tier=%s fetch_content=%s",
         collection_run_id,
         len(actor_ids),
         tier,
+        fetch_content,
     )
     _update_task_status(collection_run_id, _PLATFORM, "running")
     publish_task_update(
@@ -439,6 +502,7 @@ def common_crawl_collect_actors(
             date_from=_dt.fromisoformat(date_from),
             date_to=_dt.fromisoformat(date_to),
             actor_ids=actor_ids,
+            planned_gaps=_extra.get("coverage_gaps"),
         )
         if not gaps:
             logger.info(
@@ -464,18 +528,20 @@ def common_crawl_collect_actors(
                 "arena": _ARENA,
                 "tier": tier,
                 "coverage_skip": True,
+                "fetch_content": fetch_content,
             }
         effective_date_from = gaps[0][0].isoformat()
         effective_date_to = gaps[-1][1].isoformat()
 
     try:
-        records = asyncio.run(
+        records = run_async(
             collector.collect_by_actors(
                 actor_ids=actor_ids,
                 tier=tier_enum,
                 date_from=effective_date_from,
                 date_to=effective_date_to,
                 max_results=max_results,
+                fetch_content=fetch_content,
             )
         )
     except ArenaRateLimitError:
@@ -564,6 +630,7 @@ def common_crawl_collect_actors(
         "status": "completed",
         "arena": _ARENA,
         "tier": tier,
+        "fetch_content": fetch_content,
     }
 
 
@@ -582,6 +649,6 @@ def common_crawl_health_check() -> dict[str, Any]:
         ``checked_at``, and optionally ``detail``.
     """
     collector = CommonCrawlCollector()
-    result: dict[str, Any] = asyncio.run(collector.health_check())
+    result: dict[str, Any] = run_async(collector.health_check())
     logger.info("common_crawl: health_check status=%s", result.get("status", "unknown"))
     return result
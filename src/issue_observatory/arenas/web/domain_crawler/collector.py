@@ -14,7 +14,10 @@ Collection modes:
   domains and returns all articles without term filtering.
 
 Per-domain rate limiting uses ``asyncio.Semaphore`` instances and a politeness
-delay between consecutive requests to the same domain.
+delay between consecutive requests to the same domain, raised to the site's
+robots.txt ``Crawl-delay`` when that is longer.  robots.txt rules are shared
+with the scraper and other workers through
+:class:`~issue_observatory.scraper.robots.RobotsCache`.
 """
 
 from __future__ import annotations
@@ -55,6 +58,7 @@ from issue_observatory.core.normalizer import Normalizer
 from issue_observatory.scraper.config import DEFAULT_TIMEOUT, USER_AGENT
 from issue_observatory.scraper.content_extractor import ExtractedContent, extract_from_html
 from issue_observatory.scraper.http_fetcher import FetchResult, fetch_url
+from issue_observatory.scraper.robots import RobotsCache
 
 logger = logging.getLogger(__name__)
 
@@ -414,8 +418,10 @@ class DomainCrawlerCollector(ArenaCollector):
         }
 
         try:
-            robots_cache: dict[str, bool] = {}
-            async with self._build_http_client() as client:
+            async with (
+                self._build_http_client() as client,
+                RobotsCache.from_settings() as robots_cache,
+            ):
                 result = await fetch_url(
                     HEALTH_CHECK_URL,
                     client=client,
@@ -493,7 +499,6 @@ class DomainCrawlerCollector(ArenaCollector):
         Returns:
             Flat list of raw article dicts from all domains.
         """
-        robots_cache: dict[str, bool] = {}
         all_articles: list[dict[str, Any]] = []
         last_record_at = time.monotonic()
 
@@ -503,7 +508,10 @@ class DomainCrawlerCollector(ArenaCollector):
             for i in range(0, len(domains), FETCH_CONCURRENCY)
         ]
 
-        async with self._build_http_client() as client:
+        async with (
+            self._build_http_client() as client,
+            RobotsCache.from_settings() as robots_cache,
+        ):
             for batch_idx, batch in enumerate(batches):
                 # Idle timeout check between batches
                 if batch_idx > 0:
@@ -560,7 +568,7 @@ class DomainCrawlerCollector(ArenaCollector):
         self,
         domain: str,
         client: httpx.AsyncClient,
-        robots_cache: dict[str, bool],
+        robots_cache: RobotsCache,
     ) -> list[dict[str, Any]]:
         """Crawl a single domain: fetch front page → discover links → fetch articles.
 
@@ -639,7 +647,7 @@ class DomainCrawlerCollector(ArenaCollector):
 
             # Politeness delay between requests to same domain
             if i < len(article_urls) - 1:
-                await asyncio.sleep(DOMAIN_DELAY)
+                await asyncio.sleep(max(DOMAIN_DELAY, robots_cache.crawl_delay(url) or 0.0))
 
         logger.info(
             "domain_crawler: '%s' — %d/%d articles extracted",
@@ -653,7 +661,7 @@ class DomainCrawlerCollector(ArenaCollector):
         domain: str,
         front_page_url: str,
         client: httpx.AsyncClient,
-        robots_cache: dict[str, bool],
+        robots_cache: RobotsCache,
     ) -> dict[str, Any] | None:
         """Fetch and extract a single article URL.
 
@@ -15,7 +15,6 @@ Retry policy:
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import time
 from typing import Any
@@ -25,6 +24,7 @@ from issue_observatory.config.settings import get_settings
 from issue_observatory.core.event_bus import elapsed_since, publish_task_update
 from issue_observatory.core.exceptions import ArenaCollectionError
 from issue_observatory.workers.celery_app import celery_app
+from issue_observatory.workers.runtime import run_async
 
 logger = logging.getLogger(__name__)
 
@@ -285,7 +285,7 @@ def domain_crawler_collect_terms(
         )
 
     try:
-        asyncio.run(
+        run_async(
             collector.collect_by_terms(
                 terms=terms,
                 tier=tier_enum,
@@ -475,7 +475,7 @@ def domain_crawler_collect_actors(
         )
 
     try:
-        asyncio.run(
+        run_async(
             collector.collect_by_actors(
                 actor_ids=actor_ids,
                 tier=tier_enum,
@@ -555,7 +555,7 @@ def domain_crawler_collect_actors(
 def domain_crawler_health_check() -> dict[str, Any]:
     """Run a connectivity health check for the Domain Crawler arena."""
     collector = DomainCrawlerCollector()
-    result: dict[str, Any] = asyncio.run(collector.health_check())
+    result: dict[str, Any] = run_async(collector.health_check())
     logger.info(
         "domain_crawler: health_check status=%s", result.get("status", "unknown")
     )
@@ -14,7 +14,10 @@ Collection modes:
   presences (``platform="url_scraper"``).  Returns all content without term
   filtering.
 
-Per-domain rate limiting uses ``asyncio.Semaphore`` instances.  One URL
+Per-domain rate limiting uses ``asyncio.Semaphore`` instances and a
+politeness delay, raised to the site's robots.txt ``Crawl-delay`` when that
+is longer.  robots.txt rules are shared with the scraper and other workers
+through :class:`~issue_observatory.scraper.robots.RobotsCache`.  One URL
 failure never blocks remaining URLs (per-URL error isolation).
 
 Helpers are split across two sub-modules:
@@ -54,6 +57,7 @@ from issue_observatory.core.normalizer import Normalizer
 from issue_observatory.scraper.config import DEFAULT_TIMEOUT, USER_AGENT
 from issue_observatory.scraper.content_extractor import ExtractedContent, extract_from_html
 from issue_observatory.scraper.http_fetcher import FetchResult, fetch_url
+from issue_observatory.scraper.robots import RobotsCache
 
 logger = logging.getLogger(__name__)
 
@@ -378,8 +382,10 @@ class UrlScraperCollector(ArenaCollector):
             pass
 
         try:
-            robots_cache: dict[str, bool] = {}
-            async with self._build_http_client(Tier.FREE) as client:
+            async with (
+                self._build_http_client(Tier.FREE) as client,
+                RobotsCache.from_settings() as robots_cache,
+            ):
                 result = await fetch_url(
                     HEALTH_CHECK_URL,
                     client=client,
@@ -476,9 +482,11 @@ class UrlScraperCollector(ArenaCollector):
         domain_semaphores: dict[str, asyncio.Semaphore] = {
             d: asyncio.Semaphore(1) for d in domain_groups
         }
-        robots_cache: dict[str, bool] = {}
 
-        async with self._build_http_client(tier) as client:
+        async with (
+            self._build_http_client(tier) as client,
+            RobotsCache.from_settings() as robots_cache,
+        ):
             tasks = [
                 self._fetch_domain_urls(
                     domain_urls=domain_urls,
@@ -508,17 +516,20 @@ class UrlScraperCollector(ArenaCollector):
         client: httpx.AsyncClient,
         tier: Tier,
         domain_delay: float,
-        robots_cache: dict[str, bool],
+        robots_cache: RobotsCache,
     ) -> list[dict[str, Any]]:
         """Fetch all URLs for a single domain sequentially with a politeness delay.
 
+        The delay between two requests is ``domain_delay`` or the site's
+        robots.txt crawl delay, whichever is longer.
+
         Args:
             domain_urls: URLs belonging to this domain.
             semaphore: Per-domain semaphore (ensures sequential access).
             client: Shared HTTP client.
             tier: Operational tier (used for Playwright fallback decision).
-            domain_delay: Seconds to sleep between consecutive requests.
-            robots_cache: Shared robots.txt cache for this run.
+            domain_delay: Minimum seconds to sleep between consecutive requests.
+            robots_cache: Shared robots.txt cache.
 
         Returns:
             List of raw fetch record dicts.
@@ -529,7 +540,9 @@ class UrlScraperCollector(ArenaCollector):
                 record = await self._fetch_single_url(url, client, tier, robots_cache)
                 records.append(record)
                 if i < len(domain_urls) - 1:
-                    await asyncio.sleep(domain_delay)
+                    await asyncio.sleep(
+                        max(domain_delay, robots_cache.crawl_delay(url) or 0.0)
+                    )
         return records
 
     async def _fetch_single_url(
@@ -537,7 +550,7 @@ class UrlScraperCollector(ArenaCollector):
         url: str,
         client: httpx.AsyncClient,
         tier: Tier,
-        robots_cache: dict[str, bool],
+        robots_cache: RobotsCache,
     ) -> dict[str, Any]:
         """Fetch and extract content from a single URL with error isolation.
 
@@ -549,7 +562,7 @@ class UrlScraperCollector(ArenaCollector):
             url: Target URL.
             client: Shared HTTP client.
             tier: Operational tier (used for Playwright fallback decision).
-            robots_cache: Shared robots.txt cache for this run.
+            robots_cache: Shared robots.txt cache.
 
         Returns:
             Raw fetch record dict with ``_fetch_failed`` boolean flag.
@@ -23,7 +23,6 @@ and pages do not update on a predictable schedule.
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import time
 from typing import Any
@@ -33,6 +32,7 @@ from issue_observatory.config.settings import get_settings
 from issue_observatory.core.event_bus import elapsed_since, publish_task_update
 from issue_observatory.core.exceptions import ArenaCollectionError
 from issue_observatory.workers.celery_app import celery_app
+from issue_observatory.workers.runtime import run_async
 
 logger = logging.getLogger(__name__)
 
@@ -200,7 +200,7 @@ def url_scraper_collect_terms(
     collector = UrlScraperCollector()
 
     try:
-        records = asyncio.run(
+        records = run_async(
             collector.collect_by_terms(
                 terms=terms,
                 tier=tier_enum,
@@ -370,7 +370,7 @@ def url_scraper_collect_actors(
     collector = UrlScraperCollector()
 
     try:
-        records = asyncio.run(
+        records = run_async(
             collector.collect_by_actors(
                 actor_ids=actor_ids,
                 tier=tier_enum,
@@ -466,7 +466,7 @@ def url_scraper_health_check() -> dict[str, Any]:
         ``detail``.
     """
     collector = UrlScraperCollector()
-    result: dict[str, Any] = asyncio.run(collector.health_check())
+    result: dict[str, Any] = run_async(collector.health_check())
     logger.info(
         "url_scraper: health_check status=%s", result.get("status", "unknown")
     )
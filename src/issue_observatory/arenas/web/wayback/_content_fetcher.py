@@ -35,6 +35,7 @@ from issue_observatory.arenas.web.wayback.config import (
 )
 from issue_observatory.scraper.content_extractor import extract_from_html
 from issue_observatory.scraper.http_fetcher import fetch_url
+from issue_observatory.scraper.robots import RobotsCache
 
 logger = logging.getLogger(__name__)
 
@@ -72,7 +73,7 @@ async def fetch_single_record_content(
     record: dict[str, Any],
     client: httpx.AsyncClient,
     semaphore: asyncio.Semaphore,
-    robots_cache: dict[str, bool],
+    robots_cache: RobotsCache | None = None,
 ) -> dict[str, Any]:
     """Fetch and extract text content for a single CDX record.
 
@@ -100,8 +101,10 @@ async def fetch_single_record_content(
         record: Normalized CDX record dict (mutated in place).
         client: Shared :class:`httpx.AsyncClient` for content requests.
         semaphore: Semaphore(1) limiting concurrent content fetches.
-        robots_cache: Mutable robots.txt result cache (pass-through to
-            :func:`~issue_observatory.scraper.http_fetcher.fetch_url`).
+        robots_cache: Optional robots.txt cache (pass-through to
+            :func:`~issue_observatory.scraper.http_fetcher.fetch_url`; unused
+            because archive.org playback URLs are fetched without a
+            robots.txt check).
 
     Returns:
         The mutated *record* dict.
@@ -252,7 +255,6 @@ async def fetch_content_for_records(
     )
 
     content_semaphore = asyncio.Semaphore(1)
-    robots_cache: dict[str, bool] = {}
 
     async with httpx.AsyncClient(
         timeout=35.0,
@@ -260,9 +262,7 @@ async def fetch_content_for_records(
         headers={"User-Agent": _CONTENT_UA},
     ) as content_client:
         coro_list = [
-            fetch_single_record_content(
-                records[idx], content_client, content_semaphore, robots_cache
-            )
+            fetch_single_record_content(records[idx], content_client, content_semaphore)
             for idx, _ in fetch_candidates
         ]
         await asyncio.gather(*coro_list, return_exceptions=False)
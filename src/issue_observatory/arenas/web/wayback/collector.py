@@ -56,6 +56,7 @@ from issue_observatory.arenas.web.wayback.config import (
 )
 from issue_observatory.config.tiers import TierConfig
 from issue_observatory.core.normalizer import Normalizer
+from issue_observatory.workers.runtime import shared_http_transport
 
 logger = logging.getLogger(__name__)
 
@@ -87,6 +88,7 @@ class WaybackCollector(ArenaCollector):
     platform_name: str = "wayback"
     supported_tiers: list[Tier] = [Tier.FREE]
     temporal_mode: TemporalMode = TemporalMode.HISTORICAL
+    supports_coverage_check: bool = True
 
     def __init__(
         self,
@@ -448,6 +450,7 @@ class WaybackCollector(ArenaCollector):
             headers={
                 "User-Agent": "IssueObservatory/1.0 (wayback-collector; research use)"
             },
+            transport=shared_http_transport(),
         )
 
     async def _rate_limit_wait(self) -> None:
@@ -19,7 +19,6 @@ collection outcomes.
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import time
 from typing import Any
@@ -32,6 +31,7 @@ from issue_observatory.core.exceptions import (
     ArenaRateLimitError,
 )
 from issue_observatory.workers.celery_app import celery_app
+from issue_observatory.workers.runtime import run_async
 
 logger = logging.getLogger(__name__)
 
@@ -218,6 +218,7 @@ def wayback_collect_terms(
             date_from=_dt.fromisoformat(date_from),
             date_to=_dt.fromisoformat(date_to),
             terms=terms,
+            planned_gaps=_extra.get("coverage_gaps"),
         )
         if not gaps:
             logger.info(
@@ -249,7 +250,7 @@ def wayback_collect_terms(
         effective_date_to = gaps[-1][1].isoformat()
 
     try:
-        records = asyncio.run(
+        records = run_async(
             collector.collect_by_terms(
                 terms=terms,
                 tier=tier_enum,
@@ -459,6 +460,7 @@ def wayback_collect_actors(
             date_from=_dt.fromisoformat(date_from),
             date_to=_dt.fromisoformat(date_to),
             actor_ids=actor_ids,
+            planned_gaps=_extra.get("coverage_gaps"),
         )
         if not gaps:
             logger.info(
@@ -490,7 +492,7 @@ def wayback_collect_actors(
         effective_date_to = gaps[-1][1].isoformat()
 
     try:
-        records = asyncio.run(
+        records = run_async(
             collector.collect_by_actors(
                 actor_ids=actor_ids,
                 tier=tier_enum,
@@ -606,6 +608,6 @@ def wayback_health_check() -> dict[str, Any]:
         ``checked_at``, and optionally ``detail``.
     """
     collector = WaybackCollector()
-    result: dict[str, Any] = asyncio.run(collector.health_check())
+    result: dict[str, Any] = run_async(collector.health_check())
     logger.info("wayback: health_check status=%s", result.get("status", "unknown"))
     return result
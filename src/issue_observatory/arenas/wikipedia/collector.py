@@ -63,6 +63,7 @@ from issue_observatory.core.exceptions import (
     ArenaRateLimitError,
 )
 from issue_observatory.core.normalizer import Normalizer
+from issue_observatory.workers.runtime import shared_http_transport
 
 logger = logging.getLogger(__name__)
 
@@ -1045,6 +1046,7 @@ class WikipediaCollector(ArenaCollector):
         return httpx.AsyncClient(
             timeout=30.0,
             headers=self._make_headers(),
+            transport=shared_http_transport(),
         )
 
     def _make_headers(self) -> dict[str, str]:
@@ -21,7 +21,6 @@ logged at WARNING and do not mask collection outcomes).
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import time
 from typing import Any
@@ -34,6 +33,7 @@ from issue_observatory.core.exceptions import (
     ArenaRateLimitError,
 )
 from issue_observatory.workers.celery_app import celery_app
+from issue_observatory.workers.runtime import run_async
 
 logger = logging.getLogger(__name__)
 
@@ -257,7 +257,7 @@ def wikipedia_collect_terms(
     collector.configure_batch_persistence(sink=sink, batch_size=100, collection_run_id=collection_run_id)
 
     try:
-        remaining = asyncio.run(
+        remaining = run_async(
             collector.collect_by_terms(
                 terms=terms,
                 tier=tier_enum,
@@ -437,7 +437,7 @@ def wikipedia_collect_actors(
     collector.configure_batch_persistence(sink=sink, batch_size=100, collection_run_id=collection_run_id)
 
     try:
-        remaining = asyncio.run(
+        remaining = run_async(
             collector.collect_by_actors(
                 actor_ids=actor_ids,
                 tier=tier_enum,
@@ -535,7 +535,7 @@ def wikipedia_health_check() -> dict[str, Any]:
         ``checked_at``, and optionally ``site`` or ``detail``.
     """
     collector = WikipediaCollector()
-    result: dict[str, Any] = asyncio.run(collector.health_check())
+    result: dict[str, Any] = run_async(collector.health_check())
     logger.info(
         "wikipedia: health_check status=%s", result.get("status", "unknown")
     )
@@ -59,6 +59,7 @@ from issue_observatory.core.exceptions import (
 )
 from issue_observatory.core.language_utils import resolve_x_lang_operator
 from issue_observatory.core.normalizer import Normalizer
+from issue_observatory.workers.runtime import shared_http_transport
 
 logger = logging.getLogger(__name__)
 
@@ -88,6 +89,7 @@ class XTwitterCollector(ArenaCollector):
     supported_tiers: list[Tier] = [Tier.MEDIUM, Tier.PREMIUM]
     temporal_mode: TemporalMode = TemporalMode.RECENT
     supports_actor_collection: bool = True
+    supports_coverage_check: bool = True
     source_list_config_key: str | None = "custom_accounts"
 
     def __init__(
@@ -1062,7 +1064,7 @@ class XTwitterCollector(ArenaCollector):
         """
         if self._http_client is not None:
             return self._http_client  # type: ignore[return-value]
-        return httpx.AsyncClient(timeout=30.0)
+        return httpx.AsyncClient(timeout=30.0, transport=shared_http_transport())
 
     async def _get_twitterapiio(
         self,
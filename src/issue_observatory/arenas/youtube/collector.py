@@ -53,6 +53,7 @@ from issue_observatory.core.exceptions import (
 )
 from issue_observatory.core.language_utils import resolve_youtube_params
 from issue_observatory.core.normalizer import Normalizer
+from issue_observatory.workers.runtime import shared_http_transport
 
 logger = logging.getLogger(__name__)
 
@@ -99,6 +100,7 @@ class YouTubeCollector(ArenaCollector):
     supported_tiers: list[Tier] = [Tier.FREE]
     temporal_mode: TemporalMode = TemporalMode.MIXED
     supports_actor_collection: bool = True
+    supports_coverage_check: bool = True
     source_list_config_key: str | None = "custom_channels"
 
     def __init__(
@@ -959,7 +961,7 @@ class YouTubeCollector(ArenaCollector):
         """Return an HTTP client for use as an async context manager."""
         if self._http_client is not None:
             return self._http_client  # type: ignore[return-value]
-        return httpx.AsyncClient(timeout=30.0)
+        return httpx.AsyncClient(timeout=30.0, transport=shared_http_transport())
 
     # ------------------------------------------------------------------
     # Static conversion helpers
@@ -34,7 +34,6 @@ Database updates:
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import time
 from typing import Any
@@ -49,6 +48,7 @@ from issue_observatory.core.exceptions import (
     NoCredentialAvailableError,
 )
 from issue_observatory.workers.celery_app import celery_app
+from issue_observatory.workers.runtime import run_async
 
 logger = logging.getLogger(__name__)
 
@@ -256,6 +256,7 @@ def youtube_collect_terms(
                 date_from=_dt.fromisoformat(date_from) if isinstance(date_from, str) else date_from,
                 date_to=_dt.fromisoformat(date_to) if isinstance(date_to, str) else date_to,
                 terms=terms,
+                planned_gaps=_extra.get("coverage_gaps"),
             )
             if not gaps:
                 logger.info(
@@ -306,7 +307,7 @@ def youtube_collect_terms(
             )
 
         try:
-            remaining = asyncio.run(
+            remaining = run_async(
                 collector.collect_by_terms(
                     terms=terms,
                     tier=tier_enum,
@@ -563,6 +564,7 @@ def youtube_collect_actors(
                 date_from=_dt.fromisoformat(date_from) if isinstance(date_from, str) else date_from,
                 date_to=_dt.fromisoformat(date_to) if isinstance(date_to, str) else date_to,
                 actor_ids=actor_ids,
+                planned_gaps=_extra.get("coverage_gaps"),
             )
             if not gaps:
                 logger.info(
@@ -614,7 +616,7 @@ def youtube_collect_actors(
             )
 
         try:
-            remaining = asyncio.run(
+            remaining = run_async(
                 collector.collect_by_actors(
                     actor_ids=actor_ids,
                     tier=tier_enum,
@@ -782,7 +784,7 @@ def youtube_health_check() -> dict[str, Any]:
     """
     credential_pool = CredentialPool()
     collector = YouTubeCollector(credential_pool=credential_pool)
-    result: dict[str, Any] = asyncio.run(collector.health_check())
+    result: dict[str, Any] = run_async(collector.health_check())
     logger.info(
         "youtube: health_check status=%s", result.get("status", "unknown")
     )
@@ -905,7 +907,7 @@ def youtube_collect_comments(
         )
 
         try:
-            comment_records = asyncio.run(
+            comment_records = run_async(
                 collector.collect_comments(
                     post_ids=post_ids,
                     tier=tier_enum,
@@ -228,6 +228,68 @@ class Settings(BaseSettings):
     """Send a low-credit warning email when the user's remaining credit
     balance drops below this value after a collection run settles."""
 
+    # ------------------------------------------------------------------
+    # Enrichment
+    # ------------------------------------------------------------------
+
+    enrichment_process_workers: int = 0
+    """Process-pool size for CPU-bound enrichers (language detection, NER)
+    in ``enrich_collection_run``.  ``0`` runs them inside the Celery worker
+    process.  Only effective when the worker pool allows child processes
+    (e.g. ``--pool=threads`` or ``--pool=solo``); under the default prefork
+    pool the pipeline falls back to in-process execution."""
+
+    warc_extract_workers: int = 2
+    """Process-pool size for article extraction from Common Crawl WARC
+    records.  ``0`` extracts in a worker thread instead.  As with
+    ``enrichment_process_workers``, the pool is only usable when the
+    Celery pool allows child processes; otherwise threads are used."""
+
+    # ------------------------------------------------------------------
+    # Analysis result cache
+    # ------------------------------------------------------------------
+
+    analysis_cache_enabled: bool = True
+    """Cache analysis endpoint results in Redis.  Entries are invalidated
+    when the underlying run or design data changes (see
+    ``core/analysis_cache.py``)."""
+
+    analysis_cache_ttl_seconds: int = 86_400
+    """Expiry of cached analysis results.  Cached results are invalidated by
+    bumping data versions when ``content_records`` or actors change; the TTL
+    bounds how long superseded entries occupy Redis memory."""
+
+    analysis_process_workers: int = 2
+    """Size of the API process pool for CPU-bound analysis such as TF-IDF
+    emergent-term extraction.  ``0`` runs that work in a thread instead."""
+
+    # ------------------------------------------------------------------
+    # Content rollups
+    # ------------------------------------------------------------------
+
+    content_rollups_enabled: bool = True
+    """Maintain the per-day ``content_daily_rollups`` tables on insert and
+    serve dashboard counts and volume charts from them (see
+    ``core/content_rollups.py``).  After re-enabling, run the
+    ``reconcile_content_rollups`` task to repair rows missed meanwhile."""
+
+    # ------------------------------------------------------------------
+    # Live streaming
+    # ------------------------------------------------------------------
+
+    live_streaming_enabled: bool = False
+    """Serve live tracking of arenas with a ``stream_live`` task (Bluesky)
+    from one long-running firehose connection instead of daily searches.
+    Requires a Celery worker consuming the ``streaming`` queue."""
+
+    # ------------------------------------------------------------------
+    # Credential pool
+    # ------------------------------------------------------------------
+
+    credential_cache_ttl_seconds: int = 30
+    """Lifetime of the in-process cache of decrypted credentials used by
+    ``CredentialPool.acquire``.  Admin edits invalidate it immediately."""
+
     # ------------------------------------------------------------------
     # Observability
     # ------------------------------------------------------------------
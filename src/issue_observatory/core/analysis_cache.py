@@ -0,0 +1,551 @@
+"""Redis-backed result cache for analysis endpoints.
+
+Analysis endpoints (volume over time, top actors, emergent terms, network
+graphs, …) re-aggregate ``content_records`` on every request.  This module
+caches their JSON-ready results in Redis and invalidates them precisely by
+*data version* rather than by TTL.
+
+Data versions
+-------------
+Every collection run and query design has an integer version counter in
+Redis, plus one global counter::
+
+    analysis:version:run:{run_id}
+    analysis:version:design:{design_id}
+    analysis:version:global
+
+Writers bump the counters of the run (and its design) they touched —
+``persist_collected_records``, the enrichment tasks, the scraper and the
+dedup / engagement-refresh maintenance tasks — via
+:func:`bump_data_versions`.  API routes and services that rewrite existing
+records (actor merge/split, content re-fetch) look the affected scopes up
+with :func:`content_record_scopes` and call
+:meth:`AnalysisCache.invalidate`; so do the actor routes, since results
+such as unified top actors show ``actors.canonical_name``.  Retention
+deletes, which span all runs, bump the global counter.
+
+Versions only track ``content_records`` and the actors joined to them.
+Inputs kept elsewhere must stay out of cached results: the emergent-terms
+routes, for instance, exclude the design's search terms after the cache read
+rather than caching a ranking that already excludes them.
+
+Cache keys
+----------
+A cache key is ``analysis:cache:{endpoint}:{digest}`` where the digest is a
+SHA-256 over the normalised request parameters *and* the current versions
+of every scope the result depends on.  A bump therefore makes all affected
+entries unreachable immediately; they age out through
+``Settings.analysis_cache_ttl_seconds``.
+
+Single flight
+-------------
+Concurrent identical requests compute the result once:
+
+- Within a process, callers share an in-flight :class:`asyncio.Future`.
+- Across API processes, the first caller takes a short Redis lock
+  (``SET NX PX``); the others poll for the cached value until the lock
+  holder publishes it or the wait budget runs out, then compute themselves.
+
+State blobs
+-----------
+:meth:`AnalysisCache.load_state` / :meth:`AnalysisCache.store_state` keep
+unversioned intermediate state under ``analysis:state:{name}`` for analyses
+that update incrementally instead of recomputing (emergent terms).  Large
+states are split into chunks stored under ``analysis:state:{name}:{i}``.
+
+Redis failures never fail a request: the cache degrades to computing the
+result directly.
+
+Usage in a route::
+
+    return await get_analysis_cache().get_or_compute(
+        "run.volume",
+        lambda: get_volume_over_time(db, run_id=run_id, ...),
+        params={"arena": arena, "granularity": granularity},
+        run_ids=[run_id],
+    )
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import secrets
+import time
+import uuid
+from collections.abc import Awaitable, Callable, Iterable
+from datetime import date, datetime
+from typing import Any, TypeVar
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+_VERSION_PREFIX = "analysis:version"
+_CACHE_PREFIX = "analysis:cache"
+_LOCK_PREFIX = "analysis:lock"
+_STATE_PREFIX = "analysis:state"
+_GLOBAL_VERSION_KEY = f"{_VERSION_PREFIX}:global"
+
+# Interval between polls while another process computes the same result.
+_POLL_INTERVAL_SECONDS = 0.05
+
+# Delete the lock only if it still holds our token (it may have expired and
+# been taken over by another process in the meantime).
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+def data_version_key(scope: str, scope_id: uuid.UUID | str) -> str:
+    """Return the Redis key holding the data version of one scope.
+
+    Args:
+        scope: ``"run"`` or ``"design"``.
+        scope_id: UUID of the collection run or query design.
+
+    Returns:
+        The Redis key string.
+    """
+    return f"{_VERSION_PREFIX}:{scope}:{scope_id}"
+
+
+def bump_data_versions(
+    redis_url: str,
+    run_ids: Iterable[uuid.UUID | str] = (),
+    design_ids: Iterable[uuid.UUID | str] = (),
+    global_scope: bool = False,
+) -> None:
+    """Invalidate cached analysis results for the given runs and designs.
+
+    Designed to be called from synchronous Celery task bodies after they
+    commit a change to ``content_records``.  Opens a short-lived synchronous
+    Redis connection and increments all counters in one pipeline.  Like the
+    event bus publishers this is fire-and-forget: a failure is logged at
+    WARNING and never propagates.
+
+    Args:
+        redis_url: Redis connection URL (``settings.redis_url``).
+        run_ids: Collection runs whose data changed.
+        design_ids: Query designs whose data changed.
+        global_scope: When ``True``, bump the global version, invalidating
+            every cached analysis result.
+    """
+    keys = [data_version_key("run", r) for r in run_ids if r]
+    keys += [data_version_key("design", d) for d in design_ids if d]
+    if global_scope:
+        keys.append(_GLOBAL_VERSION_KEY)
+    if not keys:
+        return
+    try:
+        import redis as redis_lib
+
+        r = redis_lib.from_url(redis_url, decode_responses=True)
+        try:
+            pipe = r.pipeline(transaction=False)
+            for key in keys:
+                pipe.incr(key)
+            pipe.execute()
+        finally:
+            r.close()
+    except Exception as exc:
+        logger.warning("analysis_cache.bump_failed", keys=keys, error=str(exc))
+
+
+async def content_record_scopes(
+    db: Any, *criteria: Any
+) -> tuple[set[uuid.UUID], set[uuid.UUID]]:
+    """Return the runs and designs of the ``content_records`` matching *criteria*.
+
+    Call before an in-place rewrite of existing records (actor merges,
+    content re-fetches) to learn which scopes to pass to
+    :meth:`AnalysisCache.invalidate` once the change is committed.
+
+    Args:
+        db: Active async database session.
+        *criteria: SQLAlchemy filter expressions on ``UniversalContentRecord``.
+
+    Returns:
+        Tuple of (collection run IDs, query design IDs); ``NULL``s are dropped.
+    """
+    from sqlalchemy import select
+
+    from issue_observatory.core.models.content import UniversalContentRecord
+
+    rows = await db.execute(
+        select(
+            UniversalContentRecord.collection_run_id,
+            UniversalContentRecord.query_design_id,
+        )
+        .where(*criteria)
+        .distinct()
+    )
+    run_ids: set[uuid.UUID] = set()
+    design_ids: set[uuid.UUID] = set()
+    for run_id, design_id in rows.all():
+        if run_id is not None:
+            run_ids.add(run_id)
+        if design_id is not None:
+            design_ids.add(design_id)
+    return run_ids, design_ids
+
+
+def _normalise_param(value: Any) -> Any:
+    """Convert a request parameter into a stable JSON-serialisable value."""
+    if isinstance(value, datetime | date):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, dict):
+        return {str(k): _normalise_param(v) for k, v in value.items()}
+    if isinstance(value, list | tuple | set | frozenset):
+        items = [_normalise_param(v) for v in value]
+        return sorted(items, key=repr) if isinstance(value, set | frozenset) else items
+    return value
+
+
+class AnalysisCache:
+    """Versioned, single-flight analysis result cache.
+
+    Args:
+        redis_url: Redis connection URL.  Defaults to ``settings.redis_url``.
+        ttl_seconds: Expiry of cached entries.  Invalidation is driven by
+            data versions; the TTL only bounds memory held by superseded
+            entries.
+        lock_ttl_seconds: Expiry of the cross-process compute lock.  Should
+            exceed the slowest analysis query.
+        wait_timeout_seconds: How long a caller waits for another process's
+            result before computing it itself.
+        enabled: When ``False``, every call computes directly.
+    """
+
+    def __init__(
+        self,
+        redis_url: str | None = None,
+        ttl_seconds: int = 86_400,
+        lock_ttl_seconds: int = 120,
+        wait_timeout_seconds: float = 30.0,
+        enabled: bool = True,
+    ) -> None:
+        self._redis_url = redis_url
+        self._ttl = ttl_seconds
+        self._lock_ttl_ms = lock_ttl_seconds * 1000
+        self._wait_timeout = wait_timeout_seconds
+        self._enabled = enabled
+        self._redis: Any | None = None
+        self._inflight: dict[str, asyncio.Future[Any]] = {}
+
+    # ------------------------------------------------------------------
+    # Redis helpers
+    # ------------------------------------------------------------------
+
+    async def _get_redis(self) -> Any:
+        """Return (lazily initialised) async Redis client."""
+        if self._redis is not None:
+            return self._redis
+        import redis.asyncio as aioredis
+
+        url = self._redis_url
+        if url is None:
+            from issue_observatory.config.settings import get_settings
+
+            url = get_settings().redis_url
+        self._redis = aioredis.from_url(url, encoding="utf-8", decode_responses=True)
+        return self._redis
+
+    async def _build_key(
+        self,
+        redis: Any,
+        endpoint: str,
+        params: dict[str, Any],
+        run_ids: Iterable[uuid.UUID | str],
+        design_ids: Iterable[uuid.UUID | str],
+    ) -> str:
+        """Combine endpoint, normalised params and current data versions."""
+        version_keys = [_GLOBAL_VERSION_KEY]
+        version_keys += sorted(data_version_key("run", r) for r in run_ids if r)
+        version_keys += sorted(data_version_key("design", d) for d in design_ids if d)
+        versions = await redis.mget(version_keys)
+        payload = json.dumps(
+            {
+                "params": _normalise_param(params),
+                "versions": dict(zip(version_keys, versions, strict=True)),
+            },
+            sort_keys=True,
+            default=str,
+        )
+        digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        return f"{_CACHE_PREFIX}:{endpoint}:{digest}"
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    async def get_or_compute(
+        self,
+        endpoint: str,
+        compute: Callable[[], Awaitable[T]],
+        params: dict[str, Any] | None = None,
+        run_ids: Iterable[uuid.UUID | str] = (),
+        design_ids: Iterable[uuid.UUID | str] = (),
+    ) -> T:
+        """Return the cached result for this request, computing it on a miss.
+
+        The computed value is converted with FastAPI's ``jsonable_encoder``
+        before caching, so cached and freshly computed responses serialise
+        identically.  Exceptions raised by *compute* propagate to every
+        coalesced caller and are never cached.
+
+        Args:
+            endpoint: Stable endpoint identifier, e.g. ``"design.volume"``.
+            compute: Zero-argument coroutine factory producing the result.
+            params: Request parameters that influence the result.
+            run_ids: Collection runs the result is derived from.
+            design_ids: Query designs the result is derived from.
+
+        Returns:
+            The (possibly cached) JSON-ready result.
+        """
+        from issue_observatory.api.metrics import analysis_cache_requests_total
+
+        if not self._enabled:
+            analysis_cache_requests_total.labels(endpoint=endpoint, outcome="bypass").inc()
+            return await self._compute(endpoint, compute)
+
+        try:
+            redis = await self._get_redis()
+            key = await self._build_key(
+                redis, endpoint, params or {}, list(run_ids), list(design_ids)
+            )
+            cached = await redis.get(key)
+        except Exception as exc:
+            logger.warning("analysis_cache.unavailable", endpoint=endpoint, error=str(exc))
+            analysis_cache_requests_total.labels(endpoint=endpoint, outcome="bypass").inc()
+            return await self._compute(endpoint, compute)
+
+        if cached is not None:
+            analysis_cache_requests_total.labels(endpoint=endpoint, outcome="hit").inc()
+            return json.loads(cached)
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            analysis_cache_requests_total.labels(endpoint=endpoint, outcome="coalesced").inc()
+            return await asyncio.shield(inflight)
+
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await self._fill(redis, key, endpoint, compute)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            # Retrieve the exception so an unawaited future does not log it.
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
+    async def invalidate(
+        self,
+        run_ids: Iterable[uuid.UUID | str] = (),
+        design_ids: Iterable[uuid.UUID | str] = (),
+    ) -> None:
+        """Async counterpart of :func:`bump_data_versions` for API routes.
+
+        Never raises; a failure is logged at WARNING.
+
+        Args:
+            run_ids: Collection runs whose data changed.
+            design_ids: Query designs whose data changed.
+        """
+        keys = [data_version_key("run", r) for r in run_ids if r]
+        keys += [data_version_key("design", d) for d in design_ids if d]
+        if not keys:
+            return
+        try:
+            redis = await self._get_redis()
+            pipe = redis.pipeline(transaction=False)
+            for key in keys:
+                pipe.incr(key)
+            await pipe.execute()
+        except Exception as exc:
+            logger.warning("analysis_cache.bump_failed", keys=keys, error=str(exc))
+
+    async def load_state(self, name: str, encoded: bool = False) -> dict[str, Any] | None:
+        """Return an analysis state blob previously saved with :meth:`store_state`.
+
+        State blobs hold incremental intermediate results (e.g. the term
+        statistics behind emergent terms) that are updated rather than
+        recomputed.  They are not versioned; owners validate them.
+
+        Args:
+            name: State name, unique per analysis and scope.
+            encoded: Return the chunks as the stored JSON strings, leaving
+                decoding to the caller (e.g. a worker process).
+
+        Returns:
+            The stored dict, with its chunks (if it was stored with any)
+            under ``"chunks"``.  ``None`` when absent, incomplete, disabled
+            or unreachable.
+        """
+        if not self._enabled:
+            return None
+        key = f"{_STATE_PREFIX}:{name}"
+        try:
+            redis = await self._get_redis()
+            raw = await redis.get(key)
+            if raw is None:
+                return None
+            state = json.loads(raw)
+            count = state.get("chunks")
+            if count:
+                raw_chunks = await redis.mget([f"{key}:{i}" for i in range(count)])
+                if any(chunk is None for chunk in raw_chunks):
+                    return None
+                state["chunks"] = (
+                    raw_chunks if encoded else [json.loads(chunk) for chunk in raw_chunks]
+                )
+        except Exception as exc:
+            logger.warning("analysis_cache.state_unavailable", name=name, error=str(exc))
+            return None
+        return state
+
+    async def store_state(
+        self,
+        name: str,
+        state: dict[str, Any],
+        chunks: list[Any] | None = None,
+        encoded: bool = False,
+    ) -> None:
+        """Save an analysis state blob; failures are logged, never raised.
+
+        Large states pass their bulk as *chunks*: each is stored under its
+        own key, so no single Redis value holds the whole state.  The blob
+        and its chunks are written in one ``MULTI`` transaction.
+
+        Args:
+            name: State name, unique per analysis and scope.
+            state: JSON-serialisable state.
+            chunks: Optional JSON-serialisable parts returned by
+                :meth:`load_state` under ``"chunks"``.
+            encoded: The chunks are already JSON strings; store them as is.
+        """
+        if not self._enabled:
+            return
+        key = f"{_STATE_PREFIX}:{name}"
+        try:
+            redis = await self._get_redis()
+            pipe = redis.pipeline(transaction=True)
+            if chunks is not None:
+                state = {**state, "chunks": len(chunks)}
+                for i, chunk in enumerate(chunks):
+                    value = chunk if encoded else json.dumps(chunk)
+                    pipe.set(f"{key}:{i}", value, ex=self._ttl)
+            pipe.set(key, json.dumps(state), ex=self._ttl)
+            await pipe.execute()
+        except Exception as exc:
+            logger.warning("analysis_cache.state_store_failed", name=name, error=str(exc))
+
+    async def _fill(
+        self,
+        redis: Any,
+        key: str,
+        endpoint: str,
+        compute: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Compute and store *key*, coordinating with other processes."""
+        from issue_observatory.api.metrics import analysis_cache_requests_total
+
+        lock_key = f"{_LOCK_PREFIX}:{key}"
+        token = secrets.token_hex(8)
+        try:
+            acquired = await redis.set(lock_key, token, nx=True, px=self._lock_ttl_ms)
+        except Exception:
+            acquired = False
+
+        if not acquired:
+            cached = await self._wait_for_peer(redis, key, lock_key)
+            if cached is not None:
+                analysis_cache_requests_total.labels(
+                    endpoint=endpoint, outcome="coalesced"
+                ).inc()
+                return json.loads(cached)
+
+        analysis_cache_requests_total.labels(endpoint=endpoint, outcome="miss").inc()
+        try:
+            result = await self._compute(endpoint, compute)
+            try:
+                await redis.set(key, json.dumps(result), ex=self._ttl)
+            except Exception as exc:
+                logger.warning("analysis_cache.store_failed", endpoint=endpoint, error=str(exc))
+            return result
+        finally:
+            if acquired:
+                try:
+                    await redis.eval(_RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+                except Exception:
+                    logger.debug("analysis_cache.lock_release_failed", endpoint=endpoint)
+
+    async def _wait_for_peer(self, redis: Any, key: str, lock_key: str) -> str | None:
+        """Poll for a result another process is computing.
+
+        Returns:
+            The cached JSON string, or ``None`` when the peer released its
+            lock without storing a value or the wait budget ran out.
+        """
+        deadline = time.monotonic() + self._wait_timeout
+        try:
+            while time.monotonic() < deadline:
+                await asyncio.sleep(_POLL_INTERVAL_SECONDS)
+                cached = await redis.get(key)
+                if cached is not None:
+                    return cached
+                if not await redis.exists(lock_key):
+                    # Peer finished (or failed) without a value; one last look.
+                    return await redis.get(key)
+        except Exception:
+            return None
+        return None
+
+    @staticmethod
+    async def _compute(endpoint: str, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """Run *compute*, timing it and converting the result to JSON types."""
+        from fastapi.encoders import jsonable_encoder
+
+        from issue_observatory.api.metrics import analysis_cache_compute_seconds
+
+        start = time.perf_counter()
+        result = jsonable_encoder(await compute())
+        analysis_cache_compute_seconds.labels(endpoint=endpoint).observe(
+            time.perf_counter() - start
+        )
+        return result
+
+
+_analysis_cache: AnalysisCache | None = None
+
+
+def get_analysis_cache() -> AnalysisCache:
+    """Return the process-wide :class:`AnalysisCache` configured from settings."""
+    global _analysis_cache
+    if _analysis_cache is None:
+        from issue_observatory.config.settings import get_settings
+
+        settings = get_settings()
+        _analysis_cache = AnalysisCache(
+            redis_url=settings.redis_url,
+            ttl_seconds=settings.analysis_cache_ttl_seconds,
+            enabled=settings.analysis_cache_enabled,
+        )
+    return _analysis_cache
@@ -0,0 +1,644 @@
+"""Incrementally maintained per-day rollups of ``content_records``.
+
+The dashboard (volume chart, platform counts, top terms, filter options), the
+``/content/count`` card and :func:`~issue_observatory.analysis.descriptive.get_volume_over_time`
+used to run ``COUNT(*)`` / ``GROUP BY`` over the raw partitions on every page
+load, so their latency grew with the project.  They now read
+``content_daily_rollups`` and ``content_daily_term_rollups`` (see
+``core/models/content_rollups.py``), whose size grows with the number of
+distinct (query design, run, day, platform, ...) combinations instead.
+
+Maintenance
+-----------
+- **Inserts**: content inserts append :data:`INSERT_RETURNING` and pass the
+  returned rows to :func:`apply_insert_deltas_sync` /
+  :func:`apply_insert_deltas`, which upsert count deltas in the same
+  transaction.  Conflicting (skipped) rows are not returned, so they are
+  not counted.
+- **In-place updates** (duplicate marking, per-run language enrichment):
+  the affected ``(query_design_id, day)`` slices are recomputed from
+  ``content_records`` by :func:`refresh_slices_sync` / :func:`refresh_slices`.
+- **Drift** from writers that do neither (retention deletes, term-matching
+  backfills, cross-run enrichment backfills): :func:`reconcile_rollups_sync`
+  compares per-slice fingerprints with the raw table and recomputes slices
+  that differ.  The ``reconcile_content_rollups`` task runs it nightly.
+
+Slice recomputation takes an exclusive transaction-level advisory lock per
+query design; delta writers take the shared lock after inserting, so a
+recomputation never misses or double-counts a concurrent insert.
+
+All writers are no-ops when ``Settings.content_rollups_enabled`` is off, and
+readers then fall back to the raw queries.
+
+Days are UTC dates of ``published_at``.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, date, datetime, time, timedelta
+from typing import TYPE_CHECKING, Any
+
+import structlog
+from sqlalchemy import text
+
+from issue_observatory.core.queries.content_filters import ACTOR_ONLY_PLATFORMS
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.orm import Session
+
+logger = structlog.get_logger(__name__)
+
+RollupSlices = dict[str, set[date | None]]
+"""``{query_design_id: {day, ...}}`` — the unit of recomputation."""
+
+# Expressions shared by the insert RETURNING clause, slice recomputation and
+# reconciliation.  The language expression is the one every language filter
+# uses (see content_filters._build_predicates).
+_DAY_EXPR = "(published_at AT TIME ZONE 'UTC')::date"
+_LANG_EXPR = (
+    "split_part(COALESCE(NULLIF(language, ''),"
+    " raw_metadata->'enrichments'->'language_detection'->>'language'), '-', 1)"
+)
+_DUP_EXPR = "((raw_metadata->>'duplicate_of') IS NOT NULL)"
+
+_ROLLUP_DIMS = (
+    "query_design_id, day, collection_run_id, platform, arena, content_type,"
+    " language, term_matched, is_duplicate"
+)
+_TERM_DIMS = (
+    "query_design_id, day, collection_run_id, platform, arena,"
+    " language, term_matched, is_duplicate, term"
+)
+
+INSERT_RETURNING: str = (
+    f" RETURNING query_design_id, collection_run_id, {_DAY_EXPR} AS rollup_day,"
+    f" platform, arena, content_type, {_LANG_EXPR} AS rollup_language,"
+    f" term_matched, {_DUP_EXPR} AS rollup_duplicate,"
+    " likes_count, shares_count, comments_count, views_count, search_terms_matched"
+)
+"""Clause appended to ``INSERT INTO content_records`` statements; pass the
+returned rows to :func:`apply_insert_deltas_sync` / :func:`apply_insert_deltas`."""
+
+# Upper bound on VALUES rows per delta upsert statement.
+_UPSERT_BATCH = 1_000
+
+
+def rollups_enabled() -> bool:
+    """Return ``Settings.content_rollups_enabled``."""
+    from issue_observatory.config.settings import get_settings
+
+    return get_settings().content_rollups_enabled
+
+
+def _lock_sql(shared: bool) -> str:
+    fn = "pg_advisory_xact_lock_shared" if shared else "pg_advisory_xact_lock"
+    return f"SELECT {fn}(hashtext('content_rollups:' || :lock_design))"
+
+
+def _sort_key(key: tuple[Any, ...]) -> tuple[str, ...]:
+    return tuple("" if v is None else str(v) for v in key)
+
+
+# ---------------------------------------------------------------------------
+# Insert deltas
+# ---------------------------------------------------------------------------
+
+
+def _fold_inserted_rows(
+    rows: Iterable[Any],
+) -> tuple[dict[tuple[Any, ...], list[int]], dict[tuple[Any, ...], int]]:
+    """Aggregate rows returned by :data:`INSERT_RETURNING` into rollup deltas."""
+    records: dict[tuple[Any, ...], list[int]] = {}
+    terms: dict[tuple[Any, ...], int] = {}
+    for row in rows:
+        if row.query_design_id is None:
+            continue
+        design = str(row.query_design_id)
+        run = str(row.collection_run_id) if row.collection_run_id else None
+        key = (
+            design,
+            row.rollup_day,
+            run,
+            row.platform,
+            row.arena,
+            row.content_type,
+            row.rollup_language,
+            bool(row.term_matched),
+            bool(row.rollup_duplicate),
+        )
+        sums = records.setdefault(key, [0, 0, 0, 0, 0])
+        sums[0] += 1
+        sums[1] += row.likes_count or 0
+        sums[2] += row.shares_count or 0
+        sums[3] += row.comments_count or 0
+        sums[4] += row.views_count or 0
+        for term in row.search_terms_matched or []:
+            if term is None:
+                continue
+            term_key = (*key[:5], *key[6:], term)
+            terms[term_key] = terms.get(term_key, 0) + 1
+    return records, terms
+
+
+def _delta_statements(
+    records: dict[tuple[Any, ...], list[int]],
+    terms: dict[tuple[Any, ...], int],
+) -> list[tuple[str, dict[str, Any]]]:
+    """Build shared-lock and ``INSERT ... ON CONFLICT DO UPDATE`` statements.
+
+    Keys are upserted in sorted order so concurrent writers lock rollup rows
+    in the same order.
+    """
+    statements: list[tuple[str, dict[str, Any]]] = [
+        (_lock_sql(shared=True), {"lock_design": design})
+        for design in sorted({key[0] for key in records})
+    ]
+
+    record_items = sorted(records.items(), key=lambda item: _sort_key(item[0]))
+    for start in range(0, len(record_items), _UPSERT_BATCH):
+        params: dict[str, Any] = {}
+        values: list[str] = []
+        for i, (key, sums) in enumerate(record_items[start : start + _UPSERT_BATCH]):
+            design, day, run, platform, arena, content_type, language, matched, dup = key
+            params.update(
+                {
+                    f"qd_{i}": design,
+                    f"day_{i}": day,
+                    f"run_{i}": run,
+                    f"pl_{i}": platform,
+                    f"ar_{i}": arena,
+                    f"ct_{i}": content_type,
+                    f"lang_{i}": language,
+                    f"tm_{i}": matched,
+                    f"dup_{i}": dup,
+                    f"n_{i}": sums[0],
+                    f"likes_{i}": sums[1],
+                    f"shares_{i}": sums[2],
+                    f"comments_{i}": sums[3],
+                    f"views_{i}": sums[4],
+                }
+            )
+            values.append(
+                f"(CAST(:qd_{i} AS uuid), CAST(:day_{i} AS date), CAST(:run_{i} AS uuid),"
+                f" :pl_{i}, :ar_{i}, :ct_{i}, :lang_{i}, :tm_{i}, :dup_{i},"
+                f" :n_{i}, :likes_{i}, :shares_{i}, :comments_{i}, :views_{i})"
+            )
+        statements.append(
+            (
+                f"INSERT INTO content_daily_rollups ({_ROLLUP_DIMS},"
+                " record_count, likes_sum, shares_sum, comments_sum, views_sum)"
+                f" VALUES {', '.join(values)}"
+                f" ON CONFLICT ({_ROLLUP_DIMS}) DO UPDATE SET"
+                " record_count = content_daily_rollups.record_count + EXCLUDED.record_count,"
+                " likes_sum = content_daily_rollups.likes_sum + EXCLUDED.likes_sum,"
+                " shares_sum = content_daily_rollups.shares_sum + EXCLUDED.shares_sum,"
+                " comments_sum = content_daily_rollups.comments_sum + EXCLUDED.comments_sum,"
+                " views_sum = content_daily_rollups.views_sum + EXCLUDED.views_sum",
+                params,
+            )
+        )
+
+    term_items = sorted(terms.items(), key=lambda item: _sort_key(item[0]))
+    for start in range(0, len(term_items), _UPSERT_BATCH):
+        params = {}
+        values = []
+        for i, (key, count) in enumerate(term_items[start : start + _UPSERT_BATCH]):
+            design, day, run, platform, arena, language, matched, dup, term = key
+            params.update(
+                {
+                    f"qd_{i}": design,
+                    f"day_{i}": day,
+                    f"run_{i}": run,
+                    f"pl_{i}": platform,
+                    f"ar_{i}": arena,
+                    f"lang_{i}": language,
+                    f"tm_{i}": matched,
+                    f"dup_{i}": dup,
+                    f"term_{i}": term,
+                    f"n_{i}": count,
+                }
+            )
+            values.append(
+                f"(CAST(:qd_{i} AS uuid), CAST(:day_{i} AS date), CAST(:run_{i} AS uuid),"
+                f" :pl_{i}, :ar_{i}, :lang_{i}, :tm_{i}, :dup_{i}, :term_{i}, :n_{i})"
+            )
+        statements.append(
+            (
+                f"INSERT INTO content_daily_term_rollups ({_TERM_DIMS}, record_count)"
+                f" VALUES {', '.join(values)}"
+                f" ON CONFLICT ({_TERM_DIMS}) DO UPDATE SET"
+                " record_count = content_daily_term_rollups.record_count"
+                " + EXCLUDED.record_count",
+                params,
+            )
+        )
+    return statements
+
+
+def apply_insert_deltas_sync(session: Session, rows: Iterable[Any]) -> None:
+    """Fold freshly inserted records into the rollups (synchronous session).
+
+    Args:
+        session: The session that executed the insert; the deltas join its
+            transaction so they commit or roll back with the records.
+        rows: Rows returned by an insert ending in :data:`INSERT_RETURNING`.
+    """
+    if not rollups_enabled():
+        return
+    records, terms = _fold_inserted_rows(rows)
+    if not records:
+        return
+    for sql, params in _delta_statements(records, terms):
+        session.execute(text(sql), params)
+
+
+async def apply_insert_deltas(db: AsyncSession, rows: Iterable[Any]) -> None:
+    """Async variant of :func:`apply_insert_deltas_sync`."""
+    if not rollups_enabled():
+        return
+    records, terms = _fold_inserted_rows(rows)
+    if not records:
+        return
+    for sql, params in _delta_statements(records, terms):
+        await db.execute(text(sql), params)
+
+
+# ---------------------------------------------------------------------------
+# Slice recomputation
+# ---------------------------------------------------------------------------
+
+
+def add_slice(slices: RollupSlices, query_design_id: Any, published_at: datetime | None) -> None:
+    """Record that the slice holding a record changed.
+
+    Args:
+        slices: Accumulator, updated in place.
+        query_design_id: The record's query design; ``None`` is ignored
+            because such records are not rolled up.
+        published_at: The record's ``published_at``.
+    """
+    if query_design_id is None:
+        return
+    day = None
+    if published_at is not None:
+        if published_at.tzinfo is None:
+            published_at = published_at.replace(tzinfo=UTC)
+        day = published_at.astimezone(UTC).date()
+    slices.setdefault(str(query_design_id), set()).add(day)
+
+
+def _insert_select(source_where: str) -> tuple[str, str]:
+    """Return the rollup and term-rollup ``INSERT ... SELECT`` statements."""
+    records = (
+        f"INSERT INTO content_daily_rollups ({_ROLLUP_DIMS},"
+        " record_count, likes_sum, shares_sum, comments_sum, views_sum)"
+        f" SELECT query_design_id, {_DAY_EXPR}, collection_run_id, platform, arena,"
+        f" content_type, {_LANG_EXPR}, term_matched, {_DUP_EXPR}, count(*),"
+        " COALESCE(sum(likes_count), 0), COALESCE(sum(shares_count), 0),"
+        " COALESCE(sum(comments_count), 0), COALESCE(sum(views_count), 0)"
+        f" FROM content_records WHERE {source_where}"
+        " GROUP BY 1, 2, 3, 4, 5, 6, 7, 8, 9"
+    )
+    terms = (
+        f"INSERT INTO content_daily_term_rollups ({_TERM_DIMS}, record_count)"
+        f" SELECT query_design_id, {_DAY_EXPR}, collection_run_id, platform, arena,"
+        f" {_LANG_EXPR}, term_matched, {_DUP_EXPR}, term, count(*)"
+        " FROM content_records, unnest(search_terms_matched) AS term"
+        f" WHERE {source_where} AND term IS NOT NULL"
+        " GROUP BY 1, 2, 3, 4, 5, 6, 7, 8, 9"
+    )
+    return records, terms
+
+
+def _refresh_statements(
+    design_id: str, days: set[date | None]
+) -> list[tuple[str, dict[str, Any]]]:
+    """Build the statements recomputing one query design's *days*."""
+    statements: list[tuple[str, dict[str, Any]]] = [
+        (_lock_sql(shared=False), {"lock_design": design_id})
+    ]
+    dated = sorted(d for d in days if d is not None)
+    if dated:
+        params = {
+            "design_id": design_id,
+            "days": dated,
+            # Range bounds let the planner prune partitions.
+            "lo": datetime.combine(dated[0], time.min, UTC),
+            "hi": datetime.combine(dated[-1] + timedelta(days=1), time.min, UTC),
+        }
+        target = "query_design_id = CAST(:design_id AS uuid) AND day = ANY(CAST(:days AS date[]))"
+        source = (
+            "query_design_id = CAST(:design_id AS uuid)"
+            " AND published_at >= :lo AND published_at < :hi"
+            f" AND {_DAY_EXPR} = ANY(CAST(:days AS date[]))"
+        )
+        statements += [
+            (f"DELETE FROM content_daily_rollups WHERE {target}", params),
+            (f"DELETE FROM content_daily_term_rollups WHERE {target}", params),
+            *((sql, params) for sql in _insert_select(source)),
+        ]
+    if None in days:
+        params = {"design_id": design_id}
+        target = "query_design_id = CAST(:design_id AS uuid) AND day IS NULL"
+        source = "query_design_id = CAST(:design_id AS uuid) AND published_at IS NULL"
+        statements += [
+            (f"DELETE FROM content_daily_rollups WHERE {target}", params),
+            (f"DELETE FROM content_daily_term_rollups WHERE {target}", params),
+            *((sql, params) for sql in _insert_select(source)),
+        ]
+    return statements
+
+
+def refresh_slices_sync(session: Session, slices: RollupSlices) -> int:
+    """Recompute *slices* from ``content_records`` (synchronous session).
+
+    Runs in the caller's transaction; the caller commits.
+
+    Returns:
+        Number of ``(query_design_id, day)`` slices recomputed.
+    """
+    if not slices or not rollups_enabled():
+        return 0
+    for design_id in sorted(slices):
+        for sql, params in _refresh_statements(design_id, slices[design_id]):
+            session.execute(text(sql), params)
+    return sum(len(days) for days in slices.values())
+
+
+async def refresh_slices(db: AsyncSession, slices: RollupSlices) -> int:
+    """Async variant of :func:`refresh_slices_sync`."""
+    if not slices or not rollups_enabled():
+        return 0
+    for design_id in sorted(slices):
+        for sql, params in _refresh_statements(design_id, slices[design_id]):
+            await db.execute(text(sql), params)
+    return sum(len(days) for days in slices.values())
+
+
+def refresh_run_slices_sync(session: Session, run_id: str) -> int:
+    """Recompute every slice holding a record of collection run *run_id*.
+
+    Used after the dedup task re-marked records of the run and after the
+    run's language enrichment.  Runs in the caller's transaction; the caller
+    commits.
+
+    Returns:
+        Number of slices recomputed.
+    """
+    if not rollups_enabled():
+        return 0
+    rows = session.execute(
+        text(
+            f"SELECT DISTINCT query_design_id, {_DAY_EXPR} AS day FROM content_records"
+            " WHERE collection_run_id = CAST(:run_id AS uuid)"
+            " AND query_design_id IS NOT NULL"
+        ),
+        {"run_id": run_id},
+    ).fetchall()
+    slices: RollupSlices = {}
+    for row in rows:
+        slices.setdefault(str(row.query_design_id), set()).add(row.day)
+    return refresh_slices_sync(session, slices)
+
+
+# ---------------------------------------------------------------------------
+# Reconciliation
+# ---------------------------------------------------------------------------
+
+
+def _fingerprint_queries(since: date | None) -> tuple[str, str, str]:
+    """Per-slice fingerprints of the raw table, the rollups and the term rollups."""
+    raw_window = "AND published_at >= :since_ts" if since else ""
+    rollup_window = "WHERE day >= :since" if since else ""
+    raw = (
+        f"SELECT query_design_id, {_DAY_EXPR} AS day,"
+        " count(*) AS records,"
+        " count(*) FILTER (WHERE term_matched) AS matched,"
+        f" count(*) FILTER (WHERE {_DUP_EXPR}) AS duplicates,"
+        f" count({_LANG_EXPR}) AS with_language,"
+        " COALESCE(sum(COALESCE(likes_count, 0) + COALESCE(shares_count, 0)"
+        " + COALESCE(comments_count, 0) + COALESCE(views_count, 0)), 0)::bigint AS engagement,"
+        " COALESCE(sum(cardinality(array_remove(search_terms_matched, NULL))), 0)::bigint"
+        " AS term_matches"
+        f" FROM content_records WHERE query_design_id IS NOT NULL {raw_window}"
+        " GROUP BY 1, 2"
+    )
+    rollups = (
+        "SELECT query_design_id, day,"
+        " sum(record_count)::bigint AS records,"
+        " COALESCE(sum(record_count) FILTER (WHERE term_matched), 0)::bigint AS matched,"
+        " COALESCE(sum(record_count) FILTER (WHERE is_duplicate), 0)::bigint AS duplicates,"
+        " COALESCE(sum(record_count) FILTER (WHERE language IS NOT NULL), 0)::bigint"
+        " AS with_language,"
+        " sum(likes_sum + shares_sum + comments_sum + views_sum)::bigint AS engagement"
+        f" FROM content_daily_rollups {rollup_window}"
+        " GROUP BY 1, 2"
+    )
+    terms = (
+        "SELECT query_design_id, day, sum(record_count)::bigint AS term_matches"
+        f" FROM content_daily_term_rollups {rollup_window}"
+        " GROUP BY 1, 2"
+    )
+    return raw, rollups, terms
+
+
+def find_drifted_slices(
+    raw_rows: Sequence[Any],
+    rollup_rows: Sequence[Any],
+    term_rows: Sequence[Any],
+) -> tuple[int, RollupSlices]:
+    """Compare fingerprints and return ``(slices_checked, drifted_slices)``."""
+    raw = {
+        (str(r.query_design_id), r.day): (
+            r.records, r.matched, r.duplicates, r.with_language, r.engagement, r.term_matches
+        )
+        for r in raw_rows
+    }
+    term_matches = {(str(r.query_design_id), r.day): r.term_matches for r in term_rows}
+    rolled = {
+        (str(r.query_design_id), r.day): (
+            r.records,
+            r.matched,
+            r.duplicates,
+            r.with_language,
+            r.engagement,
+            term_matches.get((str(r.query_design_id), r.day), 0),
+        )
+        for r in rollup_rows
+    }
+    # Term rows without a record row are drift as well.
+    for key in term_matches.keys() - rolled.keys():
+        rolled[key] = (0, 0, 0, 0, 0, term_matches[key])
+
+    keys = raw.keys() | rolled.keys()
+    drifted: RollupSlices = {}
+    for key in keys:
+        if raw.get(key) != rolled.get(key):
+            drifted.setdefault(key[0], set()).add(key[1])
+    return len(keys), drifted
+
+
+def reconcile_rollups_sync(session: Session, days: int | None = None) -> dict[str, int]:
+    """Recompute every rollup slice that no longer matches ``content_records``.
+
+    Each slice is fingerprinted on both sides — record, term-matched,
+    duplicate and language-detected counts, engagement sum and matched-term
+    occurrences — and slices that differ (or exist on one side only) are
+    recomputed.  Commits once per query design so locks are held briefly.
+
+    Args:
+        session: Synchronous database session.
+        days: Only check slices whose day is within the last *days* days;
+            ``None`` checks everything, including undated records.
+
+    Returns:
+        Dict with ``slices_checked``, ``slices_repaired`` and
+        ``designs_repaired`` counts.
+    """
+    if not rollups_enabled():
+        return {"slices_checked": 0, "slices_repaired": 0, "designs_repaired": 0}
+    since = (datetime.now(UTC) - timedelta(days=days)).date() if days is not None else None
+    params: dict[str, Any] = {}
+    if since is not None:
+        params = {"since": since, "since_ts": datetime.combine(since, time.min, UTC)}
+    raw_sql, rollup_sql, term_sql = _fingerprint_queries(since)
+    checked, drifted = find_drifted_slices(
+        session.execute(text(raw_sql), params).fetchall(),
+        session.execute(text(rollup_sql), params).fetchall(),
+        session.execute(text(term_sql), params).fetchall(),
+    )
+    repaired = 0
+    for design_id in sorted(drifted):
+        repaired += refresh_slices_sync(session, {design_id: drifted[design_id]})
+        session.commit()
+    if repaired:
+        logger.warning(
+            "content_rollups.drift_repaired",
+            slices_repaired=repaired,
+            designs=len(drifted),
+        )
+    return {
+        "slices_checked": checked,
+        "slices_repaired": repaired,
+        "designs_repaired": len(drifted),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Reading
+# ---------------------------------------------------------------------------
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=UTC) if value.tzinfo is None else value.astimezone(UTC)
+
+
+def rollup_day_range(
+    date_from: datetime | None,
+    date_to: datetime | None,
+) -> tuple[date | None, date | None] | None:
+    """Translate inclusive ``published_at`` bounds to whole rollup days.
+
+    Returns ``None`` when a bound does not fall on a UTC day boundary
+    (``date_from`` at 00:00, ``date_to`` at 23:59:59.999999), since the
+    rollups cannot answer partial days; callers then query the raw table.
+    Naive datetimes are taken as UTC, as PostgreSQL does in a UTC session.
+    """
+    day_from = day_to = None
+    if date_from is not None:
+        start = _as_utc(date_from)
+        if start.timetz().replace(tzinfo=None) != time.min:
+            return None
+        day_from = start.date()
+    if date_to is not None:
+        end = _as_utc(date_to)
+        if end.timetz().replace(tzinfo=None) != time.max:
+            return None
+        day_to = end.date()
+    return day_from, day_to
+
+
+def whole_days(start: datetime, end: datetime) -> tuple[datetime, datetime]:
+    """Widen ``[start, end]`` to whole UTC days (00:00 to 23:59:59.999999)."""
+    return (
+        datetime.combine(_as_utc(start).date(), time.min, UTC),
+        datetime.combine(_as_utc(end).date(), time.max, UTC),
+    )
+
+
+def build_rollup_where(
+    params: dict[str, Any],
+    *,
+    query_design_ids: Sequence[Any],
+    arena: str | None = None,
+    platform: str | None = None,
+    exclude_platforms: set[str] | None = None,
+    language: str | None = None,
+    day_from: date | None = None,
+    day_to: date | None = None,
+    term_filter: str = "actor_exempt",
+    include_duplicates: bool = False,
+) -> str:
+    """Build a WHERE clause over either rollup table.
+
+    Mirrors the analysis-layer ``ContentFilterSpec`` predicates for the
+    subset the rollups can answer.
+
+    Args:
+        params: Mutable bind-parameter dict, updated in place.
+        query_design_ids: Query designs to include (required).
+        arena: Restrict to one arena.
+        platform: Restrict to one platform.
+        exclude_platforms: Platforms to leave out.
+        language: Effective-language filter; only the part before ``-``
+            is compared, as in the raw predicate.
+        day_from: Inclusive first day.
+        day_to: Inclusive last day.
+        term_filter: ``"actor_exempt"`` (``show_all=False``: term-matched
+            records plus actor-only platforms), ``"matched"`` (term-matched
+            records only) or ``"all"``.
+        include_duplicates: Count records marked as duplicates.
+
+    Returns:
+        A SQL string starting with ``WHERE``.
+    """
+    placeholders = ", ".join(f"CAST(:_rqd_{i} AS uuid)" for i in range(len(query_design_ids)))
+    params.update({f"_rqd_{i}": str(d) for i, d in enumerate(query_design_ids)})
+    clauses = [f"query_design_id IN ({placeholders})"]
+    if not include_duplicates:
+        clauses.append("NOT is_duplicate")
+    if term_filter == "matched":
+        clauses.append("term_matched")
+    elif term_filter == "actor_exempt":
+        aop = sorted(ACTOR_ONLY_PLATFORMS)
+        params.update({f"_raop_{i}": p for i, p in enumerate(aop)})
+        clauses.append(
+            "(term_matched OR platform IN ("
+            + ", ".join(f":_raop_{i}" for i in range(len(aop)))
+            + "))"
+        )
+    if arena:
+        clauses.append("arena = :_rarena")
+        params["_rarena"] = arena
+    if platform:
+        clauses.append("platform = :_rplatform")
+        params["_rplatform"] = platform
+    if exclude_platforms:
+        excl = sorted(exclude_platforms)
+        params.update({f"_rexcl_{i}": p for i, p in enumerate(excl)})
+        clauses.append(
+            "platform NOT IN (" + ", ".join(f":_rexcl_{i}" for i in range(len(excl))) + ")"
+        )
+    if language:
+        clauses.append("language = :_rlanguage")
+        params["_rlanguage"] = language.split("-")[0]
+    if day_from is not None:
+        clauses.append("day >= :_rday_from")
+        params["_rday_from"] = day_from
+    if day_to is not None:
+        clauses.append("day <= :_rday_to")
+        params["_rday_to"] = day_to
+    return "WHERE " + " AND ".join(clauses)
@@ -43,11 +43,25 @@ Usage from arena Celery tasks::
     )
     # gaps is a list of (gap_from, gap_to) datetime tuples
     # If empty, the range is fully covered — skip the API call.
+
+Batched planning
+----------------
+Checking one input at a time costs one or two queries per term/actor, which
+adds up to thousands of round trips when a design with hundreds of terms is
+dispatched to a dozen arenas.  :func:`plan_coverage` resolves the whole
+``platform x inputs x date window`` matrix up front instead: one grouped
+``collection_attempts`` query per platform, one ``content_records``
+fallback query per platform for the terms that missed, and one batched
+backfill insert.  The resulting :class:`CoveragePlan` answers gap lookups
+for any input from memory.  ``dispatch_batch_collection`` passes each arena
+task its planned gaps (:meth:`CoveragePlan.task_gaps`), which
+:func:`check_existing_coverage` uses instead of querying again.
 """
 
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable, Mapping
 from datetime import UTC, datetime
 from typing import Any
 
@@ -205,6 +219,17 @@ def _get_covered_ranges_from_content(
     return [(row[0], row[1])]
 
 
+_BACKFILL_SQL = (
+    "INSERT INTO collection_attempts "
+    "(platform, input_value, input_type, date_from, date_to, "
+    "records_returned, collection_run_id, query_design_id) "
+    "VALUES (:platform, :input_value, :input_type, "
+    "CAST(:date_from AS timestamptz), "
+    "CAST(:date_to AS timestamptz), "
+    "1, NULL, NULL)"
+)
+
+
 def _backfill_attempt_from_fallback(
     platform: str,
     date_from: datetime,
@@ -219,10 +244,6 @@ def _backfill_attempt_from_fallback(
     ``records_returned = 1`` (we know data exists but don't have the exact
     count without an expensive COUNT query).
     """
-    from sqlalchemy import text
-
-    from issue_observatory.core.database import get_sync_session
-
     if search_term:
         input_value = search_term
         input_type = "term"
@@ -234,26 +255,30 @@ def _backfill_attempt_from_fallback(
         input_value = "__platform_wide__"
         input_type = "term"
 
+    _insert_backfill_rows(
+        [
+            {
+                "platform": platform,
+                "input_value": input_value,
+                "input_type": input_type,
+                "date_from": date_from.isoformat(),
+                "date_to": date_to.isoformat(),
+            }
+        ]
+    )
+
+
+def _insert_backfill_rows(rows: list[dict[str, Any]]) -> None:
+    """Insert synthetic collection_attempts rows in one executemany batch."""
+    from sqlalchemy import text
+
+    from issue_observatory.core.database import get_sync_session
+
+    if not rows:
+        return
     try:
         with get_sync_session() as db:
-            db.execute(
-                text(
-                    "INSERT INTO collection_attempts "
-                    "(platform, input_value, input_type, date_from, date_to, "
-                    "records_returned, collection_run_id, query_design_id) "
-                    "VALUES (:platform, :input_value, :input_type, "
-                    "CAST(:date_from AS timestamptz), "
-                    "CAST(:date_to AS timestamptz), "
-                    "1, NULL, NULL)"
-                ),
-                {
-                    "platform": platform,
-                    "input_value": input_value,
-                    "input_type": input_type,
-                    "date_from": date_from.isoformat(),
-                    "date_to": date_to.isoformat(),
-                },
-            )
+            db.execute(text(_BACKFILL_SQL), rows)
             db.commit()
     except Exception as exc:
         logger.debug(
@@ -412,6 +437,7 @@ def check_existing_coverage(
     terms: list[str] | None = None,
     actor_ids: list[str] | None = None,
     max_attempt_age_days: int = DEFAULT_MAX_ATTEMPT_AGE_DAYS,
+    planned_gaps: Mapping[str, Any] | None = None,
 ) -> list[tuple[datetime, datetime]]:
     """High-level check returning uncovered date gaps.
 
@@ -419,6 +445,10 @@ def check_existing_coverage(
     uncovered ranges (conservative: if ANY term has a gap, that gap is
     returned).
 
+    When the dispatcher already planned this task's coverage it passes the
+    result as ``planned_gaps`` (see :meth:`CoveragePlan.task_gaps`); a plan
+    for the same platform and date window is returned without querying.
+
     Args:
         platform: Platform identifier.
         date_from: Start of collection window.
@@ -426,6 +456,9 @@ def check_existing_coverage(
         terms: Optional search terms to check coverage for.
         actor_ids: Optional actor platform IDs to check coverage for.
         max_attempt_age_days: Fast-path staleness cutoff in days.
+        planned_gaps: Optional planned gaps from ``dispatch_batch_collection``
+            (the ``coverage_gaps`` task kwarg).  Ignored when it was planned
+            for a different platform or date window.
 
     Returns:
         List of ``(gap_from, gap_to)`` datetime tuples.  Empty list means
@@ -437,6 +470,19 @@ def check_existing_coverage(
     if date_to.tzinfo is None:
         date_to = date_to.replace(tzinfo=UTC)
 
+    if planned_gaps is not None:
+        planned = _gaps_from_plan(planned_gaps, platform, date_from, date_to)
+        if planned is not None:
+            logger.info(
+                "coverage_checker: platform=%s using dispatch plan, %d uncovered gap(s) "
+                "in %s to %s",
+                platform,
+                len(planned),
+                date_from.isoformat(),
+                date_to.isoformat(),
+            )
+            return planned
+
     all_gaps: list[tuple[datetime, datetime]] = []
 
     if terms:
@@ -517,3 +563,327 @@ def _merge_ranges(
             merged.append((current_start, current_end))
 
     return merged
+
+
+# ---------------------------------------------------------------------------
+# Batched planning for dispatch
+# ---------------------------------------------------------------------------
+
+#: ``(platform, input_type, input_value)`` — key of the plan's interval index.
+_PlanKey = tuple[str, str, str]
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value if value.tzinfo is not None else value.replace(tzinfo=UTC)
+
+
+class CoveragePlan:
+    """Uncovered date ranges for every (platform, input) of one dispatch.
+
+    Built by :func:`plan_coverage`.  Covered ranges are held in an in-memory
+    interval index keyed by ``(platform, input_type, input_value)``, so gap
+    lookups for single inputs or whole term lists need no further queries.
+    Inputs absent from the index are uncovered for the full window.
+
+    Args:
+        date_from: Start of the planned collection window.
+        date_to: End of the planned collection window.
+        covered: Interval index of covered ranges per input.
+        platforms: Platforms whose inputs were planned.
+    """
+
+    def __init__(
+        self,
+        date_from: datetime,
+        date_to: datetime,
+        covered: Mapping[_PlanKey, list[tuple[datetime, datetime]]],
+        platforms: Iterable[str] = (),
+    ) -> None:
+        self.date_from = _as_utc(date_from)
+        self.date_to = _as_utc(date_to)
+        self.platforms = frozenset(platforms)
+        self._covered = dict(covered)
+        self._gaps: dict[_PlanKey, list[tuple[datetime, datetime]]] = {}
+
+    def gaps_for(
+        self,
+        platform: str,
+        *,
+        term: str | None = None,
+        actor_id: str | None = None,
+    ) -> list[tuple[datetime, datetime]]:
+        """Return the uncovered ranges of one term or actor on *platform*."""
+        if term is not None:
+            key = (platform, "term", term)
+        elif actor_id is not None:
+            key = (platform, "actor", actor_id)
+        else:
+            raise ValueError("gaps_for() needs a term or an actor_id")
+        gaps = self._gaps.get(key)
+        if gaps is None:
+            gaps = compute_uncovered_ranges(
+                self.date_from, self.date_to, self._covered.get(key, [])
+            )
+            self._gaps[key] = gaps
+        return gaps
+
+    def uncovered(
+        self,
+        platform: str,
+        terms: Iterable[str] | None = None,
+        actor_ids: Iterable[str] | None = None,
+    ) -> list[tuple[datetime, datetime]]:
+        """Return the merged gaps of all inputs, like :func:`check_existing_coverage`.
+
+        Terms take precedence over actor IDs, matching the arena tasks.
+        """
+        terms = list(terms or [])
+        actor_ids = list(actor_ids or [])
+        if terms:
+            gaps = [gap for term in terms for gap in self.gaps_for(platform, term=term)]
+        elif actor_ids:
+            gaps = [
+                gap for actor in actor_ids for gap in self.gaps_for(platform, actor_id=actor)
+            ]
+        else:
+            # Platform-wide coverage is not planned; report the full window.
+            return [(self.date_from, self.date_to)]
+        return _merge_ranges(gaps)
+
+    def task_gaps(
+        self,
+        platform: str,
+        *,
+        terms: Iterable[str] | None = None,
+        actor_ids: Iterable[str] | None = None,
+    ) -> dict[str, Any]:
+        """Return the planned gaps as a JSON-serialisable Celery task kwarg.
+
+        Arena tasks hand the value to :func:`check_existing_coverage` as
+        ``planned_gaps``.
+        """
+        return {
+            "platform": platform,
+            "date_from": self.date_from.isoformat(),
+            "date_to": self.date_to.isoformat(),
+            "gaps": [
+                [start.isoformat(), end.isoformat()]
+                for start, end in self.uncovered(platform, terms, actor_ids)
+            ],
+        }
+
+
+def _gaps_from_plan(
+    planned: Mapping[str, Any],
+    platform: str,
+    date_from: datetime,
+    date_to: datetime,
+) -> list[tuple[datetime, datetime]] | None:
+    """Decode :meth:`CoveragePlan.task_gaps` output, or ``None`` if it does not apply."""
+    try:
+        if planned["platform"] != platform:
+            return None
+        if (
+            _as_utc(datetime.fromisoformat(planned["date_from"])) != date_from
+            or _as_utc(datetime.fromisoformat(planned["date_to"])) != date_to
+        ):
+            return None
+        return [
+            (_as_utc(datetime.fromisoformat(start)), _as_utc(datetime.fromisoformat(end)))
+            for start, end in planned["gaps"]
+        ]
+    except (KeyError, TypeError, ValueError):
+        logger.warning("coverage_checker: ignoring malformed coverage plan for %s", platform)
+        return None
+
+
+def _get_covered_ranges_from_attempts_batch(
+    platform: str,
+    date_from: datetime,
+    date_to: datetime,
+    terms: list[str],
+    actor_ids: list[str],
+    max_attempt_age_days: int,
+) -> dict[_PlanKey, list[tuple[datetime, datetime]]]:
+    """Fast path for many inputs: one grouped ``collection_attempts`` query.
+
+    Applies the same filters as :func:`_get_covered_ranges_from_attempts`
+    and returns each input's ``(MIN(date_from), MAX(date_to))`` span.
+    """
+    from sqlalchemy import text
+
+    from issue_observatory.core.database import get_sync_session
+
+    input_clauses: list[str] = []
+    params: dict[str, Any] = {
+        "platform": platform,
+        "max_age": f"{max_attempt_age_days} days",
+        "req_from": date_from.isoformat(),
+        "req_to": date_to.isoformat(),
+    }
+    if terms:
+        input_clauses.append("(input_type = 'term' AND input_value = ANY(:terms))")
+        params["terms"] = terms
+    if actor_ids:
+        input_clauses.append("(input_type = 'actor' AND input_value = ANY(:actor_ids))")
+        params["actor_ids"] = actor_ids
+    if not input_clauses:
+        return {}
+
+    with get_sync_session() as db:
+        rows = db.execute(
+            text(
+                "SELECT input_type, input_value, MIN(date_from), MAX(date_to) "
+                "FROM collection_attempts "
+                "WHERE platform = :platform "
+                "AND records_returned IS NOT NULL "
+                "AND is_valid = TRUE "
+                "AND attempted_at >= NOW() - CAST(:max_age AS interval) "
+                f"AND ({' OR '.join(input_clauses)}) "
+                "AND date_to >= CAST(:req_from AS timestamptz) "
+                "AND date_from <= CAST(:req_to AS timestamptz) "
+                "GROUP BY input_type, input_value"
+            ),
+            params,
+        ).fetchall()
+
+    return {
+        (platform, input_type, input_value): [(range_from, range_to)]
+        for input_type, input_value, range_from, range_to in rows
+        if range_from is not None
+    }
+
+
+def _get_covered_ranges_from_content_batch(
+    platform: str,
+    date_from: datetime,
+    date_to: datetime,
+    terms: list[str],
+) -> dict[_PlanKey, list[tuple[datetime, datetime]]]:
+    """Slow fallback for many terms in one round trip.
+
+    A ``LATERAL`` subquery per unnested term keeps the per-term
+    ``search_terms_matched @>`` predicate, so each term still uses the GIN
+    index exactly as :func:`_get_covered_ranges_from_content` does.
+    """
+    from sqlalchemy import text
+
+    from issue_observatory.core.database import get_sync_session
+
+    if not terms:
+        return {}
+
+    with get_sync_session() as db:
+        rows = db.execute(
+            text(
+                "SELECT t.term, c.first_published, c.last_published "
+                "FROM unnest(CAST(:terms AS text[])) AS t(term) "
+                "CROSS JOIN LATERAL ("
+                "  SELECT MIN(published_at) AS first_published, "
+                "         MAX(published_at) AS last_published "
+                "  FROM content_records "
+                "  WHERE platform = :platform "
+                "  AND published_at >= CAST(:date_from AS timestamptz) "
+                "  AND published_at <= CAST(:date_to AS timestamptz) "
+                "  AND search_terms_matched @> ARRAY[t.term]"
+                ") AS c "
+                "WHERE c.first_published IS NOT NULL"
+            ),
+            {
+                "platform": platform,
+                "terms": terms,
+                "date_from": date_from.isoformat(),
+                "date_to": date_to.isoformat(),
+            },
+        ).fetchall()
+
+    if rows:
+        logger.info(
+            "coverage_checker: fallback found data in content_records for "
+            "platform=%s, %d of %d term(s)",
+            platform,
+            len(rows),
+            len(terms),
+        )
+    return {
+        (platform, "term", term): [(first_published, last_published)]
+        for term, first_published, last_published in rows
+    }
+
+
+def plan_coverage(
+    date_from: datetime,
+    date_to: datetime,
+    terms_by_platform: Mapping[str, Iterable[str]] | None = None,
+    actors_by_platform: Mapping[str, Iterable[str]] | None = None,
+    max_attempt_age_days: int = DEFAULT_MAX_ATTEMPT_AGE_DAYS,
+) -> CoveragePlan:
+    """Resolve coverage for every (platform, input) of a dispatch at once.
+
+    Batched equivalent of calling :func:`get_covered_ranges` per input:
+    per platform it runs one grouped ``collection_attempts`` query, one
+    ``content_records`` fallback query for terms without recent attempts
+    (actors never use the fallback), and one backfill insert for the terms
+    the fallback found.
+
+    Args:
+        date_from: Start of the collection window.
+        date_to: End of the collection window.
+        terms_by_platform: Search terms to plan, per platform.
+        actors_by_platform: Actor platform IDs to plan, per platform.
+        max_attempt_age_days: Fast-path staleness cutoff in days.
+
+    Returns:
+        A :class:`CoveragePlan` for the window.
+    """
+    date_from = _as_utc(date_from)
+    date_to = _as_utc(date_to)
+    terms_by_platform = terms_by_platform or {}
+    actors_by_platform = actors_by_platform or {}
+
+    covered: dict[_PlanKey, list[tuple[datetime, datetime]]] = {}
+    backfill_rows: list[dict[str, Any]] = []
+    planned_platforms: list[str] = []
+    n_inputs = 0
+
+    for platform in sorted(set(terms_by_platform) | set(actors_by_platform)):
+        # Blank inputs would widen the old per-input query to the whole
+        # platform; leave them unplanned (fully uncovered) instead.
+        terms = sorted({t for t in terms_by_platform.get(platform, ()) if t})
+        actor_ids = sorted({a for a in actors_by_platform.get(platform, ()) if a})
+        if not terms and not actor_ids:
+            continue
+        planned_platforms.append(platform)
+        n_inputs += len(terms) + len(actor_ids)
+
+        found = _get_covered_ranges_from_attempts_batch(
+            platform, date_from, date_to, terms, actor_ids, max_attempt_age_days
+        )
+        covered.update(found)
+
+        missed = [t for t in terms if (platform, "term", t) not in found]
+        fallback = _get_covered_ranges_from_content_batch(platform, date_from, date_to, missed)
+        covered.update(fallback)
+        for (_, input_type, input_value), ((range_from, range_to),) in fallback.items():
+            backfill_rows.append(
+                {
+                    "platform": platform,
+                    "input_value": input_value,
+                    "input_type": input_type,
+                    "date_from": range_from.isoformat(),
+                    "date_to": range_to.isoformat(),
+                }
+            )
+
+    _insert_backfill_rows(backfill_rows)
+
+    logger.info(
+        "coverage_checker: planned %d input(s) on %d platform(s) for %s to %s, "
+        "%d with existing coverage",
+        n_inputs,
+        len(planned_platforms),
+        date_from.isoformat(),
+        date_to.isoformat(),
+        len(covered),
+    )
+    return CoveragePlan(date_from, date_to, covered, planned_platforms)
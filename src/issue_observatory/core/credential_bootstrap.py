@@ -110,6 +110,7 @@ async def bootstrap_credentials_from_env(env: dict[str, str] | None = None) -> i
         from sqlalchemy import select
 
         from issue_observatory.config.settings import get_settings
+        from issue_observatory.core.credential_pool import invalidate_credential_cache
         from issue_observatory.core.database import AsyncSessionLocal
         from issue_observatory.core.models.credentials import ApiCredential
     except ImportError as exc:
@@ -194,6 +195,7 @@ async def bootstrap_credentials_from_env(env: dict[str, str] | None = None) -> i
         # Commit all new credentials at once.
         if inserted_count > 0:
             await db.commit()
+            await invalidate_credential_cache()
             logger.info(
                 "credential_bootstrap_complete",
                 inserted_count=inserted_count,
@@ -15,6 +15,24 @@ credentials from the database, decrypts them in-process using the
 - **Monthly quota**: ``credential:quota:{id}:monthly`` (TTL = seconds until month end)
 - **Cooldown**: ``credential:cooldown:{id}``          (TTL = backoff duration, max 3600s)
 
+Acquisition cost
+----------------
+Collectors acquire per task and sometimes per page, so :meth:`CredentialPool.acquire`
+is kept to a single Redis round-trip in the common case:
+
+- Decrypted credential rows are cached in-process per ``(platform, tier)``
+  for ``Settings.credential_cache_ttl_seconds``.  Edits through the admin
+  routes call :func:`invalidate_credential_cache`, which bumps
+  ``credential:cache_version``; a cached entry whose version no longer
+  matches is reloaded from the database.
+- One Lua script checks the cache version, then cooldown and quota of each
+  candidate in LRU order, and sets the lease and increments the quota
+  counters of the first eligible one.
+- ``last_used_at`` updates are coalesced: at most one batched UPDATE per
+  :data:`_LAST_USED_FLUSH_SECONDS` per process.  Celery workers write the
+  remainder after each task and at process shutdown (see
+  :func:`has_pending_last_used`).
+
 Circuit breaker
 ---------------
 After 5 consecutive errors the credential is placed on a 1-hour cooldown in
@@ -46,8 +64,10 @@ from __future__ import annotations
 import json
 import logging
 import os
+import time
 import uuid
 from collections import defaultdict
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any
 
@@ -66,6 +86,65 @@ _MAX_COOLDOWN_SECONDS: int = 3600
 _LEASE_TTL_SECONDS: int = 3600
 """Redis TTL for active credential leases."""
 
+_CACHE_VERSION_KEY: str = "credential:cache_version"
+"""Redis counter bumped by :func:`invalidate_credential_cache`."""
+
+_DEFAULT_CACHE_TTL_SECONDS: int = 30
+"""Credential cache TTL used when settings cannot be loaded."""
+
+_LAST_USED_FLUSH_SECONDS: float = 30.0
+"""Minimum interval between batched ``last_used_at`` writes per process."""
+
+# ---------------------------------------------------------------------------
+# Lua script: atomic eligibility check + lease + quota increment
+# ---------------------------------------------------------------------------
+
+# KEYS[1]          — credential:cache_version
+# KEYS[2 + 4i ..]  — per candidate i: cooldown, daily quota, monthly quota, lease
+# ARGV[1]          — cache version the candidates were loaded under
+# ARGV[2]          — number of candidates
+# ARGV[3]          — lease TTL (seconds)
+# ARGV[4]          — lease value
+# ARGV[5]          — daily quota TTL (seconds until UTC midnight)
+# ARGV[6]          — monthly quota TTL (seconds until UTC month end)
+# ARGV[7 + 2i ..]  — per candidate i: daily quota, monthly quota (-1 = unlimited)
+#
+# Returns {index, version}: the 0-based index of the acquired candidate,
+# -1 if the cached candidates are stale, or -2 if none is eligible.
+_LUA_ACQUIRE = """
+local version = redis.call('GET', KEYS[1]) or '0'
+if version ~= ARGV[1] then
+    return {-1, version}
+end
+local n = tonumber(ARGV[2])
+for i = 0, n - 1 do
+    local k = 2 + i * 4
+    local daily_quota = tonumber(ARGV[7 + i * 2])
+    local monthly_quota = tonumber(ARGV[8 + i * 2])
+    local eligible = redis.call('EXISTS', KEYS[k]) == 0
+    if eligible and daily_quota >= 0 then
+        eligible = tonumber(redis.call('GET', KEYS[k + 1]) or '0') < daily_quota
+    end
+    if eligible and monthly_quota >= 0 then
+        eligible = tonumber(redis.call('GET', KEYS[k + 2]) or '0') < monthly_quota
+    end
+    if eligible then
+        redis.call('SET', KEYS[k + 3], ARGV[4], 'EX', ARGV[3])
+        if redis.call('INCR', KEYS[k + 1]) == 1 then
+            redis.call('EXPIRE', KEYS[k + 1], ARGV[5])
+        end
+        if redis.call('INCR', KEYS[k + 2]) == 1 then
+            redis.call('EXPIRE', KEYS[k + 2], ARGV[6])
+        end
+        return {i, version}
+    end
+end
+return {-2, version}
+"""
+
+_STALE = -1
+_NONE_ELIGIBLE = -2
+
 # ---------------------------------------------------------------------------
 # Platform → env-var mapping for multi-field credentials
 # ---------------------------------------------------------------------------
@@ -187,6 +266,93 @@ def _decrypt_credentials(encrypted_payload: Any) -> dict[str, Any]:
         raise ValueError(f"Failed to decrypt credential payload: {exc}") from exc
 
 
+# ---------------------------------------------------------------------------
+# In-process credential cache
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _CachedCredential:
+    """A decrypted ``api_credentials`` row held in the in-process cache.
+
+    Attributes:
+        id: String UUID of the credential.
+        payload: Decrypted credential fields.
+        daily_quota: Daily limit or ``None`` for unlimited.
+        monthly_quota: Monthly limit or ``None`` for unlimited.
+        last_used: Epoch seconds of the last use seen by this process
+            (``0.0`` when never used); candidates are tried in this order.
+    """
+
+    id: str
+    payload: dict[str, Any]
+    daily_quota: int | None
+    monthly_quota: int | None
+    last_used: float
+
+
+@dataclass
+class _CacheEntry:
+    """Cached candidates for one ``(platform, tier)``.
+
+    Attributes:
+        version: ``credential:cache_version`` value at load time.
+        expires_at: ``time.monotonic()`` deadline of the entry.
+        credentials: Candidates in LRU order.
+    """
+
+    version: str
+    expires_at: float
+    credentials: list[_CachedCredential]
+
+
+_credential_cache: dict[tuple[str, str], _CacheEntry] = {}
+_pending_last_used: dict[str, datetime] = {}
+_last_used_flushed_at: float = 0.0
+
+
+def _cache_ttl_seconds() -> int:
+    """Return the configured credential cache TTL."""
+    try:
+        from issue_observatory.config.settings import get_settings
+
+        return get_settings().credential_cache_ttl_seconds
+    except Exception:
+        return _DEFAULT_CACHE_TTL_SECONDS
+
+
+async def invalidate_credential_cache(redis_client: Any | None = None) -> None:
+    """Invalidate cached credentials in every process after an edit.
+
+    Clears this process's cache and bumps ``credential:cache_version`` so
+    that other processes reload on their next :meth:`CredentialPool.acquire`.
+    Failures are logged and swallowed; stale entries then expire with the
+    cache TTL.
+
+    Args:
+        redis_client: Optional async Redis client.  When ``None`` a client
+            is created from ``Settings.redis_url`` and closed afterwards.
+    """
+    _credential_cache.clear()
+    client = redis_client
+    try:
+        if client is None:
+            import redis.asyncio as aioredis
+
+            from issue_observatory.config.settings import get_settings
+
+            client = aioredis.from_url(get_settings().redis_url)
+        await client.incr(_CACHE_VERSION_KEY)
+    except Exception:
+        logger.warning("Failed to bump credential cache version")
+    finally:
+        if redis_client is None and client is not None:
+            try:
+                await client.aclose()
+            except Exception:
+                logger.debug("Failed to close Redis client", exc_info=True)
+
+
 # ---------------------------------------------------------------------------
 # CredentialPool
 # ---------------------------------------------------------------------------
@@ -222,6 +388,7 @@ class CredentialPool:
         self._cooldown_ids: set[str] = set()
         # Lazy Redis client
         self._redis: Any | None = None
+        self._acquire_sha: str = ""
 
     # ------------------------------------------------------------------
     # Redis helpers
@@ -230,6 +397,8 @@ class CredentialPool:
     async def _get_redis(self) -> Any:
         """Return (lazily initialised) async Redis client.
 
+        On the worker runtime loop the process-wide shared client is used.
+
         Returns:
             A :class:`redis.asyncio.Redis` instance.
         """
@@ -246,6 +415,13 @@ class CredentialPool:
             except Exception:
                 url = "redis://localhost:6379/0"
 
+        from issue_observatory.workers.runtime import on_runtime_loop, shared_redis
+
+        if on_runtime_loop():
+            self._redis = shared_redis(url)
+            if self._redis is not None:
+                return self._redis
+
         self._redis = aioredis.from_url(
             url,
             encoding="utf-8",
@@ -399,14 +575,17 @@ class CredentialPool:
             )
             return []
 
-    async def _update_last_used_at(self, credential_id: uuid.UUID) -> None:
-        """Update ``last_used_at`` on the DB credential row.
+    async def _update_last_used_at(self, used_at: dict[str, datetime]) -> bool:
+        """Write ``last_used_at`` for several DB credential rows in one batch.
 
         Args:
-            credential_id: UUID of the credential to update.
+            used_at: ``{credential_id: last use}`` to write.
+
+        Returns:
+            ``True`` if the update was committed.
         """
         try:
-            from sqlalchemy import update
+            from sqlalchemy import bindparam, update
 
             from issue_observatory.core.database import AsyncSessionLocal
             from issue_observatory.core.models.credentials import ApiCredential
@@ -414,12 +593,55 @@ class CredentialPool:
             async with AsyncSessionLocal() as db:
                 await db.execute(
                     update(ApiCredential)
-                    .where(ApiCredential.id == credential_id)
-                    .values(last_used_at=datetime.now(tz=UTC))
+                    .where(ApiCredential.id == bindparam("b_id"))
+                    .values(last_used_at=bindparam("b_used_at")),
+                    [
+                        {"b_id": uuid.UUID(cred_id), "b_used_at": ts}
+                        for cred_id, ts in used_at.items()
+                    ],
                 )
                 await db.commit()
+            return True
         except Exception:
-            logger.warning("Failed to update last_used_at for credential '%s'", credential_id)
+            logger.warning(
+                "Failed to update last_used_at for %d credential(s)", len(used_at)
+            )
+            return False
+
+    async def _record_last_used(self, credential_id: str) -> None:
+        """Queue a ``last_used_at`` write and flush the queue when due.
+
+        Writes are coalesced per process: the queue is flushed in one
+        batched UPDATE at most every :data:`_LAST_USED_FLUSH_SECONDS`.
+        The flush is awaited inline rather than scheduled as a background
+        task so that it has finished when the calling Celery task returns.
+        Whatever is still queued then is written by :meth:`flush_last_used`
+        from the worker's ``task_postrun`` handler.
+
+        Args:
+            credential_id: String UUID of the acquired credential.
+        """
+        _pending_last_used[credential_id] = datetime.now(tz=UTC)
+        now = time.monotonic()
+        if _last_used_flushed_at and now - _last_used_flushed_at < _LAST_USED_FLUSH_SECONDS:
+            return
+        await self.flush_last_used()
+
+    async def flush_last_used(self) -> None:
+        """Write every queued ``last_used_at`` now, in one batched UPDATE.
+
+        Entries stay queued when the write fails.  A no-op when nothing is
+        queued.
+        """
+        global _last_used_flushed_at
+        if not _pending_last_used:
+            return
+        _last_used_flushed_at = time.monotonic()
+        batch = dict(_pending_last_used)
+        if await self._update_last_used_at(batch):
+            for cred_id, ts in batch.items():
+                if _pending_last_used.get(cred_id) == ts:
+                    del _pending_last_used[cred_id]
 
     async def _update_error_fields(
         self, credential_id: uuid.UUID, error_count: int
@@ -509,6 +731,143 @@ class CredentialPool:
         except Exception:
             logger.warning("Failed to increment quota counters for credential '%s'", credential_id)
 
+    # ------------------------------------------------------------------
+    # Candidate cache and atomic acquisition
+    # ------------------------------------------------------------------
+
+    async def _cached_candidates(self, platform: str, tier: str) -> _CacheEntry:
+        """Return cached decrypted candidates, loading them on a miss.
+
+        The cache version is read before the DB query so that an edit
+        committed in between makes the entry stale rather than current.
+        Empty results are not cached so newly added credentials are seen
+        immediately.
+
+        Args:
+            platform: Platform identifier.
+            tier: Tier identifier.
+
+        Returns:
+            The :class:`_CacheEntry` for *platform* / *tier*.
+        """
+        cache_key = (platform, tier)
+        entry = _credential_cache.get(cache_key)
+        if entry is not None and entry.expires_at > time.monotonic():
+            return entry
+
+        version = await self._redis_get(_CACHE_VERSION_KEY) or "0"
+        credentials: list[_CachedCredential] = []
+        for row in await self._query_db_credentials(platform, tier):
+            cred_id_str = str(row.id)
+            try:
+                payload = _decrypt_credentials(row.credentials)
+            except ValueError:
+                logger.warning("Failed to decrypt credential '%s' — skipping.", cred_id_str)
+                continue
+            last_used_at = getattr(row, "last_used_at", None)
+            credentials.append(
+                _CachedCredential(
+                    id=cred_id_str,
+                    payload=payload,
+                    daily_quota=row.daily_quota,
+                    monthly_quota=row.monthly_quota,
+                    last_used=(
+                        last_used_at.timestamp() if isinstance(last_used_at, datetime) else 0.0
+                    ),
+                )
+            )
+
+        entry = _CacheEntry(
+            version=version,
+            expires_at=time.monotonic() + _cache_ttl_seconds(),
+            credentials=credentials,
+        )
+        if credentials:
+            _credential_cache[cache_key] = entry
+        return entry
+
+    async def _run_acquire_script(
+        self,
+        candidates: list[_CachedCredential],
+        version: str,
+        platform: str,
+        task_id: str,
+    ) -> tuple[int, str]:
+        """Check and acquire the first eligible candidate in one Redis call.
+
+        Args:
+            candidates: Cached candidates (LRU order).
+            version: Cache version the candidates were loaded under.
+            platform: Platform identifier, stored as the lease value.
+            task_id: Task ID the lease is recorded under.
+
+        Returns:
+            ``(index, version)`` — index of the acquired candidate, or
+            ``_STALE`` / ``_NONE_ELIGIBLE``; and the current cache version.
+
+        Raises:
+            Exception: Any Redis error; the caller falls back to
+                :meth:`_acquire_stepwise`.
+        """
+        keys: list[str] = [_CACHE_VERSION_KEY]
+        quotas: list[str] = []
+        for cred in candidates:
+            keys += [
+                f"credential:cooldown:{cred.id}",
+                f"credential:quota:{cred.id}:daily",
+                f"credential:quota:{cred.id}:monthly",
+                f"credential:lease:{cred.id}:{task_id}",
+            ]
+            quotas += [
+                str(cred.daily_quota if cred.daily_quota is not None else -1),
+                str(cred.monthly_quota if cred.monthly_quota is not None else -1),
+            ]
+        r = await self._get_redis()
+        if not self._acquire_sha:
+            self._acquire_sha = await r.script_load(_LUA_ACQUIRE)
+        index, current_version = await r.evalsha(
+            self._acquire_sha,
+            len(keys),
+            *keys,
+            version,
+            str(len(candidates)),
+            str(_LEASE_TTL_SECONDS),
+            platform,
+            str(self._seconds_until_midnight_utc()),
+            str(self._seconds_until_month_end_utc()),
+            *quotas,
+        )
+        return int(index), str(current_version)
+
+    async def _acquire_stepwise(
+        self, candidates: list[_CachedCredential], platform: str, task_id: str
+    ) -> int:
+        """Acquire the first eligible candidate with individual Redis calls.
+
+        Fallback for when the Lua script cannot run.  Each step fails open
+        like the Redis helpers it uses.
+
+        Args:
+            candidates: Cached candidates (LRU order).
+            platform: Platform identifier, stored as the lease value.
+            task_id: Task ID the lease is recorded under.
+
+        Returns:
+            Index of the acquired candidate, or ``_NONE_ELIGIBLE``.
+        """
+        for index, cred in enumerate(candidates):
+            if await self._is_on_cooldown(cred.id):
+                logger.debug("DB credential '%s' is on cooldown — skipping.", cred.id)
+                continue
+            if await self._is_quota_exceeded(cred.id, cred.daily_quota, cred.monthly_quota):
+                logger.debug("DB credential '%s' has exceeded quota — skipping.", cred.id)
+                continue
+            lease_key = f"credential:lease:{cred.id}:{task_id}"
+            await self._redis_set(lease_key, platform, _LEASE_TTL_SECONDS)
+            await self._increment_quota(cred.id)
+            return index
+        return _NONE_ELIGIBLE
+
     # ------------------------------------------------------------------
     # Public interface
     # ------------------------------------------------------------------
@@ -522,12 +881,14 @@ class CredentialPool:
         """Acquire a credential for *platform* / *tier*.
 
         Query flow:
-        1. Load active credentials from DB (LRU order).
-        2. Skip credentials that are on cooldown or have exceeded their quota.
-        3. Select the first eligible credential.
-        4. Set a Redis lease for the acquired credential.
-        5. Increment quota counters.
-        6. If no DB credential is found, fall back to env-var discovery.
+        1. Load active, decrypted credentials (in-process cache, else DB;
+           LRU order).
+        2. In one Lua call: verify the cache version, skip credentials that
+           are on cooldown or have exceeded their quota, set a Redis lease
+           for the first eligible credential and increment its quota
+           counters.  A stale cache is reloaded and the call retried once.
+        3. Queue a coalesced ``last_used_at`` update.
+        4. If no DB credential is usable, fall back to env-var discovery.
 
         Args:
             platform: Platform identifier in lowercase (e.g. ``"serper"``).
@@ -544,57 +905,81 @@ class CredentialPool:
             - ``api_key`` (str): Primary API key.
             - Additional platform-specific fields from the decrypted payload.
         """
+        from issue_observatory.core.worker_metrics import credential_acquire_seconds
+
+        started = time.perf_counter()
         effective_task_id = task_id or str(uuid.uuid4())
 
         # -- Attempt 1: Database credentials -----------------------------------
-        db_rows = await self._query_db_credentials(platform, tier)
-        for row in db_rows:
-            cred_id_str = str(row.id)
-
-            if await self._is_on_cooldown(cred_id_str):
-                logger.debug("DB credential '%s' is on cooldown — skipping.", cred_id_str)
-                continue
-
-            if await self._is_quota_exceeded(cred_id_str, row.daily_quota, row.monthly_quota):
-                logger.debug("DB credential '%s' has exceeded quota — skipping.", cred_id_str)
-                continue
-
-            # Decrypt
+        entry: _CacheEntry | None = None
+        # Snapshot: concurrent acquires re-sort entry.credentials.
+        candidates: list[_CachedCredential] = []
+        index = _STALE
+        for _attempt in range(2):
+            entry = await self._cached_candidates(platform, tier)
+            candidates = list(entry.credentials)
+            if not candidates:
+                break
             try:
-                payload = _decrypt_credentials(row.credentials)
-            except ValueError:
-                logger.warning("Failed to decrypt credential '%s' — skipping.", cred_id_str)
-                continue
-
-            # Set Redis lease
-            lease_key = f"credential:lease:{cred_id_str}:{effective_task_id}"
-            await self._redis_set(lease_key, platform, _LEASE_TTL_SECONDS)
+                index, version = await self._run_acquire_script(
+                    candidates, entry.version, platform, effective_task_id
+                )
+            except Exception:
+                logger.debug(
+                    "Atomic credential acquire unavailable — checking step by step.",
+                    exc_info=True,
+                )
+                self._acquire_sha = ""
+                index = await self._acquire_stepwise(candidates, platform, effective_task_id)
+                break
+            if index != _STALE:
+                break
+            logger.debug(
+                "Credential cache for %s/%s is stale (version %s) — reloading.",
+                platform,
+                tier,
+                version,
+            )
+            _credential_cache.pop((platform, tier), None)
 
-            # Increment quota counters
-            await self._increment_quota(cred_id_str)
+        if candidates and index == _STALE:
+            index = await self._acquire_stepwise(candidates, platform, effective_task_id)
 
-            # Update last_used_at (best-effort, don't block)
-            await self._update_last_used_at(row.id)
+        if entry is not None and index >= 0:
+            cred = candidates[index]
+            cred.last_used = time.time()
+            entry.credentials.sort(key=lambda c: c.last_used)
+            await self._record_last_used(cred.id)
 
             logger.debug(
-                "Acquired DB credential '%s' for %s/%s.", cred_id_str, platform, tier
+                "Acquired DB credential '%s' for %s/%s.", cred.id, platform, tier
             )
 
             result: dict[str, Any] = {
-                "id": cred_id_str,
+                "id": cred.id,
                 "platform": platform,
                 "tier": tier,
-                **payload,
+                **cred.payload,
             }
             # Ensure api_key is present if the payload uses a different key name
-            if "api_key" not in result and payload:
-                first_val = next(iter(payload.values()), None)
+            if "api_key" not in result and cred.payload:
+                first_val = next(iter(cred.payload.values()), None)
                 if isinstance(first_val, str):
                     result["api_key"] = first_val
+            credential_acquire_seconds.observe(
+                time.perf_counter() - started, platform=platform, tier=tier, source="db"
+            )
             return result
 
         # -- Attempt 2: Env-var fallback (Phase 0 behaviour) ------------------
-        return await self._acquire_from_env(platform, tier)
+        env_result = await self._acquire_from_env(platform, tier)
+        credential_acquire_seconds.observe(
+            time.perf_counter() - started,
+            platform=platform,
+            tier=tier,
+            source="env" if env_result is not None else "none",
+        )
+        return env_result
 
     async def _acquire_from_env(
         self,
@@ -710,6 +1095,76 @@ class CredentialPool:
                 result["api_key"] = first_val
         return result
 
+    async def get(
+        self,
+        platform: str,
+        tier: str,
+        credential_id: str,
+    ) -> dict[str, Any] | None:
+        """Return the credential *credential_id* without leasing it.
+
+        For work that must continue on the account that started it (e.g. a
+        Bright Data snapshot can only be polled and downloaded with the token
+        that triggered it).  Cooldowns, quotas and leases are not checked.
+
+        Args:
+            platform: Platform identifier.
+            tier: Tier identifier.
+            credential_id: The ``id`` of a credential dict from ``acquire()``.
+
+        Returns:
+            Credential dict shaped like the one from ``acquire()``, or
+            ``None`` if the credential no longer exists or is inactive.
+        """
+        for _attempt in range(2):
+            cached = _credential_cache.get((platform, tier))
+            entry = await self._cached_candidates(platform, tier)
+            for cred in entry.credentials:
+                if cred.id == credential_id:
+                    result: dict[str, Any] = {
+                        "id": cred.id,
+                        "platform": platform,
+                        "tier": tier,
+                        **cred.payload,
+                    }
+                    if "api_key" not in result and cred.payload:
+                        first_val = next(iter(cred.payload.values()), None)
+                        if isinstance(first_val, str):
+                            result["api_key"] = first_val
+                    return result
+            if entry is not cached:
+                break
+            # The credential may have been added after the entry was cached.
+            _credential_cache.pop((platform, tier), None)
+
+        env_map = _PLATFORM_ENV_MAP.get((platform, tier))
+        if env_map and credential_id == f"env:{platform}:{tier}":
+            payload = {
+                field: self._env[env_var]
+                for field, env_var in env_map.items()
+                if self._env.get(env_var)
+            }
+            if payload:
+                result = {"id": credential_id, "platform": platform, "tier": tier, **payload}
+                if "api_key" not in result:
+                    first_val = next(iter(payload.values()), None)
+                    if isinstance(first_val, str):
+                        result["api_key"] = first_val
+                return result
+
+        prefix = f"{platform.upper()}_{tier.upper()}_"
+        for cred_id, api_key in self._discover_env_credentials(prefix):
+            if cred_id == credential_id:
+                return {"id": cred_id, "platform": platform, "tier": tier, "api_key": api_key}
+
+        logger.warning(
+            "Credential '%s' for platform='%s' tier='%s' is no longer available.",
+            credential_id,
+            platform,
+            tier,
+        )
+        return None
+
     async def release(
         self,
         credential_id: str,
@@ -719,7 +1174,7 @@ class CredentialPool:
         """Release a previously acquired credential.
 
         Deletes the Redis lease key.  For DB credentials, ``last_used_at``
-        is already updated in ``acquire()``.  For env-var credentials this
+        is already queued for update by ``acquire()``.  For env-var credentials this
         is a no-op (no lease key exists).
 
         Args:
@@ -940,6 +1395,16 @@ def get_credential_pool() -> CredentialPool:
     return _pool_singleton
 
 
+def has_pending_last_used() -> bool:
+    """Return ``True`` if ``last_used_at`` writes are queued in this process.
+
+    Lets the worker signal handlers skip the event-loop round trip of
+    :meth:`CredentialPool.flush_last_used` after tasks that acquired no
+    credential.
+    """
+    return bool(_pending_last_used)
+
+
 # ---------------------------------------------------------------------------
 # Utility
 # ---------------------------------------------------------------------------
@@ -8,7 +8,9 @@ Item 15 — adds SimHash-based near-duplicate detection.  SimHash is a
 64-bit locality-sensitive hash: two records with Hamming distance <= 3
 over their SimHash fingerprints are considered near-duplicates and stamped
 with ``raw_metadata['near_duplicate_of']`` (distinct from exact-duplicate
-``raw_metadata['duplicate_of']``).
+``raw_metadata['duplicate_of']``).  Candidate pairs are found with
+:class:`SimHashIndex`, a block-partitioned multi-index, so clustering scales
+near-linearly with run size instead of comparing every pair.
 
 GR-08 — adds ``run_propagation_analysis()`` which groups all records that
 carry a ``near_duplicate_cluster_id`` into clusters, runs
@@ -33,6 +35,7 @@ from __future__ import annotations
 import hashlib
 import json
 import uuid
+from contextvars import ContextVar
 from datetime import UTC, datetime
 from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 
@@ -40,10 +43,17 @@ import structlog
 from sqlalchemy import func, select, text, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from issue_observatory.core import content_rollups
 from issue_observatory.core.models.content import UniversalContentRecord
 
 logger = structlog.get_logger(__name__)
 
+# Set by DeduplicationService.run_dedup_pass() so that mark_duplicates()
+# defers rollup slice recomputation to the end of the pass.
+_deferred_rollup_slices: ContextVar[content_rollups.RollupSlices | None] = ContextVar(
+    "_deferred_rollup_slices", default=None
+)
+
 # ---------------------------------------------------------------------------
 # SimHash — 64-bit locality-sensitive hashing for near-duplicate detection
 # ---------------------------------------------------------------------------
@@ -123,6 +133,142 @@ def hamming_distance(a: int, b: int) -> int:
     return bin(a ^ b).count("1")
 
 
+# ---------------------------------------------------------------------------
+# Multi-index SimHash lookup — sub-quadratic near-duplicate search
+# ---------------------------------------------------------------------------
+
+
+class SimHashIndex:
+    """Block-partitioned multi-index over 64-bit SimHash fingerprints.
+
+    Splits each fingerprint into ``hamming_threshold + 1`` contiguous bit
+    blocks and keeps one hash table per block.  By the pigeonhole principle
+    two fingerprints within ``hamming_threshold`` bits of each other agree
+    exactly on at least one block, so only records sharing a bucket in some
+    table need an exact Hamming check (Manku et al., WWW 2007).  For
+    well-spread fingerprints bucket sizes stay small and clustering runs in
+    near-linear time, replacing the former all-pairs scan.
+
+    Identical fingerprints are collapsed before indexing so that large
+    groups of exact duplicates (e.g. reposts) do not degrade into a
+    quadratic bucket scan.
+
+    Fingerprints are masked to unsigned 64-bit values, so the signed BIGINT
+    representation stored in ``content_records.simhash`` and the unsigned
+    value returned by :func:`compute_simhash` index identically.
+
+    Args:
+        hamming_threshold: Maximum Hamming distance (inclusive) for two
+            fingerprints to be considered near-duplicates.
+    """
+
+    def __init__(self, hamming_threshold: int = 3) -> None:
+        if hamming_threshold < 0:
+            raise ValueError("hamming_threshold must be non-negative")
+        self._threshold = hamming_threshold
+
+        # Each block is a (shift, mask) pair selecting a contiguous bit range.
+        # With a threshold of 64 or more every pair matches, so a single
+        # empty-key block puts all fingerprints into one bucket.
+        self._blocks: list[tuple[int, int]] = []
+        if hamming_threshold < _SIMHASH_BITS:
+            num_blocks = hamming_threshold + 1
+            base, extra = divmod(_SIMHASH_BITS, num_blocks)
+            shift = 0
+            for i in range(num_blocks):
+                width = base + (1 if i < extra else 0)
+                self._blocks.append((shift, (1 << width) - 1))
+                shift += width
+        else:
+            self._blocks.append((0, 0))
+
+        self._tables: list[dict[int, list[int]]] = [{} for _ in self._blocks]
+        self._keys_by_fingerprint: dict[int, list[str]] = {}
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, key: str, fingerprint: int) -> None:
+        """Index *fingerprint* under *key*.
+
+        Args:
+            key: Caller-defined identifier (typically a record UUID string).
+            fingerprint: SimHash value, signed or unsigned 64-bit.
+        """
+        fp = fingerprint & (_SIMHASH_MOD - 1)
+        keys = self._keys_by_fingerprint.get(fp)
+        if keys is None:
+            self._keys_by_fingerprint[fp] = [key]
+            for table, (shift, mask) in zip(self._tables, self._blocks, strict=True):
+                table.setdefault((fp >> shift) & mask, []).append(fp)
+        else:
+            keys.append(key)
+        self._size += 1
+
+    def _candidates(self, fp: int) -> set[int]:
+        candidates: set[int] = set()
+        for table, (shift, mask) in zip(self._tables, self._blocks, strict=True):
+            bucket = table.get((fp >> shift) & mask)
+            if bucket:
+                candidates.update(bucket)
+        return candidates
+
+    def query(self, fingerprint: int) -> list[str]:
+        """Return the keys of all indexed fingerprints within the threshold.
+
+        Args:
+            fingerprint: SimHash value to look up.
+
+        Returns:
+            Keys whose fingerprints are within ``hamming_threshold`` bits of
+            *fingerprint*, including exact matches.
+        """
+        fp = fingerprint & (_SIMHASH_MOD - 1)
+        matches: list[str] = []
+        for other in self._candidates(fp):
+            if (fp ^ other).bit_count() <= self._threshold:
+                matches.extend(self._keys_by_fingerprint[other])
+        return matches
+
+    def clusters(self) -> list[list[str]]:
+        """Group all indexed keys into near-duplicate clusters.
+
+        Clusters are the connected components of the "within threshold"
+        relation, so membership is transitive exactly as with the former
+        pairwise union-find scan.
+
+        Returns:
+            A list of clusters, each a list of two or more keys.  Keys
+            appear in insertion order within each cluster.
+        """
+        parent: dict[int, int] = {fp: fp for fp in self._keys_by_fingerprint}
+
+        def find(x: int) -> int:
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]  # path compression
+                x = parent[x]
+            return x
+
+        threshold = self._threshold
+        for table in self._tables:
+            for bucket in table.values():
+                if len(bucket) < 2:
+                    continue
+                for i, a in enumerate(bucket):
+                    for b in bucket[i + 1 :]:
+                        ra, rb = find(a), find(b)
+                        # Pairs sharing several blocks are seen once per
+                        # table; skip the popcount once already merged.
+                        if ra != rb and (a ^ b).bit_count() <= threshold:
+                            parent[rb] = ra
+
+        grouped: dict[int, list[str]] = {}
+        for fp, keys in self._keys_by_fingerprint.items():
+            grouped.setdefault(find(fp), []).extend(keys)
+        return [keys for keys in grouped.values() if len(keys) >= 2]
+
+
 async def find_near_duplicates(
     db: AsyncSession,
     run_id: uuid.UUID | None = None,
@@ -177,49 +323,18 @@ async def find_near_duplicates(
     if not rows:
         return []
 
-    # Union-Find to group records into near-duplicate clusters.
-    # O(n^2) in record count — suitable for per-run batches (typically < 50K).
-    parent: dict[str, str] = {str(row.id): str(row.id) for row in rows}
-
-    def find(x: str) -> str:
-        while parent[x] != x:
-            parent[x] = parent[parent[x]]  # path compression
-            x = parent[x]
-        return x
-
-    def union(x: str, y: str) -> None:
-        rx, ry = find(x), find(y)
-        if rx != ry:
-            # Elect the lexicographically smaller UUID as the cluster root.
-            if rx < ry:
-                parent[ry] = rx
-            else:
-                parent[rx] = ry
-
+    # Near-linear clustering via the multi-index SimHash index instead of a
+    # pairwise scan, which is O(n^2) and infeasible for 100K+ record runs.
     records_by_id = {str(row.id): row for row in rows}
-    ids = list(records_by_id.keys())
-
-    for i in range(len(ids)):
-        for j in range(i + 1, len(ids)):
-            a_hash = records_by_id[ids[i]].simhash
-            b_hash = records_by_id[ids[j]].simhash
-            if a_hash is not None and b_hash is not None:
-                if hamming_distance(a_hash, b_hash) <= hamming_threshold:
-                    union(ids[i], ids[j])
 
-    # Group by cluster root
-    from collections import defaultdict
-
-    clusters: dict[str, list[str]] = defaultdict(list)
-    for record_id in ids:
-        root = find(record_id)
-        clusters[root].append(record_id)
+    index = SimHashIndex(hamming_threshold=hamming_threshold)
+    for record_id, row in records_by_id.items():
+        index.add(record_id, row.simhash)
 
     output = []
-    for root, member_ids in clusters.items():
-        if len(member_ids) < 2:
-            continue
-        canonical_id = root
+    for member_ids in index.clusters():
+        # Elect the lexicographically smallest UUID as the canonical record.
+        canonical_id = min(member_ids)
         near_duplicate_ids = [mid for mid in member_ids if mid != canonical_id]
         output.append(
             {
@@ -482,6 +597,10 @@ class DeduplicationService:
         Sets ``raw_metadata['duplicate_of'] = str(canonical_id)`` on every
         record in ``duplicate_ids``.  The canonical record is left untouched.
 
+        The content rollup slices holding the marked records are recomputed
+        in the same transaction — or, inside :meth:`run_dedup_pass`, once
+        for the whole pass.
+
         Args:
             db: Active async database session.
             canonical_id: UUID of the record to treat as the canonical copy.
@@ -508,10 +627,20 @@ class DeduplicationService:
                     func.to_jsonb(str(canonical_id)),
                 )
             )
+            .returning(
+                UniversalContentRecord.query_design_id,
+                UniversalContentRecord.published_at,
+            )
             .execution_options(synchronize_session=False)
         )
         result = await db.execute(stmt)
         count: int = result.rowcount
+        deferred = _deferred_rollup_slices.get()
+        slices: content_rollups.RollupSlices = {} if deferred is None else deferred
+        for row in result.fetchall():
+            content_rollups.add_slice(slices, row.query_design_id, row.published_at)
+        if deferred is None:
+            await content_rollups.refresh_slices(db, slices)
         logger.info(
             "dedup.mark_duplicates",
             canonical_id=str(canonical_id),
@@ -604,6 +733,8 @@ class DeduplicationService:
         self,
         db: AsyncSession,
         run_id: uuid.UUID,
+        include_near_duplicates: bool = False,
+        hamming_threshold: int = 3,
     ) -> dict:
         """Run a full deduplication pass for one collection run.
 
@@ -616,11 +747,18 @@ class DeduplicationService:
         4. For each hash duplicate group, elect the canonical record (lowest
            UUID value, with ties broken by highest engagement_score) and
            mark the rest.
-        5. Commit the transaction.
+        5. When *include_near_duplicates* is set, run the SimHash
+           near-duplicate pass (:meth:`detect_and_mark_near_duplicates`).
+        6. Recompute the content rollup slices touched by steps 2 and 4.
+        7. Commit the transaction.
 
         Args:
             db: Active async database session.
             run_id: UUID of the collection run to deduplicate.
+            include_near_duplicates: Also mark SimHash near-duplicates with
+                ``raw_metadata['near_duplicate_of']``.
+            hamming_threshold: Maximum Hamming distance for the near-duplicate
+                pass.  Ignored unless *include_near_duplicates* is set.
 
         Returns:
             Dict with keys:
@@ -628,25 +766,41 @@ class DeduplicationService:
             - ``url_groups`` (int): Number of URL duplicate groups found.
             - ``hash_groups`` (int): Number of hash duplicate groups found.
             - ``total_marked`` (int): Total records marked as duplicates.
+            - ``near_duplicates_marked`` (int): Records marked as
+              near-duplicates (only present with *include_near_duplicates*).
         """
         total_marked = 0
+        # mark_duplicates() collects touched rollup slices here instead of
+        # recomputing them once per group.
+        rollup_slices: content_rollups.RollupSlices = {}
+        token = _deferred_rollup_slices.set(rollup_slices)
+        try:
+            # --- URL pass ---
+            url_groups = await self.find_url_duplicates(db, run_id=run_id)
+            for group in url_groups:
+                record_ids = [uuid.UUID(r["id"]) for r in group["records"]]
+                canonical_id = min(record_ids)
+                duplicate_ids = [rid for rid in record_ids if rid != canonical_id]
+                total_marked += await self.mark_duplicates(db, canonical_id, duplicate_ids)
+
+            # --- Hash pass ---
+            hash_groups = await self.find_hash_duplicates(db, run_id=run_id)
+            for group in hash_groups:
+                record_ids = [uuid.UUID(r["id"]) for r in group["records"]]
+                canonical_id = min(record_ids)
+                duplicate_ids = [rid for rid in record_ids if rid != canonical_id]
+                total_marked += await self.mark_duplicates(db, canonical_id, duplicate_ids)
+        finally:
+            _deferred_rollup_slices.reset(token)
+
+        # --- SimHash near-duplicate pass ---
+        near_marked: int | None = None
+        if include_near_duplicates:
+            near_marked = await self.detect_and_mark_near_duplicates(
+                db, run_id=run_id, hamming_threshold=hamming_threshold
+            )
 
-        # --- URL pass ---
-        url_groups = await self.find_url_duplicates(db, run_id=run_id)
-        for group in url_groups:
-            record_ids = [uuid.UUID(r["id"]) for r in group["records"]]
-            canonical_id = min(record_ids)
-            duplicate_ids = [rid for rid in record_ids if rid != canonical_id]
-            total_marked += await self.mark_duplicates(db, canonical_id, duplicate_ids)
-
-        # --- Hash pass ---
-        hash_groups = await self.find_hash_duplicates(db, run_id=run_id)
-        for group in hash_groups:
-            record_ids = [uuid.UUID(r["id"]) for r in group["records"]]
-            canonical_id = min(record_ids)
-            duplicate_ids = [rid for rid in record_ids if rid != canonical_id]
-            total_marked += await self.mark_duplicates(db, canonical_id, duplicate_ids)
-
+        await content_rollups.refresh_slices(db, rollup_slices)
         await db.commit()
 
         summary = {
@@ -654,6 +808,8 @@ class DeduplicationService:
             "hash_groups": len(hash_groups),
             "total_marked": total_marked,
         }
+        if near_marked is not None:
+            summary["near_duplicates_marked"] = near_marked
         logger.info("dedup.run_complete", run_id=str(run_id), **summary)
         return summary
 
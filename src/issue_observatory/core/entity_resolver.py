@@ -433,6 +433,10 @@ class EntityResolver:
             ActorAlias,
             ActorPlatformPresence,
         )
+        from issue_observatory.core.analysis_cache import (
+            content_record_scopes,
+            get_analysis_cache,
+        )
         from issue_observatory.core.models.content import UniversalContentRecord
 
         log = _structlog.get_logger(__name__).bind(
@@ -444,6 +448,8 @@ class EntityResolver:
 
         records_updated = 0
         presences_moved = 0
+        affected_runs: set[uuid.UUID] = set()
+        affected_designs: set[uuid.UUID] = set()
 
         for dup_id in duplicate_ids:
             # Fetch the duplicate actor before deletion (need canonical_name).
@@ -454,6 +460,11 @@ class EntityResolver:
                 continue
 
             # Step 1: Re-point content_records.author_id.
+            run_ids, design_ids = await content_record_scopes(
+                db, UniversalContentRecord.author_id == dup_id
+            )
+            affected_runs |= run_ids
+            affected_designs |= design_ids
             update_content = (
                 update(UniversalContentRecord)
                 .where(UniversalContentRecord.author_id == dup_id)
@@ -509,6 +520,9 @@ class EntityResolver:
             )
 
         await db.commit()
+        await get_analysis_cache().invalidate(
+            run_ids=affected_runs, design_ids=affected_designs
+        )
 
         result = {
             "merged": len(duplicate_ids),
@@ -560,6 +574,10 @@ class EntityResolver:
             ActorAlias,
             ActorPlatformPresence,
         )
+        from issue_observatory.core.analysis_cache import (
+            content_record_scopes,
+            get_analysis_cache,
+        )
         from issue_observatory.core.models.content import UniversalContentRecord
 
         log = _structlog.get_logger(__name__).bind(
@@ -580,6 +598,8 @@ class EntityResolver:
 
         presences_moved = 0
         records_updated = 0
+        affected_runs: set[uuid.UUID] = set()
+        affected_designs: set[uuid.UUID] = set()
 
         # Step 2 & 3: Move presences and re-point content records.
         for pres_id in platform_presence_ids:
@@ -608,12 +628,16 @@ class EntityResolver:
 
             # Re-point content records authored via this presence.
             if puid:
+                moved_records = (
+                    UniversalContentRecord.author_platform_id == puid,
+                    UniversalContentRecord.author_id == actor_id,
+                )
+                run_ids, design_ids = await content_record_scopes(db, *moved_records)
+                affected_runs |= run_ids
+                affected_designs |= design_ids
                 cr_result = await db.execute(
                     update(UniversalContentRecord)
-                    .where(
-                        UniversalContentRecord.author_platform_id == puid,
-                        UniversalContentRecord.author_id == actor_id,
-                    )
+                    .where(*moved_records)
                     .values(author_id=new_actor.id)
                     .execution_options(synchronize_session=False)
                 )
@@ -631,6 +655,9 @@ class EntityResolver:
             await db.rollback()
 
         await db.commit()
+        await get_analysis_cache().invalidate(
+            run_ids=affected_runs, design_ids=affected_designs
+        )
 
         result = {
             "new_actor_id": str(new_actor.id),
@@ -51,19 +51,39 @@ Usage in arena tasks::
 
 The function is synchronous so it can be called from Celery task bodies
 (which run in a standard thread-pool worker, not inside an event loop).
-It creates a short-lived synchronous Redis connection, publishes the message,
-then closes the connection immediately.  This is intentionally fire-and-forget:
-a publish failure is logged at WARNING and never propagates to the caller.
+Each process keeps one synchronous Redis client per URL whose connection pool
+is reused across publishes, so an event costs a single ``PUBLISH`` round-trip
+rather than a connect/publish/close cycle.  This is intentionally
+fire-and-forget: a publish failure is logged at WARNING and never propagates
+to the caller.
 """
 
 from __future__ import annotations
 
 import json
 import logging
+import os
 import time
+from typing import Any
 
 logger = logging.getLogger(__name__)
 
+#: Synchronous Redis clients keyed by ``(redis_url, pid)``.  Keying by pid
+#: keeps a forked worker from reusing its parent's pooled sockets.
+_sync_clients: dict[tuple[str, int], Any] = {}
+
+
+def _get_sync_client(redis_url: str) -> Any:
+    """Return this process's pooled synchronous Redis client for *redis_url*."""
+    key = (redis_url, os.getpid())
+    client = _sync_clients.get(key)
+    if client is None:
+        import redis as redis_lib
+
+        client = redis_lib.from_url(redis_url, decode_responses=True)
+        _sync_clients[key] = client
+    return client
+
 
 def publish_task_update(
     redis_url: str,
@@ -78,9 +98,8 @@ def publish_task_update(
 ) -> None:
     """Publish a task-update event to the collection run's Redis pub/sub channel.
 
-    Designed to be called from synchronous Celery task bodies.  Opens a
-    short-lived synchronous Redis connection, publishes one message, and
-    closes immediately.
+    Designed to be called from synchronous Celery task bodies.  Publishes
+    one message over the process's pooled synchronous Redis connection.
 
     The message is silently dropped (with a WARNING log) if Redis is
     unavailable or if the ``redis`` package is not installed — this must
@@ -101,8 +120,6 @@ def publish_task_update(
             if not tracked by the caller.
     """
     try:
-        import redis as redis_lib
-
         payload: dict = {
             "event": "task_update",
             "arena": arena,
@@ -114,17 +131,13 @@ def publish_task_update(
             "elapsed_seconds": round(elapsed_seconds, 1),
         }
         channel = f"collection:{run_id}"
-        r = redis_lib.from_url(redis_url, decode_responses=True)
-        try:
-            r.publish(channel, json.dumps(payload))
-            logger.debug(
-                "event_bus: published task_update arena=%s status=%s run=%s",
-                arena,
-                status,
-                run_id,
-            )
-        finally:
-            r.close()
+        _get_sync_client(redis_url).publish(channel, json.dumps(payload))
+        logger.debug(
+            "event_bus: published task_update arena=%s status=%s run=%s",
+            arena,
+            status,
+            run_id,
+        )
     except Exception as exc:
         logger.warning(
             "event_bus: failed to publish task_update for run=%s arena=%s: %s",
@@ -156,8 +169,6 @@ def publish_run_complete(
         credits_spent: Total credits consumed by this run.
     """
     try:
-        import redis as redis_lib
-
         payload: dict = {
             "event": "run_complete",
             "status": status,
@@ -165,17 +176,13 @@ def publish_run_complete(
             "credits_spent": credits_spent,
         }
         channel = f"collection:{run_id}"
-        r = redis_lib.from_url(redis_url, decode_responses=True)
-        try:
-            r.publish(channel, json.dumps(payload))
-            logger.info(
-                "event_bus: published run_complete status=%s run=%s records=%d",
-                status,
-                run_id,
-                records_collected,
-            )
-        finally:
-            r.close()
+        _get_sync_client(redis_url).publish(channel, json.dumps(payload))
+        logger.info(
+            "event_bus: published run_complete status=%s run=%s records=%d",
+            status,
+            run_id,
+            records_collected,
+        )
     except Exception as exc:
         logger.warning(
             "event_bus: failed to publish run_complete for run=%s: %s",
@@ -30,6 +30,10 @@ from issue_observatory.core.models.collection import (
 from issue_observatory.core.models.collection_attempts import CollectionAttempt
 from issue_observatory.core.models.content import UniversalContentRecord
 from issue_observatory.core.models.content_links import ContentRecordLink
+from issue_observatory.core.models.content_rollups import (
+    ContentDailyRollup,
+    ContentDailyTermRollup,
+)
 from issue_observatory.core.models.credentials import ApiCredential
 from issue_observatory.core.models.extracted_url import ExtractedUrl
 from issue_observatory.core.models.platform_url_errors import PlatformUrlError
@@ -67,6 +71,8 @@ __all__ = [
     # Content
     "UniversalContentRecord",
     "ContentRecordLink",
+    "ContentDailyRollup",
+    "ContentDailyTermRollup",
     # Actors
     "Actor",
     "ActorAlias",
@@ -303,6 +303,11 @@ class UniversalContentRecord(Base):
         #   USING GIN(to_tsvector('danish',
         #       coalesce(text_content, '') || ' ' || coalesce(title, '')));
         #
+        # Likewise the pg_trgm index serving substring (ILIKE) term matching,
+        # which needs the pg_trgm extension — see 043_add_content_text_trigram_index.py:
+        #   CREATE INDEX idx_content_text_trgm ON content_records
+        #   USING gin (text_content gin_trgm_ops);
+        #
         # Partition directive (ignored by autogenerate; honoured by
         # create_all() against a live database):
         {"postgresql_partition_by": "RANGE (published_at)"},
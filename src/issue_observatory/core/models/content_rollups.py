@@ -0,0 +1,141 @@
+"""Per-day content rollup ORM models.
+
+Pre-aggregated counts of ``content_records`` so that dashboard cards, volume
+charts and top-term lists do not run ``COUNT(*)`` / ``GROUP BY`` over the
+raw partitions on every page load.  Each row aggregates the records sharing
+one combination of the dimension columns; readers sum ``record_count`` over
+the rows matching their filters.
+
+Only records with a ``query_design_id`` are rolled up — every reader scopes
+by query design.  Rows are maintained by ``core/content_rollups.py``:
+incremental deltas on insert, slice recomputation after duplicate marking,
+and a nightly reconciliation task.
+
+Owned by the DB Engineer.
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import date
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from issue_observatory.core.models.base import Base
+
+
+class ContentDailyRollup(Base):
+    """Record counts and engagement sums per query design, run and day.
+
+    ``day`` is the UTC date of ``published_at`` (``NULL`` for records
+    without a publication timestamp).  ``language`` is the effective
+    language base used by every language filter — the ``language`` column,
+    falling back to the enrichment result, truncated at the first ``-``.
+    ``is_duplicate`` mirrors ``raw_metadata->>'duplicate_of' IS NOT NULL``.
+    """
+
+    __tablename__ = "content_daily_rollups"
+
+    id: Mapped[int] = mapped_column(sa.BigInteger, sa.Identity(), primary_key=True)
+    query_design_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        sa.ForeignKey("query_designs.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    collection_run_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True),
+        nullable=True,
+    )
+    day: Mapped[date | None] = mapped_column(sa.Date, nullable=True)
+    platform: Mapped[str] = mapped_column(sa.String(50), nullable=False)
+    arena: Mapped[str] = mapped_column(sa.String(50), nullable=False)
+    content_type: Mapped[str] = mapped_column(sa.String(50), nullable=False)
+    language: Mapped[str | None] = mapped_column(sa.Text, nullable=True)
+    term_matched: Mapped[bool] = mapped_column(sa.Boolean, nullable=False)
+    is_duplicate: Mapped[bool] = mapped_column(sa.Boolean, nullable=False)
+    record_count: Mapped[int] = mapped_column(
+        sa.BigInteger, nullable=False, server_default=sa.text("0")
+    )
+    likes_sum: Mapped[int] = mapped_column(
+        sa.BigInteger, nullable=False, server_default=sa.text("0")
+    )
+    shares_sum: Mapped[int] = mapped_column(
+        sa.BigInteger, nullable=False, server_default=sa.text("0")
+    )
+    comments_sum: Mapped[int] = mapped_column(
+        sa.BigInteger, nullable=False, server_default=sa.text("0")
+    )
+    views_sum: Mapped[int] = mapped_column(
+        sa.BigInteger, nullable=False, server_default=sa.text("0")
+    )
+
+    __table_args__ = (
+        # Upsert target for insert deltas; (query_design_id, day) leads so the
+        # same index serves the dashboard's design + date-range reads.
+        sa.Index(
+            "uq_content_daily_rollups_dims",
+            "query_design_id",
+            "day",
+            "collection_run_id",
+            "platform",
+            "arena",
+            "content_type",
+            "language",
+            "term_matched",
+            "is_duplicate",
+            unique=True,
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
+
+
+class ContentDailyTermRollup(Base):
+    """Matched-term occurrence counts per query design, run, day and term.
+
+    One occurrence per element of ``search_terms_matched`` — the same
+    counting as ``unnest(search_terms_matched)`` over the raw records.
+    Dimensions are those of :class:`ContentDailyRollup` minus
+    ``content_type``, plus ``term``.
+    """
+
+    __tablename__ = "content_daily_term_rollups"
+
+    id: Mapped[int] = mapped_column(sa.BigInteger, sa.Identity(), primary_key=True)
+    query_design_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        sa.ForeignKey("query_designs.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    collection_run_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True),
+        nullable=True,
+    )
+    day: Mapped[date | None] = mapped_column(sa.Date, nullable=True)
+    platform: Mapped[str] = mapped_column(sa.String(50), nullable=False)
+    arena: Mapped[str] = mapped_column(sa.String(50), nullable=False)
+    language: Mapped[str | None] = mapped_column(sa.Text, nullable=True)
+    term_matched: Mapped[bool] = mapped_column(sa.Boolean, nullable=False)
+    is_duplicate: Mapped[bool] = mapped_column(sa.Boolean, nullable=False)
+    term: Mapped[str] = mapped_column(sa.Text, nullable=False)
+    record_count: Mapped[int] = mapped_column(
+        sa.BigInteger, nullable=False, server_default=sa.text("0")
+    )
+
+    __table_args__ = (
+        sa.Index(
+            "uq_content_daily_term_rollups_dims",
+            "query_design_id",
+            "day",
+            "collection_run_id",
+            "platform",
+            "arena",
+            "language",
+            "term_matched",
+            "is_duplicate",
+            "term",
+            unique=True,
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
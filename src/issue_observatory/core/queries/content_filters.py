@@ -104,6 +104,41 @@ def _escape_like(s: str) -> str:
     return s.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
 
 
+def _text_contains_any_sql(terms: list[str], param_prefix: str) -> tuple[str, dict[str, str]]:
+    """Raw-SQL substring match of ``text_content`` against any of *terms*.
+
+    Emits one ``text_content ILIKE :p`` branch per term joined with ``OR``
+    instead of ``ILIKE ANY(ARRAY[...])``: GIN indexes cannot evaluate a
+    scalar-array operator, whereas each ``ILIKE '%term%'`` branch can use
+    the ``idx_content_text_trgm`` trigram index (migration 043) and the
+    planner combines the branches with a BitmapOr.
+
+    Matching is unchanged (case-insensitive substring, wildcards escaped).
+    Terms that contain another term case-insensitively are dropped because
+    the shorter term's branch already matches every such row.  Terms shorter
+    than three characters produce no trigrams and fall back to a scan.
+
+    Args:
+        terms: Search terms, matched literally.
+        param_prefix: Bind-parameter name prefix, e.g. ``"_stl"``.
+
+    Returns:
+        ``(raw_sql, bind_params)`` with a ``{alias}`` placeholder, the SQL
+        wrapped in parentheses.
+    """
+    folded: dict[str, str] = {}
+    for term in terms:
+        folded.setdefault(term.lower(), term)
+    kept = [
+        term
+        for key, term in folded.items()
+        if not any(other != key and other in key for other in folded)
+    ]
+    binds = {f"{param_prefix}_{i}": f"%{_escape_like(t)}%" for i, t in enumerate(kept)}
+    branches = " OR ".join(f"{{alias}}text_content ILIKE :{name}" for name in binds)
+    return f"({branches})", binds
+
+
 # ---------------------------------------------------------------------------
 # Shared run_id EXISTS helper — same logic as the one inlined in content.py
 # (to keep _build_predicates independent of the route module).
@@ -732,24 +767,22 @@ def _build_predicates(spec: ContentFilterSpec) -> list[_Predicate]:
     # accelerates both operators.
     #
     # When ``search_terms_text_fallback=True``, the predicate is widened with
-    # an ILIKE ANY branch on text_content so records lacking a populated
+    # an ILIKE branch per term on text_content so records lacking a populated
     # ``search_terms_matched`` array (actor-only, imports, linked) are not
-    # silently excluded when their text actually contains the term.
+    # silently excluded when their text actually contains the term.  Both
+    # sides are index-assisted (idx_content_terms, idx_content_text_trgm),
+    # so the planner can BitmapOr them instead of scanning every partition.
     if spec.search_terms:
         _sp = ", ".join(f":_st_{i}" for i in range(len(spec.search_terms)))
         _st_binds = {f"_st_{i}": t for i, t in enumerate(spec.search_terms)}
         if spec.search_terms_text_fallback:
-            _lp = ", ".join(f":_stl_{i}" for i in range(len(spec.search_terms)))
-            _stl_binds = {
-                f"_stl_{i}": f"%{_escape_like(t)}%"
-                for i, t in enumerate(spec.search_terms)
-            }
+            _text_sql, _stl_binds = _text_contains_any_sql(spec.search_terms, "_stl")
             predicates.append(
                 _Predicate(
                     sa_clause=None,
                     raw_sql=(
                         f"({{alias}}search_terms_matched && ARRAY[{_sp}]::text[]"
-                        f" OR {{alias}}text_content ILIKE ANY(ARRAY[{_lp}]))"
+                        f" OR {_text_sql})"
                     ),
                     bind_params={**_st_binds, **_stl_binds},
                 )
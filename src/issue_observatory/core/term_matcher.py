@@ -0,0 +1,292 @@
+"""Single-pass multi-term matching for search-term tagging.
+
+Tagging a record with the search terms it mentions used to test every term
+separately (``term.lower() in haystack`` in the ingestion helpers, one regex
+per term in the arena collectors), so the cost per record grew linearly with
+the size of the project's term list.  :class:`TermMatcher` compiles a term
+set into an Aho–Corasick automaton and reports every matching term in one
+pass over the text, whatever the number of terms.
+
+Two matching modes reproduce the two existing semantics exactly:
+
+- **substring** (default) — case-insensitive substring containment, as used
+  by ``_match_terms_in_text`` in the worker helpers.
+- **word boundary** — the rules of
+  :func:`~issue_observatory.arenas.query_builder.term_in_text`: a term must
+  start at a word boundary; terms of at most two characters must also end at
+  one; whitespace inside a phrase matches any run of whitespace.  The
+  regex form of that rule, :func:`word_boundary_pattern`, lives here too and
+  is used directly for the rare terms the automaton cannot express (empty
+  terms, tabs or newlines, repeated spaces).  Word boundaries are checked
+  on the lowercased text, so they can differ from the regex for the few
+  characters whose lowercase form is longer (``"İ"``).
+
+The automaton is a plain-Python goto/fail trie whose transitions are
+memoised into a DFA as texts are scanned, so repeated characters cost one
+dict lookup each.  Building it is not free, which is why
+:func:`get_term_matcher` caches matchers per term set: a project's matcher
+is built once per worker process and a changed term list (terms added,
+removed or deactivated) produces a different cache key and therefore a
+fresh automaton.  Small substring term sets skip the automaton altogether —
+below :data:`AUTOMATON_MIN_TERMS` terms the C-level ``in`` scan is faster.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import deque
+from collections.abc import Iterable, Sequence
+from functools import lru_cache
+
+# Below this many distinct substring patterns a per-term ``in`` scan beats
+# the automaton (measured with scripts/benchmark_term_matcher.py).
+AUTOMATON_MIN_TERMS = 100
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _is_word(ch: str) -> bool:
+    """Return ``True`` for characters matched by the ``\\w`` regex class."""
+    return ch.isalnum() or ch == "_"
+
+
+@lru_cache(maxsize=4096)
+def word_boundary_pattern(term: str) -> re.Pattern[str]:
+    """Compile the word-boundary regex for a single lowercased term.
+
+    Spaces in the term match any run of whitespace.  Terms longer than two
+    characters need a word boundary on the left only, so that a term matches
+    the start of a Danish compound ("grønland" in "grønlandspolitik"); shorter
+    terms need one on both sides so that "i" does not match inside "politik".
+    """
+    escaped = re.sub(r"\\ ", r"\\s+", re.escape(term))
+    if len(term) > 2:
+        return re.compile(rf"\b{escaped}", re.IGNORECASE)
+    return re.compile(rf"\b{escaped}\b", re.IGNORECASE)
+
+
+def _needs_regex(pattern: str) -> bool:
+    """Return ``True`` if collapsing whitespace would change the term's rule."""
+    if not pattern or "  " in pattern:
+        return True
+    return any(ch.isspace() and ch != " " for ch in pattern)
+
+
+class _Automaton:
+    """Aho–Corasick automaton over a list of patterns.
+
+    ``_delta[state]`` starts as the trie's goto function and is filled in
+    lazily with the failure-resolved transition for each character seen, so
+    it converges to the full DFA for the alphabet of the scanned texts.
+    ``_out[state]`` lists the indices of every pattern ending at ``state``,
+    including those reached through failure links.  Empty patterns are not
+    entered into the trie; callers handle them.
+    """
+
+    __slots__ = ("_delta", "_fail", "_out")
+
+    def __init__(self, patterns: Sequence[str]) -> None:
+        delta: list[dict[str, int]] = [{}]
+        out: list[list[int]] = [[]]
+        for idx, pattern in enumerate(patterns):
+            if not pattern:
+                continue
+            state = 0
+            for ch in pattern:
+                nxt = delta[state].get(ch)
+                if nxt is None:
+                    nxt = len(delta)
+                    delta[state][ch] = nxt
+                    delta.append({})
+                    out.append([])
+                state = nxt
+            out[state].append(idx)
+
+        fail = [0] * len(delta)
+        queue: deque[int] = deque(delta[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in delta[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in delta[f]:
+                    f = fail[f]
+                target = delta[f].get(ch, 0)
+                fail[nxt] = target if target != nxt else 0
+                out[nxt].extend(out[fail[nxt]])
+
+        self._delta = delta
+        self._fail = fail
+        self._out = out
+
+    def _step(self, state: int, ch: str) -> int:
+        origin = state
+        delta = self._delta
+        while True:
+            nxt = delta[state].get(ch)
+            if nxt is not None:
+                break
+            if state == 0:
+                nxt = 0
+                break
+            state = self._fail[state]
+        # Memoise: later occurrences of (origin, ch) are a single lookup.
+        delta[origin][ch] = nxt
+        return nxt
+
+    def found(self, text: str) -> set[int]:
+        """Return the indices of all patterns occurring in *text*."""
+        delta = self._delta
+        out = self._out
+        found: set[int] = set()
+        state = 0
+        for ch in text:
+            nxt = delta[state].get(ch)
+            if nxt is None:
+                nxt = self._step(state, ch)
+            state = nxt
+            if out[state]:
+                found.update(out[state])
+        return found
+
+    def occurrences(self, text: str) -> Iterable[tuple[int, int]]:
+        """Yield ``(pattern_index, end_position)`` for every occurrence."""
+        delta = self._delta
+        out = self._out
+        state = 0
+        for pos, ch in enumerate(text):
+            nxt = delta[state].get(ch)
+            if nxt is None:
+                nxt = self._step(state, ch)
+            state = nxt
+            for idx in out[state]:
+                yield idx, pos
+
+
+class TermMatcher:
+    """Find which of a fixed set of search terms occur in a text.
+
+    Matching is case-insensitive.  Results are always reported as the
+    original term strings, in the order the terms were given, so the matcher
+    is a drop-in replacement for a ``[t for t in terms if ...]`` scan.
+
+    Args:
+        terms: The search terms.  Duplicates are preserved in the output.
+        word_boundary: Use the word-boundary rules of
+            :func:`~issue_observatory.arenas.query_builder.term_in_text`
+            instead of plain substring containment.
+    """
+
+    __slots__ = (
+        "_automaton",
+        "_empty_patterns",
+        "_pattern_index",
+        "_patterns",
+        "_regexes",
+        "_terms",
+        "word_boundary",
+    )
+
+    def __init__(self, terms: Iterable[str], *, word_boundary: bool = False) -> None:
+        self._terms: tuple[str, ...] = tuple(terms)
+        self.word_boundary = word_boundary
+
+        # Terms differing only in case share one automaton entry.
+        patterns: list[str] = []
+        index: dict[str, int] = {}
+        self._pattern_index: list[int] = []
+        for term in self._terms:
+            pattern = term.lower()
+            if pattern not in index:
+                index[pattern] = len(patterns)
+                patterns.append(pattern)
+            self._pattern_index.append(index[pattern])
+        self._patterns = patterns
+        self._empty_patterns = {i for i, p in enumerate(patterns) if not p}
+        self._regexes: dict[int, re.Pattern[str]] = {}
+
+        if word_boundary:
+            self._regexes = {
+                i: word_boundary_pattern(p) for i, p in enumerate(patterns) if _needs_regex(p)
+            }
+            # Regex-only patterns are left out of the trie.
+            self._automaton: _Automaton | None = _Automaton(
+                ["" if i in self._regexes else p for i, p in enumerate(patterns)]
+            )
+        elif len(patterns) >= AUTOMATON_MIN_TERMS:
+            self._automaton = _Automaton(patterns)
+        else:
+            self._automaton = None
+
+    @property
+    def terms(self) -> tuple[str, ...]:
+        """The terms this matcher was built for, in input order."""
+        return self._terms
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def _found_patterns(self, text: str, original: str) -> set[int]:
+        if self.word_boundary:
+            found = self._found_word_boundary(_WHITESPACE_RE.sub(" ", text))
+            found.update(i for i, rx in self._regexes.items() if rx.search(original))
+            return found
+        if self._automaton is None:
+            return {i for i, p in enumerate(self._patterns) if p in text}
+        found = self._automaton.found(text)
+        if self._empty_patterns:
+            found |= self._empty_patterns
+        return found
+
+    def _found_word_boundary(self, text: str) -> set[int]:
+        patterns = self._patterns
+        n = len(text)
+        found: set[int] = set()
+        automaton = self._automaton
+        if automaton is None:
+            return found
+        for idx, end in automaton.occurrences(text):
+            if idx in found:
+                continue
+            pattern = patterns[idx]
+            start = end - len(pattern) + 1
+            before = text[start - 1] if start > 0 else ""
+            if _is_word(before) == _is_word(pattern[0]):
+                continue
+            if len(pattern) <= 2:
+                after = text[end + 1] if end + 1 < n else ""
+                if _is_word(pattern[-1]) == _is_word(after):
+                    continue
+            found.add(idx)
+        return found
+
+    def match(self, text: str) -> list[str]:
+        """Return the terms occurring in *text*, in input order."""
+        if not self._terms:
+            return []
+        found = self._found_patterns(text.lower(), text)
+        if not found:
+            return []
+        return [t for t, i in zip(self._terms, self._pattern_index) if i in found]
+
+
+@lru_cache(maxsize=256)
+def _cached_matcher(terms: tuple[str, ...], word_boundary: bool) -> TermMatcher:
+    return TermMatcher(terms, word_boundary=word_boundary)
+
+
+def get_term_matcher(terms: Iterable[str], *, word_boundary: bool = False) -> TermMatcher:
+    """Return a cached :class:`TermMatcher` for *terms*.
+
+    The cache is keyed on the exact term tuple, so a project whose search
+    terms change gets a new matcher on its next batch while the superseded
+    one ages out of the LRU.  Matchers are immutable apart from the
+    automaton's memoised transitions, which are idempotent, so sharing one
+    between threads is safe.
+    """
+    return _cached_matcher(tuple(terms), word_boundary)
+
+
+def clear_term_matcher_cache() -> None:
+    """Drop all cached matchers (tests and long-lived maintenance scripts)."""
+    _cached_matcher.cache_clear()
@@ -0,0 +1,341 @@
+"""Collection throughput and latency metrics recorded in Celery workers.
+
+Worker processes do not serve HTTP, so Prometheus objects created there are
+never scraped.  The metrics in this module are instead accumulated in memory
+per process and pushed to Redis, where every worker process adds into the
+same series; the API's ``/metrics`` endpoint reads them back through
+:class:`WorkerMetricsCollector` (registered in ``api/metrics.py``).
+
+Redis layout — one hash per metric::
+
+    metrics:worker:{metric_name}
+
+whose fields are JSON-encoded label values followed by the series suffix
+(``["bluesky", "bluesky", "free", "count"]``) and whose values are
+cumulative totals maintained with ``HINCRBYFLOAT``.
+
+Pending observations are pushed by :func:`flush_worker_metrics` — called
+from the ``task_postrun`` signal handler in ``celery_app.py`` — and, during
+long collections, by :func:`maybe_flush_worker_metrics` at most every
+:data:`FLUSH_INTERVAL_SECONDS`.  Recording never performs I/O, and a failed
+push is logged at WARNING and retried with the next flush.
+
+Metrics defined here:
+
+  collection_flush_seconds{arena, platform, tier}
+      Histogram — time spent persisting one batch of collected records
+      (``ArenaCollector._flush``).
+
+  collection_records_persisted_total{arena, platform, tier, outcome}
+      Counter — records handed to the batch sink, by outcome
+      (inserted, skipped, failed).
+
+  rate_limit_wait_seconds{arena, platform}
+      Histogram — time spent in ``RateLimiter.wait_for_slot``.
+
+  rate_limit_timeouts_total{arena, platform}
+      Counter — ``wait_for_slot`` calls that gave up.
+
+  credential_acquire_seconds{platform, tier, source}
+      Histogram — ``CredentialPool.acquire`` latency by where the credential
+      came from (db, env, none).
+
+  enrichment_batch_seconds{stage}
+      Histogram — time per enrichment page, by stage (enrich, write).
+
+  enrichment_records_total{enricher, outcome}
+      Counter — per-enricher record results (applied, failed).
+
+Usage::
+
+    from issue_observatory.core.worker_metrics import rate_limit_wait_seconds
+
+    rate_limit_wait_seconds.observe(1.2, arena="social_media", platform="bluesky")
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+#: Redis key prefix of the per-metric hashes.
+_KEY_PREFIX = "metrics:worker"
+
+#: Minimum seconds between opportunistic pushes during long tasks.
+FLUSH_INTERVAL_SECONDS: float = 15.0
+
+_LATENCY_BUCKETS: tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+
+_lock = threading.Lock()
+#: Pending increments: metric name -> encoded field -> amount.
+_pending: dict[str, dict[str, float]] = defaultdict(lambda: defaultdict(float))
+_last_flush: float = time.monotonic()
+_clients: dict[tuple[str, int], Any] = {}
+_metrics: dict[str, WorkerCounter | WorkerHistogram] = {}
+
+
+def _field(label_values: list[str], suffix: str | None = None) -> str:
+    parts = list(label_values) if suffix is None else [*label_values, suffix]
+    return json.dumps(parts, separators=(",", ":"))
+
+
+class _WorkerMetric:
+    """Base for metrics whose samples are aggregated in Redis."""
+
+    kind: str = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: list[str]) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        _metrics[name] = self  # type: ignore[assignment]
+
+    def _label_values(self, labels: dict[str, Any]) -> list[str]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"{self.name}: expected labels {self.labelnames}, got {tuple(labels)}"
+            )
+        return [str(labels[name]) for name in self.labelnames]
+
+    def _add(self, increments: list[tuple[str, float]]) -> None:
+        with _lock:
+            series = _pending[self.name]
+            for field, amount in increments:
+                series[field] += amount
+
+
+class WorkerCounter(_WorkerMetric):
+    """Monotonic counter aggregated across worker processes."""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        """Add *amount* to the series identified by *labels*."""
+        if amount:
+            self._add([(_field(self._label_values(labels)), amount)])
+
+
+class WorkerHistogram(_WorkerMetric):
+    """Histogram aggregated across worker processes."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: list[str],
+        buckets: tuple[float, ...] = _LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels: Any) -> None:
+        """Record one observation of *value* in the series identified by *labels*."""
+        label_values = self._label_values(labels)
+        increments = [
+            (_field(label_values, "sum"), value),
+            (_field(label_values, "count"), 1.0),
+        ]
+        increments += [
+            (_field(label_values, f"le={bound}"), 1.0)
+            for bound in self.buckets
+            if value <= bound
+        ]
+        self._add(increments)
+
+
+# ---------------------------------------------------------------------------
+# Metrics
+# ---------------------------------------------------------------------------
+
+collection_flush_seconds = WorkerHistogram(
+    "collection_flush_seconds",
+    "Time spent persisting one batch of collected records.",
+    labelnames=["arena", "platform", "tier"],
+)
+
+collection_records_persisted_total = WorkerCounter(
+    "collection_records_persisted_total",
+    "Collected records handed to the batch sink, by outcome.",
+    labelnames=["arena", "platform", "tier", "outcome"],
+)
+
+rate_limit_wait_seconds = WorkerHistogram(
+    "rate_limit_wait_seconds",
+    "Time spent waiting for a rate-limit slot.",
+    labelnames=["arena", "platform"],
+)
+
+rate_limit_timeouts_total = WorkerCounter(
+    "rate_limit_timeouts_total",
+    "Rate-limit waits that timed out.",
+    labelnames=["arena", "platform"],
+)
+
+credential_acquire_seconds = WorkerHistogram(
+    "credential_acquire_seconds",
+    "Credential acquisition latency by credential source.",
+    labelnames=["platform", "tier", "source"],
+)
+
+enrichment_batch_seconds = WorkerHistogram(
+    "enrichment_batch_seconds",
+    "Time per enrichment page by stage.",
+    labelnames=["stage"],
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0),
+)
+
+enrichment_records_total = WorkerCounter(
+    "enrichment_records_total",
+    "Per-enricher record results by outcome.",
+    labelnames=["enricher", "outcome"],
+)
+
+
+# ---------------------------------------------------------------------------
+# Pushing to Redis
+# ---------------------------------------------------------------------------
+
+
+def _get_client(redis_url: str) -> Any:
+    key = (redis_url, os.getpid())
+    client = _clients.get(key)
+    if client is None:
+        import redis as redis_lib
+
+        client = redis_lib.from_url(
+            redis_url, decode_responses=True, socket_connect_timeout=2, socket_timeout=2
+        )
+        _clients[key] = client
+    return client
+
+
+def _default_redis_url() -> str:
+    from issue_observatory.config.settings import get_settings
+
+    return str(get_settings().redis_url)
+
+
+def flush_worker_metrics(redis_url: str | None = None) -> None:
+    """Push this process's pending observations to Redis.
+
+    Fire-and-forget: on failure the observations are put back and pushed
+    with the next flush.
+
+    Args:
+        redis_url: Redis connection URL.  Defaults to ``Settings.redis_url``.
+    """
+    global _last_flush
+    with _lock:
+        _last_flush = time.monotonic()
+        if not _pending:
+            return
+        batch = {name: dict(series) for name, series in _pending.items()}
+        _pending.clear()
+
+    try:
+        pipe = _get_client(redis_url or _default_redis_url()).pipeline(transaction=False)
+        for name, series in batch.items():
+            for field, amount in series.items():
+                pipe.hincrbyfloat(f"{_KEY_PREFIX}:{name}", field, amount)
+        pipe.execute()
+    except Exception as exc:
+        logger.warning("worker_metrics: push failed, keeping observations: %s", exc)
+        with _lock:
+            for name, series in batch.items():
+                for field, amount in series.items():
+                    _pending[name][field] += amount
+
+
+def maybe_flush_worker_metrics(redis_url: str | None = None) -> None:
+    """Flush if :data:`FLUSH_INTERVAL_SECONDS` have passed since the last flush.
+
+    Meant for synchronous code paths of long-running tasks, so their progress
+    is visible before the task ends.
+    """
+    if time.monotonic() - _last_flush >= FLUSH_INTERVAL_SECONDS:
+        flush_worker_metrics(redis_url)
+
+
+# ---------------------------------------------------------------------------
+# Reading back (API side)
+# ---------------------------------------------------------------------------
+
+
+class WorkerMetricsCollector:
+    """Prometheus collector exposing the worker metrics aggregated in Redis.
+
+    Register it on a ``CollectorRegistry``; each scrape reads one hash per
+    metric.  If Redis is unreachable the scrape simply omits worker metrics.
+
+    Args:
+        redis_url: Redis connection URL.  Defaults to ``Settings.redis_url``
+            at scrape time.
+    """
+
+    def __init__(self, redis_url: str | None = None) -> None:
+        self._redis_url = redis_url
+
+    def describe(self) -> Any:
+        """Yield empty metric families so registration does not read Redis."""
+        from prometheus_client.core import CounterMetricFamily, HistogramMetricFamily
+
+        for metric in _metrics.values():
+            family = (
+                CounterMetricFamily
+                if isinstance(metric, WorkerCounter)
+                else HistogramMetricFamily
+            )
+            yield family(metric.name, metric.documentation, labels=list(metric.labelnames))
+
+    def collect(self) -> Any:
+        from prometheus_client.core import CounterMetricFamily, HistogramMetricFamily
+
+        try:
+            client = _get_client(self._redis_url or _default_redis_url())
+            pipe = client.pipeline(transaction=False)
+            for name in _metrics:
+                pipe.hgetall(f"{_KEY_PREFIX}:{name}")
+            stored = pipe.execute()
+        except Exception as exc:
+            logger.warning("worker_metrics: could not read worker metrics: %s", exc)
+            return
+
+        for metric, values in zip(_metrics.values(), stored, strict=True):
+            labelnames = list(metric.labelnames)
+            if isinstance(metric, WorkerCounter):
+                counter = CounterMetricFamily(
+                    metric.name, metric.documentation, labels=labelnames
+                )
+                for field, value in sorted(values.items()):
+                    counter.add_metric(json.loads(field), float(value))
+                yield counter
+                continue
+
+            histogram = HistogramMetricFamily(
+                metric.name, metric.documentation, labels=labelnames
+            )
+            by_series: dict[tuple[str, ...], dict[str, float]] = defaultdict(dict)
+            for field, value in values.items():
+                *label_values, suffix = json.loads(field)
+                by_series[tuple(label_values)][suffix] = float(value)
+            for label_values, parts in sorted(by_series.items()):
+                count = parts.get("count", 0.0)
+                buckets = [
+                    (str(bound), parts.get(f"le={bound}", 0.0)) for bound in metric.buckets
+                ]
+                buckets.append(("+Inf", count))
+                histogram.add_metric(
+                    list(label_values), buckets=buckets, sum_value=parts.get("sum", 0.0)
+                )
+            yield histogram
@@ -8,6 +8,8 @@ Sub-modules:
 - ``content_extractor``  — trafilatura-based article text extraction
 - ``http_fetcher``       — async httpx-based page fetcher with robots.txt support
 - ``playwright_fetcher`` — headless Chromium fallback for JS-heavy pages
+- ``robots``             — origin-keyed robots.txt cache shared via Redis
+- ``scheduler``          — concurrent fetch scheduling with per-domain politeness
 - ``tasks``              — Celery tasks (``scrape_urls_task``, ``cancel_scraping_job_task``)
 - ``router``             — FastAPI router (``/scraping-jobs/``)
 """
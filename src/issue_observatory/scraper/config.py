@@ -15,6 +15,26 @@ DEFAULT_DELAY_MAX: float = 5.0
 #: Default HTTP request timeout in seconds.
 DEFAULT_TIMEOUT: int = 30
 
+# ---------------------------------------------------------------------------
+# Concurrency
+# ---------------------------------------------------------------------------
+
+#: Maximum number of URLs fetched concurrently across all domains in one job.
+MAX_CONCURRENT_FETCHES: int = 16
+
+#: Maximum number of concurrent requests to a single host.  Together with
+#: the job's ``delay_min``/``delay_max`` this bounds the load per site.
+MAX_CONCURRENT_PER_DOMAIN: int = 1
+
+#: Maximum number of pages open at once in the shared Playwright browser.
+PLAYWRIGHT_MAX_PAGES: int = 2
+
+#: Flush batched job progress (counters and URL errors) after this many URLs.
+PROGRESS_FLUSH_EVERY: int = 25
+
+#: Flush batched job progress at least this often (seconds).
+PROGRESS_FLUSH_INTERVAL: float = 5.0
+
 # ---------------------------------------------------------------------------
 # Content size guards
 # ---------------------------------------------------------------------------
@@ -62,3 +82,15 @@ ROBOTS_USER_AGENT: str = "IssueObservatory"
 
 #: Fallback user-agent token if a site has no entry for ``ROBOTS_USER_AGENT``.
 ROBOTS_USER_AGENT_FALLBACK: str = "*"
+
+#: How long a fetched (or definitively absent / forbidden) robots.txt is cached.
+ROBOTS_TTL_SECONDS: int = 24 * 3600
+
+#: How long an unreachable robots.txt (5xx, network error) is cached.
+ROBOTS_NEGATIVE_TTL_SECONDS: int = 15 * 60
+
+#: Maximum robots.txt size parsed (RFC 9309 requires at least 500 KiB).
+ROBOTS_MAX_BYTES: int = 512 * 1024
+
+#: Upper bound on a site's ``Crawl-delay`` honoured by the schedulers (seconds).
+ROBOTS_MAX_CRAWL_DELAY: float = 60.0
@@ -1,15 +1,16 @@
 """Async HTTP fetcher with robots.txt support and JS-shell detection.
 
-Uses ``httpx`` for all HTTP requests.  Detects JavaScript-only page shells
-(near-empty body) and sets ``needs_playwright=True`` on the result so the
-caller can retry with :mod:`issue_observatory.scraper.playwright_fetcher`.
+Uses ``httpx`` for all HTTP requests, including robots.txt downloads, whose
+rules are cached per origin by :mod:`issue_observatory.scraper.robots`.
+:func:`build_client` creates the shared keep-alive client (HTTP/2 when the
+``h2`` package is installed) that a scraping job reuses for every URL.
+Detects JavaScript-only page shells (near-empty body) and sets
+``needs_playwright=True`` on the result so the caller can retry with :mod:`issue_observatory.scraper.playwright_fetcher`.
 """
 
 from __future__ import annotations
 
 import logging
-import urllib.parse
-import urllib.robotparser
 from dataclasses import dataclass
 
 import httpx
@@ -17,13 +18,21 @@ import httpx
 from issue_observatory.scraper.config import (
     BINARY_CONTENT_TYPES,
     JS_SHELL_BODY_THRESHOLD,
-    ROBOTS_USER_AGENT,
-    ROBOTS_USER_AGENT_FALLBACK,
+    MAX_CONCURRENT_FETCHES,
     USER_AGENT,
 )
+from issue_observatory.scraper.robots import RobotsCache
 
 logger = logging.getLogger(__name__)
 
+# Guard import — HTTP/2 support needs the optional ``h2`` package
+try:
+    import h2  # noqa: F401
+
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
 
 # ---------------------------------------------------------------------------
 # Result dataclass
@@ -50,53 +59,70 @@ class FetchResult:
     needs_playwright: bool = False
 
 
+# ---------------------------------------------------------------------------
+# Client factory
+# ---------------------------------------------------------------------------
+
+
+def build_client(max_connections: int = MAX_CONCURRENT_FETCHES) -> httpx.AsyncClient:
+    """Return the shared :class:`httpx.AsyncClient` for a scraping job.
+
+    The client keeps connections alive between requests so consecutive URLs
+    on the same host reuse one TCP/TLS connection, and negotiates HTTP/2
+    where the server supports it (falling back to HTTP/1.1 when ``h2`` is
+    not installed).
+
+    Args:
+        max_connections: Upper bound on open connections; should be at least
+            the number of concurrent fetches.
+
+    Returns:
+        An unopened client; use it as an async context manager.
+    """
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_connections,
+        keepalive_expiry=30.0,
+    )
+    return httpx.AsyncClient(
+        follow_redirects=True,
+        http2=_HTTP2_AVAILABLE,
+        limits=limits,
+    )
+
+
 # ---------------------------------------------------------------------------
 # robots.txt helpers
 # ---------------------------------------------------------------------------
 
 
-def _is_allowed_by_robots(
+async def _is_allowed_by_robots(
     url: str,
-    robots_cache: dict[str, bool],
-    timeout: int,
+    robots_cache: RobotsCache,
+    client: httpx.AsyncClient,
+    timeout: float,
 ) -> bool:
     """Return ``True`` if the URL is allowed by the site's robots.txt.
 
-    Results are cached in ``robots_cache`` keyed by origin (scheme + host).
-    On any network / parse error the URL is considered allowed (fail-open).
+    Rules are looked up per origin in ``robots_cache`` (in-process, then
+    Redis) and downloaded with ``client`` on a miss.  On any network / parse
+    error the URL is considered allowed (fail-open).
 
     Args:
         url: Target URL.
-        robots_cache: Mutable dict used as a domain-level TTL-less cache.
+        robots_cache: Shared origin-keyed robots.txt cache.
+        client: HTTP client used to download robots.txt on a cache miss.
         timeout: Seconds to wait when fetching robots.txt.
 
     Returns:
         ``True`` if allowed (or if the check fails), ``False`` if disallowed.
     """
-    parsed = urllib.parse.urlparse(url)
-    origin = f"{parsed.scheme}://{parsed.netloc}"
-    robots_url = f"{origin}/robots.txt"
-
-    cache_key = f"{origin}:{url}"
-    if cache_key in robots_cache:
-        return robots_cache[cache_key]
-
-    rp = urllib.robotparser.RobotFileParser()
-    rp.set_url(robots_url)
     try:
-        rp.read()
+        return await robots_cache.is_allowed(url, client=client, timeout=timeout)
     except Exception as exc:
-        logger.debug("scraper: robots.txt fetch failed for %s: %s — allowing", origin, exc)
-        robots_cache[cache_key] = True
+        logger.debug("scraper: robots.txt check failed for %s: %s — allowing", url, exc)
         return True
 
-    allowed_primary = rp.can_fetch(ROBOTS_USER_AGENT, url)
-    allowed_fallback = rp.can_fetch(ROBOTS_USER_AGENT_FALLBACK, url)
-    # If neither agent is explicitly listed, default to allowed.
-    allowed = allowed_primary and allowed_fallback
-    robots_cache[cache_key] = allowed
-    return allowed
-
 
 # ---------------------------------------------------------------------------
 # Binary content-type check
@@ -140,15 +166,15 @@ async def fetch_url(
     client: httpx.AsyncClient,
     timeout: int,
     respect_robots: bool,
-    robots_cache: dict[str, bool],
+    robots_cache: RobotsCache | None = None,
 ) -> FetchResult:
     """Fetch a single URL using httpx with robots.txt checking.
 
     Performs the following checks in order:
 
-    1. **robots.txt** — if ``respect_robots`` is ``True``, fetches and caches
-       the robots.txt for the URL's origin.  Returns an error result if
-       disallowed.
+    1. **robots.txt** — if ``respect_robots`` is ``True``, looks up the
+       rules for the URL's origin in ``robots_cache`` (downloading robots.txt
+       on a miss).  Returns an error result if disallowed.
     2. **HTTP GET** — sends a ``GET`` request with a custom user-agent.
        Follows redirects (up to httpx defaults).
     3. **Binary content-type** — returns a skip result for PDFs, images, etc.
@@ -160,13 +186,17 @@ async def fetch_url(
         client: Shared :class:`httpx.AsyncClient` instance.
         timeout: Request timeout in seconds.
         respect_robots: Whether to honour robots.txt disallow rules.
-        robots_cache: Mutable dict used as a domain-level robots.txt cache.
+        robots_cache: Shared :class:`~issue_observatory.scraper.robots.RobotsCache`.
+            When ``None`` a throwaway in-process cache is used, so robots.txt
+            is downloaded for this call only.
 
     Returns:
         A :class:`FetchResult` instance.
     """
     # 1. robots.txt check
-    if respect_robots and not _is_allowed_by_robots(url, robots_cache, timeout):
+    if respect_robots and not await _is_allowed_by_robots(
+        url, robots_cache if robots_cache is not None else RobotsCache(), client, timeout
+    ):
         logger.info("scraper: robots.txt disallows %s", url)
         return FetchResult(
             html=None,
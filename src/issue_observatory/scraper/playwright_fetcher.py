@@ -5,6 +5,11 @@ This module is an optional dependency — it is only imported when the
 is not installed, any call to :func:`fetch_url_playwright` raises
 ``ImportError`` with installation instructions.
 
+Scraping jobs share one headless browser across all their URLs through
+:class:`BrowserPool`; launching Chromium costs far more than rendering a
+page, so :func:`fetch_url_playwright` only launches a throwaway browser when
+it is called without a pool.
+
 Install Playwright and download the Chromium browser binary::
 
     pip install playwright>=1.48
@@ -13,8 +18,11 @@ Install Playwright and download the Chromium browser binary::
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from typing import Any
 
+from issue_observatory.scraper.config import PLAYWRIGHT_MAX_PAGES
 from issue_observatory.scraper.http_fetcher import FetchResult
 
 logger = logging.getLogger(__name__)
@@ -27,18 +35,132 @@ try:
 except ImportError:
     _PLAYWRIGHT_AVAILABLE = False
 
+_BROWSER_USER_AGENT = (
+    "Mozilla/5.0 (X11; Linux x86_64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/120.0.0.0 Safari/537.36"
+)
+
+_INSTALL_HINT = (
+    "Playwright is not installed. "
+    "Install it with: pip install playwright>=1.48 && playwright install chromium"
+)
+
+
+class BrowserPool:
+    """A lazily launched headless Chromium shared by many fetches.
+
+    The browser is started on the first :meth:`acquire_browser` call and
+    kept until :meth:`close`.  Each fetch still gets its own browser context
+    (cookies and storage are not shared between URLs); a semaphore caps the
+    number of pages rendering at once.  If the browser dies it is relaunched
+    on the next fetch.
+
+    Use as an async context manager::
+
+        async with BrowserPool() as pool:
+            result = await fetch_url_playwright(url, timeout=30, pool=pool)
+
+    Args:
+        max_pages: Maximum number of pages open concurrently.
+    """
+
+    def __init__(self, max_pages: int = PLAYWRIGHT_MAX_PAGES) -> None:
+        self._pages = asyncio.Semaphore(max_pages)
+        self._launch_lock = asyncio.Lock()
+        self._playwright: Any = None
+        self._browser: Any = None
+
+    async def __aenter__(self) -> BrowserPool:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    @property
+    def pages(self) -> asyncio.Semaphore:
+        """Semaphore bounding concurrent pages in the shared browser."""
+        return self._pages
+
+    async def acquire_browser(self) -> Any:
+        """Return the shared browser, launching it if necessary.
+
+        Raises:
+            ImportError: If ``playwright`` is not installed.
+        """
+        if not _PLAYWRIGHT_AVAILABLE:
+            raise ImportError(_INSTALL_HINT)
+        async with self._launch_lock:
+            if self._browser is not None and self._browser.is_connected():
+                return self._browser
+            if self._playwright is None:
+                self._playwright = await _async_playwright().start()
+            logger.info("scraper: launching shared playwright browser")
+            self._browser = await self._playwright.chromium.launch(headless=True)
+            return self._browser
+
+    async def close(self) -> None:
+        """Close the browser and stop Playwright.  Safe to call repeatedly."""
+        browser, self._browser = self._browser, None
+        playwright, self._playwright = self._playwright, None
+        if browser is not None:
+            try:
+                await browser.close()
+            except Exception as exc:
+                logger.debug("scraper: error closing playwright browser: %s", exc)
+        if playwright is not None:
+            try:
+                await playwright.stop()
+            except Exception as exc:
+                logger.debug("scraper: error stopping playwright: %s", exc)
 
-async def fetch_url_playwright(url: str, *, timeout: int) -> FetchResult:
+
+async def _render(browser: Any, url: str, timeout_ms: int) -> FetchResult:
+    """Render ``url`` in a fresh context of ``browser`` and return its HTML."""
+    context = await browser.new_context(user_agent=_BROWSER_USER_AGENT)
+    try:
+        page = await context.new_page()
+        try:
+            response = await page.goto(
+                url,
+                timeout=timeout_ms,
+                wait_until="networkidle",
+            )
+            final_url = page.url
+            status_code = response.status if response else None
+            html = await page.content()
+            return FetchResult(
+                html=html,
+                status_code=status_code,
+                final_url=final_url,
+                error=None,
+                needs_playwright=False,
+            )
+        finally:
+            await page.close()
+    finally:
+        await context.close()
+
+
+async def fetch_url_playwright(
+    url: str,
+    *,
+    timeout: int,
+    pool: BrowserPool | None = None,
+) -> FetchResult:
     """Fetch a URL using a headless Chromium browser via Playwright.
 
-    Launches a Playwright Chromium instance, navigates to ``url``, waits for
-    the network to become idle (``"networkidle"``), and returns the full page
-    source.  The browser is always closed in a ``finally`` block.
+    Navigates to ``url`` in a new browser context, waits for the network to
+    become idle (``"networkidle"``), and returns the full page source.  With
+    a ``pool`` the pool's shared browser is used; without one a browser is
+    launched for this call and closed in a ``finally`` block.
 
     Args:
         url: Target URL.
         timeout: Navigation timeout in seconds (converted to milliseconds
             for Playwright).
+        pool: Shared :class:`BrowserPool` to render in, or ``None`` to
+            launch a dedicated browser.
 
     Returns:
         A :class:`~issue_observatory.scraper.http_fetcher.FetchResult`.
@@ -49,44 +171,20 @@ async def fetch_url_playwright(url: str, *, timeout: int) -> FetchResult:
         ImportError: If ``playwright`` is not installed.
     """
     if not _PLAYWRIGHT_AVAILABLE:
-        raise ImportError(
-            "Playwright is not installed. "
-            "Install it with: pip install playwright>=1.48 && playwright install chromium"
-        )
+        raise ImportError(_INSTALL_HINT)
 
     timeout_ms = timeout * 1000
 
     try:
+        if pool is not None:
+            async with pool.pages:
+                browser = await pool.acquire_browser()
+                return await _render(browser, url, timeout_ms)
+
         async with _async_playwright() as p:
             browser = await p.chromium.launch(headless=True)
             try:
-                context = await browser.new_context(
-                    user_agent=(
-                        "Mozilla/5.0 (X11; Linux x86_64) "
-                        "AppleWebKit/537.36 (KHTML, like Gecko) "
-                        "Chrome/120.0.0.0 Safari/537.36"
-                    )
-                )
-                page = await context.new_page()
-                try:
-                    response = await page.goto(
-                        url,
-                        timeout=timeout_ms,
-                        wait_until="networkidle",
-                    )
-                    final_url = page.url
-                    status_code = response.status if response else None
-                    html = await page.content()
-                    return FetchResult(
-                        html=html,
-                        status_code=status_code,
-                        final_url=final_url,
-                        error=None,
-                        needs_playwright=False,
-                    )
-                finally:
-                    await page.close()
-                    await context.close()
+                return await _render(browser, url, timeout_ms)
             finally:
                 await browser.close()
 
@@ -0,0 +1,341 @@
+"""Shared robots.txt cache for the scraper and the web arenas.
+
+robots.txt is a per-origin resource, yet it used to be cached per URL in a
+dict that lived for one job or one request, so every distinct URL on a host
+re-downloaded and re-parsed the same file.  :class:`RobotsCache` keys rules
+by origin (scheme + host + port) and keeps them at two levels:
+
+- an in-process dict of parsed rules, valid for the lifetime of the cache
+  instance (normally one scraping job or one collection call), and
+- Redis, shared by every Celery worker and API process::
+
+      scraper:robots:{origin}
+
+  holding the raw robots.txt body and the fetch outcome as JSON.
+
+Fetch outcomes follow the conventions of :mod:`urllib.robotparser` and
+RFC 9309, except that server errors fail open like the previous code did:
+
+- ``ok`` — 2xx, body parsed.
+- ``missing`` — other 4xx, everything allowed.
+- ``forbidden`` — 401 / 403, everything disallowed.
+- ``unreachable`` — 5xx or network error, everything allowed.
+
+``ok``, ``missing`` and ``forbidden`` are stored for ``ttl_seconds``;
+``unreachable`` is negatively cached for the shorter
+``negative_ttl_seconds`` so a flaky host is neither hammered once per URL
+nor treated as robots-free for a whole day.
+
+Besides allow/deny the rules expose the ``Crawl-delay`` (or
+``Request-rate``) that applies to us, so schedulers can space requests to a
+host accordingly.  Redis failures never fail a fetch: the cache falls back
+to in-process rules.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+import urllib.parse
+import urllib.robotparser
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+from issue_observatory.scraper.config import (
+    ROBOTS_MAX_BYTES,
+    ROBOTS_MAX_CRAWL_DELAY,
+    ROBOTS_NEGATIVE_TTL_SECONDS,
+    ROBOTS_TTL_SECONDS,
+    ROBOTS_USER_AGENT,
+    ROBOTS_USER_AGENT_FALLBACK,
+    USER_AGENT,
+)
+
+logger = logging.getLogger(__name__)
+
+_KEY_PREFIX = "scraper:robots"
+
+ROBOTS_STATUSES: tuple[str, ...] = ("ok", "missing", "forbidden", "unreachable")
+"""Possible :attr:`RobotsRules.status` values (see module docstring)."""
+
+
+def robots_origin(url: str) -> str:
+    """Return the origin (``scheme://host[:port]``) whose robots.txt governs *url*."""
+    parsed = urllib.parse.urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}".lower()
+
+
+@dataclass
+class RobotsRules:
+    """robots.txt rules of one origin.
+
+    Attributes:
+        status: Fetch outcome, one of :data:`ROBOTS_STATUSES`.
+        body: robots.txt body (only meaningful for ``status="ok"``).
+    """
+
+    status: str
+    body: str = ""
+    _parser: urllib.robotparser.RobotFileParser | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def _parsed(self) -> urllib.robotparser.RobotFileParser:
+        if self._parser is None:
+            parser = urllib.robotparser.RobotFileParser()
+            parser.parse(self.body.splitlines())
+            self._parser = parser
+        return self._parser
+
+    def can_fetch(self, url: str) -> bool:
+        """Return ``True`` if we may fetch *url* under these rules.
+
+        Both our own user-agent token and the ``*`` group must allow the URL.
+        """
+        if self.status == "forbidden":
+            return False
+        if self.status != "ok":
+            return True
+        parser = self._parsed()
+        return parser.can_fetch(ROBOTS_USER_AGENT, url) and parser.can_fetch(
+            ROBOTS_USER_AGENT_FALLBACK, url
+        )
+
+    def crawl_delay(self) -> float | None:
+        """Return the minimum delay between requests the site asks of us.
+
+        Uses ``Crawl-delay`` or, failing that, ``Request-rate`` (seconds per
+        request) for our user-agent token, falling back to ``*``.  Capped at
+        ``ROBOTS_MAX_CRAWL_DELAY``; ``None`` when the site sets neither.
+        """
+        if self.status != "ok":
+            return None
+        parser = self._parsed()
+        delay: float | None = None
+        for agent in (ROBOTS_USER_AGENT, ROBOTS_USER_AGENT_FALLBACK):
+            crawl_delay = parser.crawl_delay(agent)
+            if crawl_delay is not None:
+                delay = float(crawl_delay)
+                break
+            rate = parser.request_rate(agent)
+            if rate is not None and rate.requests:
+                delay = rate.seconds / rate.requests
+                break
+        if delay is None or delay <= 0:
+            return None
+        return min(delay, ROBOTS_MAX_CRAWL_DELAY)
+
+    def to_json(self) -> str:
+        return json.dumps({"status": self.status, "body": self.body})
+
+    @classmethod
+    def from_json(cls, value: str) -> RobotsRules:
+        data = json.loads(value)
+        return cls(status=data["status"], body=data.get("body") or "")
+
+
+class RobotsCache:
+    """Origin-keyed robots.txt rules, persisted in Redis across workers.
+
+    Use as an async context manager so the Redis connection is closed on the
+    event loop that opened it::
+
+        async with RobotsCache(settings.redis_url) as robots:
+            allowed = await robots.is_allowed(url, client=client, timeout=30)
+
+    Args:
+        redis_url: Redis connection URL (``settings.redis_url``), or ``None``
+            to cache in-process only.
+        ttl_seconds: Expiry of definitive outcomes (``ok``, ``missing``,
+            ``forbidden``).
+        negative_ttl_seconds: Expiry of ``unreachable`` outcomes.
+    """
+
+    def __init__(
+        self,
+        redis_url: str | None = None,
+        *,
+        ttl_seconds: int = ROBOTS_TTL_SECONDS,
+        negative_ttl_seconds: int = ROBOTS_NEGATIVE_TTL_SECONDS,
+    ) -> None:
+        self._redis_url = redis_url
+        self._ttl = ttl_seconds
+        self._negative_ttl = negative_ttl_seconds
+        self._redis: Any | None = None
+        self._redis_disabled = redis_url is None
+        # origin -> (monotonic expiry, rules)
+        self._local: dict[str, tuple[float, RobotsRules]] = {}
+        # origin -> in-flight lookup, so concurrent URLs of one host share it
+        self._pending: dict[str, asyncio.Future[RobotsRules]] = {}
+
+    @classmethod
+    def from_settings(cls) -> RobotsCache:
+        """Return a cache backed by the application's Redis."""
+        from issue_observatory.config.settings import get_settings
+
+        return cls(get_settings().redis_url)
+
+    async def __aenter__(self) -> RobotsCache:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the Redis connection; the cache stays usable (it reconnects)."""
+        if self._redis is not None:
+            try:
+                await self._redis.aclose()
+            except Exception:
+                logger.debug("scraper: robots cache close failed", exc_info=True)
+            self._redis = None
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    async def is_allowed(self, url: str, *, client: httpx.AsyncClient, timeout: float) -> bool:
+        """Return ``True`` if robots.txt allows fetching *url*.
+
+        Args:
+            url: Target URL.
+            client: HTTP client used if robots.txt must be downloaded.
+            timeout: Seconds to wait for robots.txt.
+        """
+        rules = await self.rules_for(url, client=client, timeout=timeout)
+        return rules.can_fetch(url)
+
+    def crawl_delay(self, url: str) -> float | None:
+        """Return the crawl delay for *url*'s origin from already loaded rules.
+
+        Synchronous so schedulers can consult it cheaply after a fetch; it
+        never triggers a download and returns ``None`` for origins whose
+        rules have not been loaded by :meth:`rules_for` / :meth:`is_allowed`.
+        """
+        entry = self._local.get(robots_origin(url))
+        return entry[1].crawl_delay() if entry is not None else None
+
+    async def rules_for(
+        self, url: str, *, client: httpx.AsyncClient, timeout: float
+    ) -> RobotsRules:
+        """Return the robots.txt rules governing *url*.
+
+        Looks in the in-process cache, then Redis, then downloads
+        robots.txt.  Concurrent lookups for the same origin share one
+        download.
+        """
+        origin = robots_origin(url)
+        entry = self._local.get(origin)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+        pending = self._pending.get(origin)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future: asyncio.Future[RobotsRules] = asyncio.get_running_loop().create_future()
+        self._pending[origin] = future
+        try:
+            rules = await self._load(origin, client, timeout)
+            future.set_result(rules)
+            return rules
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            # Mark retrieved so an unawaited future does not log a warning.
+            future.exception()
+            raise
+        finally:
+            del self._pending[origin]
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _ttl_for(self, rules: RobotsRules) -> int:
+        return self._negative_ttl if rules.status == "unreachable" else self._ttl
+
+    async def _load(self, origin: str, client: httpx.AsyncClient, timeout: float) -> RobotsRules:
+        rules = await self._redis_get(origin)
+        ttl: float
+        if rules is None:
+            rules = await _download(origin, client, timeout)
+            ttl = self._ttl_for(rules)
+            await self._redis_set(origin, rules, int(ttl))
+        else:
+            ttl = self._ttl_for(rules)
+        self._local[origin] = (time.monotonic() + ttl, rules)
+        return rules
+
+    async def _get_redis(self) -> Any:
+        if self._redis is None:
+            import redis.asyncio as aioredis
+
+            self._redis = aioredis.from_url(self._redis_url, decode_responses=True)
+        return self._redis
+
+    def _disable_redis(self, exc: Exception) -> None:
+        # One warning per cache instance; later lookups stay in-process.
+        logger.warning("scraper: robots cache Redis unavailable, caching locally: %s", exc)
+        self._redis_disabled = True
+
+    async def _redis_get(self, origin: str) -> RobotsRules | None:
+        if self._redis_disabled:
+            return None
+        try:
+            redis = await self._get_redis()
+            value = await redis.get(f"{_KEY_PREFIX}:{origin}")
+        except Exception as exc:
+            self._disable_redis(exc)
+            return None
+        if not value:
+            return None
+        try:
+            return RobotsRules.from_json(value)
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    async def _redis_set(self, origin: str, rules: RobotsRules, ttl: int) -> None:
+        if self._redis_disabled:
+            return
+        try:
+            redis = await self._get_redis()
+            await redis.set(f"{_KEY_PREFIX}:{origin}", rules.to_json(), ex=ttl)
+        except Exception as exc:
+            self._disable_redis(exc)
+
+
+async def _download(origin: str, client: httpx.AsyncClient, timeout: float) -> RobotsRules:
+    """Fetch ``{origin}/robots.txt`` and classify the outcome."""
+    robots_url = f"{origin}/robots.txt"
+    try:
+        response = await client.get(
+            robots_url,
+            timeout=timeout,
+            follow_redirects=True,
+            headers={"User-Agent": USER_AGENT},
+        )
+    except httpx.HTTPError as exc:
+        logger.debug("scraper: robots.txt fetch failed for %s: %s — allowing", origin, exc)
+        return RobotsRules(status="unreachable")
+
+    code = response.status_code
+    if code in (401, 403):
+        return RobotsRules(status="forbidden")
+    if 400 <= code < 500:
+        return RobotsRules(status="missing")
+    if code >= 300:
+        logger.debug("scraper: robots.txt HTTP %d for %s — allowing", code, origin)
+        return RobotsRules(status="unreachable")
+    try:
+        body = response.text[:ROBOTS_MAX_BYTES]
+    except Exception as exc:
+        logger.debug("scraper: robots.txt decode failed for %s: %s — allowing", origin, exc)
+        return RobotsRules(status="unreachable")
+    return RobotsRules(status="ok", body=body)
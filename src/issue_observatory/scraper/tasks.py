@@ -30,15 +30,26 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
-import random
+import time
 from datetime import UTC, datetime
 from typing import Any
 
 import httpx
 
+from issue_observatory.scraper.config import (
+    PROGRESS_FLUSH_EVERY,
+    PROGRESS_FLUSH_INTERVAL,
+)
 from issue_observatory.scraper.content_extractor import extract_from_html
-from issue_observatory.scraper.http_fetcher import fetch_url
+from issue_observatory.scraper.http_fetcher import build_client, fetch_url
+from issue_observatory.scraper.playwright_fetcher import (
+    BrowserPool,
+    fetch_url_playwright,
+)
+from issue_observatory.scraper.robots import RobotsCache
+from issue_observatory.scraper.scheduler import DomainScheduler
 from issue_observatory.workers.celery_app import celery_app
+from issue_observatory.workers.runtime import run_async
 
 logger = logging.getLogger(__name__)
 
@@ -100,52 +111,102 @@ def _update_job(job_id: str, **kwargs: Any) -> None:
         logger.warning("scraper: failed to update scraping_jobs(%s): %s", job_id, exc)
 
 
-def _increment_counter(job_id: str, column: str) -> None:
-    """Atomically increment a progress counter column."""
+#: Progress counter columns of ``scraping_jobs`` updated by :func:`_flush_progress`.
+_PROGRESS_COLUMNS = frozenset({"urls_enriched", "urls_failed", "urls_skipped"})
+
+
+def _flush_progress(
+    job_id: str,
+    counts: dict[str, int],
+    url_errors: dict[str, str],
+) -> None:
+    """Apply a batch of progress counter increments and URL errors in one write.
+
+    Args:
+        job_id: UUID string of the ScrapingJob.
+        counts: Increment per counter column (``urls_enriched``,
+            ``urls_failed``, ``urls_skipped``).
+        url_errors: URL → error reason entries merged into ``url_errors``.
+    """
+    if not counts and not url_errors:
+        return
     from sqlalchemy import text
 
     from issue_observatory.core.database import get_sync_session
 
+    counts = {col: n for col, n in counts.items() if col in _PROGRESS_COLUMNS}
+    set_clauses = [f"{col} = {col} + :{col}" for col in counts]
+    params: dict[str, Any] = {"job_id": job_id, **counts}
+    if url_errors:
+        set_clauses.append(
+            "url_errors = COALESCE(url_errors, '{}') || CAST(:url_errors AS jsonb)"
+        )
+        params["url_errors"] = json.dumps(url_errors)
+    if not set_clauses:
+        return
     try:
         with get_sync_session() as session:
             session.execute(
                 text(
-                    f"UPDATE scraping_jobs SET {column} = {column} + 1 WHERE id = :job_id"
+                    f"UPDATE scraping_jobs SET {', '.join(set_clauses)} WHERE id = :job_id"
                 ),
-                {"job_id": job_id},
+                params,
             )
             session.commit()
     except Exception as exc:
         logger.warning(
-            "scraper: failed to increment %s for job %s: %s", column, job_id, exc
+            "scraper: failed to flush progress for job %s: %s", job_id, exc
         )
 
 
-def _record_url_error(job_id: str, url: str, reason: str) -> None:
-    """Append a URL error reason to the job's url_errors JSONB dict."""
-    from sqlalchemy import text
+class _JobProgress:
+    """Accumulates per-URL outcomes and writes them to the job in batches.
 
-    from issue_observatory.core.database import get_sync_session
+    Writing every counter increment separately costs one sync DB round-trip
+    per URL.  Outcomes are buffered instead and flushed through
+    :func:`_flush_progress` every ``flush_every`` URLs or ``flush_interval``
+    seconds, whichever comes first, and once more by :meth:`flush` at the
+    end of the job.  The writes run in a worker thread so that in-flight
+    fetches on the event loop are not stalled.
+    """
 
-    # Truncate reason to avoid bloating the JSONB
-    reason = (reason or "unknown")[:200]
-    try:
-        with get_sync_session() as session:
-            session.execute(
-                text("""
-                    UPDATE scraping_jobs
-                    SET url_errors = jsonb_set(
-                        COALESCE(url_errors, '{}'),
-                        ARRAY[:url_key],
-                        to_jsonb(:reason::text)
-                    )
-                    WHERE id = :job_id
-                """),
-                {"job_id": job_id, "url_key": url, "reason": reason},
-            )
-            session.commit()
-    except Exception as exc:
-        logger.debug("scraper: failed to record url_error for %s: %s", url, exc)
+    def __init__(
+        self,
+        job_id: str,
+        *,
+        flush_every: int = PROGRESS_FLUSH_EVERY,
+        flush_interval: float = PROGRESS_FLUSH_INTERVAL,
+    ) -> None:
+        self._job_id = job_id
+        self._flush_every = flush_every
+        self._flush_interval = flush_interval
+        self._counts: dict[str, int] = {}
+        self._url_errors: dict[str, str] = {}
+        self._pending = 0
+        self._last_flush = time.monotonic()
+
+    async def add(
+        self, column: str, url: str | None = None, reason: str | None = None
+    ) -> None:
+        """Record one URL outcome, plus its error reason when given."""
+        self._counts[column] = self._counts.get(column, 0) + 1
+        if url is not None and reason is not None:
+            # Truncate reason to avoid bloating the JSONB
+            self._url_errors[url] = (reason or "unknown")[:200]
+        self._pending += 1
+        if (
+            self._pending >= self._flush_every
+            or time.monotonic() - self._last_flush >= self._flush_interval
+        ):
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Write all buffered outcomes to the job row."""
+        counts, self._counts = self._counts, {}
+        url_errors, self._url_errors = self._url_errors, {}
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        await asyncio.to_thread(_flush_progress, self._job_id, counts, url_errors)
 
 
 def _set_scrape_status_failed(record_id: str, published_at: Any) -> None:
@@ -309,6 +370,56 @@ def _insert_manual_record(
         session.commit()
 
 
+def _extract_and_store(
+    *,
+    job_id: str,
+    record_id: str | None,
+    published_at: Any,
+    url: str,
+    final_url: str | None,
+    html: str | None,
+) -> None:
+    """Extract article text from ``html`` and persist it.
+
+    Updates the existing record in collection_run mode (``record_id`` set)
+    and inserts a new record in manual_urls mode.  Synchronous; the async
+    engine runs it in a worker thread.
+    """
+    extracted = extract_from_html(html or "", final_url or url)
+    if record_id is not None:
+        # collection_run mode: UPDATE existing record
+        _update_content_record_v2(
+            record_id=record_id,
+            published_at=published_at,
+            text_value=extracted.text,
+            title=extracted.title,
+            language=extracted.language,
+            html=html,
+        )
+    else:
+        # manual_urls mode: INSERT new record
+        _insert_manual_record(
+            url=url,
+            text_value=extracted.text,
+            title=extracted.title,
+            language=extracted.language,
+            html=html,
+            job_id=job_id,
+        )
+
+
+def _invalidate_enriched_runs(run_ids: set[str]) -> None:
+    """Invalidate cached analysis results of runs whose records were scraped.
+
+    Scraping rewrites ``text_content`` and ``language``, which feed the
+    run's term, language and emergent-term views.
+    """
+    from issue_observatory.workers._task_helpers import invalidate_analysis_cache
+
+    for run_id in run_ids:
+        invalidate_analysis_cache(run_id)
+
+
 # ---------------------------------------------------------------------------
 # Async scraping engine
 # ---------------------------------------------------------------------------
@@ -317,9 +428,15 @@ def _insert_manual_record(
 async def _run_scraping(job_id: str, celery_task_id: str) -> None:
     """Async implementation of the scraping job.
 
-    Loads the job config, builds the URL work-list, and iterates over each
-    URL: fetches HTML (with optional Playwright fallback), extracts text, and
-    persists the result.
+    Loads the job config, builds the URL work-list, and processes each URL:
+    fetches HTML (with optional Playwright fallback), extracts text, and
+    persists the result.  URLs are fetched concurrently through a
+    :class:`~issue_observatory.scraper.scheduler.DomainScheduler`, which
+    applies the job's ``delay_min``/``delay_max`` (or the site's robots.txt
+    crawl delay, if longer) between requests to the same host only.  All
+    fetches share one keep-alive HTTP client, one lazily launched Playwright
+    browser and the Redis-backed robots.txt cache; progress counters are
+    written in batches.
 
     Args:
         job_id: UUID string of the ScrapingJob.
@@ -364,22 +481,27 @@ async def _run_scraping(job_id: str, celery_task_id: str) -> None:
 
     _update_job(job_id, total_urls=len(work_list))
 
-    # ---- Fetch loop --------------------------------------------------------
-    robots_cache: dict[str, bool] = {}
+    # ---- Fetch ---------------------------------------------------------------
+    timeout = int(job["timeout_seconds"])
+    progress = _JobProgress(job_id)
+    enriched_runs: set[str] = set()
+    robots_cache = RobotsCache.from_settings()
+    scheduler = DomainScheduler(
+        delay_min=job["delay_min"],
+        delay_max=job["delay_max"],
+        crawl_delay=robots_cache.crawl_delay,
+    )
 
-    async with httpx.AsyncClient(follow_redirects=True) as client:
-        for record_id, published_at, url in work_list:
-            # Polite delay
-            await asyncio.sleep(
-                random.uniform(job["delay_min"], job["delay_max"])
-            )
+    async with build_client() as client, BrowserPool() as browser_pool, robots_cache:
 
+        async def _process(item: tuple[str | None, Any, str]) -> None:
+            record_id, published_at, url = item
             try:
                 # httpx fetch
                 result = await fetch_url(
                     url,
                     client=client,
-                    timeout=int(job["timeout_seconds"]),
+                    timeout=timeout,
                     respect_robots=bool(job["respect_robots_txt"]),
                     robots_cache=robots_cache,
                 )
@@ -389,12 +511,8 @@ async def _run_scraping(job_id: str, celery_task_id: str) -> None:
                     logger.info(
                         "scraper: job %s — playwright fallback for %s", job_id, url
                     )
-                    from issue_observatory.scraper.playwright_fetcher import (
-                        fetch_url_playwright,
-                    )
-
                     result = await fetch_url_playwright(
-                        url, timeout=int(job["timeout_seconds"])
+                        url, timeout=timeout, pool=browser_pool
                     )
 
                 if result.error and not result.html:
@@ -402,47 +520,41 @@ async def _run_scraping(job_id: str, celery_task_id: str) -> None:
                     logger.debug(
                         "scraper: job %s — skipping %s: %s", job_id, url, result.error
                     )
-                    _increment_counter(job_id, "urls_skipped")
-                    _record_url_error(job_id, url, result.error)
-                    continue
-
-                # Extract content
-                extracted = extract_from_html(result.html or "", result.final_url or url)
-
-                # Persist
+                    await progress.add("urls_skipped", url, result.error)
+                    return
+
+                # Extract and persist off the event loop so other fetches proceed
+                await asyncio.to_thread(
+                    _extract_and_store,
+                    job_id=job_id,
+                    record_id=record_id,
+                    published_at=published_at,
+                    url=url,
+                    final_url=result.final_url,
+                    html=result.html,
+                )
                 if record_id is not None:
-                    # collection_run mode: UPDATE existing record
-                    _update_content_record_v2(
-                        record_id=record_id,
-                        published_at=published_at,
-                        text_value=extracted.text,
-                        title=extracted.title,
-                        language=extracted.language,
-                        html=result.html,
-                    )
-                else:
-                    # manual_urls mode: INSERT new record
-                    _insert_manual_record(
-                        url=url,
-                        text_value=extracted.text,
-                        title=extracted.title,
-                        language=extracted.language,
-                        html=result.html,
-                        job_id=job_id,
-                    )
+                    enriched_runs.add(run_id)
 
-                _increment_counter(job_id, "urls_enriched")
+                await progress.add("urls_enriched")
                 logger.debug("scraper: job %s — enriched %s", job_id, url)
 
             except Exception as exc:
                 logger.warning(
                     "scraper: job %s — error processing %s: %s", job_id, url, exc
                 )
-                _increment_counter(job_id, "urls_failed")
-                _record_url_error(job_id, url, f"error: {exc}")
+                await progress.add("urls_failed", url, f"error: {exc}")
                 # Mark scrape_status as 'failed' for collection_run records
                 if record_id is not None:
-                    _set_scrape_status_failed(record_id, published_at)
+                    await asyncio.to_thread(
+                        _set_scrape_status_failed, record_id, published_at
+                    )
+
+        try:
+            await scheduler.run(work_list, _process, url_of=lambda item: item[2])
+        finally:
+            await progress.flush()
+            _invalidate_enriched_runs(enriched_runs)
 
     # ---- Mark completed ---------------------------------------------------
     _update_job(
@@ -469,7 +581,7 @@ async def _run_scraping(job_id: str, celery_task_id: str) -> None:
 def scrape_urls_task(self: Any, job_id: str) -> dict[str, Any]:
     """Fetch and store page text for all URLs in a ScrapingJob.
 
-    Runs the async scraping engine via ``asyncio.run()``.  No auto-retry
+    Runs the async scraping engine via ``run_async()``.  No auto-retry
     (scraping is stateful); the task handles per-URL errors internally.
 
     Args:
@@ -480,7 +592,7 @@ def scrape_urls_task(self: Any, job_id: str) -> dict[str, Any]:
     """
     logger.info("scraper: scrape_urls_task started for job=%s", job_id)
     try:
-        asyncio.run(_run_scraping(job_id, self.request.id))
+        run_async(_run_scraping(job_id, self.request.id))
     except Exception as exc:
         logger.error("scraper: scrape_urls_task failed for job=%s: %s", job_id, exc)
         _update_job(
@@ -604,6 +716,8 @@ async def _run_extracted_url_scraping(job_id: str, celery_task_id: str) -> None:
         len(web_urls),
     )
 
+    progress = _JobProgress(job_id)
+
     # --- Process video URLs ---
     if video_urls:
         settings = get_settings()
@@ -618,32 +732,38 @@ async def _run_extracted_url_scraping(job_id: str, celery_task_id: str) -> None:
             try:
                 result = downloader.download(url)
                 if result.success:
-                    _increment_counter(job_id, "urls_enriched")
+                    await progress.add("urls_enriched")
                 else:
-                    _increment_counter(job_id, "urls_failed")
-                    _record_url_error(job_id, url, f"video download: {result.error}")
+                    await progress.add("urls_failed", url, f"video download: {result.error}")
                     logger.warning(
                         "scraper: video download failed for %s: %s", url, result.error
                     )
             except Exception as exc:
                 logger.warning("scraper: video download error for %s: %s", url, exc)
-                _increment_counter(job_id, "urls_failed")
-                _record_url_error(job_id, url, f"video error: {exc}")
+                await progress.add("urls_failed", url, f"video error: {exc}")
 
     # --- Process web URLs ---
-    robots_cache: dict[str, bool] = {}
     max_retries = 2
+    timeout = int(job["timeout_seconds"])
+    enriched_runs: set[str] = set()
+    robots_cache = RobotsCache.from_settings()
+    scheduler = DomainScheduler(
+        delay_min=job["delay_min"],
+        delay_max=job["delay_max"],
+        crawl_delay=robots_cache.crawl_delay,
+    )
 
-    async with httpx.AsyncClient(follow_redirects=True) as client:
-        for url in web_urls:
-            await asyncio.sleep(random.uniform(job["delay_min"], job["delay_max"]))
+    async with build_client() as client, BrowserPool() as browser_pool, robots_cache:
 
+        async def _process(url: str) -> None:
             try:
                 # Resolve URL shorteners (bit.ly, t.co, etc.) via HEAD first
                 resolved_url = await _resolve_shortener(client, url)
 
                 # Check if this URL exists as a google_search record
-                google_record = _find_google_search_record(resolved_url)
+                google_record = await asyncio.to_thread(
+                    _find_google_search_record, resolved_url
+                )
 
                 # Fetch HTML with retries on transient errors
                 fetch_result = None
@@ -651,7 +771,7 @@ async def _run_extracted_url_scraping(job_id: str, celery_task_id: str) -> None:
                     fetch_result = await fetch_url(
                         resolved_url,
                         client=client,
-                        timeout=int(job["timeout_seconds"]),
+                        timeout=timeout,
                         respect_robots=bool(job["respect_robots_txt"]),
                         robots_cache=robots_cache,
                     )
@@ -674,49 +794,44 @@ async def _run_extracted_url_scraping(job_id: str, celery_task_id: str) -> None:
                     break
 
                 if fetch_result.needs_playwright and job["use_playwright_fallback"]:
-                    from issue_observatory.scraper.playwright_fetcher import (
-                        fetch_url_playwright,
-                    )
-
                     fetch_result = await fetch_url_playwright(
-                        resolved_url, timeout=int(job["timeout_seconds"])
+                        resolved_url, timeout=timeout, pool=browser_pool
                     )
 
                 if fetch_result.error and not fetch_result.html:
-                    _increment_counter(job_id, "urls_skipped")
-                    _record_url_error(job_id, url, fetch_result.error)
-                    continue
-
-                extracted = extract_from_html(
-                    fetch_result.html or "", fetch_result.final_url or url
-                )
+                    await progress.add("urls_skipped", url, fetch_result.error)
+                    return
 
                 if google_record:
                     # Special case: UPDATE existing google_search record with scraped body
-                    _update_content_record_v2(
+                    await asyncio.to_thread(
+                        _extract_and_store,
+                        job_id=job_id,
                         record_id=google_record["id"],
                         published_at=google_record["published_at"],
-                        text_value=extracted.text,
-                        title=extracted.title,
-                        language=extracted.language,
+                        url=url,
+                        final_url=fetch_result.final_url,
                         html=fetch_result.html,
                     )
                     logger.debug(
                         "scraper: updated google_search record %s with scraped content",
                         google_record["id"],
                     )
+                    if google_record["collection_run_id"] is not None:
+                        enriched_runs.add(google_record["collection_run_id"])
                 else:
                     # Standard path: INSERT a new content_record
-                    _insert_manual_record(
+                    await asyncio.to_thread(
+                        _extract_and_store,
+                        job_id=job_id,
+                        record_id=None,
+                        published_at=None,
                         url=url,
-                        text_value=extracted.text,
-                        title=extracted.title,
-                        language=extracted.language,
+                        final_url=fetch_result.final_url,
                         html=fetch_result.html,
-                        job_id=job_id,
                     )
 
-                _increment_counter(job_id, "urls_enriched")
+                await progress.add("urls_enriched")
 
             except Exception as exc:
                 logger.warning(
@@ -725,8 +840,13 @@ async def _run_extracted_url_scraping(job_id: str, celery_task_id: str) -> None:
                     url,
                     exc,
                 )
-                _increment_counter(job_id, "urls_failed")
-                _record_url_error(job_id, url, f"error: {exc}")
+                await progress.add("urls_failed", url, f"error: {exc}")
+
+        try:
+            await scheduler.run(web_urls, _process, url_of=lambda url: url)
+        finally:
+            await progress.flush()
+            _invalidate_enriched_runs(enriched_runs)
 
     # Mark all source URLs as scraped in extracted_urls
     _mark_urls_scraped(work_list)
@@ -791,6 +911,8 @@ def _mark_urls_scraped(urls: list[str]) -> None:
     if not urls:
         return
 
+    from sqlalchemy import text
+
     from issue_observatory.core.database import get_sync_session
 
     with get_sync_session() as db:
@@ -809,13 +931,15 @@ def _find_google_search_record(url: str) -> dict[str, Any] | None:
 
     Returns a minimal dict with ``id`` (text) and ``published_at`` so the
     caller can pass both to :func:`_update_content_record_v2` for partition-
-    pruned UPDATE queries.
+    pruned UPDATE queries, plus the record's ``collection_run_id`` so the
+    run's analysis cache can be invalidated afterwards.
 
     Args:
         url: The URL to look up.
 
     Returns:
-        ``{"id": str, "published_at": datetime | None}`` if a matching
+        ``{"id": str, "published_at": datetime | None,
+        "collection_run_id": str | None}`` if a matching
         ``google_search`` record is found, otherwise ``None``.
     """
     from sqlalchemy import text
@@ -827,7 +951,7 @@ def _find_google_search_record(url: str) -> dict[str, Any] | None:
             row = session.execute(
                 text(
                     """
-                    SELECT id::text, published_at
+                    SELECT id::text, published_at, collection_run_id::text
                     FROM content_records
                     WHERE url = :url AND platform = 'google_search'
                     LIMIT 1
@@ -837,7 +961,11 @@ def _find_google_search_record(url: str) -> dict[str, Any] | None:
             ).fetchone()
 
             if row:
-                return {"id": row[0], "published_at": row[1]}
+                return {
+                    "id": row[0],
+                    "published_at": row[1],
+                    "collection_run_id": row[2],
+                }
     except Exception as exc:
         logger.warning(
             "scraper: failed to check google_search record for %s: %s", url, exc
@@ -866,7 +994,7 @@ def scrape_extracted_urls_task(self: Any, job_id: str) -> dict[str, Any]:
        optional Playwright fallback, trafilatura text extraction, new
        ``content_record`` inserted.
 
-    Runs the async engine via ``asyncio.run()``.  No auto-retry because
+    Runs the async engine via ``run_async()``.  No auto-retry because
     scraping is stateful; per-URL errors are handled internally.
 
     Args:
@@ -877,7 +1005,7 @@ def scrape_extracted_urls_task(self: Any, job_id: str) -> dict[str, Any]:
     """
     logger.info("scraper: scrape_extracted_urls_task started for job=%s", job_id)
     try:
-        asyncio.run(_run_extracted_url_scraping(job_id, self.request.id))
+        run_async(_run_extracted_url_scraping(job_id, self.request.id))
     except Exception as exc:
         logger.error(
             "scraper: scrape_extracted_urls_task failed for job=%s: %s", job_id, exc
@@ -8,7 +8,7 @@ isolation from the Celery application.
 
 All functions open their own ``AsyncSessionLocal`` context manager and close
 the session before returning, because Celery workers call these via
-``asyncio.run()`` from synchronous task bodies.
+``run_async()`` from synchronous task bodies.
 """
 
 from __future__ import annotations
@@ -145,7 +145,7 @@ async def get_query_design_alerts(
     Thin wrapper around :func:`fetch_recent_volume_spikes` that opens its own
     database session so it can be called from the API layer via dependency
     injection without needing a pre-existing session (or can be called from
-    Celery via ``asyncio.run()``).
+    Celery via ``run_async()``).
 
     Args:
         query_design_id: UUID of the query design to look up.
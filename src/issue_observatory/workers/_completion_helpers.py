@@ -0,0 +1,134 @@
+"""Event-driven completion detection for batch collection runs.
+
+A batch run is finished once every ``collection_tasks`` row has reached a
+terminal state.  Instead of polling for that every few seconds, each arena
+task that ends (successfully or not — retries do not count) requests a
+completion check through the ``task_postrun`` signal handler in
+``celery_app.py``.  The check reads ``collection_tasks`` once: the task that
+finishes last sees every row terminal and finalizes the run, publishes the
+``run_complete`` SSE event and dispatches enrichment immediately.
+
+Requests are debounced per run with a Redis key::
+
+    collection:{run_id}:completion_check
+
+set with ``NX`` when a check is enqueued and deleted by the check before it
+reads the database.  A terminal transition committed while a check is queued
+is therefore always seen by that check, and a burst of arena tasks ending
+together enqueues a single check.
+
+Workers that die without ending their task never fire the signal, so
+``dispatch_batch_collection`` still schedules a slow safety sweep every
+:data:`COMPLETION_SWEEP_SECONDS`.  Finalization is claimed in the database
+(:func:`~issue_observatory.workers._task_helpers.finalize_run_status`), so a
+sweep and an event-driven check can never both publish ``run_complete``.
+
+Redis failures fail open: the check is enqueued without debouncing.
+"""
+
+from __future__ import annotations
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+#: Interval of the safety sweep that catches runs whose workers crashed.
+COMPLETION_SWEEP_SECONDS: int = 300
+
+#: Celery task name of the completion check.
+CHECK_BATCH_COMPLETION_TASK = "issue_observatory.workers.tasks.check_batch_completion"
+
+#: Expiry of the debounce key, in case a queued check is lost.
+_PENDING_CHECK_TTL_SECONDS = 600
+
+#: Celery states after which an arena task will not run again.
+_FINAL_TASK_STATES = frozenset({"SUCCESS", "FAILURE"})
+
+
+def _pending_key(run_id: str) -> str:
+    return f"collection:{run_id}:completion_check"
+
+
+def run_id_for_task_end(
+    task_name: str | None,
+    kwargs: dict | None,
+    state: str | None,
+) -> str | None:
+    """Return the collection run ID if a finished task should trigger a check.
+
+    Only arena tasks (``issue_observatory.arenas.*``) that carry a
+    ``collection_run_id`` kwarg and ended in a final Celery state qualify.
+
+    Args:
+        task_name: Celery task name.
+        kwargs: Keyword arguments the task was called with.
+        state: Celery state the task ended in.
+
+    Returns:
+        The ``collection_run_id``, or ``None``.
+    """
+    if not task_name or not task_name.startswith("issue_observatory.arenas."):
+        return None
+    if state not in _FINAL_TASK_STATES:
+        return None
+    run_id = (kwargs or {}).get("collection_run_id")
+    return str(run_id) if run_id else None
+
+
+def request_completion_check(run_id: str, redis_url: str) -> bool:
+    """Enqueue an immediate completion check for *run_id* unless one is queued.
+
+    Args:
+        run_id: UUID string of the collection run.
+        redis_url: Redis connection URL for the debounce key.
+
+    Returns:
+        ``True`` if a check was enqueued.
+    """
+    try:
+        import redis as redis_lib
+
+        r = redis_lib.from_url(redis_url, decode_responses=True)
+        try:
+            if not r.set(_pending_key(run_id), "1", nx=True, ex=_PENDING_CHECK_TTL_SECONDS):
+                return False
+        finally:
+            r.close()
+    except Exception as exc:
+        logger.warning(
+            "completion: debounce unavailable for run=%s, enqueueing check: %s",
+            run_id,
+            exc,
+        )
+
+    from issue_observatory.workers.celery_app import celery_app
+
+    try:
+        celery_app.send_task(
+            CHECK_BATCH_COMPLETION_TASK,
+            kwargs={"run_id": run_id, "sweep": False},
+            queue="celery",
+        )
+    except Exception:
+        # Do not leave the debounce key blocking later requests.
+        clear_completion_check(run_id, redis_url)
+        raise
+    logger.debug("completion: check requested for run=%s", run_id)
+    return True
+
+
+def clear_completion_check(run_id: str, redis_url: str) -> None:
+    """Allow the next terminal transition of *run_id* to enqueue a new check.
+
+    Called by an event-driven check before it reads ``collection_tasks``.
+    """
+    try:
+        import redis as redis_lib
+
+        r = redis_lib.from_url(redis_url, decode_responses=True)
+        try:
+            r.delete(_pending_key(run_id))
+        finally:
+            r.close()
+    except Exception as exc:
+        logger.warning("completion: failed to clear debounce for run=%s: %s", run_id, exc)
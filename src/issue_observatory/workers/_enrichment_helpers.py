@@ -12,10 +12,14 @@ asyncpg connections on a second ``asyncio.run()`` call.
 
 Public helpers
 --------------
-- :func:`fetch_content_records_for_run` — paginated fetch for a specific run.
+- :func:`fetch_content_records_for_run` — keyset-paginated fetch for a
+  specific run.
 - :func:`fetch_unenriched_content_records` — paginated fetch of records whose
   ``raw_metadata.enrichments.{enricher_name}`` key is absent.
 - :func:`write_enrichment` — merge a single enrichment result into JSONB.
+- :func:`write_enrichments_batch` — merge the results of several enrichers
+  for a whole batch of records with one ``UPDATE ... FROM (VALUES ...)``,
+  optionally refreshing the run's content rollups in the same transaction.
 - :func:`fetch_unenriched_for_url_extraction` — specialized paginated fetch
   for URL extraction that returns extra columns and includes YouTube/TikTok
   records regardless of text length.
@@ -27,8 +31,12 @@ Public helpers
 - :func:`fetch_fitted_engagement_scalers` — load fitted per-platform
   Yeo-Johnson + MinMaxScaler parameters from the ``engagement_scalers``
   table.
-- :func:`update_engagement_score_column` — batch-update the
-  ``engagement_score`` column on ``content_records``.
+- :func:`fetch_engagement_composites` — newest positive engagement
+  composites of one platform, for fitting its scaler.
+- :func:`iter_engagement_composites` — keyset-paginated ``(ids, composites)``
+  column chunks of one platform, for rescoring.
+- :func:`update_engagement_score_column` — bulk-update the
+  ``engagement_score`` column on ``content_records`` from two arrays.
 """
 
 from __future__ import annotations
@@ -40,7 +48,9 @@ from sqlalchemy import text
 
 if TYPE_CHECKING:
     import uuid
+    from collections.abc import Iterator
 
+from issue_observatory.core.content_rollups import refresh_run_slices_sync
 from issue_observatory.core.database import get_sync_session
 
 # Batch size for fetching content records per DB round-trip.
@@ -49,34 +59,42 @@ _BATCH_SIZE = 500
 
 def fetch_content_records_for_run(
     run_id: str,
-    offset: int,
+    after_id: uuid.UUID | str | None = None,
     limit: int = _BATCH_SIZE,
 ) -> list[dict[str, Any]]:
     """Fetch a batch of content records for a collection run.
 
+    Uses keyset pagination on ``id``: pass the ``id`` of the last record of
+    the previous batch as *after_id* to get the next one.  Unlike
+    ``LIMIT/OFFSET``, each page is an index range scan starting at the
+    cursor, so the cost of a page does not grow with its position in the run.
+
     Args:
         run_id: UUID string of the CollectionRun.
-        offset: Row offset for pagination.
-        limit: Maximum number of rows to return (default: 100).
+        after_id: Return only records whose ``id`` sorts after this value.
+            ``None`` starts from the beginning.
+        limit: Maximum number of rows to return (default: 500).
 
     Returns:
         List of dicts with at minimum the keys ``id``, ``text_content``,
-        ``language``, and ``raw_metadata``.
+        ``language``, and ``raw_metadata``, ordered by ``id``.
     """
+    cursor_clause = "AND id > CAST(:after_id AS uuid)" if after_id is not None else ""
     with get_sync_session() as db:
         stmt = text(
-            """
+            f"""
             SELECT id, text_content, language, raw_metadata
             FROM content_records
             WHERE collection_run_id = CAST(:run_id AS uuid)
+              {cursor_clause}
             ORDER BY id
-            LIMIT :limit OFFSET :offset
+            LIMIT :limit
             """
         )
-        result = db.execute(
-            stmt,
-            {"run_id": run_id, "limit": limit, "offset": offset},
-        )
+        params: dict[str, Any] = {"run_id": run_id, "limit": limit}
+        if after_id is not None:
+            params["after_id"] = str(after_id)
+        result = db.execute(stmt, params)
         rows = result.mappings().all()
         return [dict(row) for row in rows]
 
@@ -153,46 +171,74 @@ def write_enrichment_batch(
     enricher_name: str,
     items: list[tuple[uuid.UUID | str, dict[str, Any]]],
 ) -> None:
-    """Merge multiple enrichment results in a single transaction.
+    """Merge multiple results of one enricher in a single statement.
 
-    Each item is a ``(record_id, enrichment_data)`` tuple. All updates are
-    executed within one DB session and committed together, which is
-    dramatically faster than one-commit-per-record.
+    Each item is a ``(record_id, enrichment_data)`` tuple.  Thin wrapper
+    around :func:`write_enrichments_batch`.
 
     Args:
         enricher_name: Key under ``raw_metadata.enrichments`` to write.
         items: List of ``(record_id, enrichment_data)`` tuples.
     """
-    if not items:
+    write_enrichments_batch(
+        [(record_id, {enricher_name: data}) for record_id, data in items]
+    )
+
+
+def write_enrichments_batch(
+    items: list[tuple[uuid.UUID | str, dict[str, dict[str, Any]]]],
+    refresh_run_rollups: str | None = None,
+) -> None:
+    """Merge results of several enrichers for many records in one UPDATE.
+
+    Each item is a ``(record_id, {enricher_name: enrichment_data, ...})``
+    tuple.  All items are written with a single
+    ``UPDATE ... FROM (VALUES ...)`` statement that shallow-merges each
+    record's patch into ``raw_metadata.enrichments`` (creating both
+    ``raw_metadata`` and ``enrichments`` when absent).  Enricher keys not
+    present in a patch are left untouched; keys present are replaced, which
+    matches the per-enricher ``jsonb_set`` semantics this replaces.
+
+    Args:
+        items: List of ``(record_id, enrichments_patch)`` tuples.  Record ids
+            should be unique within the list; with duplicates only one patch
+            is applied per record.
+        refresh_run_rollups: Collection run UUID string whose content rollup
+            slices are recomputed in the same transaction, after the
+            UPDATE.  Detected languages feed the rollups' language
+            dimension.  May be passed with an empty *items* list.
+    """
+    if not items and refresh_run_rollups is None:
         return
 
-    stmt = text(
-        f"""
-        UPDATE content_records
-        SET raw_metadata = jsonb_set(
-                jsonb_set(
-                    COALESCE(raw_metadata, '{{}}'::jsonb),
-                    '{{enrichments}}',
-                    COALESCE(raw_metadata->'enrichments', '{{}}'::jsonb),
-                    true
-                ),
-                '{{enrichments,{enricher_name}}}',
-                CAST(:data AS jsonb),
-                true
-            )
-        WHERE id = CAST(:record_id AS uuid)
-        """
-    )
+    values: list[str] = []
+    params: dict[str, Any] = {}
+    for i, (record_id, patch) in enumerate(items):
+        values.append(f"(CAST(:id_{i} AS uuid), CAST(:patch_{i} AS jsonb))")
+        params[f"id_{i}"] = str(record_id)
+        params[f"patch_{i}"] = json.dumps(patch, default=str)
 
     with get_sync_session() as db:
-        for record_id, enrichment_data in items:
+        if items:
             db.execute(
-                stmt,
-                {
-                    "data": json.dumps(enrichment_data),
-                    "record_id": str(record_id),
-                },
+                text(
+                    f"""
+                    UPDATE content_records AS cr
+                    SET raw_metadata = jsonb_set(
+                            COALESCE(cr.raw_metadata, '{{}}'::jsonb),
+                            '{{enrichments}}',
+                            COALESCE(cr.raw_metadata->'enrichments', '{{}}'::jsonb)
+                                || v.patch,
+                            true
+                        )
+                    FROM (VALUES {", ".join(values)}) AS v(id, patch)
+                    WHERE cr.id = v.id
+                    """
+                ),
+                params,
             )
+        if refresh_run_rollups is not None:
+            refresh_run_slices_sync(db, refresh_run_rollups)
         db.commit()
 
 
@@ -338,6 +384,17 @@ _ENGAGEMENT_PLATFORM_LIST: tuple[str, ...] = (
 )
 
 
+#: Rows per chunk when streaming engagement columns for rescoring.
+_ENGAGEMENT_CHUNK_SIZE: int = 50_000
+
+#: Sum of the positive engagement counts; mirrors ``_compute_raw_composite``
+#: in ``engagement_scorer.py``.  ``GREATEST`` ignores NULLs in PostgreSQL.
+_ENGAGEMENT_COMPOSITE_SQL: str = (
+    "(GREATEST(views_count, 0) + GREATEST(likes_count, 0)"
+    " + GREATEST(shares_count, 0) + GREATEST(comments_count, 0))"
+)
+
+
 def fetch_unenriched_for_engagement(
     offset: int,
     limit: int = _BATCH_SIZE,
@@ -426,11 +483,88 @@ def fetch_fitted_engagement_scalers() -> dict[str, dict[str, Any]]:
     return result
 
 
+def fetch_engagement_composites(platform: str, limit: int) -> list[float]:
+    """Return the newest *limit* positive engagement composites for *platform*.
+
+    The composite (sum of the positive engagement counts) is computed in
+    PostgreSQL, so only one float per row crosses the wire.
+
+    Args:
+        platform: Platform name.
+        limit: Maximum number of values (most recently collected first).
+
+    Returns:
+        List of composite values, each greater than zero.
+    """
+    with get_sync_session() as db:
+        stmt = text(
+            f"""
+            SELECT {_ENGAGEMENT_COMPOSITE_SQL} AS composite
+            FROM content_records
+            WHERE platform = :platform
+              AND {_ENGAGEMENT_COMPOSITE_SQL} > 0
+            ORDER BY collected_at DESC
+            LIMIT :limit
+            """
+        )
+        return [
+            float(v)
+            for v in db.execute(stmt, {"platform": platform, "limit": limit}).scalars()
+        ]
+
+
+def iter_engagement_composites(
+    platform: str,
+    chunk_size: int = _ENGAGEMENT_CHUNK_SIZE,
+) -> Iterator[tuple[list[str], list[float]]]:
+    """Yield ``(record_ids, composites)`` column chunks for *platform*.
+
+    Keyset-paginated on ``id`` so every chunk costs one index range scan
+    regardless of how deep into the table it is.  Only records with a
+    positive composite are returned.
+
+    Args:
+        platform: Platform name.
+        chunk_size: Rows per chunk.
+
+    Yields:
+        Parallel lists of record UUID strings and composite values.
+    """
+    after_id: str | None = None
+    while True:
+        cursor_clause = "AND id > CAST(:after_id AS uuid)" if after_id is not None else ""
+        stmt = text(
+            f"""
+            SELECT id::text AS id, {_ENGAGEMENT_COMPOSITE_SQL} AS composite
+            FROM content_records
+            WHERE platform = :platform
+              {cursor_clause}
+              AND {_ENGAGEMENT_COMPOSITE_SQL} > 0
+            ORDER BY id
+            LIMIT :limit
+            """
+        )
+        params: dict[str, Any] = {"platform": platform, "limit": chunk_size}
+        if after_id is not None:
+            params["after_id"] = after_id
+        with get_sync_session() as db:
+            rows = db.execute(stmt, params).all()
+        if not rows:
+            return
+        yield [row[0] for row in rows], [float(row[1]) for row in rows]
+        if len(rows) < chunk_size:
+            return
+        after_id = rows[-1][0]
+
+
 def update_engagement_score_column(
     items: list[tuple[str, float]],
 ) -> None:
     """Batch-update the ``engagement_score`` column on content_records.
 
+    All rows are written by one ``UPDATE ... FROM unnest(...)`` statement
+    with the ids and scores bound as two arrays.
+
     Args:
         items: List of ``(record_id, score)`` tuples.
     """
@@ -439,13 +573,22 @@ def update_engagement_score_column(
 
     stmt = text(
         """
-        UPDATE content_records
-        SET engagement_score = :score
-        WHERE id = CAST(:record_id AS uuid)
+        UPDATE content_records AS c
+        SET engagement_score = v.score
+        FROM unnest(
+            CAST(:record_ids AS uuid[]),
+            CAST(:scores AS double precision[])
+        ) AS v(id, score)
+        WHERE c.id = v.id
         """
     )
 
     with get_sync_session() as db:
-        for record_id, score in items:
-            db.execute(stmt, {"record_id": record_id, "score": score})
+        db.execute(
+            stmt,
+            {
+                "record_ids": [str(record_id) for record_id, _ in items],
+                "scores": [float(score) for _, score in items],
+            },
+        )
         db.commit()
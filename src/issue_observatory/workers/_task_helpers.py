@@ -6,9 +6,9 @@ tasks in ``workers/tasks.py``.  They are separated to keep each file under
 the Celery application.
 
 All functions open their own ``AsyncSessionLocal`` context managers and
-commit or close the session before returning.  This is intentional: Celery
-workers call these via ``asyncio.run()`` from synchronous task bodies, so
-each invocation requires a fresh event loop with no pre-existing session.
+commit or close the session before returning.  Celery workers call these via
+``run_async()`` from synchronous task bodies; sessions are never shared
+between calls, while the pooled connections behind them are.
 """
 
 from __future__ import annotations
@@ -34,6 +34,7 @@ from issue_observatory.core.models.project import Project
 from issue_observatory.core.models.query_design import ActorList, QueryDesign
 from issue_observatory.core.models.users import User
 from issue_observatory.core.retention_service import RetentionService
+from issue_observatory.core.term_matcher import get_term_matcher
 
 _retention_service = RetentionService()
 
@@ -157,9 +158,7 @@ async def fetch_designs_with_prep() -> list[dict[str, Any]]:
 
     Combines ``fetch_live_tracking_designs`` with per-design credit balance,
     user email, public figure IDs, search terms, and actor IDs — all in a
-    single event loop invocation.  This avoids the "Future attached to a
-    different loop" error that occurs when multiple ``asyncio.run()`` calls
-    share a SQLAlchemy async connection pool.
+    single ``run_async()`` call.
 
     Returns:
         List of design dicts, each augmented with ``credit_balance``,
@@ -839,6 +838,43 @@ async def set_run_status(
         await db.commit()
 
 
+async def finalize_run_status(
+    run_id: Any,
+    status: str,
+    *,
+    error_log: str | None = None,
+) -> bool:
+    """Set a CollectionRun's final status unless it was already finalized.
+
+    Completion can be detected concurrently by an event-driven check and the
+    safety sweep; the conditional update lets exactly one of them finalize
+    the run and publish the ``run_complete`` event.
+
+    Args:
+        run_id: UUID of the CollectionRun.
+        status: Final status (``"completed"`` or ``"failed"``).
+        error_log: Optional error log message.
+
+    Returns:
+        ``True`` if this call finalized the run.
+    """
+    values: dict[str, Any] = {"status": status, "completed_at": datetime.now(tz=UTC)}
+    if error_log is not None:
+        values["error_log"] = error_log
+
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            update(CollectionRun)
+            .where(
+                CollectionRun.id == run_id,
+                CollectionRun.status.notin_(["completed", "failed"]),
+            )
+            .values(**values)
+        )
+        await db.commit()
+    return bool(result.rowcount)
+
+
 async def create_collection_tasks(
     run_id: Any,
     arena_platforms: list[dict[str, str]],
@@ -1126,17 +1162,17 @@ def _match_terms_in_text(
 ) -> list[str]:
     """Return which search terms appear in the record's text or title.
 
-    Simple case-insensitive substring matching.  Used as a fallback when
-    a collector does not populate ``search_terms_matched`` itself.
+    Case-insensitive substring matching, in the order of *terms*.  Used as a
+    fallback when a collector does not populate ``search_terms_matched``
+    itself.  Matching goes through a :class:`TermMatcher` cached per term
+    list, so all terms are tagged in one pass over the record.
     """
     if not terms:
         return []
-    haystack = (
-        (title or "").lower() + " " + (text_content or "").lower()
-    )
+    haystack = (title or "") + " " + (text_content or "")
     if not haystack.strip():
         return []
-    return [t for t in terms if t.lower() in haystack]
+    return get_term_matcher(terms).match(haystack)
 
 
 class RunCancelledError(Exception):
@@ -1186,7 +1222,8 @@ def make_rate_limiter() -> Any:
     Returns a :class:`~issue_observatory.workers.rate_limiter.RateLimiter`
     backed by the application's Redis instance.  The async Redis client
     opens connections lazily on first use, so this is safe to call from
-    synchronous Celery task bodies before ``asyncio.run()``.
+    synchronous Celery task bodies before ``run_async()``.  In a worker
+    process the runtime's shared client is used instead of a new one.
 
     Returns:
         A :class:`RateLimiter` instance, or ``None`` if Redis is unavailable.
@@ -1196,13 +1233,16 @@ def make_rate_limiter() -> Any:
 
         from issue_observatory.config.settings import get_settings
         from issue_observatory.workers.rate_limiter import RateLimiter
+        from issue_observatory.workers.runtime import shared_redis
 
         settings = get_settings()
-        redis_client = aioredis.from_url(
-            str(settings.redis_url),
-            encoding="utf-8",
-            decode_responses=True,
-        )
+        redis_client = shared_redis(str(settings.redis_url))
+        if redis_client is None:
+            redis_client = aioredis.from_url(
+                str(settings.redis_url),
+                encoding="utf-8",
+                decode_responses=True,
+            )
         return RateLimiter(redis_client=redis_client)
     except Exception:
         import logging
@@ -1213,6 +1253,180 @@ def make_rate_limiter() -> Any:
         return None
 
 
+# Columns that need explicit CAST() for psycopg2 type inference.
+_JSONB_COLS = frozenset({"raw_metadata"})
+_TEXT_ARRAY_COLS = frozenset({"search_terms_matched", "media_urls"})
+_UUID_COLS = frozenset({"collection_run_id", "query_design_id", "author_id"})
+_TIMESTAMP_COLS = frozenset({"published_at", "collected_at"})
+
+# Rows per multi-VALUES INSERT in persist_collected_records.  Bounds the
+# statement size while keeping one round-trip per collector batch (the
+# default ArenaCollector batch size is 100).
+_PERSIST_CHUNK_SIZE = 500
+
+
+def _bind_content_value(col: str, val: Any, name: str, params: dict[str, Any]) -> str:
+    """Bind *val* for column *col* as parameter *name* and return its placeholder.
+
+    Adds explicit ``CAST()`` for types the driver may not infer correctly
+    from plain strings.
+    """
+    import json
+
+    if col in _JSONB_COLS:
+        params[name] = json.dumps(val) if not isinstance(val, str) else val
+        return f"CAST(:{name} AS jsonb)"
+    if col in _TEXT_ARRAY_COLS:
+        # text[] columns — convert Python list to PostgreSQL array literal.
+        if isinstance(val, list):
+            params[name] = "{" + ",".join(
+                '"' + str(v).replace("\\", "\\\\").replace('"', '\\"') + '"'
+                for v in val
+            ) + "}"
+        else:
+            params[name] = str(val)
+        return f"CAST(:{name} AS text[])"
+    if col in _UUID_COLS:
+        params[name] = str(val)
+        return f"CAST(:{name} AS uuid)"
+    if col in _TIMESTAMP_COLS:
+        # Strip trailing 'Z' if offset already present.
+        sval = str(val)
+        if sval.endswith("+00:00Z"):
+            sval = sval[:-1]
+        params[name] = sval
+        return f"CAST(:{name} AS timestamptz)"
+    # Clamp simhash to signed bigint range.
+    if col == "simhash" and isinstance(val, int) and val > 9223372036854775807:
+        params[name] = val - 18446744073709551616  # 2^64
+    else:
+        params[name] = val
+    return f":{name}"
+
+
+def _insert_content_records(db: Any, records: list[dict[str, Any]]) -> int:
+    """Insert *records* into ``content_records`` with one multi-row statement.
+
+    Builds a single ``INSERT ... VALUES (...), (...) ON CONFLICT DO NOTHING``
+    over the union of non-NULL columns.  Columns a record does not set are
+    written as ``DEFAULT`` so server-side defaults still apply, exactly as
+    when the column is omitted from a single-row insert.  Rows conflicting
+    with existing records — or with an earlier row in the same statement —
+    are skipped by the ``ON CONFLICT`` clause.
+
+    Args:
+        db: Synchronous SQLAlchemy session.
+        records: Normalized record dicts, each with at least one non-NULL value.
+
+    Records belonging to a query design are folded into the per-day
+    rollups in the same transaction (see ``core/content_rollups.py``).
+
+    Returns:
+        Number of rows actually inserted.
+    """
+    from sqlalchemy import text
+
+    from issue_observatory.core import content_rollups
+
+    columns: list[str] = []
+    seen: set[str] = set()
+    for record in records:
+        for col, val in record.items():
+            if val is not None and col not in seen:
+                seen.add(col)
+                columns.append(col)
+
+    params: dict[str, Any] = {}
+    value_rows: list[str] = []
+    for i, record in enumerate(records):
+        placeholders = []
+        for col in columns:
+            val = record.get(col)
+            if val is None:
+                placeholders.append("DEFAULT")
+            else:
+                placeholders.append(_bind_content_value(col, val, f"{col}_{i}", params))
+        value_rows.append("(" + ", ".join(placeholders) + ")")
+
+    track_rollups = "query_design_id" in seen and content_rollups.rollups_enabled()
+    stmt = text(
+        f"INSERT INTO content_records ({', '.join(columns)}) "
+        f"VALUES {', '.join(value_rows)} "
+        f"ON CONFLICT (content_hash, published_at) "
+        f"WHERE content_hash IS NOT NULL DO NOTHING"
+        + (content_rollups.INSERT_RETURNING if track_rollups else "")
+    )
+    result = db.execute(stmt, params)
+    if track_rollups:
+        content_rollups.apply_insert_deltas_sync(db, result.fetchall())
+    return max(result.rowcount, 0)
+
+
+def invalidate_analysis_cache(
+    collection_run_id: str | None = None,
+    query_design_id: str | None = None,
+    all_data: bool = False,
+) -> None:
+    """Bump analysis-cache data versions after ``content_records`` changed.
+
+    Call after committing a write so cached analysis results that include
+    the changed records are recomputed on the next request:
+
+    - With *collection_run_id*: the run and its query design are bumped.
+      The design is looked up from ``collection_runs`` when not given.
+    - With only *query_design_id*: the design and every run belonging to it
+      are bumped (for design-wide rewrites such as term backfills).
+    - With *all_data*: the global version is bumped (retention deletes and
+      cross-run enrichment backfills).
+
+    Never raises.
+
+    Args:
+        collection_run_id: UUID string of the collection run whose data changed.
+        query_design_id: UUID string of the query design whose data changed.
+        all_data: Invalidate every cached analysis result.
+    """
+    from sqlalchemy import text
+
+    from issue_observatory.config.settings import get_settings
+    from issue_observatory.core.analysis_cache import bump_data_versions
+    from issue_observatory.core.database import get_sync_session
+
+    run_ids: list[str] = [collection_run_id] if collection_run_id else []
+    try:
+        if collection_run_id and query_design_id is None:
+            with get_sync_session() as db:
+                design = db.execute(
+                    text(
+                        "SELECT query_design_id FROM collection_runs "
+                        "WHERE id = CAST(:run_id AS uuid)"
+                    ),
+                    {"run_id": collection_run_id},
+                ).scalar()
+            query_design_id = str(design) if design is not None else None
+        elif query_design_id and not collection_run_id:
+            with get_sync_session() as db:
+                rows = db.execute(
+                    text(
+                        "SELECT id FROM collection_runs "
+                        "WHERE query_design_id = CAST(:qd_id AS uuid)"
+                    ),
+                    {"qd_id": query_design_id},
+                ).scalars()
+                run_ids = [str(r) for r in rows]
+    except Exception:
+        # Lookup failures only narrow the invalidation; the caller's own
+        # scope is still bumped below.
+        pass
+
+    bump_data_versions(
+        get_settings().redis_url,
+        run_ids=run_ids,
+        design_ids=[query_design_id] if query_design_id else [],
+        global_scope=all_data,
+    )
+
+
 def persist_collected_records(
     records: list[dict[str, Any]],
     collection_run_id: str,
@@ -1224,7 +1438,10 @@ def persist_collected_records(
 
     Uses a synchronous session (safe for Celery worker context) with
     ``INSERT ... ON CONFLICT DO NOTHING`` to skip duplicate records
-    (matched on ``content_hash`` + ``published_at``).
+    (matched on ``content_hash`` + ``published_at``).  Records are written
+    with one multi-row statement per chunk of up to ``_PERSIST_CHUNK_SIZE``
+    rows inside a SAVEPOINT; only when that statement fails is the chunk
+    retried row by row so a single bad record cannot drop the batch.
 
     Args:
         records: List of normalized record dicts from a collector's
@@ -1244,8 +1461,6 @@ def persist_collected_records(
     Returns:
         Tuple of ``(inserted_count, skipped_count)``.
     """
-    import json
-
     import structlog
     from sqlalchemy import text
 
@@ -1288,16 +1503,11 @@ def persist_collected_records(
         else:
             record.setdefault("term_matched", len(existing_terms) > 0)
 
-    # Columns that need explicit CAST() for psycopg2 type inference.
-    _JSONB_COLS = {"raw_metadata"}
-    _TEXT_ARRAY_COLS = {"search_terms_matched", "media_urls"}
-    _UUID_COLS = {"collection_run_id", "query_design_id", "author_id"}
-    _TIMESTAMP_COLS = {"published_at", "collected_at"}
-
     inserted = 0
     skipped = 0
 
     with get_sync_session() as db:
+        pending: list[dict[str, Any]] = []
         for record in records:
             # Inject run/design IDs if the normalizer didn't set them.
             if not record.get("collection_run_id"):
@@ -1305,77 +1515,41 @@ def persist_collected_records(
             if not record.get("query_design_id") and query_design_id:
                 record["query_design_id"] = query_design_id
 
-            columns = [k for k, v in record.items() if v is not None]
-            if not columns:
+            if all(v is None for v in record.values()):
                 skipped += 1
                 continue
+            pending.append(record)
 
-            # Build placeholder list with CAST() for types the driver may
-            # not infer correctly from plain strings.
-            placeholders = []
-            params: dict[str, Any] = {}
-            for col in columns:
-                val = record[col]
-                if col in _JSONB_COLS:
-                    placeholders.append(f"CAST(:{col} AS jsonb)")
-                    params[col] = json.dumps(val) if not isinstance(val, str) else val
-                elif col in _TEXT_ARRAY_COLS:
-                    # text[] columns — convert Python list to PostgreSQL array literal.
-                    placeholders.append(f"CAST(:{col} AS text[])")
-                    if isinstance(val, list):
-                        params[col] = "{" + ",".join(
-                            '"' + str(v).replace("\\", "\\\\").replace('"', '\\"') + '"'
-                            for v in val
-                        ) + "}"
-                    else:
-                        params[col] = str(val)
-                elif col in _UUID_COLS:
-                    placeholders.append(f"CAST(:{col} AS uuid)")
-                    params[col] = str(val)
-                elif col in _TIMESTAMP_COLS:
-                    placeholders.append(f"CAST(:{col} AS timestamptz)")
-                    # Strip trailing 'Z' if offset already present.
-                    sval = str(val)
-                    if sval.endswith("+00:00Z"):
-                        sval = sval[:-1]
-                    params[col] = sval
-                else:
-                    placeholders.append(f":{col}")
-                    # Clamp simhash to signed bigint range.
-                    if col == "simhash" and isinstance(val, int) and val > 9223372036854775807:
-                        params[col] = val - 18446744073709551616  # 2^64
-                    else:
-                        params[col] = val
-
-            col_list = ", ".join(columns)
-            val_list = ", ".join(placeholders)
-
-            stmt = text(
-                f"INSERT INTO content_records ({col_list}) "
-                f"VALUES ({val_list}) "
-                f"ON CONFLICT (content_hash, published_at) "
-                f"WHERE content_hash IS NOT NULL DO NOTHING"
-            )
+        for start in range(0, len(pending), _PERSIST_CHUNK_SIZE):
+            chunk = pending[start : start + _PERSIST_CHUNK_SIZE]
             try:
-                # Use a SAVEPOINT so individual failures don't kill the batch.
-                db.begin_nested()
-                result = db.execute(stmt, params)
-                if result.rowcount == 1:
-                    inserted += 1
-                else:
-                    skipped += 1
-                db.commit()  # release savepoint
+                # One multi-row statement per chunk; the SAVEPOINT lets us
+                # fall back to per-row isolation if any row is rejected.
+                with db.begin_nested():
+                    chunk_inserted = _insert_content_records(db, chunk)
+                inserted += chunk_inserted
+                skipped += len(chunk) - chunk_inserted
             except Exception as exc:
                 logger.warning(
-                    "persist_collected_records: insert failed",
+                    "persist_collected_records: bulk insert failed, retrying per row",
                     error=str(exc),
-                    platform=record.get("platform"),
-                    url=(record.get("url") or "")[:100],
+                    batch_size=len(chunk),
                 )
-                db.rollback()  # rollback to savepoint only
-                skipped += 1
-
-        db.commit()
+                for record in chunk:
+                    try:
+                        with db.begin_nested():
+                            row_inserted = _insert_content_records(db, [record])
+                        inserted += row_inserted
+                        skipped += 1 - row_inserted
+                    except Exception as row_exc:
+                        logger.warning(
+                            "persist_collected_records: insert failed",
+                            error=str(row_exc),
+                            platform=record.get("platform"),
+                            url=(record.get("url") or "")[:100],
+                        )
+                        skipped += 1
+            db.commit()
 
         # Update the collection run's records_collected counter.
         if inserted > 0:
@@ -1389,6 +1563,9 @@ def persist_collected_records(
             )
             db.commit()
 
+    if inserted > 0:
+        invalidate_analysis_cache(collection_run_id, query_design_id)
+
     logger.info(
         "persist_collected_records: done",
         inserted=inserted,
@@ -2469,7 +2646,7 @@ def run_with_tier_fallback(
     in order: PREMIUM → MEDIUM → FREE.  Only tiers in the collector's
     ``supported_tiers`` are attempted.
 
-    The collection method is called via ``asyncio.run()`` (suitable for
+    The collection method is called via ``run_async()`` (suitable for
     synchronous Celery task bodies).
 
     Args:
@@ -2488,11 +2665,11 @@ def run_with_tier_fallback(
     Raises:
         NoCredentialAvailableError: If no supported tier has credentials.
     """
-    import asyncio
     import logging
 
     from issue_observatory.arenas.base import Tier
     from issue_observatory.core.exceptions import NoCredentialAvailableError
+    from issue_observatory.workers.runtime import run_async
 
     log = task_logger or logging.getLogger(__name__)
 
@@ -2515,7 +2692,7 @@ def run_with_tier_fallback(
     for tier in tiers_to_try:
         try:
             kwargs["tier"] = tier
-            result = asyncio.run(method(**kwargs))
+            result = run_async(method(**kwargs))
             if tier != requested_tier:
                 log.warning(
                     "%s: fell back from tier=%s to tier=%s due to missing credentials",
@@ -30,11 +30,19 @@ Schedule overview:
 | retention_enforcement     | 04:00 Copenhagen    | Delete records older than    |
 |                           |                     | DATA_RETENTION_DAYS.         |
 +---------------------------+---------------------+-----------------------------+
+| reconcile_content_rollups | 04:30 Copenhagen    | Repair per-day content       |
+|                           |                     | rollups that drifted from    |
+|                           |                     | content_records.             |
++---------------------------+---------------------+-----------------------------+
 | nightly_enrichment        | 00:00 Copenhagen    | Enrich all content records   |
 |                           |                     | missing language_detection,  |
 |                           |                     | actor_roles, or              |
 |                           |                     | url_extraction enrichments.  |
 +---------------------------+---------------------+-----------------------------+
+| advance_brightdata_       | Every minute        | Poll pending Bright Data     |
+| snapshots                 |                     | snapshots and dispatch the   |
+|                           |                     | ready ones for ingestion.    |
++---------------------------+---------------------+-----------------------------+
 """
 
 from __future__ import annotations
@@ -100,6 +108,19 @@ beat_schedule: dict[str, dict] = {  # type: ignore[type-arg]
         },
     },
     # ------------------------------------------------------------------
+    # Content rollup reconciliation — 04:30 Copenhagen time
+    # Runs after retention enforcement so the rows it deleted are dropped
+    # from the dashboard rollups the same night.
+    # ------------------------------------------------------------------
+    "reconcile_content_rollups": {
+        "task": "reconcile_content_rollups",
+        "schedule": crontab(hour=4, minute=30),
+        "options": {
+            "queue": "celery",
+            "expires": 7_200,  # discard if not started within 2 hours
+        },
+    },
+    # ------------------------------------------------------------------
     # Threads — daily token refresh (tokens expire after 60 days)
     # Runs at 02:00 Copenhagen time to avoid overlap with daily collection.
     # ------------------------------------------------------------------
@@ -153,4 +174,18 @@ beat_schedule: dict[str, dict] = {  # type: ignore[type-arg]
             "expires": 14_400,  # 4 hours — NER can be slow on large backlogs
         },
     },
+    # ------------------------------------------------------------------
+    # Bright Data snapshot poller — every minute
+    # Facebook/Instagram collection tasks only trigger snapshots; this
+    # tick polls their progress and dispatches ingest_snapshot for each
+    # ready one (see arenas/_brightdata_snapshots.py).
+    # ------------------------------------------------------------------
+    "advance_brightdata_snapshots": {
+        "task": "issue_observatory.workers.tasks.advance_brightdata_snapshots",
+        "schedule": 60.0,
+        "options": {
+            "queue": "celery",
+            "expires": 55,  # a missed tick is covered by the next one
+        },
+    },
 }
@@ -27,7 +27,7 @@ from __future__ import annotations
 import logging
 
 from celery import Celery
-from celery.signals import task_postrun, worker_process_init
+from celery.signals import task_postrun, worker_process_init, worker_process_shutdown
 from dotenv import load_dotenv
 
 _logger = logging.getLogger(__name__)
@@ -144,7 +144,7 @@ celery_app.conf.update(
     # on a dedicated queue to avoid blocking batch collection workers.
     # Scraping tasks run on a dedicated queue with extended time limits.
     task_routes={
-        "issue_observatory.arenas.social_media.bluesky.tasks.stream*": {
+        "issue_observatory.arenas.bluesky.tasks.stream*": {
             "queue": "streaming"
         },
         "issue_observatory.arenas.social_media.reddit.tasks.stream*": {
@@ -178,45 +178,110 @@ celery_app.conf.beat_schedule = beat_schedule
 
 
 # ---------------------------------------------------------------------------
-# Engine disposal on fork — prevents "attached to a different loop" errors
+# Worker runtime — one persistent event loop and client pool per process
 # ---------------------------------------------------------------------------
 @worker_process_init.connect
-def _dispose_engines_on_fork(**kwargs: object) -> None:
-    """Dispose SQLAlchemy engines after Celery forks a worker process.
-
-    The async engine creates connection objects tied to the parent's event
-    loop.  After ``fork()``, those connections cannot be reused because the
-    child process has a different loop.  Disposing the engines forces fresh
-    connections to be created in the child's own event loop when
-    ``asyncio.run()`` is called.
+def _start_runtime_on_fork(**kwargs: object) -> None:
+    """Reset inherited engines and start the process's worker runtime.
+
+    Pooled connections created in the parent before ``fork()`` cannot be
+    shared with the child, so both SQLAlchemy engines drop them without
+    closing the parent's sockets.  The child then starts its own persistent
+    event loop (``workers/runtime.py``); every task in this process runs its
+    coroutines on that loop via ``run_async()``, so the async engine's pool
+    stays valid from one task to the next.
     """
     from issue_observatory.core import database as _db
+    from issue_observatory.workers.runtime import start_runtime
 
     _db.async_engine.sync_engine.dispose(close=False)
     _db._sync_engine.dispose(close=False)
+    start_runtime()
+
+
+@worker_process_shutdown.connect
+def _shutdown_runtime(**kwargs: object) -> None:
+    """Close the pooled asyncpg, Redis and HTTP connections of this process."""
+    _flush_credential_last_used()
+    try:
+        from issue_observatory.workers.runtime import shutdown_runtime
+
+        shutdown_runtime()
+    except Exception:
+        _logger.warning("worker runtime shutdown failed", exc_info=True)
 
 
 # ---------------------------------------------------------------------------
-# Engine disposal after each task — prevents cross-task event loop errors
+# Event-driven batch completion — arena task ends trigger the run check
 # ---------------------------------------------------------------------------
 @task_postrun.connect
-def _dispose_async_engine_after_task(**kwargs: object) -> None:
-    """Dispose the async engine's connection pool after each task completes.
-
-    Celery prefork workers reuse the same process for multiple tasks.  If a
-    task called ``asyncio.run()``, asyncpg connections in the pool are bound
-    to the event loop that ``asyncio.run()`` created and then destroyed.
-    When the next task calls ``asyncio.run()`` with a *new* loop, those
-    pooled connections fail with ``RuntimeError: ... attached to a different
-    loop``.
-
-    Disposing the underlying sync engine (which manages the actual socket
-    pool for asyncpg) after each task ensures the next task starts with a
-    clean connection pool.
+def _request_completion_check_after_arena_task(
+    sender: object = None,
+    kwargs: dict | None = None,
+    state: str | None = None,
+    **_: object,
+) -> None:
+    """Ask for a completion check when an arena task of a batch run ends.
+
+    The check finalizes the run as soon as the last arena task finishes,
+    instead of waiting for the next safety sweep (see
+    ``workers/_completion_helpers.py``).
     """
     try:
-        from issue_observatory.core import database as _db
+        from issue_observatory.workers._completion_helpers import (
+            request_completion_check,
+            run_id_for_task_end,
+        )
+
+        run_id = run_id_for_task_end(getattr(sender, "name", None), kwargs, state)
+        if run_id is not None:
+            request_completion_check(run_id, settings.redis_url)
+    except Exception:
+        _logger.warning("completion check request failed", exc_info=True)
+
+
+# ---------------------------------------------------------------------------
+# Worker metrics — push this process's observations after every task
+# ---------------------------------------------------------------------------
+@task_postrun.connect
+def _flush_worker_metrics_after_task(**kwargs: object) -> None:
+    """Push the collection metrics recorded during the task to Redis.
+
+    The API's ``/metrics`` endpoint reads them back (see
+    ``core/worker_metrics.py``).  The flush is fire-and-forget.
+    """
+    try:
+        from issue_observatory.core.worker_metrics import flush_worker_metrics
+
+        flush_worker_metrics(str(settings.redis_url))
+    except Exception:
+        _logger.warning("worker metrics flush failed", exc_info=True)
+
+
+# ---------------------------------------------------------------------------
+# Credential pool — write coalesced last_used_at timestamps after every task
+# ---------------------------------------------------------------------------
+@task_postrun.connect
+def _flush_credential_last_used_after_task(**kwargs: object) -> None:
+    """Write the ``last_used_at`` timestamps the task's acquisitions queued.
+
+    ``CredentialPool`` batches these writes per process; without a flush at
+    task end they would wait for the next acquisition (see
+    ``core/credential_pool.py``).
+    """
+    _flush_credential_last_used()
+
+
+def _flush_credential_last_used() -> None:
+    """Flush the credential pool's queued writes on the runtime loop."""
+    try:
+        from issue_observatory.core.credential_pool import (
+            get_credential_pool,
+            has_pending_last_used,
+        )
+        from issue_observatory.workers.runtime import run_async
 
-        _db.async_engine.sync_engine.dispose(close=False)
+        if has_pending_last_used():
+            run_async(get_credential_pool().flush_last_used())
     except Exception:
-        pass  # Best effort — never let cleanup crash the worker
+        _logger.warning("credential last_used_at flush failed", exc_info=True)
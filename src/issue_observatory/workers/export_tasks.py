@@ -6,17 +6,23 @@ The task:
 1. Runs the content query against PostgreSQL using a synchronous psycopg2
    connection (Celery workers are synchronous processes; asyncpg is not usable
    here without running a fresh event loop, which is fragile under Celery).
-2. Builds a list of plain dicts from the result set.
-3. Delegates serialization to ``ContentExporter``.
-4. Uploads the file to MinIO under ``exports/{user_id}/{job_id}.{ext}``.
-5. Writes a progress/status JSON blob to Redis at key
+2. Streams batches of plain dicts from a server-side cursor straight into
+   ``ContentExporter.write_stream``, which serializes them incrementally into
+   a temporary file on local disk (CSV, XLSX, NDJSON and Parquet).  GEXF
+   needs the full record set to build its graph and is still buffered.
+3. Uploads the file to MinIO under ``exports/{user_id}/{job_id}.{ext}``.
+   ``put_object`` reads the spool file in parts (multipart upload for large
+   files), so peak worker memory stays bounded by one cursor batch plus one
+   upload part regardless of export size.
+4. Writes a progress/status JSON blob to Redis at key
    ``export:{job_id}:status`` with a 24-hour TTL.
 
 Progress reporting:
     The task writes status updates to Redis at the following lifecycle points:
-    - On start: ``{"status": "running", "pct_complete": 0}``
-    - After query: ``{"status": "running", "pct_complete": 50}``
-    - After export: ``{"status": "running", "pct_complete": 80}``
+    - On start: ``{"status": "running", "pct_complete": 0, "total_records": N}``
+    - While serializing: ``pct_complete`` from 0 to 90 in proportion to the
+      rows processed so far, plus ``records_processed``
+    - Before upload: ``{"status": "running", "pct_complete": 90}``
     - On completion: ``{"status": "complete", "pct_complete": 100,
                         "download_url": "<presigned_url>", "record_count": N}``
     - On failure: ``{"status": "failed", "error": "<message>"}``
@@ -39,15 +45,19 @@ Owned by the DB Engineer.
 
 from __future__ import annotations
 
-import asyncio
 import json
+import tempfile
 from datetime import UTC, datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import structlog
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 from issue_observatory.workers._db_helpers import _build_sync_dsn
 from issue_observatory.workers.celery_app import celery_app
+from issue_observatory.workers.runtime import run_async
 
 logger = structlog.get_logger(__name__)
 
@@ -85,38 +95,18 @@ def _set_status(redis_client: Any, job_id: str, payload: dict[str, Any]) -> None
     )
 
 
-def _query_records(
-    sync_dsn: str,
-    user_id: str,
-    filters: dict[str, Any],
-    limit: int | None,
-) -> list[dict[str, Any]]:
-    """Run the content query synchronously and return plain dicts.
-
-    Uses a server-side cursor (``fetchmany`` in batches of 1 000) to avoid
-    loading the entire result set into memory at once.
+def _build_where(user_id: str, filters: dict[str, Any]) -> tuple[str, dict[str, Any]]:
+    """Build the parameterized WHERE clause shared by the export queries.
 
     Args:
-        sync_dsn: psycopg2 DSN.
         user_id: UUID string of the requesting user (ownership filter).
         filters: Dict with optional keys: ``platform``, ``arena``,
             ``query_design_id``, ``date_from``, ``date_to``, ``language``,
             ``run_id``, ``search_term``.
-        limit: Maximum number of records to return, or None for no limit.
 
     Returns:
-        List of plain dicts, one per content record row.
+        Tuple of ``(where_clause, params)`` for psycopg2.
     """
-    try:
-        import psycopg2
-        import psycopg2.extras
-    except ImportError as exc:
-        raise ImportError(
-            "psycopg2 is required for async export tasks. "
-            "Install it with: pip install psycopg2-binary"
-        ) from exc
-
-    # Build parameterized SQL
     conditions: list[str] = [
         "cr.collection_run_id IN "
         "(SELECT id FROM collection_runs WHERE initiated_by = %(user_id)s)"
@@ -155,7 +145,77 @@ def _query_records(
         conditions.append("cr.search_terms_matched @> ARRAY[%(search_term)s]::text[]")
         params["search_term"] = filters["search_term"]
 
-    where_clause = " AND ".join(conditions)
+    return " AND ".join(conditions), params
+
+
+def _import_psycopg2() -> Any:
+    try:
+        import psycopg2
+        import psycopg2.extras
+    except ImportError as exc:
+        raise ImportError(
+            "psycopg2 is required for async export tasks. "
+            "Install it with: pip install psycopg2-binary"
+        ) from exc
+    return psycopg2
+
+
+def _count_records(
+    sync_dsn: str,
+    user_id: str,
+    filters: dict[str, Any],
+    limit: int | None,
+) -> int:
+    """Return the number of rows the export query will produce.
+
+    Used as the denominator for ``pct_complete`` progress reporting.
+
+    Args:
+        sync_dsn: psycopg2 DSN.
+        user_id: UUID string of the requesting user (ownership filter).
+        filters: Same filter dict as :func:`_iter_record_batches`.
+        limit: Maximum number of records that will be exported, or None.
+
+    Returns:
+        Matching row count, capped at *limit*.
+    """
+    psycopg2 = _import_psycopg2()
+    where_clause, params = _build_where(user_id, filters)
+
+    with psycopg2.connect(sync_dsn) as conn:
+        with conn.cursor() as cur:
+            cur.execute(f"SELECT COUNT(*) FROM content_records cr WHERE {where_clause}", params)
+            count = int(cur.fetchone()[0])
+
+    return min(count, int(limit)) if limit else count
+
+
+def _iter_record_batches(
+    sync_dsn: str,
+    user_id: str,
+    filters: dict[str, Any],
+    limit: int | None,
+    batch_size: int = 1_000,
+) -> Iterator[list[dict[str, Any]]]:
+    """Run the content query and yield plain-dict rows in batches.
+
+    Uses a server-side (named) cursor with ``fetchmany`` so that only one
+    batch is held in memory at a time; nothing is accumulated across batches.
+
+    Args:
+        sync_dsn: psycopg2 DSN.
+        user_id: UUID string of the requesting user (ownership filter).
+        filters: Dict with optional keys: ``platform``, ``arena``,
+            ``query_design_id``, ``date_from``, ``date_to``, ``language``,
+            ``run_id``, ``search_term``.
+        limit: Maximum number of records to return, or None for no limit.
+        batch_size: Rows fetched per round-trip and yielded per batch.
+
+    Yields:
+        Lists of at most *batch_size* plain dicts, one per content record row.
+    """
+    psycopg2 = _import_psycopg2()
+    where_clause, params = _build_where(user_id, filters)
     limit_clause = f"LIMIT {int(limit)}" if limit else ""
 
     sql = f"""
@@ -188,19 +248,40 @@ def _query_records(
         {limit_clause}
     """
 
-    records: list[dict[str, Any]] = []
-    batch_size = 1_000
-
     with psycopg2.connect(sync_dsn) as conn:
         with conn.cursor(name="export_cursor", cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+            cur.itersize = batch_size
             cur.execute(sql, params)
             while True:
                 batch = cur.fetchmany(batch_size)
                 if not batch:
                     break
-                for row in batch:
-                    records.append(dict(row))
+                yield [dict(row) for row in batch]
+
 
+def _query_records(
+    sync_dsn: str,
+    user_id: str,
+    filters: dict[str, Any],
+    limit: int | None,
+) -> list[dict[str, Any]]:
+    """Run the content query synchronously and return all rows as plain dicts.
+
+    Only used for formats that need the full record set at once (GEXF).
+    Streaming formats consume :func:`_iter_record_batches` directly.
+
+    Args:
+        sync_dsn: psycopg2 DSN.
+        user_id: UUID string of the requesting user (ownership filter).
+        filters: See :func:`_iter_record_batches`.
+        limit: Maximum number of records to return, or None for no limit.
+
+    Returns:
+        List of plain dicts, one per content record row.
+    """
+    records: list[dict[str, Any]] = []
+    for batch in _iter_record_batches(sync_dsn, user_id, filters, limit):
+        records.extend(batch)
     return records
 
 
@@ -251,40 +332,13 @@ def export_content_records(
     log = logger.bind(job_id=job_id, user_id=user_id, format=export_format)
 
     try:
-        # --- Step 1: Query database ---
-        sync_dsn = _build_sync_dsn(settings.database_url)
-        log.info("export_task.query_start")
-        records = _query_records(sync_dsn, user_id, filters, limit=None)
-        log.info("export_task.query_done", record_count=len(records))
-        _set_status(redis_client, job_id, {"status": "running", "pct_complete": 50})
+        from minio import Minio  # type: ignore[import-untyped]
+        from minio.error import S3Error  # type: ignore[import-untyped]
 
-        # --- Step 2: Serialize to bytes ---
         from issue_observatory.analysis.export import ContentExporter
 
         exporter = ContentExporter()
-        # Extract network_type for GEXF exports.  Defaults to "actor" so that
-        # jobs dispatched before this parameter was added continue to work.
-        gexf_network_type: str = filters.get("network_type", "actor")
-
-        format_method = {
-            "csv": lambda: asyncio.run(exporter.export_csv(records)),
-            "xlsx": lambda: asyncio.run(exporter.export_xlsx(records)),
-            "json": lambda: asyncio.run(exporter.export_json(records)),
-            "parquet": lambda: asyncio.run(exporter.export_parquet(records)),
-            "gexf": lambda: asyncio.run(exporter.export_gexf(records, network_type=gexf_network_type)),
-        }
-        if export_format not in format_method:
-            raise ValueError(f"Unsupported export format: {export_format!r}")
-
-        file_bytes = format_method[export_format]()
-        log.info("export_task.serialized", byte_count=len(file_bytes))
-        _set_status(redis_client, job_id, {"status": "running", "pct_complete": 80})
-
-        # --- Step 3: Upload to MinIO ---
-        import io as _io
-
-        from minio import Minio  # type: ignore[import-untyped]
-        from minio.error import S3Error  # type: ignore[import-untyped]
+        sync_dsn = _build_sync_dsn(settings.database_url)
 
         ext_map = {
             "csv": "csv",
@@ -293,20 +347,12 @@ def export_content_records(
             "parquet": "parquet",
             "gexf": "gexf",
         }
+        if export_format not in ext_map:
+            raise ValueError(f"Unsupported export format: {export_format!r}")
+
         ext = ext_map[export_format]
         object_key = f"exports/{user_id}/{job_id}.{ext}"
 
-        minio_client = Minio(
-            settings.minio_endpoint,
-            access_key=settings.minio_root_user,
-            secret_key=settings.minio_root_password,
-            secure=settings.minio_secure,
-        )
-
-        # Ensure bucket exists
-        if not minio_client.bucket_exists(settings.minio_bucket):
-            minio_client.make_bucket(settings.minio_bucket)
-
         content_type_map = {
             "csv": "text/csv; charset=utf-8",
             "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
@@ -315,14 +361,94 @@ def export_content_records(
             "gexf": "application/xml",
         }
 
-        minio_client.put_object(
-            settings.minio_bucket,
-            object_key,
-            _io.BytesIO(file_bytes),
-            length=len(file_bytes),
-            content_type=content_type_map[export_format],
+        # --- Step 1: Count rows so progress reflects real work done ---
+        total_records = _count_records(sync_dsn, user_id, filters, limit=None)
+        log.info("export_task.query_start", total_records=total_records)
+        _set_status(
+            redis_client,
+            job_id,
+            {"status": "running", "pct_complete": 0, "total_records": total_records},
         )
 
+        last_pct = 0
+
+        def _report_progress(rows_done: int) -> None:
+            nonlocal last_pct
+            pct = min(90, rows_done * 90 // max(total_records, 1))
+            if pct > last_pct:
+                last_pct = pct
+                _set_status(
+                    redis_client,
+                    job_id,
+                    {
+                        "status": "running",
+                        "pct_complete": pct,
+                        "records_processed": rows_done,
+                        "total_records": total_records,
+                    },
+                )
+
+        # Spool to local disk rather than memory; the file is removed when
+        # the context exits.
+        with tempfile.TemporaryFile() as spool:
+            # --- Step 2: Serialize ---
+            if export_format in ContentExporter.STREAMING_FORMATS:
+                record_count = exporter.write_stream(
+                    _iter_record_batches(sync_dsn, user_id, filters, limit=None),
+                    export_format,
+                    spool,
+                    on_batch=_report_progress,
+                )
+            else:
+                # GEXF builds a graph over every record and cannot stream.
+                # Extract network_type for GEXF exports.  Defaults to "actor"
+                # so that jobs dispatched before this parameter was added
+                # continue to work.
+                gexf_network_type: str = filters.get("network_type", "actor")
+                records = _query_records(sync_dsn, user_id, filters, limit=None)
+                record_count = len(records)
+                _report_progress(record_count)
+                spool.write(
+                    run_async(exporter.export_gexf(records, network_type=gexf_network_type))
+                )
+                del records
+
+            byte_count = spool.tell()
+            spool.seek(0)
+            log.info("export_task.serialized", record_count=record_count, byte_count=byte_count)
+            _set_status(
+                redis_client,
+                job_id,
+                {
+                    "status": "running",
+                    "pct_complete": 90,
+                    "records_processed": record_count,
+                    "total_records": total_records,
+                },
+            )
+
+            # --- Step 3: Upload to MinIO ---
+            minio_client = Minio(
+                settings.minio_endpoint,
+                access_key=settings.minio_root_user,
+                secret_key=settings.minio_root_password,
+                secure=settings.minio_secure,
+            )
+
+            # Ensure bucket exists
+            if not minio_client.bucket_exists(settings.minio_bucket):
+                minio_client.make_bucket(settings.minio_bucket)
+
+            # put_object reads the spool file part by part (multipart upload
+            # above the part size), so the file is never loaded whole.
+            minio_client.put_object(
+                settings.minio_bucket,
+                object_key,
+                spool,
+                length=byte_count,
+                content_type=content_type_map[export_format],
+            )
+
         # Generate a 1-hour pre-signed download URL
         from datetime import timedelta
 
@@ -337,7 +463,7 @@ def export_content_records(
         final_status: dict[str, Any] = {
             "status": "complete",
             "pct_complete": 100,
-            "record_count": len(records),
+            "record_count": record_count,
             "object_key": object_key,
             "download_url": presigned_url,
             "completed_at": datetime.now(UTC).isoformat(),
@@ -346,7 +472,7 @@ def export_content_records(
 
         return {
             "status": "complete",
-            "record_count": len(records),
+            "record_count": record_count,
             "object_key": object_key,
         }
 
@@ -6,6 +6,8 @@ Currently covers:
   for one collection run (Task 3.8).
 - ``refresh_engagement_metrics``: re-fetch engagement metrics for existing
   content records in a collection run (IP2-035).
+- ``reconcile_content_rollups``: repair per-day content rollup slices that
+  drifted from ``content_records`` (nightly, see ``beat_schedule.py``).
 
 Database access uses ``psycopg2`` (synchronous) because Celery workers are
 synchronous processes.  The async deduplication service logic is re-implemented
@@ -20,9 +22,12 @@ from typing import Any
 
 import structlog
 
+from issue_observatory.core.deduplication import SimHashIndex
 from issue_observatory.core.deduplication import normalise_url as _normalise_url
 from issue_observatory.workers._db_helpers import _build_sync_dsn
+from issue_observatory.workers._task_helpers import invalidate_analysis_cache
 from issue_observatory.workers.celery_app import celery_app
+from issue_observatory.workers.runtime import run_async
 
 logger = structlog.get_logger(__name__)
 
@@ -40,7 +45,8 @@ def _run_dedup_sync(sync_dsn: str, run_id: str) -> dict[str, Any]:
         run_id: UUID string of the collection run to process.
 
     Returns:
-        Dict with ``url_groups``, ``hash_groups``, ``total_marked``.
+        Dict with ``url_groups``, ``hash_groups``, ``total_marked``,
+        ``near_duplicate_groups`` and ``near_duplicates_marked``.
     """
     try:
         import psycopg2
@@ -56,6 +62,8 @@ def _run_dedup_sync(sync_dsn: str, run_id: str) -> dict[str, Any]:
     total_marked = 0
     url_group_count = 0
     hash_group_count = 0
+    near_group_count = 0
+    near_marked = 0
 
     with psycopg2.connect(sync_dsn) as conn:
         with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
@@ -140,15 +148,68 @@ def _run_dedup_sync(sync_dsn: str, run_id: str) -> dict[str, Any]:
                 )
                 total_marked += cur.rowcount
 
+            # ---- SimHash near-duplicate pass ----
+            cur.execute(
+                """
+                SELECT id::text, simhash
+                FROM content_records
+                WHERE collection_run_id = %(run_id)s
+                  AND simhash IS NOT NULL
+                """,
+                {"run_id": run_id},
+            )
+            index = SimHashIndex(hamming_threshold=3)
+            for row in cur.fetchall():
+                index.add(row["id"], row["simhash"])
+
+            for ids in index.clusters():
+                near_group_count += 1
+                canonical = min(ids)
+                dupes = [i for i in ids if i != canonical]
+                cur.execute(
+                    """
+                    UPDATE content_records
+                    SET raw_metadata = jsonb_set(
+                        COALESCE(raw_metadata, '{}'::jsonb),
+                        '{near_duplicate_of}',
+                        to_jsonb(%(canonical)s::text)
+                    )
+                    WHERE id = ANY(%(dupes)s::uuid[])
+                    """,
+                    {"canonical": canonical, "dupes": dupes},
+                )
+                near_marked += cur.rowcount
+
         conn.commit()
 
     return {
         "url_groups": url_group_count,
         "hash_groups": hash_group_count,
         "total_marked": total_marked,
+        "near_duplicate_groups": near_group_count,
+        "near_duplicates_marked": near_marked,
     }
 
 
+def _refresh_run_rollups(run_id: str) -> None:
+    """Recompute the content rollup slices holding records of *run_id*.
+
+    Failures are logged, not raised: the duplicate marks are already
+    committed, and the nightly ``reconcile_content_rollups`` task repairs
+    any slice left stale.
+    """
+    from issue_observatory.core.content_rollups import refresh_run_slices_sync
+    from issue_observatory.core.database import get_sync_session
+
+    try:
+        with get_sync_session() as session:
+            refreshed = refresh_run_slices_sync(session, run_id)
+            session.commit()
+        logger.debug("dedup_task.rollups_refreshed", run_id=run_id, slices=refreshed)
+    except Exception as exc:
+        logger.warning("dedup_task.rollup_refresh_failed", run_id=run_id, error=str(exc))
+
+
 # ---------------------------------------------------------------------------
 # Celery task
 # ---------------------------------------------------------------------------
@@ -167,9 +228,12 @@ def deduplicate_run(
        params, lowercased, ``www.``-stripped) matches across different arenas.
     2. **Content hash**: records sharing the same SHA-256 ``content_hash``
        across different platforms or arenas.
+    3. **SimHash**: records whose fingerprints are within 3 bits of each
+       other, found via :class:`~issue_observatory.core.deduplication.SimHashIndex`.
 
     Duplicate records are marked in-place by setting
-    ``raw_metadata['duplicate_of']`` to the canonical record's UUID string.
+    ``raw_metadata['duplicate_of']`` (or ``raw_metadata['near_duplicate_of']``
+    for SimHash matches) to the canonical record's UUID string.
     The canonical record within each group is chosen as the record with the
     lowest UUID value.
 
@@ -179,7 +243,8 @@ def deduplicate_run(
         run_id: UUID string of the collection run to process.
 
     Returns:
-        Dict with ``url_groups``, ``hash_groups``, ``total_marked`` counts.
+        Dict with ``url_groups``, ``hash_groups``, ``total_marked``,
+        ``near_duplicate_groups`` and ``near_duplicates_marked`` counts.
     """
     log = logger.bind(task="deduplicate_run", run_id=run_id)
     log.info("dedup_task.start")
@@ -191,6 +256,10 @@ def deduplicate_run(
 
     try:
         result = _run_dedup_sync(sync_dsn, run_id)
+        if result["total_marked"]:
+            _refresh_run_rollups(run_id)
+        if result["total_marked"] or result["near_duplicates_marked"]:
+            invalidate_analysis_cache(run_id)
         log.info("dedup_task.complete", **result)
         return result
     except Exception as exc:
@@ -212,6 +281,8 @@ def refresh_engagement_metrics(
 
     Groups records by platform, calls each arena's ``refresh_engagement()``
     method (if implemented), and updates engagement counts in the database.
+    Each batch is written with one bulk UPDATE, and the ``engagement_score``
+    of the updated records is recomputed in the same transaction.
 
     Arenas that do not implement ``refresh_engagement()`` are skipped
     silently with a debug log message.
@@ -241,6 +312,8 @@ def refresh_engagement_metrics(
 
     try:
         result = _refresh_engagement_sync(sync_dsn, run_id, settings)
+        if result["records_updated"]:
+            invalidate_analysis_cache(run_id)
         log.info("refresh_engagement.complete", **result)
         return result
     except Exception as exc:
@@ -273,6 +346,8 @@ def backfill_project_terms(
 
     try:
         result = backfill_project_term_matching(project_id, batch_size=batch_size)
+        if result.get("updated"):
+            invalidate_analysis_cache(all_data=True)
         log.info("backfill_project_terms.complete", **result)
         return result
     except Exception as exc:
@@ -280,6 +355,66 @@ def backfill_project_terms(
         raise
 
 
+#: Engagement count columns an arena's ``refresh_engagement()`` may return.
+_ENGAGEMENT_COUNT_FIELDS: tuple[str, ...] = (
+    "likes_count",
+    "shares_count",
+    "comments_count",
+    "views_count",
+)
+
+#: Bulk count update for one refresh batch; returns the columns needed to
+#: rescore the updated records.
+_BULK_ENGAGEMENT_UPDATE_SQL = """
+    UPDATE content_records AS c
+    SET likes_count = COALESCE(v.likes_count, c.likes_count),
+        shares_count = COALESCE(v.shares_count, c.shares_count),
+        comments_count = COALESCE(v.comments_count, c.comments_count),
+        views_count = COALESCE(v.views_count, c.views_count)
+    FROM unnest(
+        %(record_ids)s::uuid[],
+        %(likes_count)s::bigint[],
+        %(shares_count)s::bigint[],
+        %(comments_count)s::bigint[],
+        %(views_count)s::bigint[]
+    ) AS v(id, likes_count, shares_count, comments_count, views_count)
+    WHERE c.id = v.id
+    RETURNING c.id::text AS id, c.platform, c.likes_count, c.shares_count,
+              c.comments_count, c.views_count
+"""
+
+
+def _rescore_engagement(cur: Any, rows: list[dict[str, Any]], scorer: Any) -> None:
+    """Recompute ``engagement_score`` for records whose counts were refreshed.
+
+    Scores are computed for the whole batch at once and written with one
+    ``UPDATE ... FROM unnest()`` on the caller's cursor, inside the same
+    transaction as the count update.
+
+    Args:
+        cur: Open psycopg2 cursor.
+        rows: Rows returned by :data:`_BULK_ENGAGEMENT_UPDATE_SQL`.
+        scorer: An :class:`EngagementScorer` with its scalers loaded.
+    """
+    scorable = [dict(row) for row in rows if scorer.is_applicable(row)]
+    if not scorable:
+        return
+    results = run_async(scorer.enrich_batch(scorable))
+    cur.execute(
+        """
+        UPDATE content_records AS c
+        SET engagement_score = v.score
+        FROM unnest(%(record_ids)s::uuid[], %(scores)s::double precision[])
+            AS v(id, score)
+        WHERE c.id = v.id
+        """,
+        {
+            "record_ids": [row["id"] for row in scorable],
+            "scores": [result["score"] for result in results],
+        },
+    )
+
+
 def _refresh_engagement_sync(sync_dsn: str, run_id: str, settings: Any) -> dict[str, Any]:
     """Execute engagement refresh inside a synchronous psycopg2 connection.
 
@@ -300,16 +435,18 @@ def _refresh_engagement_sync(sync_dsn: str, run_id: str, settings: Any) -> dict[
             "Install it with: pip install psycopg2-binary"
         ) from exc
 
-    import asyncio
     from collections import defaultdict
 
     from issue_observatory.arenas.base import Tier
     from issue_observatory.arenas.registry import get_arena
 
+    from issue_observatory.analysis.enrichments.engagement_scorer import EngagementScorer
+
     platforms_processed = 0
     platforms_skipped = 0
     records_queried = 0
     records_updated = 0
+    scorer = EngagementScorer()
 
     BATCH_SIZE = 50  # process 50 platform_ids per API call
 
@@ -387,7 +524,7 @@ def _refresh_engagement_sync(sync_dsn: str, run_id: str, settings: Any) -> dict[
                         )
 
                         # Call the arena's refresh_engagement() method
-                        engagement_map = asyncio.run(
+                        engagement_map = run_async(
                             collector.refresh_engagement(platform_ids, tier=tier)
                         )
 
@@ -396,38 +533,28 @@ def _refresh_engagement_sync(sync_dsn: str, run_id: str, settings: Any) -> dict[
                             log.debug("refresh_engagement: arena returned empty map")
                             continue
 
-                        # Update records in the database
+                        # Update the whole batch with one UPDATE ... FROM unnest().
+                        # A metric missing from a record's refresh keeps its
+                        # stored value.
+                        columns: dict[str, list[Any]] = {
+                            "record_ids": [],
+                            **{f: [] for f in _ENGAGEMENT_COUNT_FIELDS},
+                        }
                         for record in batch:
-                            platform_id = record["platform_id"]
-                            metrics = engagement_map.get(platform_id)
-                            if not metrics:
+                            metrics = engagement_map.get(record["platform_id"])
+                            if not metrics or not any(
+                                f in metrics for f in _ENGAGEMENT_COUNT_FIELDS
+                            ):
                                 continue
+                            columns["record_ids"].append(record["record_id"])
+                            for f in _ENGAGEMENT_COUNT_FIELDS:
+                                columns[f].append(metrics.get(f))
 
-                            # Build SET clause dynamically based on available metrics
-                            updates = []
-                            params = {"record_id": record["record_id"]}
-
-                            if "likes_count" in metrics:
-                                updates.append("likes_count = %(likes_count)s")
-                                params["likes_count"] = metrics["likes_count"]
-                            if "shares_count" in metrics:
-                                updates.append("shares_count = %(shares_count)s")
-                                params["shares_count"] = metrics["shares_count"]
-                            if "comments_count" in metrics:
-                                updates.append("comments_count = %(comments_count)s")
-                                params["comments_count"] = metrics["comments_count"]
-                            if "views_count" in metrics:
-                                updates.append("views_count = %(views_count)s")
-                                params["views_count"] = metrics["views_count"]
-
-                            if updates:
-                                sql = f"""
-                                    UPDATE content_records
-                                    SET {", ".join(updates)}
-                                    WHERE id = %(record_id)s::uuid
-                                """
-                                cur.execute(sql, params)
-                                records_updated += cur.rowcount
+                        if columns["record_ids"]:
+                            cur.execute(_BULK_ENGAGEMENT_UPDATE_SQL, columns)
+                            updated_rows = cur.fetchall()
+                            records_updated += len(updated_rows)
+                            _rescore_engagement(cur, updated_rows, scorer)
 
                     platforms_processed += 1
 
@@ -447,3 +574,46 @@ def _refresh_engagement_sync(sync_dsn: str, run_id: str, settings: Any) -> dict[
         "records_updated": records_updated,
         "platforms_skipped": platforms_skipped,
     }
+
+
+# ---------------------------------------------------------------------------
+# Content rollup reconciliation
+# ---------------------------------------------------------------------------
+
+
+@celery_app.task(name="reconcile_content_rollups", bind=True)  # type: ignore[misc]
+def reconcile_content_rollups(
+    self: Any,
+    days: int | None = None,
+) -> dict[str, Any]:
+    """Repair content rollup slices that no longer match ``content_records``.
+
+    Inserts and duplicate marking keep the rollups current; writers that
+    bypass them (retention deletes, term-matching backfills, language
+    enrichment, run deletion) leave slices stale until this task recomputes
+    them.  Scheduled nightly after retention enforcement.
+
+    Args:
+        days: Only check the last *days* days of ``published_at``.  ``None``
+            (the scheduled default) checks every slice.
+
+    Returns:
+        Dict with ``slices_checked``, ``slices_repaired`` and
+        ``designs_repaired`` counts.
+    """
+    log = logger.bind(task="reconcile_content_rollups", days=days)
+    log.info("reconcile_rollups.start")
+
+    from issue_observatory.core.content_rollups import reconcile_rollups_sync
+    from issue_observatory.core.database import get_sync_session
+
+    try:
+        with get_sync_session() as session:
+            result = reconcile_rollups_sync(session, days=days)
+        if result["slices_repaired"]:
+            invalidate_analysis_cache(all_data=True)
+        log.info("reconcile_rollups.complete", **result)
+        return result
+    except Exception as exc:
+        log.error("reconcile_rollups.failed", error=str(exc))
+        raise
@@ -5,6 +5,10 @@ ZREMRANGEBYSCORE / ZCARD) to enforce per-credential and per-arena rate
 limits.  Lua scripts are used for atomic check-and-set operations so that
 concurrent workers share a single consistent view of the rate-limit state.
 
+:meth:`RateLimiter.wait_for_slot` queues waiters in a per-key FIFO ticket
+queue and sleeps each one until exactly the moment its turn can come — the
+expiry of the window entry that frees its slot — instead of polling.
+
 Typical usage::
 
     redis_client = await get_redis_client()
@@ -144,6 +148,20 @@ ARENA_DEFAULTS: dict[str, RateLimitConfig] = {
 
 _DEFAULT_CONFIG = RateLimitConfig()
 
+# wait_for_slot() sleep bounds.  The upper bound lets a waiter re-check
+# after a ticket ahead of it was abandoned (timeout or cancellation).
+_MIN_WAIT_SECONDS = 0.01
+_MAX_WAIT_SECONDS = 5.0
+
+
+def _metric_labels(key: str) -> dict[str, str]:
+    """Return worker-metric labels for a ``ratelimit:{arena}:{platform}:...`` key."""
+    parts = key.split(":")
+    if len(parts) >= 3 and parts[0] == "ratelimit":
+        return {"arena": parts[1], "platform": parts[2]}
+    return {"arena": "unknown", "platform": "unknown"}
+
+
 # ---------------------------------------------------------------------------
 # Lua scripts
 # ---------------------------------------------------------------------------
@@ -190,6 +208,86 @@ redis.call('ZREMRANGEBYSCORE', key, '-inf', cutoff)
 return redis.call('ZCARD', key)
 """
 
+# Atomic FIFO-ticketed acquire for wait_for_slot().
+#
+# KEYS[1]  — sorted-set key for the window
+# KEYS[2]  — waiter queue: ticket -> sequence number
+# KEYS[3]  — waiter deadlines: ticket -> abandonment timestamp
+# KEYS[4]  — queue sequence counter
+# ARGV[1]  — current timestamp (float string)
+# ARGV[2]  — window size in seconds
+# ARGV[3]  — maximum requests allowed in the window
+# ARGV[4]  — the waiter's ticket (also used as the window member)
+# ARGV[5]  — TTL for the window key (seconds)
+# ARGV[6]  — timestamp after which the ticket counts as abandoned
+# ARGV[7]  — minimum TTL for the queue keys (seconds)
+#
+# The waiter at queue position ``rank`` (0-based) may acquire when
+# ``rank < limit - count``.  Otherwise it has to wait for
+# ``index = rank - free + 1`` window entries to expire.  Within the current
+# window that is the entry at ``index`` (oldest first).  Deeper waiters are
+# served by later generations: each entry's slot is refilled by the waiter
+# served when it expires, so the turn is entry ``index % count`` plus one
+# window per full generation ahead.
+#
+# Returns 1 if the slot was acquired, otherwise minus the number of
+# milliseconds until the waiter's turn.
+_LUA_ACQUIRE_IN_TURN = """
+local key       = KEYS[1]
+local queue     = KEYS[2]
+local deadlines = KEYS[3]
+local seq       = KEYS[4]
+local now       = tonumber(ARGV[1])
+local window    = tonumber(ARGV[2])
+local limit     = tonumber(ARGV[3])
+local ticket    = ARGV[4]
+local ttl       = tonumber(ARGV[5])
+local abandon   = tonumber(ARGV[6])
+local queue_ttl = tonumber(ARGV[7])
+
+redis.call('ZREMRANGEBYSCORE', key, '-inf', now - window)
+
+local stale = redis.call('ZRANGEBYSCORE', deadlines, '-inf', now, 'LIMIT', 0, 100)
+for _, t in ipairs(stale) do
+    redis.call('ZREM', queue, t)
+    redis.call('ZREM', deadlines, t)
+end
+
+if not redis.call('ZSCORE', queue, ticket) then
+    redis.call('ZADD', queue, redis.call('INCR', seq), ticket)
+    redis.call('ZADD', deadlines, abandon, ticket)
+end
+
+local rank = redis.call('ZRANK', queue, ticket)
+local free = limit - redis.call('ZCARD', key)
+if rank < free then
+    redis.call('ZADD', key, now, ticket)
+    redis.call('EXPIRE', key, ttl)
+    redis.call('ZREM', queue, ticket)
+    redis.call('ZREM', deadlines, ticket)
+    return 1
+end
+
+for _, k in ipairs({queue, deadlines, seq}) do
+    if redis.call('TTL', k) < queue_ttl then
+        redis.call('EXPIRE', k, queue_ttl)
+    end
+end
+
+local index = rank - math.max(free, 0)
+local count = limit - free
+local turn
+if count <= 0 then
+    turn = now + window * (math.floor(index / limit) + 1)
+else
+    local slot = index % count
+    local entry = redis.call('ZRANGE', key, slot, slot, 'WITHSCORES')
+    turn = tonumber(entry[2]) + window * (math.floor(index / count) + 1)
+end
+local wait_ms = math.ceil((turn - now) * 1000)
+return -math.max(wait_ms, 0)
+"""
+
 # Return the score (timestamp) of the oldest entry in the sorted set,
 # or -1 if the set is empty.
 _LUA_OLDEST_ENTRY = """
@@ -228,6 +326,7 @@ class RateLimiter:
     _sha_acquire: str = field(default="", init=False, repr=False)
     _sha_check: str = field(default="", init=False, repr=False)
     _sha_oldest: str = field(default="", init=False, repr=False)
+    _sha_in_turn: str = field(default="", init=False, repr=False)
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -269,12 +368,13 @@ class RateLimiter:
         This is called lazily on the first request so that the Redis
         connection is not required at construction time.
         """
-        if self._sha_acquire:
+        if self._sha_acquire and self._sha_in_turn:
             return
         try:
             self._sha_acquire = await self.redis_client.script_load(_LUA_CHECK_AND_ACQUIRE)
             self._sha_check = await self.redis_client.script_load(_LUA_CHECK_ONLY)
             self._sha_oldest = await self.redis_client.script_load(_LUA_OLDEST_ENTRY)
+            self._sha_in_turn = await self.redis_client.script_load(_LUA_ACQUIRE_IN_TURN)
         except Exception:
             logger.exception("Failed to load Lua scripts into Redis")
             raise
@@ -349,6 +449,27 @@ class RateLimiter:
         )
         return float(result)
 
+    def _queue_keys(self, key: str) -> tuple[str, str, str]:
+        """Return the waiter queue, deadline and sequence keys for *key*."""
+        return f"{key}:queue", f"{key}:queue:deadline", f"{key}:queue:seq"
+
+    async def _leave_queue(self, queue_key: str, deadlines_key: str, ticket: str) -> None:
+        """Remove an unserved *ticket* so waiters behind it move up.
+
+        Args:
+            queue_key: Waiter queue key.
+            deadlines_key: Waiter deadline key.
+            ticket: The ticket to remove.
+        """
+        try:
+            await self.redis_client.zrem(queue_key, ticket)
+            await self.redis_client.zrem(deadlines_key, ticket)
+        except Exception:
+            logger.debug(
+                "Failed to remove rate-limit queue ticket",
+                extra={"key": queue_key},
+            )
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
@@ -617,10 +738,16 @@ class RateLimiter:
     ) -> None:
         """Block until a rate-limit slot is available or timeout is reached.
 
-        Polls :meth:`acquire` in a loop, sleeping briefly between attempts.
-        The sleep duration is calculated as ``window_seconds / max_calls``
-        (i.e. the average time between permitted calls) capped at 5 seconds
-        so this never stalls for too long per iteration.
+        Waiters on the same *key* are served in FIFO order: the first call
+        takes a ticket in a Redis queue (``{key}:queue``) and only the first
+        ``max_calls - count`` tickets may acquire.  Every attempt is one Lua
+        call that returns either success or the exact time until the window
+        entry freeing this waiter's slot expires, so waiters sleep precisely
+        that long (capped at 5 seconds, to notice abandoned tickets ahead)
+        and wake one after another rather than as a herd.
+
+        Tickets are removed on success, timeout and cancellation; tickets of
+        crashed workers are dropped once their timeout has passed.
 
         Args:
             key: Fully-qualified Redis key (same convention as
@@ -634,16 +761,67 @@ class RateLimiter:
             RateLimitTimeoutError: If a slot cannot be acquired within
                 *timeout* seconds.
         """
-        deadline = time.monotonic() + timeout
-        sleep_seconds = min(window_seconds / max(max_calls, 1), 5.0)
+        try:
+            await self._ensure_scripts_loaded()
+        except Exception:
+            logger.warning(
+                "Redis unavailable in wait_for_slot() — allowing request without rate limiting",
+                extra={"key": key},
+            )
+            return
 
-        while True:
-            if await self.acquire(key, max_calls, window_seconds):
-                return
-            remaining = deadline - time.monotonic()
-            if remaining <= 0:
-                raise RateLimitTimeoutError(key=key, timeout=timeout)
-            await asyncio.sleep(min(sleep_seconds, remaining))
+        from issue_observatory.core import worker_metrics
+
+        queue_key, deadlines_key, seq_key = self._queue_keys(key)
+        labels = _metric_labels(key)
+        ticket = str(uuid.uuid4())
+        started = time.monotonic()
+        deadline = started + timeout
+        queue_ttl = int(timeout + window_seconds) + 10
+        in_queue = True
+
+        try:
+            while True:
+                now = time.time()
+                try:
+                    result = int(
+                        await self.redis_client.evalsha(  # type: ignore[attr-defined]
+                            self._sha_in_turn,
+                            4,
+                            key,
+                            queue_key,
+                            deadlines_key,
+                            seq_key,
+                            str(now),
+                            str(window_seconds),
+                            str(max_calls),
+                            ticket,
+                            str(window_seconds + 10),
+                            str(now + timeout + 1.0),
+                            str(queue_ttl),
+                        )
+                    )
+                except Exception:
+                    logger.exception(
+                        "Redis error in wait_for_slot() — allowing request",
+                        extra={"key": key},
+                    )
+                    return
+                if result > 0:
+                    in_queue = False
+                    return
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    worker_metrics.rate_limit_timeouts_total.inc(**labels)
+                    raise RateLimitTimeoutError(key=key, timeout=timeout)
+                wait = max(-result / 1000.0, _MIN_WAIT_SECONDS)
+                await asyncio.sleep(min(wait, _MAX_WAIT_SECONDS, remaining))
+        finally:
+            worker_metrics.rate_limit_wait_seconds.observe(
+                time.monotonic() - started, **labels
+            )
+            if in_queue:
+                await self._leave_queue(queue_key, deadlines_key, ticket)
 
     async def reset(
         self,
@@ -690,6 +868,10 @@ async def get_redis_client() -> aioredis.Redis:
     ``redis://localhost:6379/0`` if settings are not yet initialised (e.g.
     during early bootstrapping or tests).
 
+    On the worker runtime loop the process-wide shared client is returned
+    (see :func:`~issue_observatory.workers.runtime.shared_redis`); callers
+    must not close it.
+
     Returns:
         A connected :class:`redis.asyncio.Redis` instance.
     """
@@ -704,6 +886,13 @@ async def get_redis_client() -> aioredis.Redis:
             "Could not load settings — using default Redis URL: %s", redis_url
         )
 
+    from issue_observatory.workers.runtime import on_runtime_loop, shared_redis
+
+    if on_runtime_loop():
+        shared = shared_redis(redis_url)
+        if shared is not None:
+            return shared
+
     client: aioredis.Redis = aioredis.from_url(
         redis_url,
         encoding="utf-8",
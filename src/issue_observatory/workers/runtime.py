@@ -0,0 +1,267 @@
+"""Persistent per-process asyncio runtime for Celery workers.
+
+Celery task bodies are synchronous, so arena and orchestration tasks used to
+drive their coroutines with ``asyncio.run()``.  Every call created a new event
+loop, and everything bound to a loop had to be rebuilt with it: the asyncpg
+connections in the async engine's pool (disposed after every task), a Redis
+client per call and an httpx connection pool per collector.  For short tasks
+connection setup dominated the run time.
+
+This module keeps one event loop per worker process, running forever in a
+daemon thread, and runs coroutines on it with :func:`run_async`::
+
+    from issue_observatory.workers.runtime import run_async
+
+    records = run_async(collector.collect_by_terms(terms=terms, tier=tier))
+
+Because the loop outlives individual tasks, the async engine's pool stays
+valid between tasks, and two process-wide clients are shared by every task:
+
+- :func:`shared_redis` — one ``redis.asyncio`` client (with its connection
+  pool) per Redis URL.  Callers must not close it.
+- :func:`shared_http_transport` — one keep-alive httpx transport that
+  collectors pass to the clients they build, so connections to the same API
+  host are reused across tasks.  Closing a client built on it leaves the
+  transport open.
+
+Both are only handed out inside a worker process whose runtime is running;
+elsewhere (FastAPI, scripts, tests) they return ``None`` and callers build
+their own short-lived clients as before.
+
+The runtime is started on ``worker_process_init`` and closed on
+``worker_process_shutdown`` (see ``celery_app.py``).  :func:`run_async` also
+starts it lazily.  The loop thread does not survive ``fork()``, so a child
+process always gets a fresh loop and fresh clients.
+
+Unlike ``asyncio.run()``, background tasks a coroutine spawns without
+awaiting are not cancelled when :func:`run_async` returns.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+from typing import TYPE_CHECKING, Any, TypeVar
+
+import httpx
+
+if TYPE_CHECKING:
+    from collections.abc import Coroutine
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+#: Connection limits of the shared httpx transport.
+_HTTP_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=60.0,
+)
+
+#: Seconds :func:`shutdown_runtime` waits for pooled clients to close.
+_SHUTDOWN_TIMEOUT_SECONDS = 10.0
+
+_lock = threading.Lock()
+_loop: asyncio.AbstractEventLoop | None = None
+_thread: threading.Thread | None = None
+_pid: int | None = None
+_redis_clients: dict[str, Any] = {}
+_http_transport: _SharedTransport | None = None
+
+
+class _SharedTransport(httpx.AsyncHTTPTransport):
+    """Keep-alive transport owned by the runtime, not by the clients using it.
+
+    ``httpx.AsyncClient`` closes its transport on ``aclose()`` and on leaving
+    ``async with``; both are no-ops here so collectors keep their usual
+    client lifecycle.  The runtime closes the pool on shutdown.
+    """
+
+    async def __aenter__(self) -> _SharedTransport:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+    async def aclose(self) -> None:
+        return None
+
+    async def close_pool(self) -> None:
+        await super().aclose()
+
+
+def _active() -> bool:
+    """Return ``True`` if this process's runtime loop is running."""
+    return _loop is not None and _pid == os.getpid() and not _loop.is_closed()
+
+
+def _serve(loop: asyncio.AbstractEventLoop) -> None:
+    asyncio.set_event_loop(loop)
+    loop.run_forever()
+
+
+def start_runtime() -> asyncio.AbstractEventLoop:
+    """Start this process's runtime loop if it is not already running.
+
+    State inherited from a parent process is discarded: its loop thread did
+    not survive ``fork()`` and its clients hold the parent's sockets.
+
+    Returns:
+        The runtime event loop.
+    """
+    global _loop, _thread, _pid, _http_transport
+    with _lock:
+        if _active():
+            return _loop  # type: ignore[return-value]
+        _redis_clients.clear()
+        _http_transport = None
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(
+            target=_serve, args=(loop,), name="worker-runtime", daemon=True
+        )
+        thread.start()
+        _loop, _thread, _pid = loop, thread, os.getpid()
+    logger.debug("worker runtime: event loop started in pid=%d", _pid)
+    return loop
+
+
+def run_async(coro: Coroutine[Any, Any, _T]) -> _T:
+    """Run *coro* on the runtime loop and return its result.
+
+    Drop-in replacement for ``asyncio.run()`` in synchronous task bodies.
+    Context variables of the calling thread (e.g. structlog bindings) are
+    visible to the coroutine.  If waiting is interrupted — for example by
+    Celery's ``SoftTimeLimitExceeded`` — the coroutine is cancelled and the
+    exception re-raised.
+
+    Args:
+        coro: Coroutine to run.
+
+    Returns:
+        The coroutine's return value.
+
+    Raises:
+        RuntimeError: If called from a running event loop.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        coro.close()
+        raise RuntimeError("run_async() cannot be called from a running event loop")
+
+    future = asyncio.run_coroutine_threadsafe(coro, start_runtime())
+    try:
+        return future.result()
+    except BaseException:
+        future.cancel()
+        raise
+
+
+def on_runtime_loop() -> bool:
+    """Return ``True`` if the caller is running on this process's runtime loop."""
+    if not _active():
+        return False
+    try:
+        return asyncio.get_running_loop() is _loop
+    except RuntimeError:
+        return False
+
+
+def shared_redis(redis_url: str) -> Any | None:
+    """Return the process-wide async Redis client for *redis_url*.
+
+    The client connects lazily, so it may be created from a synchronous task
+    body, but it must only be awaited inside :func:`run_async`.
+
+    Args:
+        redis_url: Redis connection URL.
+
+    Returns:
+        A :class:`redis.asyncio.Redis` instance, or ``None`` if the runtime
+        is not running in this process.
+    """
+    if not _active():
+        return None
+    with _lock:
+        client = _redis_clients.get(redis_url)
+        if client is None:
+            import redis.asyncio as aioredis
+
+            client = aioredis.from_url(redis_url, encoding="utf-8", decode_responses=True)
+            _redis_clients[redis_url] = client
+    return client
+
+
+def shared_http_transport() -> httpx.AsyncBaseTransport | None:
+    """Return the process-wide keep-alive transport for collector HTTP clients.
+
+    Pass the result as ``transport=`` when building an
+    :class:`httpx.AsyncClient`; ``None`` keeps httpx's default transport.
+
+    Returns:
+        The shared transport when called on the runtime loop, otherwise
+        ``None``.
+    """
+    global _http_transport
+    if not on_runtime_loop():
+        return None
+    if _http_transport is None:
+        _http_transport = _SharedTransport(limits=_HTTP_LIMITS, retries=0)
+    return _http_transport
+
+
+async def _close_clients(clients: list[Any], transport: _SharedTransport | None) -> None:
+    for client in clients:
+        try:
+            await client.aclose()
+        except Exception:
+            logger.debug("worker runtime: failed to close Redis client", exc_info=True)
+    if transport is not None:
+        try:
+            await transport.close_pool()
+        except Exception:
+            logger.debug("worker runtime: failed to close HTTP transport", exc_info=True)
+    try:
+        from issue_observatory.core import database as _db
+
+        await _db.async_engine.dispose()
+    except Exception:
+        logger.debug("worker runtime: failed to dispose async engine", exc_info=True)
+
+
+def shutdown_runtime() -> None:
+    """Close the pooled clients and stop this process's runtime loop.
+
+    Safe to call when the runtime was never started.
+    """
+    global _loop, _thread, _pid, _http_transport
+    with _lock:
+        if not _active():
+            _loop = _thread = _pid = None
+            _redis_clients.clear()
+            _http_transport = None
+            return
+        loop: asyncio.AbstractEventLoop = _loop  # type: ignore[assignment]
+        thread: threading.Thread = _thread  # type: ignore[assignment]
+        clients = list(_redis_clients.values())
+        transport = _http_transport
+        _loop = _thread = _pid = None
+        _redis_clients.clear()
+        _http_transport = None
+
+    try:
+        asyncio.run_coroutine_threadsafe(_close_clients(clients, transport), loop).result(
+            timeout=_SHUTDOWN_TIMEOUT_SECONDS
+        )
+    except Exception:
+        logger.warning("worker runtime: pooled clients did not close cleanly", exc_info=True)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=_SHUTDOWN_TIMEOUT_SECONDS)
+    if not loop.is_running():
+        loop.close()
+    logger.debug("worker runtime: event loop stopped")
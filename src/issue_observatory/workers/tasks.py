@@ -15,7 +15,8 @@ are driven by the Celery Beat schedule in ``workers/beat_schedule.py``:
   configured GDPR retention window.
 
 All tasks are synchronous Celery tasks that bridge to async DB operations via
-``asyncio.run()``.  Async DB helpers live in ``workers._task_helpers`` to
+``run_async()``, which runs them on the worker's persistent event loop (see
+``workers/runtime.py``).  Async DB helpers live in ``workers._task_helpers`` to
 keep this file under 400 lines.
 
 Error handling policy: each task catches all exceptions at the outermost
@@ -31,6 +32,7 @@ Task names must match the references in ``workers/beat_schedule.py``::
     issue_observatory.workers.tasks.settle_pending_credits
     issue_observatory.workers.tasks.cleanup_stale_runs
     issue_observatory.workers.tasks.enforce_retention_policy
+    issue_observatory.workers.tasks.advance_brightdata_snapshots
 """
 
 from __future__ import annotations
@@ -38,6 +40,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
@@ -46,6 +49,7 @@ import structlog
 from celery.exceptions import Retry
 
 from issue_observatory.config.settings import get_settings
+from issue_observatory.core import worker_metrics
 from issue_observatory.core.email_service import get_email_service
 from issue_observatory.core.schemas.query_design import parse_language_codes
 from issue_observatory.workers._enrichment_helpers import (
@@ -55,6 +59,11 @@ from issue_observatory.workers._enrichment_helpers import (
     fetch_unenriched_for_url_extraction,
     write_enrichment,
     write_enrichment_batch,
+    write_enrichments_batch,
+)
+from issue_observatory.workers._completion_helpers import (
+    COMPLETION_SWEEP_SECONDS,
+    clear_completion_check,
 )
 from issue_observatory.workers._task_helpers import (
     check_all_tasks_terminal,
@@ -74,6 +83,8 @@ from issue_observatory.workers._task_helpers import (
     fetch_unsettled_reservations,
     filter_new_actors,
     filter_new_terms,
+    finalize_run_status,
+    invalidate_analysis_cache,
     mark_runs_failed,
     mark_task_failed,
     read_source_list_from_arenas_config,
@@ -82,6 +93,7 @@ from issue_observatory.workers._task_helpers import (
     suspend_run,
 )
 from issue_observatory.workers.celery_app import celery_app
+from issue_observatory.workers.runtime import run_async
 
 logger = structlog.get_logger(__name__)
 _stdlib_logger = logging.getLogger(__name__)
@@ -151,7 +163,10 @@ def trigger_daily_collection(self: Any) -> dict[str, Any]:
     2. If the balance is zero or negative: sends a low-credit warning email,
        suspends the run (``status='suspended'``), and skips dispatch.
     3. Otherwise, dispatches a ``collect_by_terms`` Celery task for each
-       arena listed in the design's ``arenas_config``.
+       arena listed in the design's ``arenas_config``.  With
+       ``Settings.live_streaming_enabled``, arenas that support live
+       streaming are instead served by one ``stream_live`` task per arena
+       covering every design.
 
     Retries up to three times (60-second countdown) on transient DB errors.
 
@@ -162,11 +177,9 @@ def trigger_daily_collection(self: Any) -> dict[str, Any]:
     log = logger.bind(task="trigger_daily_collection")
     log.info("trigger_daily_collection: starting")
 
-    # Single asyncio.run() for ALL async DB queries.  Multiple asyncio.run()
-    # calls cause "Future attached to a different loop" errors because the
-    # SQLAlchemy async connection pool ties connections to the first event loop.
+    # Single run_async() for ALL async DB queries.
     try:
-        designs = asyncio.run(fetch_designs_with_prep())
+        designs = run_async(fetch_designs_with_prep())
     except Exception as exc:
         log.error(
             "trigger_daily_collection: DB error fetching designs",
@@ -182,6 +195,8 @@ def trigger_daily_collection(self: Any) -> dict[str, Any]:
 
     dispatched = 0
     skipped = 0
+    # Arenas served by one stream for all designs: task module -> subscriptions.
+    live_streams: dict[str, list[dict[str, Any]]] = {}
 
     for design in designs:
         design_id = design["query_design_id"]
@@ -235,7 +250,7 @@ def trigger_daily_collection(self: Any) -> dict[str, Any]:
                 await suspend_run(_run_id)
 
             try:
-                asyncio.run(_suspend_with_email())
+                run_async(_suspend_with_email())
             except Exception as suspend_exc:
                 task_log.error(
                     "trigger_daily_collection: failed to suspend run",
@@ -406,6 +421,30 @@ def trigger_daily_collection(self: Any) -> dict[str, Any]:
                     )
                     continue
 
+                # --- Live stream instead of a daily search (see stream_live) ---
+                if settings.live_streaming_enabled and getattr(
+                    _collector_cls, "supports_live_stream", False
+                ):
+                    _stream_actors: list[str] = []
+                    if _config_key and _supports_actors:
+                        _stream_actors = read_source_list_from_arenas_config(
+                            raw_arenas_config, arena_name, _config_key
+                        )
+                    live_streams.setdefault(_task_module, []).append({
+                        "query_design_id": str(design_id),
+                        "collection_run_id": str(run_id),
+                        "terms": arena_terms,
+                        "actor_ids": _stream_actors,
+                        "language_filter": language_filter,
+                    })
+                    task_log.info(
+                        "trigger_daily_collection: arena served by live stream",
+                        arena=arena_name,
+                        terms_count=len(arena_terms),
+                        actors_count=len(_stream_actors),
+                    )
+                    continue
+
                 # --- Normal term-based dispatch (unchanged) ---
                 _task_name = f"{_task_module}.collect_by_terms"
                 last_collected_map = design.get("last_collected_by_platform", {})
@@ -489,6 +528,26 @@ def trigger_daily_collection(self: Any) -> dict[str, Any]:
 
         dispatched += 1
 
+    for _task_module, subscriptions in live_streams.items():
+        _stream_task = f"{_task_module}.stream_live"
+        try:
+            celery_app.send_task(
+                _stream_task,
+                kwargs={"subscriptions": subscriptions},
+                queue="streaming",
+            )
+            log.info(
+                "trigger_daily_collection: dispatched live stream",
+                task_name=_stream_task,
+                designs_count=len(subscriptions),
+            )
+        except Exception as dispatch_exc:
+            log.error(
+                "trigger_daily_collection: live stream dispatch failed",
+                task_name=_stream_task,
+                error=str(dispatch_exc),
+            )
+
     summary = {
         "designs_processed": len(designs),
         "dispatched": dispatched,
@@ -666,8 +725,7 @@ def settle_pending_credits() -> dict[str, Any]:
     log = logger.bind(task="settle_pending_credits")
     log.info("settle_pending_credits: starting")
 
-    # Use a single asyncio.run() for all async DB work to avoid
-    # asyncpg connection pool / event loop mismatch errors.
+    # Use a single run_async() for all async DB work.
     async def _settle_all() -> tuple[list[dict], int, int]:
         """Fetch and settle all pending reservations in one event loop."""
         _pending = await fetch_unsettled_reservations()
@@ -718,7 +776,7 @@ def settle_pending_credits() -> dict[str, Any]:
         return _pending, _settled, _errors
 
     try:
-        pending, settled_count, error_count = asyncio.run(_settle_all())
+        pending, settled_count, error_count = run_async(_settle_all())
     except Exception as exc:
         log.error(
             "settle_pending_credits: DB error",
@@ -799,8 +857,7 @@ def cleanup_stale_runs() -> dict[str, Any]:
     log = logger.bind(task="cleanup_stale_runs")
     log.info("cleanup_stale_runs: starting")
 
-    # Single asyncio.run() for all async DB work to avoid asyncpg
-    # connection pool / event loop mismatch errors.
+    # Single run_async() for all async DB work.
     async def _cleanup_stale() -> tuple[list[dict], int]:
         _stale = await fetch_stale_runs()
         if not _stale:
@@ -810,7 +867,7 @@ def cleanup_stale_runs() -> dict[str, Any]:
         return _stale, _failed
 
     try:
-        stale, runs_failed = asyncio.run(_cleanup_stale())
+        stale, runs_failed = run_async(_cleanup_stale())
     except Exception as exc:
         log.error(
             "cleanup_stale_runs: DB error",
@@ -867,7 +924,7 @@ def enforce_retention_policy() -> dict[str, Any]:
     log.info("enforce_retention_policy: starting", retention_days=retention_days)
 
     try:
-        deleted = asyncio.run(enforce_retention(retention_days))
+        deleted = run_async(enforce_retention(retention_days))
     except Exception as exc:
         log.error(
             "enforce_retention_policy: error",
@@ -880,6 +937,9 @@ def enforce_retention_policy() -> dict[str, Any]:
             "retention_days": retention_days,
         }
 
+    if deleted:
+        invalidate_analysis_cache(all_data=True)
+
     summary = {"records_deleted": deleted, "retention_days": retention_days}
     log.info("enforce_retention_policy: complete", **summary)
     try:
@@ -960,11 +1020,53 @@ def reconcile_collection_attempts_task() -> dict[str, Any]:
     return result
 
 
+def _write_relational_results(
+    enricher: Any,
+    items: list[tuple[dict, dict]],
+    log: Any,
+    task_name: str,
+) -> None:
+    """Run an enricher's relational writes for one batch of results.
+
+    Enrichers that define ``write_relational_batch`` get the whole batch in
+    one call; if it fails, or the enricher only defines
+    ``write_relational``, records are written one by one so a single bad
+    record does not lose the rest.
+    """
+    if not items:
+        return
+    if hasattr(enricher, "write_relational_batch"):
+        try:
+            enricher.write_relational_batch(items)
+            return
+        except Exception as exc:
+            log.warning(
+                f"{task_name}: write_relational_batch failed — writing per record",
+                enricher=enricher.enricher_name,
+                batch_size=len(items),
+                error=str(exc),
+            )
+    for record, result in items:
+        try:
+            enricher.write_relational(record, result)
+        except Exception as rel_exc:
+            log.warning(
+                f"{task_name}: write_relational failed",
+                record_id=str(record.get("id")),
+                enricher=enricher.enricher_name,
+                error=str(rel_exc),
+            )
+
+
 # ---------------------------------------------------------------------------
 # Task 7: enrich_collection_run
 # ---------------------------------------------------------------------------
 
 
+#: Records fetched, enriched and written per round-trip in enrich_collection_run.
+_ENRICH_PAGE_SIZE = 500
+
+
 @celery_app.task(
     name="issue_observatory.workers.tasks.enrich_collection_run",
     bind=True,
@@ -978,9 +1080,16 @@ def enrich_collection_run(
 ) -> dict[str, Any]:
     """Run content enrichment on all records from a collection run.
 
-    Fetches content records in batches of 100, applies each registered
-    enricher whose ``is_applicable()`` returns True, and writes results
-    into ``raw_metadata.enrichments.{enricher_name}`` via ``jsonb_set``.
+    Pages through the run's content records in keyset order (``id``),
+    prefetching the next page while the current one is processed.  Each
+    page is handed to an
+    :class:`~issue_observatory.analysis.enrichments.EnrichmentPipeline`,
+    which calls every applicable enricher's ``enrich_batch()`` once per page
+    (CPU-bound enrichers optionally in a process pool, see
+    ``Settings.enrichment_process_workers``).  All results for the page are
+    merged into ``raw_metadata.enrichments`` with a single
+    ``UPDATE ... FROM (VALUES ...)``.  When language detection runs, the
+    write of the last page also recomputes the run's content rollup slices.
 
     Enrichers are imported lazily from
     :mod:`issue_observatory.analysis.enrichments` to avoid circular imports
@@ -1013,6 +1122,7 @@ def enrich_collection_run(
     # --- Build enricher registry ---
     from issue_observatory.analysis.enrichments import (
         EngagementScorer,
+        EnrichmentPipeline,
         LanguageDetector,
         NamedEntityExtractor,
         UrlExtractor,
@@ -1046,100 +1156,129 @@ def enrich_collection_run(
     )
 
     # --- Process records in batches ---
+    # Pages are fetched by keyset on id; the next page is prefetched on a
+    # helper thread while the current one is enriched and written.
     records_processed = 0
     enrichments_applied = 0
     error_count = 0
-    offset = 0
-
-    while True:
-        try:
-            batch = fetch_content_records_for_run(run_id, offset=offset)
-        except Exception as exc:
-            log.error(
-                "enrich_collection_run: DB error fetching batch",
-                offset=offset,
-                error=str(exc),
-                exc_info=True,
-            )
+    last_id: Any = None
+    # Detected languages feed the content rollups; the last page's write
+    # recomputes the run's rollup slices in its own transaction.
+    refresh_rollups = any(e.enricher_name == "language_detection" for e in enrichers)
+    rollups_stale = False
+
+    pipeline = EnrichmentPipeline(
+        enrichers, process_workers=settings.enrichment_process_workers
+    )
+    prefetch = ThreadPoolExecutor(max_workers=1, thread_name_prefix="enrich-prefetch")
+    try:
+        pending = prefetch.submit(
+            fetch_content_records_for_run, run_id, None, _ENRICH_PAGE_SIZE
+        )
+        while True:
             try:
-                raise self.retry(countdown=60, exc=exc)
-            except Exception:
-                return {
-                    "records_processed": records_processed,
-                    "enrichments_applied": enrichments_applied,
-                    "error_count": error_count + 1,
-                }
+                batch = pending.result()
+            except Exception as exc:
+                log.error(
+                    "enrich_collection_run: DB error fetching batch",
+                    after_id=str(last_id) if last_id is not None else None,
+                    error=str(exc),
+                    exc_info=True,
+                )
+                try:
+                    raise self.retry(countdown=60, exc=exc)
+                except Exception:
+                    return {
+                        "records_processed": records_processed,
+                        "enrichments_applied": enrichments_applied,
+                        "error_count": error_count + 1,
+                    }
 
-        if not batch:
-            break  # all records consumed
+            if not batch:
+                break  # all records consumed
 
-        log.debug(
-            "enrich_collection_run: processing batch",
-            offset=offset,
-            batch_size=len(batch),
-        )
+            last_id = batch[-1]["id"]
+            has_more = len(batch) >= _ENRICH_PAGE_SIZE
+            if has_more:
+                pending = prefetch.submit(
+                    fetch_content_records_for_run, run_id, last_id, _ENRICH_PAGE_SIZE
+                )
 
-        # Collect results per enricher for batch write
-        enricher_batches: dict[str, list[tuple[str, dict[str, Any]]]] = {
-            e.enricher_name: [] for e in enrichers
-        }
-        relational_queue: list[tuple[Any, dict, dict]] = []
+            log.debug(
+                "enrich_collection_run: processing batch",
+                after_id=str(last_id),
+                batch_size=len(batch),
+            )
 
-        for record in batch:
-            record_id = record.get("id")
-            for enricher in enrichers:
-                if not enricher.is_applicable(record):
-                    continue
-                try:
-                    result = asyncio.run(enricher.enrich(record))
-                    enricher_batches[enricher.enricher_name].append(
-                        (record_id, result)
-                    )
-                    enrichments_applied += 1
-                    if hasattr(enricher, "write_relational"):
-                        relational_queue.append((enricher, record, result))
-                except Exception as exc:
-                    log.error(
-                        "enrich_collection_run: enrichment failed",
-                        record_id=str(record_id),
-                        enricher=enricher.enricher_name,
-                        error=str(exc),
-                        exc_info=True,
+            started = time.perf_counter()
+            outcome = pipeline.run_batch(batch)
+            worker_metrics.enrichment_batch_seconds.observe(
+                time.perf_counter() - started, stage="enrich"
+            )
+            for by_enricher in outcome.results.values():
+                for ename in by_enricher:
+                    worker_metrics.enrichment_records_total.inc(
+                        enricher=ename, outcome="applied"
                     )
-                    error_count += 1
-
-            records_processed += 1
+            for ename, record_id, exc in outcome.errors:
+                worker_metrics.enrichment_records_total.inc(enricher=ename, outcome="failed")
+                log.error(
+                    "enrich_collection_run: enrichment failed",
+                    record_id=str(record_id),
+                    enricher=ename,
+                    error=str(exc),
+                    exc_info=exc,
+                )
+            error_count += len(outcome.errors)
+            records_processed += len(batch)
 
-        # Batch write all enrichment results per enricher
-        for ename, items in enricher_batches.items():
-            if items:
+            # One UPDATE ... FROM (VALUES ...) for every enricher's results.
+            applied = outcome.enrichments_applied
+            if applied:
+                started = time.perf_counter()
                 try:
-                    write_enrichment_batch(ename, items)
+                    write_enrichments_batch(
+                        list(outcome.results.items()),
+                        refresh_run_rollups=(
+                            run_id if refresh_rollups and not has_more else None
+                        ),
+                    )
+                    enrichments_applied += applied
+                    rollups_stale = refresh_rollups and has_more
                 except Exception as exc:
                     log.error(
                         "enrich_collection_run: batch write failed",
-                        enricher=ename,
-                        batch_size=len(items),
+                        batch_size=len(outcome.results),
                         error=str(exc),
                         exc_info=True,
                     )
-                    error_count += len(items)
-                    enrichments_applied -= len(items)
-
-        for enricher, record, result in relational_queue:
-            try:
-                enricher.write_relational(record, result)
-            except Exception as rel_exc:
-                log.warning(
-                    "enrich_collection_run: write_relational failed",
-                    record_id=str(record.get("id")),
-                    enricher=enricher.enricher_name,
-                    error=str(rel_exc),
+                    error_count += applied
+                worker_metrics.enrichment_batch_seconds.observe(
+                    time.perf_counter() - started, stage="write"
                 )
 
-        offset += len(batch)
-        if len(batch) < 500:
-            break  # last partial batch; no more rows
+            relational: dict[Any, list[tuple[dict, dict]]] = {}
+            for enricher, record, result in outcome.relational:
+                relational.setdefault(enricher, []).append((record, result))
+            for enricher, items in relational.items():
+                _write_relational_results(enricher, items, log, "enrich_collection_run")
+
+            worker_metrics.maybe_flush_worker_metrics()
+            if not has_more:
+                break  # last partial batch; no more rows
+    finally:
+        prefetch.shutdown(wait=False, cancel_futures=True)
+        pipeline.close()
+
+    if rollups_stale:
+        # The last page wrote nothing, so its write did not refresh them.
+        try:
+            write_enrichments_batch([], refresh_run_rollups=run_id)
+        except Exception as exc:
+            log.warning("enrich_collection_run: rollup refresh failed", error=str(exc))
+
+    if enrichments_applied:
+        invalidate_analysis_cache(run_id)
 
     # -----------------------------------------------------------------------
     # SB-03: Post-Collection Discovery Notification
@@ -1154,7 +1293,7 @@ def enrich_collection_run(
             get_discovery_summary,
         )
 
-        discovery_summary = asyncio.run(get_discovery_summary(run_id))
+        discovery_summary = run_async(get_discovery_summary(run_id))
         if discovery_summary:
             # Emit via event bus for SSE consumers
             try:
@@ -1284,7 +1423,7 @@ def check_volume_spikes_task(
         return {"spikes": [], "spike_count": 0, "error": str(exc)}
 
     try:
-        spikes = asyncio.run(
+        spikes = run_async(
             run_spike_detection(
                 collection_run_id=run_uuid,
                 query_design_id=design_uuid,
@@ -1365,9 +1504,8 @@ async def _dispatch_batch_async(
 ) -> dict[str, Any]:
     """Inner async function that performs all DB operations in one event loop.
 
-    This consolidates all async DB calls into a single asyncio.run() to avoid
-    event loop corruption from multiple asyncio.run() invocations in the same
-    Celery task (Bug 1 fix).
+    This consolidates all async DB calls into a single run_async() call
+    (Bug 1 fix).
 
     Args:
         run_uuid: Parsed UUID of the CollectionRun.
@@ -1383,6 +1521,7 @@ async def _dispatch_batch_async(
         - language_filter: List of language codes
         - arena_entries: List of dicts for create_collection_tasks
         - no_arenas_dispatched: bool flag for completion handling
+        - coverage_plan: CoveragePlan for coverage-checking arenas, or None
     """
     from issue_observatory.arenas.registry import (
         autodiscover,
@@ -1507,6 +1646,8 @@ async def _dispatch_batch_async(
     actor_only_arenas: set[str] = set()
     # Maps platform_name -> source_list_config_key (None if the arena has no source list).
     arena_source_list_keys: dict[str, str | None] = {}
+    # Arenas whose tasks consult the coverage checker (planned in Step 7b).
+    coverage_arenas: set[str] = set()
     skipped = 0
 
     for platform_name in arenas_config:
@@ -1550,6 +1691,9 @@ async def _dispatch_batch_async(
             collector_cls, "source_list_config_key", None
         )
 
+        if getattr(collector_cls, "supports_coverage_check", False):
+            coverage_arenas.add(platform_name)
+
     # --- Step 6: Create CollectionTask rows ---
     if arena_entries:
         await create_collection_tasks(run_uuid, arena_entries)
@@ -1762,6 +1906,34 @@ async def _dispatch_batch_async(
                         error=str(mark_exc),
                     )
 
+    # --- Step 7b: Plan coverage for every arena input in one batch ---
+    # Resolving the full platform x inputs matrix here costs a few grouped
+    # queries per platform instead of one or two queries per term/actor in
+    # every arena task.  Tasks receive their gaps as the ``coverage_gaps``
+    # kwarg; without a plan they fall back to checking coverage themselves.
+    coverage_plan = None
+    if date_from and date_to and coverage_arenas:
+        from issue_observatory.core.coverage_checker import plan_coverage
+
+        try:
+            coverage_plan = await asyncio.to_thread(
+                plan_coverage,
+                date_from,
+                date_to,
+                terms_by_platform={
+                    pn: terms for pn, terms in arena_terms_map.items() if pn in coverage_arenas
+                },
+                actors_by_platform={
+                    pn: actors for pn, actors in arena_actors_map.items() if pn in coverage_arenas
+                },
+            )
+        except Exception as plan_exc:
+            log.warning(
+                "dispatch_batch_collection: coverage planning failed; "
+                "arena tasks will check coverage themselves",
+                error=str(plan_exc),
+            )
+
     # --- Step 8: Handle no-arenas case ---
     # An arena is dispatchable if it has terms (term-based) OR actor IDs (actor-only
     # or dual-mode with a source list).
@@ -1794,6 +1966,7 @@ async def _dispatch_batch_async(
         "date_from": date_from,
         "date_to": date_to,
         "default_tier": default_tier,
+        "coverage_plan": coverage_plan,
     }
 
 
@@ -1815,7 +1988,8 @@ def dispatch_batch_collection(self: Any, run_id: str) -> dict[str, Any]:
     3. Autodiscover all registered arenas.
     4. For each arena in ``arenas_config``, filter search terms (YF-01),
        create a ``CollectionTask`` row, and dispatch the arena task.
-    5. Schedule ``check_batch_completion`` to monitor completion.
+    5. Schedule the ``check_batch_completion`` safety sweep.  Completion is
+       normally detected earlier, when the last arena task ends.
 
     Args:
         run_id: UUID string of the CollectionRun to dispatch.
@@ -1829,10 +2003,10 @@ def dispatch_batch_collection(self: Any, run_id: str) -> dict[str, Any]:
     log = logger.bind(task="dispatch_batch_collection", run_id=run_id)
     log.info("dispatch_batch_collection: starting")
 
-    # --- Single asyncio.run() call to avoid event loop corruption (Bug 1 fix) ---
+    # --- Single run_async() call for all async DB work (Bug 1 fix) ---
     try:
         run_uuid = _uuid.UUID(run_id)
-        async_result = asyncio.run(_dispatch_batch_async(run_uuid, run_id, log))
+        async_result = run_async(_dispatch_batch_async(run_uuid, run_id, log))
     except Exception as exc:
         log.error(
             "dispatch_batch_collection: async operations failed",
@@ -1853,6 +2027,7 @@ def dispatch_batch_collection(self: Any, run_id: str) -> dict[str, Any]:
 
     # Unpack async results
     public_figure_ids = async_result["public_figure_ids"]
+    coverage_plan = async_result["coverage_plan"]
     arena_terms_map = async_result["arena_terms_map"]
     arena_actors_map: dict[str, list[str]] = async_result["arena_actors_map"]
     actor_only_arenas: set[str] = async_result["actor_only_arenas"]
@@ -1903,6 +2078,10 @@ def dispatch_batch_collection(self: Any, run_id: str) -> dict[str, Any]:
                 "tier": tier,
                 "public_figure_ids": public_figure_ids,
             }
+            if coverage_plan is not None and platform_name in coverage_plan.platforms:
+                task_kwargs["coverage_gaps"] = coverage_plan.task_gaps(
+                    platform_name, actor_ids=actor_ids
+                )
             if date_from:
                 task_kwargs["date_from"] = (
                     date_from.isoformat() if hasattr(date_from, "isoformat") else str(date_from)
@@ -1990,6 +2169,10 @@ def dispatch_batch_collection(self: Any, run_id: str) -> dict[str, Any]:
                     "language_filter": language_filter,
                     "public_figure_ids": public_figure_ids,
                 }
+                if coverage_plan is not None and platform_name in coverage_plan.platforms:
+                    task_kwargs["coverage_gaps"] = coverage_plan.task_gaps(
+                        platform_name, terms=arena_terms
+                    )
                 if date_from:
                     task_kwargs["date_from"] = (
                         date_from.isoformat() if hasattr(date_from, "isoformat") else str(date_from)
@@ -2060,6 +2243,10 @@ def dispatch_batch_collection(self: Any, run_id: str) -> dict[str, Any]:
                     "tier": tier,
                     "public_figure_ids": public_figure_ids,
                 }
+                if coverage_plan is not None and platform_name in coverage_plan.platforms:
+                    actors_task_kwargs["coverage_gaps"] = coverage_plan.task_gaps(
+                        platform_name, actor_ids=dual_mode_actor_ids
+                    )
                 if date_from:
                     actors_task_kwargs["date_from"] = (
                         date_from.isoformat() if hasattr(date_from, "isoformat") else str(date_from)
@@ -2102,7 +2289,7 @@ def dispatch_batch_collection(self: Any, run_id: str) -> dict[str, Any]:
                     )
 
     # --- Update CollectionTask rows with celery_task_ids ---
-    # Uses sync DB session to avoid event-loop issues from repeated asyncio.run().
+    # Uses a sync DB session: the async work above has already finished.
     if task_id_updates:
         try:
             from sqlalchemy import text as _text
@@ -2134,15 +2321,17 @@ def dispatch_batch_collection(self: Any, run_id: str) -> dict[str, Any]:
                 error=str(update_exc),
             )
 
-    # --- Schedule completion checker or emit completion event ---
+    # --- Schedule completion safety sweep or emit completion event ---
+    # Arena tasks request an immediate completion check when they end (see
+    # _completion_helpers); the sweep only catches tasks whose workers died.
     if dispatched_arenas:
         check_batch_completion.apply_async(
             kwargs={"run_id": run_id},
-            countdown=15,
+            countdown=COMPLETION_SWEEP_SECONDS,
         )
         log.info(
-            "dispatch_batch_collection: scheduled completion checker",
-            check_delay_seconds=15,
+            "dispatch_batch_collection: scheduled completion safety sweep",
+            check_delay_seconds=COMPLETION_SWEEP_SECONDS,
         )
     elif no_arenas_dispatched:
         # Already marked completed in async function; just emit the event
@@ -2183,8 +2372,7 @@ def dispatch_batch_collection(self: Any, run_id: str) -> dict[str, Any]:
 async def _check_batch_async(run_uuid: Any) -> dict[str, Any] | None:
     """Single async context for check_batch_completion DB operations.
 
-    Consolidates all async DB calls into one event loop to avoid asyncpg
-    connection pool corruption from multiple asyncio.run() calls.
+    Consolidates all async DB calls into one ``run_async()`` call.
 
     Also performs early comment triggering: checks which comment-enabled
     platforms have their post tasks completed and returns the list of
@@ -2242,37 +2430,44 @@ async def _check_batch_async(run_uuid: Any) -> dict[str, Any] | None:
         final_status = "completed"
         error_msg = None
 
-    await set_run_status(
+    result["finalized"] = await finalize_run_status(
         run_uuid,
         final_status,
-        completed_at=True,
         error_log=error_msg,
     )
-
     result["final_status"] = final_status
     result["error_msg"] = error_msg
     return result
 
 
-_CHECK_BATCH_MAX_ATTEMPTS: int = 480
-"""Maximum number of check_batch_completion re-schedules (~2 hours at 15s intervals)."""
+_CHECK_BATCH_MAX_ATTEMPTS: int = 24
+"""Maximum number of safety-sweep re-schedules (~2 hours at COMPLETION_SWEEP_SECONDS)."""
 
 
 @celery_app.task(
     name="issue_observatory.workers.tasks.check_batch_completion",
 )
-def check_batch_completion(run_id: str, attempt: int = 1) -> dict[str, Any]:
+def check_batch_completion(
+    run_id: str,
+    attempt: int = 1,
+    sweep: bool = True,
+) -> dict[str, Any]:
     """Check whether all arena tasks for a batch run have finished.
 
-    Polls the ``collection_tasks`` table to see if every task has reached
-    a terminal state (``completed`` or ``failed``).  If not all done,
-    re-schedules itself with a 15-second countdown, up to
-    ``_CHECK_BATCH_MAX_ATTEMPTS`` (480 checks, ~2 hours).
+    Reads the ``collection_tasks`` table to see if every task has reached
+    a terminal state (``completed`` or ``failed``).  Runs in two modes:
 
-    After exceeding the max attempts, forces the run to ``failed`` status
-    to prevent infinite polling.
+    - **Event-driven** (``sweep=False``): requested whenever an arena task of
+      the run ends (see ``workers/_completion_helpers.py``).  Does not
+      re-schedule itself; the next arena task to end requests the next check.
+      Only a DB error re-schedules it, again as an event-driven check.
+    - **Safety sweep** (``sweep=True``): scheduled by
+      ``dispatch_batch_collection`` and re-scheduled every
+      ``COMPLETION_SWEEP_SECONDS`` up to ``_CHECK_BATCH_MAX_ATTEMPTS``
+      (~2 hours) to catch tasks whose workers died.  After exceeding the max
+      attempts, forces the run to ``failed`` status.
 
-    When all tasks are terminal:
+    When all tasks are terminal, the first check to finalize the run:
     1. Sets the run status to ``completed`` (or ``failed`` if all tasks failed).
     2. Sets ``completed_at`` on the run.
     3. Publishes a ``run_complete`` SSE event.
@@ -2280,19 +2475,27 @@ def check_batch_completion(run_id: str, attempt: int = 1) -> dict[str, Any]:
 
     Args:
         run_id: UUID string of the CollectionRun to check.
-        attempt: Current attempt number (1-indexed, auto-incremented).
+        attempt: Current sweep attempt number (1-indexed, auto-incremented).
+        sweep: ``False`` for event-driven checks.
 
     Returns:
         Dict with ``status``, ``total_tasks``, ``completed``, ``failed``.
     """
     import uuid as _uuid
 
-    log = logger.bind(task="check_batch_completion", run_id=run_id, attempt=attempt)
+    log = logger.bind(
+        task="check_batch_completion", run_id=run_id, attempt=attempt, sweep=sweep
+    )
+
+    if not sweep:
+        # Re-arm before reading the DB so that a task ending from now on
+        # requests another check instead of relying on this one.
+        clear_completion_check(run_id, settings.redis_url)
 
-    # Single asyncio.run() call for all DB operations
+    # Single run_async() call for all DB operations
     try:
         run_uuid = _uuid.UUID(run_id)
-        result = asyncio.run(_check_batch_async(run_uuid))
+        result = run_async(_check_batch_async(run_uuid))
     except Exception as exc:
         log.error(
             "check_batch_completion: DB error — will retry",
@@ -2301,11 +2504,13 @@ def check_batch_completion(run_id: str, attempt: int = 1) -> dict[str, Any]:
         )
         # Re-schedule instead of silently returning.  DB errors (e.g.
         # connection pool exhaustion from zombie tasks) are transient;
-        # giving up here leaves the run stuck as "running" forever.
+        # giving up here leaves the run stuck as "running" forever.  An
+        # event-driven check retries as event-driven so it does not start a
+        # second sweep chain next to the one dispatch already scheduled.
         if attempt < _CHECK_BATCH_MAX_ATTEMPTS:
             check_batch_completion.apply_async(
-                kwargs={"run_id": run_id, "attempt": attempt + 1},
-                countdown=15,
+                kwargs={"run_id": run_id, "attempt": attempt + 1, "sweep": sweep},
+                countdown=COMPLETION_SWEEP_SECONDS if sweep else 15,
             )
             return {"status": "db_error_retry", "error": str(exc), "attempt": attempt}
         return {"status": "db_error_max_attempts", "error": str(exc)}
@@ -2344,6 +2549,8 @@ def check_batch_completion(run_id: str, attempt: int = 1) -> dict[str, Any]:
             )
 
     if not result["all_done"]:
+        if not sweep:
+            return {"status": "waiting", **result}
         if attempt >= _CHECK_BATCH_MAX_ATTEMPTS:
             log.error(
                 "check_batch_completion: max attempts reached — forcing run to failed",
@@ -2351,13 +2558,13 @@ def check_batch_completion(run_id: str, attempt: int = 1) -> dict[str, Any]:
                 max_attempts=_CHECK_BATCH_MAX_ATTEMPTS,
                 remaining=result["total"] - result["completed"] - result["failed"],
             )
-            asyncio.run(set_run_status(
+            run_async(set_run_status(
                 _uuid.UUID(run_id),
                 "failed",
                 completed_at=True,
                 error_log=(
                     f"Batch completion checker exceeded {_CHECK_BATCH_MAX_ATTEMPTS} "
-                    f"attempts (~{_CHECK_BATCH_MAX_ATTEMPTS * 15 // 60} min). "
+                    f"sweeps (~{_CHECK_BATCH_MAX_ATTEMPTS * COMPLETION_SWEEP_SECONDS // 60} min). "
                     f"Completed: {result['completed']}/{result['total']}, "
                     f"Failed: {result['failed']}/{result['total']}."
                 ),
@@ -2384,11 +2591,16 @@ def check_batch_completion(run_id: str, attempt: int = 1) -> dict[str, Any]:
         )
         check_batch_completion.apply_async(
             kwargs={"run_id": run_id, "attempt": attempt + 1},
-            countdown=15,
+            countdown=COMPLETION_SWEEP_SECONDS,
         )
         return {"status": "waiting", **result}
 
     # --- All tasks terminal: finalize ---
+    if not result["finalized"]:
+        # Another check (event-driven or sweep) already finalized the run.
+        log.debug("check_batch_completion: run already finalized")
+        return {"status": "already_finalized", "total_tasks": result["total"]}
+
     final_status = result["final_status"]
     total_records = result["total_records"]
     credits_spent = result["credits_spent"]
@@ -2477,9 +2689,7 @@ async def _trigger_comments_async(
 ) -> dict[str, Any]:
     """Single async context for all comment-collection DB operations.
 
-    Consolidates every async call into one event loop to avoid the asyncpg
-    ``attached to a different loop`` error that occurs when ``asyncio.run()``
-    is called multiple times within one Celery task.
+    Consolidates every async call into one ``run_async()`` call.
 
     Args:
         collection_run_id: UUID string of the collection run.
@@ -2641,8 +2851,8 @@ def trigger_comment_collection(
     Loads the project's ``comments_config``, queries for qualifying posts,
     creates ``CollectionTask`` rows, and dispatches per-platform Celery tasks.
 
-    All async DB operations are consolidated into a single ``asyncio.run()``
-    call to avoid asyncpg event-loop contamination.
+    All async DB operations are consolidated into a single ``run_async()``
+    call.
     """
     log = logger.bind(
         task="trigger_comment_collection",
@@ -2651,9 +2861,9 @@ def trigger_comment_collection(
     )
     log.info("trigger_comment_collection: starting")
 
-    # --- Single asyncio.run() for all DB operations ---
+    # --- Single run_async() for all DB operations ---
     try:
-        result = asyncio.run(
+        result = run_async(
             _trigger_comments_async(collection_run_id, log, only_platforms=only_platforms)
         )
     except Exception as exc:
@@ -2665,7 +2875,7 @@ def trigger_comment_collection(
         # Early return from async function (no project, no config, etc.)
         return result
 
-    # --- Sync Celery dispatch (outside asyncio.run) ---
+    # --- Sync Celery dispatch (outside run_async) ---
     platforms_dispatched = 0
     total_posts = 0
 
@@ -2835,28 +3045,26 @@ def enrich_all_pending(
             batch_items: list[tuple[str, dict[str, Any]]] = []
             relational_queue: list[tuple[dict, dict]] = []
 
-            for record in batch:
+            applicable = [r for r in batch if enricher.is_applicable(r)]
+            e_records += len(batch)
+            results = run_async(enricher.enrich_batch(applicable)) if applicable else []
+            for record, result in zip(applicable, results, strict=True):
                 record_id = record.get("id")
-                if not enricher.is_applicable(record):
-                    e_records += 1
-                    continue
-                try:
-                    result = asyncio.run(enricher.enrich(record))
-                    batch_items.append((record_id, result))
-                    e_applied += 1
-                    # Queue relational writes for after the batch commit
-                    if hasattr(enricher, "write_relational"):
-                        relational_queue.append((record, result))
-                except Exception as exc:
+                if isinstance(result, Exception):
                     log.error(
                         "enrich_all_pending: enrichment failed",
                         record_id=str(record_id),
                         enricher=ename,
-                        error=str(exc),
-                        exc_info=True,
+                        error=str(result),
+                        exc_info=result,
                     )
                     e_errors += 1
-                e_records += 1
+                    continue
+                batch_items.append((record_id, result))
+                e_applied += 1
+                # Queue relational writes for after the batch commit
+                if hasattr(enricher, "write_relational"):
+                    relational_queue.append((record, result))
 
             # Batch write all enrichment results in one transaction
             if batch_items:
@@ -2874,16 +3082,7 @@ def enrich_all_pending(
                     e_applied -= len(batch_items)
 
             # Write relational data (e.g. extracted_urls rows)
-            for record, result in relational_queue:
-                try:
-                    enricher.write_relational(record, result)
-                except Exception as rel_exc:
-                    log.warning(
-                        "enrich_all_pending: write_relational failed",
-                        record_id=str(record.get("id")),
-                        enricher=ename,
-                        error=str(rel_exc),
-                    )
+            _write_relational_results(enricher, relational_queue, log, "enrich_all_pending")
 
             offset += len(batch)
             if len(batch) < 500:
@@ -2905,6 +3104,9 @@ def enrich_all_pending(
         total_enrichments_applied += e_applied
         total_error_count += e_errors
 
+    if total_enrichments_applied:
+        invalidate_analysis_cache(all_data=True)
+
     summary: dict[str, Any] = {
         "records_processed": total_records_processed,
         "enrichments_applied": total_enrichments_applied,
@@ -2951,8 +3153,9 @@ def refit_engagement_scalers(
     """Weekly task: fit per-platform engagement scalers from actual data.
 
     Samples engagement data per platform, fits Yeo-Johnson + MinMaxScaler
-    transformers, and persists parameters to the ``engagement_scalers`` table.
-    Requires ``scikit-learn`` and ``numpy``.
+    transformers, persists parameters to the ``engagement_scalers`` table and
+    rescores the ``engagement_score`` column of every record of each fitted
+    platform.  Requires ``scikit-learn`` and ``numpy``.
 
     Returns:
         Dict with per-platform fitting results.
@@ -2969,13 +3172,20 @@ def refit_engagement_scalers(
         results = fit_engagement_scalers()
         fitted_count = sum(1 for v in results.values() if v.get("status") == "fitted")
         skipped_count = sum(1 for v in results.values() if v.get("status") == "skipped")
+        rescored_count = sum(v.get("rescored", 0) for v in results.values())
         log.info(
             "refit_engagement_scalers: complete",
             fitted=fitted_count,
             skipped=skipped_count,
+            rescored=rescored_count,
             duration_seconds=round(time.perf_counter() - _task_start, 1),
         )
-        return {"fitted": fitted_count, "skipped": skipped_count, "details": results}
+        return {
+            "fitted": fitted_count,
+            "skipped": skipped_count,
+            "rescored": rescored_count,
+            "details": results,
+        }
     except Exception as exc:
         log.error(
             "refit_engagement_scalers: failed",
@@ -3054,7 +3264,7 @@ def backfill_url_extraction(
             if not enricher.is_applicable(record):
                 continue
             try:
-                result = asyncio.run(enricher.enrich(record))
+                result = run_async(enricher.enrich(record))
                 write_enrichment(record_id, enricher.enricher_name, result)
                 if hasattr(enricher, "write_relational"):
                     enricher.write_relational(record, result)
@@ -3072,6 +3282,9 @@ def backfill_url_extraction(
         if len(batch) < batch_size:
             break
 
+    if enrichments_applied:
+        invalidate_analysis_cache(all_data=True)
+
     summary = {
         "records_processed": records_processed,
         "enrichments_applied": enrichments_applied,
@@ -3200,6 +3413,9 @@ def backfill_search_terms_for_design(query_design_id: str) -> dict[str, Any]:
             if len(rows) < batch_size:
                 break
 
+    if records_updated:
+        invalidate_analysis_cache(query_design_id=query_design_id)
+
     summary = {
         "records_scanned": records_scanned,
         "records_updated": records_updated,
@@ -3207,3 +3423,87 @@ def backfill_search_terms_for_design(query_design_id: str) -> dict[str, Any]:
     }
     log.info("backfill_search_terms_for_design: complete", **summary)
     return summary
+
+
+# ---------------------------------------------------------------------------
+# Task: advance_brightdata_snapshots
+# ---------------------------------------------------------------------------
+
+
+@celery_app.task(
+    name="issue_observatory.workers.tasks.advance_brightdata_snapshots",
+)
+def advance_brightdata_snapshots() -> dict[str, Any]:
+    """Poll pending Bright Data snapshots and dispatch the ready ones.
+
+    Runs every minute from Celery Beat.  Each tick advances every pending
+    snapshot by one step (see
+    :func:`~issue_observatory.arenas._brightdata_snapshots.advance_pending_snapshots`)
+    and sends the platform's ``ingest_snapshot`` task for snapshots that
+    became ready or failed.  A Redis lock keeps overlapping ticks from
+    polling the same snapshots twice.
+
+    Returns:
+        Dict with ``dispatched`` and ``failed`` counts, or ``skipped`` when
+        another tick holds the lock.
+    """
+    import httpx
+
+    from issue_observatory.arenas._brightdata_snapshots import (
+        SnapshotStore,
+        advance_pending_snapshots,
+        ingest_task_name,
+    )
+    from issue_observatory.core.credential_pool import CredentialPool
+    from issue_observatory.workers._task_helpers import is_run_cancelled
+    from issue_observatory.workers.runtime import shared_http_transport
+
+    log = logger.bind(task="advance_brightdata_snapshots")
+    store = SnapshotStore(settings.redis_url)
+
+    async def _advance() -> dict[str, Any] | None:
+        try:
+            if not await store.acquire_poll_lock():
+                return None
+            try:
+                async with httpx.AsyncClient(
+                    timeout=30.0, transport=shared_http_transport()
+                ) as client:
+                    return await advance_pending_snapshots(
+                        store, client, CredentialPool(), is_cancelled=is_run_cancelled
+                    )
+            finally:
+                await store.release_poll_lock()
+        finally:
+            await store.aclose()
+
+    try:
+        advanced = run_async(_advance())
+    except Exception as exc:
+        log.error(
+            "advance_brightdata_snapshots: error",
+            error=str(exc),
+            exc_info=True,
+        )
+        return {"error": str(exc), "dispatched": 0, "failed": 0}
+
+    if advanced is None:
+        log.debug("advance_brightdata_snapshots: previous tick still running")
+        return {"skipped": True}
+
+    for job in advanced["dispatch"] + advanced["failed"]:
+        celery_app.send_task(
+            ingest_task_name(job.platform),
+            kwargs={
+                "snapshot_id": job.snapshot_id,
+                "collection_run_id": job.collection_run_id,
+            },
+        )
+
+    summary = {
+        "dispatched": len(advanced["dispatch"]),
+        "failed": len(advanced["failed"]),
+    }
+    if summary["dispatched"] or summary["failed"]:
+        log.info("advance_brightdata_snapshots: complete", **summary)
+    return summary
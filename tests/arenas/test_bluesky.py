@@ -6,15 +6,21 @@ Covers:
 - Edge cases: empty results, HTTP 429, malformed JSON, missing author
 - health_check() test
 - Danish character preservation (æ, ø, å)
+- BlueskyStreamer against a local WebSocket stand-in replaying recorded
+  Jetstream frames (matching, cursor resume, backpressure)
 
 These tests run without a live database or network connection.
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
 import os
+import threading
 from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qs, urlparse
 
 import httpx
 import pytest
@@ -29,8 +35,13 @@ os.environ.setdefault("SECRET_KEY", "test-secret-key-for-tests-only")
 os.environ.setdefault("CREDENTIAL_ENCRYPTION_KEY", "dGVzdC1mZXJuZXQta2V5LTMyLWJ5dGVzLXBhZGRlZA==")
 
 from issue_observatory.arenas.base import Tier
-from issue_observatory.arenas.bluesky.collector import BlueskyCollector
+from issue_observatory.arenas.bluesky.collector import (
+    BlueskyCollector,
+    BlueskyStreamer,
+    StreamSubscription,
+)
 from issue_observatory.arenas.bluesky.config import BSKY_SEARCH_POSTS_ENDPOINT
+from issue_observatory.arenas.bluesky.stream_state import StreamCursorStore
 from issue_observatory.core.exceptions import ArenaRateLimitError
 
 # ---------------------------------------------------------------------------
@@ -404,3 +415,250 @@ class TestHealthCheck:
         result = await collector.health_check()
 
         assert result["status"] in ("degraded", "down")
+
+
+# ---------------------------------------------------------------------------
+# BlueskyStreamer tests (local Jetstream stand-in)
+# ---------------------------------------------------------------------------
+
+_ACTOR_DID = "did:plc:dkjournalist0000000000000"
+_LAST_TIME_US = 1772442000000008
+
+
+def _load_jetstream_frames() -> list[dict[str, Any]]:
+    """Load the recorded Jetstream frames, one JSON event per line."""
+    lines = (FIXTURES_DIR / "jetstream_frames.jsonl").read_text(encoding="utf-8").splitlines()
+    return [json.loads(line) for line in lines if line]
+
+
+class _FakeRedis:
+    """Dict-backed stand-in for the async Redis commands used by StreamCursorStore."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, str] = {}
+
+    async def get(self, key: str) -> str | None:
+        return self.data.get(key)
+
+    async def set(self, key: str, value: str, ex: int | None = None) -> bool:
+        self.data[key] = value
+        return True
+
+
+class _JetstreamStandIn:
+    """Local WebSocket server replaying recorded frames like Jetstream.
+
+    Frames older than the ``cursor`` query parameter are skipped; the
+    connection stays open after the last frame, as the live firehose would.
+    """
+
+    def __init__(self) -> None:
+        self.frames = _load_jetstream_frames()
+        self.requests: list[dict[str, list[str]]] = []
+        self.url = ""
+
+    async def _handler(self, websocket: Any) -> None:
+        params = parse_qs(urlparse(websocket.path).query)
+        self.requests.append(params)
+        cursor = int(params["cursor"][0]) if "cursor" in params else 0
+        for frame in self.frames:
+            if frame["time_us"] >= cursor:
+                await websocket.send(json.dumps(frame, ensure_ascii=False))
+        await websocket.wait_closed()
+
+    async def __aenter__(self) -> _JetstreamStandIn:
+        import websockets
+
+        self._server = await websockets.serve(self._handler, "127.0.0.1", 0)
+        port = self._server.sockets[0].getsockname()[1]
+        self.url = f"ws://127.0.0.1:{port}/subscribe"
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+
+def _stream_collector(sink: Any) -> BlueskyCollector:
+    collector = BlueskyCollector()
+    collector.configure_batch_persistence(sink=sink, batch_size=100)
+    return collector
+
+
+def _make_cursor_store(redis: _FakeRedis) -> StreamCursorStore:
+    store = StreamCursorStore("redis://localhost:6379/0")
+    store._redis = redis
+    return store
+
+
+async def _stream_until(streamer: BlueskyStreamer, time_us: int) -> None:
+    """Run *streamer* until it has read the frame at *time_us*, then stop it."""
+    task = asyncio.create_task(streamer.run(max_seconds=10))
+    for _ in range(200):
+        if streamer.cursor == time_us or task.done():
+            break
+        await asyncio.sleep(0.02)
+    streamer.stop()
+    await task
+
+
+class TestBlueskyStreamer:
+    @pytest.mark.asyncio
+    async def test_matches_danish_term_posts_and_actor_posts(self) -> None:
+        """Danish term matches and tracked-actor posts reach the sink; the rest is dropped."""
+        persisted: list[dict[str, Any]] = []
+
+        def sink(records: list[dict[str, Any]]) -> tuple[int, int]:
+            persisted.extend(records)
+            return len(records), 0
+
+        redis = _FakeRedis()
+        sub = StreamSubscription(
+            collector=_stream_collector(sink),
+            term_groups=[["Folketinget"]],
+            actor_dids={_ACTOR_DID},
+        )
+        async with _JetstreamStandIn() as jetstream:
+            streamer = BlueskyStreamer(
+                [sub],
+                cursor_store=_make_cursor_store(redis),
+                endpoints=[jetstream.url],
+                flush_interval=0.05,
+            )
+            await _stream_until(streamer, _LAST_TIME_US)
+
+        by_rkey = {r["platform_id"].rsplit("/", 1)[-1]: r for r in persisted}
+        assert set(by_rkey) == {"3mda001", "3mda004", "3mda006"}
+        assert by_rkey["3mda001"]["search_terms_matched"] == ["folketinget"]
+        assert by_rkey["3mda004"]["search_terms_matched"] == []
+        assert "ø" in by_rkey["3mda006"]["text_content"]
+        assert redis.data["streaming:cursor:bluesky:live"] == str(_LAST_TIME_US)
+        assert jetstream.requests[0]["wantedCollections"] == ["app.bsky.feed.post"]
+        assert "wantedDids" not in jetstream.requests[0]
+
+    @pytest.mark.asyncio
+    async def test_resumes_from_stored_cursor(self) -> None:
+        """A stored cursor is sent on connect and older events are not replayed."""
+        persisted: list[dict[str, Any]] = []
+
+        def sink(records: list[dict[str, Any]]) -> tuple[int, int]:
+            persisted.extend(records)
+            return len(records), 0
+
+        redis = _FakeRedis()
+        redis.data["streaming:cursor:bluesky:live"] = "1772442000000005"
+        sub = StreamSubscription(collector=_stream_collector(sink), term_groups=[["folketinget"]])
+        async with _JetstreamStandIn() as jetstream:
+            streamer = BlueskyStreamer(
+                [sub],
+                cursor_store=_make_cursor_store(redis),
+                endpoints=[jetstream.url],
+                flush_interval=0.05,
+            )
+            await _stream_until(streamer, _LAST_TIME_US)
+
+        assert jetstream.requests[0]["cursor"] == ["1772442000000005"]
+        assert [r["platform_id"].rsplit("/", 1)[-1] for r in persisted] == ["3mda006"]
+
+    @pytest.mark.asyncio
+    async def test_and_groups_per_subscription(self) -> None:
+        """Each subscription receives only the posts its own AND-groups match."""
+        received: dict[str, list[str]] = {"nato": [], "parliament": []}
+
+        def sink_for(name: str) -> Any:
+            def sink(records: list[dict[str, Any]]) -> tuple[int, int]:
+                received[name].extend(r["platform_id"].rsplit("/", 1)[-1] for r in records)
+                return len(records), 0
+
+            return sink
+
+        nato = StreamSubscription(
+            collector=_stream_collector(sink_for("nato")),
+            term_groups=[["grønland", "forsvaret"]],
+        )
+        parliament = StreamSubscription(
+            collector=_stream_collector(sink_for("parliament")),
+            term_groups=[["folketinget"]],
+        )
+        async with _JetstreamStandIn() as jetstream:
+            streamer = BlueskyStreamer(
+                [nato, parliament], endpoints=[jetstream.url], flush_interval=0.05
+            )
+            await _stream_until(streamer, _LAST_TIME_US)
+
+        assert received["nato"] == ["3mda006"]
+        assert received["parliament"] == ["3mda001", "3mda006"]
+
+    @pytest.mark.asyncio
+    async def test_actor_only_subscriptions_filter_server_side(self) -> None:
+        """Without terms, actor DIDs are sent to Jetstream as wantedDids."""
+        sub = StreamSubscription(
+            collector=_stream_collector(lambda records: (len(records), 0)),
+            actor_dids={_ACTOR_DID},
+        )
+        async with _JetstreamStandIn() as jetstream:
+            streamer = BlueskyStreamer([sub], endpoints=[jetstream.url], flush_interval=0.05)
+            await _stream_until(streamer, _LAST_TIME_US)
+
+        assert jetstream.requests[0]["wantedDids"] == [_ACTOR_DID]
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_holds_back_the_cursor(self) -> None:
+        """The cursor is only saved once the sink has accepted the matches."""
+
+        def sink(records: list[dict[str, Any]]) -> tuple[int, int]:
+            raise RuntimeError("database unavailable")
+
+        redis = _FakeRedis()
+        sub = StreamSubscription(collector=_stream_collector(sink), term_groups=[["folketinget"]])
+        async with _JetstreamStandIn() as jetstream:
+            streamer = BlueskyStreamer(
+                [sub],
+                cursor_store=_make_cursor_store(redis),
+                endpoints=[jetstream.url],
+                flush_interval=0.05,
+            )
+            await _stream_until(streamer, _LAST_TIME_US)
+
+        assert "streaming:cursor:bluesky:live" not in redis.data
+        assert len(sub.collector._batch_buffer) == 2
+
+    @pytest.mark.asyncio
+    async def test_slow_sink_pauses_the_reader(self) -> None:
+        """A blocked sink fills the bounded queue and stops frame reading."""
+        release = threading.Event()
+        persisted: list[str] = []
+
+        def sink(records: list[dict[str, Any]]) -> tuple[int, int]:
+            release.wait(timeout=5)
+            persisted.extend(r["platform_id"].rsplit("/", 1)[-1] for r in records)
+            return len(records), 0
+
+        collector = BlueskyCollector()
+        collector.configure_batch_persistence(sink=sink, batch_size=1)
+        sub = StreamSubscription(
+            collector=collector, term_groups=[["folketinget"]], actor_dids={_ACTOR_DID}
+        )
+        async with _JetstreamStandIn() as jetstream:
+            streamer = BlueskyStreamer(
+                [sub], endpoints=[jetstream.url], queue_size=1, batch_size=1, flush_interval=0.05
+            )
+            task = asyncio.create_task(streamer.run(max_seconds=10))
+            for _ in range(200):
+                if streamer.cursor == 1772442000000006:
+                    break
+                await asyncio.sleep(0.02)
+            await asyncio.sleep(0.2)
+            # 3mda001 is in the blocked sink and 3mda004 fills the queue, so
+            # the reader is parked on the 3mda006 frame and has not read it.
+            assert streamer.cursor == 1772442000000006
+
+            release.set()
+            for _ in range(200):
+                if streamer.cursor == _LAST_TIME_US:
+                    break
+                await asyncio.sleep(0.02)
+            streamer.stop()
+            await task
+
+        assert persisted == ["3mda001", "3mda004", "3mda006"]
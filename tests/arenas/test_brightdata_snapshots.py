@@ -0,0 +1,515 @@
+"""Tests for the non-blocking Bright Data snapshot lifecycle.
+
+Covers:
+- _RecordDecoder: NDJSON split across arbitrary chunk boundaries, JSON array
+  bodies, ``{"data": [...]}`` wrappers, and truncated trailing records
+- iter_snapshot_records(): streamed NDJSON download, HTTP errors and
+  bodies that end mid-record raise ArenaCollectionError
+- SnapshotStore: state transitions with time-in-state, pending index, and
+  settle() completing a task exactly once after it is closed
+- advance_pending_snapshots(): ready -> dispatch, failed, still running,
+  cancelled runs, snapshots that never become ready, stalled downloads,
+  each job polled with the credential that triggered it
+- FacebookCollector.ingest_snapshot(): snapshot records streamed into the
+  batch sink, error records captured on the job, max_results honoured
+- finalize_snapshot_task(): reindex callback for the actor task only, the
+  task fails only when every snapshot failed
+
+These tests run without a live database, Redis, or network connection.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+# ---------------------------------------------------------------------------
+# Env bootstrap (must run before any application imports)
+# ---------------------------------------------------------------------------
+
+os.environ.setdefault("PSEUDONYMIZATION_SALT", "test-pseudonymization-salt-for-unit-tests")
+os.environ.setdefault("SECRET_KEY", "test-secret-key-for-tests-only")
+os.environ.setdefault("CREDENTIAL_ENCRYPTION_KEY", "dGVzdC1mZXJuZXQta2V5LTMyLWJ5dGVzLXBhZGRlZA==")
+
+from issue_observatory.arenas._brightdata_snapshots import (
+    DONE,
+    DOWNLOAD_STALL_SECONDS,
+    DOWNLOADING,
+    FAILED,
+    MAX_DOWNLOAD_ATTEMPTS,
+    POSTS,
+    PROGRESS_URL,
+    READY,
+    RUNNING,
+    SNAPSHOT_MAX_AGE_SECONDS,
+    SNAPSHOT_URL,
+    TRIGGERED,
+    SnapshotJob,
+    SnapshotStore,
+    _RecordDecoder,
+    advance_pending_snapshots,
+    finalize_snapshot_task,
+    ingest_task_name,
+    iter_snapshot_records,
+)
+from issue_observatory.arenas.facebook.collector import FacebookCollector
+from issue_observatory.core.exceptions import ArenaCollectionError
+
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "api_responses" / "facebook"
+
+_TOKEN = "test-bd-api-token"
+_RUN_ID = "run-bd-001"
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+class _FakeRedis:
+    """Dict-backed stand-in for the async Redis commands used by SnapshotStore."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, str] = {}
+        self.sets: dict[str, set[str]] = {}
+
+    async def get(self, key: str) -> str | None:
+        return self.data.get(key)
+
+    async def mget(self, keys: list[str]) -> list[str | None]:
+        return [self.data.get(k) for k in keys]
+
+    async def set(self, key: str, value: str, ex: int | None = None, nx: bool = False) -> bool:
+        if nx and key in self.data:
+            return False
+        self.data[key] = value
+        return True
+
+    async def delete(self, *keys: str) -> int:
+        return sum(1 for k in keys if self.data.pop(k, None) is not None)
+
+    async def sadd(self, key: str, *members: str) -> int:
+        self.sets.setdefault(key, set()).update(members)
+        return len(members)
+
+    async def srem(self, key: str, *members: str) -> int:
+        self.sets.setdefault(key, set()).difference_update(members)
+        return len(members)
+
+    async def smembers(self, key: str) -> set[str]:
+        return set(self.sets.get(key, set()))
+
+    async def expire(self, key: str, seconds: int) -> bool:
+        return True
+
+
+def _client(
+    responses: dict[str, httpx.Response], requests: list[httpx.Request] | None = None
+) -> httpx.AsyncClient:
+    """Return a client answering each full URL in *responses*; others get 404."""
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        if requests is not None:
+            requests.append(request)
+        return responses.get(str(request.url), httpx.Response(404))
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+
+
+def _make_store(redis: _FakeRedis | None = None) -> SnapshotStore:
+    store = SnapshotStore("redis://localhost:6379/0")
+    store._redis = redis or _FakeRedis()
+    return store
+
+
+def _job(snapshot_id: str, **overrides: Any) -> SnapshotJob:
+    fields: dict[str, Any] = {
+        "snapshot_id": snapshot_id,
+        "platform": "facebook",
+        "task": "facebook",
+        "kind": POSTS,
+        "collection_run_id": _RUN_ID,
+        "query_design_id": "qd-001",
+        "inputs": ["https://www.facebook.com/drnyheder"],
+        "credential_id": "cred-fb-001",
+    }
+    fields.update(overrides)
+    return SnapshotJob(**fields)
+
+
+def _ndjson(records: list[dict[str, Any]]) -> str:
+    return "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in records)
+
+
+def _snapshot_records() -> list[dict[str, Any]]:
+    return json.loads(
+        (FIXTURES_DIR / "web_scraper_snapshot_response.json").read_text(encoding="utf-8")
+    )
+
+
+# ---------------------------------------------------------------------------
+# _RecordDecoder
+# ---------------------------------------------------------------------------
+
+
+class TestRecordDecoder:
+    def test_ndjson_split_at_every_offset_yields_all_records(self) -> None:
+        records = [{"id": i, "text": f"Grøn omstilling {i}"} for i in range(3)]
+        body = _ndjson(records)
+        for split in range(len(body) + 1):
+            decoder = _RecordDecoder()
+            decoded = decoder.feed(body[:split]) + decoder.feed(body[split:])
+            assert decoded == records
+            assert decoder.leftover == ""
+
+    def test_json_array_body_is_decoded(self) -> None:
+        decoder = _RecordDecoder()
+        body = json.dumps([{"id": 1}, {"id": 2}])
+        assert decoder.feed(body[:7]) + decoder.feed(body[7:]) == [{"id": 1}, {"id": 2}]
+
+    def test_data_wrapper_is_unwrapped(self) -> None:
+        decoder = _RecordDecoder()
+        assert decoder.feed(json.dumps({"data": [{"id": 1}]})) == [{"id": 1}]
+
+    def test_truncated_record_is_left_over(self) -> None:
+        decoder = _RecordDecoder()
+        assert decoder.feed('{"id": 1}\n{"id": ') == [{"id": 1}]
+        assert decoder.leftover.strip() == '{"id":'
+
+
+# ---------------------------------------------------------------------------
+# iter_snapshot_records()
+# ---------------------------------------------------------------------------
+
+
+class TestIterSnapshotRecords:
+    @pytest.mark.asyncio
+    async def test_streams_ndjson_records(self) -> None:
+        records = [{"id": i, "content": "Æblegrød på Østerbro"} for i in range(5)]
+        requests: list[httpx.Request] = []
+        responses = {
+            SNAPSHOT_URL.format(snapshot_id="snap-1"): httpx.Response(200, text=_ndjson(records))
+        }
+        async with _client(responses, requests) as client:
+            got = [r async for r in iter_snapshot_records(client, _TOKEN, "snap-1")]
+        assert got == records
+        assert requests[0].headers["Authorization"] == f"Bearer {_TOKEN}"
+
+    @pytest.mark.asyncio
+    async def test_http_error_raises_collection_error(self) -> None:
+        responses = {SNAPSHOT_URL.format(snapshot_id="snap-1"): httpx.Response(500, text="boom")}
+        async with _client(responses) as client:
+            with pytest.raises(ArenaCollectionError):
+                async for _ in iter_snapshot_records(client, _TOKEN, "snap-1"):
+                    pass
+
+    @pytest.mark.asyncio
+    async def test_body_ending_mid_record_raises_collection_error(self) -> None:
+        responses = {
+            SNAPSHOT_URL.format(snapshot_id="snap-1"): httpx.Response(
+                200, text='{"id": 1}\n{"id": 2, "te'
+            )
+        }
+        async with _client(responses) as client:
+            with pytest.raises(ArenaCollectionError, match="mid-record"):
+                async for _ in iter_snapshot_records(client, _TOKEN, "snap-1"):
+                    pass
+
+
+# ---------------------------------------------------------------------------
+# SnapshotStore
+# ---------------------------------------------------------------------------
+
+
+class TestSnapshotStore:
+    @pytest.mark.asyncio
+    async def test_transition_records_time_in_state_and_leaves_pending(self) -> None:
+        store = _make_store()
+        job = _job("snap-1")
+        job.state_since -= 30
+        await store.register(job)
+        assert [j.snapshot_id for j in await store.pending()] == ["snap-1"]
+
+        await store.transition(job, RUNNING, polls=1)
+        await store.transition(job, DONE, records_inserted=12)
+
+        stored = await store.get("snap-1")
+        assert stored is not None
+        assert stored.state == DONE
+        assert stored.records_inserted == 12
+        assert stored.state_seconds[TRIGGERED] >= 30
+        assert await store.pending() == []
+        assert (await store.for_run(_RUN_ID))[0].summary()["input_count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_settle_waits_for_close_and_terminal_jobs_then_claims_once(self) -> None:
+        store = _make_store()
+        await store.begin_task(_RUN_ID, "facebook", {"actor_ids": ["a"]})
+        job = _job("snap-1")
+        await store.register(job)
+
+        await store.transition(job, DONE)
+        assert await store.settle(_RUN_ID, "facebook") is None  # still open
+
+        other = _job("snap-2")
+        await store.register(other)
+        await store.end_task(_RUN_ID, "facebook")
+        assert await store.settle(_RUN_ID, "facebook") is None  # snap-2 pending
+
+        await store.transition(other, FAILED, error="dead_page")
+        settled = await store.settle(_RUN_ID, "facebook")
+        assert settled is not None
+        context, jobs = settled
+        assert context["actor_ids"] == ["a"]
+        assert [j.snapshot_id for j in jobs] == ["snap-1", "snap-2"]
+        assert await store.settle(_RUN_ID, "facebook") is None
+
+    @pytest.mark.asyncio
+    async def test_task_without_snapshots_settles_on_close(self) -> None:
+        store = _make_store()
+        await store.begin_task(_RUN_ID, "facebook_comments", {})
+        await store.end_task(_RUN_ID, "facebook_comments")
+        assert await store.settle(_RUN_ID, "facebook_comments") == (
+            await store.task_context(_RUN_ID, "facebook_comments"),
+            [],
+        )
+
+
+# ---------------------------------------------------------------------------
+# advance_pending_snapshots()
+# ---------------------------------------------------------------------------
+
+
+def _make_mock_pool() -> Any:
+    """Return a pool that knows the Facebook credentials ``cred-fb-00{1,2}``."""
+    tokens = {"cred-fb-001": _TOKEN, "cred-fb-002": "other-bd-api-token"}
+
+    async def _get(platform: str, tier: str, credential_id: str) -> dict[str, Any] | None:
+        if platform == "brightdata_facebook" and credential_id in tokens:
+            return {"id": credential_id, "api_token": tokens[credential_id]}
+        return None
+
+    pool = MagicMock()
+    pool.get = AsyncMock(side_effect=_get)
+    pool.acquire = AsyncMock(side_effect=AssertionError("snapshots must not acquire"))
+    return pool
+
+
+def _progress(snapshot_id: str, payload: dict[str, Any]) -> tuple[str, httpx.Response]:
+    return PROGRESS_URL.format(snapshot_id=snapshot_id), httpx.Response(200, json=payload)
+
+
+class TestAdvancePendingSnapshots:
+    @pytest.mark.asyncio
+    async def test_ready_snapshot_is_dispatched_for_download(self) -> None:
+        store = _make_store()
+        await store.register(_job("snap-ready"))
+        await store.register(_job("snap-running"))
+        await store.register(_job("snap-failed"))
+        responses = dict(
+            [
+                _progress("snap-ready", {"status": "ready", "records": 3}),
+                _progress("snap-running", {"status": "running"}),
+                _progress("snap-failed", {"status": "failed", "error": "blocked"}),
+            ]
+        )
+        async with _client(responses) as client:
+            advanced = await advance_pending_snapshots(store, client, _make_mock_pool())
+
+        assert [j.snapshot_id for j in advanced["dispatch"]] == ["snap-ready"]
+        assert [j.snapshot_id for j in advanced["failed"]] == ["snap-failed"]
+        ready = await store.get("snap-ready")
+        assert ready is not None
+        assert (ready.state, ready.downloads, ready.polls) == (DOWNLOADING, 1, 1)
+        assert ready.progress["records"] == 3
+        running = await store.get("snap-running")
+        assert running is not None and running.state == RUNNING
+        failed = await store.get("snap-failed")
+        assert failed is not None and "blocked" in (failed.error or "")
+        assert ingest_task_name("facebook") == (
+            "issue_observatory.arenas.facebook.tasks.ingest_snapshot"
+        )
+
+    @pytest.mark.asyncio
+    async def test_each_job_is_polled_with_the_credential_that_triggered_it(self) -> None:
+        store = _make_store()
+        await store.register(_job("snap-1"))
+        await store.register(_job("snap-2", credential_id="cred-fb-002"))
+        requests: list[httpx.Request] = []
+        responses = dict(
+            [
+                _progress("snap-1", {"status": "running"}),
+                _progress("snap-2", {"status": "running"}),
+            ]
+        )
+        async with _client(responses, requests) as client:
+            await advance_pending_snapshots(store, client, _make_mock_pool())
+        tokens = {
+            r.url.path.rsplit("/", 1)[-1]: r.headers["Authorization"] for r in requests
+        }
+        assert tokens == {
+            "snap-1": f"Bearer {_TOKEN}",
+            "snap-2": "Bearer other-bd-api-token",
+        }
+
+    @pytest.mark.asyncio
+    async def test_jobs_without_credential_wait_and_cancelled_runs_fail(self) -> None:
+        store = _make_store()
+        await store.register(_job("snap-ig", platform="instagram", task="instagram"))
+        await store.register(_job("snap-cancelled", collection_run_id="run-cancelled"))
+        async with _client({}) as client:
+            advanced = await advance_pending_snapshots(
+                store,
+                client,
+                _make_mock_pool(),
+                is_cancelled=lambda run_id: run_id == "run-cancelled",
+            )
+        assert advanced["dispatch"] == []
+        assert [j.snapshot_id for j in advanced["failed"]] == ["snap-cancelled"]
+        ig = await store.get("snap-ig")
+        assert ig is not None and ig.state == TRIGGERED and ig.polls == 0
+        cancelled = await store.get("snap-cancelled")
+        assert cancelled is not None and cancelled.state == FAILED
+
+    @pytest.mark.asyncio
+    async def test_snapshot_never_ready_fails_after_max_age(self) -> None:
+        store = _make_store()
+        await store.register(_job("snap-old", created_at=time.time() - SNAPSHOT_MAX_AGE_SECONDS - 1))
+        async with _client({}) as client:
+            advanced = await advance_pending_snapshots(store, client, _make_mock_pool())
+        assert [j.snapshot_id for j in advanced["failed"]] == ["snap-old"]
+
+    @pytest.mark.asyncio
+    async def test_stalled_download_is_redispatched_until_attempts_run_out(self) -> None:
+        store = _make_store()
+        stalled = _job("snap-stalled", state=DOWNLOADING, downloads=1)
+        stalled.state_since -= DOWNLOAD_STALL_SECONDS + 1
+        exhausted = _job("snap-exhausted", state=READY, downloads=MAX_DOWNLOAD_ATTEMPTS)
+        await store.register(stalled)
+        await store.register(exhausted)
+        async with _client({}) as client:
+            advanced = await advance_pending_snapshots(store, client, _make_mock_pool())
+        assert [j.snapshot_id for j in advanced["dispatch"]] == ["snap-stalled"]
+        assert [j.snapshot_id for j in advanced["failed"]] == ["snap-exhausted"]
+        redispatched = await store.get("snap-stalled")
+        assert redispatched is not None and redispatched.downloads == 2
+
+
+# ---------------------------------------------------------------------------
+# FacebookCollector.ingest_snapshot()
+# ---------------------------------------------------------------------------
+
+
+class TestFacebookIngestSnapshot:
+    @pytest.mark.asyncio
+    async def test_records_stream_into_sink_and_errors_are_kept_on_job(self) -> None:
+        posts = [r for r in _snapshot_records() if not r.get("comment_id")]
+        error_record = {
+            "error_code": "dead_page",
+            "error": "Page not found",
+            "input": {"url": "https://www.facebook.com/gone"},
+        }
+        batches: list[int] = []
+
+        def _sink(batch: list[dict[str, Any]]) -> tuple[int, int]:
+            batches.append(len(batch))
+            return len(batch), 0
+
+        body = _ndjson(posts + [error_record])
+        responses = {SNAPSHOT_URL.format(snapshot_id="snap-1"): httpx.Response(200, text=body)}
+        async with _client(responses) as client:
+            collector = FacebookCollector(credential_pool=_make_mock_pool(), http_client=client)
+            collector.configure_batch_persistence(sink=_sink, batch_size=2)
+            job = _job("snap-1", state=DOWNLOADING)
+            remaining = await collector.ingest_snapshot(job)
+
+        assert remaining == []
+        assert sum(batches) == len(posts)
+        assert max(batches) <= 2
+        assert job.records_read == len(posts) + 1
+        assert job.errors == [
+            {
+                "url": "https://www.facebook.com/gone",
+                "error_code": "dead_page",
+                "error_detail": "Page not found",
+            }
+        ]
+        assert collector.batch_stats["inserted"] == len(posts)
+
+    @pytest.mark.asyncio
+    async def test_max_results_caps_emitted_records(self) -> None:
+        posts = [r for r in _snapshot_records() if not r.get("comment_id")]
+        emitted: list[dict[str, Any]] = []
+
+        def _sink(batch: list[dict[str, Any]]) -> tuple[int, int]:
+            emitted.extend(batch)
+            return len(batch), 0
+
+        responses = {
+            SNAPSHOT_URL.format(snapshot_id="snap-1"): httpx.Response(200, text=_ndjson(posts))
+        }
+        async with _client(responses) as client:
+            collector = FacebookCollector(credential_pool=_make_mock_pool(), http_client=client)
+            collector.configure_batch_persistence(sink=_sink, batch_size=100)
+            job = _job("snap-1", state=DOWNLOADING, max_results=2)
+            await collector.ingest_snapshot(job)
+
+        assert len(emitted) == 2
+        assert job.records_read == len(posts)
+
+
+# ---------------------------------------------------------------------------
+# finalize_snapshot_task()
+# ---------------------------------------------------------------------------
+
+
+class TestFinalizeSnapshotTask:
+    def _finalize(self, task: str, jobs: list[SnapshotJob]) -> tuple[dict[str, Any], Any, Any]:
+        reindex = MagicMock(return_value=4)
+        context = {"tier": "medium", "actor_ids": ["https://www.facebook.com/drnyheder"]}
+        with (
+            patch(
+                "issue_observatory.workers._task_helpers.update_collection_task_status"
+            ) as update_status,
+            patch(
+                "issue_observatory.workers._task_helpers.count_run_platform_records",
+                return_value=0,
+            ),
+            patch("issue_observatory.arenas._brightdata_snapshots.publish_task_update"),
+        ):
+            result = finalize_snapshot_task(
+                "facebook", task, context, jobs, _RUN_ID, "qd-001", reindex=reindex
+            )
+        return result, reindex, update_status
+
+    def test_actor_task_is_reindexed_and_completes_when_one_snapshot_succeeded(self) -> None:
+        jobs = [
+            _job("snap-1", state=DONE, records_inserted=3),
+            _job("snap-2", state=FAILED, error="blocked"),
+        ]
+        result, reindex, update_status = self._finalize("facebook", jobs)
+
+        assert (result["status"], result["records_collected"]) == ("completed", 3)
+        reindex.assert_called_once_with(
+            {"tier": "medium", "actor_ids": ["https://www.facebook.com/drnyheder"]},
+            _RUN_ID,
+            "qd-001",
+        )
+        update_status.assert_called_once_with(
+            _RUN_ID, "facebook", "completed", records_collected=3, error_message=None
+        )
+
+    def test_comment_task_is_not_reindexed_and_fails_when_all_snapshots_failed(self) -> None:
+        jobs = [_job("snap-1", task="facebook_comments", state=FAILED, error="blocked")]
+        result, reindex, update_status = self._finalize("facebook_comments", jobs)
+
+        assert result["status"] == "failed"
+        reindex.assert_not_called()
+        assert update_status.call_args.kwargs["error_message"] == "snap-1: blocked"
@@ -0,0 +1,475 @@
+"""Tests for Common Crawl WARC record retrieval.
+
+Covers:
+- plan_range_reads(): grouping by WARC file, coalescing adjacent ranges,
+  splitting on large gaps and on the range size cap
+- parse_warc_member(): response records, non-response records, invalid
+  gzip, payload truncation, charset sniffing
+- WarcFetcher against a local HTTP server serving sample WARC files:
+  one ranged GET per coalesced range, extracted text applied to records,
+  error isolation on failed ranges, single retry on 503, process pool
+- collect_by_terms(fetch_content=True) end-to-end with a mocked index
+- the collect tasks honour the query design's ``fetch_content`` opt-out
+
+These tests run without a live database or network connection.
+"""
+
+from __future__ import annotations
+
+import gzip
+import os
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+# ---------------------------------------------------------------------------
+# Env bootstrap (must run before any application imports)
+# ---------------------------------------------------------------------------
+
+os.environ.setdefault("PSEUDONYMIZATION_SALT", "test-pseudonymization-salt-for-unit-tests")
+os.environ.setdefault("SECRET_KEY", "test-secret-key-for-tests-only")
+os.environ.setdefault("CREDENTIAL_ENCRYPTION_KEY", "dGVzdC1mZXJuZXQta2V5LTMyLWJ5dGVzLXBhZGRlZA==")
+
+from issue_observatory.arenas.base import Tier
+from issue_observatory.arenas.web.common_crawl import _warc
+from issue_observatory.arenas.web.common_crawl._warc import (
+    WarcFetcher,
+    WarcRecordRef,
+    parse_warc_member,
+    plan_range_reads,
+)
+from issue_observatory.arenas.web.common_crawl.collector import CommonCrawlCollector
+
+# ---------------------------------------------------------------------------
+# Sample WARC files
+# ---------------------------------------------------------------------------
+
+
+def _warc_member(
+    url: str,
+    html: bytes,
+    content_type: str = "text/html; charset=utf-8",
+    warc_type: str = "response",
+) -> bytes:
+    """Return one gzip-compressed WARC record as Common Crawl stores it."""
+    http = (
+        f"HTTP/1.1 200 OK\r\nContent-Type: {content_type}\r\n"
+        f"Content-Length: {len(html)}\r\n\r\n"
+    ).encode() + html
+    head = (
+        f"WARC/1.0\r\nWARC-Type: {warc_type}\r\nWARC-Target-URI: {url}\r\n"
+        f"Content-Type: application/http; msgtype=response\r\n"
+        f"Content-Length: {len(http)}\r\n\r\n"
+    ).encode()
+    return gzip.compress(head + http + b"\r\n\r\n")
+
+
+def _article(headline: str, body: str) -> bytes:
+    return (
+        f"<html><head><title>{headline}</title></head>"
+        f"<body><h1>{headline}</h1><p>{body}</p></body></html>"
+    ).encode()
+
+
+def _write_warc(path: Path, members: list[bytes]) -> list[tuple[int, int]]:
+    """Write *members* back to back and return their ``(offset, length)``."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    locations = []
+    offset = 0
+    with path.open("wb") as fh:
+        for member in members:
+            fh.write(member)
+            locations.append((offset, len(member)))
+            offset += len(member)
+    return locations
+
+
+def _index_record(url: str, filename: str, offset: int, length: int) -> dict[str, Any]:
+    """Return a normalized CC Index record pointing at a WARC member."""
+    return {
+        "url": url,
+        "title": None,
+        "text_content": None,
+        "language": None,
+        "content_type": "web_index_entry",
+        "raw_metadata": {
+            "warc_filename": filename,
+            "warc_record_offset": str(offset),
+            "warc_record_length": str(length),
+            "charset": "UTF-8",
+        },
+    }
+
+
+# ---------------------------------------------------------------------------
+# Local data bucket
+# ---------------------------------------------------------------------------
+
+
+class _Bucket:
+    """State shared between a test and its local HTTP server."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.ranges: list[tuple[str, str]] = []
+        self.fail_once: dict[str, int] = {}
+        self.base_url = ""
+
+
+def _handler_for(bucket: _Bucket) -> type[BaseHTTPRequestHandler]:
+    class _RangeHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802
+            name = self.path.lstrip("/")
+            range_header = self.headers.get("Range", "")
+            bucket.ranges.append((name, range_header))
+            if name in bucket.fail_once:
+                self.send_response(bucket.fail_once.pop(name))
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            path = bucket.root / name
+            if not path.is_file():
+                self.send_response(404)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            data = path.read_bytes()
+            start_s, _, end_s = range_header.removeprefix("bytes=").partition("-")
+            start, end = int(start_s), min(int(end_s), len(data) - 1)
+            body = data[start : end + 1]
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(data)}")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+    return _RangeHandler
+
+
+@pytest.fixture()
+def bucket(tmp_path: Path) -> Iterator[_Bucket]:
+    """Serve ``tmp_path`` over HTTP with byte-range support."""
+    state = _Bucket(tmp_path)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _handler_for(state))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    state.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        yield state
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+# ---------------------------------------------------------------------------
+# plan_range_reads()
+# ---------------------------------------------------------------------------
+
+
+class TestPlanRangeReads:
+    def test_adjacent_members_in_one_file_share_a_read(self) -> None:
+        refs = [
+            WarcRecordRef(index=1, filename="a.warc.gz", offset=100, length=50),
+            WarcRecordRef(index=0, filename="a.warc.gz", offset=0, length=100),
+            WarcRecordRef(index=2, filename="b.warc.gz", offset=0, length=10),
+        ]
+
+        reads = plan_range_reads(refs, max_gap=0, max_range_bytes=1_000)
+
+        assert [(r.filename, r.start, r.end) for r in reads] == [
+            ("a.warc.gz", 0, 150),
+            ("b.warc.gz", 0, 10),
+        ]
+        assert [ref.index for ref in reads[0].refs] == [0, 1]
+        assert reads[0].range_header == "bytes=0-149"
+
+    def test_gap_larger_than_max_gap_starts_new_read(self) -> None:
+        refs = [
+            WarcRecordRef(index=0, filename="a.warc.gz", offset=0, length=100),
+            WarcRecordRef(index=1, filename="a.warc.gz", offset=150, length=100),
+            WarcRecordRef(index=2, filename="a.warc.gz", offset=1_000, length=100),
+        ]
+
+        reads = plan_range_reads(refs, max_gap=64, max_range_bytes=10_000)
+
+        assert [(r.start, r.end) for r in reads] == [(0, 250), (1_000, 1_100)]
+
+    def test_range_size_cap_splits_reads(self) -> None:
+        refs = [
+            WarcRecordRef(index=i, filename="a.warc.gz", offset=i * 100, length=100)
+            for i in range(5)
+        ]
+
+        reads = plan_range_reads(refs, max_gap=0, max_range_bytes=250)
+
+        assert [(r.start, r.end) for r in reads] == [(0, 200), (200, 400), (400, 500)]
+
+    def test_duplicate_locations_share_a_read(self) -> None:
+        refs = [
+            WarcRecordRef(index=0, filename="a.warc.gz", offset=500, length=100),
+            WarcRecordRef(index=1, filename="a.warc.gz", offset=500, length=100),
+        ]
+
+        reads = plan_range_reads(refs, max_gap=0, max_range_bytes=100)
+
+        assert len(reads) == 1
+        assert len(reads[0].refs) == 2
+
+
+# ---------------------------------------------------------------------------
+# parse_warc_member()
+# ---------------------------------------------------------------------------
+
+
+class TestParseWarcMember:
+    def test_response_record_is_parsed(self) -> None:
+        html = _article("Grøn omstilling", "Regeringen fremlægger en ny klimaplan.")
+        member = _warc_member("https://www.dr.dk/nyheder/klima", html)
+
+        response = parse_warc_member(member)
+
+        assert response is not None
+        assert response.target_uri == "https://www.dr.dk/nyheder/klima"
+        assert response.http_status == 200
+        assert response.content_type == "text/html"
+        assert response.charset == "utf-8"
+        assert response.payload == html
+        assert response.truncated is False
+
+    def test_non_response_record_returns_none(self) -> None:
+        member = _warc_member("https://www.dr.dk/", b"", warc_type="request")
+
+        assert parse_warc_member(member) is None
+
+    def test_invalid_gzip_raises_value_error(self) -> None:
+        with pytest.raises(ValueError):
+            parse_warc_member(b"not a gzip member")
+
+    def test_payload_is_truncated_at_cap(self) -> None:
+        html = b"<html><body>" + b"x" * 10_000 + b"</body></html>"
+        member = _warc_member("https://www.dr.dk/lang", html)
+
+        response = parse_warc_member(member, max_payload_bytes=1_000)
+
+        assert response is not None
+        assert len(response.payload) == 1_000
+        assert response.truncated is True
+
+    def test_meta_charset_is_used_when_header_has_none(self) -> None:
+        html = '<html><head><meta charset="iso-8859-1"></head><body>Ærø</body></html>'
+        member = _warc_member(
+            "https://www.dr.dk/", html.encode("iso-8859-1"), content_type="text/html"
+        )
+
+        response = parse_warc_member(member)
+
+        assert response is not None
+        assert "Ærø" in response.decode_html()
+
+
+# ---------------------------------------------------------------------------
+# WarcFetcher against a local data bucket
+# ---------------------------------------------------------------------------
+
+
+def _sample_records(bucket: _Bucket) -> list[dict[str, Any]]:
+    """Write two WARC files and return index records for four of their members."""
+    file_a = "crawl-data/CC-MAIN-2026-08/segments/1/warc/a.warc.gz"
+    file_b = "crawl-data/CC-MAIN-2026-08/segments/1/warc/b.warc.gz"
+    locations_a = _write_warc(
+        bucket.root / file_a,
+        [
+            _warc_member("https://www.dr.dk/1", _article("Første", "Folketinget vedtog loven.")),
+            _warc_member("https://www.dr.dk/2", _article("Anden", "Vindmøller ved Esbjerg.")),
+            _warc_member("https://www.dr.dk/robots.txt", b"", warc_type="request"),
+            _warc_member("https://www.dr.dk/3", _article("Tredje", "Ny bro over Storebælt.")),
+        ],
+    )
+    locations_b = _write_warc(
+        bucket.root / file_b,
+        [_warc_member("https://tv2.dk/1", _article("Fjerde", "Valget er udskrevet."))],
+    )
+    return [
+        _index_record("https://www.dr.dk/1", file_a, *locations_a[0]),
+        _index_record("https://tv2.dk/1", file_b, *locations_b[0]),
+        _index_record("https://www.dr.dk/3", file_a, *locations_a[3]),
+        _index_record("https://www.dr.dk/2", file_a, *locations_a[1]),
+    ]
+
+
+class TestWarcFetcher:
+    @pytest.mark.asyncio
+    async def test_coalesces_ranges_and_extracts_text(self, bucket: _Bucket) -> None:
+        """Members of one file are read with one ranged GET; text lands on records."""
+        records = _sample_records(bucket)
+
+        async with WarcFetcher(base_url=bucket.base_url, process_workers=0) as fetcher:
+            fetched = await fetcher.fetch_content(records)
+
+        assert fetched == 4
+        assert sorted(name.rsplit("/", 1)[1] for name, _ in bucket.ranges) == [
+            "a.warc.gz",
+            "b.warc.gz",
+        ]
+        texts = [r["text_content"] for r in records]
+        assert "Folketinget vedtog loven." in texts[0]
+        assert "Valget er udskrevet." in texts[1]
+        assert "Ny bro over Storebælt." in texts[2]
+        assert "Vindmøller ved Esbjerg." in texts[3]
+        assert all(r["content_type"] == "web_page" for r in records)
+        assert all(r["raw_metadata"]["content_fetched"] is True for r in records)
+        assert records[0]["raw_metadata"]["warc_http_status"] == 200
+        assert records[0]["raw_metadata"]["content_fetch_url"].endswith("a.warc.gz")
+
+    @pytest.mark.asyncio
+    async def test_missing_file_marks_records_without_raising(self, bucket: _Bucket) -> None:
+        records = [_index_record("https://www.dr.dk/x", "missing.warc.gz", 0, 100)]
+
+        async with WarcFetcher(base_url=bucket.base_url, process_workers=0) as fetcher:
+            fetched = await fetcher.fetch_content(records)
+
+        assert fetched == 0
+        assert records[0]["text_content"] is None
+        assert records[0]["content_type"] == "web_index_entry"
+        assert "404" in records[0]["raw_metadata"]["content_fetch_error"]
+
+    @pytest.mark.asyncio
+    async def test_record_without_location_is_marked(self, bucket: _Bucket) -> None:
+        records = [{"url": "https://www.dr.dk/", "raw_metadata": {"warc_filename": None}}]
+
+        async with WarcFetcher(base_url=bucket.base_url, process_workers=0) as fetcher:
+            fetched = await fetcher.fetch_content(records)
+
+        assert fetched == 0
+        assert bucket.ranges == []
+        assert "content_fetch_error" in records[0]["raw_metadata"]
+
+    @pytest.mark.asyncio
+    async def test_503_is_retried_once(
+        self, bucket: _Bucket, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(_warc, "CC_WARC_RETRY_DELAY_SECONDS", 0.0)
+        records = _sample_records(bucket)[1:2]
+        bucket.fail_once[records[0]["raw_metadata"]["warc_filename"]] = 503
+
+        async with WarcFetcher(base_url=bucket.base_url, process_workers=0) as fetcher:
+            fetched = await fetcher.fetch_content(records)
+
+        assert fetched == 1
+        assert len(bucket.ranges) == 2
+
+    @pytest.mark.asyncio
+    async def test_extraction_runs_in_process_pool(self, bucket: _Bucket) -> None:
+        records = _sample_records(bucket)[:2]
+
+        async with WarcFetcher(base_url=bucket.base_url, process_workers=1) as fetcher:
+            fetched = await fetcher.fetch_content(records)
+            assert fetcher._pool is not None
+
+        assert fetched == 2
+        assert "Folketinget vedtog loven." in records[0]["text_content"]
+
+
+# ---------------------------------------------------------------------------
+# collect_by_terms(fetch_content=True)
+# ---------------------------------------------------------------------------
+
+
+class TestCollectWithContent:
+    @pytest.mark.asyncio
+    async def test_collect_by_terms_fetches_warc_content(
+        self, bucket: _Bucket, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import json
+
+        monkeypatch.setattr(
+            "issue_observatory.config.settings.get_settings",
+            lambda: type("S", (), {"warc_extract_workers": 0})(),
+        )
+        records = _sample_records(bucket)
+        index_lines = "\n".join(
+            json.dumps(
+                {
+                    "urlkey": r["url"],
+                    "timestamp": "20260115120000",
+                    "url": r["url"],
+                    "status": "200",
+                    "filename": r["raw_metadata"]["warc_filename"],
+                    "offset": r["raw_metadata"]["warc_record_offset"],
+                    "length": r["raw_metadata"]["warc_record_length"],
+                }
+            )
+            for r in records
+        )
+        index_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, text=index_lines))
+        )
+
+        with patch.object(
+            CommonCrawlCollector, "_rate_limit_wait", new=AsyncMock(return_value=None)
+        ):
+            collector = CommonCrawlCollector(
+                http_client=index_client, data_base_url=bucket.base_url
+            )
+            collected = await collector.collect_by_terms(
+                terms=["dk"], tier=Tier.FREE, max_results=10, fetch_content=True
+            )
+
+        assert len(collected) == 4
+        assert all(r["content_type"] == "web_page" for r in collected)
+        assert any("Valget er udskrevet." in r["text_content"] for r in collected)
+        assert len(bucket.ranges) == 2
+
+
+# ---------------------------------------------------------------------------
+# arenas_config["common_crawl"]["fetch_content"] opt-out
+# ---------------------------------------------------------------------------
+
+
+class TestTaskFetchContentConfig:
+    _TASKS = "issue_observatory.arenas.web.common_crawl.tasks"
+
+    def _run_terms_task(self, arenas_config: dict[str, Any]) -> tuple[dict[str, Any], AsyncMock]:
+        from issue_observatory.arenas.web.common_crawl.tasks import common_crawl_collect_terms
+
+        collect = AsyncMock(return_value=[])
+        with (
+            patch(f"{self._TASKS}._load_arenas_config", return_value=arenas_config) as load,
+            patch(f"{self._TASKS}._update_task_status"),
+            patch(f"{self._TASKS}.publish_task_update"),
+            patch.object(CommonCrawlCollector, "collect_by_terms", new=collect),
+            patch(
+                "issue_observatory.workers._task_helpers.persist_collected_records",
+                return_value=(0, 0),
+            ),
+            patch(
+                "issue_observatory.workers._task_helpers.count_run_platform_records",
+                return_value=0,
+            ),
+        ):
+            result = common_crawl_collect_terms(
+                query_design_id="design-1", collection_run_id="run-1", terms=["valg"]
+            )
+        load.assert_called_once_with("design-1")
+        return result, collect
+
+    def test_design_opt_out_disables_warc_fetch(self) -> None:
+        result, collect = self._run_terms_task({"common_crawl": {"fetch_content": False}})
+
+        assert collect.await_args.kwargs["fetch_content"] is False
+        assert result["fetch_content"] is False
+
+    def test_fetch_content_defaults_to_enabled(self) -> None:
+        result, collect = self._run_terms_task({"rss": {"custom_feeds": []}})
+
+        assert collect.await_args.kwargs["fetch_content"] is True
+        assert result["fetch_content"] is True
@@ -9,6 +9,9 @@ Covers:
   empty results, client-side term matching, boolean term_groups,
   missing channel_ids raises ArenaCollectionError, GR-04 extra_channel_ids
 - collect_by_actors() with mocked Discord API: happy path, author filtering
+- snowflake cursors: reading forward from date_from with ``after=``, resuming
+  from a stored cursor, sharing fetched pages between the term and actor
+  tasks of one collection run
 - HTTP 429 -> ArenaRateLimitError
 - Tier validation: only FREE is supported
 - health_check() returns 'ok', 'down' as appropriate
@@ -21,9 +24,10 @@ from __future__ import annotations
 
 import json
 import os
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
@@ -38,12 +42,13 @@ os.environ.setdefault("SECRET_KEY", "test-secret-key-for-tests-only")
 os.environ.setdefault("CREDENTIAL_ENCRYPTION_KEY", "dGVzdC1mZXJuZXQta2V5LTMyLWJ5dGVzLXBhZGRlZA==")
 
 from issue_observatory.arenas.base import Tier
-from issue_observatory.arenas.discord._http import enrich_message
+from issue_observatory.arenas.discord._http import enrich_message, snowflake_from_datetime
 from issue_observatory.arenas.discord.collector import (
     DiscordCollector,
     _merge_channel_ids,
 )
 from issue_observatory.arenas.discord.config import DISCORD_API_BASE
+from issue_observatory.arenas.discord.sync_state import ChannelCursor, ChannelSyncStore
 from issue_observatory.core.exceptions import (
     ArenaCollectionError,
     ArenaRateLimitError,
@@ -691,6 +696,190 @@ class TestCollectByActors:
         assert len(records) == 2
 
 
+# ---------------------------------------------------------------------------
+# Snowflake cursors and run page sharing
+# ---------------------------------------------------------------------------
+
+_CHANNEL_ID = "9876543210987654321"
+_DATE_FROM = datetime(2026, 3, 1, tzinfo=UTC)
+
+
+class _FakeRedis:
+    """Dict-backed stand-in for the async Redis commands used by ChannelSyncStore."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, str] = {}
+
+    async def get(self, key: str) -> str | None:
+        return self.data.get(key)
+
+    async def mget(self, keys: list[str]) -> list[str | None]:
+        return [self.data.get(k) for k in keys]
+
+    async def set(self, key: str, value: str, ex: int | None = None, nx: bool = False) -> bool:
+        if nx and key in self.data:
+            return False
+        self.data[key] = value
+        return True
+
+
+def _make_sync_store(redis: _FakeRedis, run_id: str | None = "run-1") -> ChannelSyncStore:
+    store = ChannelSyncStore("redis://localhost:6379/0", scope="design-1", run_id=run_id)
+    store._redis = redis
+    return store
+
+
+def _channel_history(count: int) -> list[dict[str, Any]]:
+    """Return *count* messages, one per hour from _DATE_FROM, oldest first."""
+    base = int(snowflake_from_datetime(_DATE_FROM))
+    return [
+        {
+            "id": str(base + ((i * 3_600_000) << 22) + 1),
+            "content": f"Besked {i} om klimapolitik" if i % 2 == 0 else f"Besked {i}",
+            "timestamp": datetime.fromtimestamp(
+                _DATE_FROM.timestamp() + i * 3_600, tz=UTC
+            ).isoformat(),
+            "author": {"id": "42" if i % 3 == 0 else "7", "username": "user"},
+        }
+        for i in range(count)
+    ]
+
+
+class _FakeDiscordApi:
+    """httpx MockTransport handler serving a channel's history by ``after``."""
+
+    def __init__(self, history: list[dict[str, Any]]) -> None:
+        self.history = history
+        self.message_requests: list[dict[str, str]] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/messages"):
+            params = dict(request.url.params)
+            self.message_requests.append(params)
+            limit = int(params["limit"])
+            if "after" in params:
+                newer = [m for m in self.history if int(m["id"]) > int(params["after"])]
+                page = newer[:limit]
+            else:
+                page = list(reversed(self.history))[:limit]
+            # Discord returns pages newest first.
+            return httpx.Response(200, json=sorted(page, key=lambda m: -int(m["id"])))
+        return httpx.Response(200, json={"id": _CHANNEL_ID, "name": "debat", "guild_id": "1"})
+
+
+def _collector(api: _FakeDiscordApi, store: ChannelSyncStore | None) -> DiscordCollector:
+    client = httpx.AsyncClient(
+        base_url=DISCORD_API_BASE, transport=httpx.MockTransport(api)
+    )
+    return DiscordCollector(credential_pool=_make_mock_pool(), http_client=client, sync_store=store)
+
+
+@pytest.fixture()
+def _no_request_delay() -> Any:
+    with patch("issue_observatory.arenas.discord._http.asyncio.sleep", new=AsyncMock()):
+        yield
+
+
+@pytest.mark.usefixtures("_no_request_delay")
+class TestChannelCursors:
+    def test_snowflake_from_datetime_encodes_discord_timestamp(self) -> None:
+        """The snowflake's timestamp bits decode back to the datetime."""
+        snowflake = int(snowflake_from_datetime(_DATE_FROM))
+        assert (snowflake >> 22) + 1_420_070_400_000 == int(_DATE_FROM.timestamp() * 1000)
+
+    @pytest.mark.asyncio
+    async def test_reads_forward_from_date_from_and_saves_cursor(self) -> None:
+        """With date_from the channel is paged with after= and the newest ID stored."""
+        history = _channel_history(150)
+        api = _FakeDiscordApi(history)
+        redis = _FakeRedis()
+        collector = _collector(api, _make_sync_store(redis))
+
+        records = await collector.collect_by_terms(
+            terms=["klimapolitik"],
+            tier=Tier.FREE,
+            date_from=_DATE_FROM,
+            max_results=1_000,
+            channel_ids=[_CHANNEL_ID],
+        )
+
+        assert len(records) == 75
+        assert api.message_requests[0]["after"] == snowflake_from_datetime(_DATE_FROM)
+        assert len(api.message_requests) == 2
+        cursor_key = next(k for k in redis.data if k.startswith("discord:cursor:"))
+        cursor = ChannelCursor(**json.loads(redis.data[cursor_key]))
+        assert cursor.after == history[-1]["id"]
+        assert cursor.synced_from == _DATE_FROM.isoformat()
+
+    @pytest.mark.asyncio
+    async def test_next_run_resumes_from_stored_cursor(self) -> None:
+        """A later run only requests messages after the stored cursor."""
+        history = _channel_history(10)
+        redis = _FakeRedis()
+        first = _FakeDiscordApi(history[:6])
+        await _collector(first, _make_sync_store(redis, run_id="run-1")).collect_by_terms(
+            terms=["klimapolitik"],
+            tier=Tier.FREE,
+            date_from=_DATE_FROM,
+            channel_ids=[_CHANNEL_ID],
+        )
+
+        second = _FakeDiscordApi(history)
+        records = await _collector(second, _make_sync_store(redis, run_id="run-2")).collect_by_terms(
+            terms=["klimapolitik"],
+            tier=Tier.FREE,
+            date_from=_DATE_FROM,
+            channel_ids=[_CHANNEL_ID],
+        )
+
+        assert second.message_requests[0]["after"] == history[5]["id"]
+        assert sorted(r["platform_id"] for r in records) == [history[6]["id"], history[8]["id"]]
+
+    @pytest.mark.asyncio
+    async def test_actor_task_reuses_pages_fetched_by_term_task(self) -> None:
+        """The term and actor tasks of one run share a single fetched page stream."""
+        history = _channel_history(120)
+        redis = _FakeRedis()
+        terms_api = _FakeDiscordApi(history)
+        await _collector(terms_api, _make_sync_store(redis)).collect_by_terms(
+            terms=["klimapolitik"],
+            tier=Tier.FREE,
+            date_from=_DATE_FROM,
+            channel_ids=[_CHANNEL_ID],
+        )
+
+        actors_api = _FakeDiscordApi(history)
+        records = await _collector(actors_api, _make_sync_store(redis)).collect_by_actors(
+            actor_ids=["42"],
+            tier=Tier.FREE,
+            date_from=_DATE_FROM,
+            channel_ids=[_CHANNEL_ID],
+        )
+
+        assert len(terms_api.message_requests) == 2
+        assert actors_api.message_requests == []
+        assert len(records) == 40
+
+    @pytest.mark.asyncio
+    async def test_without_date_from_reads_backwards_from_newest(self) -> None:
+        """Without date_from or cursor the channel is read newest-first (no after=)."""
+        history = _channel_history(5)
+        api = _FakeDiscordApi(history)
+        redis = _FakeRedis()
+        records = await _collector(api, _make_sync_store(redis)).collect_by_terms(
+            terms=["klimapolitik"],
+            tier=Tier.FREE,
+            channel_ids=[_CHANNEL_ID],
+        )
+
+        assert "after" not in api.message_requests[0]
+        assert len(records) == 3
+        cursor_key = next(k for k in redis.data if k.startswith("discord:cursor:"))
+        assert ChannelCursor(**json.loads(redis.data[cursor_key])) == ChannelCursor(
+            after=history[-1]["id"], synced_from=None
+        )
+
+
 # ---------------------------------------------------------------------------
 # Tier validation tests
 # ---------------------------------------------------------------------------
@@ -0,0 +1,102 @@
+"""Tests for the shared Redis plumbing of the arenas' sync state stores.
+
+Covers:
+- SyncedHistory.covers(): paged to the start, reaches back, stops short
+- RedisStateStore: records round-trip with TTL, unreadable records are
+  skipped, Redis failures load nothing and save nothing
+- collect_then_close(): stores are closed even when the collection raises
+
+These tests run against fakeredis; no live Redis is required.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+
+from issue_observatory.arenas._redis_state import (
+    RedisStateStore,
+    SyncedHistory,
+    collect_then_close,
+)
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+@dataclass
+class _Cursor(SyncedHistory):
+    after: str
+    synced_from: str | None = None
+
+
+class _CursorStore(RedisStateStore):
+    log_prefix = "test"
+
+    def key(self, source: str) -> str:
+        return f"test:cursor:{self._scope}:{source}"
+
+    async def load(self, sources: list[str]) -> dict[str, _Cursor]:
+        return await self._load_records(sources, self.key, _Cursor, "cursors")
+
+    async def save(self, source: str, cursor: _Cursor) -> None:
+        await self._save_record(self.key(source), cursor, f"cursor for {source}")
+
+
+def _make_store(redis: Any | None = None) -> _CursorStore:
+    store = _CursorStore("redis://localhost:6379/0", scope="design-1", ttl_seconds=60)
+    store._redis = redis if redis is not None else fakeredis.FakeAsyncRedis(decode_responses=True)
+    return store
+
+
+class TestSyncedHistory:
+    def test_covers(self) -> None:
+        since = datetime(2026, 3, 1, tzinfo=UTC)
+        cursor = _Cursor(after="10", synced_from=since.isoformat())
+
+        assert _Cursor(after="10").covers(None)
+        assert cursor.covers(datetime(2026, 3, 2, tzinfo=UTC))
+        assert not cursor.covers(datetime(2026, 2, 28, tzinfo=UTC))
+        assert not cursor.covers(None)
+
+
+class TestRedisStateStore:
+    @pytest.mark.asyncio
+    async def test_records_round_trip_and_unreadable_ones_are_skipped(self) -> None:
+        store = _make_store()
+        await store.save("a", _Cursor(after="42", synced_from="2026-03-01T00:00:00+00:00"))
+        redis = await store._get_redis()
+        await redis.set(store.key("b"), "{not json")
+        await redis.set(store.key("c"), '{"unknown_field": 1}')
+
+        loaded = await store.load(["a", "b", "c", "d"])
+
+        assert loaded == {"a": _Cursor(after="42", synced_from="2026-03-01T00:00:00+00:00")}
+        assert 0 < await redis.ttl(store.key("a")) <= 60
+
+    @pytest.mark.asyncio
+    async def test_redis_failures_are_swallowed(self) -> None:
+        broken = AsyncMock()
+        broken.mget.side_effect = ConnectionError("down")
+        broken.set.side_effect = ConnectionError("down")
+        store = _make_store(broken)
+
+        assert await store.load(["a"]) == {}
+        await store.save("a", _Cursor(after="1"))
+
+
+class TestCollectThenClose:
+    @pytest.mark.asyncio
+    async def test_stores_are_closed_when_the_collection_raises(self) -> None:
+        stores = [_make_store(), _make_store()]
+
+        async def _collect() -> None:
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            await collect_then_close(_collect(), *stores)
+
+        assert all(store._redis is None for store in stores)
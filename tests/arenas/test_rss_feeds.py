@@ -5,6 +5,9 @@ Covers:
 - collect_by_terms() integration tests with mocked HTTP (respx) + feedparser
 - Edge cases: empty feed, HTTP error response, feedparser bozo error, missing author
 - health_check() test
+- Persistent conditional-GET state: 304 / unchanged-body skips, seen-entry
+  filtering, date-window handling and state persistence (in-memory
+  FeedStateStore stand-in)
 - Danish character preservation (æ, ø, å)
 
 These tests run without a live database or network connection.
@@ -16,6 +19,7 @@ import os
 import time
 from pathlib import Path
 from types import SimpleNamespace
+from typing import Any
 
 import httpx
 import pytest
@@ -32,6 +36,7 @@ os.environ.setdefault("CREDENTIAL_ENCRYPTION_KEY", "dGVzdC1mZXJuZXQta2V5LTMyLWJ5
 from issue_observatory.arenas.base import Tier
 from issue_observatory.arenas.rss_feeds.collector import RSSFeedsCollector
 from issue_observatory.arenas.rss_feeds.config import HEALTH_CHECK_FEED_URL
+from issue_observatory.arenas.rss_feeds.feed_state import FeedState, query_digest
 
 # ---------------------------------------------------------------------------
 # Fixture paths
@@ -400,6 +405,146 @@ class TestCollectByTerms:
         assert isinstance(records, list)
 
 
+# ---------------------------------------------------------------------------
+# Persistent conditional-GET state
+# ---------------------------------------------------------------------------
+
+
+class _MemoryFeedStateStore:
+    """In-memory stand-in for FeedStateStore (same load/save interface)."""
+
+    def __init__(self) -> None:
+        self.states: dict[tuple[str, str], FeedState] = {}
+        self.saves: list[dict[str, tuple[str, str]]] = []
+
+    async def load(self, query: str, feed_urls: list[str]) -> dict[str, FeedState]:
+        return {
+            url: FeedState(**vars(self.states[(query, url)]))
+            for url in feed_urls
+            if (query, url) in self.states
+        }
+
+    async def save(
+        self,
+        query: str,
+        states: dict[str, FeedState],
+        outcomes: dict[str, tuple[str, str]],
+    ) -> None:
+        for url, state in states.items():
+            self.states[(query, url)] = state
+        self.saves.append(dict(outcomes))
+
+
+class TestFeedState:
+    _FEED_URL = "https://www.dr.dk/rss/nyheder"
+
+    async def _collect(
+        self,
+        store: _MemoryFeedStateStore,
+        handler: Any,
+        max_results: int = 50,
+        date_to: str | None = None,
+    ) -> list:
+        # A fresh client per call: the collector closes it after use.
+        collector = RSSFeedsCollector(
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            feed_overrides={"dr_nyheder": self._FEED_URL},
+            feed_state_store=store,  # type: ignore[arg-type]
+        )
+        return await collector.collect_by_terms(
+            terms=[""], tier=Tier.FREE, max_results=max_results, date_to=date_to
+        )
+
+    @pytest.mark.asyncio
+    async def test_validators_sent_and_304_skips_feed(self) -> None:
+        """Stored ETag/Last-Modified are sent; a 304 emits nothing."""
+        store = _MemoryFeedStateStore()
+        store.states[(query_digest([[""]]), self._FEED_URL)] = FeedState(
+            etag='"abc"', last_modified="Sat, 14 Feb 2026 10:00:00 GMT"
+        )
+        requests: list[httpx.Request] = []
+
+        def _handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(304)
+
+        records = await self._collect(store, _handler)
+
+        assert requests[0].headers["If-None-Match"] == '"abc"'
+        assert requests[0].headers["If-Modified-Since"] == "Sat, 14 Feb 2026 10:00:00 GMT"
+        assert records == []
+        assert store.saves[-1] == {self._FEED_URL: ("dr_nyheder", "not_modified")}
+
+    @pytest.mark.asyncio
+    async def test_unchanged_body_is_not_parsed_again(self) -> None:
+        """A 200 with the same body as last time is skipped without parsing."""
+        store = _MemoryFeedStateStore()
+        xml = _load_dr_feed_xml()
+
+        def _handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, text=xml)
+
+        first = await self._collect(store, _handler)
+        second = await self._collect(store, _handler)
+
+        assert len(first) >= 1
+        assert second == []
+        assert store.saves[0][self._FEED_URL][1] == "modified"
+        assert store.saves[1][self._FEED_URL][1] == "unchanged"
+
+    @pytest.mark.asyncio
+    async def test_only_new_entries_emitted(self) -> None:
+        """Entries seen in the previous body are dropped from a changed feed."""
+        store = _MemoryFeedStateStore()
+        original = _load_dr_feed_xml()
+        new_item = (
+            "<item><title>Ny artikel</title>"
+            "<link>https://www.dr.dk/nyheder/ny-artikel</link>"
+            "<guid>https://www.dr.dk/nyheder/ny-artikel</guid>"
+            "<description>Helt ny historie.</description></item>"
+        )
+        updated = original.replace("<item>", new_item + "<item>", 1)
+
+        first = await self._collect(store, lambda _r: httpx.Response(200, text=original))
+        second = await self._collect(store, lambda _r: httpx.Response(200, text=updated))
+
+        assert len(first) >= 1
+        assert [r["url"] for r in second] == ["https://www.dr.dk/nyheder/ny-artikel"]
+
+    @pytest.mark.asyncio
+    async def test_entries_after_date_to_are_emitted_by_a_wider_run(self) -> None:
+        """Entries newer than date_to are not marked seen and force a full fetch."""
+        store = _MemoryFeedStateStore()
+        xml = _load_dr_feed_xml()
+
+        first = await self._collect(
+            store, lambda _r: httpx.Response(200, text=xml), date_to="2026-02-15T00:00:00+00:00"
+        )
+        state = store.states[(query_digest([[""]]), self._FEED_URL)]
+        second = await self._collect(store, lambda _r: httpx.Response(200, text=xml))
+
+        assert [r["url"] for r in first] == ["https://www.dr.dk/nyheder/regionale/aarhus-ny-plan"]
+        assert state.body_hash is None
+        assert state.seen_ids == ["https://www.dr.dk/nyheder/regionale/aarhus-ny-plan"]
+        assert [r["url"] for r in second] == [
+            "https://www.dr.dk/nyheder/politik/mette-frederiksen-groen-omstilling"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_state_not_persisted_when_truncated(self) -> None:
+        """Hitting max_results leaves the stored state untouched."""
+        store = _MemoryFeedStateStore()
+        xml = _load_dr_feed_xml()
+
+        records = await self._collect(
+            store, lambda _r: httpx.Response(200, text=xml), max_results=1
+        )
+
+        assert len(records) == 1
+        assert store.states == {}
+        assert store.saves[-1] == {self._FEED_URL: ("dr_nyheder", "modified")}
+
+
 # ---------------------------------------------------------------------------
 # health_check() tests
 # ---------------------------------------------------------------------------
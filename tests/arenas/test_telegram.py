@@ -8,6 +8,9 @@ Covers:
 - collect_by_terms(): records returned, deduplication, FloodWaitError ->
   ArenaRateLimitError, unexpected exception -> ArenaCollectionError,
   no-credential -> NoCredentialAvailableError, non-FREE tier logs warning
+- channel sync: one history sweep per channel whatever the number of terms,
+  local AND-group matching, resuming from a stored high-water mark
+  (``min_id``), state not persisted when max_results truncates a channel
 - collect_by_actors(): records from specified channel, empty channel, no
   credential, rate limit error
 - health_check(): ok when get_me() succeeds, degraded when no credential,
@@ -41,6 +44,7 @@ os.environ.setdefault("SECRET_KEY", "test-secret-key-for-tests-only")
 os.environ.setdefault("CREDENTIAL_ENCRYPTION_KEY", "dGVzdC1mZXJuZXQta2V5LTMyLWJ5dGVzLXBhZGRlZA==")
 
 from issue_observatory.arenas.base import Tier
+from issue_observatory.arenas.telegram.channel_state import ChannelSyncState, query_digest
 from issue_observatory.arenas.telegram.collector import (
     TelegramCollector,
     _build_channel_list,
@@ -703,6 +707,168 @@ class TestCollectByTerms:
         assert any("æ" in t or "ø" in t or "å" in t for t in texts)
 
 
+# ---------------------------------------------------------------------------
+# Channel sync (local term matching and persisted high-water marks)
+# ---------------------------------------------------------------------------
+
+
+def _make_state_store(states: dict[str, ChannelSyncState] | None = None) -> MagicMock:
+    """Build a mock ChannelStateStore returning *states* from load()."""
+    store = MagicMock()
+    store.load = AsyncMock(return_value=states or {})
+    store.save = AsyncMock(return_value=None)
+    return store
+
+
+async def _collect_terms(
+    collector: TelegramCollector, client_mock: MagicMock, **kwargs: Any
+) -> list[dict[str, Any]]:
+    with patch(_TELETHON_CLIENT_PATH, return_value=client_mock):
+        with patch(_TELETHON_STRING_SESSION_PATH, return_value=MagicMock()):
+            with patch(_FLOOD_WAIT_PATH, Exception):
+                with patch(_USER_BAN_PATH, Exception):
+                    with patch("asyncio.sleep", new=AsyncMock()):
+                        return await collector.collect_by_terms(tier=Tier.FREE, **kwargs)
+
+
+class TestChannelSync:
+    @pytest.mark.asyncio
+    async def test_each_channel_is_paged_once_for_all_terms(self) -> None:
+        """Many terms cost one get_messages() sweep per channel, matched locally."""
+        messages = [
+            _make_message(msg_id=12, text="Grøn omstilling i Folketinget."),
+            _make_message(msg_id=11, text="Velfærd og skat."),
+            _make_message(msg_id=10, text="Fodbold i weekenden."),
+        ]
+        client_mock = _make_async_client_mock(messages=messages)
+        collector = TelegramCollector(
+            credential_pool=_make_mock_pool(), default_channels=["dr_nyheder", "tv2"]
+        )
+
+        records = await _collect_terms(
+            collector,
+            client_mock,
+            terms=["grøn omstilling", "velfærd", "klima", "skat"],
+            max_results=50,
+        )
+
+        assert client_mock.get_messages.await_count == 2
+        assert all("search" not in c.kwargs for c in client_mock.get_messages.await_args_list)
+        assert sorted(r["platform_id"] for r in records) == ["111222333_11", "111222333_12"]
+
+    @pytest.mark.asyncio
+    async def test_term_groups_require_every_term_of_a_group(self) -> None:
+        """A message matches a term group only when it contains all of its terms."""
+        messages = [
+            _make_message(msg_id=2, text="Grøn omstilling koster."),
+            _make_message(msg_id=1, text="Grøn energi."),
+        ]
+        client_mock = _make_async_client_mock(messages=messages)
+        collector = TelegramCollector(
+            credential_pool=_make_mock_pool(), default_channels=["dr_nyheder"]
+        )
+
+        records = await _collect_terms(
+            collector,
+            client_mock,
+            terms=[],
+            term_groups=[["Grøn", "omstilling"]],
+            max_results=50,
+        )
+
+        assert [r["platform_id"] for r in records] == ["111222333_2"]
+
+    @pytest.mark.asyncio
+    async def test_stored_state_resumes_from_high_water_mark(self) -> None:
+        """A channel whose state covers date_from is read above its max_id only."""
+        messages = [_make_message(msg_id=205, text="Ny debat om velfærd.")]
+        client_mock = _make_async_client_mock(messages=messages)
+        state = ChannelSyncState(max_id=200, synced_from="2026-01-01T00:00:00+00:00")
+        store = _make_state_store({"dr_nyheder": state})
+        collector = TelegramCollector(
+            credential_pool=_make_mock_pool(),
+            default_channels=["dr_nyheder"],
+            channel_state_store=store,
+        )
+
+        records = await _collect_terms(
+            collector,
+            client_mock,
+            terms=["velfærd"],
+            date_from="2026-02-01T00:00:00+00:00",
+            max_results=50,
+        )
+
+        assert len(records) == 1
+        assert client_mock.get_messages.await_args.kwargs["min_id"] == 200
+        query, channel, saved = store.save.await_args.args
+        assert query == query_digest([["velfærd"]])
+        assert channel == "dr_nyheder"
+        assert saved == ChannelSyncState(max_id=205, synced_from=state.synced_from)
+
+    @pytest.mark.asyncio
+    async def test_state_not_covering_date_from_pages_full_window(self) -> None:
+        """An older date_from than the stored coverage ignores the high-water mark."""
+        messages = [
+            _make_message(msg_id=205, text="Velfærd.", date=datetime(2026, 2, 15, tzinfo=UTC)),
+            _make_message(msg_id=100, text="Velfærd.", date=datetime(2025, 12, 1, tzinfo=UTC)),
+            _make_message(msg_id=50, text="Velfærd.", date=datetime(2025, 10, 1, tzinfo=UTC)),
+        ]
+        client_mock = _make_async_client_mock(messages=messages)
+        state = ChannelSyncState(max_id=200, synced_from="2026-01-01T00:00:00+00:00")
+        store = _make_state_store({"dr_nyheder": state})
+        collector = TelegramCollector(
+            credential_pool=_make_mock_pool(),
+            default_channels=["dr_nyheder"],
+            channel_state_store=store,
+        )
+
+        records = await _collect_terms(
+            collector,
+            client_mock,
+            terms=["velfærd"],
+            date_from="2025-11-01T00:00:00+00:00",
+            max_results=50,
+        )
+
+        assert client_mock.get_messages.await_args.kwargs["min_id"] == 0
+        assert len(records) == 2
+        saved = store.save.await_args.args[2]
+        assert saved == ChannelSyncState(max_id=205, synced_from="2025-11-01T00:00:00+00:00")
+
+    @pytest.mark.asyncio
+    async def test_state_not_saved_when_max_results_truncates_channel(self) -> None:
+        """Unevaluated older messages must be fetched again, so no state is stored."""
+        messages = [
+            _make_message(msg_id=3, text="Velfærd 3."),
+            _make_message(msg_id=2, text="Velfærd 2."),
+            _make_message(msg_id=1, text="Velfærd 1."),
+        ]
+        client_mock = _make_async_client_mock(messages=messages)
+        store = _make_state_store()
+        collector = TelegramCollector(
+            credential_pool=_make_mock_pool(),
+            default_channels=["dr_nyheder"],
+            channel_state_store=store,
+        )
+
+        records = await _collect_terms(
+            collector, client_mock, terms=["velfærd"], max_results=2
+        )
+
+        assert len(records) == 2
+        store.save.assert_not_awaited()
+
+    def test_covers_and_query_digest(self) -> None:
+        """Coverage compares date_from with synced_from; digests ignore order and case."""
+        state = ChannelSyncState(max_id=1, synced_from="2026-01-01T00:00:00+00:00")
+        assert state.covers(datetime(2026, 1, 2, tzinfo=UTC))
+        assert not state.covers(datetime(2025, 12, 31, tzinfo=UTC))
+        assert not state.covers(None)
+        assert ChannelSyncState(max_id=1).covers(None)
+        assert query_digest([["b", "A"], ["c"]]) == query_digest([["c"], ["a", "B"]])
+
+
 # ---------------------------------------------------------------------------
 # collect_by_actors() integration tests
 # ---------------------------------------------------------------------------
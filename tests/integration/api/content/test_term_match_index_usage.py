@@ -0,0 +1,170 @@
+"""EXPLAIN checks for index-assisted search-term text matching.
+
+``build_content_where_sql`` with ``search_terms_text_fallback=True`` matches
+``text_content`` by substring.  Migration 043 adds a pg_trgm GIN index for
+that, and ``_text_contains_any_sql`` emits one ``ILIKE`` branch per term so
+the index is usable (GIN cannot evaluate ``ILIKE ANY(ARRAY[...])``).
+
+These tests seed a temporary table partitioned like ``content_records``,
+build the same indexes on it, and assert on the ``EXPLAIN (FORMAT JSON)``
+plan of the predicate the helper emits:
+
+- The fallback predicate is answered by Bitmap Index Scans on every
+  partition — the trigram index and the ``search_terms_matched`` GIN index.
+- The previous ``ILIKE ANY`` form cannot use the trigram index even with
+  sequential scans disabled, which is why the predicate was rewritten.
+- The rewritten predicate returns exactly the rows ``ILIKE ANY`` returns.
+
+Owned by: DB Engineer (analysis layer).
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession  # noqa: TC002
+
+from issue_observatory.core.queries.content_filters import (
+    ContentFilterSpec,
+    build_content_where_sql,
+)
+
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.filterwarnings("ignore::ResourceWarning"),
+]
+
+_TERMS = ["vindmølle", "havvind", "50%"]
+
+
+async def _seed_probe(db: AsyncSession) -> None:
+    """Create and fill ``probe_records``, partitioned into two months."""
+    await db.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    await db.execute(
+        text(
+            "CREATE TEMP TABLE probe_records ("
+            " id bigint, published_at timestamptz NOT NULL,"
+            " text_content text, search_terms_matched text[]"
+            ") PARTITION BY RANGE (published_at)"
+        )
+    )
+    await db.execute(
+        text(
+            "CREATE TEMP TABLE probe_records_2026_01 PARTITION OF probe_records"
+            " FOR VALUES FROM ('2026-01-01') TO ('2026-02-01')"
+        )
+    )
+    await db.execute(
+        text(
+            "CREATE TEMP TABLE probe_records_2026_02 PARTITION OF probe_records"
+            " FOR VALUES FROM ('2026-02-01') TO ('2026-03-01')"
+        )
+    )
+    # Same DDL as migration 043 and the idx_content_terms model index.
+    await db.execute(text("CREATE INDEX ON probe_records USING gin (text_content gin_trgm_ops)"))
+    await db.execute(text("CREATE INDEX ON probe_records USING gin (search_terms_matched)"))
+    # 40k filler posts; 1 in 2000 mentions a term in the text, 1 in 2500 has
+    # a populated search_terms_matched array.
+    await db.execute(
+        text(
+            "INSERT INTO probe_records"
+            " SELECT g, TIMESTAMPTZ '2026-01-01' + (g % 59) * INTERVAL '1 day',"
+            "  'opslag nummer ' || g || ' om trafik, vejret og fodbold'"
+            "   || CASE WHEN g % 2000 = 0 THEN ' nye HAVVIND parker' ELSE '' END"
+            "   || CASE WHEN g % 2000 = 1000 THEN ' rabat 50% i dag' ELSE '' END,"
+            "  CASE WHEN g % 2500 = 0 THEN ARRAY['vindmølle'] ELSE '{}'::text[] END"
+            " FROM generate_series(1, 40000) AS g"
+        )
+    )
+    await db.execute(text("ANALYZE probe_records"))
+
+
+def _fallback_where() -> tuple[str, dict[str, Any]]:
+    spec = ContentFilterSpec(
+        search_terms=_TERMS,
+        search_terms_text_fallback=True,
+        ownership_mode="admin",
+        include_duplicates=True,
+        show_all=True,
+    )
+    params: dict[str, Any] = {}
+    where = build_content_where_sql(spec, table_alias="", params=params)
+    return where, params
+
+
+async def _plan(db: AsyncSession, sql: str, params: dict[str, Any]) -> dict[str, Any]:
+    result = await db.execute(text(f"EXPLAIN (FORMAT JSON) {sql}"), params)
+    raw = result.scalar_one()
+    return (json.loads(raw) if isinstance(raw, str) else raw)[0]["Plan"]
+
+
+def _nodes(plan: dict[str, Any]) -> list[dict[str, Any]]:
+    nodes = [plan]
+    for child in plan.get("Plans", []):
+        nodes.extend(_nodes(child))
+    return nodes
+
+
+async def test_text_fallback_uses_trigram_and_terms_indexes(db_session: AsyncSession) -> None:
+    await _seed_probe(db_session)
+    where, params = _fallback_where()
+
+    plan = await _plan(db_session, f"SELECT id FROM probe_records {where}", params)
+
+    nodes = _nodes(plan)
+    assert not any(n["Node Type"] == "Seq Scan" for n in nodes), json.dumps(plan, indent=1)
+    index_names = {n["Index Name"] for n in nodes if n["Node Type"] == "Bitmap Index Scan"}
+    for partition in ("probe_records_2026_01", "probe_records_2026_02"):
+        assert any(
+            name.startswith(partition) and "text_content" in name for name in index_names
+        ), index_names
+        assert any(
+            name.startswith(partition) and "search_terms_matched" in name for name in index_names
+        ), index_names
+
+
+async def test_ilike_any_cannot_use_trigram_index(db_session: AsyncSession) -> None:
+    await _seed_probe(db_session)
+    await db_session.execute(text("SET LOCAL enable_seqscan = off"))
+
+    plan = await _plan(
+        db_session,
+        "SELECT id FROM probe_records WHERE text_content ILIKE ANY(ARRAY[:a, :b])",
+        {"a": "%vindmølle%", "b": "%havvind%"},
+    )
+
+    assert any(n["Node Type"] == "Seq Scan" for n in _nodes(plan))
+
+
+async def test_text_fallback_matches_ilike_any_rows(db_session: AsyncSession) -> None:
+    await _seed_probe(db_session)
+    where, params = _fallback_where()
+
+    rewritten = await db_session.execute(
+        text(f"SELECT id FROM probe_records {where} ORDER BY id"), params
+    )
+    reference = await db_session.execute(
+        text(
+            "SELECT id FROM probe_records"
+            " WHERE search_terms_matched && ARRAY[:t0, :t1, :t2]::text[]"
+            "  OR text_content ILIKE ANY(ARRAY[:l0, :l1, :l2])"
+            " ORDER BY id"
+        ),
+        {
+            "t0": _TERMS[0],
+            "t1": _TERMS[1],
+            "t2": _TERMS[2],
+            "l0": "%vindmølle%",
+            "l1": "%havvind%",
+            "l2": r"%50\%%",
+        },
+    )
+
+    ids = [row[0] for row in rewritten.fetchall()]
+    assert ids == [row[0] for row in reference.fetchall()]
+    # 20 HAVVIND texts + 20 "50%" texts + 16 vindmølle arrays, 8 of which
+    # are on rows already matched by their text.
+    assert len(ids) == 48
@@ -79,7 +79,6 @@ class TestFetchUrl:
                     client=client,
                     timeout=10,
                     respect_robots=False,
-                    robots_cache={},
                 )
 
         assert result.error is None
@@ -96,7 +95,6 @@ class TestFetchUrl:
                     client=client,
                     timeout=10,
                     respect_robots=False,
-                    robots_cache={},
                 )
 
         assert result.html is None
@@ -118,7 +116,6 @@ class TestFetchUrl:
                     client=client,
                     timeout=10,
                     respect_robots=False,
-                    robots_cache={},
                 )
 
         assert result.html is None
@@ -141,7 +138,6 @@ class TestFetchUrl:
                     client=client,
                     timeout=10,
                     respect_robots=False,
-                    robots_cache={},
                 )
 
         assert result.needs_playwright is True
@@ -156,7 +152,6 @@ class TestFetchUrl:
                     client=client,
                     timeout=5,
                     respect_robots=False,
-                    robots_cache={},
                 )
 
         assert result.html is None
@@ -164,7 +159,6 @@ class TestFetchUrl:
 
     async def test_robots_txt_blocking(self) -> None:
         """When robots.txt disallows, the URL should be blocked."""
-        robots_cache: dict[str, bool] = {}
 
         with patch(
             "issue_observatory.scraper.http_fetcher._is_allowed_by_robots",
@@ -176,7 +170,6 @@ class TestFetchUrl:
                     client=client,
                     timeout=10,
                     respect_robots=True,
-                    robots_cache=robots_cache,
                 )
 
         assert result.html is None
@@ -200,7 +193,6 @@ class TestFetchUrl:
                     client=client,
                     timeout=10,
                     respect_robots=False,
-                    robots_cache={},
                 )
 
         assert result.error is None
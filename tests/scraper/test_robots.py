@@ -0,0 +1,128 @@
+"""Unit tests for the shared robots.txt cache.
+
+Tests cover:
+- robots_origin() keys by scheme + host + port
+- RobotsRules allow/deny, 401/403 and 4xx handling, crawl delay parsing
+- RobotsCache downloads robots.txt once per origin, not once per URL
+- unreachable robots.txt is negatively cached with the shorter TTL
+- rules stored in Redis are reused by another cache instance without HTTP
+"""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+import respx
+
+from issue_observatory.scraper.robots import RobotsCache, RobotsRules, robots_origin
+
+_ROBOTS = """\
+User-agent: *
+Disallow: /private/
+Crawl-delay: 4
+
+User-agent: IssueObservatory
+Disallow: /no-bots/
+"""
+
+
+class _FakeRedis:
+    """Minimal async stand-in for the two Redis commands the cache uses."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+        self.ttls: dict[str, int] = {}
+
+    async def get(self, key: str) -> str | None:
+        return self.values.get(key)
+
+    async def set(self, key: str, value: str, ex: int) -> None:
+        self.values[key] = value
+        self.ttls[key] = ex
+
+    async def aclose(self) -> None:
+        pass
+
+
+def _cache_with(redis: _FakeRedis, **kwargs: int) -> RobotsCache:
+    cache = RobotsCache("redis://unused", **kwargs)
+    cache._redis = redis
+    return cache
+
+
+class TestRobotsOrigin:
+    def test_origin_keeps_scheme_host_and_port(self) -> None:
+        assert robots_origin("https://DR.dk:8443/a/b?c=1") == "https://dr.dk:8443"
+
+    def test_urls_on_same_host_share_origin(self) -> None:
+        assert robots_origin("https://dr.dk/a") == robots_origin("https://dr.dk/b")
+
+
+class TestRobotsRules:
+    def test_disallow_rules_apply_to_both_agent_groups(self) -> None:
+        rules = RobotsRules(status="ok", body=_ROBOTS)
+        assert rules.can_fetch("https://dr.dk/nyheder")
+        assert not rules.can_fetch("https://dr.dk/private/x")
+        assert not rules.can_fetch("https://dr.dk/no-bots/x")
+
+    def test_forbidden_blocks_and_missing_allows(self) -> None:
+        assert not RobotsRules(status="forbidden").can_fetch("https://dr.dk/")
+        assert RobotsRules(status="missing").can_fetch("https://dr.dk/")
+        assert RobotsRules(status="unreachable").can_fetch("https://dr.dk/")
+
+    def test_crawl_delay_from_wildcard_group(self) -> None:
+        assert RobotsRules(status="ok", body=_ROBOTS).crawl_delay() == 4.0
+        assert RobotsRules(status="missing").crawl_delay() is None
+
+
+@pytest.mark.asyncio
+class TestRobotsCache:
+    async def test_robots_txt_fetched_once_per_origin(self) -> None:
+        with respx.mock(base_url="https://dr.dk") as mock:
+            route = mock.get("/robots.txt").mock(return_value=httpx.Response(200, text=_ROBOTS))
+            async with httpx.AsyncClient() as client:
+                cache = RobotsCache()
+                assert await cache.is_allowed("https://dr.dk/a", client=client, timeout=5)
+                assert await cache.is_allowed("https://dr.dk/b", client=client, timeout=5)
+                assert not await cache.is_allowed(
+                    "https://dr.dk/private/c", client=client, timeout=5
+                )
+
+        assert route.call_count == 1
+        assert cache.crawl_delay("https://dr.dk/anything") == 4.0
+
+    async def test_status_codes_are_classified(self) -> None:
+        with respx.mock() as mock:
+            mock.get("https://a.dk/robots.txt").mock(return_value=httpx.Response(404))
+            mock.get("https://b.dk/robots.txt").mock(return_value=httpx.Response(403))
+            async with httpx.AsyncClient() as client:
+                cache = RobotsCache()
+                assert await cache.is_allowed("https://a.dk/x", client=client, timeout=5)
+                assert not await cache.is_allowed("https://b.dk/x", client=client, timeout=5)
+
+    async def test_unreachable_is_negatively_cached(self) -> None:
+        redis = _FakeRedis()
+        with respx.mock() as mock:
+            mock.get("https://down.dk/robots.txt").mock(return_value=httpx.Response(503))
+            async with httpx.AsyncClient() as client:
+                cache = _cache_with(redis, ttl_seconds=3600, negative_ttl_seconds=60)
+                assert await cache.is_allowed("https://down.dk/x", client=client, timeout=5)
+
+        assert redis.ttls == {"scraper:robots:https://down.dk": 60}
+
+    async def test_rules_shared_through_redis(self) -> None:
+        redis = _FakeRedis()
+        with respx.mock() as mock:
+            route = mock.get("https://dr.dk/robots.txt").mock(
+                return_value=httpx.Response(200, text=_ROBOTS)
+            )
+            async with httpx.AsyncClient() as client:
+                first = _cache_with(redis)
+                await first.is_allowed("https://dr.dk/a", client=client, timeout=5)
+                second = _cache_with(redis)
+                assert not await second.is_allowed(
+                    "https://dr.dk/private/a", client=client, timeout=5
+                )
+
+        assert route.call_count == 1
+        assert redis.ttls["scraper:robots:https://dr.dk"] == 24 * 3600
@@ -0,0 +1,73 @@
+"""Unit tests for the per-domain scraping scheduler.
+
+Tests cover:
+- domain_key() normalises host names
+- DomainScheduler.run() processes every item
+- different hosts are fetched concurrently, up to max_concurrency
+- requests to one host never overlap and respect the politeness delay
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from issue_observatory.scraper.scheduler import DomainScheduler, domain_key
+
+
+class TestDomainKey:
+    def test_lowercases_host_and_drops_port_and_path(self) -> None:
+        assert domain_key("https://WWW.DR.dk:443/nyheder?x=1") == "www.dr.dk"
+
+    def test_invalid_url_returns_empty_key(self) -> None:
+        assert domain_key("not a url") == ""
+
+
+@pytest.mark.asyncio
+class TestDomainScheduler:
+    async def test_processes_every_item(self) -> None:
+        seen: list[str] = []
+
+        async def handler(url: str) -> None:
+            seen.append(url)
+
+        urls = [f"https://host{i % 3}.dk/{i}" for i in range(9)]
+        scheduler = DomainScheduler(delay_min=0, delay_max=0)
+        await scheduler.run(urls, handler, url_of=lambda u: u)
+
+        assert sorted(seen) == sorted(urls)
+
+    async def test_hosts_run_concurrently_up_to_global_limit(self) -> None:
+        running = 0
+        peak = 0
+
+        async def handler(url: str) -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        urls = [f"https://host{i}.dk/" for i in range(10)]
+        scheduler = DomainScheduler(delay_min=0, delay_max=0, max_concurrency=4)
+        await scheduler.run(urls, handler, url_of=lambda u: u)
+
+        assert peak == 4
+
+    async def test_same_host_is_serialised_with_delay(self) -> None:
+        loop = asyncio.get_running_loop()
+        spans: list[tuple[float, float]] = []
+
+        async def handler(url: str) -> None:
+            start = loop.time()
+            await asyncio.sleep(0.01)
+            spans.append((start, loop.time()))
+
+        urls = [f"https://dr.dk/{i}" for i in range(3)]
+        scheduler = DomainScheduler(delay_min=0.05, delay_max=0.05, max_concurrency=8)
+        await scheduler.run(urls, handler, url_of=lambda u: u)
+
+        spans.sort()
+        for (_, prev_end), (next_start, _) in zip(spans, spans[1:]):
+            assert next_start - prev_end >= 0.045
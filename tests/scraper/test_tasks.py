@@ -6,6 +6,7 @@ using mocked DB session and mocked HTTP fetcher.
 
 from __future__ import annotations
 
+import threading
 import uuid
 from datetime import UTC, datetime
 from typing import Any
@@ -43,6 +44,11 @@ def _make_job(
     }
 
 
+def _flushed_count(mock_flush: MagicMock, column: str) -> int:
+    """Sum the increments of ``column`` over all _flush_progress calls."""
+    return sum(c.args[1].get(column, 0) for c in mock_flush.call_args_list)
+
+
 # ---------------------------------------------------------------------------
 # _load_job
 # ---------------------------------------------------------------------------
@@ -92,10 +98,13 @@ class TestRunScrapingCollectionRun:
                 "issue_observatory.scraper.tasks._get_thin_records",
                 return_value=thin_records,
             ),
-            patch("issue_observatory.scraper.tasks._increment_counter"),
+            patch("issue_observatory.scraper.tasks._flush_progress"),
             patch(
                 "issue_observatory.scraper.tasks._update_content_record_v2"
             ) as mock_update,
+            patch(
+                "issue_observatory.workers._task_helpers.invalidate_analysis_cache"
+            ) as mock_invalidate,
             patch(
                 "issue_observatory.scraper.tasks.fetch_url",
                 new_callable=AsyncMock,
@@ -120,6 +129,7 @@ class TestRunScrapingCollectionRun:
         call_kwargs = mock_update.call_args[1]
         assert call_kwargs["record_id"] == record_id
         assert call_kwargs["published_at"] == pub_at
+        mock_invalidate.assert_called_once_with(run_id)
 
     async def test_collection_run_mode_skips_on_error(self) -> None:
         """Failed URL fetches should increment urls_failed and continue."""
@@ -139,8 +149,8 @@ class TestRunScrapingCollectionRun:
                 return_value=thin_records,
             ),
             patch(
-                "issue_observatory.scraper.tasks._increment_counter"
-            ) as mock_inc,
+                "issue_observatory.scraper.tasks._flush_progress"
+            ) as mock_flush,
             patch(
                 "issue_observatory.scraper.tasks.fetch_url",
                 new_callable=AsyncMock,
@@ -150,10 +160,7 @@ class TestRunScrapingCollectionRun:
             await _run_scraping(job_id, "celery-task-456")
 
         # Should have incremented urls_failed
-        failed_calls = [
-            call for call in mock_inc.call_args_list if call[0][1] == "urls_failed"
-        ]
-        assert len(failed_calls) == 1
+        assert _flushed_count(mock_flush, "urls_failed") == 1
 
 
 # ---------------------------------------------------------------------------
@@ -172,7 +179,7 @@ class TestRunScrapingManualUrls:
         with (
             patch("issue_observatory.scraper.tasks._load_job", return_value=job),
             patch("issue_observatory.scraper.tasks._update_job"),
-            patch("issue_observatory.scraper.tasks._increment_counter"),
+            patch("issue_observatory.scraper.tasks._flush_progress"),
             patch(
                 "issue_observatory.scraper.tasks._insert_manual_record"
             ) as mock_insert,
@@ -210,8 +217,8 @@ class TestRunScrapingManualUrls:
             patch("issue_observatory.scraper.tasks._load_job", return_value=job),
             patch("issue_observatory.scraper.tasks._update_job"),
             patch(
-                "issue_observatory.scraper.tasks._increment_counter"
-            ) as mock_inc,
+                "issue_observatory.scraper.tasks._flush_progress"
+            ) as mock_flush,
             patch(
                 "issue_observatory.scraper.tasks.fetch_url",
                 new_callable=AsyncMock,
@@ -226,7 +233,41 @@ class TestRunScrapingManualUrls:
         ):
             await _run_scraping(job_id, "celery-task-000")
 
-        skipped_calls = [
-            c for c in mock_inc.call_args_list if c[0][1] == "urls_skipped"
-        ]
-        assert len(skipped_calls) == 1
+        assert _flushed_count(mock_flush, "urls_skipped") == 1
+
+
+# ---------------------------------------------------------------------------
+# _JobProgress
+# ---------------------------------------------------------------------------
+
+
+class TestJobProgress:
+    @pytest.mark.asyncio
+    async def test_outcomes_are_flushed_in_batches(self) -> None:
+        """Counters and URL errors are written once per batch, not per URL."""
+        from issue_observatory.scraper.tasks import _JobProgress
+
+        flush_threads: list[threading.Thread] = []
+
+        with patch(
+            "issue_observatory.scraper.tasks._flush_progress",
+            side_effect=lambda *_args: flush_threads.append(threading.current_thread()),
+        ) as mock_flush:
+            progress = _JobProgress("job-1", flush_every=3, flush_interval=3600)
+            await progress.add("urls_enriched")
+            await progress.add("urls_skipped", "https://a.dk/", "robots.txt disallowed")
+            assert mock_flush.call_count == 0
+            await progress.add("urls_enriched")
+            await progress.add("urls_failed", "https://b.dk/", "error: boom")
+            await progress.flush()
+
+        assert mock_flush.call_count == 2
+        # The sync DB writes run off the event loop thread.
+        assert threading.main_thread() not in flush_threads
+        first, second = (c.args for c in mock_flush.call_args_list)
+        assert first == (
+            "job-1",
+            {"urls_enriched": 2, "urls_skipped": 1},
+            {"https://a.dk/": "robots.txt disallowed"},
+        )
+        assert second == ("job-1", {"urls_failed": 1}, {"https://b.dk/": "error: boom"})
@@ -0,0 +1,243 @@
+"""Unit tests for batch enrichment: enrich_batch() hooks and EnrichmentPipeline.
+
+Covers:
+- ContentEnricher.enrich_batch() default returns per-record results and
+  exceptions in input order
+- EnrichmentPipeline only passes applicable records to each enricher
+- Results are grouped by record id, then enricher name
+- Per-record failures are reported in BatchOutcome.errors
+- Enrichers with write_relational are queued for the relational write
+- A failing process pool falls back to in-process execution
+- NamedEntityExtractor batches through nlp.pipe with a single call
+- LanguageDetector.enrich_batch() falls back without langdetect
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# ---------------------------------------------------------------------------
+# Env bootstrap (must run before any application imports)
+# ---------------------------------------------------------------------------
+
+os.environ.setdefault("PSEUDONYMIZATION_SALT", "test-pseudonymization-salt-for-unit-tests")
+os.environ.setdefault("SECRET_KEY", "test-secret-key-for-tests-only")
+os.environ.setdefault("CREDENTIAL_ENCRYPTION_KEY", "dGVzdC1mZXJuZXQta2V5LTMyLWJ5dGVzLXBhZGRlZA==")
+
+from issue_observatory.analysis.enrichments import named_entity_extractor
+from issue_observatory.analysis.enrichments.base import ContentEnricher, EnrichmentError
+from issue_observatory.analysis.enrichments.language_detector import LanguageDetector
+from issue_observatory.analysis.enrichments.named_entity_extractor import (
+    NamedEntityExtractor,
+)
+from issue_observatory.analysis.enrichments.pipeline import EnrichmentPipeline
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(autouse=True)
+def _close_stale_event_loop() -> None:
+    """Close the loop pytest-asyncio leaves installed after async tests.
+
+    The code under test calls ``asyncio.run()``, which unsets the current
+    loop on exit; an unclosed leftover loop would otherwise surface as a
+    ResourceWarning (an error under this project's warning filters).
+    """
+    try:
+        loop = asyncio.get_event_loop_policy().get_event_loop()
+    except RuntimeError:
+        return
+    if not loop.is_running() and not loop.is_closed():
+        loop.close()
+
+
+class _LengthEnricher(ContentEnricher):
+    """Records text length; fails on texts containing 'boom'."""
+
+    enricher_name = "length"
+
+    def is_applicable(self, record: dict[str, Any]) -> bool:
+        return bool(record.get("text_content"))
+
+    async def enrich(self, record: dict[str, Any]) -> dict[str, Any]:
+        text = record["text_content"]
+        if "boom" in text:
+            raise EnrichmentError("boom")
+        return {"length": len(text)}
+
+
+class _CpuEnricher(_LengthEnricher):
+    enricher_name = "cpu_length"
+    cpu_bound = True
+
+
+class _RelationalEnricher(_LengthEnricher):
+    enricher_name = "relational"
+
+    def write_relational(self, record: dict[str, Any], result: dict[str, Any]) -> None:
+        """Not called by the pipeline itself."""
+
+
+def _records(*texts: str | None) -> list[dict[str, Any]]:
+    return [{"id": f"r{i}", "text_content": t} for i, t in enumerate(texts)]
+
+
+# ---------------------------------------------------------------------------
+# ContentEnricher.enrich_batch
+# ---------------------------------------------------------------------------
+
+
+class TestDefaultEnrichBatch:
+    def test_results_in_input_order(self) -> None:
+        results = asyncio.run(_LengthEnricher().enrich_batch(_records("a", "bbb")))
+
+        assert results == [{"length": 1}, {"length": 3}]
+
+    def test_failures_returned_as_exceptions(self) -> None:
+        results = asyncio.run(_LengthEnricher().enrich_batch(_records("ok", "boom", "fine")))
+
+        assert results[0] == {"length": 2}
+        assert isinstance(results[1], EnrichmentError)
+        assert results[2] == {"length": 4}
+
+
+# ---------------------------------------------------------------------------
+# EnrichmentPipeline
+# ---------------------------------------------------------------------------
+
+
+class TestEnrichmentPipeline:
+    def test_groups_results_by_record(self) -> None:
+        pipeline = EnrichmentPipeline([_LengthEnricher(), _CpuEnricher()])
+
+        outcome = pipeline.run_batch(_records("abc", None, "de"))
+
+        assert outcome.results == {
+            "r0": {"length": {"length": 3}, "cpu_length": {"length": 3}},
+            "r2": {"length": {"length": 2}, "cpu_length": {"length": 2}},
+        }
+        assert outcome.enrichments_applied == 4
+        assert outcome.errors == []
+
+    def test_errors_reported_per_record(self) -> None:
+        pipeline = EnrichmentPipeline([_LengthEnricher()])
+
+        outcome = pipeline.run_batch(_records("ok", "boom"))
+
+        assert list(outcome.results) == ["r0"]
+        assert len(outcome.errors) == 1
+        enricher_name, record_id, exc = outcome.errors[0]
+        assert (enricher_name, record_id) == ("length", "r1")
+        assert isinstance(exc, EnrichmentError)
+
+    def test_relational_enrichers_are_queued(self) -> None:
+        enricher = _RelationalEnricher()
+        pipeline = EnrichmentPipeline([enricher, _LengthEnricher()])
+
+        outcome = pipeline.run_batch(_records("abc"))
+
+        assert len(outcome.relational) == 1
+        queued_enricher, record, result = outcome.relational[0]
+        assert queued_enricher is enricher
+        assert record["id"] == "r0"
+        assert result == {"length": 3}
+
+    def test_each_enricher_called_once_per_batch(self) -> None:
+        enricher = _LengthEnricher()
+        with patch.object(enricher, "enrich_batch", wraps=enricher.enrich_batch) as spy:
+            EnrichmentPipeline([enricher]).run_batch(_records("a", "b", "c"))
+
+        assert spy.call_count == 1
+        assert len(spy.call_args.args[0]) == 3
+
+    def test_process_pool_failure_falls_back_in_process(self) -> None:
+        broken_pool = MagicMock()
+        broken_pool.submit.side_effect = AssertionError(
+            "daemonic processes are not allowed to have children"
+        )
+        with patch(
+            "issue_observatory.analysis.enrichments.pipeline.ProcessPoolExecutor",
+            return_value=broken_pool,
+        ) as pool_cls:
+            with EnrichmentPipeline([_CpuEnricher()], process_workers=2) as pipeline:
+                first = pipeline.run_batch(_records("abc"))
+                second = pipeline.run_batch(_records("de"))
+
+        assert first.results == {"r0": {"cpu_length": {"length": 3}}}
+        assert second.results == {"r0": {"cpu_length": {"length": 2}}}
+        # The pool is abandoned after the first failure.
+        assert pool_cls.call_count == 1
+
+    def test_no_pool_without_cpu_bound_enrichers(self) -> None:
+        with patch(
+            "issue_observatory.analysis.enrichments.pipeline.ProcessPoolExecutor"
+        ) as pool_cls:
+            EnrichmentPipeline([_LengthEnricher()], process_workers=4).run_batch(_records("abc"))
+
+        pool_cls.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# Built-in enrichers
+# ---------------------------------------------------------------------------
+
+
+def _fake_doc(text: str) -> MagicMock:
+    ent = MagicMock()
+    ent.label_ = "PER"
+    ent.text = "Mette Frederiksen"
+    ent.start_char = text.find(ent.text)
+    ent.end_char = ent.start_char + len(ent.text)
+    doc = MagicMock()
+    doc.ents = [ent]
+    return doc
+
+
+class TestBuiltInEnrichBatch:
+    def test_ner_uses_single_pipe_call(self) -> None:
+        texts = [f"Mette Frederiksen sagde noget om sag nummer {i}." for i in range(3)]
+        nlp = MagicMock()
+        nlp.pipe.side_effect = lambda batch, batch_size: [_fake_doc(t) for t in batch]
+
+        with patch.object(named_entity_extractor, "_get_nlp", return_value=nlp):
+            results = asyncio.run(NamedEntityExtractor().enrich_batch(_records(*texts)))
+
+        nlp.pipe.assert_called_once()
+        nlp.assert_not_called()
+        assert len(results) == 3
+        for result in results:
+            assert isinstance(result, dict)
+            assert result["model"] == "da_core_news_lg"
+            assert result["entities"][0]["role"] == "speaker"
+
+    def test_ner_stub_mode_without_spacy(self) -> None:
+        with patch.object(named_entity_extractor, "_get_nlp", return_value=None):
+            results = asyncio.run(NamedEntityExtractor().enrich_batch(_records("x" * 120)))
+
+        assert results[0]["model"] == "stub"
+
+    def test_language_detector_fallback_without_langdetect(self) -> None:
+        detector = LanguageDetector(expected_languages=["da"])
+
+        with patch.dict("sys.modules", {"langdetect": None}):
+            results = asyncio.run(detector.enrich_batch(_records("hej", "med dig")))
+
+        assert (
+            results
+            == [
+                {
+                    "language": "da",
+                    "confidence": None,
+                    "detector": "heuristic_single_lang",
+                    "expected": True,
+                }
+            ]
+            * 2
+        )
@@ -0,0 +1,312 @@
+"""Unit tests for incremental emergent-term statistics (analysis/term_statistics.py).
+
+Covers:
+- Tokenization lowercases and drops stop words and single characters
+- Folding documents in two batches equals folding them at once
+- Ranking honours min_doc_frequency, excluded terms and numeric tokens
+- update_and_rank() folds documents into JSON-encoded stored chunks
+- Statistics survive to_dict()/from_dict() and to_chunks()/from_chunks()
+- run_cpu_bound() falls back to a thread when the pool is disabled or fails
+- get_emergent_terms() resumes from stored statistics, only fetches new
+  records and fetches batches until it has caught up or hit the per-call
+  batch limit
+"""
+
+from __future__ import annotations
+
+import json
+import uuid
+from datetime import UTC, datetime
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from issue_observatory.analysis import term_statistics
+from issue_observatory.analysis.descriptive import get_emergent_terms
+from issue_observatory.analysis.term_statistics import (
+    VOCABULARY_CHUNKS,
+    TermStatistics,
+    run_cpu_bound,
+    tokenize,
+    update_and_rank,
+)
+
+_TEXTS = [
+    "klimaforandringer og grøn omstilling er vigtigt for Danmark",
+    "klimaforandringer påvirker økonomien og miljøet",
+    "grøn omstilling er nødvendig for fremtiden",
+    "økonomien er påvirket af klimaforandringer",
+    "Danmark satser på grøn omstilling i 2026",
+    "miljøet skal beskyttes mod klimaforandringer",
+]
+
+
+@pytest.fixture(autouse=True)
+def _thread_only(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep the tests in-process; the pool itself is covered separately."""
+    monkeypatch.setattr(term_statistics, "_pool", None)
+    monkeypatch.setattr(term_statistics, "_pool_disabled", True)
+
+
+class TestTermStatistics:
+    def test_tokenize_drops_stop_words(self) -> None:
+        assert tokenize("Klimaet og DANMARK i en krise") == ["klimaet", "danmark", "krise"]
+
+    def test_incremental_equals_batch(self) -> None:
+        whole = TermStatistics()
+        whole.add_documents(_TEXTS)
+        parts = TermStatistics()
+        parts.add_documents(_TEXTS[:2])
+        parts.add_documents(_TEXTS[2:])
+
+        assert parts.doc_count == whole.doc_count == 6
+        assert parts.document_frequency == whole.document_frequency
+        assert parts.rank(10) == whole.rank(10)
+
+    def test_rank_filters(self) -> None:
+        stats = TermStatistics()
+        stats.add_documents([*_TEXTS, "2026 er et år"])
+
+        terms = [r["term"] for r in stats.rank(50, exclude={"grøn"})]
+
+        assert "klimaforandringer" in terms
+        assert "grøn" not in terms
+        assert "2026" not in terms
+        # "satser" occurs once only.
+        assert "satser" not in terms
+        assert all(len(t) >= 2 for t in terms)
+
+    def test_rank_orders_by_score(self) -> None:
+        stats = TermStatistics()
+        stats.add_documents(_TEXTS)
+
+        ranked = stats.rank(5)
+
+        scores = [r["score"] for r in ranked]
+        assert scores == sorted(scores, reverse=True)
+        assert ranked[0]["document_frequency"] >= 2
+
+    def test_round_trip(self) -> None:
+        stats = TermStatistics(watermark=["2026-01-01T00:00:00+00:00", str(uuid.uuid4())])
+        stats.add_documents(_TEXTS)
+
+        assert TermStatistics.from_dict(stats.to_dict()) == stats
+
+    def test_chunk_round_trip(self) -> None:
+        stats = TermStatistics(watermark=["2026-01-01T00:00:00+00:00", str(uuid.uuid4())])
+        stats.add_documents(_TEXTS)
+
+        header, chunks = stats.to_chunks()
+
+        assert len(chunks) == VOCABULARY_CHUNKS
+        assert "document_frequency" not in header
+        assert sum(len(c) for c in chunks) == len(stats.document_frequency)
+        assert TermStatistics.from_chunks(header, chunks) == stats
+
+    def test_update_and_rank_in_two_steps_equals_whole(self) -> None:
+        header, chunks, _ = update_and_rank(None, None, _TEXTS[:3], 10, 2, frozenset())
+        header, chunks, ranked = update_and_rank(
+            {**header, "watermark": ["2026-01-01T00:00:00+00:00", "x"]},
+            chunks,
+            _TEXTS[3:],
+            10,
+            2,
+            frozenset(),
+        )
+        whole = TermStatistics()
+        whole.add_documents(_TEXTS)
+
+        assert header == {"doc_count": 6, "watermark": ["2026-01-01T00:00:00+00:00", "x"]}
+        assert chunks is not None and all(isinstance(c, str) for c in chunks)
+        assert ranked == whole.rank(10)
+        assert ranked[0]["term"] in {"klimaforandringer", "grøn", "omstilling"}
+
+    def test_update_and_rank_without_new_texts_stores_nothing(self) -> None:
+        header, chunks, _ = update_and_rank(None, None, _TEXTS, 10, 2, frozenset())
+
+        _, unchanged, ranked = update_and_rank(header, chunks, [], 10, 2, frozenset({"grøn"}))
+
+        assert unchanged is None
+        assert ranked and "grøn" not in [r["term"] for r in ranked]
+
+
+class TestRunCpuBound:
+    async def test_thread_fallback_when_disabled(self) -> None:
+        assert await run_cpu_bound(sum, [1, 2, 3]) == 6
+
+    async def test_pool_submit_failure_falls_back(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        pool = MagicMock()
+        pool.submit.side_effect = OSError("cannot spawn")
+        monkeypatch.setattr(term_statistics, "_pool", pool)
+        monkeypatch.setattr(term_statistics, "_pool_disabled", False)
+
+        assert await run_cpu_bound(sum, [1, 2]) == 3
+        assert term_statistics._pool_disabled is True
+        pool.shutdown.assert_called_once()
+
+    async def test_function_errors_propagate(self) -> None:
+        with pytest.raises(TypeError):
+            await run_cpu_bound(sum, [1, "x"])
+
+
+# ---------------------------------------------------------------------------
+# get_emergent_terms with stored statistics
+# ---------------------------------------------------------------------------
+
+
+def _row(text: str, n: int) -> MagicMock:
+    return MagicMock(
+        text_content=text,
+        id=uuid.UUID(int=n),
+        collected_at=datetime(2026, 1, 1, n, tzinfo=UTC),
+    )
+
+
+def _stored_state(texts: list[str], last: int) -> dict[str, Any]:
+    """What AnalysisCache.load_state returns for statistics over *texts*."""
+    stats = TermStatistics(
+        watermark=[f"2026-01-01 {last:02d}:00:00+00:00", str(uuid.UUID(int=last))]
+    )
+    stats.add_documents(texts)
+    header, chunks = stats.to_chunks()
+    return {**header, "chunks": [json.dumps(chunk) for chunk in chunks]}
+
+
+def _ranked_terms(texts: list[str]) -> list[str]:
+    stats = TermStatistics()
+    stats.add_documents(texts)
+    return [r["term"] for r in stats.rank(10)]
+
+
+class TestIncrementalEmergentTerms:
+    async def test_resumes_from_stored_statistics(self) -> None:
+        design_id = uuid.uuid4()
+        stored = _stored_state(_TEXTS[:4], 4)
+        cache = MagicMock()
+        cache.load_state = AsyncMock(return_value=stored)
+        cache.store_state = AsyncMock()
+        executed: list[tuple[str, dict[str, Any]]] = []
+
+        async def _execute(sql: Any, params: Any) -> MagicMock:
+            executed.append((str(sql), params))
+            result = MagicMock()
+            if "count(*)" in str(sql):
+                result.scalar_one.return_value = 4
+            elif "FROM search_terms" in str(sql):
+                result.fetchall.return_value = []
+            else:
+                result.fetchall.return_value = [_row(t, 5 + i) for i, t in enumerate(_TEXTS[4:])]
+            return result
+
+        db = MagicMock()
+        db.execute = AsyncMock(side_effect=_execute)
+
+        with patch(
+            "issue_observatory.analysis.descriptive.get_analysis_cache", return_value=cache
+        ):
+            result = await get_emergent_terms(db, query_design_id=design_id, top_n=10)
+
+        select_sql, select_params = executed[1]
+        assert "(collected_at, id) >" in select_sql
+        assert select_params["wm_id"] == str(uuid.UUID(int=4))
+        saved = cache.store_state.await_args.args[1]
+        assert saved["doc_count"] == 6
+        assert saved["watermark"][1] == str(uuid.UUID(int=6))
+        assert len(cache.store_state.await_args.kwargs["chunks"]) == VOCABULARY_CHUNKS
+        assert [r["term"] for r in result] == _ranked_terms(_TEXTS)
+
+    async def test_rebuilds_when_counted_records_disappear(self) -> None:
+        stored = _stored_state(_TEXTS, 6)
+        cache = MagicMock()
+        cache.load_state = AsyncMock(return_value=stored)
+        cache.store_state = AsyncMock()
+        executed: list[str] = []
+
+        async def _execute(sql: Any, params: Any) -> MagicMock:
+            executed.append(str(sql))
+            result = MagicMock()
+            # One record was deleted by retention since the last call.
+            result.scalar_one.return_value = 5
+            result.fetchall.return_value = [_row(t, 1 + i) for i, t in enumerate(_TEXTS[1:])]
+            return result
+
+        db = MagicMock()
+        db.execute = AsyncMock(side_effect=_execute)
+
+        with patch(
+            "issue_observatory.analysis.descriptive.get_analysis_cache", return_value=cache
+        ):
+            await get_emergent_terms(db, run_id=uuid.uuid4(), exclude_search_terms=False)
+
+        assert "(collected_at, id) >" not in executed[1]
+        assert cache.store_state.await_args.args[1]["doc_count"] == 5
+
+    async def test_fetches_batches_until_caught_up(self) -> None:
+        cache = MagicMock()
+        cache.load_state = AsyncMock(return_value=None)
+        cache.store_state = AsyncMock()
+        rows = [_row(t, 1 + i) for i, t in enumerate(_TEXTS)]
+        selects: list[dict[str, Any]] = []
+
+        async def _execute(sql: Any, params: Any) -> MagicMock:
+            selects.append(dict(params))
+            after = int(uuid.UUID(params["wm_id"])) if "wm_id" in params else 0
+            result = MagicMock()
+            result.fetchall.return_value = rows[after : after + 4]
+            return result
+
+        db = MagicMock()
+        db.execute = AsyncMock(side_effect=_execute)
+
+        with (
+            patch(
+                "issue_observatory.analysis.descriptive.get_analysis_cache", return_value=cache
+            ),
+            patch("issue_observatory.analysis.descriptive._EMERGENT_TERMS_BATCH_SIZE", 4),
+        ):
+            result = await get_emergent_terms(
+                db, run_id=uuid.uuid4(), top_n=10, exclude_search_terms=False
+            )
+
+        assert len(selects) == 2
+        assert selects[1]["wm_id"] == str(uuid.UUID(int=4))
+        cache.store_state.assert_awaited_once()
+        saved = cache.store_state.await_args.args[1]
+        assert saved["doc_count"] == 6
+        assert saved["watermark"][1] == str(uuid.UUID(int=6))
+        assert [r["term"] for r in result] == _ranked_terms(_TEXTS)
+
+    async def test_stops_at_batch_limit_and_serves_partial_statistics(self) -> None:
+        cache = MagicMock()
+        cache.load_state = AsyncMock(return_value=None)
+        cache.store_state = AsyncMock()
+        rows = [_row(t, 1 + i) for i, t in enumerate(_TEXTS)]
+        selects: list[dict[str, Any]] = []
+
+        async def _execute(sql: Any, params: Any) -> MagicMock:
+            selects.append(dict(params))
+            after = int(uuid.UUID(params["wm_id"])) if "wm_id" in params else 0
+            result = MagicMock()
+            result.fetchall.return_value = rows[after : after + 2]
+            return result
+
+        db = MagicMock()
+        db.execute = AsyncMock(side_effect=_execute)
+
+        with (
+            patch(
+                "issue_observatory.analysis.descriptive.get_analysis_cache", return_value=cache
+            ),
+            patch("issue_observatory.analysis.descriptive._EMERGENT_TERMS_BATCH_SIZE", 2),
+            patch("issue_observatory.analysis.descriptive._EMERGENT_TERMS_MAX_BATCHES", 3),
+        ):
+            await get_emergent_terms(db, run_id=uuid.uuid4(), exclude_search_terms=False)
+
+        assert len(selects) == 3
+        saved = cache.store_state.await_args.args[1]
+        assert saved["doc_count"] == 6
+        assert saved["watermark"][1] == str(uuid.UUID(int=6))
+        assert cache.store_state.await_args.kwargs["encoded"] is True
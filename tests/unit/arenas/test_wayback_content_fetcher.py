@@ -101,7 +101,6 @@ class TestFetchSingleRecordContentHttpError:
 
         record = _make_record_with_wayback_url()
         semaphore = _make_semaphore()
-        robots_cache: dict[str, bool] = {}
 
         mock_client = MagicMock()
 
@@ -113,7 +112,6 @@ class TestFetchSingleRecordContentHttpError:
                 record=record,
                 client=mock_client,
                 semaphore=semaphore,
-                robots_cache=robots_cache,
             )
 
         # Must return the dict — not raise
@@ -138,7 +136,6 @@ class TestFetchSingleRecordContentHttpError:
 
         record = _make_record_with_wayback_url()
         semaphore = _make_semaphore()
-        robots_cache: dict[str, bool] = {}
         mock_client = MagicMock()
 
         # Simulate a FetchResult with an error (e.g. 404 response)
@@ -155,7 +152,6 @@ class TestFetchSingleRecordContentHttpError:
                 record=record,
                 client=mock_client,
                 semaphore=semaphore,
-                robots_cache=robots_cache,
             )
 
         assert isinstance(result, dict)
@@ -175,7 +171,6 @@ class TestFetchSingleRecordContentHttpError:
 
         record = _make_record_without_wayback_url()
         semaphore = _make_semaphore()
-        robots_cache: dict[str, bool] = {}
         mock_client = MagicMock()
 
         with patch(
@@ -186,7 +181,6 @@ class TestFetchSingleRecordContentHttpError:
                 record=record,
                 client=mock_client,
                 semaphore=semaphore,
-                robots_cache=robots_cache,
             )
 
         assert isinstance(result, dict)
@@ -221,7 +215,6 @@ class TestFetchSingleRecordContentSizeGuard:
 
         record = _make_record_with_wayback_url()
         semaphore = _make_semaphore()
-        robots_cache: dict[str, bool] = {}
         mock_client = MagicMock()
 
         # Successful fetch but oversized body
@@ -241,7 +234,6 @@ class TestFetchSingleRecordContentSizeGuard:
                 record=record,
                 client=mock_client,
                 semaphore=semaphore,
-                robots_cache=robots_cache,
             )
 
         assert isinstance(result, dict)
@@ -267,7 +259,6 @@ class TestFetchSingleRecordContentSizeGuard:
 
         record = _make_record_with_wayback_url()
         semaphore = _make_semaphore()
-        robots_cache: dict[str, bool] = {}
         mock_client = MagicMock()
 
         mock_fetch_result = MagicMock()
@@ -291,7 +282,6 @@ class TestFetchSingleRecordContentSizeGuard:
                 record=record,
                 client=mock_client,
                 semaphore=semaphore,
-                robots_cache=robots_cache,
             )
 
         assert isinstance(result, dict)
@@ -0,0 +1,334 @@
+"""Unit tests for the Redis analysis result cache in core/analysis_cache.py.
+
+Tests cover:
+- A miss computes and stores the result; the next identical call is a hit
+- Different parameters produce different cache entries
+- Bumping a run or design data version makes previous entries unreachable
+- Concurrent identical calls within one process compute once
+- Exceptions from the computation propagate and are not cached
+- Redis failures bypass the cache instead of failing the request
+- bump_data_versions() increments the expected version keys
+- The emergent-terms routes exclude search terms after the cache read
+
+Redis is replaced by a small in-memory fake; no server is required.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from datetime import datetime
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from issue_observatory.core.analysis_cache import (
+    AnalysisCache,
+    bump_data_versions,
+    content_record_scopes,
+    data_version_key,
+)
+
+_RUN_ID = uuid.UUID("00000000-0000-0000-0000-000000000001")
+_DESIGN_ID = uuid.UUID("00000000-0000-0000-0000-0000000000d1")
+
+
+class _FakePipeline:
+    def __init__(self, redis: _FakeRedis) -> None:
+        self._redis = redis
+        self._ops: list[tuple[str, tuple[Any, ...], dict[str, Any]]] = []
+
+    def incr(self, key: str) -> None:
+        self._ops.append(("incr", (key,), {}))
+
+    def set(self, key: str, value: str, **kwargs: Any) -> None:
+        self._ops.append(("set", (key, value), kwargs))
+
+    async def execute(self) -> list[Any]:
+        return [
+            await getattr(self._redis, op)(*args, **kwargs) for op, args, kwargs in self._ops
+        ]
+
+
+class _FakeRedis:
+    """The subset of redis.asyncio.Redis used by AnalysisCache."""
+
+    def __init__(self) -> None:
+        self.store: dict[str, str] = {}
+
+    async def get(self, key: str) -> str | None:
+        return self.store.get(key)
+
+    async def mget(self, keys: list[str]) -> list[str | None]:
+        return [self.store.get(k) for k in keys]
+
+    async def set(
+        self, key: str, value: str, ex: int | None = None, px: int | None = None, nx: bool = False
+    ) -> bool:
+        if nx and key in self.store:
+            return False
+        self.store[key] = value
+        return True
+
+    async def exists(self, key: str) -> int:
+        return int(key in self.store)
+
+    async def incr(self, key: str) -> int:
+        value = int(self.store.get(key, 0)) + 1
+        self.store[key] = str(value)
+        return value
+
+    async def eval(self, script: str, numkeys: int, key: str, token: str) -> int:
+        if self.store.get(key) == token:
+            del self.store[key]
+            return 1
+        return 0
+
+    def pipeline(self, transaction: bool = True) -> _FakePipeline:
+        return _FakePipeline(self)
+
+
+def _cache(redis: Any) -> AnalysisCache:
+    cache = AnalysisCache(redis_url="redis://unused")
+    cache._redis = redis
+    return cache
+
+
+class _Counter:
+    """Async compute function that counts its invocations."""
+
+    def __init__(self, result: Any = None) -> None:
+        self.calls = 0
+        self.result = result if result is not None else [{"count": 1}]
+
+    async def __call__(self) -> Any:
+        self.calls += 1
+        await asyncio.sleep(0)
+        return self.result
+
+
+class TestGetOrCompute:
+    async def test_miss_then_hit(self) -> None:
+        redis = _FakeRedis()
+        cache = _cache(redis)
+        compute = _Counter()
+
+        first = await cache.get_or_compute("run.volume", compute, {"a": 1}, run_ids=[_RUN_ID])
+        second = await cache.get_or_compute("run.volume", compute, {"a": 1}, run_ids=[_RUN_ID])
+
+        assert first == second == [{"count": 1}]
+        assert compute.calls == 1
+        assert any(k.startswith("analysis:cache:run.volume:") for k in redis.store)
+
+    async def test_params_are_part_of_key(self) -> None:
+        cache = _cache(_FakeRedis())
+        compute = _Counter()
+
+        await cache.get_or_compute("run.volume", compute, {"granularity": "day"})
+        await cache.get_or_compute("run.volume", compute, {"granularity": "week"})
+
+        assert compute.calls == 2
+
+    async def test_result_is_json_encoded(self) -> None:
+        cache = _cache(_FakeRedis())
+        compute = _Counter([{"period": datetime(2026, 1, 1), "id": _RUN_ID}])
+
+        result = await cache.get_or_compute("run.volume", compute)
+
+        assert result == [{"period": "2026-01-01T00:00:00", "id": str(_RUN_ID)}]
+
+    async def test_run_version_bump_invalidates(self) -> None:
+        cache = _cache(_FakeRedis())
+        compute = _Counter()
+
+        await cache.get_or_compute("run.actors", compute, run_ids=[_RUN_ID])
+        await cache.invalidate(run_ids=[_RUN_ID])
+        await cache.get_or_compute("run.actors", compute, run_ids=[_RUN_ID])
+
+        assert compute.calls == 2
+
+    async def test_unrelated_bump_keeps_entry(self) -> None:
+        cache = _cache(_FakeRedis())
+        compute = _Counter()
+
+        await cache.get_or_compute("design.actors", compute, design_ids=[_DESIGN_ID])
+        await cache.invalidate(run_ids=[_RUN_ID])
+        await cache.get_or_compute("design.actors", compute, design_ids=[_DESIGN_ID])
+
+        assert compute.calls == 1
+
+    async def test_concurrent_calls_compute_once(self) -> None:
+        cache = _cache(_FakeRedis())
+        compute = _Counter()
+
+        results = await asyncio.gather(
+            *(cache.get_or_compute("run.terms", compute, run_ids=[_RUN_ID]) for _ in range(5))
+        )
+
+        assert compute.calls == 1
+        assert all(r == [{"count": 1}] for r in results)
+
+    async def test_exception_propagates_and_is_not_cached(self) -> None:
+        redis = _FakeRedis()
+        cache = _cache(redis)
+
+        async def _fail() -> Any:
+            raise ValueError("bad granularity")
+
+        with pytest.raises(ValueError, match="bad granularity"):
+            await cache.get_or_compute("run.volume", _fail)
+
+        assert not any(k.startswith("analysis:cache:") for k in redis.store)
+        # The compute lock was released.
+        assert not any(k.startswith("analysis:lock:") for k in redis.store)
+
+    async def test_redis_failure_bypasses_cache(self) -> None:
+        redis = MagicMock()
+        redis.mget.side_effect = ConnectionError("redis down")
+        cache = _cache(redis)
+        compute = _Counter()
+
+        result = await cache.get_or_compute("run.volume", compute, run_ids=[_RUN_ID])
+
+        assert result == [{"count": 1}]
+        assert compute.calls == 1
+
+    async def test_disabled_cache_always_computes(self) -> None:
+        cache = AnalysisCache(enabled=False)
+        compute = _Counter()
+
+        await cache.get_or_compute("run.volume", compute)
+        await cache.get_or_compute("run.volume", compute)
+
+        assert compute.calls == 2
+
+
+class TestStateBlobs:
+    async def test_chunked_state_round_trip(self) -> None:
+        redis = _FakeRedis()
+        cache = _cache(redis)
+
+        await cache.store_state("terms:x", {"doc_count": 3}, chunks=[{"a": 1}, {"b": 2}])
+
+        assert set(redis.store) == {
+            "analysis:state:terms:x",
+            "analysis:state:terms:x:0",
+            "analysis:state:terms:x:1",
+        }
+        assert await cache.load_state("terms:x") == {
+            "doc_count": 3,
+            "chunks": [{"a": 1}, {"b": 2}],
+        }
+
+    async def test_encoded_chunks_are_stored_and_returned_as_is(self) -> None:
+        cache = _cache(_FakeRedis())
+
+        await cache.store_state("terms:x", {"doc_count": 3}, chunks=['{"a": 1}'], encoded=True)
+
+        assert await cache.load_state("terms:x") == {"doc_count": 3, "chunks": [{"a": 1}]}
+        assert await cache.load_state("terms:x", encoded=True) == {
+            "doc_count": 3,
+            "chunks": ['{"a": 1}'],
+        }
+
+    async def test_missing_chunk_discards_state(self) -> None:
+        redis = _FakeRedis()
+        cache = _cache(redis)
+        await cache.store_state("terms:x", {"doc_count": 3}, chunks=[{"a": 1}, {"b": 2}])
+        del redis.store["analysis:state:terms:x:1"]
+
+        assert await cache.load_state("terms:x") is None
+
+    async def test_unchunked_state(self) -> None:
+        cache = _cache(_FakeRedis())
+        await cache.store_state("plain", {"n": 1})
+
+        assert await cache.load_state("plain") == {"n": 1}
+
+
+class TestBumpDataVersions:
+    def test_increments_run_design_and_global_keys(self) -> None:
+        client = MagicMock()
+        pipe = client.pipeline.return_value
+
+        with patch("redis.from_url", return_value=client):
+            bump_data_versions(
+                "redis://unused", run_ids=[_RUN_ID], design_ids=[_DESIGN_ID], global_scope=True
+            )
+
+        keys = [c.args[0] for c in pipe.incr.call_args_list]
+        assert keys == [
+            data_version_key("run", _RUN_ID),
+            data_version_key("design", _DESIGN_ID),
+            "analysis:version:global",
+        ]
+        pipe.execute.assert_called_once()
+        client.close.assert_called_once()
+
+    def test_noop_without_scopes(self) -> None:
+        with patch("redis.from_url") as from_url:
+            bump_data_versions("redis://unused")
+
+        from_url.assert_not_called()
+
+    def test_failure_is_swallowed(self) -> None:
+        with patch("redis.from_url", side_effect=ConnectionError("redis down")):
+            bump_data_versions("redis://unused", run_ids=[_RUN_ID])
+
+
+class TestContentRecordScopes:
+    async def test_collects_runs_and_designs_and_drops_nulls(self) -> None:
+        other_run = uuid.uuid4()
+        rows = MagicMock()
+        rows.all.return_value = [
+            (_RUN_ID, _DESIGN_ID),
+            (other_run, _DESIGN_ID),
+            (None, None),
+        ]
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=rows)
+
+        run_ids, design_ids = await content_record_scopes(db)
+
+        assert run_ids == {_RUN_ID, other_run}
+        assert design_ids == {_DESIGN_ID}
+        db.execute.assert_awaited_once()
+
+
+class TestCachedEmergentTerms:
+    async def test_search_terms_are_excluded_after_the_cache_read(self) -> None:
+        from issue_observatory.api.routes import analysis
+
+        cache = _cache(_FakeRedis())
+        ranked = [
+            {"term": "klima", "score": 0.9, "document_frequency": 5},
+            {"term": "grøn", "score": 0.8, "document_frequency": 4},
+            {"term": "energi", "score": 0.7, "document_frequency": 3},
+        ]
+        compute = AsyncMock(return_value=ranked)
+        terms = MagicMock()
+        terms.fetchall.return_value = [("Klima",)]
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=terms)
+
+        with (
+            patch.object(analysis, "get_analysis_cache", return_value=cache),
+            patch.object(analysis, "get_emergent_terms", compute),
+        ):
+            compute.__name__ = "get_emergent_terms"
+            first = await analysis._cached_emergent_terms(
+                "run", db, run_ids=[_RUN_ID], query_design_id=_DESIGN_ID,
+                run_id=_RUN_ID, top_n=2, exclude_search_terms=True,
+            )
+            # A newly added search term applies to the cached ranking.
+            terms.fetchall.return_value = [("Klima",), ("grøn",)]
+            second = await analysis._cached_emergent_terms(
+                "run", db, run_ids=[_RUN_ID], query_design_id=_DESIGN_ID,
+                run_id=_RUN_ID, top_n=1, exclude_search_terms=True,
+            )
+
+        assert [t["term"] for t in first] == ["grøn", "energi"]
+        assert [t["term"] for t in second] == ["energi"]
+        assert compute.await_args_list[0].kwargs["exclude_search_terms"] is False
+        assert compute.await_args_list[0].kwargs["top_n"] == 3
@@ -0,0 +1,147 @@
+"""Unit tests for event-driven batch completion (workers/_completion_helpers.py).
+
+Tests cover:
+- run_id_for_task_end() only fires for arena tasks of a run that ended for good
+- request_completion_check() enqueues one event-driven check per burst of
+  task ends, and re-arms after clear_completion_check()
+- Redis failures fail open; a failed enqueue releases the debounce key
+
+Redis and the Celery app are mocked; no broker is required.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from issue_observatory.workers._completion_helpers import (
+    CHECK_BATCH_COMPLETION_TASK,
+    clear_completion_check,
+    request_completion_check,
+    run_id_for_task_end,
+)
+
+_RUN_ID = "00000000-0000-0000-0000-000000000001"
+_REDIS_URL = "redis://localhost:6379/0"
+
+
+class _FakeRedis:
+    """Sync stand-in for the SET NX / DEL commands the helpers use."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+
+    def set(self, key: str, value: str, nx: bool = False, ex: int | None = None) -> bool:
+        if nx and key in self.values:
+            return False
+        self.values[key] = value
+        return True
+
+    def delete(self, key: str) -> None:
+        self.values.pop(key, None)
+
+    def close(self) -> None:
+        pass
+
+
+class TestRunIdForTaskEnd:
+    @pytest.mark.parametrize("state", ["SUCCESS", "FAILURE"])
+    def test_arena_task_end_requests_check(self, state: str) -> None:
+        run_id = run_id_for_task_end(
+            "issue_observatory.arenas.bluesky.tasks.collect_by_terms",
+            {"collection_run_id": _RUN_ID, "terms": ["klima"]},
+            state,
+        )
+        assert run_id == _RUN_ID
+
+    def test_retry_does_not_request_check(self) -> None:
+        assert (
+            run_id_for_task_end(
+                "issue_observatory.arenas.bluesky.tasks.collect_by_terms",
+                {"collection_run_id": _RUN_ID},
+                "RETRY",
+            )
+            is None
+        )
+
+    def test_non_arena_tasks_and_runless_tasks_are_ignored(self) -> None:
+        assert (
+            run_id_for_task_end(
+                CHECK_BATCH_COMPLETION_TASK, {"collection_run_id": _RUN_ID}, "SUCCESS"
+            )
+            is None
+        )
+        assert (
+            run_id_for_task_end(
+                "issue_observatory.arenas.bluesky.tasks.stream_firehose", {}, "SUCCESS"
+            )
+            is None
+        )
+
+
+class TestRequestCompletionCheck:
+    def test_burst_of_task_ends_enqueues_one_check(self) -> None:
+        redis = _FakeRedis()
+        app = MagicMock()
+        with (
+            patch("redis.from_url", return_value=redis),
+            patch("issue_observatory.workers.celery_app.celery_app", app),
+        ):
+            assert request_completion_check(_RUN_ID, _REDIS_URL)
+            assert not request_completion_check(_RUN_ID, _REDIS_URL)
+
+            clear_completion_check(_RUN_ID, _REDIS_URL)
+            assert request_completion_check(_RUN_ID, _REDIS_URL)
+
+        assert app.send_task.call_count == 2
+        name = app.send_task.call_args.args[0]
+        assert name == CHECK_BATCH_COMPLETION_TASK
+        assert app.send_task.call_args.kwargs["kwargs"] == {"run_id": _RUN_ID, "sweep": False}
+
+    def test_redis_down_still_enqueues(self) -> None:
+        app = MagicMock()
+        with (
+            patch("redis.from_url", side_effect=ConnectionError("redis down")),
+            patch("issue_observatory.workers.celery_app.celery_app", app),
+        ):
+            assert request_completion_check(_RUN_ID, _REDIS_URL)
+
+        app.send_task.assert_called_once()
+
+    def test_failed_enqueue_releases_debounce(self) -> None:
+        redis = _FakeRedis()
+        app = MagicMock()
+        app.send_task.side_effect = [RuntimeError("broker down"), MagicMock()]
+        with (
+            patch("redis.from_url", return_value=redis),
+            patch("issue_observatory.workers.celery_app.celery_app", app),
+        ):
+            with pytest.raises(RuntimeError):
+                request_completion_check(_RUN_ID, _REDIS_URL)
+            assert request_completion_check(_RUN_ID, _REDIS_URL)
+
+
+class TestCheckBatchCompletionRetry:
+    @pytest.mark.parametrize("sweep", [False, True])
+    def test_db_error_retry_keeps_check_mode(self, sweep: bool) -> None:
+        """An event-driven check retried after a DB error must not start a sweep chain."""
+        from issue_observatory.workers import tasks
+
+        def _fail(coro: object) -> None:
+            coro.close()  # type: ignore[attr-defined]
+            raise ConnectionError("db down")
+
+        with (
+            patch.object(tasks, "run_async", side_effect=_fail),
+            patch.object(tasks, "clear_completion_check"),
+            patch.object(tasks.check_batch_completion, "apply_async") as apply_async,
+        ):
+            result = tasks.check_batch_completion.run(_RUN_ID, attempt=1, sweep=sweep)
+
+        assert result["status"] == "db_error_retry"
+        assert apply_async.call_args.kwargs["kwargs"] == {
+            "run_id": _RUN_ID,
+            "attempt": 2,
+            "sweep": sweep,
+        }
@@ -0,0 +1,334 @@
+"""Unit tests for the per-day content rollups.
+
+Tests cover:
+- Inserted rows fold into per-dimension deltas; rows without a design are skipped
+- Delta upserts take the shared design lock and add to existing counts
+- Slice recomputation deletes and rebuilds only the requested days
+- rollup_day_range() accepts only whole-UTC-day bounds
+- build_rollup_where() mirrors the show_all / duplicate / language predicates
+- get_volume_over_time() and get_top_terms() read the rollups only when eligible
+- find_drifted_slices() reports slices whose fingerprints differ
+
+Sessions are mocked; no database is required.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, date, datetime, time
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from issue_observatory.analysis.descriptive import get_top_terms, get_volume_over_time
+from issue_observatory.core import content_rollups
+from issue_observatory.core.content_rollups import (
+    _fold_inserted_rows,
+    add_slice,
+    apply_insert_deltas_sync,
+    build_rollup_where,
+    find_drifted_slices,
+    refresh_slices_sync,
+    rollup_day_range,
+)
+
+_QD = "00000000-0000-0000-0000-0000000000aa"
+_RUN = "00000000-0000-0000-0000-0000000000bb"
+
+
+def _inserted(**overrides: Any) -> SimpleNamespace:
+    row = {
+        "query_design_id": _QD,
+        "collection_run_id": _RUN,
+        "rollup_day": date(2026, 3, 1),
+        "platform": "bluesky",
+        "arena": "social_media",
+        "content_type": "post",
+        "rollup_language": "da",
+        "term_matched": True,
+        "rollup_duplicate": False,
+        "likes_count": 2,
+        "shares_count": None,
+        "comments_count": 1,
+        "views_count": None,
+        "search_terms_matched": ["vindmølle"],
+    }
+    row.update(overrides)
+    return SimpleNamespace(**row)
+
+
+def _executed_sql(db: MagicMock) -> list[str]:
+    return [str(c.args[0]) for c in db.execute.call_args_list]
+
+
+# ---------------------------------------------------------------------------
+# Insert deltas
+# ---------------------------------------------------------------------------
+
+
+class TestInsertDeltas:
+    def test_rows_with_same_dimensions_fold_into_one_delta(self) -> None:
+        records, terms = _fold_inserted_rows(
+            [_inserted(), _inserted(likes_count=3, search_terms_matched=["vindmølle", "havvind"])]
+        )
+
+        assert len(records) == 1
+        assert list(records.values()) == [[2, 5, 0, 2, 0]]
+        assert sorted((key[-1], n) for key, n in terms.items()) == [
+            ("havvind", 1),
+            ("vindmølle", 2),
+        ]
+
+    def test_rows_without_query_design_are_skipped(self) -> None:
+        records, terms = _fold_inserted_rows([_inserted(query_design_id=None)])
+
+        assert records == {}
+        assert terms == {}
+
+    def test_distinct_dimensions_produce_distinct_deltas(self) -> None:
+        records, _ = _fold_inserted_rows(
+            [_inserted(), _inserted(rollup_day=date(2026, 3, 2)), _inserted(rollup_duplicate=True)]
+        )
+
+        assert len(records) == 3
+
+    def test_apply_takes_shared_lock_then_upserts(self) -> None:
+        db = MagicMock()
+
+        apply_insert_deltas_sync(db, [_inserted()])
+
+        sql = _executed_sql(db)
+        assert "pg_advisory_xact_lock_shared" in sql[0]
+        assert sql[1].startswith("INSERT INTO content_daily_rollups")
+        assert "record_count = content_daily_rollups.record_count + EXCLUDED.record_count" in sql[1]
+        assert sql[2].startswith("INSERT INTO content_daily_term_rollups")
+
+    def test_apply_without_design_rows_issues_no_statements(self) -> None:
+        db = MagicMock()
+
+        apply_insert_deltas_sync(db, [_inserted(query_design_id=None)])
+
+        db.execute.assert_not_called()
+
+    def test_apply_is_noop_when_disabled(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(content_rollups, "rollups_enabled", lambda: False)
+        db = MagicMock()
+
+        apply_insert_deltas_sync(db, [_inserted()])
+
+        db.execute.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# Slice recomputation
+# ---------------------------------------------------------------------------
+
+
+class TestRefreshSlices:
+    def test_add_slice_uses_utc_day(self) -> None:
+        slices: content_rollups.RollupSlices = {}
+
+        add_slice(slices, _QD, datetime(2026, 3, 1, 23, 30, tzinfo=UTC))
+        add_slice(slices, _QD, None)
+        add_slice(slices, None, datetime(2026, 3, 1, tzinfo=UTC))
+
+        assert slices == {_QD: {date(2026, 3, 1), None}}
+
+    def test_refresh_rebuilds_requested_days_under_exclusive_lock(self) -> None:
+        db = MagicMock()
+
+        refreshed = refresh_slices_sync(db, {_QD: {date(2026, 3, 1), date(2026, 3, 3)}})
+
+        assert refreshed == 2
+        sql = _executed_sql(db)
+        assert "pg_advisory_xact_lock(" in sql[0]
+        assert sql[1].startswith("DELETE FROM content_daily_rollups")
+        assert sql[2].startswith("DELETE FROM content_daily_term_rollups")
+        assert sql[3].startswith("INSERT INTO content_daily_rollups")
+        assert "unnest(search_terms_matched)" in sql[4]
+        params = db.execute.call_args_list[1].args[1]
+        assert params["days"] == [date(2026, 3, 1), date(2026, 3, 3)]
+        assert params["lo"] == datetime(2026, 3, 1, tzinfo=UTC)
+        assert params["hi"] == datetime(2026, 3, 4, tzinfo=UTC)
+
+    def test_refresh_handles_undated_slice(self) -> None:
+        db = MagicMock()
+
+        refresh_slices_sync(db, {_QD: {None}})
+
+        sql = _executed_sql(db)
+        assert any("day IS NULL" in s for s in sql)
+        assert any("published_at IS NULL" in s for s in sql)
+
+    def test_refresh_with_no_slices_issues_no_statements(self) -> None:
+        db = MagicMock()
+
+        assert refresh_slices_sync(db, {}) == 0
+        db.execute.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# Read helpers
+# ---------------------------------------------------------------------------
+
+
+class TestRollupDayRange:
+    def test_whole_day_bounds_map_to_days(self) -> None:
+        start = datetime(2026, 3, 1, tzinfo=UTC)
+        end = datetime.combine(date(2026, 3, 31), time.max, UTC)
+
+        assert rollup_day_range(start, end) == (date(2026, 3, 1), date(2026, 3, 31))
+
+    def test_open_bounds_are_allowed(self) -> None:
+        assert rollup_day_range(None, None) == (None, None)
+
+    def test_naive_midnight_is_treated_as_utc(self) -> None:
+        assert rollup_day_range(datetime(2026, 3, 1), None) == (date(2026, 3, 1), None)
+
+    @pytest.mark.parametrize(
+        ("date_from", "date_to"),
+        [
+            (datetime(2026, 3, 1, 12, tzinfo=UTC), None),
+            (None, datetime(2026, 3, 31, tzinfo=UTC)),
+            (None, datetime(2026, 3, 31, 23, 59, 59, tzinfo=UTC)),
+        ],
+    )
+    def test_partial_day_bounds_are_rejected(
+        self, date_from: datetime | None, date_to: datetime | None
+    ) -> None:
+        assert rollup_day_range(date_from, date_to) is None
+
+
+class TestBuildRollupWhere:
+    def test_default_excludes_duplicates_and_exempts_actor_only_platforms(self) -> None:
+        params: dict[str, Any] = {}
+
+        where = build_rollup_where(params, query_design_ids=[_QD])
+
+        assert where.startswith("WHERE query_design_id IN (CAST(:_rqd_0 AS uuid))")
+        assert "NOT is_duplicate" in where
+        assert "(term_matched OR platform IN (" in where
+        assert {"facebook", "instagram"} <= set(params.values())
+
+    def test_filters_bind_values(self) -> None:
+        params: dict[str, Any] = {}
+
+        where = build_rollup_where(
+            params,
+            query_design_ids=[_QD],
+            arena="news",
+            exclude_platforms={"google_search"},
+            language="da-DK",
+            day_from=date(2026, 3, 1),
+            term_filter="matched",
+            include_duplicates=True,
+        )
+
+        assert "NOT is_duplicate" not in where
+        assert " term_matched" in where and "platform IN" not in where
+        assert "platform NOT IN (:_rexcl_0)" in where
+        assert params["_rlanguage"] == "da"
+        assert params["_rarena"] == "news"
+        assert params["_rday_from"] == date(2026, 3, 1)
+
+
+# ---------------------------------------------------------------------------
+# Analysis readers
+# ---------------------------------------------------------------------------
+
+
+def _mock_db(rows: list[Any]) -> MagicMock:
+    result = MagicMock()
+    result.fetchall.return_value = rows
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=result)
+    return db
+
+
+class TestRollupReaders:
+    async def test_volume_reads_rollups_for_eligible_query(self) -> None:
+        db = _mock_db(
+            [SimpleNamespace(period=datetime(2026, 3, 1, tzinfo=UTC), arena="news", cnt=4)]
+        )
+
+        result = await get_volume_over_time(
+            db,
+            query_design_ids=[_QD],
+            date_from=datetime(2026, 3, 1, tzinfo=UTC),
+            date_to=datetime.combine(date(2026, 3, 31), time.max, UTC),
+            include_linked=False,
+        )
+
+        assert "FROM content_daily_rollups" in str(db.execute.call_args.args[0])
+        assert result == [
+            {"period": "2026-03-01T00:00:00+00:00", "count": 4, "arenas": {"news": 4}}
+        ]
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"include_linked": True},
+            {"include_linked": False, "run_id": _RUN},
+            {"include_linked": False, "granularity": "hour"},
+            {"include_linked": False, "date_to": datetime(2026, 3, 31, 12, tzinfo=UTC)},
+        ],
+    )
+    async def test_volume_falls_back_to_raw_table(self, kwargs: dict[str, Any]) -> None:
+        db = _mock_db([])
+
+        await get_volume_over_time(db, query_design_ids=[_QD], **kwargs)
+
+        assert "FROM content_records" in str(db.execute.call_args.args[0])
+
+    async def test_top_terms_read_term_rollups(self) -> None:
+        db = _mock_db([SimpleNamespace(term="havvind", cnt=7)])
+
+        result = await get_top_terms(db, query_design_ids=[_QD], include_linked=False)
+
+        assert "FROM content_daily_term_rollups" in str(db.execute.call_args.args[0])
+        assert result == [{"term": "havvind", "count": 7}]
+
+
+# ---------------------------------------------------------------------------
+# Reconciliation
+# ---------------------------------------------------------------------------
+
+
+def _fingerprint(day: date | None, **values: int) -> SimpleNamespace:
+    base = {
+        "records": 10,
+        "matched": 8,
+        "duplicates": 1,
+        "with_language": 9,
+        "engagement": 50,
+        "term_matches": 12,
+    }
+    base.update(values)
+    return SimpleNamespace(query_design_id=_QD, day=day, **base)
+
+
+class TestFindDriftedSlices:
+    def test_matching_fingerprints_report_no_drift(self) -> None:
+        day = date(2026, 3, 1)
+        raw = [_fingerprint(day)]
+        rolled = [_fingerprint(day)]
+        terms = [SimpleNamespace(query_design_id=_QD, day=day, term_matches=12)]
+
+        checked, drifted = find_drifted_slices(raw, rolled, terms)
+
+        assert checked == 1
+        assert drifted == {}
+
+    def test_changed_counts_and_one_sided_slices_are_drift(self) -> None:
+        d1, d2, d3 = date(2026, 3, 1), date(2026, 3, 2), date(2026, 3, 3)
+        raw = [_fingerprint(d1, matched=9), _fingerprint(d2), _fingerprint(None)]
+        rolled = [_fingerprint(d1), _fingerprint(d3), _fingerprint(None)]
+        terms = [
+            SimpleNamespace(query_design_id=_QD, day=day, term_matches=12) for day in (d1, d3, None)
+        ]
+
+        checked, drifted = find_drifted_slices(raw, rolled, terms)
+
+        assert checked == 4
+        assert drifted == {_QD: {d1, d2, d3}}
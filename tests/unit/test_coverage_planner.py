@@ -0,0 +1,190 @@
+"""Unit tests for batched coverage planning in core/coverage_checker.py.
+
+Tests cover:
+- plan_coverage() issues one attempts query per platform, one content
+  fallback query for the terms that missed, and one batched backfill insert
+- Actors never use the content_records fallback
+- CoveragePlan gaps match compute_uncovered_ranges() per input and are
+  merged across inputs like check_existing_coverage()
+- task_gaps() round-trips through check_existing_coverage(planned_gaps=...)
+  without touching the database, and is ignored for another window/platform
+
+The synchronous session is mocked; no database is required.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from issue_observatory.core.coverage_checker import (
+    CoveragePlan,
+    check_existing_coverage,
+    plan_coverage,
+)
+
+_FROM = datetime(2026, 1, 1, tzinfo=UTC)
+_TO = datetime(2026, 1, 31, tzinfo=UTC)
+
+
+def _dt(day: int) -> datetime:
+    return datetime(2026, 1, day, tzinfo=UTC)
+
+
+class _FakeDb:
+    """Answers the planner's queries from per-platform canned rows."""
+
+    def __init__(
+        self,
+        attempts: dict[str, list[tuple[Any, ...]]],
+        content: dict[str, list[tuple[Any, ...]]],
+    ) -> None:
+        self.attempts = attempts
+        self.content = content
+        self.statements: list[tuple[str, Any]] = []
+
+    def execute(self, stmt: Any, params: Any = None) -> MagicMock:
+        sql = str(stmt)
+        self.statements.append((sql, params))
+        result = MagicMock()
+        if "FROM collection_attempts" in sql:
+            result.fetchall.return_value = self.attempts.get(params["platform"], [])
+        elif "FROM content_records" in sql:
+            rows = self.content.get(params["platform"], [])
+            result.fetchall.return_value = [r for r in rows if r[0] in params["terms"]]
+        return result
+
+    def commit(self) -> None:
+        pass
+
+    def sql_matching(self, fragment: str) -> list[tuple[str, Any]]:
+        return [(sql, params) for sql, params in self.statements if fragment in sql]
+
+
+def _plan(db: _FakeDb, **kwargs: Any) -> CoveragePlan:
+    @contextmanager
+    def _session() -> Any:
+        yield db
+
+    with patch("issue_observatory.core.database.get_sync_session", _session):
+        return plan_coverage(_FROM, _TO, **kwargs)
+
+
+class TestPlanCoverage:
+    def test_one_query_per_platform_and_tier(self) -> None:
+        """Hundreds of inputs still cost one attempts query per platform."""
+        terms = [f"term-{i}" for i in range(300)]
+        db = _FakeDb(
+            attempts={"bluesky": [("term", "term-1", _dt(1), _dt(20))]},
+            content={"bluesky": [("term-2", _dt(5), _dt(10))]},
+        )
+
+        plan = _plan(
+            db,
+            terms_by_platform={"bluesky": terms, "reddit": terms},
+            actors_by_platform={"bluesky": ["did:plc:a"]},
+        )
+
+        assert len(db.sql_matching("FROM collection_attempts")) == 2
+        assert len(db.sql_matching("FROM content_records")) == 2
+        assert len(db.sql_matching("INSERT INTO collection_attempts")) == 1
+        assert plan.platforms == {"bluesky", "reddit"}
+
+    def test_fallback_only_for_terms_without_attempts(self) -> None:
+        """Terms covered by attempts, and all actors, skip the content scan."""
+        db = _FakeDb(
+            attempts={"bluesky": [("term", "klima", _dt(1), _dt(20))]},
+            content={"bluesky": [("nato", _dt(5), _dt(10))]},
+        )
+
+        _plan(
+            db,
+            terms_by_platform={"bluesky": ["klima", "nato"]},
+            actors_by_platform={"bluesky": ["did:plc:a"]},
+        )
+
+        [(_, params)] = db.sql_matching("FROM content_records")
+        assert params["terms"] == ["nato"]
+        [(_, rows)] = db.sql_matching("INSERT INTO collection_attempts")
+        assert rows == [
+            {
+                "platform": "bluesky",
+                "input_value": "nato",
+                "input_type": "term",
+                "date_from": _dt(5).isoformat(),
+                "date_to": _dt(10).isoformat(),
+            }
+        ]
+
+    def test_gaps_per_input_and_merged(self) -> None:
+        """Per-input gaps come from the index; the union is merged."""
+        db = _FakeDb(
+            attempts={
+                "bluesky": [
+                    ("term", "klima", _dt(1), _dt(20)),
+                    ("actor", "did:plc:a", _dt(10), _dt(31)),
+                ]
+            },
+            content={"bluesky": [("nato", _dt(5), _dt(25))]},
+        )
+
+        plan = _plan(
+            db,
+            terms_by_platform={"bluesky": ["klima", "nato"]},
+            actors_by_platform={"bluesky": ["did:plc:a"]},
+        )
+
+        assert plan.gaps_for("bluesky", term="klima") == [(_dt(20), _TO)]
+        assert plan.gaps_for("bluesky", term="nato") == [(_FROM, _dt(5)), (_dt(25), _TO)]
+        assert plan.gaps_for("bluesky", term="unknown") == [(_FROM, _TO)]
+        assert plan.gaps_for("bluesky", actor_id="did:plc:a") == [(_FROM, _dt(10))]
+        assert plan.uncovered("bluesky", terms=["klima", "nato"]) == [
+            (_FROM, _dt(5)),
+            (_dt(20), _TO),
+        ]
+
+
+class TestPlannedGaps:
+    def _plan(self) -> CoveragePlan:
+        return CoveragePlan(
+            _FROM,
+            _TO,
+            {("bluesky", "term", "klima"): [(_dt(1), _dt(20))]},
+            platforms=["bluesky"],
+        )
+
+    def test_task_gaps_are_used_without_queries(self) -> None:
+        """A matching plan is returned as-is; the database is not queried."""
+        planned = self._plan().task_gaps("bluesky", terms=["klima"])
+
+        with patch("issue_observatory.core.database.get_sync_session") as session:
+            gaps = check_existing_coverage(
+                "bluesky", _FROM, _TO, terms=["klima"], planned_gaps=planned
+            )
+
+        session.assert_not_called()
+        assert gaps == [(_dt(20), _TO)]
+
+    def test_fully_covered_plan_returns_no_gaps(self) -> None:
+        plan = CoveragePlan(
+            _FROM, _TO, {("bluesky", "term", "klima"): [(_FROM, _TO)]}, platforms=["bluesky"]
+        )
+        planned = plan.task_gaps("bluesky", terms=["klima"])
+
+        assert check_existing_coverage("bluesky", _FROM, _TO, planned_gaps=planned) == []
+
+    def test_plan_for_other_window_or_platform_is_ignored(self) -> None:
+        """A plan that does not apply falls back to the per-input lookup."""
+        planned = self._plan().task_gaps("bluesky", terms=["klima"])
+
+        with patch(
+            "issue_observatory.core.coverage_checker.get_covered_ranges", return_value=[]
+        ) as lookup:
+            check_existing_coverage(
+                "bluesky", _FROM, _dt(15), terms=["klima"], planned_gaps=planned
+            )
+            check_existing_coverage("reddit", _FROM, _TO, terms=["klima"], planned_gaps=planned)
+
+        assert lookup.call_count == 2
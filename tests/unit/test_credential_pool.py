@@ -20,6 +20,11 @@ Tests cover:
 - _is_uuid() utility for valid and invalid strings
 - Redis helper methods swallow connection errors gracefully
 - NoCredentialAvailableError carries platform and tier attributes
+- acquire() serves repeat calls from the in-process credential cache with one
+  Lua call each, reloads on a stale cache version, rotates candidates LRU and
+  coalesces last_used_at writes
+- invalidate_credential_cache() clears the cache and bumps the version key
+- get() returns a named DB or env credential without leasing it
 
 All tests use mocked Redis (AsyncMock) and do NOT require a live database or
 Redis instance.
@@ -32,14 +37,28 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from issue_observatory.core import credential_pool
 from issue_observatory.core.credential_pool import (
     CredentialPool,
-    NoCredentialAvailableError,
     _decrypt_credentials,
     _is_uuid,
     get_credential_pool,
+    invalidate_credential_cache,
+)
+from issue_observatory.core.exceptions import (
+    ArenaAuthError,
+    ArenaRateLimitError,
+    NoCredentialAvailableError,
 )
-from issue_observatory.core.exceptions import ArenaAuthError, ArenaRateLimitError
+
+
+@pytest.fixture(autouse=True)
+def _reset_credential_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Isolate the module-level credential cache between tests."""
+    monkeypatch.setattr(credential_pool, "_credential_cache", {})
+    monkeypatch.setattr(credential_pool, "_pending_last_used", {})
+    monkeypatch.setattr(credential_pool, "_last_used_flushed_at", 0.0)
+
 
 # ---------------------------------------------------------------------------
 # Helper: build a pool with Redis pre-wired via an AsyncMock
@@ -413,6 +432,197 @@ class TestAcquireEnvFallback:
         assert result is None
 
 
+# ---------------------------------------------------------------------------
+# acquire() — cached candidates and atomic Lua acquisition
+# ---------------------------------------------------------------------------
+
+
+def _db_row(api_key: str, daily_quota: int | None = None) -> MagicMock:
+    row = MagicMock()
+    row.id = uuid.uuid4()
+    row.credentials = {"api_key": api_key}
+    row.daily_quota = daily_quota
+    row.monthly_quota = None
+    row.last_used_at = None
+    return row
+
+
+def _make_scripted_pool(
+    evalsha_results: list[list[object]],
+) -> tuple[CredentialPool, MagicMock]:
+    pool, mock_redis = _make_pool_with_mock_redis()
+    mock_redis.get = AsyncMock(return_value="3")  # cache version
+    mock_redis.script_load = AsyncMock(return_value="sha-acquire")
+    mock_redis.evalsha = AsyncMock(side_effect=evalsha_results)
+    return pool, mock_redis
+
+
+class TestAcquireCached:
+    async def test_repeat_acquire_uses_cache_and_one_script_call(self) -> None:
+        """The DB is queried once; each acquire is a single evalsha call."""
+        rows = [_db_row("key-a", daily_quota=100)]
+        pool, mock_redis = _make_scripted_pool([[0, "3"], [0, "3"]])
+        query = AsyncMock(return_value=rows)
+
+        with (
+            patch.object(pool, "_query_db_credentials", new=query),
+            patch.object(pool, "_update_last_used_at", new=AsyncMock(return_value=True)),
+        ):
+            first = await pool.acquire(platform="serper", tier="medium", task_id="t1")
+            second = await pool.acquire(platform="serper", tier="medium", task_id="t2")
+
+        assert first["api_key"] == second["api_key"] == "key-a"
+        query.assert_awaited_once()
+        assert mock_redis.evalsha.await_count == 2
+        args = mock_redis.evalsha.await_args_list[0].args
+        cred_id = str(rows[0].id)
+        # sha, numkeys, version key + 4 keys per candidate, then ARGV
+        assert args[1] == 5
+        assert args[2:7] == (
+            "credential:cache_version",
+            f"credential:cooldown:{cred_id}",
+            f"credential:quota:{cred_id}:daily",
+            f"credential:quota:{cred_id}:monthly",
+            f"credential:lease:{cred_id}:t1",
+        )
+        assert args[7] == "3"
+        assert args[-2:] == ("100", "-1")
+        # No per-step Redis round-trips.
+        mock_redis.setex.assert_not_called()
+        mock_redis.incr.assert_not_called()
+
+    async def test_stale_version_reloads_candidates(self) -> None:
+        """A version mismatch drops the cached entry and retries with fresh rows."""
+        old_row, new_row = _db_row("old-key"), _db_row("new-key")
+        pool, mock_redis = _make_scripted_pool([[-1, "4"], [0, "4"]])
+        mock_redis.get = AsyncMock(side_effect=["3", "4"])
+        query = AsyncMock(side_effect=[[old_row], [new_row]])
+
+        with (
+            patch.object(pool, "_query_db_credentials", new=query),
+            patch.object(pool, "_update_last_used_at", new=AsyncMock(return_value=True)),
+        ):
+            result = await pool.acquire(platform="serper", tier="medium")
+
+        assert result["api_key"] == "new-key"
+        assert query.await_count == 2
+        assert mock_redis.evalsha.await_args_list[1].args[7] == "4"
+
+    async def test_no_eligible_candidate_falls_back_to_env(self) -> None:
+        """When every DB credential is on cooldown or over quota, env vars are used."""
+        pool, _ = _make_scripted_pool([[-2, "3"]])
+        pool._env = {"SERPER_API_KEY": "env-key"}
+
+        rows = [_db_row("k")]
+        with patch.object(pool, "_query_db_credentials", new=AsyncMock(return_value=rows)):
+            result = await pool.acquire(platform="serper", tier="medium")
+
+        assert result["api_key"] == "env-key"
+
+    async def test_candidates_rotate_least_recently_used_first(self) -> None:
+        """The acquired credential moves to the back of the candidate order."""
+        rows = [_db_row("key-a"), _db_row("key-b")]
+        pool, mock_redis = _make_scripted_pool([[0, "3"], [0, "3"]])
+
+        with (
+            patch.object(pool, "_query_db_credentials", new=AsyncMock(return_value=rows)),
+            patch.object(pool, "_update_last_used_at", new=AsyncMock(return_value=True)),
+        ):
+            first = await pool.acquire(platform="serper", tier="medium")
+            second = await pool.acquire(platform="serper", tier="medium")
+
+        assert (first["api_key"], second["api_key"]) == ("key-a", "key-b")
+
+    async def test_last_used_at_writes_are_coalesced(self) -> None:
+        """Several acquisitions within the flush interval produce one batched write."""
+        rows = [_db_row("key-a"), _db_row("key-b")]
+        pool, _ = _make_scripted_pool([[0, "3"], [0, "3"], [0, "3"]])
+        update = AsyncMock(return_value=True)
+
+        with (
+            patch.object(pool, "_query_db_credentials", new=AsyncMock(return_value=rows)),
+            patch.object(pool, "_update_last_used_at", new=update),
+        ):
+            for _ in range(3):
+                await pool.acquire(platform="serper", tier="medium")
+
+        update.assert_awaited_once()
+        assert list(update.await_args.args[0]) == [str(rows[0].id)]
+        assert set(credential_pool._pending_last_used) == {str(r.id) for r in rows}
+
+    async def test_flush_last_used_writes_queued_timestamps(self) -> None:
+        """flush_last_used() writes the coalesced remainder and empties the queue."""
+        rows = [_db_row("key-a"), _db_row("key-b")]
+        pool, _ = _make_scripted_pool([[0, "3"], [0, "3"]])
+        update = AsyncMock(return_value=True)
+
+        with (
+            patch.object(pool, "_query_db_credentials", new=AsyncMock(return_value=rows)),
+            patch.object(pool, "_update_last_used_at", new=update),
+        ):
+            for _ in range(2):
+                await pool.acquire(platform="serper", tier="medium")
+            assert credential_pool.has_pending_last_used()
+            await pool.flush_last_used()
+            await pool.flush_last_used()
+
+        assert update.await_count == 2
+        assert list(update.await_args.args[0]) == [str(rows[1].id)]
+        assert not credential_pool.has_pending_last_used()
+
+    async def test_invalidate_credential_cache_bumps_version(self) -> None:
+        """invalidate_credential_cache() clears local entries and increments the version."""
+        credential_pool._credential_cache[("serper", "medium")] = MagicMock()
+        redis = MagicMock()
+        redis.incr = AsyncMock(return_value=5)
+
+        await invalidate_credential_cache(redis)
+
+        assert credential_pool._credential_cache == {}
+        redis.incr.assert_awaited_once_with("credential:cache_version")
+
+
+# ---------------------------------------------------------------------------
+# get()
+# ---------------------------------------------------------------------------
+
+
+class TestGet:
+    async def test_get_returns_named_db_credential_without_lease(self) -> None:
+        """get() picks the credential by ID and never touches leases or quotas."""
+        rows = [_db_row("key-a"), _db_row("key-b")]
+        pool, mock_redis = _make_scripted_pool([])
+
+        with patch.object(pool, "_query_db_credentials", new=AsyncMock(return_value=rows)):
+            result = await pool.get("serper", "medium", str(rows[1].id))
+
+        assert result is not None
+        assert (result["id"], result["api_key"]) == (str(rows[1].id), "key-b")
+        mock_redis.evalsha.assert_not_called()
+        mock_redis.setex.assert_not_called()
+
+    async def test_get_reloads_once_then_checks_env(self) -> None:
+        """An ID missing from the cache is looked up in fresh rows, then env vars."""
+        pool, _ = _make_scripted_pool([])
+        pool._env = {"SERPER_MEDIUM_API_KEY": "env-key"}
+        query = AsyncMock(return_value=[_db_row("key-a")])
+
+        with patch.object(pool, "_query_db_credentials", new=query):
+            await pool.get("serper", "medium", "warm-cache")
+            result = await pool.get("serper", "medium", "SERPER_MEDIUM_API_KEY")
+            missing = await pool.get("serper", "medium", str(uuid.uuid4()))
+
+        assert result == {
+            "id": "SERPER_MEDIUM_API_KEY",
+            "platform": "serper",
+            "tier": "medium",
+            "api_key": "env-key",
+        }
+        assert missing is None
+        # Fresh rows are not reloaded; cached rows are reloaded once per miss.
+        assert query.await_count == 3
+
+
 # ---------------------------------------------------------------------------
 # release()
 # ---------------------------------------------------------------------------
@@ -22,20 +22,27 @@ Tests cover:
 - run_dedup_pass() returns the correct summary dict
 - get_deduplication_service() returns a DeduplicationService instance
 - Empty input to find_url_duplicates() / find_hash_duplicates() returns []
+- SimHashIndex clusters match the pairwise Hamming scan
+- find_near_duplicates() elects the lowest UUID as canonical
 
 All tests mock the SQLAlchemy AsyncSession.  No live database is required.
 """
 
 from __future__ import annotations
 
+import random
 import uuid
 from collections import namedtuple
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
+
 from issue_observatory.core.deduplication import (
     DeduplicationService,
+    SimHashIndex,
     compute_simhash,
+    find_near_duplicates,
     get_deduplication_service,
     hamming_distance,
     normalise_url,
@@ -721,3 +728,130 @@ class TestHammingDistance:
     def test_hamming_distance_all_64_bits_different(self) -> None:
         """hamming_distance(0, 2**64 - 1) == 64 (all 64 bits differ)."""
         assert hamming_distance(0, (1 << 64) - 1) == 64
+
+
+# ---------------------------------------------------------------------------
+# SimHashIndex — multi-index near-duplicate search
+# ---------------------------------------------------------------------------
+
+
+def _pairwise_clusters(fingerprints: dict[str, int], threshold: int) -> set[frozenset[str]]:
+    """Reference clustering via the all-pairs Hamming scan."""
+    parent = {k: k for k in fingerprints}
+
+    def find(x: str) -> str:
+        while parent[x] != x:
+            x = parent[x]
+        return x
+
+    keys = list(fingerprints)
+    for i, a in enumerate(keys):
+        for b in keys[i + 1 :]:
+            if hamming_distance(fingerprints[a], fingerprints[b]) <= threshold:
+                parent[find(b)] = find(a)
+
+    groups: dict[str, set[str]] = {}
+    for k in keys:
+        groups.setdefault(find(k), set()).add(k)
+    return {frozenset(g) for g in groups.values() if len(g) >= 2}
+
+
+class TestSimHashIndex:
+    def test_clusters_empty_index_returns_empty_list(self) -> None:
+        """An index with no fingerprints yields no clusters."""
+        assert SimHashIndex().clusters() == []
+
+    def test_clusters_groups_fingerprints_within_threshold(self) -> None:
+        """Fingerprints 3 bits apart cluster; 4 bits apart do not."""
+        index = SimHashIndex(hamming_threshold=3)
+        index.add("a", 0)
+        index.add("b", 0b111)
+        index.add("c", 0b1111 << 40)
+
+        assert index.clusters() == [["a", "b"]]
+
+    def test_clusters_differing_bits_spread_across_all_blocks(self) -> None:
+        """A match is found even when each block differs (pigeonhole edge)."""
+        index = SimHashIndex(hamming_threshold=3)
+        index.add("a", 0)
+        index.add("b", (1 << 0) | (1 << 20) | (1 << 40))
+
+        assert index.clusters() == [["a", "b"]]
+
+    def test_clusters_are_transitive(self) -> None:
+        """a~b and b~c put a, b and c in one cluster even if a and c are far apart."""
+        index = SimHashIndex(hamming_threshold=2)
+        index.add("a", 0)
+        index.add("b", 0b11)
+        index.add("c", 0b1111)
+
+        assert index.clusters() == [["a", "b", "c"]]
+
+    def test_identical_fingerprints_form_one_cluster(self) -> None:
+        """Exact fingerprint duplicates are collapsed into a single cluster."""
+        index = SimHashIndex()
+        for i in range(5):
+            index.add(str(i), 12345)
+
+        assert len(index) == 5
+        assert index.clusters() == [["0", "1", "2", "3", "4"]]
+
+    def test_signed_and_unsigned_fingerprints_are_equivalent(self) -> None:
+        """The signed BIGINT storage form matches the unsigned SimHash value."""
+        unsigned = (1 << 63) | 0b1010
+        index = SimHashIndex()
+        index.add("stored", unsigned - (1 << 64))
+
+        assert index.query(unsigned) == ["stored"]
+
+    def test_query_returns_keys_within_threshold(self) -> None:
+        """query() returns exactly the keys within the Hamming threshold."""
+        index = SimHashIndex(hamming_threshold=1)
+        index.add("near", 0b1)
+        index.add("far", 0b11)
+
+        assert index.query(0) == ["near"]
+
+    def test_negative_threshold_raises_value_error(self) -> None:
+        """A negative threshold is rejected."""
+        with pytest.raises(ValueError):
+            SimHashIndex(hamming_threshold=-1)
+
+    def test_clusters_match_pairwise_scan_on_random_fingerprints(self) -> None:
+        """The index finds exactly the clusters of the former O(n^2) scan."""
+        rng = random.Random(7)
+        fingerprints: dict[str, int] = {}
+        for i in range(400):
+            fingerprints[f"orig-{i}"] = rng.getrandbits(64)
+        originals = list(fingerprints.values())
+        for i in range(200):
+            fp = rng.choice(originals)
+            for bit in rng.sample(range(64), rng.randint(0, 5)):
+                fp ^= 1 << bit
+            fingerprints[f"dup-{i}"] = fp
+
+        for threshold in (0, 3, 5):
+            index = SimHashIndex(hamming_threshold=threshold)
+            for key, fp in fingerprints.items():
+                index.add(key, fp)
+            got = {frozenset(c) for c in index.clusters()}
+            assert got == _pairwise_clusters(fingerprints, threshold)
+
+
+class TestFindNearDuplicates:
+    async def test_find_near_duplicates_elects_lowest_uuid_as_canonical(self) -> None:
+        """The canonical record of a cluster is the lexicographically lowest UUID."""
+        row = namedtuple("_SimRow", ["id", "platform", "arena", "simhash"])
+        ids = sorted(uuid.uuid4() for _ in range(3))
+        rows = [
+            row(ids[2], "bluesky", "social_media", 0b1),
+            row(ids[0], "reddit", "social_media", 0b0),
+            row(ids[1], "rss_feeds", "news_media", 0xFFFF << 40),
+        ]
+        db = _mock_db_for_url_rows(rows)
+
+        clusters = await find_near_duplicates(db, run_id=uuid.uuid4())
+
+        assert len(clusters) == 1
+        assert clusters[0]["canonical_id"] == str(ids[0])
+        assert clusters[0]["near_duplicate_ids"] == [str(ids[2])]
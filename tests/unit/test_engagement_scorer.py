@@ -299,3 +299,70 @@ class TestHelpers:
             "discord",
         }
         assert _ENGAGEMENT_PLATFORMS == expected
+
+
+# ---------------------------------------------------------------------------
+# Vectorized scoring
+# ---------------------------------------------------------------------------
+
+
+class TestVectorizedScoring:
+    """Array paths produce the same scores as the per-record functions."""
+
+    def test_yeo_johnson_array_matches_scalar(self) -> None:
+        np = pytest.importorskip("numpy")
+        from issue_observatory.analysis.enrichments.engagement_scorer import (
+            _yeo_johnson_array,
+        )
+
+        values = [-5.0, -1.0, 0.0, 0.5, 3.0, 1e6]
+        for lmbda in (0.0, 0.3, 1.0, 2.0, -0.7):
+            result = _yeo_johnson_array(np.array(values), lmbda)
+            expected = [_yeo_johnson_transform(v, lmbda) for v in values]
+            assert result.tolist() == pytest.approx(expected, rel=1e-12)
+
+    def test_transform_array_matches_transform(self) -> None:
+        np = pytest.importorskip("numpy")
+        state = EngagementScalerState(
+            lmbda=0.2, data_min=1.0, data_max=15.0, fitted_at="2026-01-01T00:00:00+00:00"
+        )
+        values = [0.0, 1.0, 12.0, 450.0, 1e9]
+        result = state.transform_array(np.array(values))
+        assert result.tolist() == pytest.approx([state.transform(v) for v in values])
+
+    def test_transform_array_zero_range(self) -> None:
+        np = pytest.importorskip("numpy")
+        state = EngagementScalerState(
+            lmbda=1.0, data_min=3.0, data_max=3.0, fitted_at="2026-01-01T00:00:00+00:00"
+        )
+        assert state.transform_array(np.array([1.0, 9.0])).tolist() == [50.0, 50.0]
+
+    def test_enrich_batch_matches_enrich(self) -> None:
+        pytest.importorskip("numpy")
+        from issue_observatory.analysis.enrichments.engagement_scorer import (
+            EngagementScorer,
+        )
+
+        scorer = EngagementScorer.__new__(EngagementScorer)
+        scorer._scalers = {
+            "reddit": EngagementScalerState(
+                lmbda=0.5, data_min=0.0, data_max=20.0, fitted_at="2026-03-15T01:00:00+00:00"
+            ),
+        }
+        records = [
+            {"platform": "reddit", "views_count": None, "likes_count": 100,
+             "shares_count": None, "comments_count": 25},
+            {"platform": "bluesky", "views_count": None, "likes_count": 50,
+             "shares_count": 10, "comments_count": 5},
+            {"platform": "reddit", "views_count": 7, "likes_count": -3,
+             "shares_count": 0, "comments_count": None},
+        ]
+
+        batch = asyncio.run(scorer.enrich_batch(records))
+        single = [asyncio.run(scorer.enrich(r)) for r in records]
+
+        for got, expected in zip(batch, single, strict=True):
+            assert isinstance(got, dict)
+            got.pop("scored_at")
+            expected.pop("scored_at")
+            assert got == pytest.approx(expected)
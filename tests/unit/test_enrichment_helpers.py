@@ -0,0 +1,155 @@
+"""Unit tests for the enrichment fetch/write helpers in workers/_enrichment_helpers.py.
+
+Tests cover:
+- fetch_content_records_for_run() uses keyset pagination, never OFFSET
+- write_enrichments_batch() emits one UPDATE ... FROM (VALUES ...) per call
+- Patches merge several enrichers per record into raw_metadata.enrichments
+- write_enrichments_batch() refreshes the run's rollups in the same transaction
+- write_enrichment_batch() delegates to the multi-enricher writer
+
+The synchronous session is mocked; no database is required.
+"""
+
+from __future__ import annotations
+
+import json
+from contextlib import contextmanager
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from issue_observatory.workers._enrichment_helpers import (
+    fetch_content_records_for_run,
+    write_enrichment_batch,
+    write_enrichments_batch,
+)
+
+_RUN_ID = "00000000-0000-0000-0000-000000000001"
+_RECORD_A = "00000000-0000-0000-0000-00000000000a"
+_RECORD_B = "00000000-0000-0000-0000-00000000000b"
+
+
+def _patched_session(db: MagicMock) -> Any:
+    @contextmanager
+    def _session() -> Any:
+        yield db
+
+    return patch("issue_observatory.workers._enrichment_helpers.get_sync_session", _session)
+
+
+class TestFetchContentRecordsForRun:
+    def test_first_page_has_no_cursor(self) -> None:
+        db = MagicMock()
+        db.execute.return_value.mappings.return_value.all.return_value = []
+
+        with _patched_session(db):
+            fetch_content_records_for_run(_RUN_ID)
+
+        sql = str(db.execute.call_args.args[0])
+        params = db.execute.call_args.args[1]
+        assert "OFFSET" not in sql
+        assert "id >" not in sql
+        assert "after_id" not in params
+
+    def test_next_page_seeks_past_cursor(self) -> None:
+        db = MagicMock()
+        db.execute.return_value.mappings.return_value.all.return_value = [
+            {"id": _RECORD_B, "text_content": "x", "language": None, "raw_metadata": None}
+        ]
+
+        with _patched_session(db):
+            rows = fetch_content_records_for_run(_RUN_ID, after_id=_RECORD_A, limit=10)
+
+        sql = str(db.execute.call_args.args[0])
+        params = db.execute.call_args.args[1]
+        assert "id > CAST(:after_id AS uuid)" in sql
+        assert "OFFSET" not in sql
+        assert params == {"run_id": _RUN_ID, "limit": 10, "after_id": _RECORD_A}
+        assert rows[0]["id"] == _RECORD_B
+
+
+class TestWriteEnrichmentsBatch:
+    def test_single_statement_for_batch(self) -> None:
+        db = MagicMock()
+
+        with _patched_session(db):
+            write_enrichments_batch(
+                [
+                    (_RECORD_A, {"language_detection": {"language": "da"}}),
+                    (_RECORD_B, {"actor_roles": {"entities": []}}),
+                ]
+            )
+
+        assert db.execute.call_count == 1
+        db.commit.assert_called_once()
+        sql = str(db.execute.call_args.args[0])
+        assert "FROM (VALUES" in sql
+        assert sql.count("CAST(:patch_") == 2
+        assert "|| v.patch" in sql
+
+    def test_patch_merges_enrichers_per_record(self) -> None:
+        db = MagicMock()
+        patch_a = {"language_detection": {"language": "da"}, "actor_roles": {"entities": []}}
+
+        with _patched_session(db):
+            write_enrichments_batch([(_RECORD_A, patch_a)])
+
+        params = db.execute.call_args.args[1]
+        assert params["id_0"] == _RECORD_A
+        assert json.loads(params["patch_0"]) == patch_a
+
+    def test_empty_batch_is_noop(self) -> None:
+        db = MagicMock()
+
+        with _patched_session(db):
+            write_enrichments_batch([])
+
+        db.execute.assert_not_called()
+
+    def test_refreshes_run_rollups_before_commit(self) -> None:
+        db = MagicMock()
+        calls: list[str] = []
+        db.execute.side_effect = lambda *a, **k: calls.append("update")
+        db.commit.side_effect = lambda: calls.append("commit")
+
+        with (
+            _patched_session(db),
+            patch(
+                "issue_observatory.workers._enrichment_helpers.refresh_run_slices_sync",
+                side_effect=lambda session, run_id: calls.append(f"refresh:{run_id}"),
+            ) as refresh,
+        ):
+            write_enrichments_batch(
+                [(_RECORD_A, {"language_detection": {"language": "da"}})],
+                refresh_run_rollups=_RUN_ID,
+            )
+
+        refresh.assert_called_once_with(db, _RUN_ID)
+        assert calls == ["update", f"refresh:{_RUN_ID}", "commit"]
+
+    def test_refresh_without_items_skips_update(self) -> None:
+        db = MagicMock()
+
+        with (
+            _patched_session(db),
+            patch(
+                "issue_observatory.workers._enrichment_helpers.refresh_run_slices_sync"
+            ) as refresh,
+        ):
+            write_enrichments_batch([], refresh_run_rollups=_RUN_ID)
+
+        db.execute.assert_not_called()
+        refresh.assert_called_once_with(db, _RUN_ID)
+        db.commit.assert_called_once()
+
+    def test_single_enricher_wrapper(self) -> None:
+        db = MagicMock()
+
+        with _patched_session(db):
+            write_enrichment_batch(
+                "language_detection",
+                [(_RECORD_A, {"language": "da"}), (_RECORD_B, {"language": "en"})],
+            )
+
+        assert db.execute.call_count == 1
+        params = db.execute.call_args.args[1]
+        assert json.loads(params["patch_1"]) == {"language_detection": {"language": "en"}}
@@ -10,6 +10,8 @@ Tests cover:
 - GEXF bipartite export: actor and term node types, term: prefix on IDs
 - GEXF export: no duplicate nodes, no self-edges
 - Empty dataset: each format returns empty-but-valid output
+- Streaming writer: CSV/NDJSON byte-identical to buffered output, Parquet row
+  groups per batch, XLSX write-only workbook, cumulative progress callback
 - content_hash deduplication: duplicate records not double-counted in networks
 
 These tests run without a live database or network connection.
@@ -468,6 +470,92 @@ class TestExportJson:
         assert "æ".encode() in result
 
 
+# ---------------------------------------------------------------------------
+# Streaming writer (background exports)
+# ---------------------------------------------------------------------------
+
+
+def _batches(records: list[dict[str, Any]], size: int) -> list[list[dict[str, Any]]]:
+    return [records[i : i + size] for i in range(0, len(records), size)]
+
+
+class TestWriteStream:
+    @pytest.mark.asyncio
+    async def test_csv_stream_matches_buffered_export(self) -> None:
+        """write_stream('csv') produces the same bytes as export_csv()."""
+        import io
+
+        records = [_make_record(author_id=f"a-{i}", text=DANISH_TEXT) for i in range(7)]
+        buf = io.BytesIO()
+
+        count = EXPORTER.write_stream(_batches(records, 3), "csv", buf)
+
+        assert count == 7
+        assert buf.getvalue() == await EXPORTER.export_csv(records)
+
+    @pytest.mark.asyncio
+    async def test_json_stream_matches_buffered_export(self) -> None:
+        """write_stream('json') produces the same NDJSON as export_json()."""
+        import io
+
+        records = [_make_record(author_id=f"a-{i}") for i in range(5)]
+        buf = io.BytesIO()
+
+        EXPORTER.write_stream(_batches(records, 2), "json", buf)
+
+        assert buf.getvalue() == await EXPORTER.export_json(records)
+
+    def test_parquet_stream_writes_one_row_group_per_batch(self) -> None:
+        """Parquet output has one row group per batch and all rows."""
+        import io
+
+        import pyarrow.parquet as pq
+
+        records = [_make_record(author_id=f"a-{i}", likes=i) for i in range(10)]
+        buf = io.BytesIO()
+
+        EXPORTER.write_stream(_batches(records, 4), "parquet", buf)
+
+        parquet_file = pq.ParquetFile(io.BytesIO(buf.getvalue()))
+        assert parquet_file.metadata.num_row_groups == 3
+        table = parquet_file.read()
+        assert table.num_rows == 10
+        assert table.column("likes_count").to_pylist() == list(range(10))
+
+    def test_xlsx_stream_produces_workbook_with_all_rows(self, tmp_path) -> None:
+        """write_stream('xlsx') yields a valid workbook with a header row."""
+        import openpyxl
+
+        records = [_make_record(author_id=f"a-{i}", text=DANISH_TEXT) for i in range(5)]
+        path = tmp_path / "stream.xlsx"
+        with path.open("wb") as fh:
+            EXPORTER.write_stream(_batches(records, 2), "xlsx", fh)
+
+        ws = openpyxl.load_workbook(path).active
+        assert ws.title == "Content"
+        assert ws.max_row == 6
+        assert ws.cell(row=1, column=1).value == _COLUMN_HEADERS[_FLAT_COLUMNS[0]]
+        assert ws.cell(row=1, column=1).font.bold
+
+    def test_on_batch_receives_cumulative_row_counts(self) -> None:
+        """on_batch is called after each batch with the running total."""
+        import io
+
+        records = [_make_record(author_id=f"a-{i}") for i in range(5)]
+        seen: list[int] = []
+
+        EXPORTER.write_stream(_batches(records, 2), "csv", io.BytesIO(), on_batch=seen.append)
+
+        assert seen == [2, 4, 5]
+
+    def test_gexf_is_not_streamable(self) -> None:
+        """Formats that need the full record set are rejected."""
+        import io
+
+        with pytest.raises(ValueError, match="does not support streaming"):
+            EXPORTER.write_stream([], "gexf", io.BytesIO())
+
+
 # ---------------------------------------------------------------------------
 # GEXF — actor co-occurrence (DQ-02 regression)
 # ---------------------------------------------------------------------------
@@ -211,7 +211,7 @@ class TestListFilters:
         assert "ILIKE" not in where.upper()
 
     def test_search_terms_text_fallback_adds_ilike_branch(self) -> None:
-        """Window-mode fallback widens the predicate with ILIKE ANY on text_content."""
+        """Window-mode fallback widens the predicate with ILIKE on text_content."""
         spec = _make_spec(
             search_terms=["klima", "energi"],
             search_terms_text_fallback=True,
@@ -219,8 +219,9 @@ class TestListFilters:
         where, params = _build(spec)
         # Both branches present, combined by OR.
         assert "&&" in where
-        assert "ILIKE ANY" in where
-        assert "text_content ILIKE" in where
+        assert "text_content ILIKE :_stl_0 OR text_content ILIKE :_stl_1" in where
+        # One ILIKE per term (trigram-indexable), never ILIKE ANY.
+        assert "ILIKE ANY" not in where
         # Array-overlap binds are present as plain strings.
         assert "klima" in params.values()
         assert "energi" in params.values()
@@ -240,6 +241,20 @@ class TestListFilters:
         assert r"%50\%%" in ilike_vals
         assert r"%a\_b%" in ilike_vals
 
+    def test_search_terms_text_fallback_drops_redundant_terms(self) -> None:
+        """Case duplicates and terms containing another term add no branch."""
+        spec = _make_spec(
+            search_terms=["Klima", "klima", "klimaforandringer", "energi"],
+            search_terms_text_fallback=True,
+        )
+        where, params = _build(spec)
+        ilike_vals = [v for k, v in params.items() if k.startswith("_stl_")]
+        assert ilike_vals == ["%Klima%", "%energi%"]
+        assert where.count("ILIKE") == 2
+        # The array-overlap side still receives every term verbatim.
+        st_vals = [v for k, v in params.items() if k.startswith("_st_")]
+        assert st_vals == ["Klima", "klima", "klimaforandringer", "energi"]
+
     def test_multiple_arenas_uses_indexed_params(self) -> None:
         spec = _make_spec(arenas=["news", "social"])
         where, params = _build(spec)
@@ -19,6 +19,7 @@ from issue_observatory.analysis.network_builder import (
     _filter_items_per_group,
     _invert_edges,
     _project_edges,
+    _project_edges_sparse,
     _reduce_retained_nodes,
     _safe_power,
     enforce_network_limits,
@@ -645,6 +646,52 @@ class TestProjectionCap:
             all_retained.update(rn.keys())
         assert "hub" in all_retained
 
+    def test_reduce_keeps_largest_k_under_cap(self) -> None:
+        """The single-pass selection keeps exactly as many nodes as fit."""
+        # 30 senders sharing one keyword: K nodes give C(K, 2) pairs.
+        bipartite_edges = {f"s{i:02d}": {"x": 100 - i} for i in range(30)}
+        inverted = {"x": {s: w["x"] for s, w in bipartite_edges.items()}}
+
+        reduced, kept = _reduce_retained_nodes(
+            inverted, bipartite_edges, max_projected_edges=100,
+        )
+
+        # C(14, 2) = 91 <= 100 < C(15, 2) = 105
+        assert kept == 14
+        assert set(reduced["x"]) == {f"s{i:02d}" for i in range(14)}
+
+    def test_sparse_projection_matches_pair_loop(self) -> None:
+        """The scipy projection yields the same min-weighted edges as the loop."""
+        pytest.importorskip("scipy")
+        inverted = {
+            "x": {"A": 3, "B": 1, "C": 2},
+            "y": {"A": 5, "B": 4},
+            "z": {"C": 7, "D": 7, "A": 1},
+            "solo": {"E": 9},
+        }
+
+        expected, _ = _project_edges(inverted, max_edges=1000)
+        edges, capped = _project_edges_sparse(inverted, max_edges=1000)
+
+        assert capped is False
+        assert {(a, b): w for a, b, w in edges} == expected
+        assert expected[("A", "B")] == 1 + 4
+
+    def test_sparse_projection_cap_keeps_heaviest(self) -> None:
+        """When capped, the heaviest pairs survive and min_weight still applies."""
+        pytest.importorskip("scipy")
+        inverted = {"x": {f"n{i}": i + 1 for i in range(20)}}
+
+        edges, capped = _project_edges_sparse(inverted, max_edges=10)
+
+        assert capped is True
+        assert len(edges) == 10
+        # min(w_i, w_j) is largest among the heaviest nodes n15..n19.
+        assert {w for _, _, w in edges} == {16, 17, 18, 19}
+
+        light, _ = _project_edges_sparse(inverted, max_edges=1000, min_weight=19)
+        assert light == [("n18", "n19", 19)]
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -0,0 +1,156 @@
+"""Unit tests for the bulk write path of persist_collected_records().
+
+Tests cover:
+- _insert_content_records() emits one multi-row INSERT for the whole batch
+- Columns a record does not set are written as DEFAULT
+- Per-row parameter names do not collide across rows
+- persist_collected_records() derives inserted/skipped from the statement rowcount
+- A failing bulk statement falls back to per-row inserts with accurate counts
+- The analysis cache is invalidated only when rows were inserted
+
+The synchronous session is mocked; no database is required.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from issue_observatory.workers._task_helpers import (
+    _insert_content_records,
+    persist_collected_records,
+)
+
+_RUN_ID = "00000000-0000-0000-0000-000000000001"
+
+
+def _record(n: int, **extra: Any) -> dict[str, Any]:
+    return {
+        "platform": "bluesky",
+        "arena": "social_media",
+        "content_hash": f"hash-{n}",
+        "published_at": "2026-01-01T00:00:00+00:00",
+        "text_content": f"post {n}",
+        **extra,
+    }
+
+
+def _mock_db(rowcounts: list[int | Exception]) -> MagicMock:
+    """Return a mock sync session whose execute() yields *rowcounts* in order."""
+    db = MagicMock()
+    outcomes = iter(rowcounts)
+
+    def _execute(stmt: Any, params: Any = None) -> MagicMock:
+        outcome = next(outcomes, 1)
+        if isinstance(outcome, Exception):
+            raise outcome
+        result = MagicMock()
+        result.rowcount = outcome
+        return result
+
+    db.execute.side_effect = _execute
+    return db
+
+
+def _run_persist(
+    db: MagicMock,
+    records: list[dict[str, Any]],
+    invalidate: MagicMock | None = None,
+) -> tuple[int, int]:
+    @contextmanager
+    def _session() -> Any:
+        yield db
+
+    with (
+        patch("issue_observatory.core.database.get_sync_session", _session),
+        patch("issue_observatory.workers._task_helpers.check_run_cancelled"),
+        patch(
+            "issue_observatory.workers._task_helpers.invalidate_analysis_cache",
+            invalidate or MagicMock(),
+        ),
+    ):
+        return persist_collected_records(records, _RUN_ID, terms=["post"])
+
+
+class TestInsertContentRecords:
+    def test_single_statement_for_all_rows(self) -> None:
+        db = _mock_db([3])
+
+        inserted = _insert_content_records(db, [_record(1), _record(2), _record(3)])
+
+        assert inserted == 3
+        assert db.execute.call_count == 1
+        sql = str(db.execute.call_args.args[0])
+        assert sql.count("), (") == 2
+        assert "ON CONFLICT (content_hash, published_at)" in sql
+
+    def test_missing_columns_use_default(self) -> None:
+        db = _mock_db([2])
+
+        _insert_content_records(db, [_record(1, title="Overskrift"), _record(2)])
+
+        sql = str(db.execute.call_args.args[0])
+        params = db.execute.call_args.args[1]
+        assert "DEFAULT" in sql
+        assert params["title_0"] == "Overskrift"
+        assert "title_1" not in params
+
+    def test_params_are_namespaced_per_row(self) -> None:
+        db = _mock_db([2])
+
+        _insert_content_records(db, [_record(1), _record(2)])
+
+        params = db.execute.call_args.args[1]
+        assert params["content_hash_0"] == "hash-1"
+        assert params["content_hash_1"] == "hash-2"
+
+    def test_casts_and_simhash_clamp(self) -> None:
+        db = _mock_db([1])
+
+        _insert_content_records(
+            db,
+            [_record(1, raw_metadata={"a": 1}, media_urls=['x"y'], simhash=(1 << 64) - 1)],
+        )
+
+        sql = str(db.execute.call_args.args[0])
+        params = db.execute.call_args.args[1]
+        assert "CAST(:raw_metadata_0 AS jsonb)" in sql
+        assert params["raw_metadata_0"] == '{"a": 1}'
+        assert params["media_urls_0"] == '{"x\\"y"}'
+        assert params["simhash_0"] == -1
+
+
+class TestPersistCollectedRecordsBulk:
+    def test_counts_from_bulk_rowcount(self) -> None:
+        # 3 records, 2 inserted, 1 conflicting; then the run-counter UPDATE.
+        db = _mock_db([2, 1])
+
+        inserted, skipped = _run_persist(db, [_record(1), _record(2), _record(3)])
+
+        assert (inserted, skipped) == (2, 1)
+        # One INSERT plus the records_collected UPDATE.
+        assert db.execute.call_count == 2
+
+    def test_bulk_failure_falls_back_to_per_row(self) -> None:
+        db = _mock_db([RuntimeError("bad row"), 1, RuntimeError("bad row"), 0, 1])
+
+        inserted, skipped = _run_persist(db, [_record(1), _record(2), _record(3)])
+
+        assert (inserted, skipped) == (1, 2)
+        # Bulk attempt + three single-row inserts + run-counter UPDATE.
+        assert db.execute.call_count == 5
+
+    def test_invalidates_analysis_cache_after_insert(self) -> None:
+        invalidate = MagicMock()
+
+        _run_persist(_mock_db([2, 1]), [_record(1), _record(2)], invalidate)
+
+        invalidate.assert_called_once_with(_RUN_ID, None)
+
+    def test_no_invalidation_when_nothing_inserted(self) -> None:
+        invalidate = MagicMock()
+
+        _run_persist(_mock_db([0]), [_record(1)], invalidate)
+
+        invalidate.assert_not_called()
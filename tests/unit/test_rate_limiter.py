@@ -14,6 +14,10 @@ Tests cover:
 - RateLimiter.get_wait_time() returns positive seconds when a window is exhausted
 - RateLimiter.wait_for_slot() returns immediately when slot is acquired first try
 - RateLimiter.wait_for_slot() raises RateLimitTimeoutError when timeout is exceeded
+- RateLimiter.wait_for_slot() sleeps exactly the wait returned by the ticket script
+- RateLimiter.wait_for_slot() keeps one FIFO ticket and removes it when not served
+- The FIFO ticket Lua script, run by fakeredis, returns turn times for
+  waiters deeper than one window
 - RateLimiter.reset() deletes the sorted sets for all windows
 - rate_limited_request() context manager enters and exits cleanly on success
 - rate_limited_request() releases the slot even when an exception occurs inside
@@ -21,7 +25,8 @@ Tests cover:
 - RateLimitConfig dataclass holds fields with defaults
 - RateLimitTimeoutError carries key and timeout attributes
 
-All Redis calls are mocked via AsyncMock.  No live Redis is required.
+Redis calls are mocked via AsyncMock, except the script tests, which use
+fakeredis with Lua support.  No live Redis is required.
 """
 
 from __future__ import annotations
@@ -511,6 +516,76 @@ class TestWaitForSlot:
         assert expected_key in str(exc_info.value)
 
 
+    async def test_wait_for_slot_sleeps_until_turn(self) -> None:
+        """wait_for_slot() sleeps the milliseconds returned by the script, not a poll interval."""
+        limiter, mock_redis = _make_limiter()
+        mock_redis.evalsha = AsyncMock(side_effect=[-1500, 1])
+        sleep = AsyncMock()
+
+        with patch("asyncio.sleep", new=sleep):
+            await limiter.wait_for_slot(
+                key="ratelimit:gdelt:shared:default",
+                max_calls=1,
+                window_seconds=1,
+                timeout=30.0,
+            )
+
+        sleep.assert_awaited_once_with(1.5)
+
+    async def test_wait_for_slot_caps_sleep(self) -> None:
+        """A long wait is split so abandoned tickets ahead are noticed."""
+        limiter, mock_redis = _make_limiter()
+        mock_redis.evalsha = AsyncMock(side_effect=[-45_000, 1])
+        sleep = AsyncMock()
+
+        with patch("asyncio.sleep", new=sleep):
+            await limiter.wait_for_slot(
+                key="ratelimit:x:y:z", max_calls=15, window_seconds=60, timeout=120.0
+            )
+
+        sleep.assert_awaited_once_with(5.0)
+
+    async def test_wait_for_slot_reuses_ticket_across_attempts(self) -> None:
+        """Every attempt presents the same ticket so the FIFO position is kept."""
+        limiter, mock_redis = _make_limiter()
+        mock_redis.evalsha = AsyncMock(side_effect=[-10, -10, 1])
+        key = "ratelimit:common_crawl:shared:default"
+
+        with patch("asyncio.sleep", new=AsyncMock()):
+            await limiter.wait_for_slot(key=key, max_calls=1, window_seconds=1)
+
+        calls = mock_redis.evalsha.await_args_list
+        assert calls[0].args[1:6] == (
+            4,
+            key,
+            f"{key}:queue",
+            f"{key}:queue:deadline",
+            f"{key}:queue:seq",
+        )
+        assert len({c.args[9] for c in calls}) == 1
+        # Served tickets are removed by the script itself.
+        mock_redis.zrem.assert_not_awaited()
+
+    async def test_wait_for_slot_removes_ticket_on_timeout(self) -> None:
+        """A waiter that gives up leaves the queue so later waiters move up."""
+        limiter, mock_redis = _make_limiter(evalsha_return=0)
+        key = "ratelimit:gdelt:shared:default"
+
+        with pytest.raises(RateLimitTimeoutError):
+            await limiter.wait_for_slot(key=key, max_calls=1, window_seconds=1, timeout=0.02)
+
+        ticket = mock_redis.evalsha.await_args.args[9]
+        removed = [c.args for c in mock_redis.zrem.await_args_list]
+        assert removed == [(f"{key}:queue", ticket), (f"{key}:queue:deadline", ticket)]
+
+    async def test_wait_for_slot_allows_request_on_redis_error(self) -> None:
+        """wait_for_slot() returns instead of blocking when Redis fails."""
+        limiter, mock_redis = _make_limiter()
+        mock_redis.evalsha = AsyncMock(side_effect=ConnectionError("redis down"))
+
+        await limiter.wait_for_slot(key="ratelimit:a:b:c", max_calls=1, window_seconds=1)
+
+
 # ---------------------------------------------------------------------------
 # RateLimiter.reset()
 # ---------------------------------------------------------------------------
@@ -579,3 +654,65 @@ class TestRateLimitedRequest:
 
         # asyncio.sleep must have been called at least once (waiting for slot)
         assert mock_sleep.call_count >= 1
+
+
+# ---------------------------------------------------------------------------
+# FIFO ticket script executed by a Lua-capable fake Redis
+# ---------------------------------------------------------------------------
+
+
+class TestAcquireInTurnScript:
+    """Runs ``_LUA_ACQUIRE_IN_TURN`` itself instead of mocking ``evalsha``."""
+
+    _KEY = "ratelimit:gdelt:shared:default"
+
+    @pytest.fixture()
+    async def limiter(self) -> RateLimiter:
+        pytest.importorskip("lupa")
+        fakeredis = pytest.importorskip("fakeredis")
+        limiter = RateLimiter(redis_client=fakeredis.FakeAsyncRedis())
+        await limiter._ensure_scripts_loaded()
+        return limiter
+
+    async def _attempt(self, limiter: RateLimiter, ticket: str, now: float) -> int:
+        queue_key, deadlines_key, seq_key = limiter._queue_keys(self._KEY)
+        return int(
+            await limiter.redis_client.evalsha(
+                limiter._sha_in_turn,
+                4,
+                self._KEY,
+                queue_key,
+                deadlines_key,
+                seq_key,
+                str(now),
+                "60",
+                "2",
+                ticket,
+                "70",
+                str(now + 600),
+                "700",
+            )
+        )
+
+    async def test_free_slot_is_acquired(self, limiter: RateLimiter) -> None:
+        assert await self._attempt(limiter, "t0", 1_000.0) == 1
+        assert await limiter.redis_client.zcard(self._KEY) == 1
+
+    async def test_waiters_beyond_the_window_get_their_turn_time(
+        self, limiter: RateLimiter
+    ) -> None:
+        """Deep queue positions wait whole windows, not the 10 ms minimum."""
+        now = 1_000.0
+        await limiter.redis_client.zadd(self._KEY, {"a": now - 50, "b": now - 40})
+
+        waits = [-await self._attempt(limiter, f"t{i}", now) for i in range(5)]
+
+        # Entries expire at +10 s and +20 s; their refills a window later.
+        assert waits == [10_000, 20_000, 70_000, 80_000, 130_000]
+
+    async def test_wait_for_slot_serves_first_waiter(self, limiter: RateLimiter) -> None:
+        await limiter.wait_for_slot(self._KEY, max_calls=2, window_seconds=60, timeout=1.0)
+
+        queue_key, _, _ = limiter._queue_keys(self._KEY)
+        assert await limiter.redis_client.zcard(self._KEY) == 1
+        assert await limiter.redis_client.zcard(queue_key) == 0
@@ -0,0 +1,132 @@
+"""Unit tests for core/term_matcher.py.
+
+Tests cover:
+- TermMatcher substring mode matches the former ``t.lower() in haystack`` scan,
+  both below and above AUTOMATON_MIN_TERMS
+- TermMatcher preserves input order, duplicates and case variants
+- TermMatcher word-boundary mode matches term_in_text() for compounds, short
+  terms, phrases and regex-only terms (tabs, repeated spaces)
+- get_term_matcher() caches per term tuple and returns a new matcher when the
+  term list changes
+- _match_terms_in_text() and match_groups_in_text() keep their results
+"""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from issue_observatory.arenas.query_builder import match_groups_in_text, term_in_text
+from issue_observatory.core.term_matcher import (
+    AUTOMATON_MIN_TERMS,
+    TermMatcher,
+    clear_term_matcher_cache,
+    get_term_matcher,
+)
+from issue_observatory.workers._task_helpers import _match_terms_in_text
+
+_ALPHABET = "abcdeøå "
+
+
+def _random_text(rng: random.Random, n: int) -> str:
+    return "".join(rng.choice(_ALPHABET) for _ in range(n))
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache() -> None:
+    clear_term_matcher_cache()
+
+
+class TestSubstringMode:
+    def test_matches_in_input_order(self) -> None:
+        """Matched terms are returned in the order they were given."""
+        matcher = TermMatcher(["velfærd", "Grønland", "klima"])
+        assert matcher.match("Klima og grønlandspolitik") == ["Grønland", "klima"]
+
+    def test_duplicates_and_case_variants_are_preserved(self) -> None:
+        """Each input term is reported, including repeats and case variants."""
+        matcher = TermMatcher(["NATO", "nato", "NATO"])
+        assert matcher.match("nato-topmøde") == ["NATO", "nato", "NATO"]
+
+    def test_empty_terms_and_text(self) -> None:
+        """No terms yields no matches; an empty term matches any text."""
+        assert TermMatcher([]).match("anything") == []
+        assert TermMatcher(["", "x"]).match("abc") == [""]
+
+    @pytest.mark.parametrize("n_terms", [5, AUTOMATON_MIN_TERMS + 20])
+    def test_agrees_with_per_term_scan(self, n_terms: int) -> None:
+        """Results equal the per-term ``in`` scan, with and without the automaton."""
+        rng = random.Random(n_terms)
+        terms = [_random_text(rng, rng.randint(1, 4)).strip() or "a" for _ in range(n_terms)]
+        matcher = TermMatcher(terms)
+        for _ in range(200):
+            text = _random_text(rng, 60)
+            expected = [t for t in terms if t.lower() in text.lower()]
+            assert matcher.match(text) == expected
+
+
+class TestWordBoundaryMode:
+    @pytest.mark.parametrize(
+        ("term", "text"),
+        [
+            ("grønland", "Grønlands selvstyre"),
+            ("grønland", "grønlandspolitik"),
+            ("grønland", "nygrønland"),
+            ("eu", "EU-kommissionen"),
+            ("eu", "neutral"),
+            ("i", "politik i dag"),
+            ("i", "politik"),
+            ("klima politik", "klima   politik"),
+            ("klima politik", "klima\npolitik"),
+            ("klima\tpolitik", "klima politik"),
+            ("a  b", "a  b"),
+        ],
+    )
+    def test_agrees_with_term_in_text(self, term: str, text: str) -> None:
+        """Each single-term result equals term_in_text()."""
+        matcher = TermMatcher([term], word_boundary=True)
+        assert bool(matcher.match(text)) == term_in_text(term, text)
+
+    def test_agrees_with_term_in_text_on_random_input(self) -> None:
+        """Multi-term results equal one term_in_text() call per term."""
+        rng = random.Random(7)
+        terms = [_random_text(rng, rng.randint(1, 5)).strip() or "b" for _ in range(60)]
+        matcher = TermMatcher(terms, word_boundary=True)
+        for _ in range(200):
+            text = _random_text(rng, 80)
+            assert matcher.match(text) == [t for t in terms if term_in_text(t, text)]
+
+
+class TestGetTermMatcher:
+    def test_same_terms_share_a_matcher(self) -> None:
+        """Equal term lists reuse the cached matcher."""
+        assert get_term_matcher(["a", "b"]) is get_term_matcher(("a", "b"))
+
+    def test_changed_terms_get_a_new_matcher(self) -> None:
+        """Adding or removing a term produces a different matcher."""
+        first = get_term_matcher(["a", "b"])
+        assert get_term_matcher(["a", "b", "c"]) is not first
+        assert get_term_matcher(["a"]) is not first
+
+    def test_mode_is_part_of_the_key(self) -> None:
+        """Substring and word-boundary matchers are cached separately."""
+        assert get_term_matcher(["a"]) is not get_term_matcher(["a"], word_boundary=True)
+
+
+class TestCallers:
+    def test_match_terms_in_text_uses_title_and_text(self) -> None:
+        """_match_terms_in_text() searches both fields, case-insensitively."""
+        result = _match_terms_in_text("Debat om klima", "GRØNLAND", ["grønland", "klima", "nato"])
+        assert result == ["grønland", "klima"]
+
+    def test_match_terms_in_text_blank_record(self) -> None:
+        """Records without text match nothing."""
+        assert _match_terms_in_text(None, None, ["klima"]) == []
+
+    def test_match_groups_in_text_and_or(self) -> None:
+        """AND groups need every term; OR groups are independent."""
+        groups = [["klima", "afgift"], ["grønland"]]
+        assert match_groups_in_text(groups, "Klimaafgift vedtaget") == []
+        assert match_groups_in_text(groups, "Klima: ny afgift") == ["klima", "afgift"]
+        assert match_groups_in_text(groups, "Grønlands selvstyre") == ["grønland"]
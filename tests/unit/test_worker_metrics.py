@@ -0,0 +1,175 @@
+"""Unit tests for the Redis-aggregated worker metrics (core/worker_metrics.py).
+
+Tests cover:
+- counters and histograms accumulate pending increments without I/O
+- flush_worker_metrics() pushes one HINCRBYFLOAT per series field
+- a failed push keeps the observations for the next flush
+- WorkerMetricsCollector rebuilds Prometheus families from the Redis hashes
+- label names are validated
+
+No Redis server is required; a dict-backed fake stands in for the client.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from issue_observatory.core import worker_metrics
+from issue_observatory.core.worker_metrics import (
+    WorkerMetricsCollector,
+    collection_records_persisted_total,
+    flush_worker_metrics,
+    rate_limit_wait_seconds,
+)
+
+_REDIS_URL = "redis://localhost:6379/0"
+
+
+class _FakePipeline:
+    def __init__(self, redis: _FakeRedis) -> None:
+        self._redis = redis
+        self._ops: list[tuple[str, tuple[Any, ...]]] = []
+
+    def hincrbyfloat(self, key: str, field: str, amount: float) -> None:
+        self._ops.append(("hincrbyfloat", (key, field, amount)))
+
+    def hgetall(self, key: str) -> None:
+        self._ops.append(("hgetall", (key,)))
+
+    def execute(self) -> list[Any]:
+        if self._redis.fail:
+            raise ConnectionError("redis down")
+        results: list[Any] = []
+        for op, args in self._ops:
+            if op == "hincrbyfloat":
+                key, field, amount = args
+                self._redis.hashes[key][field] += amount
+                results.append(self._redis.hashes[key][field])
+            else:
+                results.append({f: str(v) for f, v in self._redis.hashes[args[0]].items()})
+        return results
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.hashes: dict[str, dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        self.fail = False
+
+    def pipeline(self, transaction: bool = True) -> _FakePipeline:
+        return _FakePipeline(self)
+
+
+@pytest.fixture()
+def fake_redis() -> Iterator[_FakeRedis]:
+    fake = _FakeRedis()
+    worker_metrics._pending.clear()
+    with patch.object(worker_metrics, "_get_client", return_value=fake):
+        yield fake
+    worker_metrics._pending.clear()
+
+
+def _samples(families: list[Any], name: str) -> dict[tuple[str, tuple[tuple[str, str], ...]], float]:
+    return {
+        (s.name, tuple(sorted(s.labels.items()))): s.value
+        for family in families
+        if family.name == name
+        for s in family.samples
+    }
+
+
+def _with_le(
+    labels: tuple[tuple[str, str], ...], bound: str
+) -> tuple[tuple[str, str], ...]:
+    return tuple(sorted((*labels, ("le", bound))))
+
+
+class TestRecording:
+    def test_counter_accumulates_pending(self, fake_redis: _FakeRedis) -> None:
+        labels = {"arena": "social_media", "platform": "bluesky", "tier": "free"}
+        collection_records_persisted_total.inc(3, outcome="inserted", **labels)
+        collection_records_persisted_total.inc(2, outcome="inserted", **labels)
+        assert not fake_redis.hashes
+        pending = worker_metrics._pending["collection_records_persisted_total"]
+        assert list(pending.values()) == [5.0]
+
+    def test_zero_increment_is_ignored(self, fake_redis: _FakeRedis) -> None:
+        collection_records_persisted_total.inc(
+            0, arena="a", platform="p", tier="free", outcome="skipped"
+        )
+        assert "collection_records_persisted_total" not in worker_metrics._pending
+
+    def test_wrong_labels_raise(self, fake_redis: _FakeRedis) -> None:
+        with pytest.raises(ValueError, match="expected labels"):
+            rate_limit_wait_seconds.observe(1.0, arena="social_media")
+
+
+class TestFlush:
+    def test_flush_pushes_and_clears(self, fake_redis: _FakeRedis) -> None:
+        rate_limit_wait_seconds.observe(0.3, arena="social_media", platform="bluesky")
+        flush_worker_metrics(_REDIS_URL)
+
+        stored = fake_redis.hashes["metrics:worker:rate_limit_wait_seconds"]
+        assert stored['["social_media","bluesky","count"]'] == 1.0
+        assert stored['["social_media","bluesky","sum"]'] == pytest.approx(0.3)
+        assert stored['["social_media","bluesky","le=0.5"]'] == 1.0
+        assert '["social_media","bluesky","le=0.25"]' not in stored
+        assert not worker_metrics._pending
+
+    def test_failed_push_keeps_observations(self, fake_redis: _FakeRedis) -> None:
+        rate_limit_wait_seconds.observe(0.3, arena="social_media", platform="bluesky")
+        fake_redis.fail = True
+        flush_worker_metrics(_REDIS_URL)
+        assert worker_metrics._pending["rate_limit_wait_seconds"]
+
+        fake_redis.fail = False
+        flush_worker_metrics(_REDIS_URL)
+        stored = fake_redis.hashes["metrics:worker:rate_limit_wait_seconds"]
+        assert stored['["social_media","bluesky","count"]'] == 1.0
+
+
+class TestCollector:
+    def test_collect_builds_prometheus_families(self, fake_redis: _FakeRedis) -> None:
+        rate_limit_wait_seconds.observe(0.3, arena="social_media", platform="bluesky")
+        rate_limit_wait_seconds.observe(2.0, arena="social_media", platform="bluesky")
+        collection_records_persisted_total.inc(
+            4, arena="social_media", platform="bluesky", tier="free", outcome="inserted"
+        )
+        flush_worker_metrics(_REDIS_URL)
+
+        families = list(WorkerMetricsCollector(_REDIS_URL).collect())
+
+        hist = _samples(families, "rate_limit_wait_seconds")
+        labels = (("arena", "social_media"), ("platform", "bluesky"))
+        assert hist[("rate_limit_wait_seconds_count", labels)] == 2.0
+        assert hist[("rate_limit_wait_seconds_sum", labels)] == pytest.approx(2.3)
+        assert hist[("rate_limit_wait_seconds_bucket", _with_le(labels, "0.5"))] == 1.0
+        assert hist[("rate_limit_wait_seconds_bucket", _with_le(labels, "+Inf"))] == 2.0
+
+        counter = _samples(families, "collection_records_persisted")
+        key = (
+            "collection_records_persisted_total",
+            (
+                ("arena", "social_media"),
+                ("outcome", "inserted"),
+                ("platform", "bluesky"),
+                ("tier", "free"),
+            ),
+        )
+        assert counter[key] == 4.0
+
+    def test_collect_without_redis_yields_nothing(self, fake_redis: _FakeRedis) -> None:
+        fake_redis.fail = True
+        assert list(WorkerMetricsCollector(_REDIS_URL).collect()) == []
+
+    def test_describe_does_not_read_redis(self, fake_redis: _FakeRedis) -> None:
+        fake_redis.fail = True
+        with patch.object(worker_metrics, "_get_client") as get_client:
+            names = {family.name for family in WorkerMetricsCollector(_REDIS_URL).describe()}
+        get_client.assert_not_called()
+        assert "rate_limit_wait_seconds" in names
+        assert "collection_records_persisted" in names
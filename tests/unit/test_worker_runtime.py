@@ -0,0 +1,125 @@
+"""Unit tests for the persistent worker runtime (workers/runtime.py).
+
+Tests cover:
+- run_async() returns results and propagates exceptions like asyncio.run()
+- consecutive run_async() calls share one event loop
+- context variables of the caller are visible to the coroutine
+- run_async() refuses to run from inside a running event loop
+- shared clients are only handed out while the runtime is running, and the
+  shared HTTP transport survives clients that close it
+
+No Redis server or network access is required.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+from collections.abc import Iterator
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from issue_observatory.workers import runtime
+from issue_observatory.workers.runtime import (
+    run_async,
+    shared_http_transport,
+    shared_redis,
+    shutdown_runtime,
+    start_runtime,
+)
+
+_REDIS_URL = "redis://localhost:6379/0"
+
+_request_id: contextvars.ContextVar[str] = contextvars.ContextVar("request_id", default="")
+
+
+@pytest.fixture(autouse=True)
+def _fresh_runtime() -> Iterator[None]:
+    shutdown_runtime()
+    yield
+    shutdown_runtime()
+
+
+async def _current_loop() -> asyncio.AbstractEventLoop:
+    return asyncio.get_running_loop()
+
+
+class TestRunAsync:
+    def test_returns_result(self) -> None:
+        assert run_async(asyncio.sleep(0, result=42)) == 42
+
+    def test_propagates_exceptions(self) -> None:
+        async def _boom() -> None:
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            run_async(_boom())
+
+    def test_loop_persists_across_calls(self) -> None:
+        first = run_async(_current_loop())
+        second = run_async(_current_loop())
+
+        assert first is second
+        assert not first.is_closed()
+
+    def test_caller_context_is_visible(self) -> None:
+        async def _read() -> str:
+            return _request_id.get()
+
+        token = _request_id.set("task-123")
+        try:
+            assert run_async(_read()) == "task-123"
+        finally:
+            _request_id.reset(token)
+
+    def test_nested_call_is_rejected(self) -> None:
+        async def _nested() -> None:
+            run_async(asyncio.sleep(0))
+
+        with pytest.raises(RuntimeError, match="running event loop"):
+            run_async(_nested())
+
+    def test_shutdown_stops_loop_and_next_call_restarts(self) -> None:
+        first = run_async(_current_loop())
+        shutdown_runtime()
+
+        assert first.is_closed()
+        assert run_async(_current_loop()) is not first
+
+
+class TestSharedClients:
+    def test_not_available_without_runtime(self) -> None:
+        assert shared_redis(_REDIS_URL) is None
+        assert shared_http_transport() is None
+
+    def test_redis_client_shared_per_url(self) -> None:
+        start_runtime()
+        with patch("redis.asyncio.from_url", side_effect=lambda *a, **kw: MagicMock()):
+            client = shared_redis(_REDIS_URL)
+            assert client is not None
+            assert shared_redis(_REDIS_URL) is client
+            assert shared_redis("redis://other:6379/0") is not client
+
+    def test_http_transport_only_on_runtime_loop(self) -> None:
+        start_runtime()
+        assert shared_http_transport() is None
+
+        async def _transport() -> httpx.AsyncBaseTransport | None:
+            return shared_http_transport()
+
+        transport = run_async(_transport())
+        assert transport is not None
+        assert run_async(_transport()) is transport
+
+    def test_closing_a_client_keeps_the_transport(self) -> None:
+        async def _use_and_close() -> httpx.AsyncBaseTransport | None:
+            transport = shared_http_transport()
+            async with httpx.AsyncClient(transport=transport):
+                pass
+            return transport
+
+        transport = run_async(_use_and_close())
+        assert run_async(_use_and_close()) is transport
+        assert runtime._http_transport is transport